@@ -17,6 +17,29 @@ typedef uint16_t _Py_CODEUNIT;
 #  define _Py_OPARG(word) ((word) >> 8)
 #endif
 
+/* Per-instruction cache entries, see _PyCode_InitOpcache() */
+typedef struct {
+    PyObject *ptr;          /* Cached pointer (borrowed reference) */
+    uint64_t globals_ver;   /* ma_version_tag of the globals dict */
+    uint64_t builtins_ver;  /* ma_version_tag of the builtins dict */
+} _PyOpcache_LoadGlobal;
+
+typedef struct {
+    PyTypeObject *type;     /* Type of the instance (borrowed reference) */
+    unsigned int tp_version_tag;  /* tp_version_tag of the type */
+    Py_ssize_t hint;        /* Index of the attribute in the instance dict */
+} _PyOpcache_LoadAttr;
+
+typedef struct {
+    union {
+        _PyOpcache_LoadGlobal lg;
+        _PyOpcache_LoadAttr la;
+    } u;
+    /* 0: not yet filled, > 0: filled (remaining misses allowed for
+       LOAD_ATTR), < 0: disabled for this instruction */
+    char optimized;
+} _PyOpcache;
+
 /* Bytecode object */
 typedef struct {
     PyObject_HEAD
@@ -48,6 +71,19 @@ typedef struct {
        Type is a void* to keep the format private in codeobject.c to force
        people to go through the proper APIs. */
     void *co_extra;
+
+    /* Per-instruction cache, created once the code object has been run
+       _PyCode_OPCACHE_MIN_RUNS times.  To keep the cache small, opcodes
+       are mapped indirectly to cache entries:
+
+           co_opcache[co_opcache_map[next_instr - first_instr] - 1]
+
+       where a zero in co_opcache_map means that the instruction has no
+       cache entry. */
+    unsigned char *co_opcache_map;
+    _PyOpcache *co_opcache;
+    int co_opcache_flag;        /* number of runs before creating the cache */
+    unsigned char co_opcache_size;  /* number of entries in co_opcache */
 } PyCodeObject;
 
 /* Masks for co_flags above */
@@ -136,6 +172,14 @@ PyAPI_FUNC(int) _PyCode_CheckLineNumber(PyCodeObject* co,
  * depending on the type and the value. The type is the first item to not
  * compare bytes and str which can raise a BytesWarning exception. */
 PyAPI_FUNC(PyObject*) _PyCode_ConstantKey(PyObject *obj);
+
+/* Number of times a code object must be run before its opcode cache is
+   created. */
+#define _PyCode_OPCACHE_MIN_RUNS 1024
+
+/* Create the opcode cache of a code object.  Return 0 on success, or set
+   an exception and return -1 on error. */
+PyAPI_FUNC(int) _PyCode_InitOpcache(PyCodeObject *co);
 #endif
 
 PyAPI_FUNC(PyObject*) PyCode_Optimize(PyObject *code, PyObject* consts,
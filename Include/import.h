@@ -132,6 +132,11 @@ struct _frozen {
    collection of frozen modules: */
 
 PyAPI_DATA(const struct _frozen *) PyImport_FrozenModules;
+
+/* The default table of frozen modules, and the same table without the
+   startup modules of the standard library (-X frozen_modules=off). */
+PyAPI_DATA(const struct _frozen *) _PyImport_FrozenStdlib;
+PyAPI_DATA(const struct _frozen *) _PyImport_FrozenNoStdlib;
 #endif
 
 #ifdef __cplusplus
@@ -59,6 +59,9 @@ PyAPI_FUNC(wchar_t *) Py_GetPrefix(void);
 PyAPI_FUNC(wchar_t *) Py_GetExecPrefix(void);
 PyAPI_FUNC(wchar_t *) Py_GetPath(void);
 PyAPI_FUNC(void)      Py_SetPath(const wchar_t *);
+#ifndef Py_LIMITED_API
+PyAPI_FUNC(wchar_t *) _Py_GetStdlibDir(void);
+#endif
 #ifdef MS_WINDOWS
 int _Py_CheckPython3();
 #endif
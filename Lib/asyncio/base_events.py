@@ -29,10 +29,13 @@ import warnings
 import weakref
 
 from . import compat
+from . import constants
 from . import coroutines
 from . import events
 from . import futures
+from . import protocols
 from . import tasks
+from . import transports
 from .coroutines import coroutine
 from .log import logger
 
@@ -229,6 +232,80 @@ class Server(events.AbstractServer):
         yield from waiter
 
 
+class _SendfileFallbackProtocol(protocols.Protocol):
+    """Protocol temporarily installed on a transport by the sendfile()
+    fallback: it pauses reading and turns the transport's flow control
+    callbacks into a future which the writing loop waits for."""
+
+    def __init__(self, transp):
+        if not isinstance(transp, transports._FlowControlMixin):
+            raise TypeError("transport should be _FlowControlMixin instance")
+        self._transport = transp
+        self._proto = transp.get_protocol()
+        self._should_resume_reading = transp.is_reading()
+        self._should_resume_writing = transp._protocol_paused
+        if self._should_resume_reading:
+            transp.pause_reading()
+        transp.set_protocol(self)
+        if self._should_resume_writing:
+            self._write_ready_fut = self._transport._loop.create_future()
+        else:
+            self._write_ready_fut = None
+
+    @coroutine
+    def drain(self):
+        if self._transport.is_closing():
+            raise ConnectionError("Connection closed by peer")
+        fut = self._write_ready_fut
+        if fut is None:
+            return
+        yield from fut
+
+    def connection_made(self, transport):
+        raise RuntimeError("Invalid state: "
+                           "connection should have been established already.")
+
+    def connection_lost(self, exc):
+        if self._write_ready_fut is not None:
+            # Never happens if peer disconnects after sending the whole
+            # content, thus disconnection is always an exception from the
+            # user perspective
+            if exc is None:
+                self._write_ready_fut.set_exception(
+                    ConnectionError("Connection is closed by peer"))
+            else:
+                self._write_ready_fut.set_exception(exc)
+        self._proto.connection_lost(exc)
+
+    def pause_writing(self):
+        if self._write_ready_fut is not None:
+            return
+        self._write_ready_fut = self._transport._loop.create_future()
+
+    def resume_writing(self):
+        if self._write_ready_fut is None:
+            return
+        self._write_ready_fut.set_result(False)
+        self._write_ready_fut = None
+
+    def data_received(self, data):
+        raise RuntimeError("Invalid state: reading should be paused")
+
+    def eof_received(self):
+        raise RuntimeError("Invalid state: reading should be paused")
+
+    def restore(self):
+        self._transport.set_protocol(self._proto)
+        if self._should_resume_reading:
+            self._transport.resume_reading()
+        if self._write_ready_fut is not None:
+            # Nobody waits for the future anymore since the original
+            # protocol is back in place
+            self._write_ready_fut.cancel()
+        if self._should_resume_writing:
+            self._proto.resume_writing()
+
+
 class BaseEventLoop(events.AbstractEventLoop):
 
     def __init__(self):
@@ -675,6 +752,93 @@ class BaseEventLoop(events.AbstractEventLoop):
     def getnameinfo(self, sockaddr, flags=0):
         return self.run_in_executor(None, socket.getnameinfo, sockaddr, flags)
 
+    @coroutine
+    def sock_sendfile(self, sock, file, offset=0, count=None,
+                      *, fallback=True):
+        """Send a file to a connected socket.
+
+        Use the high-performance os.sendfile() if possible, otherwise
+        read the file in chunks and send them with sock_sendall() (unless
+        fallback is false).
+
+        The file must be a regular file object opened in binary mode.
+        offset tells from where to start reading the file; count is the
+        total number of bytes to transmit (by default, until EOF is
+        reached).  The file position is updated on return, and the total
+        number of bytes sent is returned.
+
+        This method is a coroutine.
+        """
+        if self._debug and sock.gettimeout() != 0:
+            raise ValueError("the socket must be non-blocking")
+        self._check_sendfile_params(sock, file, offset, count)
+        try:
+            return (yield from self._sock_sendfile_native(sock, file,
+                                                          offset, count))
+        except events.SendfileNotAvailableError:
+            if not fallback:
+                raise
+        return (yield from self._sock_sendfile_fallback(sock, file,
+                                                        offset, count))
+
+    @coroutine
+    def _sock_sendfile_native(self, sock, file, offset, count):
+        # NB: sendfile syscall is not supported for SSLSockets and
+        # non-mmap files even if sendfile is supported by OS
+        raise events.SendfileNotAvailableError(
+            "syscall sendfile is not available for socket {!r} "
+            "and file {!r} combination".format(sock, file))
+
+    @coroutine
+    def _sock_sendfile_fallback(self, sock, file, offset, count):
+        if offset:
+            file.seek(offset)
+        blocksize = constants.SENDFILE_FALLBACK_READBUFFER_SIZE
+        if count:
+            blocksize = min(count, blocksize)
+        buf = bytearray(blocksize)
+        total_sent = 0
+        try:
+            while True:
+                if count:
+                    blocksize = min(count - total_sent, blocksize)
+                    if blocksize <= 0:
+                        break
+                view = memoryview(buf)[:blocksize]
+                read = yield from self.run_in_executor(None, file.readinto,
+                                                       view)
+                if not read:
+                    break  # EOF
+                yield from self.sock_sendall(sock, view[:read])
+                total_sent += read
+            return total_sent
+        finally:
+            if total_sent > 0 and hasattr(file, 'seek'):
+                file.seek(offset + total_sent)
+
+    def _check_sendfile_params(self, sock, file, offset, count):
+        if 'b' not in getattr(file, 'mode', 'b'):
+            raise ValueError("file should be opened in binary mode")
+        if not _is_stream_socket(sock):
+            raise ValueError("only SOCK_STREAM type sockets are supported")
+        if count is not None:
+            if not isinstance(count, int):
+                raise TypeError(
+                    "count must be a positive integer "
+                    "(got {!r})".format(count))
+            if count <= 0:
+                raise ValueError(
+                    "count must be a positive integer "
+                    "(got {!r})".format(count))
+        if not isinstance(offset, int):
+            raise TypeError(
+                "offset must be a non-negative integer "
+                "(got {!r})".format(offset))
+        if offset < 0:
+            raise ValueError(
+                "offset must be a non-negative integer "
+                "(got {!r})".format(offset))
+
     @coroutine
     def create_connection(self, protocol_factory, host=None, port=None, *,
                           ssl=None, family=0, proto=0, flags=0, sock=None,
@@ -831,6 +995,92 @@ class BaseEventLoop(events.AbstractEventLoop):
 
         return transport, protocol
 
+    @coroutine
+    def sendfile(self, transport, file, offset=0, count=None,
+                 *, fallback=True):
+        """Send a file to transport.
+
+        Return the total number of bytes which were sent.
+
+        The method uses the high-performance os.sendfile() if available.
+
+        file must be a regular file object opened in binary mode.
+
+        offset tells from where to start reading the file.  If specified,
+        count is the total number of bytes to transmit as opposed to
+        sending the file until EOF is reached.  File position is updated on
+        return or also in case of error in which case file.tell()
+        can be used to figure out the number of bytes
+        which were sent.
+
+        fallback set to True makes asyncio to manually read and send
+        the file when the platform does not support the sendfile syscall
+        (e.g. Windows or SSL socket on Unix).  The fallback respects the
+        transport's write flow control.
+
+        Raise SendfileNotAvailableError if the system does not support
+        sendfile syscall and fallback is False.
+
+        This method is a coroutine.
+        """
+        if transport.is_closing():
+            raise RuntimeError("Transport is closing")
+        mode = getattr(transport, '_sendfile_compatible',
+                       constants._SendfileMode.UNSUPPORTED)
+        if mode is constants._SendfileMode.UNSUPPORTED:
+            raise RuntimeError(
+                "sendfile is not supported for transport {!r}".format(
+                    transport))
+        if mode is constants._SendfileMode.TRY_NATIVE:
+            try:
+                return (yield from self._sendfile_native(transport, file,
+                                                         offset, count))
+            except events.SendfileNotAvailableError:
+                if not fallback:
+                    raise
+
+        if not fallback:
+            raise RuntimeError(
+                "fallback is disabled and native sendfile is not "
+                "supported for transport {!r}".format(transport))
+
+        return (yield from self._sendfile_fallback(transport, file,
+                                                   offset, count))
+
+    @coroutine
+    def _sendfile_native(self, transp, file, offset, count):
+        raise events.SendfileNotAvailableError(
+            "sendfile syscall is not supported")
+
+    @coroutine
+    def _sendfile_fallback(self, transp, file, offset, count):
+        if offset:
+            file.seek(offset)
+        blocksize = constants.SENDFILE_FALLBACK_READBUFFER_SIZE
+        if count:
+            blocksize = min(count, blocksize)
+        total_sent = 0
+        proto = _SendfileFallbackProtocol(transp)
+        try:
+            while True:
+                if count:
+                    blocksize = min(count - total_sent, blocksize)
+                    if blocksize <= 0:
+                        return total_sent
+                # Transports may keep a reference to the data passed to
+                # write(), so a fresh chunk is read every time.
+                data = yield from self.run_in_executor(None, file.read,
+                                                       blocksize)
+                if not data:
+                    return total_sent
+                yield from proto.drain()
+                transp.write(data)
+                total_sent += len(data)
+        finally:
+            if total_sent > 0 and hasattr(file, 'seek'):
+                file.seek(offset + total_sent)
+            proto.restore()
+
     @coroutine
     def create_datagram_endpoint(self, protocol_factory,
                                  local_addr=None, remote_addr=None, *,
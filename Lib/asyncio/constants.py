@@ -1,7 +1,20 @@
 """Constants."""
 
+import enum
+
 # After the connection is lost, log warnings after this many write()s.
 LOG_THRESHOLD_FOR_CONNLOST_WRITES = 5
 
 # Seconds to wait before retrying accept().
 ACCEPT_RETRY_DELAY = 1
+
+# Number of bytes read from the file per iteration when sendfile() falls
+# back to reading and writing.
+SENDFILE_FALLBACK_READBUFFER_SIZE = 1024 * 256
+
+
+# How a transport can be used with loop.sendfile().
+class _SendfileMode(enum.Enum):
+    UNSUPPORTED = 1
+    TRY_NATIVE = 2
+    FALLBACK = 3
@@ -7,6 +7,7 @@ __all__ = ['AbstractEventLoopPolicy',
            'get_event_loop', 'set_event_loop', 'new_event_loop',
            'get_child_watcher', 'set_child_watcher',
            '_set_running_loop', '_get_running_loop',
+           'SendfileNotAvailableError',
            ]
 
 import functools
@@ -21,6 +22,14 @@ import traceback
 from asyncio import compat
 
 
+class SendfileNotAvailableError(RuntimeError):
+    """Sendfile syscall is not available.
+
+    Raised if the OS does not support the sendfile syscall for the given
+    socket or file type.
+    """
+
+
 def _get_function_source(func):
     if compat.PY34:
         func = inspect.unwrap(func)
@@ -474,6 +483,18 @@ class AbstractEventLoop:
     def sock_accept(self, sock):
         raise NotImplementedError
 
+    def sock_sendfile(self, sock, file, offset=0, count=None,
+                      *, fallback=True):
+        raise NotImplementedError
+
+    def sendfile(self, transport, file, offset=0, count=None,
+                 *, fallback=True):
+        """Send a file through a transport.
+
+        Return the total number of bytes sent.
+        """
+        raise NotImplementedError
+
     # Signal handling.
 
     def add_signal_handler(self, sig, callback, *args):
@@ -13,6 +13,7 @@ from . import base_events
 from . import compat
 from . import constants
 from . import futures
+from . import protocols
 from . import sslproto
 from . import transports
 from .log import logger
@@ -177,6 +178,9 @@ class _ProactorReadPipeTransport(_ProactorBasePipeTransport,
         if self._loop.get_debug():
             logger.debug("%r resumes reading", self)
 
+    def is_reading(self):
+        return not self._paused and not self._closing
+
     def _loop_reading(self, fut=None):
         if self._paused:
             return
@@ -217,7 +221,11 @@ class _ProactorReadPipeTransport(_ProactorBasePipeTransport,
             self._read_fut.add_done_callback(self._loop_reading)
         finally:
             if data:
-                self._protocol.data_received(data)
+                if isinstance(self._protocol, protocols.BufferedProtocol):
+                    protocols._feed_data_to_buffered_proto(self._protocol,
+                                                           data)
+                else:
+                    self._protocol.data_received(data)
             elif data is not None:
                 if self._loop.get_debug():
                     logger.debug("%r received EOF", self)
@@ -349,6 +357,8 @@ class _ProactorSocketTransport(_ProactorReadPipeTransport,
                                transports.Transport):
     """Transport for connected sockets."""
 
+    _sendfile_compatible = constants._SendfileMode.FALLBACK
+
     def _set_extra(self, sock):
         self._extra['socket'] = sock
         try:
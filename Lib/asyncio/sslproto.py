@@ -7,6 +7,7 @@ except ImportError:  # pragma: no cover
 
 from . import base_events
 from . import compat
+from . import constants
 from . import protocols
 from . import transports
 from .log import logger
@@ -294,6 +295,8 @@ class _SSLPipe(object):
 class _SSLProtocolTransport(transports._FlowControlMixin,
                             transports.Transport):
 
+    _sendfile_compatible = constants._SendfileMode.FALLBACK
+
     def __init__(self, loop, ssl_protocol, app_protocol):
         self._loop = loop
         # SSLProtocol instance
@@ -307,6 +310,7 @@ class _SSLProtocolTransport(transports._FlowControlMixin,
 
     def set_protocol(self, protocol):
         self._app_protocol = protocol
+        self._ssl_protocol._set_app_protocol(protocol)
 
     def get_protocol(self):
         return self._app_protocol
@@ -351,6 +355,17 @@ class _SSLProtocolTransport(transports._FlowControlMixin,
         """
         self._ssl_protocol._transport.resume_reading()
 
+    def is_reading(self):
+        tr = self._ssl_protocol._transport
+        if tr is None:
+            raise RuntimeError('SSL transport has not been initialized yet')
+        return tr.is_reading()
+
+    @property
+    def _protocol_paused(self):
+        # Required for sendfile fallback pause_writing/resume_writing logic
+        return self._ssl_protocol._transport._protocol_paused
+
     def set_write_buffer_limits(self, high=None, low=None):
         """Set the high- and low-water limits for write flow control.
 
@@ -435,7 +450,7 @@ class SSLProtocol(protocols.Protocol):
 
         self._waiter = waiter
         self._loop = loop
-        self._app_protocol = app_protocol
+        self._set_app_protocol(app_protocol)
         self._app_transport = _SSLProtocolTransport(self._loop,
                                                     self, self._app_protocol)
         # _SSLPipe instance (None until the connection is made)
@@ -447,6 +462,11 @@ class SSLProtocol(protocols.Protocol):
         self._transport = None
         self._call_connection_made = call_connection_made
 
+    def _set_app_protocol(self, app_protocol):
+        self._app_protocol = app_protocol
+        self._app_protocol_is_buffer = isinstance(app_protocol,
+                                                  protocols.BufferedProtocol)
+
     def _wakeup_waiter(self, exc=None):
         if self._waiter is None:
             return
@@ -513,7 +533,11 @@ class SSLProtocol(protocols.Protocol):
 
         for chunk in appdata:
             if chunk:
-                self._app_protocol.data_received(chunk)
+                if self._app_protocol_is_buffer:
+                    protocols._feed_data_to_buffered_proto(
+                        self._app_protocol, chunk)
+                else:
+                    self._app_protocol.data_received(chunk)
             else:
                 self._start_shutdown()
                 break
@@ -21,6 +21,14 @@ from .log import logger
 
 _DEFAULT_LIMIT = 2 ** 16
 
+# Size of the receive buffer of StreamReaderProtocol.  Unlike the bytes
+# object returned by recv(), which is freed once consumed, the buffer is
+# kept for the life of the connection, so it is smaller than the 256 KiB
+# read at once by selector transports to bound the memory held by idle
+# connections.  The default StreamReader pauses reading once it holds twice
+# its limit anyway, so larger reads would mostly go past that point.
+_RECV_BUFFER_SIZE = _DEFAULT_LIMIT
+
 
 class IncompleteReadError(EOFError):
     """
@@ -211,13 +219,20 @@ class FlowControlMixin(protocols.Protocol):
         yield from waiter
 
 
-class StreamReaderProtocol(FlowControlMixin, protocols.Protocol):
+class StreamReaderProtocol(FlowControlMixin, protocols.Protocol,
+                           protocols.BufferedProtocol):
     """Helper class to adapt between Protocol and StreamReader.
 
     (This is a helper class instead of making StreamReader itself a
     Protocol subclass, because the StreamReader has other potential
     uses, and to prevent the user of the StreamReader to accidentally
     call inappropriate methods of the protocol.)
+
+    Transports which support BufferedProtocol read into a receive
+    buffer owned by the protocol, which is then appended to the
+    StreamReader's buffer without creating an intermediate bytes object.
+    If a subclass overrides data_received(), the received data is passed
+    to it instead.
     """
 
     def __init__(self, stream_reader, client_connected_cb=None, loop=None):
@@ -226,6 +241,7 @@ class StreamReaderProtocol(FlowControlMixin, protocols.Protocol):
         self._stream_writer = None
         self._client_connected_cb = client_connected_cb
         self._over_ssl = False
+        self._recv_buffer = None
 
     def connection_made(self, transport):
         self._stream_reader.set_transport(transport)
@@ -248,10 +264,26 @@ class StreamReaderProtocol(FlowControlMixin, protocols.Protocol):
         super().connection_lost(exc)
         self._stream_reader = None
         self._stream_writer = None
+        self._recv_buffer = None
 
     def data_received(self, data):
         self._stream_reader.feed_data(data)
 
+    def get_buffer(self, sizehint):
+        # The buffer is allocated lazily and reused for every read: its
+        # content is copied into the StreamReader by buffer_updated().
+        if self._recv_buffer is None:
+            self._recv_buffer = memoryview(bytearray(_RECV_BUFFER_SIZE))
+        return self._recv_buffer
+
+    def buffer_updated(self, nbytes):
+        data = self._recv_buffer[:nbytes]
+        if type(self).data_received is not StreamReaderProtocol.data_received:
+            # Subclasses overriding data_received() keep getting the data
+            self.data_received(bytes(data))
+        else:
+            self._stream_reader.feed_data(data)
+
     def eof_received(self):
         self._stream_reader.feed_eof()
         if self._over_ssl:
@@ -61,6 +61,10 @@ class ReadTransport(BaseTransport):
         """
         raise NotImplementedError
 
+    def is_reading(self):
+        """Return True if the transport is receiving."""
+        raise NotImplementedError
+
 
 class WriteTransport(BaseTransport):
     """Interface for write-only transports."""
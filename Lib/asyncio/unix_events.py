@@ -18,6 +18,7 @@ from . import constants
 from . import coroutines
 from . import events
 from . import futures
+from . import protocols
 from . import selector_events
 from . import selectors
 from . import transports
@@ -333,6 +334,7 @@ class _UnixReadPipeTransport(transports.ReadTransport):
         self._fileno = pipe.fileno()
         self._protocol = protocol
         self._closing = False
+        self._paused = False
 
         mode = os.fstat(self._fileno).st_mode
         if not (stat.S_ISFIFO(mode) or
@@ -385,7 +387,11 @@ class _UnixReadPipeTransport(transports.ReadTransport):
             self._fatal_error(exc, 'Fatal read error on pipe transport')
         else:
             if data:
-                self._protocol.data_received(data)
+                if isinstance(self._protocol, protocols.BufferedProtocol):
+                    protocols._feed_data_to_buffered_proto(self._protocol,
+                                                           data)
+                else:
+                    self._protocol.data_received(data)
             else:
                 if self._loop.get_debug():
                     logger.info("%r was closed by peer", self)
@@ -396,9 +402,14 @@ class _UnixReadPipeTransport(transports.ReadTransport):
 
     def pause_reading(self):
         self._loop._remove_reader(self._fileno)
+        self._paused = True
 
     def resume_reading(self):
         self._loop._add_reader(self._fileno, self._read_ready)
+        self._paused = False
+
+    def is_reading(self):
+        return not self._paused and not self._closing
 
     def set_protocol(self, protocol):
         self._protocol = protocol
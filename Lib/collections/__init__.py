@@ -43,6 +43,11 @@ try:
 except ImportError:
     pass
 
+try:
+    from _collections import _tuplegetter
+except ImportError:
+    _tuplegetter = lambda index, doc: property(_itemgetter(index), doc=doc)
+
 
 ################################################################################
 ### OrderedDict
@@ -355,6 +360,70 @@ _field_template = '''\
     {name} = _property(_itemgetter({index:d}), doc='Alias for field number {index:d}')
 '''
 
+def _namedtuple_source(typename, field_names):
+    'Return the pure Python source code of a named tuple class.'
+    return _class_template.format(
+        typename = typename,
+        field_names = tuple(field_names),
+        num_fields = len(field_names),
+        arg_list = repr(tuple(field_names)).replace("'", "")[1:-1],
+        repr_fmt = ', '.join(_repr_template.format(name=name)
+                             for name in field_names),
+        field_defs = '\n'.join(_field_template.format(index=index, name=name)
+                               for index, name in enumerate(field_names))
+    )
+
+class _NamedTupleSource:
+    'Descriptor computing the _source attribute on first access.'
+
+    def __init__(self, typename, field_names):
+        self.typename = typename
+        self.field_names = field_names
+        self.source = None
+
+    def __get__(self, instance, owner):
+        if self.source is None:
+            self.source = _namedtuple_source(self.typename, self.field_names)
+        return self.source
+
+# Docstrings of the field descriptors, keyed by field index.
+_nt_field_docs = {}
+
+# types.FunctionType and types.CodeType; importing types here would be
+# circular, since types imports functools which imports collections.
+def _f(): pass
+_FunctionType = type(_f)
+_CodeType = type(_f.__code__)
+del _f
+
+# Code objects of __new__ methods, keyed by number of fields.  They only
+# differ in the names of their arguments, which are filled in per class.
+_nt_new_code = {}
+
+def _make_new(typename, field_names):
+    'Return the __new__ method of a named tuple class.'
+    num_fields = len(field_names)
+    try:
+        code = _nt_new_code[num_fields]
+    except KeyError:
+        names = tuple('_%d' % index for index in range(num_fields))
+        arg_list = repr(names).replace("'", "")[1:-1]
+        source = ('def __new__(_cls, %s): return _tuple_new(_cls, (%s))'
+                  % (arg_list, arg_list))
+        code = compile(source, '<string>', 'exec').co_consts[0]
+        _nt_new_code[num_fields] = code
+    code = _CodeType(code.co_argcount, code.co_kwonlyargcount,
+                     code.co_nlocals, code.co_stacksize, code.co_flags,
+                     code.co_code, code.co_consts, code.co_names,
+                     ('_cls',) + tuple(field_names), code.co_filename,
+                     code.co_name, code.co_firstlineno, code.co_lnotab,
+                     code.co_freevars, code.co_cellvars)
+    # Support tracing utilities by setting a value for
+    # __new__.__globals__['__name__']
+    namespace = {'_tuple_new': tuple.__new__,
+                 '__name__': 'namedtuple_%s' % typename}
+    return _FunctionType(code, namespace)
+
 def namedtuple(typename, field_names, *, verbose=False, rename=False, module=None):
     """Returns a new subclass of tuple with named fields.
 
@@ -412,24 +481,87 @@ def namedtuple(typename, field_names, *, verbose=False, rename=False, module=Non
             raise ValueError('Encountered duplicate field name: %r' % name)
         seen.add(name)
 
-    # Fill-in the class template
-    class_definition = _class_template.format(
-        typename = typename,
-        field_names = tuple(field_names),
-        num_fields = len(field_names),
-        arg_list = repr(tuple(field_names)).replace("'", "")[1:-1],
-        repr_fmt = ', '.join(_repr_template.format(name=name)
-                             for name in field_names),
-        field_defs = '\n'.join(_field_template.format(index=index, name=name)
-                               for index, name in enumerate(field_names))
-    )
+    if verbose:
+        import warnings
+        warnings.warn("the verbose parameter of namedtuple() is deprecated, "
+                      "print the _source attribute instead",
+                      DeprecationWarning, stacklevel=2)
+
+    # Variables used in the methods and docstrings
+    field_names = tuple(map(_sys.intern, field_names))
+    num_fields = len(field_names)
+    arg_list = repr(field_names).replace("'", "")[1:-1]
+    repr_fmt = '(' + ', '.join(_repr_template.format(name=name)
+                               for name in field_names) + ')'
+    tuple_new = tuple.__new__
+    _len = len
+
+    # Create all the named tuple methods to be added to the class namespace.
+    # Only __new__ needs a code object of its own, for its argument names.
+
+    __new__ = _make_new(typename, field_names)
+    __new__.__doc__ = 'Create new instance of %s(%s)' % (typename, arg_list)
+
+    @classmethod
+    def _make(cls, iterable):
+        result = tuple_new(cls, iterable)
+        if _len(result) != num_fields:
+            raise TypeError('Expected %d arguments, got %d'
+                            % (num_fields, len(result)))
+        return result
+
+    _make.__func__.__doc__ = ('Make a new %s object from a sequence '
+                              'or iterable' % typename)
+
+    def _replace(_self, **kwds):
+        result = _self._make(map(kwds.pop, field_names, _self))
+        if kwds:
+            raise ValueError('Got unexpected field names: %r' % list(kwds))
+        return result
+
+    _replace.__doc__ = ('Return a new %s object replacing specified '
+                        'fields with new values' % typename)
+
+    def __repr__(self):
+        'Return a nicely formatted representation string'
+        return self.__class__.__name__ + repr_fmt % self
+
+    def _asdict(self):
+        'Return a new OrderedDict which maps field names to their values.'
+        return OrderedDict(zip(self._fields, self))
+
+    def __getnewargs__(self):
+        'Return self as a plain tuple.  Used by copy and pickle.'
+        return tuple(self)
+
+    # Modify function metadata to help with introspection and debugging
+    for method in (__new__, _make.__func__, _replace,
+                   __repr__, _asdict, __getnewargs__):
+        method.__qualname__ = '%s.%s' % (typename, method.__name__)
+
+    # Build-up the class namespace dictionary
+    # and use type() to build the result class
+    class_namespace = {
+        '__doc__': '%s(%s)' % (typename, arg_list),
+        '__slots__': (),
+        '_fields': field_names,
+        '_source': _NamedTupleSource(typename, field_names),
+        '__new__': __new__,
+        '_make': _make,
+        '_replace': _replace,
+        '__repr__': __repr__,
+        '_asdict': _asdict,
+        '__getnewargs__': __getnewargs__,
+    }
+    cache = _nt_field_docs
+    for index, name in enumerate(field_names):
+        try:
+            doc = cache[index]
+        except KeyError:
+            doc = cache[index] = 'Alias for field number %d' % index
+        class_namespace[name] = _tuplegetter(index, doc)
 
-    # Execute the template string in a temporary namespace and support
-    # tracing utilities by setting a value for frame.f_globals['__name__']
-    namespace = dict(__name__='namedtuple_%s' % typename)
-    exec(class_definition, namespace)
-    result = namespace[typename]
-    result._source = class_definition
+    result = type(typename, (tuple,), class_namespace)
     if verbose:
         print(result._source)
 
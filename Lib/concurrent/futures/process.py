@@ -50,8 +50,7 @@ import os
 from concurrent.futures import _base
 import queue
 from queue import Full
-import multiprocessing
-from multiprocessing import SimpleQueue
+import multiprocessing as mp
 from multiprocessing.connection import wait
 import threading
 import weakref
@@ -120,10 +119,11 @@ class _WorkItem(object):
         self.kwargs = kwargs
 
 class _ResultItem(object):
-    def __init__(self, work_id, exception=None, result=None):
+    def __init__(self, work_id, exception=None, result=None, exit_pid=None):
         self.work_id = work_id
         self.exception = exception
         self.result = result
+        self.exit_pid = exit_pid
 
 class _CallItem(object):
     def __init__(self, work_id, fn, args, kwargs):
@@ -152,7 +152,8 @@ def _process_chunk(fn, chunk):
     """
     return [fn(*args) for args in chunk]
 
-def _process_worker(call_queue, result_queue):
+def _process_worker(call_queue, result_queue, initializer, initargs,
+                    max_tasks=None):
     """Evaluates calls from call_queue and places the results in result_queue.
 
     This worker is run in a separate process.
@@ -162,23 +163,58 @@ def _process_worker(call_queue, result_queue):
             evaluated by the worker.
         result_queue: A multiprocessing.Queue of _ResultItems that will written
             to by the worker.
-        shutdown: A multiprocessing.Event that will be set as a signal to the
-            worker that it should exit when call_queue is empty.
+        initializer: A callable initializer, or None
+        initargs: A tuple of args for the initializer
+        max_tasks: The number of calls after which the worker exits so that
+            it can be replaced by a fresh process, or None.
     """
+    if initializer is not None:
+        try:
+            initializer(*initargs)
+        except BaseException:
+            _base.LOGGER.critical('Exception in initializer:', exc_info=True)
+            # The parent will notice that the process stopped and
+            # mark the pool broken
+            return
+    num_tasks = 0
+    exit_pid = None
     while True:
         call_item = call_queue.get(block=True)
         if call_item is None:
             # Wake up queue management thread
             result_queue.put(os.getpid())
             return
+        if max_tasks is not None:
+            num_tasks += 1
+            if num_tasks >= max_tasks:
+                exit_pid = os.getpid()
         try:
             r = call_item.fn(*call_item.args, **call_item.kwargs)
         except BaseException as e:
             exc = _ExceptionWithTraceback(e, e.__traceback__)
-            result_queue.put(_ResultItem(call_item.work_id, exception=exc))
+            result_queue.put(_ResultItem(call_item.work_id, exception=exc,
+                                         exit_pid=exit_pid))
         else:
-            result_queue.put(_ResultItem(call_item.work_id,
-                                         result=r))
+            result_queue.put(_ResultItem(call_item.work_id, result=r,
+                                         exit_pid=exit_pid))
+            del r
+        # Delete references to object. See issue16284
+        del call_item
+        if exit_pid is not None:
+            return
+
+def _start_process(mp_context, call_queue, result_queue, initializer,
+                   initargs, max_tasks):
+    """Starts a worker process from the given context and returns it."""
+    p = mp_context.Process(
+            target=_process_worker,
+            args=(call_queue,
+                  result_queue,
+                  initializer,
+                  initargs,
+                  max_tasks))
+    p.start()
+    return p
 
 def _add_call_item_to_queue(pending_work_items,
                             work_ids,
@@ -222,7 +258,8 @@ def _queue_management_worker(executor_reference,
                              pending_work_items,
                              work_ids_queue,
                              call_queue,
-                             result_queue):
+                             result_queue,
+                             start_process):
     """Manages the communication between this process and the worker processes.
 
     This function is run in a local thread.
@@ -240,6 +277,8 @@ def _queue_management_worker(executor_reference,
             derived from _WorkItems for processing by the process workers.
         result_queue: A multiprocessing.Queue of _ResultItems generated by the
             process workers.
+        start_process: A callable starting a new worker process, used to
+            replace workers that exited after max_tasks_per_child calls.
     """
     executor = None
 
@@ -313,6 +352,19 @@ def _queue_management_worker(executor_reference,
                     work_item.future.set_result(result_item.result)
                 # Delete references to object. See issue16284
                 del work_item
+            if result_item.exit_pid is not None:
+                # The worker reached max_tasks_per_child and exited: replace
+                # it unless there is nothing left for it to do.
+                p = processes.pop(result_item.exit_pid)
+                p.join()
+                executor = executor_reference()
+                if pending_work_items or not shutting_down():
+                    p = start_process()
+                    processes[p.pid] = p
+                executor = None
+            # Delete reference to result_item to avoid keeping references
+            # while waiting on new results.
+            del result_item
         # Check whether we should start shutting down.
         executor = executor_reference()
         # No more work items can be added if:
@@ -357,7 +409,7 @@ def _check_system_limits():
     raise NotImplementedError(_system_limited)
 
 
-class BrokenProcessPool(RuntimeError):
+class BrokenProcessPool(_base.BrokenExecutor):
     """
     Raised when a process in a ProcessPoolExecutor terminated abruptly
     while a future was in the running state.
@@ -365,13 +417,24 @@ class BrokenProcessPool(RuntimeError):
 
 
 class ProcessPoolExecutor(_base.Executor):
-    def __init__(self, max_workers=None):
+    def __init__(self, max_workers=None, mp_context=None,
+                 initializer=None, initargs=(), *, max_tasks_per_child=None):
         """Initializes a new ProcessPoolExecutor instance.
 
         Args:
             max_workers: The maximum number of processes that can be used to
                 execute the given calls. If None or not given then as many
                 worker processes will be created as the machine has processors.
+            mp_context: A multiprocessing context to launch the workers. This
+                object should provide SimpleQueue, Queue and Process. If None,
+                the default context is used, or "spawn" when
+                max_tasks_per_child is given.
+            initializer: A callable used to initialize worker processes.
+            initargs: A tuple of arguments to pass to the initializer.
+            max_tasks_per_child: The maximum number of tasks a worker process
+                can complete before it will exit and be replaced with a fresh
+                worker process. The default of None means worker processes
+                will live as long as the executor.
         """
         _check_system_limits()
 
@@ -383,16 +446,40 @@ class ProcessPoolExecutor(_base.Executor):
 
             self._max_workers = max_workers
 
+        if initializer is not None and not callable(initializer):
+            raise TypeError("initializer must be a callable")
+        self._initializer = initializer
+        self._initargs = initargs
+
+        if max_tasks_per_child is not None:
+            if not isinstance(max_tasks_per_child, int):
+                raise TypeError("max_tasks_per_child must be an integer")
+            elif max_tasks_per_child <= 0:
+                raise ValueError("max_tasks_per_child must be >= 1")
+            # Replacement workers are started from the queue management
+            # thread, and forking a multi-threaded process is unsafe.
+            if mp_context is None:
+                mp_context = mp.get_context("spawn")
+            elif mp_context.get_start_method(allow_none=False) == "fork":
+                raise ValueError("max_tasks_per_child is incompatible with"
+                                 " the 'fork' multiprocessing start method;"
+                                 " supply a different mp_context.")
+        self._max_tasks_per_child = max_tasks_per_child
+
+        if mp_context is None:
+            mp_context = mp.get_context()
+        self._mp_context = mp_context
+
         # Make the call queue slightly larger than the number of processes to
         # prevent the worker processes from idling. But don't make it too big
         # because futures in the call queue cannot be cancelled.
-        self._call_queue = multiprocessing.Queue(self._max_workers +
-                                                 EXTRA_QUEUED_CALLS)
+        queue_size = self._max_workers + EXTRA_QUEUED_CALLS
+        self._call_queue = mp_context.Queue(queue_size)
         # Killed worker processes can produce spurious "broken pipe"
         # tracebacks in the queue's own worker thread. But we detect killed
         # processes anyway, so silence the tracebacks.
         self._call_queue._ignore_epipe = True
-        self._result_queue = SimpleQueue()
+        self._result_queue = mp_context.SimpleQueue()
         self._work_ids = queue.Queue()
         self._queue_management_thread = None
         # Map of pids to processes
@@ -420,18 +507,26 @@ class ProcessPoolExecutor(_base.Executor):
                           self._pending_work_items,
                           self._work_ids,
                           self._call_queue,
-                          self._result_queue))
+                          self._result_queue,
+                          partial(_start_process,
+                                  self._mp_context,
+                                  self._call_queue,
+                                  self._result_queue,
+                                  self._initializer,
+                                  self._initargs,
+                                  self._max_tasks_per_child)))
             self._queue_management_thread.daemon = True
             self._queue_management_thread.start()
             _threads_queues[self._queue_management_thread] = self._result_queue
 
     def _adjust_process_count(self):
         for _ in range(len(self._processes), self._max_workers):
-            p = multiprocessing.Process(
-                    target=_process_worker,
-                    args=(self._call_queue,
-                          self._result_queue))
-            p.start()
+            p = _start_process(self._mp_context,
+                               self._call_queue,
+                               self._result_queue,
+                               self._initializer,
+                               self._initargs,
+                               self._max_tasks_per_child)
             self._processes[p.pid] = p
 
     def submit(self, fn, *args, **kwargs):
@@ -44,9 +44,9 @@ class PythonValuesTestCase(unittest.TestCase):
         # array is marked by an entry containing a NULL name and zero
         # size.
 
-        # In standard Python, this table contains a __hello__
-        # module, and a __phello__ package containing a spam
-        # module.
+        # In standard Python, this table contains the startup modules of
+        # the standard library, a __hello__ module, and a __phello__
+        # package containing a spam module.
         class struct_frozen(Structure):
             _fields_ = [("name", c_char_p),
                         ("code", POINTER(c_ubyte)),
@@ -61,6 +61,8 @@ class PythonValuesTestCase(unittest.TestCase):
         # found, but don't worry about its size too much.  The same
         # applies to _frozen_importlib_external.
         bootstrap_seen = []
+        # The startup modules of the standard library come first.
+        stdlib_seen = {}
         bootstrap_expected = [
                 b'_frozen_importlib',
                 b'_frozen_importlib_external',
@@ -77,7 +79,13 @@ class PythonValuesTestCase(unittest.TestCase):
                 self.assertTrue(entry.size,
                     "{!r} was reported as having no size".format(entry.name))
                 continue
-            items.append((entry.name.decode("ascii"), entry.size))
+            name = entry.name.decode("ascii")
+            if not name.startswith("__"):
+                stdlib_seen[name] = entry.size
+                self.assertEqual(items, [])
+                self.assertEqual(bootstrap_seen, [])
+                continue
+            items.append((name, entry.size))
 
         expected = [("__hello__", 139),
                     ("__phello__", -139),
@@ -89,6 +97,9 @@ class PythonValuesTestCase(unittest.TestCase):
         self.assertEqual(sorted(bootstrap_seen), bootstrap_expected,
             "frozen bootstrap modules did not match PyImport_FrozenModules")
 
+        self.assertGreater(stdlib_seen["os"], 0)
+        self.assertLess(stdlib_seen["encodings"], 0)
+
         from ctypes import _pointer_type_cache
         del _pointer_type_cache[struct_frozen]
 
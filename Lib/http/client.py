@@ -70,6 +70,7 @@ Req-sent-unread-response       _CS_REQ_SENT       <response_class>
 
 import email.parser
 import email.message
+from email._policybase import compat32
 import http
 import io
 import re
@@ -112,6 +113,12 @@ MAXAMOUNT = 1048576
 _MAXLINE = 65536
 _MAXHEADERS = 100
 
+# A header line that the email package would parse into a plain
+# (name, value) pair without recording any defect: see headerRE in
+# email.feedparser and Compat32.header_source_parse().
+_simple_header_line = re.compile(
+    r'([\041-\071\073-\176]+):[ \t]*([^\r\n]*)\r?\n?\Z').match
+
 # Header name/value ABNF (http://tools.ietf.org/html/rfc7230#section-3.2)
 #
 # VCHAR          = %x21-7E
@@ -190,15 +197,11 @@ class HTTPMessage(email.message.Message):
                 lst.append(line)
         return lst
 
-def parse_headers(fp, _class=HTTPMessage):
-    """Parses only RFC2822 headers from a file pointer.
-
-    email Parser wants to see strings rather than bytes.
-    But a TextIOWrapper around self.rfile would buffer too many bytes
-    from the stream, bytes which we later need to read as bytes.
-    So we read the correct bytes here, as bytes, for email Parser
-    to parse.
+def _read_headers(fp):
+    """Reads potential header lines into a list from a file pointer.
 
+    Length of line is limited by _MAXLINE, and number of
+    headers is limited by _MAXHEADERS.
     """
     headers = []
     while True:
@@ -210,9 +213,61 @@ def parse_headers(fp, _class=HTTPMessage):
             raise HTTPException("got more than %d headers" % _MAXHEADERS)
         if line in (b'\r\n', b'\n', b''):
             break
-    hstring = b''.join(headers).decode('iso-8859-1')
+    return headers
+
+def _split_simple_headers(header_lines):
+    """Returns the (name, value) pairs of plain "Name: value" lines.
+
+    None is returned if any line needs the full email parser: folded
+    (continuation) lines, malformed lines, or a multipart/* or message/*
+    content type, for which the email package also parses the body.
+    """
+    headers = []
+    for line in header_lines:
+        if line in (b'\r\n', b'\n', b''):
+            break
+        match = _simple_header_line(line.decode('iso-8859-1'))
+        if match is None:
+            return None
+        name, value = match.groups()
+        if name.lower() == 'content-type':
+            ctype = value.lower()
+            if 'multipart' in ctype or 'message' in ctype:
+                return None
+        headers.append((name, value))
+    return headers
+
+def _parse_header_lines(header_lines, _class=HTTPMessage):
+    """Builds a message object of class _class from raw header lines.
+
+    Plain header lines are stored on the message directly, exactly as
+    the email package would store them; anything else is left to
+    email.parser so that the resulting message is the same either way.
+    """
+    msg = _class()
+    if msg.policy is compat32:
+        headers = _split_simple_headers(header_lines)
+        if headers is not None:
+            msg._headers = headers
+            msg.set_payload('')
+            return msg
+    hstring = b''.join(header_lines).decode('iso-8859-1')
     return email.parser.Parser(_class=_class).parsestr(hstring)
 
+def parse_headers(fp, _class=HTTPMessage):
+    """Parses only RFC2822 headers from a file pointer.
+
+    email Parser wants to see strings rather than bytes.
+    But a TextIOWrapper around self.rfile would buffer too many bytes
+    from the stream, bytes which we later need to read as bytes.
+    So we read the correct bytes here, as bytes, and build the message
+    from them directly, falling back to the email Parser for anything
+    but plain "Name: value" lines.
+
+    """
+    headers = _read_headers(fp)
+    return _parse_header_lines(headers, _class)
+
 
 class HTTPResponse(io.BufferedIOBase):
 
@@ -750,6 +750,20 @@ class BuiltinImporter:
     load_module = classmethod(_load_module_shim)
 
 
+def _locate_frozen_source(code):
+    """Return the path of the source file of a frozen module, or None.
+
+    The startup modules of the standard library are frozen with a file name
+    relative to the standard library directory, which is resolved and set
+    on the code object once the path-based import system is installed.
+    Other frozen modules have no source.
+
+    """
+    if _bootstrap_external is None:
+        return None
+    return _bootstrap_external._locate_frozen_source(code)
+
+
 class FrozenImporter:
 
     """Meta path import for frozen modules.
@@ -795,6 +809,13 @@ class FrozenImporter:
             raise ImportError('{!r} is not a frozen module'.format(name),
                               name=name)
         code = _call_with_frames_removed(_imp.get_frozen_object, name)
+        path = _locate_frozen_source(code)
+        if path is not None:
+            # A frozen module of the standard library: point to its source.
+            module.__file__ = path
+            locations = module.__spec__.submodule_search_locations
+            if locations is not None and not locations:
+                locations.append(_bootstrap_external._path_split(path)[0])
         exec(code, module.__dict__)
 
     @classmethod
@@ -810,7 +831,9 @@ class FrozenImporter:
     @_requires_frozen
     def get_code(cls, fullname):
         """Return the code object for the frozen module."""
-        return _imp.get_frozen_object(fullname)
+        code = _imp.get_frozen_object(fullname)
+        _locate_frozen_source(code)
+        return code
 
     @classmethod
     @_requires_frozen
@@ -1192,8 +1192,14 @@ class FileFinder:
     Interactions with the file system are cached for performance, being
     refreshed when the directory the finder is handling has been modified.
 
+    If _persistent_cache is true, the directory listing is also saved to
+    the __pycache__ subdirectory, when there is one, so that other processes
+    can reuse it as long as the directory is not modified.
+
     """
 
+    _persistent_cache = False
+
     def __init__(self, path, *loader_details):
         """Initialize with the path to search on and a variable number of
         2-tuples containing the loader and the file suffixes the loader
@@ -1243,7 +1249,7 @@ class FileFinder:
         except OSError:
             mtime = -1
         if mtime != self._path_mtime:
-            self._fill_cache()
+            self._fill_cache(mtime)
             self._path_mtime = mtime
         # tail_module keeps the original casing, for __file__ and friends
         if _relax_case():
@@ -1279,15 +1285,23 @@ class FileFinder:
             return spec
         return None
 
-    def _fill_cache(self):
+    def _fill_cache(self, mtime=-1):
         """Fill the cache of potential modules and packages for this directory."""
         path = self.path
-        try:
-            contents = _os.listdir(path or _os.getcwd())
-        except (FileNotFoundError, PermissionError, NotADirectoryError):
-            # Directory has either been removed, turned into a file, or made
-            # unreadable.
-            contents = []
+        persistent = self._persistent_cache and mtime != -1
+        contents = None
+        if persistent:
+            contents = self._read_dir_cache(mtime)
+        if contents is None:
+            try:
+                contents = _os.listdir(path or _os.getcwd())
+            except (FileNotFoundError, PermissionError, NotADirectoryError):
+                # Directory has either been removed, turned into a file, or
+                # made unreadable.
+                contents = []
+            else:
+                if persistent:
+                    self._write_dir_cache(mtime, contents)
         # We store two cached versions, to handle runtime changes of the
         # PYTHONCASEOK environment variable.
         if not sys.platform.startswith('win'):
@@ -1310,6 +1324,57 @@ class FileFinder:
         if sys.platform.startswith(_CASE_INSENSITIVE_PLATFORMS):
             self._relaxed_path_cache = {fn.lower() for fn in contents}
 
+    def _dir_cache_path(self):
+        """Return the path of the persistent directory listing, or None."""
+        tag = sys.implementation.cache_tag
+        if tag is None:
+            return None
+        return _path_join(self.path, _PYCACHE, _DIR_CACHE_PREFIX + tag)
+
+    def _read_dir_cache(self, mtime):
+        """Return the persistent listing of the directory, or None if there is
+        none or it may be out of date."""
+        cache_path = self._dir_cache_path()
+        if cache_path is None:
+            return None
+        try:
+            # The directory could have been modified right after it was
+            # listed without its mtime changing: only trust listings written
+            # long enough after the last modification.
+            if _path_stat(cache_path).st_mtime - mtime < _DIR_CACHE_MIN_AGE:
+                return None
+            with _io.FileIO(cache_path, 'r') as file:
+                data = file.read()
+        except OSError:
+            return None
+        header, _, names = data.partition(b'\n')
+        if header != _dir_cache_header(mtime):
+            return None
+        _bootstrap._verbose_message('directory listing of {} read from {}',
+                                    self.path, cache_path, verbosity=2)
+        return names.decode('utf-8', 'surrogatepass').split('\n')
+
+    def _write_dir_cache(self, mtime, contents):
+        """Save the listing of the directory to its __pycache__ subdirectory,
+        if it has one."""
+        if sys.dont_write_bytecode or _PYCACHE not in contents:
+            return
+        cache_path = self._dir_cache_path()
+        if cache_path is None:
+            return
+        names = '\n'.join(contents)
+        if len(names.split('\n')) != len(contents):
+            # A file name contains a newline.
+            return
+        data = (_dir_cache_header(mtime) + b'\n'
+                + names.encode('utf-8', 'surrogatepass'))
+        try:
+            _write_atomic(cache_path, data)
+        except OSError:
+            return
+        _bootstrap._verbose_message('directory listing of {} written to {}',
+                                    self.path, cache_path, verbosity=2)
+
     @classmethod
     def path_hook(cls, *loader_details):
         """A class method which returns a closure to use on sys.path_hook
@@ -1332,6 +1397,50 @@ class FileFinder:
         return 'FileFinder({!r})'.format(self.path)
 
 
+# Persistent directory listings of FileFinder are saved to
+# __pycache__/dircache.<cache_tag>.  The header records the directory mtime.
+_DIR_CACHE_PREFIX = 'dircache.'
+_DIR_CACHE_MAGIC = b'dircache 1 '
+# Minimum delay, in seconds, between the last modification of a directory
+# and the moment its listing was saved for the listing to be trusted.  It
+# leaves room for file systems with coarse timestamps.
+_DIR_CACHE_MIN_AGE = 2
+
+
+def _dir_cache_header(mtime):
+    return _DIR_CACHE_MAGIC + repr(mtime).encode('ascii')
+
+
+# Prefix of the file name of the frozen modules of the standard library,
+# followed by their path relative to the standard library directory (see
+# Programs/_freeze_importlib.c).
+_FROZEN_STDLIB_PREFIX = '<stdlib>/'
+
+
+def _stdlib_dir():
+    """Return the directory of the standard library, or None if unknown."""
+    # Computed by getpath along with sys.prefix, where it found os.py.
+    # Entries of sys.path are not searched, as a directory of PYTHONPATH
+    # may well hold a module named os.
+    return getattr(sys, '_stdlib_dir', None)
+
+
+def _locate_frozen_source(code):
+    """Return the path of the source of a frozen module of the standard
+    library and set it as the file name of its code, or return None."""
+    filename = code.co_filename
+    if not filename.startswith(_FROZEN_STDLIB_PREFIX):
+        # Not a module of the standard library, like importlib itself.
+        return None
+    stdlib_dir = _stdlib_dir()
+    if stdlib_dir is None:
+        return None
+    relative_path = filename[len(_FROZEN_STDLIB_PREFIX):]
+    path = _path_join(stdlib_dir, *relative_path.split('/'))
+    _imp._fix_co_filename(code, path)
+    return path
+
+
 # Import setup ###############################################################
 
 def _fix_up_module(ns, name, pathname, cpathname=None):
@@ -1429,6 +1538,11 @@ def _setup(_bootstrap_module):
 
     # Constants
     setattr(self_module, '_relax_case', _make_relax_case())
+    if 'dircache' in sys._xoptions:
+        FileFinder._persistent_cache = True
+    elif not sys.flags.ignore_environment:
+        key = 'PYTHONDIRCACHE' if builtin_os == 'nt' else b'PYTHONDIRCACHE'
+        FileFinder._persistent_cache = bool(_os.environ.get(key))
     EXTENSION_SUFFIXES.extend(_imp.extension_suffixes())
     if builtin_os == 'nt':
         SOURCE_SUFFIXES.append('.pyw')
@@ -4,6 +4,8 @@ from ._bootstrap import module_from_spec
 from ._bootstrap import _resolve_name
 from ._bootstrap import spec_from_loader
 from ._bootstrap import _find_spec
+from ._bootstrap import _find_spec_legacy
+from ._bootstrap_external import ExtensionFileLoader
 from ._bootstrap_external import MAGIC_NUMBER
 from ._bootstrap_external import cache_from_source
 from ._bootstrap_external import decode_source
@@ -16,6 +18,14 @@ import sys
 import types
 import warnings
 
+try:
+    from _thread import RLock
+except ImportError:
+    class RLock:
+        'Dummy reentrant lock for builds without threads'
+        def __enter__(self): pass
+        def __exit__(self, exctype, excinst, exctb): pass
+
 
 def resolve_name(name, package):
     """Resolve a relative module name to an absolute one."""
@@ -212,35 +222,54 @@ class _LazyModule(types.ModuleType):
         """Trigger the load of the module and return the attribute."""
         # All module metadata must be garnered from __spec__ in order to avoid
         # using mutated values.
-        # Stop triggering this method.
-        self.__class__ = types.ModuleType
-        # Get the original name to make sure no object substitution occurred
-        # in sys.modules.
-        original_name = self.__spec__.name
-        # Figure out exactly what attributes were mutated between the creation
-        # of the module and now.
-        attrs_then = self.__spec__.loader_state['__dict__']
-        original_type = self.__spec__.loader_state['__class__']
-        attrs_now = self.__dict__
-        attrs_updated = {}
-        for key, value in attrs_now.items():
-            # Code that set the attribute may have kept a reference to the
-            # assigned object, making identity more important than equality.
-            if key not in attrs_then:
-                attrs_updated[key] = value
-            elif id(attrs_now[key]) != id(attrs_then[key]):
-                attrs_updated[key] = value
-        self.__spec__.loader.exec_module(self)
-        # If exec_module() was used directly there is no guarantee the module
-        # object was put into sys.modules.
-        if original_name in sys.modules:
-            if id(self) != id(sys.modules[original_name]):
-                raise ValueError(f"module object for {original_name!r} "
-                                  "substituted in sys.modules during a lazy "
-                                  "load")
-        # Update after loading since that's what would happen in an eager
-        # loading situation.
-        self.__dict__.update(attrs_updated)
+        __spec__ = object.__getattribute__(self, '__spec__')
+        loader_state = __spec__.loader_state
+        with loader_state['lock']:
+            # Only the first thread to get the lock triggers the load and
+            # resets the module's class; the others then simply getattr().
+            if object.__getattribute__(self, '__class__') is _LazyModule:
+                original_type = loader_state['__class__']
+                # Reentrant calls from the loading thread, e.g. a module
+                # looking itself up in sys.modules while it executes, must
+                # not trigger the load again.
+                if loader_state['is_loading']:
+                    return original_type.__getattribute__(self, attr)
+                loader_state['is_loading'] = True
+                __dict__ = original_type.__getattribute__(self, '__dict__')
+                # Get the original name to make sure no object substitution
+                # occurred in sys.modules.
+                original_name = __spec__.name
+                # Figure out exactly what attributes were mutated between the
+                # creation of the module and now.
+                attrs_then = loader_state['__dict__']
+                attrs_now = __dict__
+                attrs_updated = {}
+                for key, value in attrs_now.items():
+                    # Code that set the attribute may have kept a reference to
+                    # the assigned object, making identity more important than
+                    # equality.
+                    if key not in attrs_then:
+                        attrs_updated[key] = value
+                    elif id(attrs_now[key]) != id(attrs_then[key]):
+                        attrs_updated[key] = value
+                try:
+                    __spec__.loader.exec_module(self)
+                finally:
+                    loader_state['is_loading'] = False
+                # Stop triggering this method, unless the module already
+                # changed its own __class__.
+                if isinstance(self, _LazyModule):
+                    object.__setattr__(self, '__class__', original_type)
+                # If exec_module() was used directly there is no guarantee the
+                # module object was put into sys.modules.
+                if original_name in sys.modules:
+                    if id(self) != id(sys.modules[original_name]):
+                        raise ValueError(f"module object for {original_name!r} "
+                                          "substituted in sys.modules during a "
+                                          "lazy load")
+                # Update after loading since that's what would happen in an
+                # eager loading situation.
+                __dict__.update(attrs_updated)
         return getattr(self, attr)
 
     def __delattr__(self, attr):
@@ -284,5 +313,105 @@ class LazyLoader(abc.Loader):
         loader_state = {}
         loader_state['__dict__'] = module.__dict__.copy()
         loader_state['__class__'] = module.__class__
+        loader_state['lock'] = RLock()
+        loader_state['is_loading'] = False
         module.__spec__.loader_state = loader_state
         module.__class__ = _LazyModule
+
+
+class _LazyImportLoader(LazyLoader):
+
+    """LazyLoader used by the lazy import mode.
+
+    Other attributes are looked up on the wrapped loader, so that code using
+    a module spec without importing it (e.g. runpy calling get_code()) keeps
+    working.
+    """
+
+    def __getattr__(self, name):
+        if name == 'loader':
+            raise AttributeError(name)
+        return getattr(self.loader, name)
+
+
+class _LazyImportFinder:
+
+    """Meta path finder making the modules found by later finders lazy.
+
+    It is inserted first in sys.meta_path by enable_lazy_imports().
+    """
+
+    def __init__(self):
+        self.exclude = set()
+
+    def _is_excluded(self, fullname):
+        name = fullname
+        while True:
+            if name in self.exclude:
+                return True
+            name, dot, _ = name.rpartition('.')
+            if not dot:
+                return False
+
+    def find_spec(self, fullname, path=None, target=None):
+        # A target is given by reload(), which has to load eagerly.
+        if target is not None or self._is_excluded(fullname):
+            return None
+        try:
+            index = sys.meta_path.index(self)
+        except ValueError:
+            return None
+        for finder in sys.meta_path[index + 1:]:
+            try:
+                find_spec = finder.find_spec
+            except AttributeError:
+                spec = _find_spec_legacy(finder, fullname, path)
+            else:
+                spec = find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        loader = spec.loader
+        # Built-in and frozen modules are cheap to load and extension modules
+        # are initialized when created, so only the others are made lazy.
+        if (loader is not None and not isinstance(loader, type)
+                and hasattr(loader, 'exec_module')
+                and not isinstance(loader, ExtensionFileLoader)):
+            spec.loader = _LazyImportLoader(loader)
+        return spec
+
+
+# Modules which are imported for their side effects.
+_LAZY_IMPORTS_EXCLUDE = frozenset({
+    'sitecustomize', 'usercustomize', 'rlcompleter', 'this', 'antigravity'})
+
+
+def enable_lazy_imports(exclude=()):
+    """Make the following imports of all modules lazy.
+
+    An imported module is created but only executed the first time one of
+    its attributes is accessed, see LazyLoader.  Modules named in exclude,
+    and their submodules, are still imported eagerly; calling the function
+    again adds to the names already excluded.
+    """
+    if isinstance(exclude, str):
+        raise TypeError('exclude must be an iterable of module names, '
+                        'not str')
+    for finder in sys.meta_path:
+        if isinstance(finder, _LazyImportFinder):
+            break
+    else:
+        finder = _LazyImportFinder()
+        finder.exclude.update(_LAZY_IMPORTS_EXCLUDE)
+        sys.meta_path.insert(0, finder)
+    finder.exclude.update(exclude)
+
+
+def disable_lazy_imports():
+    """Stop making imports lazy.
+
+    Modules which were imported lazily stay lazy until they are used.
+    """
+    sys.meta_path[:] = [finder for finder in sys.meta_path
+                        if not isinstance(finder, _LazyImportFinder)]
@@ -97,16 +97,20 @@ Using json.tool from the shell to validate and pretty-print::
 """
 __version__ = '2.0.9'
 __all__ = [
-    'dump', 'dumps', 'load', 'loads',
-    'JSONDecoder', 'JSONDecodeError', 'JSONEncoder',
+    'dump', 'dumps', 'dumpb', 'load', 'loads', 'iterload',
+    'JSONDecoder', 'JSONDecodeError', 'JSONEncoder', 'JSONPullParser',
 ]
 
 __author__ = 'Bob Ippolito <bob@redivi.com>'
 
-from .decoder import JSONDecoder, JSONDecodeError
+from .decoder import JSONDecoder, JSONDecodeError, JSONPullParser
 from .encoder import JSONEncoder
 import codecs
 
+# The number of characters dump() writes at once, and iterload() reads
+_WRITE_SIZE = 8192
+_READ_SIZE = 65536
+
 _default_encoder = JSONEncoder(
     skipkeys=False,
     ensure_ascii=True,
@@ -160,6 +164,9 @@ def dump(obj, fp, *, skipkeys=False, ensure_ascii=True, check_circular=True,
     ``.default()`` method to serialize additional types), specify it with
     the ``cls`` kwarg; otherwise ``JSONEncoder`` is used.
 
+    The JSON text is written to ``fp`` in pieces of about 8 KiB, rather
+    than with one ``.write()`` call per chunk produced by the encoder.
+
     """
     # cached encoder
     if (not skipkeys and ensure_ascii and
@@ -174,10 +181,20 @@ def dump(obj, fp, *, skipkeys=False, ensure_ascii=True, check_circular=True,
             check_circular=check_circular, allow_nan=allow_nan, indent=indent,
             separators=separators,
             default=default, sort_keys=sort_keys, **kw).iterencode(obj)
-    # could accelerate with writelines in some versions of Python, at
-    # a debuggability cost
+    # Join the many small chunks yielded by iterencode(), rather than
+    # calling fp.write() for each of them
+    write = fp.write
+    chunks = []
+    size = 0
     for chunk in iterable:
-        fp.write(chunk)
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= _WRITE_SIZE:
+            write(''.join(chunks))
+            chunks.clear()
+            size = 0
+    if chunks:
+        write(''.join(chunks))
 
 
 def dumps(obj, *, skipkeys=False, ensure_ascii=True, check_circular=True,
@@ -238,6 +255,32 @@ def dumps(obj, *, skipkeys=False, ensure_ascii=True, check_circular=True,
         **kw).encode(obj)
 
 
+def dumpb(obj, *, skipkeys=False, ensure_ascii=True, check_circular=True,
+        allow_nan=True, cls=None, indent=None, separators=None,
+        default=None, sort_keys=False, **kw):
+    """Serialize ``obj`` to a UTF-8 encoded JSON formatted ``bytes``.
+
+    This is equivalent to ``dumps(obj, ...).encode('utf-8')``, but does
+    not create the intermediate ``str``.  The arguments have the same
+    meaning as in ``dumps()``; to use a custom ``JSONEncoder`` subclass,
+    specify it with the ``cls`` kwarg.
+
+    """
+    # cached encoder
+    if (not skipkeys and ensure_ascii and
+        check_circular and allow_nan and
+        cls is None and indent is None and separators is None and
+        default is None and not sort_keys and not kw):
+        return _default_encoder.encode_utf8(obj)
+    if cls is None:
+        cls = JSONEncoder
+    return cls(
+        skipkeys=skipkeys, ensure_ascii=ensure_ascii,
+        check_circular=check_circular, allow_nan=allow_nan, indent=indent,
+        separators=separators, default=default, sort_keys=sort_keys,
+        **kw).encode_utf8(obj)
+
+
 _default_decoder = JSONDecoder(object_hook=None, object_pairs_hook=None)
 
 
@@ -299,6 +342,55 @@ def load(fp, *, cls=None, object_hook=None, parse_float=None,
         parse_constant=parse_constant, object_pairs_hook=object_pairs_hook, **kw)
 
 
+def iterload(fp, depth=1, *, cls=None, object_hook=None, parse_float=None,
+        parse_int=None, parse_constant=None, object_pairs_hook=None, **kw):
+    """Deserialize ``fp`` (a ``.read()``-supporting file-like object containing
+    a stream of JSON documents) incrementally, yielding the values found
+    ``depth`` levels of arrays and objects below the top level as soon
+    as they have been read.
+
+    With the default ``depth`` of 1, this yields the items of a top-level
+    array (or the values of the members of a top-level object) without
+    reading the whole array into memory.  With a ``depth`` of 0, this
+    yields each of a sequence of documents, such as the lines of a JSON
+    lines file.  Use ``JSONPullParser`` to know where each value was found.
+
+    ``fp`` can be opened in text or binary mode.  The other arguments have
+    the same meaning as in ``load()``.
+
+    """
+    if (cls is None and object_hook is None and
+            parse_int is None and parse_float is None and
+            parse_constant is None and object_pairs_hook is None and not kw):
+        decoder = _default_decoder
+    else:
+        if cls is None:
+            cls = JSONDecoder
+        if object_hook is not None:
+            kw['object_hook'] = object_hook
+        if object_pairs_hook is not None:
+            kw['object_pairs_hook'] = object_pairs_hook
+        if parse_float is not None:
+            kw['parse_float'] = parse_float
+        if parse_int is not None:
+            kw['parse_int'] = parse_int
+        if parse_constant is not None:
+            kw['parse_constant'] = parse_constant
+        decoder = cls(**kw)
+    parser = JSONPullParser(depth, decoder=decoder)
+    read = fp.read
+    while True:
+        data = read(_READ_SIZE)
+        if not data:
+            break
+        parser.feed(data)
+        for path, value in parser.read_events():
+            yield value
+    parser.close()
+    for path, value in parser.read_events():
+        yield value
+
+
 def loads(s, *, encoding=None, cls=None, object_hook=None, parse_float=None,
         parse_int=None, parse_constant=None, object_pairs_hook=None, **kw):
     """Deserialize ``s`` (a ``str``, ``bytes`` or ``bytearray`` instance
@@ -346,7 +438,10 @@ def loads(s, *, encoding=None, cls=None, object_hook=None, parse_float=None,
         if not isinstance(s, (bytes, bytearray)):
             raise TypeError('the JSON object must be str, bytes or bytearray, '
                             'not {!r}'.format(s.__class__.__name__))
-        s = s.decode(detect_encoding(s), 'surrogatepass')
+        encoding = detect_encoding(s)
+        # JSONDecoder can parse UTF-8 bytes without decoding them first
+        if encoding != 'utf-8' or type(s) is not bytes or cls is not None:
+            s = s.decode(encoding, 'surrogatepass')
 
     if (cls is None and object_hook is None and
             parse_int is None and parse_float is None and
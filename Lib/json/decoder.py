@@ -1,6 +1,8 @@
 """Implementation of JSONDecoder
 """
+import codecs
 import re
+from collections import deque
 
 from json import scanner
 try:
@@ -8,7 +10,7 @@ try:
 except ImportError:
     c_scanstring = None
 
-__all__ = ['JSONDecoder', 'JSONDecodeError']
+__all__ = ['JSONDecoder', 'JSONDecodeError', 'JSONPullParser']
 
 FLAGS = re.VERBOSE | re.MULTILINE | re.DOTALL
 
@@ -130,6 +132,7 @@ scanstring = c_scanstring or py_scanstring
 
 WHITESPACE = re.compile(r'[ \t\n\r]*', FLAGS)
 WHITESPACE_STR = ' \t\n\r'
+WHITESPACE_BYTES = re.compile(rb'[ \t\n\r]*', FLAGS)
 
 
 def JSONObject(s_and_end, strict, scan_once, object_hook, object_pairs_hook,
@@ -333,9 +336,12 @@ class JSONDecoder(object):
 
     def decode(self, s, _w=WHITESPACE.match):
         """Return the Python representation of ``s`` (a ``str`` instance
-        containing a JSON document).
+        containing a JSON document, or a ``bytes`` instance containing
+        a UTF-8 encoded JSON document).
 
         """
+        if isinstance(s, bytes):
+            return self._decode_utf8(s)
         obj, end = self.raw_decode(s, idx=_w(s, 0).end())
         end = _w(s, end).end()
         if end != len(s):
@@ -356,3 +362,361 @@ class JSONDecoder(object):
         except StopIteration as err:
             raise JSONDecodeError("Expecting value", s, err.value) from None
         return obj, end
+
+    def _decode_utf8(self, b, _w=WHITESPACE_BYTES.match):
+        # The C scanner reads UTF-8 directly and only decodes the strings
+        # it finds, which avoids building a str copy of the whole document.
+        if (scanner.c_make_scanner is None or
+                not isinstance(self.scan_once, scanner.c_make_scanner)):
+            return self.decode(b.decode('utf-8', 'surrogatepass'))
+        try:
+            obj, end = self.scan_once(b, _w(b, 0).end())
+        except StopIteration as err:
+            raise _utf8_error("Expecting value", b, err.value) from None
+        end = _w(b, end).end()
+        if end != len(b):
+            raise _utf8_error("Extra data", b, end)
+        return obj
+
+
+def _utf8_error(msg, b, pos):
+    # Build a JSONDecodeError for byte offset pos of the UTF-8 document b;
+    # like the scanner, report a character position in the decoded text.
+    return JSONDecodeError(msg, b.decode('utf-8', 'replace'),
+                           len(b[:pos].decode('utf-8', 'replace')))
+
+
+# States of JSONPullParser, named after what is expected next
+_VALUE = 'value'
+_FIRST_VALUE = 'value or ]'
+_KEY = 'key'
+_FIRST_KEY = 'key or }'
+_COLON = ':'
+_NEXT = ', or end'
+
+_EXPECTING = {
+    _VALUE: "Expecting value",
+    _FIRST_VALUE: "Expecting value",
+    _KEY: "Expecting property name enclosed in double quotes",
+    _FIRST_KEY: "Expecting property name enclosed in double quotes",
+    _COLON: "Expecting ':' delimiter",
+    _NEXT: "Expecting ',' delimiter",
+}
+
+_CLOSE = {'[': ']', '{': '}'}
+
+# The longest token which can be cut by the end of the text fed so far:
+# an error within that distance of the end may just be a truncated value.
+_MAX_TOKEN = len('-Infinity')
+
+# Characters which can follow a complete value
+_VALUE_END = WHITESPACE_STR + ',]}'
+
+# Used to find where an array, object or string cut by the end of the text
+# fed so far ends, without decoding it.
+_STRUCTURE = re.compile(r'[^"\[\]{}]*', FLAGS)
+_STRING_CHARS = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*', FLAGS)
+
+
+class JSONPullParser(object):
+    """Incremental parser of a stream of JSON documents.
+
+    The text is passed in pieces to feed(), and the values found at
+    ``depth`` levels of arrays and objects below the top level are decoded
+    as soon as they are complete and returned by read_events().  With the
+    default depth of 1, these are the items of a top-level array (or the
+    members of a top-level object); with a depth of 0, these are whole
+    documents, such as the lines of a JSON lines stream.  The containers
+    above that depth are never held in memory.
+
+    """
+
+    def __init__(self, depth=1, *, decoder=None):
+        """``depth`` is the number of arrays and objects enclosing the values
+        to return.  Values which are not arrays or objects are returned
+        even if they are closer to the top level.
+
+        ``decoder``, if specified, is the ``JSONDecoder`` instance used to
+        decode the values, so that its hooks are applied to them.
+
+        """
+        if depth < 0:
+            raise ValueError("depth must be non-negative")
+        if decoder is None:
+            decoder = JSONDecoder()
+        self._depth = depth
+        self._scan_once = decoder.scan_once
+        self._strict = decoder.strict
+        self._buf = ''
+        self._chunks = []
+        # State of the scan for the end of an incomplete array, object or
+        # string at the start of self._buf: None if there is none, else
+        # [nesting, in_string, escaped].
+        self._held = None
+        # Characters, lines and columns of the stream before self._buf
+        self._offset = 0
+        self._lineno = 0
+        self._colno = 0
+        self._binary = None
+        self._bytes = None
+        self._text_decoder = None
+        self._stack = []
+        self._state = _VALUE
+        self._events = deque()
+        self._closed = False
+
+    def feed(self, data):
+        """Feed a piece of JSON text, either ``str`` or ``bytes``, to the
+        parser.
+
+        Bytes are decoded from UTF-8, UTF-16 or UTF-32, which is detected
+        from the start of the stream.  The values completed by ``data`` are
+        decoded.  An array, object or string cut by the end of the text is
+        not decoded again until the text which ends it has been fed, so
+        that the time spent on large values stays linear.
+
+        """
+        if self._closed:
+            raise ValueError("feed() called after close()")
+        if isinstance(data, str):
+            if self._binary is None:
+                if not data:
+                    return
+                if data.startswith('\ufeff'):
+                    raise JSONDecodeError(
+                        "Unexpected UTF-8 BOM (decode using utf-8-sig)",
+                        data, 0)
+                self._binary = False
+            elif self._binary:
+                raise TypeError("cannot mix str and bytes in a JSON stream")
+        elif isinstance(data, (bytes, bytearray)):
+            if self._binary is None:
+                self._binary = True
+            elif not self._binary:
+                raise TypeError("cannot mix str and bytes in a JSON stream")
+            if self._text_decoder is None:
+                data = self._detect_encoding(data, False)
+            else:
+                data = self._text_decoder.decode(data)
+        else:
+            raise TypeError('the JSON data must be str, bytes or bytearray, '
+                            'not {!r}'.format(data.__class__.__name__))
+        if data:
+            self._chunks.append(data)
+            if self._held is None or self._scan_held(data):
+                self._parse(False)
+
+    def close(self):
+        """Signal the end of the stream to the parser.
+
+        Decode the last values, and raise ``JSONDecodeError`` if the stream
+        ends with an incomplete document.
+
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._text_decoder is not None:
+            data = self._text_decoder.decode(b'', True)
+        elif self._bytes is not None:
+            data = self._detect_encoding(b'', True)
+        else:
+            data = ''
+        if data:
+            self._chunks.append(data)
+        self._parse(True)
+
+    def read_events(self):
+        """Return an iterator over the ``(path, value)`` pairs decoded since
+        the last call.
+
+        ``path`` is a tuple of the array indices and object keys leading
+        from the top level document to ``value``.
+
+        """
+        events = self._events
+        while events:
+            # Consume the events as they are returned, so that they are
+            # not returned twice if read_events() is called again before
+            # the iterator is exhausted.
+            event = events.popleft()
+            yield event
+
+    def _detect_encoding(self, data, final):
+        from json import detect_encoding
+        if self._bytes is None:
+            self._bytes = bytes(data)
+        else:
+            self._bytes += data
+        if len(self._bytes) < 4 and not final:
+            return ''
+        data, self._bytes = self._bytes, None
+        encoding = detect_encoding(data)
+        self._text_decoder = codecs.getincrementaldecoder(encoding)(
+            'surrogatepass')
+        return self._text_decoder.decode(data, final)
+
+    def _incomplete(self, err, final):
+        # Return true if err may be caused by a value cut by the end
+        # of the text fed so far.
+        if final:
+            return False
+        return (err.pos >= len(err.doc) - _MAX_TOKEN or
+                err.msg.startswith('Unterminated string'))
+
+    def _scan_held(self, data, _structure=_STRUCTURE.match,
+                   _string_chars=_STRING_CHARS.match):
+        # Continue the scan of the held value over data, and return true
+        # once its end has been found.
+        nesting, in_string, escaped = self._held
+        end = len(data)
+        pos = 0
+        if escaped and end:
+            pos = 1
+            escaped = False
+        while pos < end:
+            if in_string:
+                pos = _string_chars(data, pos).end()
+                if pos == end:
+                    break
+                if data[pos] == '\\':
+                    # The escaped character is still to come
+                    escaped = True
+                    break
+                in_string = False
+                pos += 1
+                if not nesting:
+                    return True
+            else:
+                pos = _structure(data, pos).end()
+                if pos == end:
+                    break
+                nextchar = data[pos]
+                pos += 1
+                if nextchar == '"':
+                    in_string = True
+                elif nextchar in '[{':
+                    nesting += 1
+                else:
+                    nesting -= 1
+                    if nesting <= 0:
+                        return True
+        self._held = [nesting, in_string, escaped]
+        return False
+
+    def _parse(self, final):
+        buf = self._buf
+        if self._chunks:
+            self._chunks.insert(0, buf)
+            buf = ''.join(self._chunks)
+            self._chunks.clear()
+        try:
+            pos = self._parse_values(buf, final)
+        except JSONDecodeError as err:
+            # Report the position in the whole stream
+            if err.lineno == 1:
+                err.colno += self._colno
+            err.pos += self._offset
+            err.lineno += self._lineno
+            err.args = ('%s: line %d column %d (char %d)' %
+                        (err.msg, err.lineno, err.colno, err.pos),)
+            raise
+        lines = buf.count('\n', 0, pos)
+        if lines:
+            self._lineno += lines
+            self._colno = pos - buf.rfind('\n', 0, pos) - 1
+        else:
+            self._colno += pos
+        self._offset += pos
+        self._buf = buf = buf[pos:]
+        self._held = None
+        if buf[:1] in ('[', '{', '"'):
+            # Wait for the end of the value before decoding it again
+            self._held = [0, False, False]
+            if self._scan_held(buf):
+                self._held = None
+
+    def _parse_values(self, buf, final, _w=WHITESPACE.match,
+                      _ws=WHITESPACE_STR):
+        # Decode the values in buf, and return the position of the first
+        # one which is not complete yet.
+        stack = self._stack
+        state = self._state
+        depth = self._depth
+        scan_once = self._scan_once
+        events = self._events
+        end = len(buf)
+        pos = 0
+        while True:
+            if pos < end and buf[pos] in _ws:
+                pos = _w(buf, pos).end()
+            if pos == end:
+                if final and (stack or state is not _VALUE):
+                    raise JSONDecodeError(_EXPECTING[state], buf, pos)
+                break
+            nextchar = buf[pos]
+            if state is _NEXT:
+                container = stack[-1]
+                if nextchar == ',':
+                    if container[0] == '[':
+                        container[1] += 1
+                        state = _VALUE
+                    else:
+                        state = _KEY
+                elif nextchar == _CLOSE[container[0]]:
+                    stack.pop()
+                    state = _NEXT if stack else _VALUE
+                else:
+                    raise JSONDecodeError(_EXPECTING[state], buf, pos)
+                pos += 1
+            elif state is _COLON:
+                if nextchar != ':':
+                    raise JSONDecodeError(_EXPECTING[state], buf, pos)
+                pos += 1
+                state = _VALUE
+            elif state is _KEY or state is _FIRST_KEY:
+                if nextchar == '"':
+                    try:
+                        key, pos = scanstring(buf, pos + 1, self._strict)
+                    except JSONDecodeError as err:
+                        if self._incomplete(err, final):
+                            break
+                        raise
+                    stack[-1][1] = key
+                    state = _COLON
+                elif nextchar == '}' and state is _FIRST_KEY:
+                    pos += 1
+                    stack.pop()
+                    state = _NEXT if stack else _VALUE
+                else:
+                    raise JSONDecodeError(_EXPECTING[state], buf, pos)
+            elif nextchar == ']' and state is _FIRST_VALUE:
+                pos += 1
+                stack.pop()
+                state = _NEXT if stack else _VALUE
+            elif nextchar in '[{' and len(stack) < depth:
+                stack.append([nextchar, 0 if nextchar == '[' else None])
+                state = _FIRST_VALUE if nextchar == '[' else _FIRST_KEY
+                pos += 1
+            else:
+                try:
+                    value, valueend = scan_once(buf, pos)
+                except StopIteration as err:
+                    err = JSONDecodeError("Expecting value", buf, err.value)
+                    if self._incomplete(err, final):
+                        break
+                    raise err from None
+                except JSONDecodeError as err:
+                    if self._incomplete(err, final):
+                        break
+                    raise
+                if (not final and nextchar not in '[{"' and
+                        valueend > end - _MAX_TOKEN and
+                        (valueend == end or buf[valueend] not in _VALUE_END)):
+                    # A number may go on in the text still to come
+                    break
+                events.append((tuple([c[1] for c in stack]), value))
+                pos = valueend
+                state = _NEXT if stack else _VALUE
+        self._state = state
+        return pos
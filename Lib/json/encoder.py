@@ -14,6 +14,10 @@ try:
     from _json import make_encoder as c_make_encoder
 except ImportError:
     c_make_encoder = None
+try:
+    from _json import join_utf8 as c_join_utf8
+except ImportError:
+    c_join_utf8 = None
 
 ESCAPE = re.compile(r'[\x00-\x1f\\"\b\f\n\r\t]')
 ESCAPE_ASCII = re.compile(r'([\\"]|[^\ -~])')
@@ -33,6 +37,15 @@ for i in range(0x20):
 
 INFINITY = float('inf')
 
+def py_join_utf8(chunks):
+    """Return the concatenation of a sequence of strings, encoded to UTF-8
+
+    """
+    return ''.join(chunks).encode('utf-8')
+
+
+join_utf8 = (c_join_utf8 or py_join_utf8)
+
 def py_encode_basestring(s):
     """Return a JSON representation of a Python string
 
@@ -201,6 +214,24 @@ class JSONEncoder(object):
             chunks = list(chunks)
         return ''.join(chunks)
 
+    def encode_utf8(self, o):
+        """Return a UTF-8 encoded JSON ``bytes`` representation of a Python
+        data structure.
+
+        >>> from json.encoder import JSONEncoder
+        >>> JSONEncoder().encode_utf8({"foo": ["bar", "baz"]})
+        b'{"foo": ["bar", "baz"]}'
+
+        """
+        # Subclasses that override encode() get their own representation,
+        # otherwise the chunks are encoded without joining them into a str.
+        if type(self).encode is not JSONEncoder.encode or isinstance(o, str):
+            return self.encode(o).encode('utf-8')
+        chunks = self.iterencode(o, _one_shot=True)
+        if not isinstance(chunks, (list, tuple)):
+            chunks = list(chunks)
+        return join_utf8(chunks)
+
     def iterencode(self, o, _one_shot=False):
         """Encode the given object and yield each string
         representation as available.
@@ -236,6 +236,32 @@ def _releaseLock():
 #   The logging record
 #---------------------------------------------------------------------------
 
+#
+# _pathnames maps the pathnames of logging calls to their filename and module
+# name, which would otherwise be computed again for every record. The calls
+# come from a limited number of source files, but pathnames can also be
+# passed in arbitrarily, so the cache is cleared when it is full.
+#
+_pathnames = {}
+_MAX_PATHNAMES = 1000
+
+def _splitPathname(pathname):
+    """
+    Return the filename and module name for a pathname, and cache them.
+    """
+    try:
+        filename = os.path.basename(pathname)
+        module = os.path.splitext(filename)[0]
+    except (TypeError, ValueError, AttributeError):
+        return pathname, "Unknown module"
+    if len(_pathnames) >= _MAX_PATHNAMES:
+        _pathnames.clear()
+    try:
+        _pathnames[pathname] = (filename, module)
+    except TypeError: # unhashable path-like object
+        pass
+    return filename, module
+
 class LogRecord(object):
     """
     A LogRecord instance represents an event being logged.
@@ -282,11 +308,9 @@ class LogRecord(object):
         self.levelno = level
         self.pathname = pathname
         try:
-            self.filename = os.path.basename(pathname)
-            self.module = os.path.splitext(self.filename)[0]
-        except (TypeError, ValueError, AttributeError):
-            self.filename = pathname
-            self.module = "Unknown module"
+            self.filename, self.module = _pathnames[pathname]
+        except (KeyError, TypeError):
+            self.filename, self.module = _splitPathname(pathname)
         self.exc_info = exc_info
         self.exc_text = None      # used to cache the traceback text
         self.stack_info = sinfo
@@ -381,11 +405,22 @@ class PercentStyle(object):
     asctime_format = '%(asctime)s'
     asctime_search = '%(asctime)'
 
+    _usesTimeCache = (None, False)
+
     def __init__(self, fmt):
         self._fmt = fmt or self.default_format
 
     def usesTime(self):
-        return self._fmt.find(self.asctime_search) >= 0
+        # The result is cached, but checked again if _fmt is replaced
+        fmt, result = self._usesTimeCache
+        if fmt is not self._fmt:
+            fmt = self._fmt
+            result = self._findTime(fmt)
+            self._usesTimeCache = (fmt, result)
+        return result
+
+    def _findTime(self, fmt):
+        return fmt.find(self.asctime_search) >= 0
 
     def format(self, record):
         return self._fmt % record.__dict__
@@ -408,8 +443,7 @@ class StringTemplateStyle(PercentStyle):
         self._fmt = fmt or self.default_format
         self._tpl = Template(self._fmt)
 
-    def usesTime(self):
-        fmt = self._fmt
+    def _findTime(self, fmt):
         return fmt.find('$asctime') >= 0 or fmt.find(self.asctime_format) >= 0
 
     def format(self, record):
@@ -466,8 +500,14 @@ class Formatter(object):
     """
 
     converter = time.localtime
+    reuse = False
+
+    # The last time formatted, as ((seconds, format, converter), text)
+    _timeCache = (None, None)
+    # A weak reference to the last record formatted, and its text
+    _lastRecord = (None, None)
 
-    def __init__(self, fmt=None, datefmt=None, style='%'):
+    def __init__(self, fmt=None, datefmt=None, style='%', *, reuse=False):
         """
         Initialize the formatter with specified format strings.
 
@@ -479,6 +519,11 @@ class Formatter(object):
         use one of %-formatting, :meth:`str.format` (``{}``) formatting or
         :class:`string.Template` formatting in your format string.
 
+        If reuse is true, formatting the record which was formatted last
+        again returns the same text, so that handlers sharing the formatter
+        only format each record once. The record must not be changed in
+        between.
+
         .. versionchanged:: 3.2
            Added the ``style`` parameter.
         """
@@ -488,6 +533,7 @@ class Formatter(object):
         self._style = _STYLES[style][0](fmt)
         self._fmt = self._style._fmt
         self.datefmt = datefmt
+        self.reuse = reuse
 
     default_time_format = '%Y-%m-%d %H:%M:%S'
     default_msec_format = '%s,%03d'
@@ -509,30 +555,36 @@ class Formatter(object):
         time.localtime() or time.gmtime(). To change it for all formatters,
         for example if you want all logging times to be shown in GMT,
         set the 'converter' attribute in the Formatter class.
+
+        The formatted time is cached, so that the conversion is only done
+        once per second.
         """
-        ct = self.converter(record.created)
+        converter = self.converter
+        key = (record.created // 1, datefmt or self.default_time_format,
+               converter)
+        cached, t = self._timeCache
+        if key != cached:
+            t = time.strftime(key[1], converter(record.created))
+            self._timeCache = (key, t)
         if datefmt:
-            s = time.strftime(datefmt, ct)
-        else:
-            t = time.strftime(self.default_time_format, ct)
-            s = self.default_msec_format % (t, record.msecs)
-        return s
+            return t
+        return self.default_msec_format % (t, record.msecs)
 
     def formatException(self, ei):
         """
         Format and return the specified exception information as a string.
 
-        This default implementation just uses
-        traceback.print_exception()
+        This default implementation captures the exception with
+        traceback.TracebackException without looking up any source lines,
+        which are then read while formatting, stat()ing each source file
+        at most once.
         """
-        sio = io.StringIO()
         tb = ei[2]
         # See issues #9427, #1553375. Commented out for now.
         #if getattr(self, 'fullstack', False):
         #    traceback.print_stack(tb.tb_frame.f_back, file=sio)
-        traceback.print_exception(ei[0], ei[1], tb, None, sio)
-        s = sio.getvalue()
-        sio.close()
+        s = ''.join(traceback.TracebackException(
+            type(ei[1]), ei[1], tb, lookup_lines=False).format())
         if s[-1:] == "\n":
             s = s[:-1]
         return s
@@ -571,7 +623,13 @@ class Formatter(object):
         time (as determined by a call to usesTime(), formatTime() is
         called to format the event time. If there is exception information,
         it is formatted using formatException() and appended to the message.
+        If the reuse attribute is true and the record was the last one
+        formatted, the text returned then is returned again.
         """
+        if self.reuse:
+            ref, s = self._lastRecord
+            if ref is not None and ref() is record:
+                return s
         record.message = record.getMessage()
         if self.usesTime():
             record.asctime = self.formatTime(record, self.datefmt)
@@ -589,6 +647,8 @@ class Formatter(object):
             if s[-1:] != "\n":
                 s = s + "\n"
             s = s + self.formatStack(record.stack_info)
+        if self.reuse:
+            self._lastRecord = (weakref.ref(record), s)
         return s
 
 #
@@ -865,6 +925,31 @@ class Handler(Filterer):
                 self.release()
         return rv
 
+    def emitBatch(self, records):
+        """
+        Emit a sequence of logging records.
+
+        This version calls emit() for each record. Subclasses may override
+        it to output the records together.
+        """
+        for record in records:
+            self.emit(record)
+
+    def handleBatch(self, records):
+        """
+        Conditionally emit a sequence of logging records.
+
+        The records which pass the handler's filters are passed to
+        emitBatch(), with the I/O thread lock acquired once for all of them.
+        """
+        records = [record for record in records if self.filter(record)]
+        if records:
+            self.acquire()
+            try:
+                self.emitBatch(records)
+            finally:
+                self.release()
+
     def setFormatter(self, fmt):
         """
         Set the formatter for this handler.
@@ -997,6 +1082,33 @@ class StreamHandler(Handler):
         except Exception:
             self.handleError(record)
 
+    def emitBatch(self, records):
+        """
+        Emit a sequence of records.
+
+        The records are formatted as by emit(), but written to the stream
+        with a single call and flushed once. If a subclass overrides emit(),
+        it is called for each record instead.
+        """
+        if type(self).emit is not StreamHandler.emit:
+            Handler.emitBatch(self, records)
+        else:
+            self._writeBatch(records)
+
+    def _writeBatch(self, records):
+        lines = []
+        for record in records:
+            try:
+                lines.append(self.format(record) + self.terminator)
+            except Exception:
+                self.handleError(record)
+        if lines:
+            try:
+                self.stream.write(''.join(lines))
+                self.flush()
+            except Exception:
+                self.handleError(records[-1])
+
     def __repr__(self):
         level = getLevelName(self.level)
         name = getattr(self.stream, 'name', '')
@@ -1069,6 +1181,22 @@ class FileHandler(StreamHandler):
             self.stream = self._open()
         StreamHandler.emit(self, record)
 
+    def emitBatch(self, records):
+        """
+        Emit a sequence of records.
+
+        If the stream was not opened because 'delay' was specified in the
+        constructor, open it before writing the records as StreamHandler
+        does. If a subclass overrides emit(), it is called for each record
+        instead.
+        """
+        if type(self).emit is not FileHandler.emit:
+            Handler.emitBatch(self, records)
+        else:
+            if self.stream is None:
+                self.stream = self._open()
+            self._writeBatch(records)
+
     def __repr__(self):
         level = getLevelName(self.level)
         return '<%s %s (%s)>' % (self.__class__.__name__, self.baseFilename, level)
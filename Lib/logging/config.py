@@ -718,6 +718,19 @@ class DictConfigurator(BaseConfigurator):
                 except Exception as e:
                     raise ValueError('Unable to set target handler '
                                      '%r' % config['target']) from e
+            elif thread and\
+                issubclass(klass, logging.handlers.AsyncHandler) and\
+                'handlers' in config:
+                try:
+                    hl = [self.config['handlers'][h]
+                          for h in config['handlers']]
+                    if not all(isinstance(h, logging.Handler) for h in hl):
+                        config.update(config_copy)  # restore for deferred cfg
+                        raise TypeError('target not configured yet')
+                    config['handlers'] = hl
+                except Exception as e:
+                    raise ValueError('Unable to set target handlers '
+                                     '%r' % config['handlers']) from e
             elif issubclass(klass, logging.handlers.SMTPHandler) and\
                 'mailhost' in config:
                 config['mailhost'] = self.as_tuple(config['mailhost'])
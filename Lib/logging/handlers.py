@@ -23,7 +23,7 @@ Copyright (C) 2001-2016 Vinay Sajip. All Rights Reserved.
 To use, simply 'import logging.handlers' and log away!
 """
 
-import logging, socket, os, pickle, struct, time, re
+import logging, socket, os, pickle, struct, time, re, copy
 from stat import ST_DEV, ST_INO, ST_MTIME
 import queue
 try:
@@ -1381,15 +1381,21 @@ if threading:
         """
         _sentinel = None
 
-        def __init__(self, queue, *handlers, respect_handler_level=False):
+        def __init__(self, queue, *handlers, respect_handler_level=False,
+                     batch_size=1):
             """
             Initialise an instance with the specified queue and
             handlers.
+
+            If batch_size is greater than one, the records which are
+            already waiting on the queue when one is dequeued are
+            handled together, up to batch_size at a time.
             """
             self.queue = queue
             self.handlers = handlers
             self._thread = None
             self.respect_handler_level = respect_handler_level
+            self.batch_size = batch_size
 
         def dequeue(self, block):
             """
@@ -1437,6 +1443,25 @@ if threading:
                 if process:
                     handler.handle(record)
 
+        def handle_batch(self, records):
+            """
+            Handle a list of records.
+
+            This passes all the records to the handleBatch() method of each
+            handler, which takes the handler's lock once for the whole batch
+            rather than once per record. StreamHandler and FileHandler write
+            the batch to their stream at once.
+            """
+            records = [self.prepare(record) for record in records]
+            for handler in self.handlers:
+                if not self.respect_handler_level:
+                    batch = records
+                else:
+                    batch = [record for record in records
+                             if record.levelno >= handler.level]
+                if batch:
+                    handler.handleBatch(batch)
+
         def _monitor(self):
             """
             Monitor the queue for records, and ask the handler
@@ -1452,9 +1477,27 @@ if threading:
                     record = self.dequeue(True)
                     if record is self._sentinel:
                         break
-                    self.handle(record)
+                    records = [record]
+                    stop = False
+                    # Collect the records which are already waiting
+                    while len(records) < self.batch_size:
+                        try:
+                            record = self.dequeue(False)
+                        except queue.Empty:
+                            break
+                        if record is self._sentinel:
+                            stop = True
+                            break
+                        records.append(record)
+                    if len(records) == 1:
+                        self.handle(records[0])
+                    else:
+                        self.handle_batch(records)
                     if has_task_done:
-                        q.task_done()
+                        for record in records:
+                            q.task_done()
+                    if stop:
+                        break
                 except queue.Empty:
                     break
 
@@ -1462,11 +1505,12 @@ if threading:
             """
             This is used to enqueue the sentinel record.
 
-            The base implementation uses put_nowait. You may want to override this
+            The base implementation uses put, waiting for the listener to
+            make room if the queue is full. You may want to override this
             method if you want to use timeouts or work with custom queue
             implementations.
             """
-            self.queue.put_nowait(self._sentinel)
+            self.queue.put(self._sentinel)
 
         def stop(self):
             """
@@ -1479,3 +1523,114 @@ if threading:
             self.enqueue_sentinel()
             self._thread.join()
             self._thread = None
+
+    class AsyncHandler(QueueHandler):
+        """
+        This handler passes records to other handlers on a background
+        thread, so that logging calls do not wait for formatting or I/O.
+
+        Records are put on a queue, bounded by capacity unless it is zero,
+        and handled in batches by a QueueListener. When the queue is full,
+        records are dropped and counted, or if block is true the caller
+        waits for room for up to timeout seconds first. Closing the handler,
+        which logging.shutdown() does at exit, handles the records which
+        are still queued.
+        """
+        def __init__(self, handlers, capacity=10000, block=False,
+                     timeout=None, batch_size=100,
+                     respect_handler_level=False):
+            """
+            Initialise the handler and start the listener's thread, which
+            passes records to the given sequence of handlers.
+            """
+            if capacity:
+                q = queue.Queue(capacity)
+            else:
+                q = queue.SimpleQueue()
+            QueueHandler.__init__(self, q)
+            self.block = block
+            self.timeout = timeout
+            self.dropped = 0
+            # Number of records being put on the queue, which close() waits
+            # for before stopping the listener
+            self._putting = 0
+            self._put_done = threading.Condition(self.lock)
+            self.listener = QueueListener(
+                q, *handlers, respect_handler_level=respect_handler_level,
+                batch_size=batch_size)
+            self.listener.start()
+
+        def handle(self, record):
+            """
+            Conditionally emit the specified logging record.
+
+            Unlike other handlers, this does not hold the handler's lock,
+            as the queue does its own locking.
+            """
+            rv = self.filter(record)
+            if rv:
+                self.emit(record)
+            return rv
+
+        def enqueue(self, record):
+            """
+            Enqueue a record, or drop it if the queue is full or the handler
+            has been closed.
+            """
+            # The lock is only held to count the records being put, so that
+            # close() waits for them before queuing the listener's sentinel:
+            # a record put after the sentinel would be lost.
+            with self.lock:
+                if self.listener is None:
+                    self.dropped += 1
+                    return
+                self._putting += 1
+            try:
+                self.queue.put(record, self.block, self.timeout)
+            except queue.Full:
+                with self.lock:
+                    self.dropped += 1
+            finally:
+                with self.lock:
+                    self._putting -= 1
+                    if not self._putting:
+                        self._put_done.notify_all()
+
+        def prepare(self, record):
+            """
+            Prepare a record for queuing.
+
+            A copy of the record is queued, in which the message and
+            arguments are merged and the exception information is formatted
+            into exc_text, so that it is not affected by changes made to the
+            arguments after the logging call. The rest of the formatting is
+            left to the target handlers on the listener's thread, and
+            exc_info is kept for them. The original record, which other
+            handlers may still process, is left unchanged.
+            """
+            record = copy.copy(record)
+            record.msg = record.getMessage()
+            record.args = None
+            if record.exc_info and not record.exc_text:
+                fmt = self.formatter or logging._defaultFormatter
+                record.exc_text = fmt.formatException(record.exc_info)
+            return record
+
+        def close(self):
+            """
+            Handle the records left on the queue, stop the listener's thread
+            and tidy up.
+            """
+            self.acquire()
+            try:
+                listener, self.listener = self.listener, None
+                # Let the records being put reach the queue before the
+                # sentinel.  The listener keeps running meanwhile, so a put
+                # waiting for room is not stuck.
+                while self._putting:
+                    self._put_done.wait()
+            finally:
+                self.release()
+            if listener is not None:
+                listener.stop()
+            QueueHandler.close(self)
@@ -14,6 +14,7 @@ __all__ = [ 'BaseManager', 'SyncManager', 'BaseProxy', 'Token' ]
 # Imports
 #
 
+import os
 import sys
 import threading
 import array
@@ -28,6 +29,11 @@ from . import pool
 from . import process
 from . import util
 from . import get_context
+try:
+    from . import shared_memory
+    HAS_SHMEM = True
+except ImportError:
+    HAS_SHMEM = False
 
 #
 # Register some things for pickling
@@ -478,8 +484,8 @@ class BaseManager(object):
         Return server object with serve_forever() method and address attribute
         '''
         assert self._state.value == State.INITIAL
-        return Server(self._registry, self._address,
-                      self._authkey, self._serializer)
+        return self._Server(self._registry, self._address,
+                            self._authkey, self._serializer)
 
     def connect(self):
         '''
@@ -1158,3 +1164,144 @@ SyncManager.register('Namespace', Namespace, NamespaceProxy)
 # types returned by methods of PoolProxy
 SyncManager.register('Iterator', proxytype=IteratorProxy, create_method=False)
 SyncManager.register('AsyncResult', create_method=False)
+
+#
+# Definition of SharedMemoryManager and SharedMemoryServer
+#
+
+if HAS_SHMEM:
+    __all__.append('SharedMemoryManager')
+
+    class _SharedMemoryTracker(object):
+        '''
+        Manages one or more shared memory segments
+        '''
+
+        def __init__(self, name, segment_names=None):
+            self.shared_memory_context_name = name
+            self.segment_names = list(segment_names or ())
+
+        def register_segment(self, segment_name):
+            '''
+            Adds the supplied shared memory block name to tracker
+            '''
+            util.debug('register segment %r', segment_name)
+            self.segment_names.append(segment_name)
+
+        def destroy_segment(self, segment_name):
+            '''
+            Calls unlink() on the shared memory block with the supplied name
+            and removes it from the list of blocks being tracked
+            '''
+            util.debug('destroy segment %r', segment_name)
+            self.segment_names.remove(segment_name)
+            segment = shared_memory.SharedMemory(segment_name)
+            segment.close()
+            segment.unlink()
+
+        def unlink(self):
+            '''
+            Calls destroy_segment() on all tracked shared memory blocks
+            '''
+            for segment_name in self.segment_names[:]:
+                try:
+                    self.destroy_segment(segment_name)
+                except FileNotFoundError:
+                    # Already unlinked by one of the processes using it.
+                    pass
+
+        def __del__(self):
+            self.unlink()
+
+        def __getstate__(self):
+            return (self.shared_memory_context_name, self.segment_names)
+
+        def __setstate__(self, state):
+            self.__init__(*state)
+
+
+    class SharedMemoryServer(Server):
+        '''
+        Server which additionally owns the lifetime of shared memory blocks
+        '''
+        public = Server.public + \
+                 ['track_segment', 'release_segment', 'list_segments']
+
+        def __init__(self, *args, **kwds):
+            Server.__init__(self, *args, **kwds)
+            self.shared_memory_context = \
+                _SharedMemoryTracker('shm_%s_%d' % (self.address, os.getpid()))
+            util.debug('SharedMemoryServer started')
+
+        def shutdown(self, c):
+            '''
+            Call unlink() on all tracked shared memory, then shutdown
+            '''
+            self.shared_memory_context.unlink()
+            return Server.shutdown(self, c)
+
+        def track_segment(self, c, segment_name):
+            '''
+            Adds the supplied shared memory block name to the tracker
+            '''
+            self.shared_memory_context.register_segment(segment_name)
+
+        def release_segment(self, c, segment_name):
+            '''
+            Calls unlink() on the shared memory block with the supplied name
+            and stops tracking it
+            '''
+            self.shared_memory_context.destroy_segment(segment_name)
+
+        def list_segments(self, c):
+            '''
+            Returns the names of the shared memory blocks being tracked
+            '''
+            return self.shared_memory_context.segment_names
+
+
+    class SharedMemoryManager(BaseManager):
+        '''
+        Like SyncManager but uses SharedMemoryServer instead of Server
+
+        It provides methods for creating and returning SharedMemory
+        instances and for creating a list-like object (ShareableList)
+        backed by shared memory.  Every shared memory block created this
+        way is unlinked when the manager is shut down, so callers need not
+        track the lifetime of each block themselves.
+        '''
+        _Server = SharedMemoryServer
+
+        def SharedMemory(self, size):
+            '''
+            Returns a new SharedMemory instance with the specified size in
+            bytes, to be tracked by the manager
+            '''
+            conn = self._Client(self._address, authkey=self._authkey)
+            try:
+                sms = shared_memory.SharedMemory(None, create=True, size=size)
+                try:
+                    dispatch(conn, None, 'track_segment', (sms.name,))
+                except BaseException:
+                    sms.unlink()
+                    raise
+            finally:
+                conn.close()
+            return sms
+
+        def ShareableList(self, sequence):
+            '''
+            Returns a new ShareableList instance populated with the values
+            from the input sequence, to be tracked by the manager
+            '''
+            conn = self._Client(self._address, authkey=self._authkey)
+            try:
+                sl = shared_memory.ShareableList(sequence)
+                try:
+                    dispatch(conn, None, 'track_segment', (sl.shm.name,))
+                except BaseException:
+                    sl.shm.unlink()
+                    raise
+            finally:
+                conn.close()
+            return sl
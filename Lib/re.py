@@ -132,6 +132,7 @@ except ImportError:
 __all__ = [
     "match", "fullmatch", "search", "sub", "subn", "split",
     "findall", "finditer", "compile", "purge", "template", "escape",
+    "cache_info", "set_cache_size",
     "error", "A", "I", "L", "M", "S", "X", "U",
     "ASCII", "IGNORECASE", "LOCALE", "MULTILINE", "DOTALL", "VERBOSE",
     "UNICODE",
@@ -233,10 +234,34 @@ def compile(pattern, flags=0):
     return _compile(pattern, flags)
 
 def purge():
-    "Clear the regular expression caches"
-    _cache.clear()
+    "Clear the regular expression caches and their statistics"
+    _cached_compile.cache_clear()
     _compile_repl.cache_clear()
 
+def cache_info():
+    """Report statistics of the cache of compiled patterns.
+
+    Return a named tuple (hits, misses, maxsize, currsize), as returned by
+    the cache_info() method of functions wrapped by functools.lru_cache().
+    """
+    return _cached_compile.cache_info()
+
+def set_cache_size(maxsize):
+    """Set the maximum number of compiled patterns kept in the cache.
+
+    When the cache is full, the least recently used pattern is discarded.
+    If maxsize is None, the cache can grow without bound.  Changing the
+    size empties the cache and resets its statistics.
+    """
+    global _cached_compile
+    if maxsize is not None:
+        if not isinstance(maxsize, int):
+            raise TypeError("cache size must be an integer or None")
+        if maxsize < 0:
+            raise ValueError("cache size must not be negative")
+    _cached_compile = functools.lru_cache(maxsize, typed=True)(
+        _compile_uncached)
+
 def template(pattern, flags=0):
     "Compile a template pattern, returning a pattern object"
     return _compile(pattern, flags|T)
@@ -278,38 +303,51 @@ def escape(pattern):
 # --------------------------------------------------------------------
 # internals
 
-_cache = {}
-
 _pattern_type = type(sre_compile.compile("", 0))
 
 _MAXCACHE = 512
+
 def _compile(pattern, flags):
     # internal: compile pattern
-    try:
-        p, loc = _cache[type(pattern), pattern, flags]
-        if loc is None or loc == _locale.setlocale(_locale.LC_CTYPE):
-            return p
-    except KeyError:
-        pass
     if isinstance(pattern, _pattern_type):
         if flags:
             raise ValueError(
                 "cannot process flags argument with a compiled pattern")
         return pattern
+    entry = _cached_compile(pattern, flags)
+    p, loc = entry
+    if p is None:
+        # debugging output is printed by every compilation
+        return sre_compile.compile(pattern, flags)
+    if loc is not None:
+        current = _locale.setlocale(_locale.LC_CTYPE)
+        if loc != current:
+            # The locale has changed: recompile, updating the cache entry
+            # in place since the cache has no API for replacing it
+            p = sre_compile.compile(pattern, flags)
+            entry[:] = p, current
+    return p
+
+def _compile_uncached(pattern, flags):
+    # internal: compile pattern into a [pattern object, locale] entry for
+    # the cache; the locale is None unless the pattern depends on it.
+    # Patterns compiled with DEBUG get a [None, None] entry instead, so
+    # that flags are only tested on a cache miss.
     if not sre_compile.isstring(pattern):
         raise TypeError("first argument must be string or compiled pattern")
+    if flags & DEBUG:
+        return [None, None]
     p = sre_compile.compile(pattern, flags)
-    if not (flags & DEBUG):
-        if len(_cache) >= _MAXCACHE:
-            _cache.clear()
-        if p.flags & LOCALE:
-            if not _locale:
-                return p
-            loc = _locale.setlocale(_locale.LC_CTYPE)
-        else:
-            loc = None
-        _cache[type(pattern), pattern, flags] = p, loc
-    return p
+    loc = None
+    if p.flags & LOCALE and _locale:
+        loc = _locale.setlocale(_locale.LC_CTYPE)
+    return [p, loc]
+
+# The cache of compiled patterns, a true LRU cache which is safe to use
+# from several threads.  Keys include the type of the pattern, so that
+# str subclasses get their own entries.
+_cached_compile = functools.lru_cache(_MAXCACHE, typed=True)(
+    _compile_uncached)
 
 @functools.lru_cache(_MAXCACHE)
 def _compile_repl(repl, pattern):
@@ -145,6 +145,9 @@ def _get_module_details(mod_name, error=ImportError):
                 raise  # No module loaded; being a package is irrelevant
             raise error(("%s; %r is a package and cannot " +
                                "be directly executed") %(e, mod_name))
+    if isinstance(spec.loader, importlib.util._LazyImportLoader):
+        # The code is run eagerly here: drop the lazy import mode wrapper.
+        spec.loader = spec.loader.loader
     loader = spec.loader
     if loader is None:
         raise error("%r is a namespace package and cannot be executed"
@@ -514,6 +514,24 @@ def execusercustomize():
                 (err.__class__.__name__, err))
 
 
+def enablelazyimports():
+    """Enable lazy imports if requested on the command line.
+
+    This is done by the -X lazyimports option, whose value can list modules
+    to import eagerly (-X lazyimports=name,name), or by setting the
+    PYTHONLAZYIMPORTS environment variable to a non-empty string.
+    """
+    option = sys._xoptions.get('lazyimports')
+    if option is None and not sys.flags.ignore_environment:
+        if os.environ.get('PYTHONLAZYIMPORTS'):
+            option = True
+    if option is None:
+        return
+    exclude = option.split(',') if isinstance(option, str) else ()
+    import importlib.util
+    importlib.util.enable_lazy_imports(name.strip() for name in exclude
+                                       if name.strip())
+
 def main():
     """Add standard site-specific directories to the module search path.
 
@@ -537,6 +555,7 @@ def main():
     execsitecustomize()
     if ENABLE_USER_SITE:
         execusercustomize()
+    enablelazyimports()
 
 # Prevent extending of sys.path when python was started with -S and
 # site is imported later.
@@ -126,6 +126,7 @@ __version__ = "0.4"
 import socket
 import selectors
 import os
+import queue
 import sys
 try:
     import threading
@@ -136,8 +137,9 @@ from time import monotonic as time
 
 __all__ = ["BaseServer", "TCPServer", "UDPServer",
            "ThreadingUDPServer", "ThreadingTCPServer",
+           "ThreadPoolUDPServer", "ThreadPoolTCPServer",
            "BaseRequestHandler", "StreamRequestHandler",
-           "DatagramRequestHandler", "ThreadingMixIn"]
+           "DatagramRequestHandler", "ThreadingMixIn", "ThreadPoolMixIn"]
 if hasattr(os, "fork"):
     __all__.extend(["ForkingUDPServer","ForkingTCPServer", "ForkingMixIn"])
 if hasattr(socket, "AF_UNIX"):
@@ -649,6 +651,104 @@ class ThreadingMixIn:
         t.start()
 
 
+class ThreadPoolMixIn:
+    """Mix-in class to handle requests in a bounded pool of threads.
+
+    Worker threads are started on demand, up to max_workers, and are
+    reused for later requests.  Requests arriving while all workers are
+    busy wait in a queue until a worker becomes free.
+
+    """
+
+    # Maximum number of worker threads
+    max_workers = 16
+
+    # Timeout (in seconds) set on accepted stream sockets.  A persistent
+    # connection which stays idle for longer gives its worker back to the
+    # pool instead of holding it until the client disconnects.  None
+    # means no timeout.
+    idle_timeout = None
+
+    # The workers wait for requests forever, so they are daemon threads
+    # by default: they would otherwise keep the process alive until
+    # server_close() is called.
+    daemon_threads = True
+
+    _request_queue = None
+    _workers = None
+    _idle_semaphore = None
+
+    def process_request_thread(self, request, client_address):
+        """Same as in BaseServer but run in a worker thread.
+
+        In addition, exception handling is done here.
+
+        """
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def process_request(self, request, client_address):
+        """Hand the request over to an idle worker thread."""
+        if self._request_queue is None:
+            self._request_queue = queue.Queue()
+            self._workers = []
+            self._idle_semaphore = threading.Semaphore(0)
+        if self.idle_timeout is not None and isinstance(request, socket.socket):
+            request.settimeout(self.idle_timeout)
+        self._request_queue.put((request, client_address))
+        # Reuse an idle worker if there is one, otherwise start a new
+        # thread unless the pool is full.
+        if self._idle_semaphore.acquire(timeout=0):
+            return
+        if len(self._workers) < self.max_workers:
+            t = threading.Thread(target=self._worker,
+                                 name='%s-worker-%d' % (type(self).__name__,
+                                                         len(self._workers)))
+            t.daemon = self.daemon_threads
+            self._workers.append(t)
+            t.start()
+
+    def _worker(self):
+        try:
+            while True:
+                item = self._request_queue.get()
+                if item is None:
+                    return
+                self.process_request_thread(*item)
+                del item
+                self._idle_semaphore.release()
+        except BaseException:
+            # Exiting exceptions like SystemExit are not passed to
+            # handle_error() and end the thread: let a new worker take
+            # its place.
+            try:
+                self._workers.remove(threading.current_thread())
+            except ValueError:
+                pass
+            raise
+
+    def server_close(self):
+        """Called to clean-up the server.
+
+        Stop the worker threads once the queued requests are handled.
+        Wait for them unless they are daemon threads.
+
+        """
+        super().server_close()
+        workers = self._workers
+        if workers:
+            for t in workers:
+                self._request_queue.put(None)
+            if not self.daemon_threads:
+                for t in workers:
+                    t.join()
+            self._workers = []
+
+
 if hasattr(os, "fork"):
     class ForkingUDPServer(ForkingMixIn, UDPServer): pass
     class ForkingTCPServer(ForkingMixIn, TCPServer): pass
@@ -656,6 +756,9 @@ if hasattr(os, "fork"):
 class ThreadingUDPServer(ThreadingMixIn, UDPServer): pass
 class ThreadingTCPServer(ThreadingMixIn, TCPServer): pass
 
+class ThreadPoolUDPServer(ThreadPoolMixIn, UDPServer): pass
+class ThreadPoolTCPServer(ThreadPoolMixIn, TCPServer): pass
+
 if hasattr(socket, 'AF_UNIX'):
 
     class UnixStreamServer(TCPServer):
@@ -3,6 +3,7 @@
 #
 
 import unittest
+import unittest.mock
 import queue as pyqueue
 import time
 import io
@@ -51,6 +52,12 @@ try:
 except ImportError:
     HAS_SHAREDCTYPES = False
 
+try:
+    from multiprocessing import shared_memory
+    HAS_SHMEM = True
+except ImportError:
+    HAS_SHMEM = False
+
 try:
     import msvcrt
 except ImportError:
@@ -2967,6 +2974,196 @@ class _TestSharedCTypes(BaseTestCase):
         self.assertEqual(bar.x, 2)
         self.assertAlmostEqual(bar.y, 5.0)
 
+#
+# Tests for shared memory blocks and the SharedMemoryManager
+#
+
+@unittest.skipUnless(HAS_SHMEM, "requires multiprocessing.shared_memory")
+class _TestSharedMemory(BaseTestCase):
+
+    ALLOWED_TYPES = ('processes',)
+
+    @staticmethod
+    def _attach_existing_shmem_then_write(shmem_name, binary_data):
+        local_sms = shared_memory.SharedMemory(shmem_name)
+        local_sms.buf[:len(binary_data)] = binary_data
+        local_sms.close()
+
+    @staticmethod
+    def _write_to_shmem(sms, binary_data):
+        sms.buf[:len(binary_data)] = binary_data
+        sms.close()
+
+    def test_shared_memory_basics(self):
+        sms = shared_memory.SharedMemory(create=True, size=512)
+        self.addCleanup(sms.unlink)
+        self.addCleanup(sms.close)
+
+        self.assertGreaterEqual(sms.size, 512)
+        self.assertGreaterEqual(len(sms.buf), sms.size)
+        self.assertIn(sms.name, repr(sms))
+
+        # Modify contents of shared memory segment through memoryview.
+        sms.buf[0] = 42
+        self.assertEqual(sms.buf[0], 42)
+
+        # Attach to existing shared memory segment.
+        also_sms = shared_memory.SharedMemory(sms.name)
+        self.assertEqual(also_sms.buf[0], 42)
+        also_sms.close()
+
+        # Creating a segment with an existing name must fail.
+        with self.assertRaises(FileExistsError):
+            shared_memory.SharedMemory(sms.name, create=True, size=512)
+
+        with self.assertRaises(ValueError):
+            shared_memory.SharedMemory(create=True, size=-2)
+        with self.assertRaises(ValueError):
+            shared_memory.SharedMemory(create=True, size=0)
+        with self.assertRaises(ValueError):
+            shared_memory.SharedMemory(create=False)
+
+    def test_shared_memory_across_processes(self):
+        sms = shared_memory.SharedMemory(create=True, size=512)
+        self.addCleanup(sms.unlink)
+        self.addCleanup(sms.close)
+
+        # Verify remote attachment to existing block by name is working.
+        p = self.Process(
+            target=self._attach_existing_shmem_then_write,
+            args=(sms.name, b'howdy')
+        )
+        p.daemon = True
+        p.start()
+        p.join()
+        self.assertEqual(bytes(sms.buf[:5]), b'howdy')
+
+        # Verify passing the SharedMemory instance itself also works.
+        p = self.Process(
+            target=self._write_to_shmem,
+            args=(sms, b'HELLO')
+        )
+        p.daemon = True
+        p.start()
+        p.join()
+        self.assertEqual(bytes(sms.buf[:5]), b'HELLO')
+
+    def test_shared_memory_unlink(self):
+        sms = shared_memory.SharedMemory(create=True, size=64)
+        name = sms.name
+        sms.close()
+        sms.unlink()
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(name)
+
+    def test_shared_memory_attach_failure(self):
+        sms = shared_memory.SharedMemory(create=True, size=64)
+        self.addCleanup(sms.unlink)
+        self.addCleanup(sms.close)
+        closed = []
+        real_close = os.close
+        def close(fd):
+            closed.append(fd)
+            real_close(fd)
+        with unittest.mock.patch('mmap.mmap', side_effect=OSError), \
+             unittest.mock.patch('os.close', close):
+            # A failed attach leaves the segment alone, but closes the fd
+            with self.assertRaises(OSError):
+                shared_memory.SharedMemory(sms.name)
+            self.assertEqual(len(closed), 1)
+            # A failed create destroys the new segment
+            with self.assertRaises(OSError):
+                shared_memory.SharedMemory(sms.name + 'x', create=True,
+                                           size=64)
+            self.assertEqual(len(closed), 2)
+        also_sms = shared_memory.SharedMemory(sms.name)
+        also_sms.close()
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(sms.name + 'x')
+
+    def test_shared_memory_ShareableList_basics(self):
+        sl = shared_memory.ShareableList(
+            ['howdy', b'HoWdY', -273.154, 100, None, True, 42]
+        )
+        self.addCleanup(sl.shm.unlink)
+        self.addCleanup(sl.shm.close)
+
+        self.assertIn(sl.shm.name, repr(sl))
+        self.assertEqual(len(sl), 7)
+        self.assertEqual(sl.format, '8s8sdqxxxxxx?xxxxxxxx?q')
+        self.assertEqual(sl.index(42), 6)
+        self.assertEqual(sl.count(b'HoWdY'), 1)
+        with self.assertRaises(ValueError):
+            sl.index('not there')
+
+        # Exercise retrieving individual values and negative indexing.
+        self.assertEqual(sl[0], 'howdy')
+        self.assertEqual(sl[-2], True)
+        with self.assertRaises(IndexError):
+            sl[7]
+        with self.assertRaises(IndexError):
+            sl[7] = 2
+        self.assertEqual(sl[-7], 'howdy')
+        with self.assertRaises(IndexError):
+            sl[-8]
+        with self.assertRaises(IndexError):
+            sl[-8] = 2
+
+        # Assign values of different types, including to a former str slot.
+        sl[3] = 42
+        self.assertEqual(sl[3], 42)
+        sl[4] = 'some'
+        self.assertEqual(sl[4], 'some')
+        sl[0] = 3.5
+        self.assertEqual(sl[0], 3.5)
+        sl[0] = 'encodés'
+        self.assertEqual(sl[0], 'encodés')
+        with self.assertRaises(ValueError):
+            sl[0] = 'this string is too long to fit'
+        self.assertEqual(sl[0], 'encodés')
+
+        # Attach to the existing list by name and through pickling.
+        also_sl = shared_memory.ShareableList(name=sl.shm.name)
+        self.addCleanup(also_sl.shm.close)
+        self.assertEqual(list(also_sl), list(sl))
+        also_sl[1] = b'changed'
+        self.assertEqual(sl[1], b'changed')
+
+        import pickle
+        for proto in range(pickle.HIGHEST_PROTOCOL + 1):
+            with self.subTest(proto=proto):
+                unpickled_sl = pickle.loads(pickle.dumps(sl, proto))
+                self.assertEqual(list(unpickled_sl), list(sl))
+                unpickled_sl.shm.close()
+
+        empty_sl = shared_memory.ShareableList([])
+        self.addCleanup(empty_sl.shm.unlink)
+        self.addCleanup(empty_sl.shm.close)
+        self.assertEqual(len(empty_sl), 0)
+        self.assertEqual(list(empty_sl), [])
+
+    def test_shared_memory_SharedMemoryManager_basics(self):
+        smm = multiprocessing.managers.SharedMemoryManager()
+        smm.start()
+        sl = smm.ShareableList(range(4))
+        sms = smm.SharedMemory(128)
+        held_name = sms.name
+        self.assertEqual(list(sl), [0, 1, 2, 3])
+        sms.close()
+        sl.shm.close()
+        smm.shutdown()
+
+        # The manager unlinks every block it created on shutdown.
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(held_name)
+
+        with multiprocessing.managers.SharedMemoryManager() as smm:
+            sl = smm.ShareableList('howdy')
+            held_name = sl.shm.name
+            sl.shm.close()
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.ShareableList(name=held_name)
+
 #
 #
 #
@@ -3056,6 +3253,10 @@ class _TestImportStar(unittest.TestCase):
             # This module requires _ctypes
             modules.remove('multiprocessing.sharedctypes')
 
+        if not HAS_SHMEM:
+            # This module requires _posixshmem
+            modules.remove('multiprocessing.shared_memory')
+
         for name in modules:
             __import__(name)
             mod = sys.modules[name]
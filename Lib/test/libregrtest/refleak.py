@@ -5,6 +5,14 @@ import sys
 import warnings
 from inspect import isabstract
 from test import support
+try:
+    from _abc import _get_dump
+except ImportError:
+    def _get_dump(cls):
+        # Pure Python ABCMeta (_py_abc) stores the registry in a WeakSet
+        return (set(cls._abc_registry.data), set(cls._abc_cache.data),
+                set(cls._abc_negative_cache.data),
+                cls._abc_negative_cache_version)
 
 
 try:
@@ -66,7 +74,7 @@ def dash_R(the_module, test, indirect_test, huntrleaks):
         if not isabstract(abc):
             continue
         for obj in abc.__subclasses__() + [abc]:
-            abcs[obj] = obj._abc_registry.copy()
+            abcs[obj] = _get_dump(obj)[0]
 
     nwarmup, ntracked, fname = huntrleaks
     fname = os.path.join(support.SAVEDCWD, fname)
@@ -123,7 +131,6 @@ def dash_R(the_module, test, indirect_test, huntrleaks):
 def dash_R_cleanup(fs, ps, pic, zdc, abcs):
     import gc, copyreg
     import collections.abc
-    from weakref import WeakSet
 
     # Restore some original values.
     warnings.filters[:] = fs
@@ -143,13 +150,21 @@ def dash_R_cleanup(fs, ps, pic, zdc, abcs):
     sys._clear_type_cache()
 
     # Clear ABC registries, restoring previously saved ABC registries.
-    for abc in [getattr(collections.abc, a) for a in collections.abc.__all__]:
-        if not isabstract(abc):
-            continue
+    abs_classes = [getattr(collections.abc, a)
+                   for a in collections.abc.__all__]
+    abs_classes = [abc for abc in abs_classes if isabstract(abc)]
+    for abc in abs_classes:
+        for obj in abc.__subclasses__() + [abc]:
+            obj._abc_registry_clear()
+            obj._abc_caches_clear()
+    for abc in abs_classes:
+        for obj in abc.__subclasses__() + [abc]:
+            for ref in abcs.get(obj, ()):
+                if ref() is not None:
+                    obj.register(ref())
+    for abc in abs_classes:
         for obj in abc.__subclasses__() + [abc]:
-            obj._abc_registry = abcs.get(obj, WeakSet()).copy()
-            obj._abc_cache.clear()
-            obj._abc_negative_cache.clear()
+            obj._abc_caches_clear()
 
     clear_caches()
 
@@ -883,6 +883,10 @@ class AbstractUnpickleTests(unittest.TestCase):
         dumped = b'\x80\x04\x8d\4\0\0\0\0\0\0\0\xe2\x82\xac\x00.'
         self.assertEqual(self.loads(dumped), '\u20ac\x00')
 
+    def test_bytearray8(self):
+        dumped = b'\x80\x05\x96\x03\x00\x00\x00\x00\x00\x00\x00xxx.'
+        self.assertEqual(self.loads(dumped), bytearray(b'xxx'))
+
     @requires_32b
     def test_large_32b_binbytes8(self):
         dumped = b'\x80\x04\x8e\4\0\0\0\1\0\0\0\xe2\x82\xac\x00.'
@@ -895,6 +899,12 @@ class AbstractUnpickleTests(unittest.TestCase):
         self.check_unpickling_error((pickle.UnpicklingError, OverflowError),
                                     dumped)
 
+    @requires_32b
+    def test_large_32b_bytearray8(self):
+        dumped = b'\x80\x05\x96\4\0\0\0\1\0\0\0\xe2\x82\xac\x00.'
+        self.check_unpickling_error((pickle.UnpicklingError, OverflowError),
+                                    dumped)
+
     def test_get(self):
         pickled = b'((lp100000\ng100000\nt.'
         unpickled = self.loads(pickled)
@@ -1416,6 +1426,82 @@ class AbstractPickleTests(unittest.TestCase):
                 p = self.dumps(s, proto)
                 self.assert_is_copy(s, self.loads(p))
 
+    def test_bytearray(self):
+        for proto in protocols:
+            for s in b'', b'xyz', b'xyz'*100:
+                b = bytearray(s)
+                p = self.dumps(b, proto)
+                bb = self.loads(p)
+                self.assertIsNot(bb, b)
+                self.assert_is_copy(b, bb)
+                if proto <= 3:
+                    # bytearray is serialized using a global reference
+                    self.assertIn(b'bytearray', p)
+                    self.assertTrue(opcode_in_pickle(pickle.GLOBAL, p))
+                elif proto == 4:
+                    self.assertIn(b'bytearray', p)
+                    self.assertTrue(opcode_in_pickle(pickle.STACK_GLOBAL, p))
+                elif proto == 5:
+                    self.assertNotIn(b'bytearray', p)
+                    self.assertTrue(opcode_in_pickle(pickle.BYTEARRAY8, p))
+
+    def test_picklebuffer_in_band(self):
+        for proto in protocols:
+            if proto < 5:
+                # PickleBuffer is only picklable with protocol 5
+                with self.assertRaises(pickle.PicklingError):
+                    self.dumps(pickle.PickleBuffer(b'abc'), proto)
+                continue
+            for obj in b'', b'abc', bytearray(b'abc'):
+                data = self.dumps(pickle.PickleBuffer(obj), proto)
+                new = self.loads(data)
+                self.assertIs(type(new), type(obj))
+                self.assertEqual(new, obj)
+
+    def test_picklebuffer_oob(self):
+        for proto in range(5, pickle.HIGHEST_PROTOCOL + 1):
+            for obj in b'abc', bytearray(b'abc'):
+                buffers = []
+                data = self.dumps([pickle.PickleBuffer(obj)] * 2, proto,
+                                  buffer_callback=buffers.append)
+                self.assertEqual(len(buffers), 1)
+                self.assertNotIn(b'abc', data)
+                self.assertEqual(count_opcode(pickle.NEXT_BUFFER, data), 1)
+                self.assertEqual(count_opcode(pickle.READONLY_BUFFER, data),
+                                 1 if isinstance(obj, bytes) else 0)
+                new = self.loads(data, buffers=buffers)
+                # Out-of-band buffers are returned as-is
+                self.assertIs(new[0], buffers[0])
+                self.assertIs(new[1], new[0])
+                m = memoryview(new[0])
+                self.assertEqual(m.readonly, isinstance(obj, bytes))
+                self.assertEqual(m, obj)
+                # Any iterable of buffer-like objects is accepted
+                new = self.loads(data, buffers=iter([bytearray(b'xyz')]))
+                self.assertEqual(bytes(new[0]), b'xyz')
+                # Not enough buffers
+                with self.assertRaises(pickle.UnpicklingError):
+                    self.loads(data, buffers=[])
+                with self.assertRaises(pickle.UnpicklingError):
+                    self.loads(data)
+
+    def test_picklebuffer_callback_returns_true(self):
+        for proto in range(5, pickle.HIGHEST_PROTOCOL + 1):
+            data = self.dumps(pickle.PickleBuffer(bytearray(b'abc')), proto,
+                              buffer_callback=lambda buf: True)
+            self.assertFalse(opcode_in_pickle(pickle.NEXT_BUFFER, data))
+            self.assertEqual(self.loads(data), bytearray(b'abc'))
+
+    def test_buffer_callback_error(self):
+        for proto in range(5):
+            with self.assertRaises(ValueError):
+                self.dumps(b'abc', proto, buffer_callback=[].append)
+        def callback(buf):
+            1/0
+        with self.assertRaises(ZeroDivisionError):
+            self.dumps(pickle.PickleBuffer(b'abc'), 5,
+                       buffer_callback=callback)
+
     def test_ints(self):
         for proto in protocols:
             n = sys.maxsize
@@ -2557,7 +2643,7 @@ class AbstractPickleModuleTests(unittest.TestCase):
 
     def test_highest_protocol(self):
         # Of course this needs to be changed when HIGHEST_PROTOCOL changes.
-        self.assertEqual(pickle.HIGHEST_PROTOCOL, 4)
+        self.assertEqual(pickle.HIGHEST_PROTOCOL, 5)
 
     def test_callapi(self):
         f = io.BytesIO()
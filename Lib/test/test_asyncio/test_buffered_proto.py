@@ -0,0 +1,117 @@
+"""Tests for BufferedProtocol."""
+
+import asyncio
+import unittest
+from asyncio import protocols
+from asyncio import test_utils
+
+
+class ReceiveStuffProto(asyncio.BufferedProtocol):
+    def __init__(self, cb, con_lost_fut):
+        self.cb = cb
+        self.con_lost_fut = con_lost_fut
+
+    def get_buffer(self, sizehint):
+        self.buffer = bytearray(100)
+        return self.buffer
+
+    def buffer_updated(self, nbytes):
+        self.cb(self.buffer[:nbytes])
+
+    def connection_lost(self, exc):
+        if exc is None:
+            self.con_lost_fut.set_result(None)
+        else:
+            self.con_lost_fut.set_exception(exc)
+
+
+class BaseTestBufferedProtocol:
+
+    def new_loop(self):
+        raise NotImplementedError
+
+    def setUp(self):
+        super().setUp()
+        self.loop = self.new_loop()
+        self.set_event_loop(self.loop)
+
+    def test_buffered_proto_create_connection(self):
+
+        NOISE = b'12345678+' * 1024
+
+        @asyncio.coroutine
+        def handle_client(reader, writer):
+            data = yield from reader.readexactly(4)
+            self.assertEqual(data, b'o' * 4)
+
+            writer.write(NOISE)
+            writer.close()
+
+        srv = self.loop.run_until_complete(
+            asyncio.start_server(handle_client, '127.0.0.1', 0,
+                                 loop=self.loop))
+
+        port = srv.sockets[0].getsockname()[1]
+
+        buf = bytearray()
+
+        def on_buf(data):
+            buf.extend(data)
+
+        @asyncio.coroutine
+        def client():
+            con_lost_fut = self.loop.create_future()
+            tr, pr = yield from self.loop.create_connection(
+                lambda: ReceiveStuffProto(on_buf, con_lost_fut),
+                '127.0.0.1', port)
+            tr.write(b'o' * 4)
+            yield from con_lost_fut
+
+        self.loop.run_until_complete(client())
+        self.assertEqual(buf, NOISE)
+
+        srv.close()
+        self.loop.run_until_complete(srv.wait_closed())
+
+
+class BufferedProtocolSelectorTests(BaseTestBufferedProtocol,
+                                    test_utils.TestCase):
+
+    def new_loop(self):
+        return asyncio.SelectorEventLoop()
+
+
+class FeedDataToBufferedProtoTests(unittest.TestCase):
+
+    def make_proto(self, bufsize):
+        received = []
+
+        class Proto(asyncio.BufferedProtocol):
+            def get_buffer(self, sizehint):
+                self.buf = bytearray(bufsize)
+                return self.buf
+
+            def buffer_updated(self, nbytes):
+                received.append(bytes(self.buf[:nbytes]))
+
+        return Proto(), received
+
+    def test_large_buffer(self):
+        proto, received = self.make_proto(100)
+        protocols._feed_data_to_buffered_proto(proto, b'abcdef')
+        self.assertEqual(received, [b'abcdef'])
+
+    def test_small_buffer(self):
+        proto, received = self.make_proto(4)
+        protocols._feed_data_to_buffered_proto(proto, b'abcdefghij')
+        self.assertEqual(received, [b'abcd', b'efgh', b'ij'])
+
+    def test_empty_buffer(self):
+        proto, received = self.make_proto(0)
+        with self.assertRaisesRegex(RuntimeError, 'empty buffer'):
+            protocols._feed_data_to_buffered_proto(proto, b'abc')
+        self.assertEqual(received, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
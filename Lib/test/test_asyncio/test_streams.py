@@ -759,6 +759,27 @@ os.close(fd)
         protocol = asyncio.StreamReaderProtocol(reader)
         self.assertIs(protocol._loop, self.loop)
 
+    def test_streamreaderprotocol_data_received_override(self):
+        # A subclass overriding data_received() gets the data even though
+        # the transport reads into the protocol's buffer.
+        received = []
+        class Protocol(asyncio.StreamReaderProtocol):
+            def data_received(self, data):
+                received.append(data)
+                super().data_received(data)
+
+        rsock, wsock = socket.socketpair()
+        self.addCleanup(wsock.close)
+        reader = asyncio.StreamReader(loop=self.loop)
+        protocol = Protocol(reader, loop=self.loop)
+        transport, _ = self.loop.run_until_complete(
+            self.loop.create_connection(lambda: protocol, sock=rsock))
+        wsock.sendall(b'data')
+        data = self.loop.run_until_complete(reader.readexactly(4))
+        transport.close()
+        self.assertEqual(data, b'data')
+        self.assertEqual(received, [b'data'])
+
     def test_drain_raises(self):
         # See http://bugs.python.org/issue25441
 
@@ -4,6 +4,7 @@
 
 import test.support, unittest
 import os
+import re
 import sys
 import subprocess
 import tempfile
@@ -100,6 +101,35 @@ class CmdLineTest(unittest.TestCase):
         else:
             self.assertEqual(err, b'')
 
+    def test_importtime(self):
+        # -X importtime and PYTHONPROFILEIMPORTTIME print a line per imported
+        # module, nested imports being indented below their importer.
+        code = 'import json'
+        line_re = br'^import time: +\d+ \| +\d+ \| ( *)(\S+)$'
+        for args, env in ((('-X', 'importtime'), {}),
+                          ((), {'PYTHONPROFILEIMPORTTIME': '1'})):
+            with self.subTest(args=args, env=env):
+                rc, out, err = assert_python_ok(*args, '-c', code, **env)
+                lines = err.splitlines()
+                self.assertEqual(lines[0], b'import time: self [us] | '
+                                           b'cumulative | imported package')
+                found = {}
+                for line in lines[1:]:
+                    match = re.match(line_re, line)
+                    self.assertIsNotNone(match, line)
+                    indent, name = match.groups()
+                    found[name] = len(indent)
+                self.assertEqual(found[b'json'], 0)
+                self.assertEqual(found[b'json.decoder'], 2)
+                self.assertEqual(found[b'json.scanner'], 4)
+        # An empty PYTHONPROFILEIMPORTTIME and -E disable the report
+        rc, out, err = assert_python_ok('-c', code,
+                                        PYTHONPROFILEIMPORTTIME='')
+        self.assertNotIn(b'import time:', err)
+        rc, out, err = assert_python_ok('-E', '-c', code,
+                                        PYTHONPROFILEIMPORTTIME='1')
+        self.assertNotIn(b'import time:', err)
+
     def test_run_module(self):
         # Test expected operation of the '-m' switch
         # Switch needs an argument
@@ -430,7 +430,7 @@ class CmdLineTest(unittest.TestCase):
                 br'AttributeError'),
             ('builtins.x.y', br'Error while finding module specification.*'
                 br'ModuleNotFoundError.*No module named.*not a package'),
-            ('os.path', br'loader.*cannot handle'),
+            ('os.path', br'loader.*cannot handle|is not a frozen module'),
             ('importlib', br'No module named.*'
                 br'is a package and cannot be directly executed'),
             ('importlib.nonexistant', br'No module named'),
@@ -231,6 +231,39 @@ class TestNamedTuple(unittest.TestCase):
         self.assertEqual(Point.x.__doc__, 'Alias for field number 0')
         Point.x.__doc__ = 'docstring for Point.x'
         self.assertEqual(Point.x.__doc__, 'docstring for Point.x')
+        # Field descriptors are not shared between named tuple classes
+        Vector = namedtuple('Vector', 'x y')
+        self.assertEqual(Vector.x.__doc__, 'Alias for field number 0')
+
+    def test_field_descriptor(self):
+        Point = namedtuple('Point', 'x y')
+        p = Point(11, 22)
+        self.assertEqual((p.x, p.y), (11, 22))
+        with self.assertRaises(AttributeError):
+            p.x = 33
+        with self.assertRaises(AttributeError):
+            del p.y
+        self.assertIsNotNone(Point.x)
+        # The descriptors can be used on other tuples, but check bounds
+        self.assertEqual(Point.y.__get__((1, 2, 3)), 2)
+        self.assertRaises(IndexError, Point.y.__get__, (1,))
+        self.assertRaises(TypeError, Point.x.__get__, [1, 2])
+        for proto in range(pickle.HIGHEST_PROTOCOL + 1):
+            y = pickle.loads(pickle.dumps(Point.y, proto))
+            self.assertEqual(y.__get__(p), 22)
+            self.assertEqual(y.__doc__, Point.y.__doc__)
+
+    def test_new_signature(self):
+        Point = namedtuple('Point', 'x y')
+        self.assertEqual(str(inspect.signature(Point)), '(x, y)')
+        self.assertEqual(Point.__new__.__qualname__, 'Point.__new__')
+        with self.assertRaisesRegex(TypeError, "'y'"):
+            Point(1)
+        Empty = namedtuple('Empty', '')
+        self.assertEqual(Empty(), ())
+        Single = namedtuple('Single', 'a')
+        self.assertEqual(Single(a=1), (1,))
+        self.assertEqual(repr(Single(1)), 'Single(a=1)')
 
     def test_name_fixer(self):
         for spec, renamed in [
@@ -368,9 +401,8 @@ class TestNamedTuple(unittest.TestCase):
         self.assertEqual(newt, (10,20,30,40,50))
 
         # Broader test of all interesting names in a template
-        with support.captured_stdout() as template:
-            T = namedtuple('T', 'x', verbose=True)
-        words = set(re.findall('[A-Za-z]+', template.getvalue()))
+        T = namedtuple('T', 'x')
+        words = set(re.findall('[A-Za-z]+', T._source))
         words -= set(keyword.kwlist)
         T = namedtuple('T', words)
         # test __new__
@@ -397,8 +429,7 @@ class TestNamedTuple(unittest.TestCase):
         self.assertEqual(t.__getnewargs__(), values)
 
     def test_repr(self):
-        with support.captured_stdout() as template:
-            A = namedtuple('A', 'x', verbose=True)
+        A = namedtuple('A', 'x')
         self.assertEqual(repr(A(1)), 'A(x=1)')
         # repr should show the name of the subclass
         class B(A):
@@ -419,8 +450,10 @@ class TestNamedTuple(unittest.TestCase):
     def test_keyword_only_arguments(self):
         # See issue 25628
         with support.captured_stdout() as template:
-            NT = namedtuple('NT', ['x', 'y'], verbose=True)
+            with self.assertWarns(DeprecationWarning):
+                NT = namedtuple('NT', ['x', 'y'], verbose=True)
         self.assertIn('class NT', NT._source)
+        self.assertEqual(template.getvalue(), NT._source + '\n')
         with self.assertRaises(TypeError):
             NT = namedtuple('NT', ['x', 'y'], True)
 
@@ -11,7 +11,11 @@ test.support.import_module('threading')
 
 from test.support.script_helper import assert_python_ok
 
+import contextlib
+import logging
+from logging.handlers import QueueHandler
 import os
+import queue
 import sys
 import threading
 import time
@@ -20,9 +24,12 @@ import weakref
 
 from concurrent import futures
 from concurrent.futures._base import (
-    PENDING, RUNNING, CANCELLED, CANCELLED_AND_NOTIFIED, FINISHED, Future)
+    PENDING, RUNNING, CANCELLED, CANCELLED_AND_NOTIFIED, FINISHED, Future,
+    BrokenExecutor)
 from concurrent.futures.process import BrokenProcessPool
 
+import multiprocessing
+
 
 def create_future(state=PENDING, exception=None, result=None):
     f = Future()
@@ -54,6 +61,25 @@ def sleep_and_print(t, msg):
     sys.stdout.flush()
 
 
+INITIALIZER_STATUS = 'uninitialized'
+
+def init(x):
+    global INITIALIZER_STATUS
+    INITIALIZER_STATUS = x
+
+def get_init_status():
+    return INITIALIZER_STATUS
+
+def init_fail(log_queue=None):
+    if log_queue is not None:
+        logger = logging.getLogger('concurrent.futures')
+        logger.addHandler(QueueHandler(log_queue))
+        logger.setLevel('CRITICAL')
+        logger.propagate = False
+    time.sleep(0.1)  # let some futures be scheduled
+    raise ValueError('error in initializer')
+
+
 class MyObject(object):
     def my_method(self):
         pass
@@ -61,11 +87,19 @@ class MyObject(object):
 
 class ExecutorMixin:
     worker_count = 5
+    executor_kwargs = {}
 
     def setUp(self):
         self.t1 = time.time()
         try:
-            self.executor = self.executor_type(max_workers=self.worker_count)
+            if hasattr(self, "ctx"):
+                self.executor = self.executor_type(
+                    max_workers=self.worker_count,
+                    mp_context=self.get_context(),
+                    **self.executor_kwargs)
+            else:
+                self.executor = self.executor_type(
+                    max_workers=self.worker_count, **self.executor_kwargs)
         except NotImplementedError as e:
             self.skipTest(str(e))
         self._prime_executor()
@@ -93,6 +127,131 @@ class ThreadPoolMixin(ExecutorMixin):
 
 class ProcessPoolMixin(ExecutorMixin):
     executor_type = futures.ProcessPoolExecutor
+    # None selects the default start method
+    ctx = None
+
+    def get_context(self):
+        return multiprocessing.get_context(self.ctx)
+
+
+class ProcessPoolSpawnMixin(ProcessPoolMixin):
+    ctx = "spawn"
+
+
+class ProcessPoolForkserverMixin(ProcessPoolMixin):
+    ctx = "forkserver"
+
+    def get_context(self):
+        if sys.platform == "win32":
+            self.skipTest("require unix system")
+        return super().get_context()
+
+
+class InitializerMixin(ExecutorMixin):
+    worker_count = 2
+
+    def setUp(self):
+        global INITIALIZER_STATUS
+        INITIALIZER_STATUS = 'uninitialized'
+        self.executor_kwargs = dict(initializer=init,
+                                    initargs=('initialized',))
+        super().setUp()
+
+    def test_initializer(self):
+        futures = [self.executor.submit(get_init_status)
+                   for _ in range(self.worker_count)]
+
+        for f in futures:
+            self.assertEqual(f.result(), 'initialized')
+
+
+class FailingInitializerMixin(ExecutorMixin):
+    worker_count = 2
+
+    def setUp(self):
+        if self.executor_type is futures.ProcessPoolExecutor:
+            # Child processes log through a queue checked by _assert_logged()
+            self.log_queue = multiprocessing.Queue()
+            self.executor_kwargs = dict(initializer=init_fail,
+                                        initargs=(self.log_queue,))
+        else:
+            self.executor_kwargs = dict(initializer=init_fail)
+        super().setUp()
+
+    def test_initializer(self):
+        with self._assert_logged('ValueError: error in initializer'):
+            try:
+                future = self.executor.submit(get_init_status)
+            except BrokenExecutor:
+                # Perhaps the executor is already broken
+                pass
+            else:
+                with self.assertRaises(BrokenExecutor):
+                    future.result()
+            # At some point, the executor should break
+            t1 = time.time()
+            while not self.executor._broken:
+                if time.time() - t1 > 5:
+                    self.fail("executor not broken after 5 s.")
+                time.sleep(0.01)
+            # ... and from this point submit() is guaranteed to fail
+            with self.assertRaises(BrokenExecutor):
+                self.executor.submit(get_init_status)
+
+    def _prime_executor(self):
+        pass
+
+    @contextlib.contextmanager
+    def _assert_logged(self, msg):
+        if self.executor_type is futures.ProcessPoolExecutor:
+            yield
+            output = []
+            formatter = logging.Formatter()
+            try:
+                while True:
+                    record = self.log_queue.get_nowait()
+                    output.append(formatter.format(record))
+            except queue.Empty:
+                pass
+        else:
+            with self.assertLogs('concurrent.futures', 'CRITICAL') as cm:
+                yield
+            output = cm.output
+        self.assertTrue(any(msg in line for line in output),
+                        output)
+
+
+class ThreadPoolInitializerTest(ThreadPoolMixin, InitializerMixin,
+                                unittest.TestCase):
+    pass
+
+
+class ProcessPoolInitializerTest(ProcessPoolMixin, InitializerMixin,
+                                 unittest.TestCase):
+    pass
+
+
+class ThreadPoolFailingInitializerTest(ThreadPoolMixin,
+                                       FailingInitializerMixin,
+                                       unittest.TestCase):
+    pass
+
+
+class ProcessPoolFailingInitializerTest(ProcessPoolMixin,
+                                        FailingInitializerMixin,
+                                        unittest.TestCase):
+    pass
+
+
+class ProcessPoolSpawnInitializerTest(ProcessPoolSpawnMixin, InitializerMixin,
+                                      unittest.TestCase):
+    pass
+
+
+class ProcessPoolForkserverInitializerTest(ProcessPoolForkserverMixin,
+                                           InitializerMixin,
+                                           unittest.TestCase):
+    pass
 
 
 class ExecutorShutdownTest:
@@ -530,6 +689,71 @@ class ProcessPoolExecutorTest(ProcessPoolMixin, ExecutorTest, unittest.TestCase)
         self.assertIn('raise RuntimeError(123) # some comment',
                       f1.getvalue())
 
+    def test_initializer_not_callable(self):
+        with self.assertRaises(TypeError):
+            self.executor_type(1, initializer=42)
+
+    def test_max_tasks_per_child(self):
+        context = self.get_context()
+        if context.get_start_method(allow_none=False) == "fork":
+            with self.assertRaises(ValueError):
+                self.executor_type(1, mp_context=context,
+                                   max_tasks_per_child=3)
+            return
+        executor = self.executor_type(1, mp_context=context,
+                                      max_tasks_per_child=3)
+        f1 = executor.submit(os.getpid)
+        original_pid = f1.result()
+        # The worker pid remains the same as the worker could be reused
+        f2 = executor.submit(os.getpid)
+        self.assertEqual(f2.result(), original_pid)
+        self.assertEqual(len(executor._processes), 1)
+        f3 = executor.submit(os.getpid)
+        self.assertEqual(f3.result(), original_pid)
+
+        # A new worker is spawned, with a statistically different pid,
+        # while the previous was reaped.
+        f4 = executor.submit(os.getpid)
+        new_pid = f4.result()
+        self.assertNotEqual(original_pid, new_pid)
+
+        executor.shutdown()
+
+    def test_max_tasks_per_child_defaults_to_spawn(self):
+        executor = self.executor_type(1, max_tasks_per_child=3)
+        self.assertEqual(executor._mp_context.get_start_method(), "spawn")
+        self.assertEqual(executor.submit(mul, 6, 7).result(), 42)
+        executor.shutdown()
+
+    def test_max_tasks_early_shutdown(self):
+        context = self.get_context()
+        if context.get_start_method(allow_none=False) == "fork":
+            context = None
+        executor = self.executor_type(3, mp_context=context,
+                                      max_tasks_per_child=1)
+        futures = []
+        for i in range(6):
+            futures.append(executor.submit(mul, i, i))
+        executor.shutdown()
+        for i, future in enumerate(futures):
+            self.assertEqual(future.result(), mul(i, i))
+
+    def test_max_tasks_per_child_invalid(self):
+        with self.assertRaises(TypeError):
+            self.executor_type(1, max_tasks_per_child=1.5)
+        with self.assertRaises(ValueError):
+            self.executor_type(1, max_tasks_per_child=0)
+
+
+class ProcessPoolSpawnExecutorTest(ProcessPoolSpawnMixin,
+                                   ProcessPoolExecutorTest):
+    pass
+
+
+class ProcessPoolForkserverExecutorTest(ProcessPoolForkserverMixin,
+                                        ProcessPoolExecutorTest):
+    pass
+
 
 class FutureTests(unittest.TestCase):
     def test_done_callback_with_result(self):
@@ -5,6 +5,10 @@ import unittest
 
 from test.support import swap_item, swap_attr
 
+# Number of runs after which CPython creates the opcode cache of a code
+# object (_PyCode_OPCACHE_MIN_RUNS in Include/code.h).
+OPCACHE_MIN_RUNS = 1024
+
 
 class RebindBuiltinsTests(unittest.TestCase):
 
@@ -134,5 +138,101 @@ class RebindBuiltinsTests(unittest.TestCase):
         self.assertEqual(foo(), 7)
 
 
+class RebindBuiltinsWarmedUpTests(RebindBuiltinsTests):
+
+    """Same tests, with the opcode cache of the functions filled in."""
+
+    def configure_func(self, func, *args):
+        for _ in range(OPCACHE_MIN_RUNS + 1):
+            func(*args)
+
+
+class InstanceAttributeTests(unittest.TestCase):
+
+    """Test changes that must be seen by warmed-up attribute loads."""
+
+    def warm_up(self, func, *args):
+        for _ in range(OPCACHE_MIN_RUNS + 1):
+            func(*args)
+
+    def test_class_attribute_shadows_instance_attribute(self):
+        class C:
+            def __init__(self):
+                self.x = 1
+        def foo(obj):
+            return obj.x
+        c = C()
+        self.warm_up(foo, c)
+
+        self.assertEqual(foo(c), 1)
+        C.x = property(lambda self: 2)
+        self.assertEqual(foo(c), 2)
+        del C.x
+        self.assertEqual(foo(c), 1)
+
+    def test_base_class_attribute_shadows_instance_attribute(self):
+        class B:
+            pass
+        class C(B):
+            def __init__(self):
+                self.x = 1
+        def foo(obj):
+            return obj.x
+        c = C()
+        self.warm_up(foo, c)
+
+        B.x = property(lambda self: 2)
+        self.assertEqual(foo(c), 2)
+
+    def test_modify_instance_dict(self):
+        class C:
+            pass
+        def foo(obj):
+            return obj.x
+        c = C()
+        c.x = 1
+        self.warm_up(foo, c)
+
+        c.x = 2
+        self.assertEqual(foo(c), 2)
+        c.__dict__.clear()
+        c.y = 3
+        c.x = 4
+        self.assertEqual(foo(c), 4)
+        del c.x
+        with self.assertRaises(AttributeError):
+            foo(c)
+        c.__dict__ = {"x": 5}
+        self.assertEqual(foo(c), 5)
+
+    def test_different_instances_and_types(self):
+        class C:
+            def __init__(self, x):
+                self.x = x
+        class D:
+            x = "class"
+        def foo(obj):
+            return obj.x
+        self.warm_up(foo, C(1))
+
+        self.assertEqual([foo(C(i)) for i in range(3)], [0, 1, 2])
+        self.assertEqual(foo(D()), "class")
+        c = C(1)
+        c.__class__ = D
+        self.assertEqual(foo(c), 1)
+
+    def test_getattribute_added_to_type(self):
+        class C:
+            def __init__(self):
+                self.x = 1
+        def foo(obj):
+            return obj.x
+        c = C()
+        self.warm_up(foo, c)
+
+        C.__getattribute__ = lambda self, name: 2
+        self.assertEqual(foo(c), 2)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -739,6 +739,40 @@ class GCTests(unittest.TestCase):
         self.assertEqual(new[1]["collections"], old[1]["collections"])
         self.assertEqual(new[2]["collections"], old[2]["collections"] + 1)
 
+    def test_freeze(self):
+        gc.freeze()
+        self.addCleanup(gc.unfreeze)
+        self.assertGreater(gc.get_freeze_count(), 0)
+        gc.unfreeze()
+        self.assertEqual(gc.get_freeze_count(), 0)
+
+    def test_freeze_ignores_frozen_objects(self):
+        # A cycle that is frozen is not collected until it is unfrozen
+        if gc.isenabled():
+            self.addCleanup(gc.enable)
+            gc.disable()
+        gc.collect()
+        a = []
+        a.append(a)
+        wr = weakref.ref(C1055820(a))
+        gc.freeze()
+        self.addCleanup(gc.unfreeze)
+        frozen = gc.get_freeze_count()
+        self.assertGreater(frozen, 0)
+        del a
+        self.assertEqual(gc.collect(), 0)
+        self.assertIsNotNone(wr())
+        # Objects allocated after the freeze are still collected
+        b = []
+        b.append(b)
+        del b
+        self.assertGreaterEqual(gc.collect(), 1)
+        self.assertEqual(gc.get_freeze_count(), frozen)
+        gc.unfreeze()
+        self.assertEqual(gc.get_freeze_count(), 0)
+        self.assertGreater(gc.collect(), 0)
+        self.assertIsNone(wr())
+
 
 class GCCallbackTests(unittest.TestCase):
     def setUp(self):
@@ -1,3 +1,6 @@
+import email.message
+import email.parser
+import email.policy
 import errno
 from http import client
 import io
@@ -313,6 +316,60 @@ class HeaderTests(TestCase):
             self.assertIn(' folded with space', folded)
             self.assertTrue(folded.endswith('folded with tab'))
 
+    def test_parse_headers_same_as_email_parser(self):
+        # parse_headers() builds plain header blocks itself and must give
+        # exactly what email.parser gives for those and for all the
+        # unusual ones it hands over to email.parser.
+        cases = [
+            b'Content-Length: 42\r\nContent-Type: text/html\r\n\r\n',
+            b'Trailing-Space: value \r\nEmpty:\t \r\nNo-Space:x\n\n',
+            b'obs-text: ' + bytes(range(0x80, 0xFF + 1)) + b'\r\n\r\n',
+            b'Unterminated: value\r\n',
+            b'\r\n',
+            b'',
+            b'obs-fold: text\r\n folded with space\r\n\r\n',
+            b' Leading: continuation\r\n\r\n',
+            b'First: val\r\n: nval\r\nSecond: val\r\n\r\n',
+            b'Space : before colon\r\nOther: val\r\n\r\n',
+            b'No colon\r\nOther: val\r\n\r\n',
+            b'From nobody\r\nOther: val\r\n\r\n',
+            b'Bare-CR: a\rb\r\n\r\n',
+            b'Content-Type: multipart/mixed; boundary=x\r\n\r\n',
+            b'Content-Type: message/rfc822\r\n\r\n',
+        ]
+        for data in cases:
+            with self.subTest(data=data):
+                msg = client.parse_headers(io.BytesIO(data))
+                expected = email.parser.Parser(
+                    _class=client.HTTPMessage).parsestr(
+                        data.decode('iso-8859-1'))
+                self.assertIsInstance(msg, client.HTTPMessage)
+                self.assertEqual(msg.items(), expected.items())
+                self.assertEqual(msg.is_multipart(), expected.is_multipart())
+                self.assertEqual(list(map(type, msg.defects)),
+                                 list(map(type, expected.defects)))
+                self.assertEqual(msg.get_unixfrom(), expected.get_unixfrom())
+                self.assertEqual(msg.as_string(), expected.as_string())
+
+    def test_parse_headers_custom_class(self):
+        class Message(email.message.Message):
+            pass
+
+        data = b'Host: example.com\r\nAccept: */*\r\n\r\n'
+        msg = client.parse_headers(io.BytesIO(data), _class=Message)
+        self.assertIs(type(msg), Message)
+        self.assertEqual(msg.items(),
+                         [('Host', 'example.com'), ('Accept', '*/*')])
+
+        class PolicyMessage(email.message.Message):
+            def __init__(self):
+                super().__init__(policy=email.policy.HTTP)
+
+        msg = client.parse_headers(io.BytesIO(data), _class=PolicyMessage)
+        self.assertIs(type(msg), PolicyMessage)
+        self.assertIs(msg.policy, email.policy.HTTP)
+        self.assertEqual(msg['Host'], 'example.com')
+
     def test_invalid_headers(self):
         conn = client.HTTPConnection('example.com')
         conn.sock = FakeSocket('')
@@ -5,7 +5,7 @@ Josip Dzolonga, and Michael Otteneder for the 2007/08 GHOP contest.
 """
 
 from http.server import BaseHTTPRequestHandler, HTTPServer, \
-     SimpleHTTPRequestHandler, CGIHTTPRequestHandler
+     ThreadingHTTPServer, SimpleHTTPRequestHandler, CGIHTTPRequestHandler
 from http import server, HTTPStatus
 
 import os
@@ -41,7 +41,8 @@ class TestServerThread(threading.Thread):
         self.test_object = test_object
 
     def run(self):
-        self.server = HTTPServer(('localhost', 0), self.request_handler)
+        self.server = self.test_object.server_class(('localhost', 0),
+                                                    self.request_handler)
         self.test_object.HOST, self.test_object.PORT = self.server.socket.getsockname()
         self.test_object.server_started.set()
         self.test_object = None
@@ -55,6 +56,8 @@ class TestServerThread(threading.Thread):
 
 
 class BaseTestCase(unittest.TestCase):
+    server_class = HTTPServer
+
     def setUp(self):
         self._threads = support.threading_setup()
         os.environ = support.EnvironmentVarGuard()
@@ -282,6 +285,50 @@ class BaseHTTPServerTestCase(BaseTestCase):
             self.assertEqual(b'', data)
 
 
+class ThreadingHTTPServerTestCase(BaseTestCase):
+    server_class = ThreadingHTTPServer
+
+    class request_handler(NoLogRequestHandler, BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        unblock = threading.Event()
+        thread_names = []
+
+        def do_GET(self):
+            self.thread_names.append(threading.current_thread().name)
+            if self.path == '/block':
+                self.unblock.wait(10)
+            self.send_response(HTTPStatus.OK)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+
+    def test_slow_client_does_not_block_others(self):
+        blocked = http.client.HTTPConnection(self.HOST, self.PORT)
+        self.addCleanup(blocked.close)
+        self.addCleanup(self.request_handler.unblock.set)
+        blocked.request('GET', '/block')
+
+        res = self.request('/')
+        self.assertEqual(res.status, HTTPStatus.OK)
+        self.connection.close()
+
+        self.request_handler.unblock.set()
+        self.assertEqual(blocked.getresponse().status, HTTPStatus.OK)
+        blocked.close()
+
+    def test_requests_run_in_thread_pool(self):
+        names = self.request_handler.thread_names
+        names.clear()
+        for i in range(3):
+            res = self.request('/')
+            self.assertEqual(res.status, HTTPStatus.OK)
+            res.read()
+            self.connection.close()
+        # The requests are handled by the worker threads of the pool
+        self.assertEqual(len(names), 3)
+        for name in names:
+            self.assertRegex(name, r'^ThreadingHTTPServer-worker-\d+$')
+
+
 class RequestHandlerLoggingTestCase(BaseTestCase):
     class request_handler(BaseHTTPRequestHandler):
         protocol_version = 'HTTP/1.1'
@@ -1056,6 +1103,7 @@ def test_main(verbose=None):
             RequestHandlerLoggingTestCase,
             BaseHTTPRequestHandlerTestCase,
             BaseHTTPServerTestCase,
+            ThreadingHTTPServerTestCase,
             SimpleHTTPServerTestCase,
             CGIHTTPServerTestCase,
             SimpleHTTPRequestHandlerTestCase,
@@ -216,7 +216,8 @@ class ImportTests(unittest.TestCase):
         orig_path = os.path
         orig_getenv = os.getenv
         with support.EnvironmentVarGuard():
-            x = imp.find_module("os")
+            # Pass the path, os is otherwise found as a frozen module.
+            x = imp.find_module("os", [os.path.dirname(os.__file__)])
             self.addCleanup(x[0].close)
             new_os = imp.load_module("os", *x)
             self.assertIs(os, new_os)
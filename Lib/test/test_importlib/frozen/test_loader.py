@@ -3,7 +3,10 @@ from .. import util
 
 machinery = util.import_importlib('importlib.machinery')
 
-from test.support import captured_stdout
+from test.support import captured_stdout, temp_dir
+from test.support.script_helper import assert_python_ok
+import json
+import os
 import types
 import unittest
 import warnings
@@ -221,5 +224,59 @@ class InspectLoaderTests:
  ) = util.test_both(InspectLoaderTests, machinery=machinery)
 
 
+class StdlibTests(unittest.TestCase):
+
+    """The startup modules of the standard library are frozen into the
+    interpreter, unless -X frozen_modules=off is used."""
+
+    names = ['abc', 'codecs', 'encodings', 'encodings.aliases', 'io', 'os',
+             'stat', 'genericpath', '_collections_abc', 'site']
+
+    def get_modules(self, *args, **env_vars):
+        code = ('import json, sys\n'
+                'import encodings.cp437, ' + ', '.join(self.names) + '\n'
+                'print(json.dumps({name: [m.__spec__.origin, m.__file__,\n'
+                '                         getattr(m, "__path__", None)]\n'
+                '                  for name, m in sys.modules.items()\n'
+                '                  if name in %r}))\n'
+                'print(json.dumps(encodings.cp437.__file__))\n'
+                'print(json.dumps(os.walk.__code__.co_filename))\n'
+                % (self.names,))
+        rc, out, err = assert_python_ok(*args, '-c', code, **env_vars)
+        modules, cp437, filename = out.decode().splitlines()
+        return json.loads(modules), json.loads(cp437), json.loads(filename)
+
+    def test_frozen(self):
+        frozen, frozen_cp437, frozen_filename = self.get_modules()
+        source, source_cp437, source_filename = self.get_modules(
+            '-X', 'frozen_modules=off')
+        self.assertEqual(sorted(frozen), sorted(self.names))
+        for name in self.names:
+            with self.subTest(name=name):
+                origin, path, pkgpath = frozen[name]
+                self.assertEqual(origin, 'frozen')
+                source_origin, source_path, source_pkgpath = source[name]
+                self.assertEqual(source_origin, source_path)
+                # The frozen modules still point to their source.
+                self.assertEqual(path, source_path)
+                self.assertEqual(pkgpath, source_pkgpath)
+        # Submodules of the frozen packages are found on the file system.
+        self.assertEqual(frozen_cp437, source_cp437)
+        self.assertEqual(frozen_filename, frozen['os'][1])
+        self.assertEqual(source_filename, frozen['os'][1])
+
+    def test_os_on_pythonpath(self):
+        # The source of the frozen modules is looked up in the directory of
+        # the standard library, not in the first sys.path entry with an
+        # os.py.
+        with temp_dir() as path:
+            with open(os.path.join(path, 'os.py'), 'w') as f:
+                f.write('raise ImportError\n')
+            frozen, cp437, filename = self.get_modules(PYTHONPATH=path)
+        self.assertEqual(frozen['os'][0], 'frozen')
+        self.assertEqual(frozen['os'][1], os.__file__)
+        self.assertEqual(filename, os.__file__)
+
+
 if __name__ == '__main__':
     unittest.main()
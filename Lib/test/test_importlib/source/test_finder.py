@@ -9,7 +9,7 @@ import py_compile
 import stat
 import sys
 import tempfile
-from test.support import make_legacy_pyc
+from test.support import make_legacy_pyc, swap_attr
 import unittest
 import warnings
 
@@ -186,6 +186,76 @@ class FinderTests(abc.FinderTests):
             found = self._find(finder, 'doesnotexist')
             self.assertEqual(found, self.NOT_FOUND)
 
+    def make_dir_cache_root(self, pycache=True, age=10):
+        tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tempdir.cleanup)
+        root = tempdir.name
+        if pycache:
+            os.mkdir(os.path.join(root, '__pycache__'))
+        with open(os.path.join(root, 'mod.py'), 'w'):
+            pass
+        mtime = os.stat(root).st_mtime - age
+        os.utime(root, (mtime, mtime))
+        return root
+
+    def get_dir_cache_finder(self, root):
+        finder = self.get_finder(root)
+        finder._persistent_cache = True
+        return finder
+
+    def hide_from_dir_cache(self, finder, name):
+        cache_path = finder._dir_cache_path()
+        with open(cache_path, 'rb') as file:
+            header, _, names = file.read().partition(b'\n')
+        names = [n for n in names.split(b'\n') if n != name.encode()]
+        with open(cache_path, 'wb') as file:
+            file.write(header + b'\n' + b'\n'.join(names))
+
+    def test_persistent_cache(self):
+        root = self.make_dir_cache_root()
+        with swap_attr(sys, 'dont_write_bytecode', False):
+            finder = self.get_dir_cache_finder(root)
+            self.assertIsNotNone(self._find(finder, 'mod', loader_only=True))
+            self.assertTrue(os.path.exists(finder._dir_cache_path()))
+            # Other finders use the saved listing.
+            self.hide_from_dir_cache(finder, 'mod.py')
+            finder = self.get_dir_cache_finder(root)
+            self.assertEqual(self._find(finder, 'mod'), self.NOT_FOUND)
+            # The listing is out of date once the directory is modified.
+            mtime = os.stat(root).st_mtime + 1
+            os.utime(root, (mtime, mtime))
+            finder = self.get_dir_cache_finder(root)
+            self.assertIsNotNone(self._find(finder, 'mod', loader_only=True))
+            # Without the option the saved listing is ignored.
+            self.hide_from_dir_cache(finder, 'mod.py')
+            finder = self.get_finder(root)
+            self.assertIsNotNone(self._find(finder, 'mod', loader_only=True))
+
+    def test_persistent_cache_recently_modified(self):
+        # The directory could have been modified after it was listed without
+        # its mtime changing.
+        root = self.make_dir_cache_root(age=0)
+        with swap_attr(sys, 'dont_write_bytecode', False):
+            finder = self.get_dir_cache_finder(root)
+            self._find(finder, 'mod')
+            self.hide_from_dir_cache(finder, 'mod.py')
+            finder = self.get_dir_cache_finder(root)
+            self.assertIsNotNone(self._find(finder, 'mod', loader_only=True))
+
+    def test_persistent_cache_not_written(self):
+        # The listing is only saved to an existing __pycache__ directory, and
+        # not when bytecode isn't written either.
+        root = self.make_dir_cache_root(pycache=False)
+        with swap_attr(sys, 'dont_write_bytecode', False):
+            finder = self.get_dir_cache_finder(root)
+            self.assertIsNotNone(self._find(finder, 'mod', loader_only=True))
+        self.assertEqual(os.listdir(root), ['mod.py'])
+        root = self.make_dir_cache_root()
+        with swap_attr(sys, 'dont_write_bytecode', True):
+            finder = self.get_dir_cache_finder(root)
+            self.assertIsNotNone(self._find(finder, 'mod', loader_only=True))
+        self.assertEqual(os.listdir(os.path.join(root, '__pycache__')), [])
+
 
 class FinderTestsPEP451(FinderTests):
 
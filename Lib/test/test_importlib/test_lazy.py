@@ -1,12 +1,22 @@
 import importlib
 from importlib import abc
 from importlib import util
+import os
 import sys
+import time
 import types
 import unittest
 
+from test import support
+from test.support import script_helper
+
 from . import util as test_util
 
+try:
+    import threading
+except ImportError:
+    threading = None
+
 
 class CollectInit:
 
@@ -140,6 +150,158 @@ class LazyLoaderTests(unittest.TestCase):
             # Force the load; just care that no exception is raised.
             module.__name__
 
+    def test_self_reference_during_load(self):
+        # The module can look up its own attributes while it is executed.
+        source = ('import sys; attr = 42; '
+                  'seen = sys.modules[__spec__.name].attr')
+        with test_util.uncache(TestingImporter.module_name):
+            module = self.new_module(source)
+            sys.modules[TestingImporter.module_name] = module
+            self.assertEqual(module.seen, 42)
+            self.assertIs(type(module), types.ModuleType)
+
+    def test_failed_load_is_retried(self):
+        source = ('import sys; tries = sys.modules[__spec__.name].__dict__; '
+                  'count = tries.get("count", 0) + 1\n'
+                  'if count == 1: raise ValueError\n'
+                  'attr = 42')
+        with test_util.uncache(TestingImporter.module_name):
+            module = self.new_module(source)
+            sys.modules[TestingImporter.module_name] = module
+            with self.assertRaises(ValueError):
+                module.attr
+            self.assertEqual(module.attr, 42)
+
+    @unittest.skipUnless(threading, 'requires threading')
+    def test_concurrent_loads(self):
+        # Only one thread runs the module, the others wait for it to be done.
+        source = ('import sys, time; sys.lazy_loads.append(__name__); '
+                  'time.sleep(0.1); attr = 42')
+        loads = []
+        with test_util.uncache(TestingImporter.module_name), \
+             support.swap_attr(sys, 'lazy_loads', loads):
+            module = self.new_module(source)
+            sys.modules[TestingImporter.module_name] = module
+            results = []
+            threads = [threading.Thread(target=lambda: results.append(module.attr))
+                       for _ in range(5)]
+            with support.start_threads(threads):
+                pass
+            self.assertEqual(results, [42] * 5)
+            self.assertEqual(len(loads), 1)
+
+
+class LazyImportModeTests(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = support.TESTFN + '_lazy'
+        os.mkdir(self.tmpdir)
+        self.addCleanup(support.rmtree, self.tmpdir)
+        self.addCleanup(util.disable_lazy_imports)
+        self.names = ['lazy_mod', 'lazy_pkg', 'lazy_pkg.sub']
+        self.addCleanup(support.forget, 'lazy_pkg.sub')
+        for name in self.names:
+            self.addCleanup(support.forget, name)
+        self.write('lazy_mod.py')
+        os.mkdir(os.path.join(self.tmpdir, 'lazy_pkg'))
+        self.write(os.path.join('lazy_pkg', '__init__.py'))
+        self.write(os.path.join('lazy_pkg', 'sub.py'))
+        importlib.invalidate_caches()
+        sys.path.insert(0, self.tmpdir)
+        self.addCleanup(sys.path.remove, self.tmpdir)
+        self.addCleanup(sys.__dict__.pop, 'lazy_executed', None)
+        sys.lazy_executed = []
+
+    def write(self, path):
+        with open(os.path.join(self.tmpdir, path), 'w') as file:
+            file.write('import sys; sys.lazy_executed.append(__name__)\n'
+                       'attr = __name__\n')
+
+    def test_lazy_import(self):
+        util.enable_lazy_imports()
+        import lazy_mod
+        self.assertEqual(sys.lazy_executed, [])
+        self.assertEqual(lazy_mod.attr, 'lazy_mod')
+        self.assertEqual(sys.lazy_executed, ['lazy_mod'])
+        self.assertIs(type(lazy_mod), types.ModuleType)
+        self.assertIsInstance(lazy_mod.__loader__,
+                              importlib.machinery.SourceFileLoader)
+        self.assertIsInstance(lazy_mod.__spec__.loader,
+                              importlib.machinery.SourceFileLoader)
+
+    def test_submodule_loads_parent(self):
+        util.enable_lazy_imports()
+        import lazy_pkg.sub
+        self.assertEqual(sys.lazy_executed, ['lazy_pkg'])
+        self.assertEqual(lazy_pkg.sub.attr, 'lazy_pkg.sub')
+        self.assertEqual(sys.lazy_executed, ['lazy_pkg', 'lazy_pkg.sub'])
+
+    def test_exclude(self):
+        util.enable_lazy_imports(exclude=['lazy_pkg'])
+        import lazy_mod
+        import lazy_pkg.sub
+        self.assertEqual(sys.lazy_executed, ['lazy_pkg', 'lazy_pkg.sub'])
+        lazy_mod.attr
+        self.assertEqual(sys.lazy_executed,
+                         ['lazy_pkg', 'lazy_pkg.sub', 'lazy_mod'])
+        with self.assertRaises(TypeError):
+            util.enable_lazy_imports(exclude='lazy_mod')
+
+    def test_enable_twice(self):
+        util.enable_lazy_imports(exclude=['lazy_mod'])
+        util.enable_lazy_imports(exclude=['lazy_pkg'])
+        finders = [finder for finder in sys.meta_path
+                   if isinstance(finder, util._LazyImportFinder)]
+        self.assertEqual(len(finders), 1)
+        import lazy_mod
+        import lazy_pkg
+        self.assertEqual(sys.lazy_executed, ['lazy_mod', 'lazy_pkg'])
+
+    def test_disable(self):
+        util.enable_lazy_imports()
+        util.disable_lazy_imports()
+        self.assertFalse(any(isinstance(finder, util._LazyImportFinder)
+                             for finder in sys.meta_path))
+        import lazy_mod
+        self.assertEqual(sys.lazy_executed, ['lazy_mod'])
+
+    def test_missing_module(self):
+        util.enable_lazy_imports()
+        with self.assertRaises(ModuleNotFoundError):
+            import lazy_missing
+
+    def test_builtin_and_extension_modules_are_eager(self):
+        util.enable_lazy_imports()
+        spec = util.find_spec('lazy_mod')
+        self.assertIsInstance(spec.loader, util.LazyLoader)
+        # The wrapper still provides the other loader methods.
+        self.assertEqual(spec.loader.get_filename('lazy_mod'), spec.origin)
+        for name in ('sys', 'itertools', '_testcapi'):
+            with self.subTest(name=name):
+                with support.CleanImport(name):
+                    spec = util.find_spec(name)
+                    if spec is None:
+                        self.skipTest('requires ' + name)
+                    self.assertNotIsInstance(spec.loader, util.LazyLoader)
+
+    def test_command_line(self):
+        code = ('import sys, json; '
+                'print(type(sys.modules["json"]).__name__, json.dumps(1))')
+        rc, out, err = script_helper.assert_python_ok('-c', code)
+        self.assertEqual(out.strip(), b'module 1')
+        rc, out, err = script_helper.assert_python_ok('-X', 'lazyimports',
+                                                      '-c', code)
+        self.assertEqual(out.strip(), b'_LazyModule 1')
+        rc, out, err = script_helper.assert_python_ok(
+            '-X', 'lazyimports=json', '-c', code)
+        self.assertEqual(out.strip(), b'module 1')
+        rc, out, err = script_helper.assert_python_ok(
+            '-c', code, PYTHONLAZYIMPORTS='1')
+        self.assertEqual(out.strip(), b'_LazyModule 1')
+        rc, out, err = script_helper.assert_python_ok(
+            '-E', '-c', code, PYTHONLAZYIMPORTS='1')
+        self.assertEqual(out.strip(), b'module 1')
+
 
 if __name__ == '__main__':
     unittest.main()
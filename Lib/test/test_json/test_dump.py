@@ -9,9 +9,40 @@ class TestDump:
         self.json.dump({}, sio)
         self.assertEqual(sio.getvalue(), '{}')
 
+    def test_dump_buffered(self):
+        class Writer:
+            def __init__(self):
+                self.chunks = []
+            def write(self, s):
+                self.chunks.append(s)
+        obj = [{'key': i, 'values': [i, str(i)]} for i in range(5000)]
+        w = Writer()
+        self.json.dump(obj, w, indent=1)
+        self.assertEqual(''.join(w.chunks), self.dumps(obj, indent=1))
+        # The chunks produced by the encoder are written in large pieces
+        self.assertLess(len(w.chunks), 50)
+        self.assertTrue(all(len(s) >= self.json._WRITE_SIZE
+                            for s in w.chunks[:-1]))
+
     def test_dumps(self):
         self.assertEqual(self.dumps({}), '{}')
 
+    def test_dumpb(self):
+        self.assertEqual(self.json.dumpb({}), b'{}')
+        obj = {"k\xb5": ["\u20ac", 1.5, None, "\U0001d120"]}
+        for kw in {}, {'ensure_ascii': False}, {'indent': 2, 'sort_keys': True}:
+            self.assertEqual(self.json.dumpb(obj, **kw),
+                             self.dumps(obj, **kw).encode('utf-8'))
+        self.assertEqual(self.json.dumpb('\xb5', ensure_ascii=False),
+                         b'"\xc2\xb5"')
+        self.assertRaises(UnicodeEncodeError, self.json.dumpb, ['\ud800'],
+                          ensure_ascii=False)
+
+        class Encoder(self.json.JSONEncoder):
+            def encode(self, o):
+                return '"\xb5"'
+        self.assertEqual(self.json.dumpb([1], cls=Encoder), b'"\xc2\xb5"')
+
     def test_encode_truefalse(self):
         self.assertEqual(self.dumps(
                  {True: False, False: True}, sort_keys=True),
@@ -12,6 +12,17 @@ class TestSpeedups(CTest):
         self.assertIs(self.json.encoder.encode_basestring_ascii,
                       self.json.encoder.c_encode_basestring_ascii)
 
+    def test_join_utf8(self):
+        self.assertIs(self.json.encoder.join_utf8,
+                      self.json.encoder.c_join_utf8)
+        join_utf8 = self.json.encoder.c_join_utf8
+        self.assertEqual(join_utf8([]), b'')
+        self.assertEqual(join_utf8(('a', 'bc')), b'abc')
+        self.assertEqual(join_utf8(['a', '\xb5', '\u20ac']),
+                         b'a\xc2\xb5\xe2\x82\xac')
+        self.assertRaises(TypeError, join_utf8, ['a', b'b'])
+        self.assertRaises(TypeError, join_utf8, 1)
+
 
 class TestDecode(CTest):
     def test_make_scanner(self):
@@ -0,0 +1,186 @@
+from io import BytesIO, StringIO
+from collections import OrderedDict
+from test.test_json import PyTest, CTest
+
+
+DOC = ('[1, 2.5e10, -Infinity, "a\\u00e9\\"b", {"x": [1, 2, {"y": null}]}, '
+       'true, false, [], {}, 12345678901234567890, "", -0.5]')
+
+
+class TestStream:
+    def parse(self, text, depth=1, step=1, **kw):
+        decoder = self.json.JSONDecoder(**kw)
+        parser = self.json.JSONPullParser(depth, decoder=decoder)
+        events = []
+        for i in range(0, len(text), step):
+            parser.feed(text[i:i + step])
+            events.extend(parser.read_events())
+        parser.close()
+        events.extend(parser.read_events())
+        return events
+
+    def test_items(self):
+        expected = [((i,), v) for i, v in enumerate(self.loads(DOC))]
+        for step in 1, 2, 3, 7, 100:
+            with self.subTest(step=step):
+                self.assertEqual(self.parse(DOC, step=step), expected)
+
+    def test_documents(self):
+        text = '{"a": 1}\n[2, 3]\n4\n"five"\nnull'
+        expected = [((), {'a': 1}), ((), [2, 3]), ((), 4), ((), 'five'),
+                    ((), None)]
+        for step in 1, 5, 100:
+            with self.subTest(step=step):
+                self.assertEqual(self.parse(text, 0, step), expected)
+        self.assertEqual(self.parse(''), [])
+        self.assertEqual(self.parse(' \n '), [])
+
+    def test_paths(self):
+        text = '{"a": [1, {"b": 2}], "c": {"d": [3]}, "e": 4, "f": []}'
+        self.assertEqual(self.parse(text, 1), [
+            (('a',), [1, {'b': 2}]), (('c',), {'d': [3]}), (('e',), 4),
+            (('f',), []),
+        ])
+        self.assertEqual(self.parse(text, 2), [
+            (('a', 0), 1), (('a', 1), {'b': 2}), (('c', 'd'), [3]),
+            (('e',), 4),
+        ])
+        self.assertEqual(self.parse(text, 3), [
+            (('a', 0), 1), (('a', 1, 'b'), 2), (('c', 'd', 0), 3),
+            (('e',), 4),
+        ])
+
+    def test_read_events(self):
+        parser = self.json.JSONPullParser()
+        parser.feed('[1, 2, ')
+        events = parser.read_events()
+        self.assertEqual(next(events), ((0,), 1))
+        parser.feed('3, [')
+        self.assertEqual(list(events), [((1,), 2), ((2,), 3)])
+        self.assertEqual(list(parser.read_events()), [])
+        parser.feed('4]]')
+        self.assertEqual(list(parser.read_events()), [((3,), [4])])
+        parser.close()
+        self.assertEqual(list(parser.read_events()), [])
+        self.assertRaises(ValueError, parser.feed, '[]')
+
+    def test_truncated_values(self):
+        # A value is only returned once it is known to be complete
+        parser = self.json.JSONPullParser(0)
+        for text in '1', '2', '.', '5', 'e', '-', '1', ' ':
+            self.assertEqual(list(parser.read_events()), [])
+            parser.feed(text)
+        self.assertEqual(list(parser.read_events()), [((), 12.5e-1)])
+        parser.feed('-Inf')
+        parser.feed('inity')
+        self.assertEqual(list(parser.read_events()), [])
+        parser.close()
+        self.assertEqual(list(parser.read_events()),
+                         [((), float('-inf'))])
+
+    def test_bytes(self):
+        expected = [((i,), v) for i, v in enumerate(self.loads(DOC))]
+        for encoding in ('utf-8', 'utf-8-sig', 'utf-16', 'utf-16-be',
+                         'utf-16-le', 'utf-32', 'utf-32-be', 'utf-32-le'):
+            data = DOC.encode(encoding)
+            for step in 1, 3, 100:
+                with self.subTest(encoding=encoding, step=step):
+                    self.assertEqual(self.parse(data, step=step), expected)
+        self.assertEqual(self.parse(b'1', 0), [((), 1)])
+        self.assertEqual(self.parse(bytearray(b'[1]')), [((0,), 1)])
+
+    def test_hooks(self):
+        text = '[{"a": 1, "b": 1.5}, {"c": 2}]'
+        self.assertEqual(self.parse(text, object_pairs_hook=OrderedDict),
+                         [((0,), OrderedDict([('a', 1), ('b', 1.5)])),
+                          ((1,), OrderedDict([('c', 2)]))])
+        self.assertEqual(self.parse(text, 2, parse_float=str),
+                         [((0, 'a'), 1), ((0, 'b'), '1.5'), ((1, 'c'), 2)])
+
+    def test_errors(self):
+        for text in ('[1,]', '[1 2]', '{"a" 1}', '{"a": 1,}', '{1: 2}',
+                     '[', '[1', '{"a"', '{"a":', '"abc', '[tru]', '[1e]',
+                     '[1e5x]', ']', '[}', '[-]', '[1] x'):
+            for step in 1, 100:
+                with self.subTest(text=text, step=step):
+                    with self.assertRaises(self.JSONDecodeError):
+                        self.parse(text, step=step)
+        # Errors are detected before the end of the stream
+        parser = self.json.JSONPullParser()
+        with self.assertRaises(self.JSONDecodeError):
+            parser.feed('[1, x, ' + '2, ' * 10)
+
+    def test_error_position(self):
+        # The position is relative to the start of the stream
+        parser = self.json.JSONPullParser(0)
+        parser.feed('1\n[2,\n3]\n')
+        parser.feed('{"a": 4} ')
+        parser.feed('x')
+        with self.assertRaises(self.JSONDecodeError) as cm:
+            parser.close()
+        self.assertEqual(cm.exception.pos, 18)
+        self.assertEqual(cm.exception.lineno, 4)
+        self.assertEqual(cm.exception.colno, 10)
+        self.assertIn('line 4 column 10 (char 18)', str(cm.exception))
+        parser = self.json.JSONPullParser()
+        parser.feed('[1, 2, ')
+        parser.feed('[3, x]]')
+        with self.assertRaises(self.JSONDecodeError) as cm:
+            parser.close()
+        self.assertEqual(cm.exception.pos, 11)
+        self.assertEqual(cm.exception.lineno, 1)
+        self.assertEqual(cm.exception.colno, 12)
+
+    def test_bad_input(self):
+        parser = self.json.JSONPullParser()
+        self.assertRaises(TypeError, parser.feed, 1)
+        self.assertRaises(self.JSONDecodeError, parser.feed, '\ufeff[]')
+        parser.feed('[')
+        self.assertRaises(TypeError, parser.feed, b']')
+        parser = self.json.JSONPullParser()
+        parser.feed(b'[')
+        self.assertRaises(TypeError, parser.feed, ']')
+        self.assertRaises(ValueError, self.json.JSONPullParser, -1)
+
+    def test_large_value(self):
+        item = list(range(10000))
+        text = self.dumps([item, item])
+        self.assertEqual(self.parse(text, step=100), [((0,), item),
+                                                      ((1,), item)])
+        text = self.dumps({'a': ['x' * 10, '"\\]}', {'b': ']'}] * 100}) + '\n'
+        for step in 1, 7, 100, len(text) * 2 // 3:
+            with self.subTest(step=step):
+                self.assertEqual(self.parse(text, 0, step),
+                                 [((), self.loads(text))])
+
+    def test_complete_value(self):
+        # A value is decoded as soon as its end has been fed
+        message = self.dumps({'data': ['x' * 10] * 70}) + '\n'
+        parser = self.json.JSONPullParser(0)
+        parser.feed(message[:600])
+        self.assertEqual(list(parser.read_events()), [])
+        parser.feed(message[600:])
+        self.assertEqual(list(parser.read_events()),
+                         [((), self.loads(message))])
+        parser.feed('"a\\')
+        parser.feed('"b"')
+        self.assertEqual(list(parser.read_events()), [((), 'a"b')])
+
+    def test_iterload(self):
+        self.assertEqual(list(self.json.iterload(StringIO(DOC))),
+                         self.loads(DOC))
+        self.assertEqual(list(self.json.iterload(BytesIO(DOC.encode()))),
+                         self.loads(DOC))
+        self.assertEqual(list(self.json.iterload(StringIO('1\n[2]\n'), 0)),
+                         [1, [2]])
+        self.assertEqual(
+            list(self.json.iterload(StringIO('[{"a": 1.5}]'),
+                                    object_pairs_hook=OrderedDict,
+                                    parse_float=str)),
+            [OrderedDict([('a', '1.5')])])
+        with self.assertRaises(self.JSONDecodeError):
+            list(self.json.iterload(StringIO('[1, 2')))
+
+
+class TestPyStream(TestStream, PyTest): pass
+class TestCStream(TestStream, CTest): pass
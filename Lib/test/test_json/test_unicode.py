@@ -79,6 +79,26 @@ class TestUnicode:
         self.assertEqual(self.loads(b'\x007'), 7)
         self.assertEqual(self.loads(b'57'), 57)
 
+    def test_utf8_bytes_decode(self):
+        data = {"k\xb5y": ["a\xb5\u20ac\U0001d120", "\n", 1, 2.5, None, True]}
+        encoded = self.dumps(data, ensure_ascii=False).encode('utf-8')
+        self.assertEqual(self.loads(encoded), data)
+        self.assertEqual(self.loads(bytearray(encoded)), data)
+        self.assertEqual(self.json.JSONDecoder().decode(encoded), data)
+        # Encoded lone surrogates are accepted, as with 'surrogatepass'
+        self.assertEqual(self.loads(b'["\xed\xa0\x80"]'), ['\ud800'])
+        # Error positions are character positions in the decoded document
+        for doc, msg, pos in [
+                (b'["\xc3\xa9"] x', 'Extra data', 6),
+                (b'["\xc3\xa9", ]', 'Expecting value', 6),
+                (b'\xc3\xa9', 'Expecting value', 0),
+            ]:
+            with self.assertRaises(self.JSONDecodeError) as cm:
+                self.loads(doc)
+            self.assertEqual(cm.exception.msg, msg)
+            self.assertEqual(cm.exception.doc, doc.decode('utf-8'))
+            self.assertEqual(cm.exception.pos, pos)
+
     def test_object_pairs_hook_with_unicode(self):
         s = '{"xkd":1, "kcw":2, "art":3, "hxm":4, "qrt":5, "pad":6, "hoy":7}'
         p = [("xkd", 1), ("kcw", 2), ("art", 3), ("hxm", 4),
@@ -43,7 +43,9 @@ from test.support.script_helper import assert_python_ok
 from test import support
 import textwrap
 import time
+import traceback
 import unittest
+from unittest import mock
 import warnings
 import weakref
 try:
@@ -617,6 +619,22 @@ class HandlerTest(BaseTest):
             h.close()
             os.unlink(fn)
 
+    def test_file_handler_batch(self):
+        fd, fn = tempfile.mkstemp(".log", "test_logging-batch-")
+        os.close(fd)
+        os.unlink(fn)
+        h = logging.FileHandler(fn, delay=True)
+        try:
+            h.handleBatch([logging.makeLogRecord({'msg': msg})
+                           for msg in 'ab'])
+        finally:
+            h.close()
+        try:
+            with open(fn) as f:
+                self.assertEqual(f.read(), 'a\nb\n')
+        finally:
+            os.unlink(fn)
+
     @unittest.skipIf(os.name == 'nt', 'WatchedFileHandler not appropriate for Windows.')
     @unittest.skipUnless(threading, 'Threading required for this test.')
     def test_race(self):
@@ -695,6 +713,35 @@ class StreamHandlerTest(BaseTest):
         finally:
             logging.raiseExceptions = old_raise
 
+    def test_handle_batch(self):
+        class Stream(io.StringIO):
+            writes = flushes = 0
+            def write(self, data):
+                self.writes += 1
+                return super().write(data)
+            def flush(self):
+                self.flushes += 1
+        stream = Stream()
+        h = logging.StreamHandler(stream)
+        h.addFilter(lambda record: record.msg != 'b')
+        records = [logging.makeLogRecord({'msg': msg}) for msg in 'abc']
+        h.handleBatch(records)
+        self.assertEqual(stream.getvalue(), 'a\nc\n')
+        self.assertEqual(stream.writes, 1)
+        self.assertEqual(stream.flushes, 1)
+
+        # An overridden emit() is called for each record
+        emitted = []
+        class Handler(logging.StreamHandler):
+            def emit(self, record):
+                emitted.append(record.msg)
+        Handler(stream).handleBatch(records)
+        self.assertEqual(emitted, ['a', 'b', 'c'])
+
+        h = TestStreamHandler(BadStream())
+        h.handleBatch(records)
+        self.assertIs(h.error_record, records[-1])
+
 # -- The following section could be moved into a server_helper.py module
 # -- if it proves to be of wider utility than just test_logging
 
@@ -2962,6 +3009,40 @@ class ConfigDictTest(BaseTest):
             ('ERROR', '2'),
         ], pat=r"^[\w.]+ -> (\w+): (\d+)$")
 
+    @unittest.skipUnless(threading, 'Threading required for this test.')
+    def test_config_async_handler(self):
+        config = {
+            "version": 1,
+            "handlers": {
+                "async": {
+                    "class": "logging.handlers.AsyncHandler",
+                    "handlers": ["stream"],
+                    "capacity": 5,
+                    "batch_size": 2,
+                },
+                "stream": {
+                    "class": "logging.StreamHandler",
+                    "stream": "ext://sys.stdout",
+                },
+            },
+            "root": {
+                "level": "WARNING",
+                "handlers": ["async"],
+            },
+        }
+        with support.captured_stdout() as output:
+            self.apply_config(config)
+            handler = logging.root.handlers[0]
+            self.assertIsInstance(handler, logging.handlers.AsyncHandler)
+            self.assertEqual(handler.queue.maxsize, 5)
+            self.assertEqual(handler.listener.batch_size, 2)
+            [target] = handler.listener.handlers
+            self.assertIsInstance(target, logging.StreamHandler)
+            logging.warning('one')
+            logging.error('two')
+            handler.close()
+        self.assertEqual(output.getvalue(), 'one\ntwo\n')
+
     def test_out_of_order(self):
         self.apply_config(self.out_of_order)
         handler = logging.getLogger('mymodule').handlers[0]
@@ -3132,6 +3213,205 @@ class QueueHandlerTest(BaseTest):
         self.assertFalse(handler.matches(levelno=logging.ERROR, message='5'))
         self.assertTrue(handler.matches(levelno=logging.CRITICAL, message='6'))
 
+    @unittest.skipUnless(hasattr(logging.handlers, 'QueueListener'),
+                         'logging.handlers.QueueListener required for this test')
+    def test_queue_listener_batch(self):
+        batches = []
+        class Listener(logging.handlers.QueueListener):
+            def handle(self, record):
+                batches.append([record.msg])
+                super().handle(record)
+            def handle_batch(self, records):
+                batches.append([record.msg for record in records])
+                super().handle_batch(records)
+
+        handler = support.TestHandler(support.Matcher())
+        handler.setLevel(logging.ERROR)
+        writes = []
+        class Stream(io.StringIO):
+            def write(self, data):
+                writes.append(data)
+        stream_handler = logging.StreamHandler(Stream())
+        listener = Listener(self.queue, handler, stream_handler,
+                            respect_handler_level=True, batch_size=3)
+        for i in range(5):
+            self.que_logger.error(self.next_message())
+        self.que_logger.warning(self.next_message())
+        listener.start()
+        listener.stop()
+        self.assertEqual(batches, [['1', '2', '3'], ['4', '5', '6']])
+        self.assertEqual([r['msg'] for r in handler.buffer],
+                         ['1', '2', '3', '4', '5'])
+        # The stream handler writes each batch at once
+        self.assertEqual(writes, ['1\n2\n3\n', '4\n5\n6\n'])
+        handler.close()
+
+if hasattr(logging.handlers, 'AsyncHandler'):
+    class AsyncHandlerTest(BaseTest):
+
+        def setUp(self):
+            BaseTest.setUp(self)
+            self.target = support.TestHandler(support.Matcher())
+            self.async_logger = logging.getLogger('async')
+            self.async_logger.propagate = False
+
+        def tearDown(self):
+            self.target.close()
+            BaseTest.tearDown(self)
+
+        def make_handler(self, **kwargs):
+            handler = logging.handlers.AsyncHandler([self.target], **kwargs)
+            self.addCleanup(handler.close)
+            self.addCleanup(self.async_logger.removeHandler, handler)
+            self.async_logger.addHandler(handler)
+            return handler
+
+        def test_handle(self):
+            threads = []
+            self.target.emit = lambda record: threads.append(
+                threading.current_thread())
+            handler = self.make_handler()
+            for i in range(200):
+                self.async_logger.error('%d', i)
+            handler.close()
+            self.assertEqual(len(threads), 200)
+            self.assertNotIn(threading.current_thread(), threads)
+            self.assertEqual(handler.dropped, 0)
+            # Records emitted after closing are dropped
+            self.async_logger.error('late')
+            self.assertEqual(handler.dropped, 1)
+            self.assertEqual(len(threads), 200)
+
+        def test_prepare(self):
+            handler = self.make_handler(capacity=0)
+            self.assertIsInstance(handler.queue, queue.SimpleQueue)
+            arg = [1]
+            self.async_logger.error('%s', arg)
+            # The message is not affected by later changes to arguments
+            arg.append(2)
+            try:
+                1 / 0
+            except ZeroDivisionError:
+                self.async_logger.exception('failed')
+            handler.close()
+            record = self.target.buffer[0]
+            self.assertIsNone(record['args'])
+            self.assertEqual(record['message'], '[1]')
+            record = self.target.buffer[1]
+            self.assertIn('ZeroDivisionError', record['exc_text'])
+            self.assertIsNotNone(record['exc_info'])
+
+        def test_other_handlers(self):
+            # The record seen by the logger's other handlers is unchanged
+            class Formatter(logging.Formatter):
+                def formatException(self, ei):
+                    return 'custom traceback'
+            stream = io.StringIO()
+            other = logging.StreamHandler(stream)
+            other.setFormatter(Formatter('%(message)s %(args)s'))
+            handler = self.make_handler()
+            self.async_logger.addHandler(other)
+            self.addCleanup(self.async_logger.removeHandler, other)
+            try:
+                1 / 0
+            except ZeroDivisionError:
+                self.async_logger.exception('failed %s', 'here')
+            handler.close()
+            self.assertEqual(stream.getvalue(),
+                             "failed here ('here',)\ncustom traceback\n")
+            record = self.target.buffer[0]
+            self.assertEqual(record['message'], 'failed here')
+            self.assertIn('ZeroDivisionError', record['exc_text'])
+
+        def stall_target(self):
+            started = threading.Event()
+            proceed = threading.Event()
+            target_emit = self.target.emit
+            def emit(record):
+                started.set()
+                proceed.wait()
+                target_emit(record)
+            self.target.emit = emit
+            self.addCleanup(proceed.set)
+            return started, proceed
+
+        def test_concurrent_timeouts(self):
+            # Callers waiting for room on a full queue do not wait for each
+            # other: each one waits for its own timeout.
+            started, proceed = self.stall_target()
+            handler = self.make_handler(capacity=1, block=True, timeout=0.5,
+                                        batch_size=1)
+            self.async_logger.error('first')
+            started.wait()
+            self.async_logger.error('queued')
+            durations = []
+            def log():
+                start = time.monotonic()
+                self.async_logger.error('dropped')
+                durations.append(time.monotonic() - start)
+            threads = [threading.Thread(target=log) for i in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            proceed.set()
+            handler.close()
+            self.assertEqual(handler.dropped, 4)
+            self.assertLess(max(durations), 1.5)
+
+        def test_close_while_putting(self):
+            # A record waiting for room when the handler is closed is
+            # handled rather than lost after the listener has stopped.
+            started, proceed = self.stall_target()
+            handler = self.make_handler(capacity=1, block=True, batch_size=1)
+            self.async_logger.error('first')
+            started.wait()
+            self.async_logger.error('queued')
+            producer = threading.Thread(target=self.async_logger.error,
+                                        args=('waiting',))
+            producer.start()
+            while not handler._putting:
+                time.sleep(0.01)
+            closer = threading.Thread(target=handler.close)
+            closer.start()
+            closer.join(0.1)
+            self.assertTrue(closer.is_alive())
+            proceed.set()
+            producer.join()
+            closer.join()
+            self.assertEqual(handler.dropped, 0)
+            self.assertEqual([r['message'] for r in self.target.buffer],
+                             ['first', 'queued', 'waiting'])
+
+        def test_overflow(self):
+            started = threading.Event()
+            proceed = threading.Event()
+            target_emit = self.target.emit
+            def emit(record):
+                started.set()
+                proceed.wait()
+                target_emit(record)
+            self.target.emit = emit
+            handler = self.make_handler(capacity=2, batch_size=1)
+            self.async_logger.error('first')
+            started.wait()
+            for i in range(5):
+                self.async_logger.error('%d', i)
+            proceed.set()
+            handler.close()
+            self.assertEqual(handler.dropped, 3)
+            self.assertEqual([r['message'] for r in self.target.buffer],
+                             ['first', '0', '1'])
+
+        def test_block(self):
+            handler = self.make_handler(capacity=1, block=True, batch_size=2)
+            for i in range(50):
+                self.async_logger.error('%d', i)
+            handler.close()
+            self.assertEqual(handler.dropped, 0)
+            self.assertEqual([r['message'] for r in self.target.buffer],
+                             [str(i) for i in range(50)])
+
 if hasattr(logging.handlers, 'QueueListener'):
     import multiprocessing
     from unittest.mock import patch
@@ -3298,6 +3578,17 @@ class FormatterTest(unittest.TestCase):
         f = logging.Formatter('asctime', style='$')
         self.assertFalse(f.usesTime())
 
+    def test_uses_time_cached(self):
+        f = logging.Formatter('%(message)s')
+        self.assertFalse(f.usesTime())
+        # The cached result is not used once the format is replaced
+        f._style._fmt = '%(asctime)s %(message)s'
+        self.assertTrue(f.usesTime())
+        f = logging.Formatter('${message}', style='$')
+        self.assertFalse(f.usesTime())
+        f._style._fmt = '$asctime'
+        self.assertTrue(f.usesTime())
+
     def test_invalid_style(self):
         self.assertRaises(ValueError, logging.Formatter, None, None, 'x')
 
@@ -3315,6 +3606,63 @@ class FormatterTest(unittest.TestCase):
         f.format(r)
         self.assertEqual(r.asctime, '1993-04-21 08:03:00,123')
 
+    def test_time_cached(self):
+        r = self.get_record()
+        r.created = 735379380.25
+        r.msecs = 250
+        f = logging.Formatter()
+        f.converter = time.gmtime
+        with mock.patch('time.strftime', wraps=time.strftime) as strftime:
+            self.assertEqual(f.formatTime(r), '1993-04-21 08:03:00,250')
+            r.created += 0.5
+            r.msecs = 750
+            self.assertEqual(f.formatTime(r), '1993-04-21 08:03:00,750')
+            self.assertEqual(strftime.call_count, 1)
+            # A different second, format or converter is converted again
+            r.created += 0.5
+            self.assertEqual(f.formatTime(r), '1993-04-21 08:03:01,750')
+            self.assertEqual(f.formatTime(r, '%H:%M:%S'), '08:03:01')
+            f.converter = lambda secs: time.gmtime(secs + 3600)
+            self.assertEqual(f.formatTime(r, '%H:%M:%S'), '09:03:01')
+            self.assertEqual(strftime.call_count, 4)
+
+    def test_reuse(self):
+        r = self.get_record()
+        f = logging.Formatter('%(message)s', reuse=True)
+        self.assertEqual(f.format(r), 'Message with 2 placeholders')
+        r.msg = 'Changed'
+        r.args = None
+        self.assertEqual(f.format(r), 'Message with 2 placeholders')
+        r2 = self.get_record()
+        r2.msg = 'Other'
+        r2.args = None
+        self.assertEqual(f.format(r2), 'Other')
+        self.assertEqual(f.format(r), 'Changed')
+        f = logging.Formatter('%(message)s')
+        self.assertFalse(f.reuse)
+        self.assertEqual(f.format(r), 'Changed')
+        r.msg = 'Changed again'
+        self.assertEqual(f.format(r), 'Changed again')
+
+    def test_format_exception(self):
+        def f():
+            try:
+                1/0
+            except ZeroDivisionError:
+                raise ValueError('bad')
+        try:
+            f()
+        except ValueError:
+            ei = sys.exc_info()
+        f = logging.Formatter()
+        with mock.patch('linecache.checkcache') as checkcache:
+            s = f.formatException(ei)
+        # Each source file is checked once, while formatting
+        checkcache.assert_called_once_with(__file__)
+        self.assertEqual(s, ''.join(traceback.format_exception(*ei))[:-1])
+        self.assertIn('    1/0\n', s)
+        self.assertTrue(s.endswith('ValueError: bad'))
+
 class TestBufferingFormatter(logging.BufferingFormatter):
     def formatHeader(self, records):
         return '[(%d)' % len(records)
@@ -3622,6 +3970,31 @@ class LogRecordTest(BaseTest):
         r.removeHandler(h)
         h.close()
 
+    def test_filename_and_module(self):
+        pathname = os.path.join('path', 'to', 'cached.py')
+        for i in range(2):
+            r = logging.LogRecord('name', logging.INFO, pathname, 1, 'msg',
+                                  (), None)
+            self.assertEqual((r.filename, r.module), ('cached.py', 'cached'))
+        self.assertEqual(logging._pathnames[pathname], ('cached.py', 'cached'))
+        for pathname, expected in [
+                (None, (None, 'Unknown module')),
+                (pathlib.PurePath('path', 'pure.py'), ('pure.py', 'pure')),
+                ('', ('', '')),
+            ]:
+            r = logging.LogRecord('name', logging.INFO, pathname, 1, 'msg',
+                                  (), None)
+            self.assertEqual((r.filename, r.module), expected)
+        r = logging.makeLogRecord({'pathname': 'a.py', 'filename': 'b.py'})
+        self.assertEqual((r.pathname, r.filename), ('a.py', 'b.py'))
+        # The cache does not grow without bound
+        with support.swap_attr(logging, '_MAX_PATHNAMES', 3):
+            for i in range(10):
+                r = logging.LogRecord('name', logging.INFO, 'mod%d.py' % i,
+                                      1, 'msg', (), None)
+                self.assertEqual(r.module, 'mod%d' % i)
+                self.assertLessEqual(len(logging._pathnames), 3)
+
     def test_multiprocessing(self):
         r = logging.makeLogRecord({})
         self.assertEqual(r.processName, 'MainProcess')
@@ -4388,6 +4761,8 @@ def test_main():
     ]
     if hasattr(logging.handlers, 'QueueListener'):
         tests.append(QueueListenerTest)
+    if hasattr(logging.handlers, 'AsyncHandler'):
+        tests.append(AsyncHandlerTest)
     support.run_unittest(*tests)
 
 if __name__ == "__main__":
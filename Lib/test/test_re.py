@@ -1,5 +1,6 @@
 from test.support import verbose, run_unittest, gc_collect, bigmemtest, _2G, \
         cpython_only, captured_stdout
+from test import support
 import locale
 import re
 import sre_compile
@@ -1888,6 +1889,83 @@ class PatternReprTests(unittest.TestCase):
         self.assertEqual(r[-16:], ", re.IGNORECASE)")
 
 
+class CacheTests(unittest.TestCase):
+
+    def setUp(self):
+        re.purge()
+        self.addCleanup(re.set_cache_size, re._MAXCACHE)
+
+    def test_cache_info(self):
+        info = re.cache_info()
+        self.assertEqual(info.hits, 0)
+        self.assertEqual(info.misses, 0)
+        self.assertEqual(info.maxsize, re._MAXCACHE)
+        self.assertEqual(info.currsize, 0)
+        p = re.compile('cache_info')
+        self.assertIs(re.compile('cache_info'), p)
+        self.assertTrue(re.match('cache_info', 'cache_info'))
+        re.compile('cache_info', re.I)
+        re.compile(b'cache_info')
+        self.assertEqual(re.cache_info()[:2], (2, 3))
+        self.assertEqual(re.cache_info().currsize, 3)
+        re.purge()
+        self.assertEqual(re.cache_info()[:2], (0, 0))
+        self.assertEqual(re.cache_info().currsize, 0)
+
+    def test_lru_eviction(self):
+        re.set_cache_size(2)
+        self.assertEqual(re.cache_info().maxsize, 2)
+        p = re.compile('a')
+        q = re.compile('b')
+        self.assertIs(re.compile('a'), p)
+        # 'b' is the least recently used pattern and is evicted first
+        re.compile('c')
+        self.assertIs(re.compile('a'), p)
+        self.assertIsNot(re.compile('b'), q)
+        self.assertEqual(re.cache_info().currsize, 2)
+
+    def test_set_cache_size(self):
+        re.compile('set_cache_size')
+        re.set_cache_size(10)
+        self.assertEqual(re.cache_info(), (0, 0, 10, 0))
+        re.set_cache_size(0)
+        p = re.compile('set_cache_size')
+        self.assertIsNot(re.compile('set_cache_size'), p)
+        self.assertEqual(re.cache_info().currsize, 0)
+        re.set_cache_size(None)
+        self.assertIsNone(re.cache_info().maxsize)
+        self.assertRaises(ValueError, re.set_cache_size, -1)
+        self.assertRaises(TypeError, re.set_cache_size, 1.0)
+        self.assertRaises(TypeError, re.set_cache_size, '10')
+        self.assertIsNone(re.cache_info().maxsize)
+
+    def test_debug_not_cached(self):
+        with captured_stdout() as out:
+            re.compile('debug_not_cached', re.DEBUG)
+            re.compile('debug_not_cached', re.DEBUG)
+        dump = out.getvalue()
+        self.assertTrue(dump)
+        self.assertEqual(dump, dump[:len(dump) // 2] * 2)
+
+    def test_threads(self):
+        threading = support.import_module('threading')
+        re.set_cache_size(8)
+        patterns = ['t%d' % i for i in range(20)]
+        errors = []
+        def worker():
+            try:
+                for i in range(200):
+                    pat = patterns[i % len(patterns)]
+                    self.assertEqual(re.compile(pat).pattern, pat)
+            except Exception as e:
+                errors.append(e)
+        threads = [threading.Thread(target=worker) for i in range(5)]
+        with support.start_threads(threads):
+            pass
+        self.assertEqual(errors, [])
+        self.assertLessEqual(re.cache_info().currsize, 8)
+
+
 class ImplementationTest(unittest.TestCase):
     """
     Test implementation details of the re module.
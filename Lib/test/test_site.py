@@ -331,7 +331,9 @@ class ImportSideEffectTests(unittest.TestCase):
         # PYTHONPATH would cause the os module to have a relative path for
         # __file__ if abs_paths() does not get run.  sys and builtins (the
         # only other modules imported before site.py runs) do not have
-        # __file__ or __cached__ because they are built-in.
+        # __file__ or __cached__ because they are built-in.  os is imported
+        # from its source file rather than from its frozen copy, which has
+        # no __cached__.
         parent = os.path.relpath(os.path.dirname(os.__file__))
         env = os.environ.copy()
         env['PYTHONPATH'] = parent
@@ -344,7 +346,8 @@ class ImportSideEffectTests(unittest.TestCase):
         command = '\n'.join(code)
         # First, prove that with -S (no 'import site'), the paths are
         # relative.
-        proc = subprocess.Popen([sys.executable, '-S', '-c', command],
+        proc = subprocess.Popen([sys.executable, '-X', 'frozen_modules=off',
+                                 '-S', '-c', command],
                                 env=env,
                                 stdout=subprocess.PIPE)
         stdout, stderr = proc.communicate()
@@ -354,7 +357,8 @@ class ImportSideEffectTests(unittest.TestCase):
         self.assertFalse(os.path.isabs(os__file__))
         self.assertFalse(os.path.isabs(os__cached__))
         # Now, with 'import site', it works.
-        proc = subprocess.Popen([sys.executable, '-c', command],
+        proc = subprocess.Popen([sys.executable, '-X', 'frozen_modules=off',
+                                 '-c', command],
                                 env=env,
                                 stdout=subprocess.PIPE)
         stdout, stderr = proc.communicate()
@@ -179,6 +179,11 @@ class SocketServerTest(unittest.TestCase):
                         socketserver.StreamRequestHandler,
                         self.stream_examine)
 
+    def test_ThreadPoolTCPServer(self):
+        self.run_server(socketserver.ThreadPoolTCPServer,
+                        socketserver.StreamRequestHandler,
+                        self.stream_examine)
+
     @requires_forking
     def test_ForkingTCPServer(self):
         with simple_subprocess(self):
@@ -216,6 +221,11 @@ class SocketServerTest(unittest.TestCase):
                         socketserver.DatagramRequestHandler,
                         self.dgram_examine)
 
+    def test_ThreadPoolUDPServer(self):
+        self.run_server(socketserver.ThreadPoolUDPServer,
+                        socketserver.DatagramRequestHandler,
+                        self.dgram_examine)
+
     @requires_forking
     def test_ForkingUDPServer(self):
         with simple_subprocess(self):
@@ -312,6 +322,16 @@ class ErrorHandlerTest(unittest.TestCase):
         ThreadingErrorTestServer(SystemExit)
         self.check_result(handled=False)
 
+    @unittest.skipUnless(threading, 'Threading required for this test.')
+    def test_thread_pool_handled(self):
+        ThreadPoolErrorTestServer(ValueError)
+        self.check_result(handled=True)
+
+    @unittest.skipUnless(threading, 'Threading required for this test.')
+    def test_thread_pool_not_handled(self):
+        ThreadPoolErrorTestServer(SystemExit)
+        self.check_result(handled=False)
+
     @requires_forking
     def test_forking_handled(self):
         ForkingErrorTestServer(ValueError)
@@ -369,6 +389,111 @@ class ThreadingErrorTestServer(socketserver.ThreadingMixIn,
         self.done.wait()
 
 
+class ThreadPoolErrorTestServer(socketserver.ThreadPoolMixIn,
+        BaseErrorTestServer):
+    def __init__(self, *pos, **kw):
+        self.done = threading.Event()
+        super().__init__(*pos, **kw)
+
+    def shutdown_request(self, *pos, **kw):
+        super().shutdown_request(*pos, **kw)
+        self.done.set()
+
+    def wait_done(self):
+        self.done.wait()
+
+
+@unittest.skipUnless(threading, 'Threading required for this test.')
+class ThreadPoolMixInTest(unittest.TestCase):
+
+    def make_server(self, handler, **attrs):
+        class MyServer(socketserver.ThreadPoolTCPServer):
+            pass
+        for name, value in attrs.items():
+            setattr(MyServer, name, value)
+        server = MyServer((HOST, 0), handler)
+        self.addCleanup(server.server_close)
+        t = threading.Thread(target=server.serve_forever,
+                             kwargs={'poll_interval': 0.01})
+        t.daemon = True
+        t.start()
+        def stop():
+            server.shutdown()
+            t.join()
+        self.addCleanup(stop)
+        return server
+
+    @reap_threads
+    def test_workers_are_reused_and_bounded(self):
+        threads = set()
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                threads.add(threading.current_thread())
+                self.wfile.write(self.rfile.readline())
+
+        server = self.make_server(Handler, max_workers=2,
+                                  daemon_threads=False)
+        for i in range(10):
+            with socket.create_connection(server.server_address) as s:
+                s.sendall(TEST_STR)
+                self.assertEqual(receive(s, 100), TEST_STR)
+        self.assertLessEqual(len(threads), 2)
+        self.assertLessEqual(len(server._workers), 2)
+
+    @reap_threads
+    def test_requests_wait_for_a_free_worker(self):
+        started = threading.Semaphore(0)
+        release = threading.Event()
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                started.release()
+                release.wait()
+                self.wfile.write(self.rfile.readline())
+
+        server = self.make_server(Handler, max_workers=1,
+                                  daemon_threads=False)
+        self.addCleanup(release.set)
+        s1 = socket.create_connection(server.server_address)
+        self.addCleanup(s1.close)
+        s2 = socket.create_connection(server.server_address)
+        self.addCleanup(s2.close)
+        self.assertTrue(started.acquire(timeout=10))
+        # The second connection is queued behind the first one.
+        self.assertFalse(started.acquire(timeout=0.2))
+        release.set()
+        for s in (s1, s2):
+            s.sendall(TEST_STR)
+            self.assertEqual(receive(s, 100), TEST_STR)
+        self.assertTrue(started.acquire(timeout=10))
+        self.assertEqual(len(server._workers), 1)
+
+    @reap_threads
+    def test_idle_timeout(self):
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                try:
+                    while True:
+                        line = self.rfile.readline()
+                        if not line:
+                            break
+                        self.wfile.write(line)
+                except socket.timeout:
+                    pass
+
+        server = self.make_server(Handler, max_workers=1, idle_timeout=0.1,
+                                  daemon_threads=False)
+        idle = socket.create_connection(server.server_address)
+        self.addCleanup(idle.close)
+        idle.sendall(TEST_STR)
+        self.assertEqual(receive(idle, 100), TEST_STR)
+        # The idle connection is dropped and the only worker serves the
+        # next client.
+        with socket.create_connection(server.server_address) as s:
+            s.sendall(TEST_STR)
+            self.assertEqual(receive(s, 100), TEST_STR)
+        self.assertEqual(receive(idle, 100), b'')
+
+
 if HAVE_FORKING:
     class ForkingErrorTestServer(socketserver.ForkingMixIn, BaseErrorTestServer):
         def wait_done(self):
@@ -920,13 +920,13 @@ class SizeofTest(unittest.TestCase):
             return inner
         check(get_cell().__closure__[0], size('P'))
         # code
-        check(get_cell().__code__, size('6i13P'))
-        check(get_cell.__code__, size('6i13P'))
+        check(get_cell().__code__, size('6i15Pic'))
+        check(get_cell.__code__, size('6i15Pic'))
         def get_cell2(x):
             def inner():
                 return x
             return inner
-        check(get_cell2.__code__, size('6i13P') + calcsize('n'))
+        check(get_cell2.__code__, size('6i15Pic') + calcsize('n'))
         # complex
         check(complex(0,1), size('2d'))
         # method_descriptor (descriptor object)
@@ -5,6 +5,7 @@ from io import StringIO
 import linecache
 import sys
 import unittest
+from unittest import mock
 import re
 from test import support
 from test.support import TESTFN, Error, captured_output, unlink, cpython_only
@@ -860,6 +861,20 @@ class TestStack(unittest.TestCase):
         linecache.updatecache('/foo.py', globals())
         self.assertEqual(s[0].line, "import sys")
 
+    def test_extract_stack_deferred_checkcache(self):
+        # Without line lookups, no source file is stat()ed before the
+        # stack is formatted, and then only once per file.
+        c = test_code('/foo.py', 'method')
+        f = test_frame(c, None, None)
+        with mock.patch('linecache.checkcache') as checkcache:
+            s = traceback.StackSummary.extract(iter([(f, 6), (f, 7)]),
+                                               lookup_lines=False)
+            checkcache.assert_not_called()
+            s.format()
+            checkcache.assert_called_once_with('/foo.py')
+            s.format()
+            checkcache.assert_called_once_with('/foo.py')
+
     def test_from_list(self):
         s = traceback.StackSummary.from_list([('foo.py', 1, 'fred', 'line')])
         self.assertEqual(
@@ -1039,6 +1054,23 @@ class TestTracebackException(unittest.TestCase):
         exc = traceback.TracebackException(Exception, e, tb)
         self.assertEqual(exc.stack[0].locals, None)
 
+    def test_checkcache_once_per_file(self):
+        def f():
+            try:
+                1/0
+            except ZeroDivisionError as e:
+                raise ValueError from e
+        try:
+            f()
+        except ValueError as e:
+            exc = e
+        with mock.patch('linecache.checkcache') as checkcache:
+            lines = traceback.format_exception(type(exc), exc,
+                                               exc.__traceback__)
+        self.assertEqual(checkcache.call_args_list, [mock.call(__file__)])
+        self.assertIn('    1/0\n', ''.join(lines))
+        self.assertIn('    raise ValueError from e\n', ''.join(lines))
+
     def test_traceback_header(self):
         # do not print a traceback header if exc_traceback is None
         # see issue #24695
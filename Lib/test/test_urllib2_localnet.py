@@ -654,6 +654,148 @@ class TestUrlopen(unittest.TestCase):
         self.assertEqual(index + 1, len(lines))
 
 
+class KeepAliveHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Set to False to drop the connection after each response without
+    # telling the client
+    keep_alive = True
+
+    def do_GET(self):
+        self.server.client_ports.append(self.client_address[1])
+        body = self.path.encode('ascii')
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        if not self.keep_alive:
+            self.close_connection = True
+
+    do_POST = do_GET
+
+    def log_message(self, *args):
+        pass
+
+
+@unittest.skipUnless(threading, "Threading required for this test.")
+class PooledHTTPHandlerTests(unittest.TestCase):
+
+    def setUp(self):
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0),
+                                                      KeepAliveHandler)
+        self.server.client_ports = []
+        self.addCleanup(self.server.server_close)
+        thread = threading.Thread(target=self.server.serve_forever,
+                                  kwargs={'poll_interval': 0.01})
+        thread.start()
+        def stop():
+            self.server.shutdown()
+            thread.join()
+        self.addCleanup(stop)
+        self.url = "http://127.0.0.1:%d" % self.server.server_port
+
+    def build_opener(self, **kwargs):
+        handler = urllib.request.PooledHTTPHandler(**kwargs)
+        self.addCleanup(handler.close)
+        return urllib.request.build_opener(urllib.request.ProxyHandler({}),
+                                           handler)
+
+    def test_connection_is_reused(self):
+        opener = self.build_opener()
+        for path in ("/a", "/b", "/c"):
+            with opener.open(self.url + path) as f:
+                self.assertEqual(f.read(), path.encode())
+        ports = self.server.client_ports
+        self.assertEqual(len(ports), 3)
+        self.assertEqual(len(set(ports)), 1)
+
+    def test_unread_response_is_not_reused(self):
+        opener = self.build_opener()
+        opener.open(self.url + "/a").close()
+        with opener.open(self.url + "/b") as f:
+            self.assertEqual(f.read(), b"/b")
+        ports = self.server.client_ports
+        self.assertEqual(len(set(ports)), 2)
+
+    def test_idle_timeout(self):
+        opener = self.build_opener(idle_timeout=0)
+        for path in ("/a", "/b"):
+            with opener.open(self.url + path) as f:
+                self.assertEqual(f.read(), path.encode())
+        self.assertEqual(len(set(self.server.client_ports)), 2)
+
+    def test_connection_closed_by_server(self):
+        self.addCleanup(setattr, KeepAliveHandler, 'keep_alive', True)
+        KeepAliveHandler.keep_alive = False
+        opener = self.build_opener()
+        for path in ("/a", "/b", "/c"):
+            with opener.open(self.url + path) as f:
+                self.assertEqual(f.read(), path.encode())
+        self.assertEqual(len(set(self.server.client_ports)), 3)
+
+    def test_non_idempotent_request_is_not_retried(self):
+        self.addCleanup(setattr, KeepAliveHandler, 'keep_alive', True)
+        KeepAliveHandler.keep_alive = False
+        opener = self.build_opener()
+        with opener.open(self.url + "/a") as f:
+            self.assertEqual(f.read(), b"/a")
+        # The server may have handled the request before closing
+        with self.assertRaises(OSError):
+            opener.open(self.url + "/b", data=b"x")
+        with opener.open(self.url + "/c", data=b"x") as f:
+            self.assertEqual(f.read(), b"/c")
+        self.assertEqual(len(self.server.client_ports), 2)
+
+    def test_concurrent_requests(self):
+        opener = self.build_opener(maxsize=2)
+        results = []
+        def fetch(path):
+            with opener.open(self.url + path) as f:
+                results.append(f.read())
+        threads = [threading.Thread(target=fetch, args=("/%d" % i,))
+                   for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertCountEqual(results, [b"/%d" % i for i in range(8)])
+
+
+class HTTPConnectionPoolTests(unittest.TestCase):
+
+    class FakeConnection:
+        sock = object()
+        closed = False
+
+        def close(self):
+            self.closed = True
+
+    def test_maxsize(self):
+        pool = urllib.request._HTTPConnectionPool(2, None)
+        conns = [self.FakeConnection() for i in range(3)]
+        for conn in conns:
+            pool.release('key', conn, True)
+        self.assertTrue(conns[0].closed)
+        self.assertIs(pool.get('key'), conns[2])
+        self.assertIs(pool.get('key'), conns[1])
+        self.assertIsNone(pool.get('key'))
+        self.assertIsNone(pool.get('other'))
+
+    def test_not_reusable(self):
+        pool = urllib.request._HTTPConnectionPool(2, None)
+        conn = self.FakeConnection()
+        pool.release('key', conn, False)
+        self.assertTrue(conn.closed)
+        self.assertIsNone(pool.get('key'))
+
+    def test_close(self):
+        pool = urllib.request._HTTPConnectionPool(2, None)
+        conn = self.FakeConnection()
+        pool.release('key', conn, True)
+        pool.close()
+        self.assertTrue(conn.closed)
+        self.assertIsNone(pool.get('key'))
+
+
 threads_key = None
 
 def setUpModule():
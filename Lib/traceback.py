@@ -52,7 +52,8 @@ def print_tb(tb, limit=None, file=None):
 
 def format_tb(tb, limit=None):
     """A shorthand for 'format_list(extract_tb(tb, limit))'."""
-    return extract_tb(tb, limit=limit).format()
+    return StackSummary.extract(walk_tb(tb), limit=limit,
+                                lookup_lines=False).format()
 
 def extract_tb(tb, limit=None):
     """Return list of up to limit pre-processed entries from traceback.
@@ -97,7 +98,8 @@ def print_exception(etype, value, tb, limit=None, file=None, chain=True):
     if file is None:
         file = sys.stderr
     for line in TracebackException(
-            type(value), value, tb, limit=limit).format(chain=chain):
+            type(value), value, tb, limit=limit,
+            lookup_lines=False).format(chain=chain):
         print(line, file=file, end="")
 
 
@@ -114,7 +116,8 @@ def format_exception(etype, value, tb, limit=None, chain=True):
     # passes in bogus values as a result. For compatibility with such code we
     # ignore it here (rather than in the new TracebackException API).
     return list(TracebackException(
-        type(value), value, tb, limit=limit).format(chain=chain))
+        type(value), value, tb, limit=limit,
+        lookup_lines=False).format(chain=chain))
 
 
 def format_exception_only(etype, value):
@@ -307,9 +310,29 @@ def walk_tb(tb):
         tb = tb.tb_next
 
 
+def _checkcache(stacks):
+    """Validate the linecache entries of the files of several stacks.
+
+    Each file is only stat()ed once, however many frames and stacks refer
+    to it.
+    """
+    checked = set()
+    for stack in stacks:
+        filenames = stack._unchecked
+        if filenames:
+            for filename in filenames - checked:
+                linecache.checkcache(filename)
+            checked |= filenames
+            stack._unchecked = frozenset()
+
+
 class StackSummary(list):
     """A stack of frames."""
 
+    # Files whose linecache entries have to be validated with
+    # linecache.checkcache() before the lines of this stack are looked up.
+    _unchecked = frozenset()
+
     @classmethod
     def extract(klass, frame_gen, *, limit=None, lookup_lines=True,
             capture_locals=False):
@@ -320,7 +343,9 @@ class StackSummary(list):
         :param limit: None to include all frames or the number of frames to
             include.
         :param lookup_lines: If True, lookup lines for each frame immediately,
-            otherwise lookup is deferred until the frame is rendered.
+            otherwise lookup is deferred until the frame is rendered.  The
+            linecache entries are then also only validated when the stack
+            is formatted, so that no source file is stat()ed here.
         :param capture_locals: If True, the local variables from each frame will
             be captured as object representations into the FrameSummary.
         """
@@ -350,10 +375,10 @@ class StackSummary(list):
                 f_locals = None
             result.append(FrameSummary(
                 filename, lineno, name, lookup_line=False, locals=f_locals))
-        for filename in fnames:
-            linecache.checkcache(filename)
+        result._unchecked = frozenset(fnames)
         # If immediate lookup was desired, trigger lookups now.
         if lookup_lines:
+            _checkcache([result])
             for f in result:
                 f.line
         return result
@@ -390,6 +415,7 @@ class StackSummary(list):
         repetitions are shown, followed by a summary line stating the exact
         number of further repetitions.
         """
+        _checkcache([self])
         result = []
         last_file = None
         last_line = None
@@ -493,7 +519,7 @@ class TracebackException:
             exc_value.__suppress_context__ if exc_value else False
         # TODO: locals.
         self.stack = StackSummary.extract(
-            walk_tb(exc_traceback), limit=limit, lookup_lines=lookup_lines,
+            walk_tb(exc_traceback), limit=limit, lookup_lines=False,
             capture_locals=capture_locals)
         self.exc_type = exc_type
         # Capture now to permit freeing resources: only complication is in the
@@ -514,14 +540,21 @@ class TracebackException:
         """Create a TracebackException from an exception."""
         return cls(type(exc), exc, exc.__traceback__, *args, **kwargs)
 
-    def _load_lines(self):
-        """Private API. force all lines in the stack to be loaded."""
-        for frame in self.stack:
-            frame.line
+    def _iter_chain(self):
+        """Yield self and all the chained TracebackExceptions."""
+        yield self
         if self.__context__:
-            self.__context__._load_lines()
+            yield from self.__context__._iter_chain()
         if self.__cause__:
-            self.__cause__._load_lines()
+            yield from self.__cause__._iter_chain()
+
+    def _load_lines(self):
+        """Private API. force all lines in the stack to be loaded."""
+        chain = list(self._iter_chain())
+        _checkcache([exc.stack for exc in chain])
+        for exc in chain:
+            for frame in exc.stack:
+                frame.line
 
     def __eq__(self, other):
         return self.__dict__ == other.__dict__
@@ -586,6 +619,8 @@ class TracebackException:
         The message indicating which exception occurred is always the last
         string in the output.
         """
+        # Validate the linecache once per file for the whole chain
+        _checkcache([exc.stack for exc in self._iter_chain()])
         if chain:
             if self.__cause__ is not None:
                 yield from self.__cause__.format(chain=chain)
@@ -1001,7 +1001,7 @@ class GenericMeta(TypingMeta, abc.ABCMeta):
         ):
             self.__subclasshook__ = _make_subclasshook(self)
         if isinstance(extra, abc.ABCMeta):
-            self._abc_registry = extra._abc_registry
+            self._abc_registry_share(extra)
 
         if origin and hasattr(origin, '__qualname__'):  # Fix for Python 3.2.
             self.__qualname__ = origin.__qualname__
@@ -84,6 +84,7 @@ f = urllib.request.urlopen('http://www.python.org/')
 import base64
 import bisect
 import email
+import functools
 import hashlib
 import http.client
 import io
@@ -97,6 +98,10 @@ import time
 import tempfile
 import contextlib
 import warnings
+try:
+    import threading
+except ImportError:
+    import dummy_threading as threading
 
 
 from urllib.error import URLError, HTTPError, ContentTooShortError
@@ -123,7 +128,7 @@ __all__ = [
     'HTTPPasswordMgrWithPriorAuth', 'AbstractBasicAuthHandler',
     'HTTPBasicAuthHandler', 'ProxyBasicAuthHandler', 'AbstractDigestAuthHandler',
     'HTTPDigestAuthHandler', 'ProxyDigestAuthHandler', 'HTTPHandler',
-    'FileHandler', 'FTPHandler', 'CacheFTPHandler', 'DataHandler',
+    'PooledHTTPHandler', 'FileHandler', 'FTPHandler', 'CacheFTPHandler', 'DataHandler',
     'UnknownHandler', 'HTTPErrorProcessor',
     # Functions
     'urlopen', 'install_opener', 'build_opener',
@@ -1285,30 +1290,15 @@ class AbstractHTTPHandler(BaseHandler):
         h = http_class(host, timeout=req.timeout, **http_conn_args)
         h.set_debuglevel(self._debuglevel)
 
-        headers = dict(req.unredirected_hdrs)
-        headers.update(dict((k, v) for k, v in req.headers.items()
-                            if k not in headers))
-
-        # TODO(jhylton): Should this be redesigned to handle
-        # persistent connections?
-
         # We want to make an HTTP/1.1 request, but the addinfourl
         # class isn't prepared to deal with a persistent connection.
         # It will try to read all remaining data from the socket,
         # which will block while the server waits for the next request.
         # So make sure the connection gets closed after the (only)
-        # request.
-        headers["Connection"] = "close"
-        headers = dict((name.title(), val) for name, val in headers.items())
-
+        # request.  Persistent connections are handled by
+        # _do_open_pooled().
+        headers, tunnel_headers = self._get_request_headers(req, "close")
         if req._tunnel_host:
-            tunnel_headers = {}
-            proxy_auth_hdr = "Proxy-Authorization"
-            if proxy_auth_hdr in headers:
-                tunnel_headers[proxy_auth_hdr] = headers[proxy_auth_hdr]
-                # Proxy-Authorization should not be sent to origin
-                # server.
-                del headers[proxy_auth_hdr]
             h.set_tunnel(req._tunnel_host, headers=tunnel_headers)
 
         try:
@@ -1338,6 +1328,184 @@ class AbstractHTTPHandler(BaseHandler):
         r.msg = r.reason
         return r
 
+    def _get_request_headers(self, req, connection):
+        """Return the headers to send for req and the tunnel headers."""
+        headers = dict(req.unredirected_hdrs)
+        headers.update(dict((k, v) for k, v in req.headers.items()
+                            if k not in headers))
+        headers["Connection"] = connection
+        headers = dict((name.title(), val) for name, val in headers.items())
+
+        tunnel_headers = {}
+        if req._tunnel_host:
+            proxy_auth_hdr = "Proxy-Authorization"
+            if proxy_auth_hdr in headers:
+                tunnel_headers[proxy_auth_hdr] = headers[proxy_auth_hdr]
+                # Proxy-Authorization should not be sent to origin
+                # server.
+                del headers[proxy_auth_hdr]
+        return headers, tunnel_headers
+
+    def _do_open_pooled(self, pool, http_class, req, **http_conn_args):
+        """Like do_open(), but keep the connection alive and reuse it.
+
+        Connections are taken from and returned to pool, an
+        _HTTPConnectionPool.  A connection is given back to the pool once
+        the body of the response has been read entirely.
+        """
+        host = req.host
+        if not host:
+            raise URLError('no host given')
+
+        headers, tunnel_headers = self._get_request_headers(req, "keep-alive")
+        key = (http_class, host, req._tunnel_host)
+        # A connection taken from the pool may have been closed by the
+        # server in the meantime: in that case the request is sent again on
+        # a new connection, unless it is not idempotent (the server may
+        # have acted on it before closing) or its body cannot be read a
+        # second time.
+        retry = (req.get_method() in _IDEMPOTENT_METHODS and
+                 (req.data is None or
+                  isinstance(req.data, (bytes, bytearray, memoryview))))
+        while True:
+            h = pool.get(key)
+            reused = h is not None
+            if reused:
+                h.timeout = req.timeout
+                if req.timeout is socket._GLOBAL_DEFAULT_TIMEOUT:
+                    h.sock.settimeout(socket.getdefaulttimeout())
+                else:
+                    h.sock.settimeout(req.timeout)
+            else:
+                # will parse host:port
+                h = http_class(host, timeout=req.timeout, **http_conn_args)
+                h.response_class = _PooledHTTPResponse
+                if req._tunnel_host:
+                    h.set_tunnel(req._tunnel_host, headers=tunnel_headers)
+            h.set_debuglevel(self._debuglevel)
+
+            try:
+                try:
+                    h.request(req.get_method(), req.selector, req.data,
+                              headers,
+                              encode_chunked=req.has_header('Transfer-encoding'))
+                except OSError as err: # timeout error
+                    if reused and retry and isinstance(err, ConnectionError):
+                        h.close()
+                        continue
+                    raise URLError(err)
+                try:
+                    r = h.getresponse()
+                except ConnectionError:
+                    if reused and retry:
+                        h.close()
+                        continue
+                    raise
+            except:
+                h.close()
+                raise
+            break
+
+        if not r.will_close:
+            r._release = functools.partial(pool.release, key, h)
+
+        r.url = req.get_full_url()
+        r.msg = r.reason
+        return r
+
+
+# Methods of the requests which may be sent twice (RFC 7231, section 4.2.2)
+_IDEMPOTENT_METHODS = frozenset(
+    {"GET", "HEAD", "PUT", "DELETE", "OPTIONS", "TRACE"})
+
+class _PooledHTTPResponse(http.client.HTTPResponse):
+    # HTTPResponse which gives its connection back to the pool once the
+    # body has been read entirely, or closes it if the response is closed
+    # earlier.
+
+    _release = None
+    _trailer_read = False
+
+    def _read_and_discard_trailer(self):
+        super()._read_and_discard_trailer()
+        self._trailer_read = True
+
+    def _body_consumed(self):
+        if self._method == "HEAD":
+            return True
+        if self.chunked:
+            return self._trailer_read
+        return self.length == 0
+
+    def _close_conn(self):
+        super()._close_conn()
+        release = self._release
+        if release is not None:
+            self._release = None
+            release(self._body_consumed())
+
+
+class _HTTPConnectionPool:
+    """Thread-safe store of idle persistent HTTP connections.
+
+    At most maxsize idle connections are kept for each key; connections
+    idle for more than idle_timeout seconds are closed instead of being
+    reused.
+    """
+
+    def __init__(self, maxsize, idle_timeout):
+        self.maxsize = maxsize
+        self.idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        self._idle = {}
+
+    def get(self, key):
+        """Return an idle connection for key, or None."""
+        now = time.monotonic()
+        conn = None
+        expired = []
+        with self._lock:
+            conns = self._idle.get(key)
+            while conns:
+                conn, released = conns.pop()
+                if (self.idle_timeout is not None and
+                        now - released > self.idle_timeout):
+                    # The other connections were released earlier
+                    expired.append(conn)
+                    expired.extend(c for c, t in conns)
+                    conns.clear()
+                    conn = None
+                else:
+                    break
+            if conns is not None and not conns:
+                del self._idle[key]
+        for c in expired:
+            c.close()
+        return conn
+
+    def release(self, key, conn, reusable):
+        """Give conn back to the pool, or close it if not reusable."""
+        if not reusable or conn.sock is None:
+            conn.close()
+            return
+        evicted = None
+        with self._lock:
+            conns = self._idle.setdefault(key, [])
+            if len(conns) >= self.maxsize:
+                evicted, _ = conns.pop(0)
+            conns.append((conn, time.monotonic()))
+        if evicted is not None:
+            evicted.close()
+
+    def close(self):
+        """Close all the idle connections."""
+        with self._lock:
+            idle = self._idle
+            self._idle = {}
+        for conns in idle.values():
+            for conn, released in conns:
+                conn.close()
+
 
 class HTTPHandler(AbstractHTTPHandler):
 
@@ -1346,6 +1514,20 @@ class HTTPHandler(AbstractHTTPHandler):
 
     http_request = AbstractHTTPHandler.do_request_
 
+class PooledHTTPHandler(HTTPHandler):
+    """HTTPHandler reusing persistent connections across requests."""
+
+    def __init__(self, debuglevel=0, maxsize=10, idle_timeout=60.0):
+        HTTPHandler.__init__(self, debuglevel)
+        self._pool = _HTTPConnectionPool(maxsize, idle_timeout)
+
+    def http_open(self, req):
+        return self._do_open_pooled(self._pool, http.client.HTTPConnection,
+                                    req)
+
+    def close(self):
+        self._pool.close()
+
 if hasattr(http.client, 'HTTPSConnection'):
 
     class HTTPSHandler(AbstractHTTPHandler):
@@ -1361,7 +1543,24 @@ if hasattr(http.client, 'HTTPSConnection'):
 
         https_request = AbstractHTTPHandler.do_request_
 
-    __all__.append('HTTPSHandler')
+    class PooledHTTPSHandler(HTTPSHandler):
+        """HTTPSHandler reusing persistent connections across requests."""
+
+        def __init__(self, debuglevel=0, context=None, check_hostname=None,
+                     maxsize=10, idle_timeout=60.0):
+            HTTPSHandler.__init__(self, debuglevel, context, check_hostname)
+            self._pool = _HTTPConnectionPool(maxsize, idle_timeout)
+
+        def https_open(self, req):
+            return self._do_open_pooled(self._pool,
+                                        http.client.HTTPSConnection, req,
+                                        context=self._context,
+                                        check_hostname=self._check_hostname)
+
+        def close(self):
+            self._pool.close()
+
+    __all__.extend(['HTTPSHandler', 'PooledHTTPSHandler'])
 
 class HTTPCookieProcessor(BaseHandler):
     def __init__(self, cookiejar=None):
@@ -335,7 +335,24 @@ raise_errmsg(const char *msg, PyObject *s, Py_ssize_t end)
         if (JSONDecodeError == NULL)
             return;
     }
+    if (PyBytes_Check(s)) {
+        /* Report the error in the decoded document */
+        PyObject *head;
+        const char *data = PyBytes_AS_STRING(s);
+        head = PyUnicode_DecodeUTF8(data, end, "replace");
+        if (head == NULL)
+            return;
+        end = PyUnicode_GET_LENGTH(head);
+        Py_DECREF(head);
+        s = PyUnicode_DecodeUTF8(data, PyBytes_GET_SIZE(s), "replace");
+        if (s == NULL)
+            return;
+    }
+    else {
+        Py_INCREF(s);
+    }
     exc = PyObject_CallFunction(JSONDecodeError, "zOn", msg, s, end);
+    Py_DECREF(s);
     if (exc) {
         PyErr_SetObject(JSONDecodeError, exc);
         Py_DECREF(exc);
@@ -352,6 +369,41 @@ raise_stop_iteration(Py_ssize_t idx)
     }
 }
 
+/* The scanner reads either a str, or a bytes object holding UTF-8 text.
+   All the characters of the JSON syntax are ASCII, and the bytes of
+   multibyte UTF-8 sequences are never ASCII, so bytes can be scanned as
+   one-byte characters: only the contents of strings need to be decoded.
+   The indices into bytes are byte offsets. */
+
+static int
+_get_input(PyObject *pystr, void **data, int *kind, Py_ssize_t *length)
+{
+    if (PyBytes_Check(pystr)) {
+        *data = PyBytes_AS_STRING(pystr);
+        *kind = PyUnicode_1BYTE_KIND;
+        *length = PyBytes_GET_SIZE(pystr);
+        return 0;
+    }
+    if (PyUnicode_READY(pystr) == -1)
+        return -1;
+    *data = PyUnicode_DATA(pystr);
+    *kind = PyUnicode_KIND(pystr);
+    *length = PyUnicode_GET_LENGTH(pystr);
+    return 0;
+}
+
+static PyObject *
+_input_substring(PyObject *pystr, int kind, const void *data,
+                 Py_ssize_t start, Py_ssize_t end)
+{
+    /* Return the characters from start to end of the input as a str */
+    if (PyBytes_Check(pystr))
+        return PyUnicode_DecodeUTF8((const char *)data + start, end - start,
+                                    "surrogatepass");
+    return PyUnicode_FromKindAndData(kind, (const char *)data + kind * start,
+                                     end - start);
+}
+
 static PyObject *
 _build_rval_index_tuple(PyObject *rval, Py_ssize_t idx) {
     /* return (rval, idx) tuple, stealing reference to rval */
@@ -409,18 +461,14 @@ scanstring_unicode(PyObject *pystr, Py_ssize_t end, int strict, Py_ssize_t *next
     Py_ssize_t len;
     Py_ssize_t begin = end - 1;
     Py_ssize_t next /* = begin */;
-    const void *buf;
+    void *buf;
     int kind;
     PyObject *chunks = NULL;
     PyObject *chunk = NULL;
 
-    if (PyUnicode_READY(pystr) == -1)
+    if (_get_input(pystr, &buf, &kind, &len) < 0)
         return 0;
 
-    len = PyUnicode_GET_LENGTH(pystr);
-    buf = PyUnicode_DATA(pystr);
-    kind = PyUnicode_KIND(pystr);
-
     if (end < 0 || len < end) {
         PyErr_SetString(PyExc_ValueError, "end is out of bounds");
         goto bail;
@@ -445,10 +493,7 @@ scanstring_unicode(PyObject *pystr, Py_ssize_t end, int strict, Py_ssize_t *next
         /* Pick up this chunk if it's not zero length */
         if (next != end) {
             APPEND_OLD_CHUNK
-                chunk = PyUnicode_FromKindAndData(
-                    kind,
-                    (char*)buf + kind * end,
-                    next - end);
+                chunk = _input_substring(pystr, kind, buf, end, next);
             if (chunk == NULL) {
                 goto bail;
             }
@@ -656,6 +701,70 @@ py_encode_basestring(PyObject* self UNUSED, PyObject *pystr)
     return rval;
 }
 
+PyDoc_STRVAR(pydoc_join_utf8,
+    "join_utf8(chunks) -> bytes\n"
+    "\n"
+    "Return the concatenation of a sequence of strings, encoded to UTF-8"
+);
+
+static PyObject *
+py_join_utf8(PyObject* self UNUSED, PyObject *chunks)
+{
+    /* Equivalent to ''.join(chunks).encode('utf-8').  When all chunks are
+       ASCII (always the case with ensure_ascii), they are copied straight
+       into the result without creating the joined string. */
+    PyObject *seq;
+    PyObject *rval = NULL;
+    Py_ssize_t i, n, size = 0;
+    char *p;
+
+    seq = PySequence_Fast(chunks, "can only join an iterable");
+    if (seq == NULL)
+        return NULL;
+    n = PySequence_Fast_GET_SIZE(seq);
+    for (i = 0; i < n; i++) {
+        PyObject *item = PySequence_Fast_GET_ITEM(seq, i);
+        if (!PyUnicode_Check(item)) {
+            PyErr_Format(PyExc_TypeError,
+                         "sequence item %zd: expected str instance,"
+                         " %.80s found",
+                         i, Py_TYPE(item)->tp_name);
+            goto bail;
+        }
+        if (PyUnicode_READY(item) == -1)
+            goto bail;
+        if (!PyUnicode_IS_ASCII(item)) {
+            PyObject *joined, *empty = PyUnicode_New(0, 0);
+            if (empty == NULL)
+                goto bail;
+            joined = PyUnicode_Join(empty, seq);
+            Py_DECREF(empty);
+            if (joined != NULL) {
+                rval = PyUnicode_AsUTF8String(joined);
+                Py_DECREF(joined);
+            }
+            goto bail;
+        }
+        if (PyUnicode_GET_LENGTH(item) > PY_SSIZE_T_MAX - size) {
+            PyErr_NoMemory();
+            goto bail;
+        }
+        size += PyUnicode_GET_LENGTH(item);
+    }
+    rval = PyBytes_FromStringAndSize(NULL, size);
+    if (rval == NULL)
+        goto bail;
+    p = PyBytes_AS_STRING(rval);
+    for (i = 0; i < n; i++) {
+        PyObject *item = PySequence_Fast_GET_ITEM(seq, i);
+        memcpy(p, PyUnicode_1BYTE_DATA(item), PyUnicode_GET_LENGTH(item));
+        p += PyUnicode_GET_LENGTH(item);
+    }
+bail:
+    Py_DECREF(seq);
+    return rval;
+}
+
 static void
 scanner_dealloc(PyObject *self)
 {
@@ -717,12 +826,9 @@ _parse_object_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t idx, Py_ss
     if (strict < 0)
         return NULL;
 
-    if (PyUnicode_READY(pystr) == -1)
+    if (_get_input(pystr, &str, &kind, &end_idx) < 0)
         return NULL;
-
-    str = PyUnicode_DATA(pystr);
-    kind = PyUnicode_KIND(pystr);
-    end_idx = PyUnicode_GET_LENGTH(pystr) - 1;
+    end_idx--;
 
     if (has_pairs_hook)
         rval = PyList_New(0);
@@ -848,17 +954,14 @@ _parse_array_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t idx, Py_ssi
     PyObject *rval;
     Py_ssize_t next_idx;
 
-    if (PyUnicode_READY(pystr) == -1)
+    if (_get_input(pystr, &str, &kind, &end_idx) < 0)
         return NULL;
+    end_idx--;
 
     rval = PyList_New(0);
     if (rval == NULL)
         return NULL;
 
-    str = PyUnicode_DATA(pystr);
-    kind = PyUnicode_KIND(pystr);
-    end_idx = PyUnicode_GET_LENGTH(pystr) - 1;
-
     /* skip whitespace after [ */
     while (idx <= end_idx && IS_WHITESPACE(PyUnicode_READ(kind, str, idx))) idx++;
 
@@ -953,12 +1056,9 @@ _match_number_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t start, Py_
     PyObject *numstr = NULL;
     PyObject *custom_func;
 
-    if (PyUnicode_READY(pystr) == -1)
+    if (_get_input(pystr, &str, &kind, &end_idx) < 0)
         return NULL;
-
-    str = PyUnicode_DATA(pystr);
-    kind = PyUnicode_KIND(pystr);
-    end_idx = PyUnicode_GET_LENGTH(pystr) - 1;
+    end_idx--;
 
     /* read a sign if it's there, make sure it's not the end of the string */
     if (PyUnicode_READ(kind, str, idx) == '-') {
@@ -1053,7 +1153,7 @@ _match_number_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t start, Py_
 static PyObject *
 scan_once_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t idx, Py_ssize_t *next_idx_ptr)
 {
-    /* Read one JSON term (of any kind) from PyUnicode pystr.
+    /* Read one JSON term (of any kind) from PyUnicode (or UTF-8 PyBytes) pystr.
     idx is the index of the first character of the term
     *next_idx_ptr is a return-by-reference index to the first character after
         the number.
@@ -1066,13 +1166,9 @@ scan_once_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t idx, Py_ssize_
     Py_ssize_t length;
     int strict;
 
-    if (PyUnicode_READY(pystr) == -1)
+    if (_get_input(pystr, &str, &kind, &length) < 0)
         return NULL;
 
-    str = PyUnicode_DATA(pystr);
-    kind = PyUnicode_KIND(pystr);
-    length = PyUnicode_GET_LENGTH(pystr);
-
     if (idx < 0) {
         PyErr_SetString(PyExc_ValueError, "idx cannot be negative");
         return NULL;
@@ -1181,12 +1277,12 @@ scanner_call(PyObject *self, PyObject *args, PyObject *kwds)
     if (!PyArg_ParseTupleAndKeywords(args, kwds, "On:scan_once", kwlist, &pystr, &idx))
         return NULL;
 
-    if (PyUnicode_Check(pystr)) {
+    if (PyUnicode_Check(pystr) || PyBytes_Check(pystr)) {
         rval = scan_once_unicode(s, pystr, idx, &next_idx);
     }
     else {
         PyErr_Format(PyExc_TypeError,
-                 "first argument must be a string, not %.80s",
+                 "first argument must be a string or bytes, not %.80s",
                  Py_TYPE(pystr)->tp_name);
         return NULL;
     }
@@ -1930,6 +2026,10 @@ static PyMethodDef speedups_methods[] = {
         (PyCFunction)py_scanstring,
         METH_VARARGS,
         pydoc_scanstring},
+    {"join_utf8",
+        (PyCFunction)py_join_utf8,
+        METH_O,
+        pydoc_join_utf8},
     {NULL, NULL, 0, NULL}
 };
 
@@ -0,0 +1,121 @@
+/*
+ * Extension module providing POSIX named shared memory primitives
+ * for the multiprocessing.shared_memory module.
+ *
+ * posixshmem.c
+ *
+ * Licensed to PSF under a Contributor Agreement.
+ */
+
+#define PY_SSIZE_T_CLEAN
+
+#include <Python.h>
+
+#include <errno.h>
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+
+
+PyDoc_STRVAR(shm_open_doc,
+"shm_open(path, flags, mode=0o777)\n\
+\n\
+Open a shared memory object.  Returns a file descriptor (integer).");
+
+static PyObject *
+posixshmem_shm_open(PyObject *self, PyObject *args, PyObject *kwds)
+{
+    static char *kwlist[] = {"path", "flags", "mode", NULL};
+    PyObject *path;
+    int flags, mode = 0777;
+    int fd, async_err = 0;
+    const char *name;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "Ui|i:shm_open", kwlist,
+                                     &path, &flags, &mode))
+        return NULL;
+
+    name = PyUnicode_AsUTF8(path);
+    if (name == NULL)
+        return NULL;
+
+    do {
+        Py_BEGIN_ALLOW_THREADS
+        fd = shm_open(name, flags, mode);
+        Py_END_ALLOW_THREADS
+    } while (fd < 0 && errno == EINTR && !(async_err = PyErr_CheckSignals()));
+
+    if (fd < 0) {
+        if (!async_err)
+            PyErr_SetFromErrnoWithFilenameObject(PyExc_OSError, path);
+        return NULL;
+    }
+
+    return PyLong_FromLong((long)fd);
+}
+
+
+PyDoc_STRVAR(shm_unlink_doc,
+"shm_unlink(path)\n\
+\n\
+Remove a shared memory object (similar to unlink()).\n\
+\n\
+Remove a shared memory object name, and, once all processes have unmapped\n\
+the object, de-allocates and destroys the contents of the associated memory\n\
+region.");
+
+static PyObject *
+posixshmem_shm_unlink(PyObject *self, PyObject *args, PyObject *kwds)
+{
+    static char *kwlist[] = {"path", NULL};
+    PyObject *path;
+    int rv, async_err = 0;
+    const char *name;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "U:shm_unlink", kwlist,
+                                     &path))
+        return NULL;
+
+    name = PyUnicode_AsUTF8(path);
+    if (name == NULL)
+        return NULL;
+
+    do {
+        Py_BEGIN_ALLOW_THREADS
+        rv = shm_unlink(name);
+        Py_END_ALLOW_THREADS
+    } while (rv < 0 && errno == EINTR && !(async_err = PyErr_CheckSignals()));
+
+    if (rv < 0) {
+        if (!async_err)
+            PyErr_SetFromErrnoWithFilenameObject(PyExc_OSError, path);
+        return NULL;
+    }
+
+    Py_RETURN_NONE;
+}
+
+
+static PyMethodDef module_methods[ ] = {
+    {"shm_open", (PyCFunction)posixshmem_shm_open,
+     METH_VARARGS | METH_KEYWORDS, shm_open_doc},
+    {"shm_unlink", (PyCFunction)posixshmem_shm_unlink,
+     METH_VARARGS | METH_KEYWORDS, shm_unlink_doc},
+    {NULL} /* Sentinel */
+};
+
+
+static struct PyModuleDef this_module = {
+    PyModuleDef_HEAD_INIT,
+    "_posixshmem",
+    "POSIX shared memory module",
+    -1,
+    module_methods,
+};
+
+
+PyMODINIT_FUNC
+PyInit__posixshmem(void)
+{
+    return PyModule_Create(&this_module);
+}
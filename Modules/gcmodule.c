@@ -56,6 +56,11 @@ static struct gc_generation generations[NUM_GENERATIONS] = {
 
 PyGC_Head *_PyGC_generation0 = GEN_HEAD(0);
 
+/* Objects moved here by gc.freeze() are never examined by a collection. */
+static struct gc_generation permanent_generation = {
+    {{&permanent_generation.head, &permanent_generation.head, 0}}, 0, 0
+};
+
 static int enabled = 1; /* automatic collection enabled? */
 
 /* true if we are currently running the collector */
@@ -1486,6 +1491,54 @@ gc_is_tracked(PyObject *self, PyObject *obj)
 }
 
 
+PyDoc_STRVAR(gc_freeze__doc__,
+"freeze() -> None\n"
+"\n"
+"Freeze all current tracked objects and ignore them for future collections.\n"
+"\n"
+"This can be used before a POSIX fork() call to make the gc copy-on-write\n"
+"friendly.\n"
+"Note: collection before a POSIX fork() call may free pages for future\n"
+"allocation which can cause copy-on-write.\n");
+
+static PyObject *
+gc_freeze(PyObject *self, PyObject *noargs)
+{
+    int i;
+
+    for (i = 0; i < NUM_GENERATIONS; i++) {
+        gc_list_merge(GEN_HEAD(i), &permanent_generation.head);
+        generations[i].count = 0;
+    }
+    Py_RETURN_NONE;
+}
+
+PyDoc_STRVAR(gc_unfreeze__doc__,
+"unfreeze() -> None\n"
+"\n"
+"Unfreeze all objects in the permanent generation.\n"
+"\n"
+"Put all objects in the permanent generation back into oldest generation.\n");
+
+static PyObject *
+gc_unfreeze(PyObject *self, PyObject *noargs)
+{
+    gc_list_merge(&permanent_generation.head, GEN_HEAD(NUM_GENERATIONS-1));
+    Py_RETURN_NONE;
+}
+
+PyDoc_STRVAR(gc_get_freeze_count__doc__,
+"get_freeze_count() -> int\n"
+"\n"
+"Return the number of objects in the permanent generation.\n");
+
+static PyObject *
+gc_get_freeze_count(PyObject *self, PyObject *noargs)
+{
+    return PyLong_FromSsize_t(gc_list_size(&permanent_generation.head));
+}
+
+
 PyDoc_STRVAR(gc__doc__,
 "This module provides access to the garbage collector for reference cycles.\n"
 "\n"
@@ -1502,7 +1555,10 @@ PyDoc_STRVAR(gc__doc__,
 "get_objects() -- Return a list of all objects tracked by the collector.\n"
 "is_tracked() -- Returns true if a given object is tracked.\n"
 "get_referrers() -- Return the list of objects that refer to an object.\n"
-"get_referents() -- Return the list of objects that an object refers to.\n");
+"get_referents() -- Return the list of objects that an object refers to.\n"
+"freeze() -- Freeze all tracked objects and ignore them for future collections.\n"
+"unfreeze() -- Unfreeze all objects in the permanent generation.\n"
+"get_freeze_count() -- Return the number of objects in the permanent generation.\n");
 
 static PyMethodDef GcMethods[] = {
     {"enable",             gc_enable,     METH_NOARGS,  gc_enable__doc__},
@@ -1522,6 +1578,10 @@ static PyMethodDef GcMethods[] = {
         gc_get_referrers__doc__},
     {"get_referents",  gc_get_referents, METH_VARARGS,
         gc_get_referents__doc__},
+    {"freeze",         gc_freeze,     METH_NOARGS,  gc_freeze__doc__},
+    {"unfreeze",       gc_unfreeze,   METH_NOARGS,  gc_unfreeze__doc__},
+    {"get_freeze_count", gc_get_freeze_count, METH_NOARGS,
+        gc_get_freeze_count__doc__},
     {NULL,      NULL}           /* Sentinel */
 };
 
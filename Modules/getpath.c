@@ -112,6 +112,7 @@
 static wchar_t prefix[MAXPATHLEN+1];
 static wchar_t exec_prefix[MAXPATHLEN+1];
 static wchar_t progpath[MAXPATHLEN+1];
+static wchar_t stdlib_dir[MAXPATHLEN+1];
 static wchar_t *module_search_path = NULL;
 
 /* Get file status. Encode the path to the locale encoding. */
@@ -672,8 +673,11 @@ calculate_path(void)
         wcsncpy(prefix, _prefix, MAXPATHLEN);
         joinpath(prefix, lib_python);
     }
-    else
+    else {
         reduce(prefix);
+        /* The standard library is where the landmark was found */
+        wcscpy(stdlib_dir, prefix);
+    }
 
     wcsncpy(zip_path, prefix, MAXPATHLEN);
     zip_path[MAXPATHLEN] = L'\0';
@@ -834,7 +838,7 @@ Py_SetPath(const wchar_t *path)
         extern wchar_t *Py_GetProgramName(void);
         wchar_t *prog = Py_GetProgramName();
         wcsncpy(progpath, prog, MAXPATHLEN);
-        exec_prefix[0] = prefix[0] = L'\0';
+        exec_prefix[0] = prefix[0] = stdlib_dir[0] = L'\0';
         module_search_path = PyMem_RawMalloc((wcslen(path) + 1) * sizeof(wchar_t));
         if (module_search_path != NULL)
             wcscpy(module_search_path, path);
@@ -873,6 +877,14 @@ Py_GetProgramFullPath(void)
     return progpath;
 }
 
+wchar_t *
+_Py_GetStdlibDir(void)
+{
+    if (!module_search_path)
+        calculate_path();
+    return stdlib_dir;
+}
+
 
 #ifdef __cplusplus
 }
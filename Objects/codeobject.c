@@ -2,6 +2,7 @@
 
 #include "Python.h"
 #include "code.h"
+#include "opcode.h"
 #include "structmember.h"
 
 #define NAME_CHARS \
@@ -206,9 +207,61 @@ PyCode_New(int argcount, int kwonlyargcount,
     co->co_zombieframe = NULL;
     co->co_weakreflist = NULL;
     co->co_extra = NULL;
+
+    co->co_opcache_map = NULL;
+    co->co_opcache = NULL;
+    co->co_opcache_flag = 0;
+    co->co_opcache_size = 0;
     return co;
 }
 
+int
+_PyCode_InitOpcache(PyCodeObject *co)
+{
+    Py_ssize_t co_size, i;
+    const _Py_CODEUNIT *opcodes;
+    Py_ssize_t opts = 0;
+
+    co_size = PyBytes_Size(co->co_code) / sizeof(_Py_CODEUNIT);
+    co->co_opcache_map = (unsigned char *)PyMem_Calloc(co_size, 1);
+    if (co->co_opcache_map == NULL) {
+        PyErr_NoMemory();
+        return -1;
+    }
+
+    opcodes = (const _Py_CODEUNIT *)PyBytes_AS_STRING(co->co_code);
+    for (i = 0; i < co_size; ) {
+        unsigned char opcode = _Py_OPCODE(opcodes[i]);
+        i++;  /* 'i' is now aligned to (next_instr - first_instr) */
+
+        if ((opcode == LOAD_GLOBAL || opcode == LOAD_ATTR) && i < co_size) {
+            opts++;
+            co->co_opcache_map[i] = (unsigned char)opts;
+            if (opts > 254) {
+                break;
+            }
+        }
+    }
+
+    if (opts) {
+        co->co_opcache = (_PyOpcache *)PyMem_Calloc(opts, sizeof(_PyOpcache));
+        if (co->co_opcache == NULL) {
+            PyMem_FREE(co->co_opcache_map);
+            co->co_opcache_map = NULL;
+            PyErr_NoMemory();
+            return -1;
+        }
+    }
+    else {
+        PyMem_FREE(co->co_opcache_map);
+        co->co_opcache_map = NULL;
+        co->co_opcache = NULL;
+    }
+
+    co->co_opcache_size = (unsigned char)opts;
+    return 0;
+}
+
 PyCodeObject *
 PyCode_NewEmpty(const char *filename, const char *funcname, int firstlineno)
 {
@@ -415,6 +468,13 @@ code_new(PyTypeObject *type, PyObject *args, PyObject *kw)
 static void
 code_dealloc(PyCodeObject *co)
 {
+    if (co->co_opcache != NULL) {
+        PyMem_FREE(co->co_opcache);
+    }
+    if (co->co_opcache_map != NULL) {
+        PyMem_FREE(co->co_opcache_map);
+    }
+
     if (co->co_extra != NULL) {
         PyThreadState *tstate = PyThreadState_Get();
         _PyCodeObjectExtra *co_extra = co->co_extra;
@@ -456,6 +516,13 @@ code_sizeof(PyCodeObject *co, void *unused)
     res = _PyObject_SIZE(Py_TYPE(co));
     if (co->co_cell2arg != NULL && co->co_cellvars != NULL)
         res += PyTuple_GET_SIZE(co->co_cellvars) * sizeof(Py_ssize_t);
+    if (co->co_opcache != NULL) {
+        assert(co->co_opcache_map != NULL);
+        /* co_opcache_map */
+        res += PyBytes_GET_SIZE(co->co_code) / sizeof(_Py_CODEUNIT);
+        /* co_opcache */
+        res += co->co_opcache_size * sizeof(_PyOpcache);
+    }
     return PyLong_FromSsize_t(res);
 }
 
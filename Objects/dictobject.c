@@ -1534,6 +1534,60 @@ _PyDict_LoadGlobal(PyDictObject *globals, PyDictObject *builtins, PyObject *key)
     return value;
 }
 
+/* Look up a str key, trying first the entry at index *hint* (usually
+ * remembered from a previous lookup in a dict with the same layout).
+ *
+ * Return the index of the entry and store the value (borrowed reference)
+ * into *value if the key exists.  Otherwise, store NULL into *value and
+ * return DKIX_EMPTY, or DKIX_ERROR with an exception set if an error
+ * occurred.
+ */
+Py_ssize_t
+_PyDict_GetItemHint(PyDictObject *mp, PyObject *key,
+                    Py_ssize_t hint, PyObject **value)
+{
+    Py_hash_t hash;
+    Py_ssize_t ix;
+
+    assert(PyDict_CheckExact((PyObject *)mp));
+    assert(PyUnicode_CheckExact(key));
+
+    if (hint >= 0 && hint < mp->ma_keys->dk_nentries) {
+        PyObject *res = NULL;
+        PyDictKeyEntry *ep = DK_ENTRIES(mp->ma_keys) + (size_t)hint;
+
+        if (ep->me_key == key) {
+            if (mp->ma_values != NULL) {
+                res = mp->ma_values[(size_t)hint];
+            }
+            else {
+                res = ep->me_value;
+            }
+            if (res != NULL) {
+                *value = res;
+                return hint;
+            }
+        }
+    }
+
+    if ((hash = ((PyASCIIObject *) key)->hash) == -1) {
+        hash = PyObject_Hash(key);
+        if (hash == -1) {
+            *value = NULL;
+            return DKIX_ERROR;
+        }
+    }
+
+    ix = (mp->ma_keys->dk_lookup)(mp, key, hash, value, NULL);
+    if (ix < 0) {
+        *value = NULL;
+    }
+    else if (*value == NULL) {
+        ix = DKIX_EMPTY;
+    }
+    return ix;
+}
+
 /* CAUTION: PyDict_SetItem() must guarantee that it won't resize the
  * dictionary if it's merely replacing the value for an existing key.
  * This means that it's safe to loop over a dictionary with PyDict_Next()
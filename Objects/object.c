@@ -1740,6 +1740,9 @@ _Py_ReadyTypes(void)
     if (PyType_Ready(&PyMemoryView_Type) < 0)
         Py_FatalError("Can't initialize memoryview type");
 
+    if (PyType_Ready(&PyPickleBuffer_Type) < 0)
+        Py_FatalError("Can't initialize pickle buffer type");
+
     if (PyType_Ready(&PyTuple_Type) < 0)
         Py_FatalError("Can't initialize tuple type");
 
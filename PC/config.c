@@ -5,6 +5,7 @@
 
 #include "Python.h"
 
+extern PyObject* PyInit__abc(void);
 extern PyObject* PyInit_array(void);
 #ifndef MS_WINI64
 extern PyObject* PyInit_audioop(void);
@@ -78,6 +79,7 @@ extern PyObject* PyInit_imp(void);
 
 struct _inittab _PyImport_Inittab[] = {
 
+    {"_abc", PyInit__abc},
     {"array", PyInit_array},
     {"_ast", PyInit__ast},
 #ifdef MS_WINDOWS
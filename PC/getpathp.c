@@ -926,6 +926,26 @@ Py_GetProgramFullPath(void)
     return progpath;
 }
 
+wchar_t *
+_Py_GetStdlibDir(void)
+{
+    static wchar_t stdlib_dir[MAXPATHLEN+1];
+    wchar_t landmark[MAXPATHLEN+1];
+    wchar_t *dir = Py_GetPrefix();
+
+    /* The prefix is normally where the "lib\\os.py" landmark was found */
+    stdlib_dir[0] = L'\0';
+    if (dir[0] && wcslen(dir) + 10 < MAXPATHLEN) {
+        wcscpy(landmark, dir);
+        join(landmark, LANDMARK);
+        if (ismodule(landmark, FALSE)) {
+            wcscpy(stdlib_dir, dir);
+            join(stdlib_dir, L"Lib");
+        }
+    }
+    return stdlib_dir;
+}
+
 /* Load python3.dll before loading any extension module that might refer
    to it. That way, we can be sure that always the python3.dll corresponding
    to this python DLL is loaded, not a python3.dll that might be on the path
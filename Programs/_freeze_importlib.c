@@ -1,9 +1,18 @@
 /* This is built as a stand-alone executable by the Makefile, and helps turn
    Lib/importlib/_bootstrap.py into a frozen module in Python/importlib.h
+
+   Usage:
+
+       _freeze_importlib INPUT OUTPUT
+           Freeze Lib/importlib/_bootstrap.py or _bootstrap_external.py.
+       _freeze_importlib --stdlib LIBDIR OUTPUT MODULE...
+           Freeze the given modules of the standard library, found in
+           LIBDIR, into Python/frozen_stdlib.h (see Python/frozen.c).
 */
 
 #include <Python.h>
 #include <marshal.h>
+#include <osdefs.h>
 
 #include <stdio.h>
 #include <sys/types.h>
@@ -27,52 +36,198 @@ static const struct _frozen _PyImport_FrozenModules[] = {
 const struct _frozen *PyImport_FrozenModules;
 #endif
 
+#ifndef MS_WINDOWS
+const struct _frozen *_PyImport_FrozenStdlib;
+const struct _frozen *_PyImport_FrozenNoStdlib;
+#endif
+
 const char header[] = "/* Auto-generated by Programs/_freeze_importlib.c */";
 
-int
-main(int argc, char *argv[])
+/* Return the content of path as a nul-terminated string, or NULL. */
+static char *
+read_text(const char *path)
 {
-    char *inpath, *outpath, *code_name;
-    FILE *infile = NULL, *outfile = NULL;
+    FILE *infile;
     struct _Py_stat_struct status;
-    size_t text_size, data_size, n;
-    char *text = NULL;
-    unsigned char *data;
-    PyObject *code = NULL, *marshalled = NULL;
-    int is_bootstrap = 1;
+    size_t text_size, n;
+    char *text;
 
-    PyImport_FrozenModules = _PyImport_FrozenModules;
-
-    if (argc != 3) {
-        fprintf(stderr, "need to specify input and output paths\n");
-        return 2;
-    }
-    inpath = argv[1];
-    outpath = argv[2];
-    infile = fopen(inpath, "rb");
+    infile = fopen(path, "rb");
     if (infile == NULL) {
-        fprintf(stderr, "cannot open '%s' for reading\n", inpath);
-        goto error;
+        fprintf(stderr, "cannot open '%s' for reading\n", path);
+        return NULL;
     }
     if (_Py_fstat_noraise(fileno(infile), &status)) {
-        fprintf(stderr, "cannot fstat '%s'\n", inpath);
-        goto error;
+        fprintf(stderr, "cannot fstat '%s'\n", path);
+        fclose(infile);
+        return NULL;
     }
     text_size = (size_t)status.st_size;
     text = (char *) malloc(text_size + 1);
     if (text == NULL) {
         fprintf(stderr, "could not allocate %ld bytes\n", (long) text_size);
-        goto error;
+        fclose(infile);
+        return NULL;
     }
     n = fread(text, 1, text_size, infile);
     fclose(infile);
-    infile = NULL;
     if (n < text_size) {
         fprintf(stderr, "read too short: got %ld instead of %ld bytes\n",
                 (long) n, (long) text_size);
-        goto error;
+        free(text);
+        return NULL;
     }
     text[text_size] = '\0';
+    return text;
+}
+
+/* Compile the source in path and return the marshalled code object. */
+static PyObject *
+compile_and_marshal(const char *path, const char *code_name)
+{
+    char *text;
+    PyObject *code, *marshalled;
+
+    text = read_text(path);
+    if (text == NULL)
+        return NULL;
+    code = Py_CompileStringExFlags(text, code_name, Py_file_input, NULL, 0);
+    free(text);
+    if (code == NULL)
+        return NULL;
+    marshalled = PyMarshal_WriteObjectToString(code, Py_MARSHAL_VERSION);
+    Py_DECREF(code);
+    if (marshalled == NULL)
+        return NULL;
+    assert(PyBytes_CheckExact(marshalled));
+    return marshalled;
+}
+
+static void
+write_code(FILE *outfile, const char *decl, const char *array_name,
+           PyObject *marshalled)
+{
+    unsigned char *data = (unsigned char *) PyBytes_AS_STRING(marshalled);
+    size_t data_size = PyBytes_GET_SIZE(marshalled);
+    size_t n;
+
+    fprintf(outfile, "%sconst unsigned char %s[] = {\n", decl, array_name);
+    for (n = 0; n < data_size; n += 16) {
+        size_t i, end = Py_MIN(n + 16, data_size);
+        fprintf(outfile, "    ");
+        for (i = n; i < end; i++) {
+            fprintf(outfile, "%d,", (unsigned int) data[i]);
+        }
+        fprintf(outfile, "\n");
+    }
+    fprintf(outfile, "};\n");
+}
+
+/* Freeze importlib._bootstrap or importlib._bootstrap_external. */
+static int
+freeze_importlib(const char *inpath, FILE *outfile)
+{
+    PyObject *marshalled;
+    int is_bootstrap = (strstr(inpath, "_external") == NULL);
+
+    marshalled = compile_and_marshal(inpath, is_bootstrap ?
+                                     "<frozen importlib._bootstrap>" :
+                                     "<frozen importlib._bootstrap_external>");
+    if (marshalled == NULL)
+        return -1;
+    write_code(outfile, "", is_bootstrap ? "_Py_M__importlib" :
+                                           "_Py_M__importlib_external",
+               marshalled);
+    Py_DECREF(marshalled);
+    return 0;
+}
+
+/* Freeze modules of the standard library.  Their code is compiled with
+   their file name relative to libdir, prefixed with "<stdlib>/", which the
+   import system resolves
+   when the module is imported (see FrozenImporter.exec_module()), and
+   the header defines FROZEN_STDLIB_MODULES, the entries to add to the
+   table of frozen modules. */
+static int
+freeze_stdlib(const char *libdir, FILE *outfile, int count, char **names)
+{
+    char path[MAXPATHLEN + 1], relpath[MAXPATHLEN + 1];
+    char code_name[MAXPATHLEN + 1];
+    char array_name[MAXPATHLEN + 1];
+    char *c;
+    int i, *is_package;
+    FILE *module_file;
+    PyObject *marshalled;
+
+    is_package = (int *) calloc(count ? count : 1, sizeof(int));
+    if (is_package == NULL) {
+        fprintf(stderr, "could not allocate memory\n");
+        return -1;
+    }
+    for (i = 0; i < count; i++) {
+        PyOS_snprintf(relpath, sizeof(relpath), "%s.py", names[i]);
+        for (c = relpath; *c && strcmp(c, ".py"); c++) {
+            if (*c == '.')
+                *c = '/';
+        }
+        PyOS_snprintf(path, sizeof(path), "%s/%s", libdir, relpath);
+        module_file = fopen(path, "rb");
+        if (module_file != NULL) {
+            fclose(module_file);
+        }
+        else {
+            /* A package */
+            relpath[strlen(relpath) - 3] = '\0';
+            strncat(relpath, "/__init__.py",
+                    sizeof(relpath) - strlen(relpath) - 1);
+            PyOS_snprintf(path, sizeof(path), "%s/%s", libdir, relpath);
+            is_package[i] = 1;
+        }
+        PyOS_snprintf(code_name, sizeof(code_name), "<stdlib>/%s", relpath);
+        marshalled = compile_and_marshal(path, code_name);
+        if (marshalled == NULL) {
+            free(is_package);
+            return -1;
+        }
+        PyOS_snprintf(array_name, sizeof(array_name), "_Py_M__%s", names[i]);
+        for (c = array_name; *c; c++) {
+            if (*c == '.')
+                *c = '_';
+        }
+        write_code(outfile, "static ", array_name, marshalled);
+        Py_DECREF(marshalled);
+    }
+    fprintf(outfile, "\n#define FROZEN_STDLIB_COUNT %d\n", count);
+    fprintf(outfile, "#define FROZEN_STDLIB_MODULES \\\n");
+    for (i = 0; i < count; i++) {
+        PyOS_snprintf(array_name, sizeof(array_name), "_Py_M__%s", names[i]);
+        for (c = array_name; *c; c++) {
+            if (*c == '.')
+                *c = '_';
+        }
+        fprintf(outfile, "    {\"%s\", %s, %s(int)sizeof(%s)}, \\\n",
+                names[i], array_name, is_package[i] ? "-" : "", array_name);
+    }
+    fprintf(outfile, "    /* end of FROZEN_STDLIB_MODULES */\n");
+    free(is_package);
+    return 0;
+}
+
+int
+main(int argc, char *argv[])
+{
+    char *outpath;
+    FILE *outfile = NULL;
+    int stdlib, res;
+
+    PyImport_FrozenModules = _PyImport_FrozenModules;
+
+    stdlib = (argc >= 4 && strcmp(argv[1], "--stdlib") == 0);
+    if (!stdlib && argc != 3) {
+        fprintf(stderr, "need to specify input and output paths\n");
+        return 2;
+    }
+    outpath = stdlib ? argv[3] : argv[2];
 
     Py_NoUserSiteDirectory++;
     Py_NoSiteFlag++;
@@ -83,28 +238,6 @@ main(int argc, char *argv[])
     /* Don't install importlib, since it could execute outdated bytecode. */
     _Py_InitializeEx_Private(1, 0);
 
-    if (strstr(inpath, "_external") != NULL) {
-        is_bootstrap = 0;
-    }
-
-    code_name = is_bootstrap ?
-        "<frozen importlib._bootstrap>" :
-        "<frozen importlib._bootstrap_external>";
-    code = Py_CompileStringExFlags(text, code_name, Py_file_input, NULL, 0);
-    if (code == NULL)
-        goto error;
-    free(text);
-    text = NULL;
-
-    marshalled = PyMarshal_WriteObjectToString(code, Py_MARSHAL_VERSION);
-    Py_CLEAR(code);
-    if (marshalled == NULL)
-        goto error;
-
-    assert(PyBytes_CheckExact(marshalled));
-    data = (unsigned char *) PyBytes_AS_STRING(marshalled);
-    data_size = PyBytes_GET_SIZE(marshalled);
-
     /* Open the file in text mode. The hg checkout should be using the eol extension,
        which in turn should cause the EOL style match the C library's text mode */
     outfile = fopen(outpath, "w");
@@ -113,43 +246,28 @@ main(int argc, char *argv[])
         goto error;
     }
     fprintf(outfile, "%s\n", header);
-    if (is_bootstrap)
-        fprintf(outfile, "const unsigned char _Py_M__importlib[] = {\n");
+    if (stdlib)
+        res = freeze_stdlib(argv[2], outfile, argc - 4, argv + 4);
     else
-        fprintf(outfile,
-                "const unsigned char _Py_M__importlib_external[] = {\n");
-    for (n = 0; n < data_size; n += 16) {
-        size_t i, end = Py_MIN(n + 16, data_size);
-        fprintf(outfile, "    ");
-        for (i = n; i < end; i++) {
-            fprintf(outfile, "%d,", (unsigned int) data[i]);
-        }
-        fprintf(outfile, "\n");
-    }
-    fprintf(outfile, "};\n");
-
-    Py_CLEAR(marshalled);
+        res = freeze_importlib(argv[1], outfile);
+    if (res < 0)
+        goto error;
 
     Py_Finalize();
-    if (outfile) {
-        if (ferror(outfile)) {
-            fprintf(stderr, "error when writing to '%s'\n", outpath);
-            goto error;
-        }
+    if (ferror(outfile)) {
+        fprintf(stderr, "error when writing to '%s'\n", outpath);
         fclose(outfile);
+        return 1;
     }
+    fclose(outfile);
     return 0;
 
 error:
     PyErr_Print();
     Py_Finalize();
-    if (infile)
-        fclose(infile);
-    if (outfile)
+    if (outfile) {
         fclose(outfile);
-    if (text)
-        free(text);
-    if (marshalled)
-        Py_DECREF(marshalled);
+        remove(outpath);
+    }
     return 1;
 }
@@ -692,6 +692,7 @@ _PyEval_EvalFrameDefault(PyFrameObject *f, int throwflag)
     const _Py_CODEUNIT *first_instr;
     PyObject *names;
     PyObject *consts;
+    _PyOpcache *co_opcache;
 
 #ifdef LLTRACE
     _Py_IDENTIFIER(__ltrace__);
@@ -821,6 +822,48 @@ _PyEval_EvalFrameDefault(PyFrameObject *f, int throwflag)
 #define JUMPTO(x)       (next_instr = first_instr + (x) / sizeof(_Py_CODEUNIT))
 #define JUMPBY(x)       (next_instr += (x) / sizeof(_Py_CODEUNIT))
 
+/* Opcode cache macros
+
+   OPCACHE_CHECK() sets co_opcache to the cache entry of the current
+   instruction, or to NULL if the code object has no cache (yet) or the
+   instruction has no entry.  It must be used after NEXTOPARG(). */
+
+/* Number of cache misses tolerated before LOAD_ATTR gives up caching */
+#define OPCACHE_MAX_TRIES 20
+
+#define OPCACHE_CHECK() \
+    do { \
+        co_opcache = NULL; \
+        if (co->co_opcache != NULL) { \
+            unsigned char co_opt_offset = \
+                co->co_opcache_map[next_instr - first_instr]; \
+            if (co_opt_offset > 0) { \
+                assert(co_opt_offset <= co->co_opcache_size); \
+                co_opcache = &co->co_opcache[co_opt_offset - 1]; \
+                if (co_opcache->optimized < 0) { \
+                    co_opcache = NULL; \
+                } \
+            } \
+        } \
+    } while (0)
+
+/* Stop caching the current instruction */
+#define OPCACHE_DEOPT() \
+    do { \
+        if (co_opcache != NULL) { \
+            co_opcache->optimized = -1; \
+            co_opcache = NULL; \
+        } \
+    } while (0)
+
+/* Count a miss, stop caching after OPCACHE_MAX_TRIES misses */
+#define OPCACHE_MAYBE_DEOPT() \
+    do { \
+        if (co_opcache != NULL && --co_opcache->optimized <= 0) { \
+            OPCACHE_DEOPT(); \
+        } \
+    } while (0)
+
 /* OpCode prediction macros
     Some opcodes tend to come in pairs thus making it possible to
     predict the second code when the first is run.  For example,
@@ -998,6 +1041,14 @@ _PyEval_EvalFrameDefault(PyFrameObject *f, int throwflag)
     assert(PyBytes_GET_SIZE(co->co_code) % sizeof(_Py_CODEUNIT) == 0);
     assert(_Py_IS_ALIGNED(PyBytes_AS_STRING(co->co_code), sizeof(_Py_CODEUNIT)));
     first_instr = (_Py_CODEUNIT *) PyBytes_AS_STRING(co->co_code);
+    if (co->co_opcache_flag < _PyCode_OPCACHE_MIN_RUNS) {
+        co->co_opcache_flag++;
+        if (co->co_opcache_flag == _PyCode_OPCACHE_MIN_RUNS) {
+            if (_PyCode_InitOpcache(co) < 0) {
+                goto exit_eval_frame;
+            }
+        }
+    }
     /*
        f->f_lasti refers to the index of the last instruction,
        unless it's -1 in which case next_instr should be first_instr.
@@ -2292,11 +2343,32 @@ _PyEval_EvalFrameDefault(PyFrameObject *f, int throwflag)
         }
 
         TARGET(LOAD_GLOBAL) {
-            PyObject *name = GETITEM(names, oparg);
+            PyObject *name;
             PyObject *v;
             if (PyDict_CheckExact(f->f_globals)
                 && PyDict_CheckExact(f->f_builtins))
             {
+                OPCACHE_CHECK();
+                if (co_opcache != NULL && co_opcache->optimized > 0) {
+                    _PyOpcache_LoadGlobal *lg = &co_opcache->u.lg;
+
+                    /* Version tags are unique across dicts and change on
+                       every mutation: if neither namespace changed, the
+                       cached object is still the result of the lookup. */
+                    if (lg->globals_ver ==
+                            ((PyDictObject *)f->f_globals)->ma_version_tag
+                        && lg->builtins_ver ==
+                           ((PyDictObject *)f->f_builtins)->ma_version_tag)
+                    {
+                        v = lg->ptr;
+                        assert(v != NULL);
+                        Py_INCREF(v);
+                        PUSH(v);
+                        DISPATCH();
+                    }
+                }
+
+                name = GETITEM(names, oparg);
                 v = _PyDict_LoadGlobal((PyDictObject *)f->f_globals,
                                        (PyDictObject *)f->f_builtins,
                                        name);
@@ -2309,10 +2381,23 @@ _PyEval_EvalFrameDefault(PyFrameObject *f, int throwflag)
                     }
                     goto error;
                 }
+
+                if (co_opcache != NULL) {
+                    _PyOpcache_LoadGlobal *lg = &co_opcache->u.lg;
+
+                    co_opcache->optimized = 1;
+                    lg->globals_ver =
+                        ((PyDictObject *)f->f_globals)->ma_version_tag;
+                    lg->builtins_ver =
+                        ((PyDictObject *)f->f_builtins)->ma_version_tag;
+                    lg->ptr = v; /* borrowed */
+                }
+
                 Py_INCREF(v);
             }
             else {
                 /* Slow-path if globals or builtins is not a dict */
+                name = GETITEM(names, oparg);
 
                 /* namespace 1: globals */
                 v = PyObject_GetItem(f->f_globals, name);
@@ -2766,7 +2851,95 @@ _PyEval_EvalFrameDefault(PyFrameObject *f, int throwflag)
         TARGET(LOAD_ATTR) {
             PyObject *name = GETITEM(names, oparg);
             PyObject *owner = TOP();
-            PyObject *res = PyObject_GetAttr(owner, name);
+            PyTypeObject *type = Py_TYPE(owner);
+            PyObject *res;
+
+            OPCACHE_CHECK();
+            if (co_opcache != NULL
+                && PyType_HasFeature(type, Py_TPFLAGS_VALID_VERSION_TAG))
+            {
+                _PyOpcache_LoadAttr *la = &co_opcache->u.la;
+                PyObject *dict;
+
+                if (co_opcache->optimized > 0) {
+                    /* A matching version tag means that the type (and its
+                       bases) still has no attribute named *name*, so the
+                       instance dict is the only place to look. */
+                    if (la->type == type
+                        && la->tp_version_tag == type->tp_version_tag)
+                    {
+                        dict = *(PyObject **)((char *)owner +
+                                              type->tp_dictoffset);
+                        if (dict != NULL && PyDict_CheckExact(dict)) {
+                            Py_ssize_t hint = la->hint;
+
+                            /* The lookup may run arbitrary code */
+                            Py_INCREF(dict);
+                            res = NULL;
+                            la->hint = _PyDict_GetItemHint(
+                                (PyDictObject *)dict, name, hint, &res);
+                            if (res != NULL) {
+                                if (la->hint != hint) {
+                                    /* Layout differs from last time */
+                                    OPCACHE_MAYBE_DEOPT();
+                                }
+                                Py_INCREF(res);
+                                SET_TOP(res);
+                                Py_DECREF(owner);
+                                Py_DECREF(dict);
+                                DISPATCH();
+                            }
+                            /* The attribute is sometimes missing from the
+                               instance: don't cache this lookup */
+                            PyErr_Clear();
+                            Py_DECREF(dict);
+                        }
+                        OPCACHE_DEOPT();
+                    }
+                    else {
+                        /* The type was modified or another type is seen
+                           here, maybe it will stabilize */
+                        OPCACHE_MAYBE_DEOPT();
+                    }
+                }
+                else if (type->tp_getattro == PyObject_GenericGetAttr
+                         && type->tp_dictoffset > 0
+                         && _PyType_Lookup(type, name) == NULL
+                         && PyType_HasFeature(type,
+                                              Py_TPFLAGS_VALID_VERSION_TAG))
+                {
+                    /* First execution with a cache entry: only instance
+                       attributes not shadowed by the type are cached */
+                    dict = *(PyObject **)((char *)owner + type->tp_dictoffset);
+                    if (dict != NULL && PyDict_CheckExact(dict)) {
+                        Py_ssize_t hint;
+
+                        Py_INCREF(dict);
+                        res = NULL;
+                        hint = _PyDict_GetItemHint((PyDictObject *)dict,
+                                                   name, -1, &res);
+                        if (res != NULL) {
+                            co_opcache->optimized = OPCACHE_MAX_TRIES;
+                            la->type = type;
+                            la->tp_version_tag = type->tp_version_tag;
+                            la->hint = hint;
+                            Py_INCREF(res);
+                            SET_TOP(res);
+                            Py_DECREF(owner);
+                            Py_DECREF(dict);
+                            DISPATCH();
+                        }
+                        PyErr_Clear();
+                        Py_DECREF(dict);
+                    }
+                    OPCACHE_DEOPT();
+                }
+                else {
+                    OPCACHE_DEOPT();
+                }
+            }
+
+            res = PyObject_GetAttr(owner, name);
             Py_DECREF(owner);
             SET_TOP(res);
             if (res == NULL)
@@ -4,6 +4,7 @@
 #include "Python.h"
 #include "importlib.h"
 #include "importlib_external.h"
+#include "frozen_stdlib.h"
 
 /* In order to test the support for frozen modules, by default we
    define a single frozen module, __hello__.  Loading it will print
@@ -27,7 +28,13 @@ static unsigned char M___hello__[] = {
 
 #define SIZE (int)sizeof(M___hello__)
 
+/* The startup modules of the standard library come first, so that
+   -X frozen_modules=off can skip them.  They are listed in Makefile.pre.in;
+   to regenerate Python/frozen_stdlib.h, run make and copy it from the build
+   directory when building out of tree. */
+
 static const struct _frozen _PyImport_FrozenModules[] = {
+    FROZEN_STDLIB_MODULES
     /* importlib */
     {"_frozen_importlib", _Py_M__importlib, (int)sizeof(_Py_M__importlib)},
     {"_frozen_importlib_external", _Py_M__importlib_external,
@@ -44,3 +51,7 @@ static const struct _frozen _PyImport_FrozenModules[] = {
    collection of frozen modules: */
 
 const struct _frozen *PyImport_FrozenModules = _PyImport_FrozenModules;
+
+const struct _frozen *_PyImport_FrozenStdlib = _PyImport_FrozenModules;
+const struct _frozen *_PyImport_FrozenNoStdlib =
+    _PyImport_FrozenModules + FROZEN_STDLIB_COUNT;
@@ -0,0 +1,10667 @@
+/* Auto-generated by Programs/_freeze_importlib.c */
+static const unsigned char _Py_M__abc[] = {
+    99,0,0,0,0,0,0,0,0,0,0,0,0,13,0,0,
+    0,64,0,0,0,115,190,0,0,0,100,0,90,0,100,1,
+    100,2,132,0,90,1,71,0,100,3,100,4,132,0,100,4,
+    101,2,131,3,90,3,71,0,100,5,100,6,132,0,100,6,
+    101,4,131,3,90,5,71,0,100,7,100,8,132,0,100,8,
+    101,6,131,3,90,7,121,48,100,9,100,10,108,8,109,9,
+    90,9,109,10,90,10,109,11,90,11,109,12,90,12,109,13,
+    90,13,109,14,90,14,109,15,90,15,109,16,90,16,109,17,
+    90,17,1,0,87,0,110,42,4,0,101,18,107,10,114,150,
+    1,0,1,0,1,0,100,9,100,11,108,19,109,20,90,20,
+    109,9,90,9,1,0,100,12,101,20,95,21,89,0,110,18,
+    88,0,71,0,100,13,100,14,132,0,100,14,101,22,131,3,
+    90,20,71,0,100,15,100,16,132,0,100,16,101,20,100,17,
+    141,3,90,23,100,18,83,0,41,19,122,51,65,98,115,116,
+    114,97,99,116,32,66,97,115,101,32,67,108,97,115,115,101,
+    115,32,40,65,66,67,115,41,32,97,99,99,111,114,100,105,
+    110,103,32,116,111,32,80,69,80,32,51,49,49,57,46,99,
+    1,0,0,0,0,0,0,0,1,0,0,0,2,0,0,0,
+    67,0,0,0,115,10,0,0,0,100,1,124,0,95,0,124,
+    0,83,0,41,2,97,222,1,0,0,65,32,100,101,99,111,
+    114,97,116,111,114,32,105,110,100,105,99,97,116,105,110,103,
+    32,97,98,115,116,114,97,99,116,32,109,101,116,104,111,100,
+    115,46,10,10,32,32,32,32,82,101,113,117,105,114,101,115,
+    32,116,104,97,116,32,116,104,101,32,109,101,116,97,99,108,
+    97,115,115,32,105,115,32,65,66,67,77,101,116,97,32,111,
+    114,32,100,101,114,105,118,101,100,32,102,114,111,109,32,105,
+    116,46,32,32,65,10,32,32,32,32,99,108,97,115,115,32,
+    116,104,97,116,32,104,97,115,32,97,32,109,101,116,97,99,
+    108,97,115,115,32,100,101,114,105,118,101,100,32,102,114,111,
+    109,32,65,66,67,77,101,116,97,32,99,97,110,110,111,116,
+    32,98,101,10,32,32,32,32,105,110,115,116,97,110,116,105,
+    97,116,101,100,32,117,110,108,101,115,115,32,97,108,108,32,
+    111,102,32,105,116,115,32,97,98,115,116,114,97,99,116,32,
+    109,101,116,104,111,100,115,32,97,114,101,32,111,118,101,114,
+    114,105,100,100,101,110,46,10,32,32,32,32,84,104,101,32,
+    97,98,115,116,114,97,99,116,32,109,101,116,104,111,100,115,
+    32,99,97,110,32,98,101,32,99,97,108,108,101,100,32,117,
+    115,105,110,103,32,97,110,121,32,111,102,32,116,104,101,32,
+    110,111,114,109,97,108,10,32,32,32,32,39,115,117,112,101,
+    114,39,32,99,97,108,108,32,109,101,99,104,97,110,105,115,
+    109,115,46,10,10,32,32,32,32,85,115,97,103,101,58,10,
+    10,32,32,32,32,32,32,32,32,99,108,97,115,115,32,67,
+    40,109,101,116,97,99,108,97,115,115,61,65,66,67,77,101,
+    116,97,41,58,10,32,32,32,32,32,32,32,32,32,32,32,
+    32,64,97,98,115,116,114,97,99,116,109,101,116,104,111,100,
+    10,32,32,32,32,32,32,32,32,32,32,32,32,100,101,102,
+    32,109,121,95,97,98,115,116,114,97,99,116,95,109,101,116,
+    104,111,100,40,115,101,108,102,44,32,46,46,46,41,58,10,
+    32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,
+    46,46,46,10,32,32,32,32,84,41,1,218,20,95,95,105,
+    115,97,98,115,116,114,97,99,116,109,101,116,104,111,100,95,
+    95,41,1,90,7,102,117,110,99,111,98,106,169,0,114,1,
+    0,0,0,250,15,60,115,116,100,108,105,98,62,47,97,98,
+    99,46,112,121,218,14,97,98,115,116,114,97,99,116,109,101,
+    116,104,111,100,7,0,0,0,115,4,0,0,0,0,16,6,
+    1,114,3,0,0,0,99,0,0,0,0,0,0,0,0,0,
+    0,0,0,3,0,0,0,0,0,0,0,115,36,0,0,0,
+    101,0,90,1,100,0,90,2,100,1,90,3,100,2,90,4,
+    135,0,102,1,100,3,100,4,132,8,90,5,135,0,4,0,
+    90,6,83,0,41,5,218,19,97,98,115,116,114,97,99,116,
+    99,108,97,115,115,109,101,116,104,111,100,97,79,1,0,0,
+    10,32,32,32,32,65,32,100,101,99,111,114,97,116,111,114,
+    32,105,110,100,105,99,97,116,105,110,103,32,97,98,115,116,
+    114,97,99,116,32,99,108,97,115,115,109,101,116,104,111,100,
+    115,46,10,10,32,32,32,32,83,105,109,105,108,97,114,32,
+    116,111,32,97,98,115,116,114,97,99,116,109,101,116,104,111,
+    100,46,10,10,32,32,32,32,85,115,97,103,101,58,10,10,
+    32,32,32,32,32,32,32,32,99,108,97,115,115,32,67,40,
+    109,101,116,97,99,108,97,115,115,61,65,66,67,77,101,116,
+    97,41,58,10,32,32,32,32,32,32,32,32,32,32,32,32,
+    64,97,98,115,116,114,97,99,116,99,108,97,115,115,109,101,
+    116,104,111,100,10,32,32,32,32,32,32,32,32,32,32,32,
+    32,100,101,102,32,109,121,95,97,98,115,116,114,97,99,116,
+    95,99,108,97,115,115,109,101,116,104,111,100,40,99,108,115,
+    44,32,46,46,46,41,58,10,32,32,32,32,32,32,32,32,
+    32,32,32,32,32,32,32,32,46,46,46,10,10,32,32,32,
+    32,39,97,98,115,116,114,97,99,116,99,108,97,115,115,109,
+    101,116,104,111,100,39,32,105,115,32,100,101,112,114,101,99,
+    97,116,101,100,46,32,85,115,101,32,39,99,108,97,115,115,
+    109,101,116,104,111,100,39,32,119,105,116,104,10,32,32,32,
+    32,39,97,98,115,116,114,97,99,116,109,101,116,104,111,100,
+    39,32,105,110,115,116,101,97,100,46,10,32,32,32,32,84,
+    99,2,0,0,0,0,0,0,0,2,0,0,0,3,0,0,
+    0,3,0,0,0,115,22,0,0,0,100,1,124,1,95,0,
+    116,1,131,0,160,2,124,1,161,1,1,0,100,0,83,0,
+    41,2,78,84,41,3,114,0,0,0,0,218,5,115,117,112,
+    101,114,218,8,95,95,105,110,105,116,95,95,41,2,218,4,
+    115,101,108,102,218,8,99,97,108,108,97,98,108,101,41,1,
+    218,9,95,95,99,108,97,115,115,95,95,114,1,0,0,0,
+    114,2,0,0,0,114,6,0,0,0,46,0,0,0,115,4,
+    0,0,0,0,1,6,1,122,28,97,98,115,116,114,97,99,
+    116,99,108,97,115,115,109,101,116,104,111,100,46,95,95,105,
+    110,105,116,95,95,41,7,218,8,95,95,110,97,109,101,95,
+    95,218,10,95,95,109,111,100,117,108,101,95,95,218,12,95,
+    95,113,117,97,108,110,97,109,101,95,95,218,7,95,95,100,
+    111,99,95,95,114,0,0,0,0,114,6,0,0,0,218,13,
+    95,95,99,108,97,115,115,99,101,108,108,95,95,114,1,0,
+    0,0,114,1,0,0,0,41,1,114,9,0,0,0,114,2,
+    0,0,0,114,4,0,0,0,27,0,0,0,115,6,0,0,
+    0,8,15,4,2,4,2,114,4,0,0,0,99,0,0,0,
+    0,0,0,0,0,0,0,0,0,3,0,0,0,0,0,0,
+    0,115,36,0,0,0,101,0,90,1,100,0,90,2,100,1,
+    90,3,100,2,90,4,135,0,102,1,100,3,100,4,132,8,
+    90,5,135,0,4,0,90,6,83,0,41,5,218,20,97,98,
+    115,116,114,97,99,116,115,116,97,116,105,99,109,101,116,104,
+    111,100,97,79,1,0,0,10,32,32,32,32,65,32,100,101,
+    99,111,114,97,116,111,114,32,105,110,100,105,99,97,116,105,
+    110,103,32,97,98,115,116,114,97,99,116,32,115,116,97,116,
+    105,99,109,101,116,104,111,100,115,46,10,10,32,32,32,32,
+    83,105,109,105,108,97,114,32,116,111,32,97,98,115,116,114,
+    97,99,116,109,101,116,104,111,100,46,10,10,32,32,32,32,
+    85,115,97,103,101,58,10,10,32,32,32,32,32,32,32,32,
+    99,108,97,115,115,32,67,40,109,101,116,97,99,108,97,115,
+    115,61,65,66,67,77,101,116,97,41,58,10,32,32,32,32,
+    32,32,32,32,32,32,32,32,64,97,98,115,116,114,97,99,
+    116,115,116,97,116,105,99,109,101,116,104,111,100,10,32,32,
+    32,32,32,32,32,32,32,32,32,32,100,101,102,32,109,121,
+    95,97,98,115,116,114,97,99,116,95,115,116,97,116,105,99,
+    109,101,116,104,111,100,40,46,46,46,41,58,10,32,32,32,
+    32,32,32,32,32,32,32,32,32,32,32,32,32,46,46,46,
+    10,10,32,32,32,32,39,97,98,115,116,114,97,99,116,115,
+    116,97,116,105,99,109,101,116,104,111,100,39,32,105,115,32,
+    100,101,112,114,101,99,97,116,101,100,46,32,85,115,101,32,
+    39,115,116,97,116,105,99,109,101,116,104,111,100,39,32,119,
+    105,116,104,10,32,32,32,32,39,97,98,115,116,114,97,99,
+    116,109,101,116,104,111,100,39,32,105,110,115,116,101,97,100,
+    46,10,32,32,32,32,84,99,2,0,0,0,0,0,0,0,
+    2,0,0,0,3,0,0,0,3,0,0,0,115,22,0,0,
+    0,100,1,124,1,95,0,116,1,131,0,160,2,124,1,161,
+    1,1,0,100,0,83,0,41,2,78,84,41,3,114,0,0,
+    0,0,114,5,0,0,0,114,6,0,0,0,41,2,114,7,
+    0,0,0,114,8,0,0,0,41,1,114,9,0,0,0,114,
+    1,0,0,0,114,2,0,0,0,114,6,0,0,0,70,0,
+    0,0,115,4,0,0,0,0,1,6,1,122,29,97,98,115,
+    116,114,97,99,116,115,116,97,116,105,99,109,101,116,104,111,
+    100,46,95,95,105,110,105,116,95,95,41,7,114,10,0,0,
+    0,114,11,0,0,0,114,12,0,0,0,114,13,0,0,0,
+    114,0,0,0,0,114,6,0,0,0,114,14,0,0,0,114,
+    1,0,0,0,114,1,0,0,0,41,1,114,9,0,0,0,
+    114,2,0,0,0,114,15,0,0,0,51,0,0,0,115,6,
+    0,0,0,8,15,4,2,4,2,114,15,0,0,0,99,0,
+    0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,64,
+    0,0,0,115,20,0,0,0,101,0,90,1,100,0,90,2,
+    100,1,90,3,100,2,90,4,100,3,83,0,41,4,218,16,
+    97,98,115,116,114,97,99,116,112,114,111,112,101,114,116,121,
+    97,107,3,0,0,10,32,32,32,32,65,32,100,101,99,111,
+    114,97,116,111,114,32,105,110,100,105,99,97,116,105,110,103,
+    32,97,98,115,116,114,97,99,116,32,112,114,111,112,101,114,
+    116,105,101,115,46,10,10,32,32,32,32,82,101,113,117,105,
+    114,101,115,32,116,104,97,116,32,116,104,101,32,109,101,116,
+    97,99,108,97,115,115,32,105,115,32,65,66,67,77,101,116,
+    97,32,111,114,32,100,101,114,105,118,101,100,32,102,114,111,
+    109,32,105,116,46,32,32,65,10,32,32,32,32,99,108,97,
+    115,115,32,116,104,97,116,32,104,97,115,32,97,32,109,101,
+    116,97,99,108,97,115,115,32,100,101,114,105,118,101,100,32,
+    102,114,111,109,32,65,66,67,77,101,116,97,32,99,97,110,
+    110,111,116,32,98,101,10,32,32,32,32,105,110,115,116,97,
+    110,116,105,97,116,101,100,32,117,110,108,101,115,115,32,97,
+    108,108,32,111,102,32,105,116,115,32,97,98,115,116,114,97,
+    99,116,32,112,114,111,112,101,114,116,105,101,115,32,97,114,
+    101,32,111,118,101,114,114,105,100,100,101,110,46,10,32,32,
+    32,32,84,104,101,32,97,98,115,116,114,97,99,116,32,112,
+    114,111,112,101,114,116,105,101,115,32,99,97,110,32,98,101,
+    32,99,97,108,108,101,100,32,117,115,105,110,103,32,97,110,
+    121,32,111,102,32,116,104,101,32,110,111,114,109,97,108,10,
+    32,32,32,32,39,115,117,112,101,114,39,32,99,97,108,108,
+    32,109,101,99,104,97,110,105,115,109,115,46,10,10,32,32,
+    32,32,85,115,97,103,101,58,10,10,32,32,32,32,32,32,
+    32,32,99,108,97,115,115,32,67,40,109,101,116,97,99,108,
+    97,115,115,61,65,66,67,77,101,116,97,41,58,10,32,32,
+    32,32,32,32,32,32,32,32,32,32,64,97,98,115,116,114,
+    97,99,116,112,114,111,112,101,114,116,121,10,32,32,32,32,
+    32,32,32,32,32,32,32,32,100,101,102,32,109,121,95,97,
+    98,115,116,114,97,99,116,95,112,114,111,112,101,114,116,121,
+    40,115,101,108,102,41,58,10,32,32,32,32,32,32,32,32,
+    32,32,32,32,32,32,32,32,46,46,46,10,10,32,32,32,
+    32,84,104,105,115,32,100,101,102,105,110,101,115,32,97,32,
+    114,101,97,100,45,111,110,108,121,32,112,114,111,112,101,114,
+    116,121,59,32,121,111,117,32,99,97,110,32,97,108,115,111,
+    32,100,101,102,105,110,101,32,97,32,114,101,97,100,45,119,
+    114,105,116,101,10,32,32,32,32,97,98,115,116,114,97,99,
+    116,32,112,114,111,112,101,114,116,121,32,117,115,105,110,103,
+    32,116,104,101,32,39,108,111,110,103,39,32,102,111,114,109,
+    32,111,102,32,112,114,111,112,101,114,116,121,32,100,101,99,
+    108,97,114,97,116,105,111,110,58,10,10,32,32,32,32,32,
+    32,32,32,99,108,97,115,115,32,67,40,109,101,116,97,99,
+    108,97,115,115,61,65,66,67,77,101,116,97,41,58,10,32,
+    32,32,32,32,32,32,32,32,32,32,32,100,101,102,32,103,
+    101,116,120,40,115,101,108,102,41,58,32,46,46,46,10,32,
+    32,32,32,32,32,32,32,32,32,32,32,100,101,102,32,115,
+    101,116,120,40,115,101,108,102,44,32,118,97,108,117,101,41,
+    58,32,46,46,46,10,32,32,32,32,32,32,32,32,32,32,
+    32,32,120,32,61,32,97,98,115,116,114,97,99,116,112,114,
+    111,112,101,114,116,121,40,103,101,116,120,44,32,115,101,116,
+    120,41,10,10,32,32,32,32,39,97,98,115,116,114,97,99,
+    116,112,114,111,112,101,114,116,121,39,32,105,115,32,100,101,
+    112,114,101,99,97,116,101,100,46,32,85,115,101,32,39,112,
+    114,111,112,101,114,116,121,39,32,119,105,116,104,32,39,97,
+    98,115,116,114,97,99,116,109,101,116,104,111,100,39,10,32,
+    32,32,32,105,110,115,116,101,97,100,46,10,32,32,32,32,
+    84,78,41,5,114,10,0,0,0,114,11,0,0,0,114,12,
+    0,0,0,114,13,0,0,0,114,0,0,0,0,114,1,0,
+    0,0,114,1,0,0,0,114,1,0,0,0,114,2,0,0,
+    0,114,16,0,0,0,75,0,0,0,115,4,0,0,0,8,
+    27,4,2,114,16,0,0,0,233,0,0,0,0,41,9,218,
+    15,103,101,116,95,99,97,99,104,101,95,116,111,107,101,110,
+    218,9,95,97,98,99,95,105,110,105,116,218,13,95,97,98,
+    99,95,114,101,103,105,115,116,101,114,218,18,95,97,98,99,
+    95,105,110,115,116,97,110,99,101,99,104,101,99,107,218,18,
+    95,97,98,99,95,115,117,98,99,108,97,115,115,99,104,101,
+    99,107,218,9,95,103,101,116,95,100,117,109,112,218,15,95,
+    114,101,115,101,116,95,114,101,103,105,115,116,114,121,218,13,
+    95,114,101,115,101,116,95,99,97,99,104,101,115,218,15,95,
+    115,104,97,114,101,95,114,101,103,105,115,116,114,121,41,2,
+    218,7,65,66,67,77,101,116,97,114,18,0,0,0,90,3,
+    97,98,99,99,0,0,0,0,0,0,0,0,0,0,0,0,
+    3,0,0,0,0,0,0,0,115,90,0,0,0,101,0,90,
+    1,100,0,90,2,100,1,90,3,135,0,102,1,100,2,100,
+    3,132,8,90,4,100,4,100,5,132,0,90,5,100,6,100,
+    7,132,0,90,6,100,8,100,9,132,0,90,7,100,19,100,
+    11,100,12,132,1,90,8,100,13,100,14,132,0,90,9,100,
+    15,100,16,132,0,90,10,100,17,100,18,132,0,90,11,135,
+    0,4,0,90,12,83,0,41,20,114,27,0,0,0,97,145,
+    2,0,0,77,101,116,97,99,108,97,115,115,32,102,111,114,
+    32,100,101,102,105,110,105,110,103,32,65,98,115,116,114,97,
+    99,116,32,66,97,115,101,32,67,108,97,115,115,101,115,32,
+    40,65,66,67,115,41,46,10,10,32,32,32,32,32,32,32,
+    32,85,115,101,32,116,104,105,115,32,109,101,116,97,99,108,
+    97,115,115,32,116,111,32,99,114,101,97,116,101,32,97,110,
+    32,65,66,67,46,32,32,65,110,32,65,66,67,32,99,97,
+    110,32,98,101,32,115,117,98,99,108,97,115,115,101,100,10,
+    32,32,32,32,32,32,32,32,100,105,114,101,99,116,108,121,
+    44,32,97,110,100,32,116,104,101,110,32,97,99,116,115,32,
+    97,115,32,97,32,109,105,120,45,105,110,32,99,108,97,115,
+    115,46,32,32,89,111,117,32,99,97,110,32,97,108,115,111,
+    32,114,101,103,105,115,116,101,114,10,32,32,32,32,32,32,
+    32,32,117,110,114,101,108,97,116,101,100,32,99,111,110,99,
+    114,101,116,101,32,99,108,97,115,115,101,115,32,40,101,118,
+    101,110,32,98,117,105,108,116,45,105,110,32,99,108,97,115,
+    115,101,115,41,32,97,110,100,32,117,110,114,101,108,97,116,
+    101,100,10,32,32,32,32,32,32,32,32,65,66,67,115,32,
+    97,115,32,39,118,105,114,116,117,97,108,32,115,117,98,99,
+    108,97,115,115,101,115,39,32,45,45,32,116,104,101,115,101,
+    32,97,110,100,32,116,104,101,105,114,32,100,101,115,99,101,
+    110,100,97,110,116,115,32,119,105,108,108,10,32,32,32,32,
+    32,32,32,32,98,101,32,99,111,110,115,105,100,101,114,101,
+    100,32,115,117,98,99,108,97,115,115,101,115,32,111,102,32,
+    116,104,101,32,114,101,103,105,115,116,101,114,105,110,103,32,
+    65,66,67,32,98,121,32,116,104,101,32,98,117,105,108,116,
+    45,105,110,10,32,32,32,32,32,32,32,32,105,115,115,117,
+    98,99,108,97,115,115,40,41,32,102,117,110,99,116,105,111,
+    110,44,32,98,117,116,32,116,104,101,32,114,101,103,105,115,
+    116,101,114,105,110,103,32,65,66,67,32,119,111,110,39,116,
+    32,115,104,111,119,32,117,112,32,105,110,10,32,32,32,32,
+    32,32,32,32,116,104,101,105,114,32,77,82,79,32,40,77,
+    101,116,104,111,100,32,82,101,115,111,108,117,116,105,111,110,
+    32,79,114,100,101,114,41,32,110,111,114,32,119,105,108,108,
+    32,109,101,116,104,111,100,10,32,32,32,32,32,32,32,32,
+    105,109,112,108,101,109,101,110,116,97,116,105,111,110,115,32,
+    100,101,102,105,110,101,100,32,98,121,32,116,104,101,32,114,
+    101,103,105,115,116,101,114,105,110,103,32,65,66,67,32,98,
+    101,32,99,97,108,108,97,98,108,101,32,40,110,111,116,10,
+    32,32,32,32,32,32,32,32,101,118,101,110,32,118,105,97,
+    32,115,117,112,101,114,40,41,41,46,10,10,32,32,32,32,
+    32,32,32,32,99,4,0,0,0,0,0,0,0,5,0,0,
+    0,6,0,0,0,3,0,0,0,115,30,0,0,0,116,0,
+    131,0,160,1,124,0,124,1,124,2,124,3,161,4,125,4,
+    116,2,124,4,131,1,1,0,124,4,83,0,41,1,78,41,
+    3,114,5,0,0,0,218,7,95,95,110,101,119,95,95,114,
+    19,0,0,0,41,5,90,4,109,99,108,115,218,4,110,97,
+    109,101,90,5,98,97,115,101,115,90,9,110,97,109,101,115,
+    112,97,99,101,218,3,99,108,115,41,1,114,9,0,0,0,
+    114,1,0,0,0,114,2,0,0,0,114,28,0,0,0,130,
+    0,0,0,115,6,0,0,0,0,1,18,1,8,1,122,15,
+    65,66,67,77,101,116,97,46,95,95,110,101,119,95,95,99,
+    2,0,0,0,0,0,0,0,2,0,0,0,3,0,0,0,
+    67,0,0,0,115,10,0,0,0,116,0,124,0,124,1,131,
+    2,83,0,41,1,122,123,82,101,103,105,115,116,101,114,32,
+    97,32,118,105,114,116,117,97,108,32,115,117,98,99,108,97,
+    115,115,32,111,102,32,97,110,32,65,66,67,46,10,10,32,
+    32,32,32,32,32,32,32,32,32,32,32,82,101,116,117,114,
+    110,115,32,116,104,101,32,115,117,98,99,108,97,115,115,44,
+    32,116,111,32,97,108,108,111,119,32,117,115,97,103,101,32,
+    97,115,32,97,32,99,108,97,115,115,32,100,101,99,111,114,
+    97,116,111,114,46,10,32,32,32,32,32,32,32,32,32,32,
+    32,32,41,1,114,20,0,0,0,41,2,114,30,0,0,0,
+    218,8,115,117,98,99,108,97,115,115,114,1,0,0,0,114,
+    1,0,0,0,114,2,0,0,0,218,8,114,101,103,105,115,
+    116,101,114,135,0,0,0,115,2,0,0,0,0,5,122,16,
+    65,66,67,77,101,116,97,46,114,101,103,105,115,116,101,114,
+    99,2,0,0,0,0,0,0,0,2,0,0,0,3,0,0,
+    0,67,0,0,0,115,10,0,0,0,116,0,124,0,124,1,
+    131,2,83,0,41,1,122,39,79,118,101,114,114,105,100,101,
+    32,102,111,114,32,105,115,105,110,115,116,97,110,99,101,40,
+    105,110,115,116,97,110,99,101,44,32,99,108,115,41,46,41,
+    1,114,21,0,0,0,41,2,114,30,0,0,0,90,8,105,
+    110,115,116,97,110,99,101,114,1,0,0,0,114,1,0,0,
+    0,114,2,0,0,0,218,17,95,95,105,110,115,116,97,110,
+    99,101,99,104,101,99,107,95,95,142,0,0,0,115,2,0,
+    0,0,0,2,122,25,65,66,67,77,101,116,97,46,95,95,
+    105,110,115,116,97,110,99,101,99,104,101,99,107,95,95,99,
+    2,0,0,0,0,0,0,0,2,0,0,0,3,0,0,0,
+    67,0,0,0,115,10,0,0,0,116,0,124,0,124,1,131,
+    2,83,0,41,1,122,39,79,118,101,114,114,105,100,101,32,
+    102,111,114,32,105,115,115,117,98,99,108,97,115,115,40,115,
+    117,98,99,108,97,115,115,44,32,99,108,115,41,46,41,1,
+    114,22,0,0,0,41,2,114,30,0,0,0,114,31,0,0,
+    0,114,1,0,0,0,114,1,0,0,0,114,2,0,0,0,
+    218,17,95,95,115,117,98,99,108,97,115,115,99,104,101,99,
+    107,95,95,146,0,0,0,115,2,0,0,0,0,2,122,25,
+    65,66,67,77,101,116,97,46,95,95,115,117,98,99,108,97,
+    115,115,99,104,101,99,107,95,95,78,99,2,0,0,0,0,
+    0,0,0,6,0,0,0,4,0,0,0,67,0,0,0,115,
+    134,0,0,0,116,0,100,1,124,0,106,1,124,0,106,2,
+    102,2,22,0,124,1,100,2,141,2,1,0,116,0,100,3,
+    116,3,131,0,22,0,124,1,100,2,141,2,1,0,116,4,
+    124,0,131,1,92,4,125,2,125,3,125,4,125,5,116,0,
+    100,4,124,2,102,1,22,0,124,1,100,2,141,2,1,0,
+    116,0,100,5,124,3,102,1,22,0,124,1,100,2,141,2,
+    1,0,116,0,100,6,124,4,102,1,22,0,124,1,100,2,
+    141,2,1,0,116,0,100,7,124,5,102,1,22,0,124,1,
+    100,2,141,2,1,0,100,8,83,0,41,9,122,39,68,101,
+    98,117,103,32,104,101,108,112,101,114,32,116,111,32,112,114,
+    105,110,116,32,116,104,101,32,65,66,67,32,114,101,103,105,
+    115,116,114,121,46,122,12,67,108,97,115,115,58,32,37,115,
+    46,37,115,41,1,218,4,102,105,108,101,122,15,73,110,118,
+    46,99,111,117,110,116,101,114,58,32,37,115,122,17,95,97,
+    98,99,95,114,101,103,105,115,116,114,121,58,32,37,114,122,
+    14,95,97,98,99,95,99,97,99,104,101,58,32,37,114,122,
+    23,95,97,98,99,95,110,101,103,97,116,105,118,101,95,99,
+    97,99,104,101,58,32,37,114,122,31,95,97,98,99,95,110,
+    101,103,97,116,105,118,101,95,99,97,99,104,101,95,118,101,
+    114,115,105,111,110,58,32,37,114,78,41,5,218,5,112,114,
+    105,110,116,114,11,0,0,0,114,12,0,0,0,114,18,0,
+    0,0,114,23,0,0,0,41,6,114,30,0,0,0,114,35,
+    0,0,0,90,13,95,97,98,99,95,114,101,103,105,115,116,
+    114,121,90,10,95,97,98,99,95,99,97,99,104,101,90,19,
+    95,97,98,99,95,110,101,103,97,116,105,118,101,95,99,97,
+    99,104,101,90,27,95,97,98,99,95,110,101,103,97,116,105,
+    118,101,95,99,97,99,104,101,95,118,101,114,115,105,111,110,
+    114,1,0,0,0,114,1,0,0,0,114,2,0,0,0,218,
+    14,95,100,117,109,112,95,114,101,103,105,115,116,114,121,150,
+    0,0,0,115,20,0,0,0,0,2,16,1,8,1,18,2,
+    16,1,18,1,18,1,10,1,8,1,4,1,122,22,65,66,
+    67,77,101,116,97,46,95,100,117,109,112,95,114,101,103,105,
+    115,116,114,121,99,1,0,0,0,0,0,0,0,1,0,0,
+    0,2,0,0,0,67,0,0,0,115,12,0,0,0,116,0,
+    124,0,131,1,1,0,100,1,83,0,41,2,122,46,67,108,
+    101,97,114,32,116,104,101,32,114,101,103,105,115,116,114,121,
+    32,40,102,111,114,32,100,101,98,117,103,103,105,110,103,32,
+    111,114,32,116,101,115,116,105,110,103,41,46,78,41,1,114,
+    24,0,0,0,41,1,114,30,0,0,0,114,1,0,0,0,
+    114,1,0,0,0,114,2,0,0,0,218,19,95,97,98,99,
+    95,114,101,103,105,115,116,114,121,95,99,108,101,97,114,164,
+    0,0,0,115,2,0,0,0,0,2,122,27,65,66,67,77,
+    101,116,97,46,95,97,98,99,95,114,101,103,105,115,116,114,
+    121,95,99,108,101,97,114,99,1,0,0,0,0,0,0,0,
+    1,0,0,0,2,0,0,0,67,0,0,0,115,12,0,0,
+    0,116,0,124,0,131,1,1,0,100,1,83,0,41,2,122,
+    44,67,108,101,97,114,32,116,104,101,32,99,97,99,104,101,
+    115,32,40,102,111,114,32,100,101,98,117,103,103,105,110,103,
+    32,111,114,32,116,101,115,116,105,110,103,41,46,78,41,1,
+    114,25,0,0,0,41,1,114,30,0,0,0,114,1,0,0,
+    0,114,1,0,0,0,114,2,0,0,0,218,17,95,97,98,
+    99,95,99,97,99,104,101,115,95,99,108,101,97,114,168,0,
+    0,0,115,2,0,0,0,0,2,122,25,65,66,67,77,101,
+    116,97,46,95,97,98,99,95,99,97,99,104,101,115,95,99,
+    108,101,97,114,99,2,0,0,0,0,0,0,0,2,0,0,
+    0,3,0,0,0,67,0,0,0,115,14,0,0,0,116,0,
+    124,0,124,1,131,2,1,0,100,1,83,0,41,2,122,43,
+    77,97,107,101,32,99,108,115,32,117,115,101,32,116,104,101,
+    32,114,101,103,105,115,116,114,121,32,111,102,32,116,104,101,
+    32,65,66,67,32,111,116,104,101,114,46,78,41,1,114,26,
+    0,0,0,41,2,114,30,0,0,0,90,5,111,116,104,101,
+    114,114,1,0,0,0,114,1,0,0,0,114,2,0,0,0,
+    218,19,95,97,98,99,95,114,101,103,105,115,116,114,121,95,
+    115,104,97,114,101,172,0,0,0,115,2,0,0,0,0,2,
+    122,27,65,66,67,77,101,116,97,46,95,97,98,99,95,114,
+    101,103,105,115,116,114,121,95,115,104,97,114,101,41,1,78,
+    41,13,114,10,0,0,0,114,11,0,0,0,114,12,0,0,
+    0,114,13,0,0,0,114,28,0,0,0,114,32,0,0,0,
+    114,33,0,0,0,114,34,0,0,0,114,37,0,0,0,114,
+    38,0,0,0,114,39,0,0,0,114,40,0,0,0,114,14,
+    0,0,0,114,1,0,0,0,114,1,0,0,0,41,1,114,
+    9,0,0,0,114,2,0,0,0,114,27,0,0,0,115,0,
+    0,0,115,18,0,0,0,8,13,4,2,12,5,8,7,8,
+    4,8,4,10,14,8,4,8,4,114,27,0,0,0,99,0,
+    0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,64,
+    0,0,0,115,16,0,0,0,101,0,90,1,100,0,90,2,
+    100,1,90,3,100,2,83,0,41,3,218,3,65,66,67,122,
+    86,72,101,108,112,101,114,32,99,108,97,115,115,32,116,104,
+    97,116,32,112,114,111,118,105,100,101,115,32,97,32,115,116,
+    97,110,100,97,114,100,32,119,97,121,32,116,111,32,99,114,
+    101,97,116,101,32,97,110,32,65,66,67,32,117,115,105,110,
+    103,10,32,32,32,32,105,110,104,101,114,105,116,97,110,99,
+    101,46,10,32,32,32,32,78,41,4,114,10,0,0,0,114,
+    11,0,0,0,114,12,0,0,0,114,13,0,0,0,114,1,
+    0,0,0,114,1,0,0,0,114,1,0,0,0,114,2,0,
+    0,0,114,41,0,0,0,177,0,0,0,115,4,0,0,0,
+    8,3,4,1,114,41,0,0,0,41,1,90,9,109,101,116,
+    97,99,108,97,115,115,78,41,24,114,13,0,0,0,114,3,
+    0,0,0,218,11,99,108,97,115,115,109,101,116,104,111,100,
+    114,4,0,0,0,218,12,115,116,97,116,105,99,109,101,116,
+    104,111,100,114,15,0,0,0,218,8,112,114,111,112,101,114,
+    116,121,114,16,0,0,0,90,4,95,97,98,99,114,18,0,
+    0,0,114,19,0,0,0,114,20,0,0,0,114,21,0,0,
+    0,114,22,0,0,0,114,23,0,0,0,114,24,0,0,0,
+    114,25,0,0,0,114,26,0,0,0,218,11,73,109,112,111,
+    114,116,69,114,114,111,114,90,7,95,112,121,95,97,98,99,
+    114,27,0,0,0,114,11,0,0,0,218,4,116,121,112,101,
+    114,41,0,0,0,114,1,0,0,0,114,1,0,0,0,114,
+    1,0,0,0,114,2,0,0,0,218,8,60,109,111,100,117,
+    108,101,62,4,0,0,0,115,22,0,0,0,4,3,8,20,
+    16,24,16,24,16,32,2,1,48,3,14,1,16,1,12,2,
+    16,62,
+};
+static const unsigned char _Py_M__codecs[] = {
+    99,0,0,0,0,0,0,0,0,0,0,0,0,58,0,0,
+    0,64,0,0,0,115,162,2,0,0,100,0,90,0,100,1,
+    100,2,108,1,90,1,100,1,100,2,108,2,90,2,121,12,
+    100,1,100,3,108,3,84,0,87,0,110,46,4,0,101,4,
+    107,10,114,78,1,0,90,5,1,0,122,18,101,6,100,4,
+    101,5,22,0,131,1,130,1,87,0,89,0,100,2,100,2,
+    90,5,91,5,88,0,110,2,88,0,100,5,100,6,100,7,
+    100,8,100,9,100,10,100,11,100,12,100,13,100,14,100,15,
+    100,16,100,17,100,18,100,19,100,20,100,21,100,22,100,23,
+    100,24,100,25,100,26,100,27,100,28,100,29,100,30,100,31,
+    100,32,100,33,100,34,100,35,100,36,100,37,100,38,100,39,
+    100,40,100,41,100,42,100,43,100,44,100,45,100,46,100,47,
+    100,48,103,44,90,7,100,49,90,8,100,50,4,0,90,9,
+    90,10,100,51,4,0,90,11,90,12,100,52,90,13,100,53,
+    90,14,101,2,106,15,100,54,107,2,114,224,101,10,4,0,
+    90,16,90,17,101,13,90,18,110,12,101,12,4,0,90,16,
+    90,17,101,14,90,18,101,10,90,19,101,12,90,20,101,13,
+    90,21,101,14,90,22,71,0,100,55,100,23,132,0,100,23,
+    101,23,131,3,90,24,71,0,100,56,100,24,132,0,100,24,
+    131,2,90,25,71,0,100,57,100,25,132,0,100,25,101,26,
+    131,3,90,27,71,0,100,58,100,59,132,0,100,59,101,27,
+    131,3,90,28,71,0,100,60,100,26,132,0,100,26,101,26,
+    131,3,90,29,71,0,100,61,100,62,132,0,100,62,101,29,
+    131,3,90,30,71,0,100,63,100,28,132,0,100,28,101,25,
+    131,3,90,31,71,0,100,64,100,27,132,0,100,27,101,25,
+    131,3,90,32,71,0,100,65,100,29,132,0,100,29,131,2,
+    90,33,71,0,100,66,100,30,132,0,100,30,131,2,90,34,
+    100,92,100,70,100,7,132,1,90,35,100,93,100,71,100,8,
+    132,1,90,36,100,72,100,31,132,0,90,37,100,73,100,32,
+    132,0,90,38,100,74,100,33,132,0,90,39,100,75,100,34,
+    132,0,90,40,100,76,100,35,132,0,90,41,100,77,100,36,
+    132,0,90,42,100,94,100,78,100,39,132,1,90,43,100,95,
+    100,79,100,40,132,1,90,44,100,80,100,81,132,0,90,45,
+    100,82,100,83,132,0,90,46,121,52,101,47,100,68,131,1,
+    90,48,101,47,100,84,131,1,90,49,101,47,100,85,131,1,
+    90,50,101,47,100,86,131,1,90,51,101,47,100,87,131,1,
+    90,52,101,47,100,88,131,1,90,53,87,0,110,46,4,0,
+    101,54,107,10,144,2,114,96,1,0,1,0,1,0,100,2,
+    90,48,100,2,90,49,100,2,90,50,100,2,90,51,100,2,
+    90,52,100,2,90,53,89,0,110,2,88,0,100,1,90,55,
+    101,55,144,2,114,116,100,1,100,2,108,56,90,56,101,57,
+    100,89,107,2,144,2,114,158,101,36,101,2,106,58,100,90,
+    100,91,131,3,101,2,95,58,101,36,101,2,106,59,100,91,
+    100,90,131,3,101,2,95,59,100,2,83,0,41,96,122,158,
+    32,99,111,100,101,99,115,32,45,45,32,80,121,116,104,111,
+    110,32,67,111,100,101,99,32,82,101,103,105,115,116,114,121,
+    44,32,65,80,73,32,97,110,100,32,104,101,108,112,101,114,
+    115,46,10,10,10,87,114,105,116,116,101,110,32,98,121,32,
+    77,97,114,99,45,65,110,100,114,101,32,76,101,109,98,117,
+    114,103,32,40,109,97,108,64,108,101,109,98,117,114,103,46,
+    99,111,109,41,46,10,10,40,99,41,32,67,111,112,121,114,
+    105,103,104,116,32,67,78,82,73,44,32,65,108,108,32,82,
+    105,103,104,116,115,32,82,101,115,101,114,118,101,100,46,32,
+    78,79,32,87,65,82,82,65,78,84,89,46,10,10,233,0,
+    0,0,0,78,41,1,218,1,42,122,37,70,97,105,108,101,
+    100,32,116,111,32,108,111,97,100,32,116,104,101,32,98,117,
+    105,108,116,105,110,32,99,111,100,101,99,115,58,32,37,115,
+    90,8,114,101,103,105,115,116,101,114,218,6,108,111,111,107,
+    117,112,218,4,111,112,101,110,218,11,69,110,99,111,100,101,
+    100,70,105,108,101,218,3,66,79,77,218,6,66,79,77,95,
+    66,69,218,6,66,79,77,95,76,69,218,8,66,79,77,51,
+    50,95,66,69,218,8,66,79,77,51,50,95,76,69,218,8,
+    66,79,77,54,52,95,66,69,218,8,66,79,77,54,52,95,
+    76,69,218,8,66,79,77,95,85,84,70,56,218,9,66,79,
+    77,95,85,84,70,49,54,218,12,66,79,77,95,85,84,70,
+    49,54,95,76,69,218,12,66,79,77,95,85,84,70,49,54,
+    95,66,69,218,9,66,79,77,95,85,84,70,51,50,218,12,
+    66,79,77,95,85,84,70,51,50,95,76,69,218,12,66,79,
+    77,95,85,84,70,51,50,95,66,69,218,9,67,111,100,101,
+    99,73,110,102,111,218,5,67,111,100,101,99,218,18,73,110,
+    99,114,101,109,101,110,116,97,108,69,110,99,111,100,101,114,
+    218,18,73,110,99,114,101,109,101,110,116,97,108,68,101,99,
+    111,100,101,114,218,12,83,116,114,101,97,109,82,101,97,100,
+    101,114,218,12,83,116,114,101,97,109,87,114,105,116,101,114,
+    218,18,83,116,114,101,97,109,82,101,97,100,101,114,87,114,
+    105,116,101,114,218,13,83,116,114,101,97,109,82,101,99,111,
+    100,101,114,218,10,103,101,116,101,110,99,111,100,101,114,218,
+    10,103,101,116,100,101,99,111,100,101,114,218,21,103,101,116,
+    105,110,99,114,101,109,101,110,116,97,108,101,110,99,111,100,
+    101,114,218,21,103,101,116,105,110,99,114,101,109,101,110,116,
+    97,108,100,101,99,111,100,101,114,218,9,103,101,116,114,101,
+    97,100,101,114,218,9,103,101,116,119,114,105,116,101,114,218,
+    6,101,110,99,111,100,101,218,6,100,101,99,111,100,101,218,
+    10,105,116,101,114,101,110,99,111,100,101,218,10,105,116,101,
+    114,100,101,99,111,100,101,218,13,115,116,114,105,99,116,95,
+    101,114,114,111,114,115,218,13,105,103,110,111,114,101,95,101,
+    114,114,111,114,115,218,14,114,101,112,108,97,99,101,95,101,
+    114,114,111,114,115,218,24,120,109,108,99,104,97,114,114,101,
+    102,114,101,112,108,97,99,101,95,101,114,114,111,114,115,218,
+    23,98,97,99,107,115,108,97,115,104,114,101,112,108,97,99,
+    101,95,101,114,114,111,114,115,218,18,110,97,109,101,114,101,
+    112,108,97,99,101,95,101,114,114,111,114,115,90,14,114,101,
+    103,105,115,116,101,114,95,101,114,114,111,114,218,12,108,111,
+    111,107,117,112,95,101,114,114,111,114,115,3,0,0,0,239,
+    187,191,115,2,0,0,0,255,254,115,2,0,0,0,254,255,
+    115,4,0,0,0,255,254,0,0,115,4,0,0,0,0,0,
+    254,255,90,6,108,105,116,116,108,101,99,0,0,0,0,0,
+    0,0,0,0,0,0,0,5,0,0,0,64,0,0,0,115,
+    44,0,0,0,101,0,90,1,100,0,90,2,100,1,90,3,
+    100,2,90,4,100,9,100,3,100,4,156,1,100,5,100,6,
+    132,3,90,5,100,7,100,8,132,0,90,6,100,3,83,0,
+    41,10,114,19,0,0,0,122,48,67,111,100,101,99,32,100,
+    101,116,97,105,108,115,32,119,104,101,110,32,108,111,111,107,
+    105,110,103,32,117,112,32,116,104,101,32,99,111,100,101,99,
+    32,114,101,103,105,115,116,114,121,84,78,41,1,218,17,95,
+    105,115,95,116,101,120,116,95,101,110,99,111,100,105,110,103,
+    99,8,0,0,0,1,0,0,0,10,0,0,0,7,0,0,
+    0,67,0,0,0,115,80,0,0,0,116,0,160,1,124,0,
+    124,1,124,2,124,3,124,4,102,4,161,2,125,9,124,7,
+    124,9,95,2,124,1,124,9,95,3,124,2,124,9,95,4,
+    124,5,124,9,95,5,124,6,124,9,95,6,124,4,124,9,
+    95,7,124,3,124,9,95,8,124,8,100,0,107,9,114,76,
+    124,8,124,9,95,9,124,9,83,0,41,1,78,41,10,218,
+    5,116,117,112,108,101,218,7,95,95,110,101,119,95,95,218,
+    4,110,97,109,101,114,33,0,0,0,114,34,0,0,0,218,
+    18,105,110,99,114,101,109,101,110,116,97,108,101,110,99,111,
+    100,101,114,218,18,105,110,99,114,101,109,101,110,116,97,108,
+    100,101,99,111,100,101,114,218,12,115,116,114,101,97,109,119,
+    114,105,116,101,114,218,12,115,116,114,101,97,109,114,101,97,
+    100,101,114,114,44,0,0,0,41,10,90,3,99,108,115,114,
+    33,0,0,0,114,34,0,0,0,114,51,0,0,0,114,50,
+    0,0,0,114,48,0,0,0,114,49,0,0,0,114,47,0,
+    0,0,114,44,0,0,0,218,4,115,101,108,102,169,0,114,
+    53,0,0,0,250,18,60,115,116,100,108,105,98,62,47,99,
+    111,100,101,99,115,46,112,121,114,46,0,0,0,93,0,0,
+    0,115,22,0,0,0,0,3,20,1,6,1,6,1,6,1,
+    6,1,6,1,6,1,6,1,8,1,6,1,122,17,67,111,
+    100,101,99,73,110,102,111,46,95,95,110,101,119,95,95,99,
+    1,0,0,0,0,0,0,0,1,0,0,0,6,0,0,0,
+    67,0,0,0,115,30,0,0,0,100,1,124,0,106,0,106,
+    1,124,0,106,0,106,2,124,0,106,3,116,4,124,0,131,
+    1,102,4,22,0,83,0,41,2,78,122,37,60,37,115,46,
+    37,115,32,111,98,106,101,99,116,32,102,111,114,32,101,110,
+    99,111,100,105,110,103,32,37,115,32,97,116,32,37,35,120,
+    62,41,5,218,9,95,95,99,108,97,115,115,95,95,218,10,
+    95,95,109,111,100,117,108,101,95,95,218,12,95,95,113,117,
+    97,108,110,97,109,101,95,95,114,47,0,0,0,218,2,105,
+    100,41,1,114,52,0,0,0,114,53,0,0,0,114,53,0,
+    0,0,114,54,0,0,0,218,8,95,95,114,101,112,114,95,
+    95,108,0,0,0,115,6,0,0,0,0,1,2,1,12,1,
+    122,18,67,111,100,101,99,73,110,102,111,46,95,95,114,101,
+    112,114,95,95,41,5,78,78,78,78,78,41,7,218,8,95,
+    95,110,97,109,101,95,95,114,56,0,0,0,114,57,0,0,
+    0,218,7,95,95,100,111,99,95,95,114,44,0,0,0,114,
+    46,0,0,0,114,59,0,0,0,114,53,0,0,0,114,53,
+    0,0,0,114,53,0,0,0,114,54,0,0,0,114,19,0,
+    0,0,82,0,0,0,115,12,0,0,0,8,1,4,8,4,
+    2,0,1,2,1,14,13,99,0,0,0,0,0,0,0,0,
+    0,0,0,0,3,0,0,0,64,0,0,0,115,36,0,0,
+    0,101,0,90,1,100,0,90,2,100,1,90,3,100,8,100,
+    3,100,4,132,1,90,4,100,9,100,5,100,6,132,1,90,
+    5,100,7,83,0,41,10,114,20,0,0,0,97,57,4,0,
+    0,32,68,101,102,105,110,101,115,32,116,104,101,32,105,110,
+    116,101,114,102,97,99,101,32,102,111,114,32,115,116,97,116,
+    101,108,101,115,115,32,101,110,99,111,100,101,114,115,47,100,
+    101,99,111,100,101,114,115,46,10,10,32,32,32,32,32,32,
+    32,32,84,104,101,32,46,101,110,99,111,100,101,40,41,47,
+    46,100,101,99,111,100,101,40,41,32,109,101,116,104,111,100,
+    115,32,109,97,121,32,117,115,101,32,100,105,102,102,101,114,
+    101,110,116,32,101,114,114,111,114,10,32,32,32,32,32,32,
+    32,32,104,97,110,100,108,105,110,103,32,115,99,104,101,109,
+    101,115,32,98,121,32,112,114,111,118,105,100,105,110,103,32,
+    116,104,101,32,101,114,114,111,114,115,32,97,114,103,117,109,
+    101,110,116,46,32,84,104,101,115,101,10,32,32,32,32,32,
+    32,32,32,115,116,114,105,110,103,32,118,97,108,117,101,115,
+    32,97,114,101,32,112,114,101,100,101,102,105,110,101,100,58,
+    10,10,32,32,32,32,32,32,32,32,32,39,115,116,114,105,
+    99,116,39,32,45,32,114,97,105,115,101,32,97,32,86,97,
+    108,117,101,69,114,114,111,114,32,101,114,114,111,114,32,40,
+    111,114,32,97,32,115,117,98,99,108,97,115,115,41,10,32,
+    32,32,32,32,32,32,32,32,39,105,103,110,111,114,101,39,
+    32,45,32,105,103,110,111,114,101,32,116,104,101,32,99,104,
+    97,114,97,99,116,101,114,32,97,110,100,32,99,111,110,116,
+    105,110,117,101,32,119,105,116,104,32,116,104,101,32,110,101,
+    120,116,10,32,32,32,32,32,32,32,32,32,39,114,101,112,
+    108,97,99,101,39,32,45,32,114,101,112,108,97,99,101,32,
+    119,105,116,104,32,97,32,115,117,105,116,97,98,108,101,32,
+    114,101,112,108,97,99,101,109,101,110,116,32,99,104,97,114,
+    97,99,116,101,114,59,10,32,32,32,32,32,32,32,32,32,
+    32,32,32,32,32,32,32,32,32,32,32,80,121,116,104,111,
+    110,32,119,105,108,108,32,117,115,101,32,116,104,101,32,111,
+    102,102,105,99,105,97,108,32,85,43,70,70,70,68,32,82,
+    69,80,76,65,67,69,77,69,78,84,10,32,32,32,32,32,
+    32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,67,
+    72,65,82,65,67,84,69,82,32,102,111,114,32,116,104,101,
+    32,98,117,105,108,116,105,110,32,85,110,105,99,111,100,101,
+    32,99,111,100,101,99,115,32,111,110,10,32,32,32,32,32,
+    32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,100,
+    101,99,111,100,105,110,103,32,97,110,100,32,39,63,39,32,
+    111,110,32,101,110,99,111,100,105,110,103,46,10,32,32,32,
+    32,32,32,32,32,32,39,115,117,114,114,111,103,97,116,101,
+    101,115,99,97,112,101,39,32,45,32,114,101,112,108,97,99,
+    101,32,119,105,116,104,32,112,114,105,118,97,116,101,32,99,
+    111,100,101,32,112,111,105,110,116,115,32,85,43,68,67,110,
+    110,46,10,32,32,32,32,32,32,32,32,32,39,120,109,108,
+    99,104,97,114,114,101,102,114,101,112,108,97,99,101,39,32,
+    45,32,82,101,112,108,97,99,101,32,119,105,116,104,32,116,
+    104,101,32,97,112,112,114,111,112,114,105,97,116,101,32,88,
+    77,76,10,32,32,32,32,32,32,32,32,32,32,32,32,32,
+    32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,
+    32,32,99,104,97,114,97,99,116,101,114,32,114,101,102,101,
+    114,101,110,99,101,32,40,111,110,108,121,32,102,111,114,32,
+    101,110,99,111,100,105,110,103,41,46,10,32,32,32,32,32,
+    32,32,32,32,39,98,97,99,107,115,108,97,115,104,114,101,
+    112,108,97,99,101,39,32,32,45,32,82,101,112,108,97,99,
+    101,32,119,105,116,104,32,98,97,99,107,115,108,97,115,104,
+    101,100,32,101,115,99,97,112,101,32,115,101,113,117,101,110,
+    99,101,115,46,10,32,32,32,32,32,32,32,32,32,39,110,
+    97,109,101,114,101,112,108,97,99,101,39,32,32,32,32,32,
+    32,32,45,32,82,101,112,108,97,99,101,32,119,105,116,104,
+    32,92,78,123,46,46,46,125,32,101,115,99,97,112,101,32,
+    115,101,113,117,101,110,99,101,115,10,32,32,32,32,32,32,
+    32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,
+    32,32,32,32,32,32,32,32,32,40,111,110,108,121,32,102,
+    111,114,32,101,110,99,111,100,105,110,103,41,46,10,10,32,
+    32,32,32,32,32,32,32,84,104,101,32,115,101,116,32,111,
+    102,32,97,108,108,111,119,101,100,32,118,97,108,117,101,115,
+    32,99,97,110,32,98,101,32,101,120,116,101,110,100,101,100,
+    32,118,105,97,32,114,101,103,105,115,116,101,114,95,101,114,
+    114,111,114,46,10,10,32,32,32,32,218,6,115,116,114,105,
+    99,116,99,3,0,0,0,0,0,0,0,3,0,0,0,1,
+    0,0,0,67,0,0,0,115,8,0,0,0,116,0,130,1,
+    100,1,83,0,41,2,97,35,2,0,0,32,69,110,99,111,
+    100,101,115,32,116,104,101,32,111,98,106,101,99,116,32,105,
+    110,112,117,116,32,97,110,100,32,114,101,116,117,114,110,115,
+    32,97,32,116,117,112,108,101,32,40,111,117,116,112,117,116,
+    10,32,32,32,32,32,32,32,32,32,32,32,32,111,98,106,
+    101,99,116,44,32,108,101,110,103,116,104,32,99,111,110,115,
+    117,109,101,100,41,46,10,10,32,32,32,32,32,32,32,32,
+    32,32,32,32,101,114,114,111,114,115,32,100,101,102,105,110,
+    101,115,32,116,104,101,32,101,114,114,111,114,32,104,97,110,
+    100,108,105,110,103,32,116,111,32,97,112,112,108,121,46,32,
+    73,116,32,100,101,102,97,117,108,116,115,32,116,111,10,32,
+    32,32,32,32,32,32,32,32,32,32,32,39,115,116,114,105,
+    99,116,39,32,104,97,110,100,108,105,110,103,46,10,10,32,
+    32,32,32,32,32,32,32,32,32,32,32,84,104,101,32,109,
+    101,116,104,111,100,32,109,97,121,32,110,111,116,32,115,116,
+    111,114,101,32,115,116,97,116,101,32,105,110,32,116,104,101,
+    32,67,111,100,101,99,32,105,110,115,116,97,110,99,101,46,
+    32,85,115,101,10,32,32,32,32,32,32,32,32,32,32,32,
+    32,83,116,114,101,97,109,87,114,105,116,101,114,32,102,111,
+    114,32,99,111,100,101,99,115,32,119,104,105,99,104,32,104,
+    97,118,101,32,116,111,32,107,101,101,112,32,115,116,97,116,
+    101,32,105,110,32,111,114,100,101,114,32,116,111,10,32,32,
+    32,32,32,32,32,32,32,32,32,32,109,97,107,101,32,101,
+    110,99,111,100,105,110,103,32,101,102,102,105,99,105,101,110,
+    116,46,10,10,32,32,32,32,32,32,32,32,32,32,32,32,
+    84,104,101,32,101,110,99,111,100,101,114,32,109,117,115,116,
+    32,98,101,32,97,98,108,101,32,116,111,32,104,97,110,100,
+    108,101,32,122,101,114,111,32,108,101,110,103,116,104,32,105,
+    110,112,117,116,32,97,110,100,10,32,32,32,32,32,32,32,
+    32,32,32,32,32,114,101,116,117,114,110,32,97,110,32,101,
+    109,112,116,121,32,111,98,106,101,99,116,32,111,102,32,116,
+    104,101,32,111,117,116,112,117,116,32,111,98,106,101,99,116,
+    32,116,121,112,101,32,105,110,32,116,104,105,115,10,32,32,
+    32,32,32,32,32,32,32,32,32,32,115,105,116,117,97,116,
+    105,111,110,46,10,10,32,32,32,32,32,32,32,32,78,41,
+    1,218,19,78,111,116,73,109,112,108,101,109,101,110,116,101,
+    100,69,114,114,111,114,41,3,114,52,0,0,0,218,5,105,
+    110,112,117,116,218,6,101,114,114,111,114,115,114,53,0,0,
+    0,114,53,0,0,0,114,54,0,0,0,114,33,0,0,0,
+    137,0,0,0,115,2,0,0,0,0,17,122,12,67,111,100,
+    101,99,46,101,110,99,111,100,101,99,3,0,0,0,0,0,
+    0,0,3,0,0,0,1,0,0,0,67,0,0,0,115,8,
+    0,0,0,116,0,130,1,100,1,83,0,41,2,97,242,2,
+    0,0,32,68,101,99,111,100,101,115,32,116,104,101,32,111,
+    98,106,101,99,116,32,105,110,112,117,116,32,97,110,100,32,
+    114,101,116,117,114,110,115,32,97,32,116,117,112,108,101,32,
+    40,111,117,116,112,117,116,10,32,32,32,32,32,32,32,32,
+    32,32,32,32,111,98,106,101,99,116,44,32,108,101,110,103,
+    116,104,32,99,111,110,115,117,109,101,100,41,46,10,10,32,
+    32,32,32,32,32,32,32,32,32,32,32,105,110,112,117,116,
+    32,109,117,115,116,32,98,101,32,97,110,32,111,98,106,101,
+    99,116,32,119,104,105,99,104,32,112,114,111,118,105,100,101,
+    115,32,116,104,101,32,98,102,95,103,101,116,114,101,97,100,
+    98,117,102,10,32,32,32,32,32,32,32,32,32,32,32,32,
+    98,117,102,102,101,114,32,115,108,111,116,46,32,80,121,116,
+    104,111,110,32,115,116,114,105,110,103,115,44,32,98,117,102,
+    102,101,114,32,111,98,106,101,99,116,115,32,97,110,100,32,
+    109,101,109,111,114,121,10,32,32,32,32,32,32,32,32,32,
+    32,32,32,109,97,112,112,101,100,32,102,105,108,101,115,32,
+    97,114,101,32,101,120,97,109,112,108,101,115,32,111,102,32,
+    111,98,106,101,99,116,115,32,112,114,111,118,105,100,105,110,
+    103,32,116,104,105,115,32,115,108,111,116,46,10,10,32,32,
+    32,32,32,32,32,32,32,32,32,32,101,114,114,111,114,115,
+    32,100,101,102,105,110,101,115,32,116,104,101,32,101,114,114,
+    111,114,32,104,97,110,100,108,105,110,103,32,116,111,32,97,
+    112,112,108,121,46,32,73,116,32,100,101,102,97,117,108,116,
+    115,32,116,111,10,32,32,32,32,32,32,32,32,32,32,32,
+    32,39,115,116,114,105,99,116,39,32,104,97,110,100,108,105,
+    110,103,46,10,10,32,32,32,32,32,32,32,32,32,32,32,
+    32,84,104,101,32,109,101,116,104,111,100,32,109,97,121,32,
+    110,111,116,32,115,116,111,114,101,32,115,116,97,116,101,32,
+    105,110,32,116,104,101,32,67,111,100,101,99,32,105,110,115,
+    116,97,110,99,101,46,32,85,115,101,10,32,32,32,32,32,
+    32,32,32,32,32,32,32,83,116,114,101,97,109,82,101,97,
+    100,101,114,32,102,111,114,32,99,111,100,101,99,115,32,119,
+    104,105,99,104,32,104,97,118,101,32,116,111,32,107,101,101,
+    112,32,115,116,97,116,101,32,105,110,32,111,114,100,101,114,
+    32,116,111,10,32,32,32,32,32,32,32,32,32,32,32,32,
+    109,97,107,101,32,100,101,99,111,100,105,110,103,32,101,102,
+    102,105,99,105,101,110,116,46,10,10,32,32,32,32,32,32,
+    32,32,32,32,32,32,84,104,101,32,100,101,99,111,100,101,
+    114,32,109,117,115,116,32,98,101,32,97,98,108,101,32,116,
+    111,32,104,97,110,100,108,101,32,122,101,114,111,32,108,101,
+    110,103,116,104,32,105,110,112,117,116,32,97,110,100,10,32,
+    32,32,32,32,32,32,32,32,32,32,32,114,101,116,117,114,
+    110,32,97,110,32,101,109,112,116,121,32,111,98,106,101,99,
+    116,32,111,102,32,116,104,101,32,111,117,116,112,117,116,32,
+    111,98,106,101,99,116,32,116,121,112,101,32,105,110,32,116,
+    104,105,115,10,32,32,32,32,32,32,32,32,32,32,32,32,
+    115,105,116,117,97,116,105,111,110,46,10,10,32,32,32,32,
+    32,32,32,32,78,41,1,114,63,0,0,0,41,3,114,52,
+    0,0,0,114,64,0,0,0,114,65,0,0,0,114,53,0,
+    0,0,114,53,0,0,0,114,54,0,0,0,114,34,0,0,
+    0,156,0,0,0,115,2,0,0,0,0,21,122,12,67,111,
+    100,101,99,46,100,101,99,111,100,101,78,41,1,114,62,0,
+    0,0,41,1,114,62,0,0,0,41,6,114,60,0,0,0,
+    114,56,0,0,0,114,57,0,0,0,114,61,0,0,0,114,
+    33,0,0,0,114,34,0,0,0,114,53,0,0,0,114,53,
+    0,0,0,114,53,0,0,0,114,54,0,0,0,114,20,0,
+    0,0,113,0,0,0,115,6,0,0,0,8,23,4,1,10,
+    19,99,0,0,0,0,0,0,0,0,0,0,0,0,3,0,
+    0,0,64,0,0,0,115,60,0,0,0,101,0,90,1,100,
+    0,90,2,100,1,90,3,100,15,100,3,100,4,132,1,90,
+    4,100,16,100,6,100,7,132,1,90,5,100,8,100,9,132,
+    0,90,6,100,10,100,11,132,0,90,7,100,12,100,13,132,
+    0,90,8,100,14,83,0,41,17,114,21,0,0,0,122,232,
+    10,32,32,32,32,65,110,32,73,110,99,114,101,109,101,110,
+    116,97,108,69,110,99,111,100,101,114,32,101,110,99,111,100,
+    101,115,32,97,110,32,105,110,112,117,116,32,105,110,32,109,
+    117,108,116,105,112,108,101,32,115,116,101,112,115,46,32,84,
+    104,101,32,105,110,112,117,116,32,99,97,110,10,32,32,32,
+    32,98,101,32,112,97,115,115,101,100,32,112,105,101,99,101,
+    32,98,121,32,112,105,101,99,101,32,116,111,32,116,104,101,
+    32,101,110,99,111,100,101,40,41,32,109,101,116,104,111,100,
+    46,32,84,104,101,32,73,110,99,114,101,109,101,110,116,97,
+    108,69,110,99,111,100,101,114,10,32,32,32,32,114,101,109,
+    101,109,98,101,114,115,32,116,104,101,32,115,116,97,116,101,
+    32,111,102,32,116,104,101,32,101,110,99,111,100,105,110,103,
+    32,112,114,111,99,101,115,115,32,98,101,116,119,101,101,110,
+    32,99,97,108,108,115,32,116,111,32,101,110,99,111,100,101,
+    40,41,46,10,32,32,32,32,114,62,0,0,0,99,2,0,
+    0,0,0,0,0,0,2,0,0,0,2,0,0,0,67,0,
+    0,0,115,16,0,0,0,124,1,124,0,95,0,100,1,124,
+    0,95,1,100,2,83,0,41,3,122,244,10,32,32,32,32,
+    32,32,32,32,67,114,101,97,116,101,115,32,97,110,32,73,
+    110,99,114,101,109,101,110,116,97,108,69,110,99,111,100,101,
+    114,32,105,110,115,116,97,110,99,101,46,10,10,32,32,32,
+    32,32,32,32,32,84,104,101,32,73,110,99,114,101,109,101,
+    110,116,97,108,69,110,99,111,100,101,114,32,109,97,121,32,
+    117,115,101,32,100,105,102,102,101,114,101,110,116,32,101,114,
+    114,111,114,32,104,97,110,100,108,105,110,103,32,115,99,104,
+    101,109,101,115,32,98,121,10,32,32,32,32,32,32,32,32,
+    112,114,111,118,105,100,105,110,103,32,116,104,101,32,101,114,
+    114,111,114,115,32,107,101,121,119,111,114,100,32,97,114,103,
+    117,109,101,110,116,46,32,83,101,101,32,116,104,101,32,109,
+    111,100,117,108,101,32,100,111,99,115,116,114,105,110,103,10,
+    32,32,32,32,32,32,32,32,102,111,114,32,97,32,108,105,
+    115,116,32,111,102,32,112,111,115,115,105,98,108,101,32,118,
+    97,108,117,101,115,46,10,32,32,32,32,32,32,32,32,218,
+    0,78,41,2,114,65,0,0,0,218,6,98,117,102,102,101,
+    114,41,2,114,52,0,0,0,114,65,0,0,0,114,53,0,
+    0,0,114,53,0,0,0,114,54,0,0,0,218,8,95,95,
+    105,110,105,116,95,95,185,0,0,0,115,4,0,0,0,0,
+    8,6,1,122,27,73,110,99,114,101,109,101,110,116,97,108,
+    69,110,99,111,100,101,114,46,95,95,105,110,105,116,95,95,
+    70,99,3,0,0,0,0,0,0,0,3,0,0,0,1,0,
+    0,0,67,0,0,0,115,8,0,0,0,116,0,130,1,100,
+    1,83,0,41,2,122,65,10,32,32,32,32,32,32,32,32,
+    69,110,99,111,100,101,115,32,105,110,112,117,116,32,97,110,
+    100,32,114,101,116,117,114,110,115,32,116,104,101,32,114,101,
+    115,117,108,116,105,110,103,32,111,98,106,101,99,116,46,10,
+    32,32,32,32,32,32,32,32,78,41,1,114,63,0,0,0,
+    41,3,114,52,0,0,0,114,64,0,0,0,218,5,102,105,
+    110,97,108,114,53,0,0,0,114,53,0,0,0,114,54,0,
+    0,0,114,33,0,0,0,196,0,0,0,115,2,0,0,0,
+    0,4,122,25,73,110,99,114,101,109,101,110,116,97,108,69,
+    110,99,111,100,101,114,46,101,110,99,111,100,101,99,1,0,
+    0,0,0,0,0,0,1,0,0,0,1,0,0,0,67,0,
+    0,0,115,4,0,0,0,100,1,83,0,41,2,122,58,10,
+    32,32,32,32,32,32,32,32,82,101,115,101,116,115,32,116,
+    104,101,32,101,110,99,111,100,101,114,32,116,111,32,116,104,
+    101,32,105,110,105,116,105,97,108,32,115,116,97,116,101,46,
+    10,32,32,32,32,32,32,32,32,78,114,53,0,0,0,41,
+    1,114,52,0,0,0,114,53,0,0,0,114,53,0,0,0,
+    114,54,0,0,0,218,5,114,101,115,101,116,202,0,0,0,
+    115,0,0,0,0,122,24,73,110,99,114,101,109,101,110,116,
+    97,108,69,110,99,111,100,101,114,46,114,101,115,101,116,99,
+    1,0,0,0,0,0,0,0,1,0,0,0,1,0,0,0,
+    67,0,0,0,115,4,0,0,0,100,1,83,0,41,2,122,
+    58,10,32,32,32,32,32,32,32,32,82,101,116,117,114,110,
+    32,116,104,101,32,99,117,114,114,101,110,116,32,115,116,97,
+    116,101,32,111,102,32,116,104,101,32,101,110,99,111,100,101,
+    114,46,10,32,32,32,32,32,32,32,32,114,0,0,0,0,
+    114,53,0,0,0,41,1,114,52,0,0,0,114,53,0,0,
+    0,114,53,0,0,0,114,54,0,0,0,218,8,103,101,116,
+    115,116,97,116,101,207,0,0,0,115,2,0,0,0,0,4,
+    122,27,73,110,99,114,101,109,101,110,116,97,108,69,110,99,
+    111,100,101,114,46,103,101,116,115,116,97,116,101,99,2,0,
+    0,0,0,0,0,0,2,0,0,0,1,0,0,0,67,0,
+    0,0,115,4,0,0,0,100,1,83,0,41,2,122,108,10,
+    32,32,32,32,32,32,32,32,83,101,116,32,116,104,101,32,
+    99,117,114,114,101,110,116,32,115,116,97,116,101,32,111,102,
+    32,116,104,101,32,101,110,99,111,100,101,114,46,32,115,116,
+    97,116,101,32,109,117,115,116,32,104,97,118,101,32,98,101,
+    101,110,10,32,32,32,32,32,32,32,32,114,101,116,117,114,
+    110,101,100,32,98,121,32,103,101,116,115,116,97,116,101,40,
+    41,46,10,32,32,32,32,32,32,32,32,78,114,53,0,0,
+    0,41,2,114,52,0,0,0,218,5,115,116,97,116,101,114,
+    53,0,0,0,114,53,0,0,0,114,54,0,0,0,218,8,
+    115,101,116,115,116,97,116,101,213,0,0,0,115,0,0,0,
+    0,122,27,73,110,99,114,101,109,101,110,116,97,108,69,110,
+    99,111,100,101,114,46,115,101,116,115,116,97,116,101,78,41,
+    1,114,62,0,0,0,41,1,70,41,9,114,60,0,0,0,
+    114,56,0,0,0,114,57,0,0,0,114,61,0,0,0,114,
+    68,0,0,0,114,33,0,0,0,114,70,0,0,0,114,71,
+    0,0,0,114,73,0,0,0,114,53,0,0,0,114,53,0,
+    0,0,114,53,0,0,0,114,54,0,0,0,114,21,0,0,
+    0,179,0,0,0,115,12,0,0,0,8,5,4,1,10,11,
+    10,6,8,5,8,6,99,0,0,0,0,0,0,0,0,0,
+    0,0,0,3,0,0,0,64,0,0,0,115,68,0,0,0,
+    101,0,90,1,100,0,90,2,100,1,90,3,100,17,100,3,
+    100,4,132,1,90,4,100,5,100,6,132,0,90,5,100,18,
+    100,8,100,9,132,1,90,6,100,10,100,11,132,0,90,7,
+    100,12,100,13,132,0,90,8,100,14,100,15,132,0,90,9,
+    100,16,83,0,41,19,218,26,66,117,102,102,101,114,101,100,
+    73,110,99,114,101,109,101,110,116,97,108,69,110,99,111,100,
+    101,114,122,192,10,32,32,32,32,84,104,105,115,32,115,117,
+    98,99,108,97,115,115,32,111,102,32,73,110,99,114,101,109,
+    101,110,116,97,108,69,110,99,111,100,101,114,32,99,97,110,
+    32,98,101,32,117,115,101,100,32,97,115,32,116,104,101,32,
+    98,97,115,101,99,108,97,115,115,32,102,111,114,32,97,110,
+    10,32,32,32,32,105,110,99,114,101,109,101,110,116,97,108,
+    32,101,110,99,111,100,101,114,32,105,102,32,116,104,101,32,
+    101,110,99,111,100,101,114,32,109,117,115,116,32,107,101,101,
+    112,32,115,111,109,101,32,111,102,32,116,104,101,32,111,117,
+    116,112,117,116,32,105,110,32,97,10,32,32,32,32,98,117,
+    102,102,101,114,32,98,101,116,119,101,101,110,32,99,97,108,
+    108,115,32,116,111,32,101,110,99,111,100,101,40,41,46,10,
+    32,32,32,32,114,62,0,0,0,99,2,0,0,0,0,0,
+    0,0,2,0,0,0,4,0,0,0,67,0,0,0,115,22,
+    0,0,0,116,0,160,1,124,0,124,1,161,2,1,0,100,
+    1,124,0,95,2,100,0,83,0,41,2,78,114,66,0,0,
+    0,41,3,114,21,0,0,0,114,68,0,0,0,114,67,0,
+    0,0,41,2,114,52,0,0,0,114,65,0,0,0,114,53,
+    0,0,0,114,53,0,0,0,114,54,0,0,0,114,68,0,
+    0,0,225,0,0,0,115,4,0,0,0,0,1,12,2,122,
+    35,66,117,102,102,101,114,101,100,73,110,99,114,101,109,101,
+    110,116,97,108,69,110,99,111,100,101,114,46,95,95,105,110,
+    105,116,95,95,99,4,0,0,0,0,0,0,0,4,0,0,
+    0,1,0,0,0,67,0,0,0,115,8,0,0,0,116,0,
+    130,1,100,0,83,0,41,1,78,41,1,114,63,0,0,0,
+    41,4,114,52,0,0,0,114,64,0,0,0,114,65,0,0,
+    0,114,69,0,0,0,114,53,0,0,0,114,53,0,0,0,
+    114,54,0,0,0,218,14,95,98,117,102,102,101,114,95,101,
+    110,99,111,100,101,230,0,0,0,115,2,0,0,0,0,3,
+    122,41,66,117,102,102,101,114,101,100,73,110,99,114,101,109,
+    101,110,116,97,108,69,110,99,111,100,101,114,46,95,98,117,
+    102,102,101,114,95,101,110,99,111,100,101,70,99,3,0,0,
+    0,0,0,0,0,6,0,0,0,5,0,0,0,67,0,0,
+    0,115,48,0,0,0,124,0,106,0,124,1,23,0,125,3,
+    124,0,160,1,124,3,124,0,106,2,124,2,161,3,92,2,
+    125,4,125,5,124,3,124,5,100,0,133,2,25,0,124,0,
+    95,0,124,4,83,0,41,1,78,41,3,114,67,0,0,0,
+    114,75,0,0,0,114,65,0,0,0,41,6,114,52,0,0,
+    0,114,64,0,0,0,114,69,0,0,0,218,4,100,97,116,
+    97,218,6,114,101,115,117,108,116,218,8,99,111,110,115,117,
+    109,101,100,114,53,0,0,0,114,53,0,0,0,114,54,0,
+    0,0,114,33,0,0,0,235,0,0,0,115,8,0,0,0,
+    0,2,10,1,20,2,14,1,122,33,66,117,102,102,101,114,
+    101,100,73,110,99,114,101,109,101,110,116,97,108,69,110,99,
+    111,100,101,114,46,101,110,99,111,100,101,99,1,0,0,0,
+    0,0,0,0,1,0,0,0,3,0,0,0,67,0,0,0,
+    115,20,0,0,0,116,0,160,1,124,0,161,1,1,0,100,
+    1,124,0,95,2,100,0,83,0,41,2,78,114,66,0,0,
+    0,41,3,114,21,0,0,0,114,70,0,0,0,114,67,0,
+    0,0,41,1,114,52,0,0,0,114,53,0,0,0,114,53,
+    0,0,0,114,54,0,0,0,114,70,0,0,0,243,0,0,
+    0,115,4,0,0,0,0,1,10,1,122,32,66,117,102,102,
+    101,114,101,100,73,110,99,114,101,109,101,110,116,97,108,69,
+    110,99,111,100,101,114,46,114,101,115,101,116,99,1,0,0,
+    0,0,0,0,0,1,0,0,0,1,0,0,0,67,0,0,
+    0,115,10,0,0,0,124,0,106,0,112,8,100,1,83,0,
+    41,2,78,114,0,0,0,0,41,1,114,67,0,0,0,41,
+    1,114,52,0,0,0,114,53,0,0,0,114,53,0,0,0,
+    114,54,0,0,0,114,71,0,0,0,247,0,0,0,115,2,
+    0,0,0,0,1,122,35,66,117,102,102,101,114,101,100,73,
+    110,99,114,101,109,101,110,116,97,108,69,110,99,111,100,101,
+    114,46,103,101,116,115,116,97,116,101,99,2,0,0,0,0,
+    0,0,0,2,0,0,0,2,0,0,0,67,0,0,0,115,
+    14,0,0,0,124,1,112,6,100,1,124,0,95,0,100,0,
+    83,0,41,2,78,114,66,0,0,0,41,1,114,67,0,0,
+    0,41,2,114,52,0,0,0,114,72,0,0,0,114,53,0,
+    0,0,114,53,0,0,0,114,54,0,0,0,114,73,0,0,
+    0,250,0,0,0,115,2,0,0,0,0,1,122,35,66,117,
+    102,102,101,114,101,100,73,110,99,114,101,109,101,110,116,97,
+    108,69,110,99,111,100,101,114,46,115,101,116,115,116,97,116,
+    101,78,41,1,114,62,0,0,0,41,1,70,41,10,114,60,
+    0,0,0,114,56,0,0,0,114,57,0,0,0,114,61,0,
+    0,0,114,68,0,0,0,114,75,0,0,0,114,33,0,0,
+    0,114,70,0,0,0,114,71,0,0,0,114,73,0,0,0,
+    114,53,0,0,0,114,53,0,0,0,114,53,0,0,0,114,
+    54,0,0,0,114,74,0,0,0,219,0,0,0,115,14,0,
+    0,0,8,5,4,1,10,5,8,5,10,8,8,4,8,3,
+    114,74,0,0,0,99,0,0,0,0,0,0,0,0,0,0,
+    0,0,3,0,0,0,64,0,0,0,115,60,0,0,0,101,
+    0,90,1,100,0,90,2,100,1,90,3,100,15,100,3,100,
+    4,132,1,90,4,100,16,100,6,100,7,132,1,90,5,100,
+    8,100,9,132,0,90,6,100,10,100,11,132,0,90,7,100,
+    12,100,13,132,0,90,8,100,14,83,0,41,17,114,22,0,
+    0,0,122,232,10,32,32,32,32,65,110,32,73,110,99,114,
+    101,109,101,110,116,97,108,68,101,99,111,100,101,114,32,100,
+    101,99,111,100,101,115,32,97,110,32,105,110,112,117,116,32,
+    105,110,32,109,117,108,116,105,112,108,101,32,115,116,101,112,
+    115,46,32,84,104,101,32,105,110,112,117,116,32,99,97,110,
+    10,32,32,32,32,98,101,32,112,97,115,115,101,100,32,112,
+    105,101,99,101,32,98,121,32,112,105,101,99,101,32,116,111,
+    32,116,104,101,32,100,101,99,111,100,101,40,41,32,109,101,
+    116,104,111,100,46,32,84,104,101,32,73,110,99,114,101,109,
+    101,110,116,97,108,68,101,99,111,100,101,114,10,32,32,32,
+    32,114,101,109,101,109,98,101,114,115,32,116,104,101,32,115,
+    116,97,116,101,32,111,102,32,116,104,101,32,100,101,99,111,
+    100,105,110,103,32,112,114,111,99,101,115,115,32,98,101,116,
+    119,101,101,110,32,99,97,108,108,115,32,116,111,32,100,101,
+    99,111,100,101,40,41,46,10,32,32,32,32,114,62,0,0,
+    0,99,2,0,0,0,0,0,0,0,2,0,0,0,2,0,
+    0,0,67,0,0,0,115,10,0,0,0,124,1,124,0,95,
+    0,100,1,83,0,41,2,122,243,10,32,32,32,32,32,32,
+    32,32,67,114,101,97,116,101,32,97,110,32,73,110,99,114,
+    101,109,101,110,116,97,108,68,101,99,111,100,101,114,32,105,
+    110,115,116,97,110,99,101,46,10,10,32,32,32,32,32,32,
+    32,32,84,104,101,32,73,110,99,114,101,109,101,110,116,97,
+    108,68,101,99,111,100,101,114,32,109,97,121,32,117,115,101,
+    32,100,105,102,102,101,114,101,110,116,32,101,114,114,111,114,
+    32,104,97,110,100,108,105,110,103,32,115,99,104,101,109,101,
+    115,32,98,121,10,32,32,32,32,32,32,32,32,112,114,111,
+    118,105,100,105,110,103,32,116,104,101,32,101,114,114,111,114,
+    115,32,107,101,121,119,111,114,100,32,97,114,103,117,109,101,
+    110,116,46,32,83,101,101,32,116,104,101,32,109,111,100,117,
+    108,101,32,100,111,99,115,116,114,105,110,103,10,32,32,32,
+    32,32,32,32,32,102,111,114,32,97,32,108,105,115,116,32,
+    111,102,32,112,111,115,115,105,98,108,101,32,118,97,108,117,
+    101,115,46,10,32,32,32,32,32,32,32,32,78,41,1,114,
+    65,0,0,0,41,2,114,52,0,0,0,114,65,0,0,0,
+    114,53,0,0,0,114,53,0,0,0,114,54,0,0,0,114,
+    68,0,0,0,3,1,0,0,115,2,0,0,0,0,8,122,
+    27,73,110,99,114,101,109,101,110,116,97,108,68,101,99,111,
+    100,101,114,46,95,95,105,110,105,116,95,95,70,99,3,0,
+    0,0,0,0,0,0,3,0,0,0,1,0,0,0,67,0,
+    0,0,115,8,0,0,0,116,0,130,1,100,1,83,0,41,
+    2,122,64,10,32,32,32,32,32,32,32,32,68,101,99,111,
+    100,101,32,105,110,112,117,116,32,97,110,100,32,114,101,116,
+    117,114,110,115,32,116,104,101,32,114,101,115,117,108,116,105,
+    110,103,32,111,98,106,101,99,116,46,10,32,32,32,32,32,
+    32,32,32,78,41,1,114,63,0,0,0,41,3,114,52,0,
+    0,0,114,64,0,0,0,114,69,0,0,0,114,53,0,0,
+    0,114,53,0,0,0,114,54,0,0,0,114,34,0,0,0,
+    13,1,0,0,115,2,0,0,0,0,4,122,25,73,110,99,
+    114,101,109,101,110,116,97,108,68,101,99,111,100,101,114,46,
+    100,101,99,111,100,101,99,1,0,0,0,0,0,0,0,1,
+    0,0,0,1,0,0,0,67,0,0,0,115,4,0,0,0,
+    100,1,83,0,41,2,122,57,10,32,32,32,32,32,32,32,
+    32,82,101,115,101,116,32,116,104,101,32,100,101,99,111,100,
+    101,114,32,116,111,32,116,104,101,32,105,110,105,116,105,97,
+    108,32,115,116,97,116,101,46,10,32,32,32,32,32,32,32,
+    32,78,114,53,0,0,0,41,1,114,52,0,0,0,114,53,
+    0,0,0,114,53,0,0,0,114,54,0,0,0,114,70,0,
+    0,0,19,1,0,0,115,0,0,0,0,122,24,73,110,99,
+    114,101,109,101,110,116,97,108,68,101,99,111,100,101,114,46,
+    114,101,115,101,116,99,1,0,0,0,0,0,0,0,1,0,
+    0,0,2,0,0,0,67,0,0,0,115,4,0,0,0,100,
+    3,83,0,41,4,97,9,2,0,0,10,32,32,32,32,32,
+    32,32,32,82,101,116,117,114,110,32,116,104,101,32,99,117,
+    114,114,101,110,116,32,115,116,97,116,101,32,111,102,32,116,
+    104,101,32,100,101,99,111,100,101,114,46,10,10,32,32,32,
+    32,32,32,32,32,84,104,105,115,32,109,117,115,116,32,98,
+    101,32,97,32,40,98,117,102,102,101,114,101,100,95,105,110,
+    112,117,116,44,32,97,100,100,105,116,105,111,110,97,108,95,
+    115,116,97,116,101,95,105,110,102,111,41,32,116,117,112,108,
+    101,46,10,32,32,32,32,32,32,32,32,98,117,102,102,101,
+    114,101,100,95,105,110,112,117,116,32,109,117,115,116,32,98,
+    101,32,97,32,98,121,116,101,115,32,111,98,106,101,99,116,
+    32,99,111,110,116,97,105,110,105,110,103,32,98,121,116,101,
+    115,32,116,104,97,116,10,32,32,32,32,32,32,32,32,119,
+    101,114,101,32,112,97,115,115,101,100,32,116,111,32,100,101,
+    99,111,100,101,40,41,32,116,104,97,116,32,104,97,118,101,
+    32,110,111,116,32,121,101,116,32,98,101,101,110,32,99,111,
+    110,118,101,114,116,101,100,46,10,32,32,32,32,32,32,32,
+    32,97,100,100,105,116,105,111,110,97,108,95,115,116,97,116,
+    101,95,105,110,102,111,32,109,117,115,116,32,98,101,32,97,
+    32,110,111,110,45,110,101,103,97,116,105,118,101,32,105,110,
+    116,101,103,101,114,10,32,32,32,32,32,32,32,32,114,101,
+    112,114,101,115,101,110,116,105,110,103,32,116,104,101,32,115,
+    116,97,116,101,32,111,102,32,116,104,101,32,100,101,99,111,
+    100,101,114,32,87,73,84,72,79,85,84,32,121,101,116,32,
+    104,97,118,105,110,103,10,32,32,32,32,32,32,32,32,112,
+    114,111,99,101,115,115,101,100,32,116,104,101,32,99,111,110,
+    116,101,110,116,115,32,111,102,32,98,117,102,102,101,114,101,
+    100,95,105,110,112,117,116,46,32,32,73,110,32,116,104,101,
+    32,105,110,105,116,105,97,108,32,115,116,97,116,101,10,32,
+    32,32,32,32,32,32,32,97,110,100,32,97,102,116,101,114,
+    32,114,101,115,101,116,40,41,44,32,103,101,116,115,116,97,
+    116,101,40,41,32,109,117,115,116,32,114,101,116,117,114,110,
+    32,40,98,34,34,44,32,48,41,46,10,32,32,32,32,32,
+    32,32,32,243,0,0,0,0,114,0,0,0,0,41,2,114,
+    79,0,0,0,114,0,0,0,0,114,53,0,0,0,41,1,
+    114,52,0,0,0,114,53,0,0,0,114,53,0,0,0,114,
+    54,0,0,0,114,71,0,0,0,24,1,0,0,115,2,0,
+    0,0,0,12,122,27,73,110,99,114,101,109,101,110,116,97,
+    108,68,101,99,111,100,101,114,46,103,101,116,115,116,97,116,
+    101,99,2,0,0,0,0,0,0,0,2,0,0,0,1,0,
+    0,0,67,0,0,0,115,4,0,0,0,100,1,83,0,41,
+    2,122,182,10,32,32,32,32,32,32,32,32,83,101,116,32,
+    116,104,101,32,99,117,114,114,101,110,116,32,115,116,97,116,
+    101,32,111,102,32,116,104,101,32,100,101,99,111,100,101,114,
+    46,10,10,32,32,32,32,32,32,32,32,115,116,97,116,101,
+    32,109,117,115,116,32,104,97,118,101,32,98,101,101,110,32,
+    114,101,116,117,114,110,101,100,32,98,121,32,103,101,116,115,
+    116,97,116,101,40,41,46,32,32,84,104,101,32,101,102,102,
+    101,99,116,32,111,102,10,32,32,32,32,32,32,32,32,115,
+    101,116,115,116,97,116,101,40,40,98,34,34,44,32,48,41,
+    41,32,109,117,115,116,32,98,101,32,101,113,117,105,118,97,
+    108,101,110,116,32,116,111,32,114,101,115,101,116,40,41,46,
+    10,32,32,32,32,32,32,32,32,78,114,53,0,0,0,41,
+    2,114,52,0,0,0,114,72,0,0,0,114,53,0,0,0,
+    114,53,0,0,0,114,54,0,0,0,114,73,0,0,0,38,
+    1,0,0,115,0,0,0,0,122,27,73,110,99,114,101,109,
+    101,110,116,97,108,68,101,99,111,100,101,114,46,115,101,116,
+    115,116,97,116,101,78,41,1,114,62,0,0,0,41,1,70,
+    41,9,114,60,0,0,0,114,56,0,0,0,114,57,0,0,
+    0,114,61,0,0,0,114,68,0,0,0,114,34,0,0,0,
+    114,70,0,0,0,114,71,0,0,0,114,73,0,0,0,114,
+    53,0,0,0,114,53,0,0,0,114,53,0,0,0,114,54,
+    0,0,0,114,22,0,0,0,253,0,0,0,115,12,0,0,
+    0,8,5,4,1,10,10,10,6,8,5,8,14,99,0,0,
+    0,0,0,0,0,0,0,0,0,0,3,0,0,0,64,0,
+    0,0,115,68,0,0,0,101,0,90,1,100,0,90,2,100,
+    1,90,3,100,17,100,3,100,4,132,1,90,4,100,5,100,
+    6,132,0,90,5,100,18,100,8,100,9,132,1,90,6,100,
+    10,100,11,132,0,90,7,100,12,100,13,132,0,90,8,100,
+    14,100,15,132,0,90,9,100,16,83,0,41,19,218,26,66,
+    117,102,102,101,114,101,100,73,110,99,114,101,109,101,110,116,
+    97,108,68,101,99,111,100,101,114,122,174,10,32,32,32,32,
+    84,104,105,115,32,115,117,98,99,108,97,115,115,32,111,102,
+    32,73,110,99,114,101,109,101,110,116,97,108,68,101,99,111,
+    100,101,114,32,99,97,110,32,98,101,32,117,115,101,100,32,
+    97,115,32,116,104,101,32,98,97,115,101,99,108,97,115,115,
+    32,102,111,114,32,97,110,10,32,32,32,32,105,110,99,114,
+    101,109,101,110,116,97,108,32,100,101,99,111,100,101,114,32,
+    105,102,32,116,104,101,32,100,101,99,111,100,101,114,32,109,
+    117,115,116,32,98,101,32,97,98,108,101,32,116,111,32,104,
+    97,110,100,108,101,32,105,110,99,111,109,112,108,101,116,101,
+    10,32,32,32,32,98,121,116,101,32,115,101,113,117,101,110,
+    99,101,115,46,10,32,32,32,32,114,62,0,0,0,99,2,
+    0,0,0,0,0,0,0,2,0,0,0,4,0,0,0,67,
+    0,0,0,115,22,0,0,0,116,0,160,1,124,0,124,1,
+    161,2,1,0,100,1,124,0,95,2,100,0,83,0,41,2,
+    78,114,79,0,0,0,41,3,114,22,0,0,0,114,68,0,
+    0,0,114,67,0,0,0,41,2,114,52,0,0,0,114,65,
+    0,0,0,114,53,0,0,0,114,53,0,0,0,114,54,0,
+    0,0,114,68,0,0,0,52,1,0,0,115,4,0,0,0,
+    0,1,12,2,122,35,66,117,102,102,101,114,101,100,73,110,
+    99,114,101,109,101,110,116,97,108,68,101,99,111,100,101,114,
+    46,95,95,105,110,105,116,95,95,99,4,0,0,0,0,0,
+    0,0,4,0,0,0,1,0,0,0,67,0,0,0,115,8,
+    0,0,0,116,0,130,1,100,0,83,0,41,1,78,41,1,
+    114,63,0,0,0,41,4,114,52,0,0,0,114,64,0,0,
+    0,114,65,0,0,0,114,69,0,0,0,114,53,0,0,0,
+    114,53,0,0,0,114,54,0,0,0,218,14,95,98,117,102,
+    102,101,114,95,100,101,99,111,100,101,57,1,0,0,115,2,
+    0,0,0,0,3,122,41,66,117,102,102,101,114,101,100,73,
+    110,99,114,101,109,101,110,116,97,108,68,101,99,111,100,101,
+    114,46,95,98,117,102,102,101,114,95,100,101,99,111,100,101,
+    70,99,3,0,0,0,0,0,0,0,6,0,0,0,5,0,
+    0,0,67,0,0,0,115,48,0,0,0,124,0,106,0,124,
+    1,23,0,125,3,124,0,160,1,124,3,124,0,106,2,124,
+    2,161,3,92,2,125,4,125,5,124,3,124,5,100,0,133,
+    2,25,0,124,0,95,0,124,4,83,0,41,1,78,41,3,
+    114,67,0,0,0,114,81,0,0,0,114,65,0,0,0,41,
+    6,114,52,0,0,0,114,64,0,0,0,114,69,0,0,0,
+    114,76,0,0,0,114,77,0,0,0,114,78,0,0,0,114,
+    53,0,0,0,114,53,0,0,0,114,54,0,0,0,114,34,
+    0,0,0,62,1,0,0,115,8,0,0,0,0,2,10,1,
+    20,2,14,1,122,33,66,117,102,102,101,114,101,100,73,110,
+    99,114,101,109,101,110,116,97,108,68,101,99,111,100,101,114,
+    46,100,101,99,111,100,101,99,1,0,0,0,0,0,0,0,
+    1,0,0,0,3,0,0,0,67,0,0,0,115,20,0,0,
+    0,116,0,160,1,124,0,161,1,1,0,100,1,124,0,95,
+    2,100,0,83,0,41,2,78,114,79,0,0,0,41,3,114,
+    22,0,0,0,114,70,0,0,0,114,67,0,0,0,41,1,
+    114,52,0,0,0,114,53,0,0,0,114,53,0,0,0,114,
+    54,0,0,0,114,70,0,0,0,70,1,0,0,115,4,0,
+    0,0,0,1,10,1,122,32,66,117,102,102,101,114,101,100,
+    73,110,99,114,101,109,101,110,116,97,108,68,101,99,111,100,
+    101,114,46,114,101,115,101,116,99,1,0,0,0,0,0,0,
+    0,1,0,0,0,2,0,0,0,67,0,0,0,115,10,0,
+    0,0,124,0,106,0,100,1,102,2,83,0,41,2,78,114,
+    0,0,0,0,41,1,114,67,0,0,0,41,1,114,52,0,
+    0,0,114,53,0,0,0,114,53,0,0,0,114,54,0,0,
+    0,114,71,0,0,0,74,1,0,0,115,2,0,0,0,0,
+    2,122,35,66,117,102,102,101,114,101,100,73,110,99,114,101,
+    109,101,110,116,97,108,68,101,99,111,100,101,114,46,103,101,
+    116,115,116,97,116,101,99,2,0,0,0,0,0,0,0,2,
+    0,0,0,2,0,0,0,67,0,0,0,115,14,0,0,0,
+    124,1,100,1,25,0,124,0,95,0,100,0,83,0,41,2,
+    78,114,0,0,0,0,41,1,114,67,0,0,0,41,2,114,
+    52,0,0,0,114,72,0,0,0,114,53,0,0,0,114,53,
+    0,0,0,114,54,0,0,0,114,73,0,0,0,78,1,0,
+    0,115,2,0,0,0,0,2,122,35,66,117,102,102,101,114,
+    101,100,73,110,99,114,101,109,101,110,116,97,108,68,101,99,
+    111,100,101,114,46,115,101,116,115,116,97,116,101,78,41,1,
+    114,62,0,0,0,41,1,70,41,10,114,60,0,0,0,114,
+    56,0,0,0,114,57,0,0,0,114,61,0,0,0,114,68,
+    0,0,0,114,81,0,0,0,114,34,0,0,0,114,70,0,
+    0,0,114,71,0,0,0,114,73,0,0,0,114,53,0,0,
+    0,114,53,0,0,0,114,53,0,0,0,114,54,0,0,0,
+    114,80,0,0,0,46,1,0,0,115,14,0,0,0,8,5,
+    4,1,10,5,8,5,10,8,8,4,8,4,114,80,0,0,
+    0,99,0,0,0,0,0,0,0,0,0,0,0,0,3,0,
+    0,0,64,0,0,0,115,84,0,0,0,101,0,90,1,100,
+    0,90,2,100,20,100,2,100,3,132,1,90,3,100,4,100,
+    5,132,0,90,4,100,6,100,7,132,0,90,5,100,8,100,
+    9,132,0,90,6,100,21,100,11,100,12,132,1,90,7,101,
+    8,102,1,100,13,100,14,132,1,90,9,100,15,100,16,132,
+    0,90,10,100,17,100,18,132,0,90,11,100,19,83,0,41,
+    22,114,24,0,0,0,114,62,0,0,0,99,3,0,0,0,
+    0,0,0,0,3,0,0,0,2,0,0,0,67,0,0,0,
+    115,16,0,0,0,124,1,124,0,95,0,124,2,124,0,95,
+    1,100,1,83,0,41,2,97,119,3,0,0,32,67,114,101,
+    97,116,101,115,32,97,32,83,116,114,101,97,109,87,114,105,
+    116,101,114,32,105,110,115,116,97,110,99,101,46,10,10,32,
+    32,32,32,32,32,32,32,32,32,32,32,115,116,114,101,97,
+    109,32,109,117,115,116,32,98,101,32,97,32,102,105,108,101,
+    45,108,105,107,101,32,111,98,106,101,99,116,32,111,112,101,
+    110,32,102,111,114,32,119,114,105,116,105,110,103,46,10,10,
+    32,32,32,32,32,32,32,32,32,32,32,32,84,104,101,32,
+    83,116,114,101,97,109,87,114,105,116,101,114,32,109,97,121,
+    32,117,115,101,32,100,105,102,102,101,114,101,110,116,32,101,
+    114,114,111,114,32,104,97,110,100,108,105,110,103,10,32,32,
+    32,32,32,32,32,32,32,32,32,32,115,99,104,101,109,101,
+    115,32,98,121,32,112,114,111,118,105,100,105,110,103,32,116,
+    104,101,32,101,114,114,111,114,115,32,107,101,121,119,111,114,
+    100,32,97,114,103,117,109,101,110,116,46,32,84,104,101,115,
+    101,10,32,32,32,32,32,32,32,32,32,32,32,32,112,97,
+    114,97,109,101,116,101,114,115,32,97,114,101,32,112,114,101,
+    100,101,102,105,110,101,100,58,10,10,32,32,32,32,32,32,
+    32,32,32,32,32,32,32,39,115,116,114,105,99,116,39,32,
+    45,32,114,97,105,115,101,32,97,32,86,97,108,117,101,69,
+    114,114,111,114,32,40,111,114,32,97,32,115,117,98,99,108,
+    97,115,115,41,10,32,32,32,32,32,32,32,32,32,32,32,
+    32,32,39,105,103,110,111,114,101,39,32,45,32,105,103,110,
+    111,114,101,32,116,104,101,32,99,104,97,114,97,99,116,101,
+    114,32,97,110,100,32,99,111,110,116,105,110,117,101,32,119,
+    105,116,104,32,116,104,101,32,110,101,120,116,10,32,32,32,
+    32,32,32,32,32,32,32,32,32,32,39,114,101,112,108,97,
+    99,101,39,45,32,114,101,112,108,97,99,101,32,119,105,116,
+    104,32,97,32,115,117,105,116,97,98,108,101,32,114,101,112,
+    108,97,99,101,109,101,110,116,32,99,104,97,114,97,99,116,
+    101,114,10,32,32,32,32,32,32,32,32,32,32,32,32,32,
+    39,120,109,108,99,104,97,114,114,101,102,114,101,112,108,97,
+    99,101,39,32,45,32,82,101,112,108,97,99,101,32,119,105,
+    116,104,32,116,104,101,32,97,112,112,114,111,112,114,105,97,
+    116,101,32,88,77,76,10,32,32,32,32,32,32,32,32,32,
+    32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,
+    32,32,32,32,32,32,32,32,32,32,99,104,97,114,97,99,
+    116,101,114,32,114,101,102,101,114,101,110,99,101,46,10,32,
+    32,32,32,32,32,32,32,32,32,32,32,32,39,98,97,99,
+    107,115,108,97,115,104,114,101,112,108,97,99,101,39,32,32,
+    45,32,82,101,112,108,97,99,101,32,119,105,116,104,32,98,
+    97,99,107,115,108,97,115,104,101,100,32,101,115,99,97,112,
+    101,10,32,32,32,32,32,32,32,32,32,32,32,32,32,32,
+    32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,
+    32,32,32,32,32,115,101,113,117,101,110,99,101,115,46,10,
+    32,32,32,32,32,32,32,32,32,32,32,32,32,39,110,97,
+    109,101,114,101,112,108,97,99,101,39,32,32,32,32,32,32,
+    32,45,32,82,101,112,108,97,99,101,32,119,105,116,104,32,
+    92,78,123,46,46,46,125,32,101,115,99,97,112,101,32,115,
+    101,113,117,101,110,99,101,115,46,10,10,32,32,32,32,32,
+    32,32,32,32,32,32,32,84,104,101,32,115,101,116,32,111,
+    102,32,97,108,108,111,119,101,100,32,112,97,114,97,109,101,
+    116,101,114,32,118,97,108,117,101,115,32,99,97,110,32,98,
+    101,32,101,120,116,101,110,100,101,100,32,118,105,97,10,32,
+    32,32,32,32,32,32,32,32,32,32,32,114,101,103,105,115,
+    116,101,114,95,101,114,114,111,114,46,10,32,32,32,32,32,
+    32,32,32,78,41,2,218,6,115,116,114,101,97,109,114,65,
+    0,0,0,41,3,114,52,0,0,0,114,82,0,0,0,114,
+    65,0,0,0,114,53,0,0,0,114,53,0,0,0,114,54,
+    0,0,0,114,68,0,0,0,91,1,0,0,115,4,0,0,
+    0,0,22,6,1,122,21,83,116,114,101,97,109,87,114,105,
+    116,101,114,46,95,95,105,110,105,116,95,95,99,2,0,0,
+    0,0,0,0,0,4,0,0,0,4,0,0,0,67,0,0,
+    0,115,34,0,0,0,124,0,160,0,124,1,124,0,106,1,
+    161,2,92,2,125,2,125,3,124,0,106,2,160,3,124,2,
+    161,1,1,0,100,1,83,0,41,2,122,62,32,87,114,105,
+    116,101,115,32,116,104,101,32,111,98,106,101,99,116,39,115,
+    32,99,111,110,116,101,110,116,115,32,101,110,99,111,100,101,
+    100,32,116,111,32,115,101,108,102,46,115,116,114,101,97,109,
+    46,10,32,32,32,32,32,32,32,32,78,41,4,114,33,0,
+    0,0,114,65,0,0,0,114,82,0,0,0,218,5,119,114,
+    105,116,101,41,4,114,52,0,0,0,218,6,111,98,106,101,
+    99,116,114,76,0,0,0,114,78,0,0,0,114,53,0,0,
+    0,114,53,0,0,0,114,54,0,0,0,114,83,0,0,0,
+    116,1,0,0,115,4,0,0,0,0,4,18,1,122,18,83,
+    116,114,101,97,109,87,114,105,116,101,114,46,119,114,105,116,
+    101,99,2,0,0,0,0,0,0,0,2,0,0,0,5,0,
+    0,0,67,0,0,0,115,20,0,0,0,124,0,160,0,100,
+    1,160,1,124,1,161,1,161,1,1,0,100,2,83,0,41,
+    3,122,91,32,87,114,105,116,101,115,32,116,104,101,32,99,
+    111,110,99,97,116,101,110,97,116,101,100,32,108,105,115,116,
+    32,111,102,32,115,116,114,105,110,103,115,32,116,111,32,116,
+    104,101,32,115,116,114,101,97,109,10,32,32,32,32,32,32,
+    32,32,32,32,32,32,117,115,105,110,103,32,46,119,114,105,
+    116,101,40,41,46,10,32,32,32,32,32,32,32,32,114,66,
+    0,0,0,78,41,2,114,83,0,0,0,218,4,106,111,105,
+    110,41,2,114,52,0,0,0,218,4,108,105,115,116,114,53,
+    0,0,0,114,53,0,0,0,114,54,0,0,0,218,10,119,
+    114,105,116,101,108,105,110,101,115,123,1,0,0,115,2,0,
+    0,0,0,5,122,23,83,116,114,101,97,109,87,114,105,116,
+    101,114,46,119,114,105,116,101,108,105,110,101,115,99,1,0,
+    0,0,0,0,0,0,1,0,0,0,1,0,0,0,67,0,
+    0,0,115,4,0,0,0,100,1,83,0,41,2,97,53,1,
+    0,0,32,70,108,117,115,104,101,115,32,97,110,100,32,114,
+    101,115,101,116,115,32,116,104,101,32,99,111,100,101,99,32,
+    98,117,102,102,101,114,115,32,117,115,101,100,32,102,111,114,
+    32,107,101,101,112,105,110,103,32,115,116,97,116,101,46,10,
+    10,32,32,32,32,32,32,32,32,32,32,32,32,67,97,108,
+    108,105,110,103,32,116,104,105,115,32,109,101,116,104,111,100,
+    32,115,104,111,117,108,100,32,101,110,115,117,114,101,32,116,
+    104,97,116,32,116,104,101,32,100,97,116,97,32,111,110,32,
+    116,104,101,10,32,32,32,32,32,32,32,32,32,32,32,32,
+    111,117,116,112,117,116,32,105,115,32,112,117,116,32,105,110,
+    116,111,32,97,32,99,108,101,97,110,32,115,116,97,116,101,
+    44,32,116,104,97,116,32,97,108,108,111,119,115,32,97,112,
+    112,101,110,100,105,110,103,10,32,32,32,32,32,32,32,32,
+    32,32,32,32,111,102,32,110,101,119,32,102,114,101,115,104,
+    32,100,97,116,97,32,119,105,116,104,111,117,116,32,104,97,
+    118,105,110,103,32,116,111,32,114,101,115,99,97,110,32,116,
+    104,101,32,119,104,111,108,101,10,32,32,32,32,32,32,32,
+    32,32,32,32,32,115,116,114,101,97,109,32,116,111,32,114,
+    101,99,111,118,101,114,32,115,116,97,116,101,46,10,10,32,
+    32,32,32,32,32,32,32,78,114,53,0,0,0,41,1,114,
+    52,0,0,0,114,53,0,0,0,114,53,0,0,0,114,54,
+    0,0,0,114,70,0,0,0,130,1,0,0,115,2,0,0,
+    0,0,10,122,18,83,116,114,101,97,109,87,114,105,116,101,
+    114,46,114,101,115,101,116,114,0,0,0,0,99,3,0,0,
+    0,0,0,0,0,3,0,0,0,4,0,0,0,67,0,0,
+    0,115,42,0,0,0,124,0,106,0,160,1,124,1,124,2,
+    161,2,1,0,124,2,100,1,107,2,114,38,124,1,100,1,
+    107,2,114,38,124,0,160,2,161,0,1,0,100,0,83,0,
+    41,2,78,114,0,0,0,0,41,3,114,82,0,0,0,218,
+    4,115,101,101,107,114,70,0,0,0,41,3,114,52,0,0,
+    0,218,6,111,102,102,115,101,116,218,6,119,104,101,110,99,
+    101,114,53,0,0,0,114,53,0,0,0,114,54,0,0,0,
+    114,88,0,0,0,142,1,0,0,115,6,0,0,0,0,1,
+    14,1,16,1,122,17,83,116,114,101,97,109,87,114,105,116,
+    101,114,46,115,101,101,107,99,3,0,0,0,0,0,0,0,
+    3,0,0,0,3,0,0,0,67,0,0,0,115,12,0,0,
+    0,124,2,124,0,106,0,124,1,131,2,83,0,41,1,122,
+    63,32,73,110,104,101,114,105,116,32,97,108,108,32,111,116,
+    104,101,114,32,109,101,116,104,111,100,115,32,102,114,111,109,
+    32,116,104,101,32,117,110,100,101,114,108,121,105,110,103,32,
+    115,116,114,101,97,109,46,10,32,32,32,32,32,32,32,32,
+    41,1,114,82,0,0,0,41,3,114,52,0,0,0,114,47,
+    0,0,0,218,7,103,101,116,97,116,116,114,114,53,0,0,
+    0,114,53,0,0,0,114,54,0,0,0,218,11,95,95,103,
+    101,116,97,116,116,114,95,95,147,1,0,0,115,2,0,0,
+    0,0,5,122,24,83,116,114,101,97,109,87,114,105,116,101,
+    114,46,95,95,103,101,116,97,116,116,114,95,95,99,1,0,
+    0,0,0,0,0,0,1,0,0,0,1,0,0,0,67,0,
+    0,0,115,4,0,0,0,124,0,83,0,41,1,78,114,53,
+    0,0,0,41,1,114,52,0,0,0,114,53,0,0,0,114,
+    53,0,0,0,114,54,0,0,0,218,9,95,95,101,110,116,
+    101,114,95,95,154,1,0,0,115,2,0,0,0,0,1,122,
+    22,83,116,114,101,97,109,87,114,105,116,101,114,46,95,95,
+    101,110,116,101,114,95,95,99,4,0,0,0,0,0,0,0,
+    4,0,0,0,2,0,0,0,67,0,0,0,115,14,0,0,
+    0,124,0,106,0,160,1,161,0,1,0,100,0,83,0,41,
+    1,78,41,2,114,82,0,0,0,218,5,99,108,111,115,101,
+    41,4,114,52,0,0,0,218,4,116,121,112,101,218,5,118,
+    97,108,117,101,218,2,116,98,114,53,0,0,0,114,53,0,
+    0,0,114,54,0,0,0,218,8,95,95,101,120,105,116,95,
+    95,157,1,0,0,115,2,0,0,0,0,1,122,21,83,116,
+    114,101,97,109,87,114,105,116,101,114,46,95,95,101,120,105,
+    116,95,95,78,41,1,114,62,0,0,0,41,1,114,0,0,
+    0,0,41,12,114,60,0,0,0,114,56,0,0,0,114,57,
+    0,0,0,114,68,0,0,0,114,83,0,0,0,114,87,0,
+    0,0,114,70,0,0,0,114,88,0,0,0,114,91,0,0,
+    0,114,92,0,0,0,114,93,0,0,0,114,98,0,0,0,
+    114,53,0,0,0,114,53,0,0,0,114,53,0,0,0,114,
+    54,0,0,0,114,24,0,0,0,89,1,0,0,115,16,0,
+    0,0,8,2,10,25,8,7,8,7,8,12,10,6,12,6,
+    8,3,99,0,0,0,0,0,0,0,0,0,0,0,0,3,
+    0,0,0,64,0,0,0,115,128,0,0,0,101,0,90,1,
+    100,0,90,2,101,3,90,4,100,31,100,2,100,3,132,1,
+    90,5,100,32,100,4,100,5,132,1,90,6,100,35,100,8,
+    100,9,132,1,90,7,100,36,100,12,100,13,132,1,90,8,
+    100,37,100,14,100,15,132,1,90,9,100,16,100,17,132,0,
+    90,10,100,38,100,19,100,20,132,1,90,11,100,21,100,22,
+    132,0,90,12,100,23,100,24,132,0,90,13,101,14,102,1,
+    100,25,100,26,132,1,90,15,100,27,100,28,132,0,90,16,
+    100,29,100,30,132,0,90,17,100,10,83,0,41,39,114,23,
+    0,0,0,114,62,0,0,0,99,3,0,0,0,0,0,0,
+    0,3,0,0,0,2,0,0,0,67,0,0,0,115,46,0,
+    0,0,124,1,124,0,95,0,124,2,124,0,95,1,100,1,
+    124,0,95,2,124,0,160,3,161,0,124,0,95,4,124,0,
+    106,4,124,0,95,5,100,2,124,0,95,6,100,2,83,0,
+    41,3,97,141,2,0,0,32,67,114,101,97,116,101,115,32,
+    97,32,83,116,114,101,97,109,82,101,97,100,101,114,32,105,
+    110,115,116,97,110,99,101,46,10,10,32,32,32,32,32,32,
+    32,32,32,32,32,32,115,116,114,101,97,109,32,109,117,115,
+    116,32,98,101,32,97,32,102,105,108,101,45,108,105,107,101,
+    32,111,98,106,101,99,116,32,111,112,101,110,32,102,111,114,
+    32,114,101,97,100,105,110,103,46,10,10,32,32,32,32,32,
+    32,32,32,32,32,32,32,84,104,101,32,83,116,114,101,97,
+    109,82,101,97,100,101,114,32,109,97,121,32,117,115,101,32,
+    100,105,102,102,101,114,101,110,116,32,101,114,114,111,114,32,
+    104,97,110,100,108,105,110,103,10,32,32,32,32,32,32,32,
+    32,32,32,32,32,115,99,104,101,109,101,115,32,98,121,32,
+    112,114,111,118,105,100,105,110,103,32,116,104,101,32,101,114,
+    114,111,114,115,32,107,101,121,119,111,114,100,32,97,114,103,
+    117,109,101,110,116,46,32,84,104,101,115,101,10,32,32,32,
+    32,32,32,32,32,32,32,32,32,112,97,114,97,109,101,116,
+    101,114,115,32,97,114,101,32,112,114,101,100,101,102,105,110,
+    101,100,58,10,10,32,32,32,32,32,32,32,32,32,32,32,
+    32,32,39,115,116,114,105,99,116,39,32,45,32,114,97,105,
+    115,101,32,97,32,86,97,108,117,101,69,114,114,111,114,32,
+    40,111,114,32,97,32,115,117,98,99,108,97,115,115,41,10,
+    32,32,32,32,32,32,32,32,32,32,32,32,32,39,105,103,
+    110,111,114,101,39,32,45,32,105,103,110,111,114,101,32,116,
+    104,101,32,99,104,97,114,97,99,116,101,114,32,97,110,100,
+    32,99,111,110,116,105,110,117,101,32,119,105,116,104,32,116,
+    104,101,32,110,101,120,116,10,32,32,32,32,32,32,32,32,
+    32,32,32,32,32,39,114,101,112,108,97,99,101,39,45,32,
+    114,101,112,108,97,99,101,32,119,105,116,104,32,97,32,115,
+    117,105,116,97,98,108,101,32,114,101,112,108,97,99,101,109,
+    101,110,116,32,99,104,97,114,97,99,116,101,114,10,32,32,
+    32,32,32,32,32,32,32,32,32,32,32,39,98,97,99,107,
+    115,108,97,115,104,114,101,112,108,97,99,101,39,32,45,32,
+    82,101,112,108,97,99,101,32,119,105,116,104,32,98,97,99,
+    107,115,108,97,115,104,101,100,32,101,115,99,97,112,101,32,
+    115,101,113,117,101,110,99,101,115,59,10,10,32,32,32,32,
+    32,32,32,32,32,32,32,32,84,104,101,32,115,101,116,32,
+    111,102,32,97,108,108,111,119,101,100,32,112,97,114,97,109,
+    101,116,101,114,32,118,97,108,117,101,115,32,99,97,110,32,
+    98,101,32,101,120,116,101,110,100,101,100,32,118,105,97,10,
+    32,32,32,32,32,32,32,32,32,32,32,32,114,101,103,105,
+    115,116,101,114,95,101,114,114,111,114,46,10,32,32,32,32,
+    32,32,32,32,114,79,0,0,0,78,41,7,114,82,0,0,
+    0,114,65,0,0,0,218,10,98,121,116,101,98,117,102,102,
+    101,114,218,14,99,104,97,114,98,117,102,102,101,114,116,121,
+    112,101,218,17,95,101,109,112,116,121,95,99,104,97,114,98,
+    117,102,102,101,114,218,10,99,104,97,114,98,117,102,102,101,
+    114,218,10,108,105,110,101,98,117,102,102,101,114,41,3,114,
+    52,0,0,0,114,82,0,0,0,114,65,0,0,0,114,53,
+    0,0,0,114,53,0,0,0,114,54,0,0,0,114,68,0,
+    0,0,166,1,0,0,115,12,0,0,0,0,18,6,1,6,
+    1,6,1,10,1,8,1,122,21,83,116,114,101,97,109,82,
+    101,97,100,101,114,46,95,95,105,110,105,116,95,95,99,3,
+    0,0,0,0,0,0,0,3,0,0,0,1,0,0,0,67,
+    0,0,0,115,8,0,0,0,116,0,130,1,100,0,83,0,
+    41,1,78,41,1,114,63,0,0,0,41,3,114,52,0,0,
+    0,114,64,0,0,0,114,65,0,0,0,114,53,0,0,0,
+    114,53,0,0,0,114,54,0,0,0,114,34,0,0,0,191,
+    1,0,0,115,2,0,0,0,0,1,122,19,83,116,114,101,
+    97,109,82,101,97,100,101,114,46,100,101,99,111,100,101,233,
+    1,0,0,0,70,99,4,0,0,0,0,0,0,0,11,0,
+    0,0,17,0,0,0,67,0,0,0,115,92,1,0,0,124,
+    0,106,0,114,28,124,0,106,1,160,2,124,0,106,0,161,
+    1,124,0,95,3,100,1,124,0,95,0,144,1,120,0,124,
+    2,100,2,107,5,114,58,116,4,124,0,106,3,131,1,124,
+    2,107,5,114,82,80,0,110,24,124,1,100,2,107,5,114,
+    82,116,4,124,0,106,3,131,1,124,1,107,5,114,82,80,
+    0,124,1,100,2,107,0,114,102,124,0,106,5,160,6,161,
+    0,125,4,110,12,124,0,106,5,160,6,124,1,161,1,125,
+    4,124,0,106,7,124,4,23,0,125,5,124,5,115,130,80,
+    0,121,22,124,0,160,8,124,5,124,0,106,9,161,2,92,
+    2,125,6,125,7,87,0,110,96,4,0,116,10,107,10,114,
+    248,1,0,125,8,1,0,122,68,124,3,114,230,124,0,160,
+    8,124,5,100,1,124,8,106,11,133,2,25,0,124,0,106,
+    9,161,2,92,2,125,6,125,7,124,6,106,12,100,3,100,
+    4,141,1,125,9,116,4,124,9,131,1,100,5,107,1,114,
+    232,130,0,110,2,130,0,87,0,89,0,100,1,100,1,125,
+    8,126,8,88,0,110,2,88,0,124,5,124,7,100,1,133,
+    2,25,0,124,0,95,7,124,0,4,0,106,3,124,6,55,
+    0,2,0,95,3,124,4,115,32,80,0,113,32,87,0,124,
+    2,100,2,107,0,144,1,114,58,124,0,106,3,125,10,124,
+    0,106,1,124,0,95,3,110,30,124,0,106,3,100,1,124,
+    2,133,2,25,0,125,10,124,0,106,3,124,2,100,1,133,
+    2,25,0,124,0,95,3,124,10,83,0,41,6,97,236,4,
+    0,0,32,68,101,99,111,100,101,115,32,100,97,116,97,32,
+    102,114,111,109,32,116,104,101,32,115,116,114,101,97,109,32,
+    115,101,108,102,46,115,116,114,101,97,109,32,97,110,100,32,
+    114,101,116,117,114,110,115,32,116,104,101,10,32,32,32,32,
+    32,32,32,32,32,32,32,32,114,101,115,117,108,116,105,110,
+    103,32,111,98,106,101,99,116,46,10,10,32,32,32,32,32,
+    32,32,32,32,32,32,32,99,104,97,114,115,32,105,110,100,
+    105,99,97,116,101,115,32,116,104,101,32,110,117,109,98,101,
+    114,32,111,102,32,100,101,99,111,100,101,100,32,99,111,100,
+    101,32,112,111,105,110,116,115,32,111,114,32,98,121,116,101,
+    115,32,116,111,10,32,32,32,32,32,32,32,32,32,32,32,
+    32,114,101,116,117,114,110,46,32,114,101,97,100,40,41,32,
+    119,105,108,108,32,110,101,118,101,114,32,114,101,116,117,114,
+    110,32,109,111,114,101,32,100,97,116,97,32,116,104,97,110,
+    32,114,101,113,117,101,115,116,101,100,44,10,32,32,32,32,
+    32,32,32,32,32,32,32,32,98,117,116,32,105,116,32,109,
+    105,103,104,116,32,114,101,116,117,114,110,32,108,101,115,115,
+    44,32,105,102,32,116,104,101,114,101,32,105,115,32,110,111,
+    116,32,101,110,111,117,103,104,32,97,118,97,105,108,97,98,
+    108,101,46,10,10,32,32,32,32,32,32,32,32,32,32,32,
+    32,115,105,122,101,32,105,110,100,105,99,97,116,101,115,32,
+    116,104,101,32,97,112,112,114,111,120,105,109,97,116,101,32,
+    109,97,120,105,109,117,109,32,110,117,109,98,101,114,32,111,
+    102,32,100,101,99,111,100,101,100,10,32,32,32,32,32,32,
+    32,32,32,32,32,32,98,121,116,101,115,32,111,114,32,99,
+    111,100,101,32,112,111,105,110,116,115,32,116,111,32,114,101,
+    97,100,32,102,111,114,32,100,101,99,111,100,105,110,103,46,
+    32,84,104,101,32,100,101,99,111,100,101,114,10,32,32,32,
+    32,32,32,32,32,32,32,32,32,99,97,110,32,109,111,100,
+    105,102,121,32,116,104,105,115,32,115,101,116,116,105,110,103,
+    32,97,115,32,97,112,112,114,111,112,114,105,97,116,101,46,
+    32,84,104,101,32,100,101,102,97,117,108,116,32,118,97,108,
+    117,101,10,32,32,32,32,32,32,32,32,32,32,32,32,45,
+    49,32,105,110,100,105,99,97,116,101,115,32,116,111,32,114,
+    101,97,100,32,97,110,100,32,100,101,99,111,100,101,32,97,
+    115,32,109,117,99,104,32,97,115,32,112,111,115,115,105,98,
+    108,101,46,32,32,115,105,122,101,10,32,32,32,32,32,32,
+    32,32,32,32,32,32,105,115,32,105,110,116,101,110,100,101,
+    100,32,116,111,32,112,114,101,118,101,110,116,32,104,97,118,
+    105,110,103,32,116,111,32,100,101,99,111,100,101,32,104,117,
+    103,101,32,102,105,108,101,115,32,105,110,32,111,110,101,10,
+    32,32,32,32,32,32,32,32,32,32,32,32,115,116,101,112,
+    46,10,10,32,32,32,32,32,32,32,32,32,32,32,32,73,
+    102,32,102,105,114,115,116,108,105,110,101,32,105,115,32,116,
+    114,117,101,44,32,97,110,100,32,97,32,85,110,105,99,111,
+    100,101,68,101,99,111,100,101,69,114,114,111,114,32,104,97,
+    112,112,101,110,115,10,32,32,32,32,32,32,32,32,32,32,
+    32,32,97,102,116,101,114,32,116,104,101,32,102,105,114,115,
+    116,32,108,105,110,101,32,116,101,114,109,105,110,97,116,111,
+    114,32,105,110,32,116,104,101,32,105,110,112,117,116,32,111,
+    110,108,121,32,116,104,101,32,102,105,114,115,116,32,108,105,
+    110,101,10,32,32,32,32,32,32,32,32,32,32,32,32,119,
+    105,108,108,32,98,101,32,114,101,116,117,114,110,101,100,44,
+    32,116,104,101,32,114,101,115,116,32,111,102,32,116,104,101,
+    32,105,110,112,117,116,32,119,105,108,108,32,98,101,32,107,
+    101,112,116,32,117,110,116,105,108,32,116,104,101,10,32,32,
+    32,32,32,32,32,32,32,32,32,32,110,101,120,116,32,99,
+    97,108,108,32,116,111,32,114,101,97,100,40,41,46,10,10,
+    32,32,32,32,32,32,32,32,32,32,32,32,84,104,101,32,
+    109,101,116,104,111,100,32,115,104,111,117,108,100,32,117,115,
+    101,32,97,32,103,114,101,101,100,121,32,114,101,97,100,32,
+    115,116,114,97,116,101,103,121,44,32,109,101,97,110,105,110,
+    103,32,116,104,97,116,10,32,32,32,32,32,32,32,32,32,
+    32,32,32,105,116,32,115,104,111,117,108,100,32,114,101,97,
+    100,32,97,115,32,109,117,99,104,32,100,97,116,97,32,97,
+    115,32,105,115,32,97,108,108,111,119,101,100,32,119,105,116,
+    104,105,110,32,116,104,101,10,32,32,32,32,32,32,32,32,
+    32,32,32,32,100,101,102,105,110,105,116,105,111,110,32,111,
+    102,32,116,104,101,32,101,110,99,111,100,105,110,103,32,97,
+    110,100,32,116,104,101,32,103,105,118,101,110,32,115,105,122,
+    101,44,32,101,46,103,46,32,32,105,102,10,32,32,32,32,
+    32,32,32,32,32,32,32,32,111,112,116,105,111,110,97,108,
+    32,101,110,99,111,100,105,110,103,32,101,110,100,105,110,103,
+    115,32,111,114,32,115,116,97,116,101,32,109,97,114,107,101,
+    114,115,32,97,114,101,32,97,118,97,105,108,97,98,108,101,
+    10,32,32,32,32,32,32,32,32,32,32,32,32,111,110,32,
+    116,104,101,32,115,116,114,101,97,109,44,32,116,104,101,115,
+    101,32,115,104,111,117,108,100,32,98,101,32,114,101,97,100,
+    32,116,111,111,46,10,32,32,32,32,32,32,32,32,78,114,
+    0,0,0,0,84,41,1,218,8,107,101,101,112,101,110,100,
+    115,114,104,0,0,0,41,13,114,103,0,0,0,114,101,0,
+    0,0,114,85,0,0,0,114,102,0,0,0,218,3,108,101,
+    110,114,82,0,0,0,218,4,114,101,97,100,114,99,0,0,
+    0,114,34,0,0,0,114,65,0,0,0,218,18,85,110,105,
+    99,111,100,101,68,101,99,111,100,101,69,114,114,111,114,218,
+    5,115,116,97,114,116,218,10,115,112,108,105,116,108,105,110,
+    101,115,41,11,114,52,0,0,0,218,4,115,105,122,101,218,
+    5,99,104,97,114,115,218,9,102,105,114,115,116,108,105,110,
+    101,90,7,110,101,119,100,97,116,97,114,76,0,0,0,90,
+    8,110,101,119,99,104,97,114,115,90,12,100,101,99,111,100,
+    101,100,98,121,116,101,115,90,3,101,120,99,218,5,108,105,
+    110,101,115,114,77,0,0,0,114,53,0,0,0,114,53,0,
+    0,0,114,54,0,0,0,114,107,0,0,0,194,1,0,0,
+    115,70,0,0,0,0,28,6,1,16,1,6,3,4,2,8,
+    1,14,1,4,1,8,1,14,1,2,2,8,1,12,2,12,
+    2,10,1,4,1,2,1,2,1,22,1,16,1,4,2,28,
+    1,12,1,12,1,4,2,20,2,14,2,14,2,4,1,6,
+    1,10,2,6,1,10,3,14,1,16,1,122,17,83,116,114,
+    101,97,109,82,101,97,100,101,114,46,114,101,97,100,78,84,
+    99,3,0,0,0,0,0,0,0,9,0,0,0,5,0,0,
+    0,67,0,0,0,115,216,1,0,0,124,0,106,0,114,80,
+    124,0,106,0,100,1,25,0,125,3,124,0,106,0,100,1,
+    61,0,116,1,124,0,106,0,131,1,100,2,107,2,114,56,
+    124,0,106,0,100,1,25,0,124,0,95,2,100,3,124,0,
+    95,0,124,2,115,76,124,3,106,3,100,4,100,5,141,1,
+    100,1,25,0,125,3,124,3,83,0,124,1,112,86,100,6,
+    125,4,124,0,106,4,125,3,144,1,120,114,124,0,106,5,
+    124,4,100,7,100,8,141,2,125,5,124,5,114,174,116,6,
+    124,5,116,7,131,2,114,136,124,5,160,8,100,9,161,1,
+    115,156,116,6,124,5,116,9,131,2,114,174,124,5,160,8,
+    100,10,161,1,114,174,124,5,124,0,106,5,100,2,100,2,
+    100,11,141,2,55,0,125,5,124,3,124,5,55,0,125,3,
+    124,3,106,3,100,7,100,5,141,1,125,6,124,6,144,1,
+    114,142,116,1,124,6,131,1,100,2,107,4,144,1,114,58,
+    124,6,100,1,25,0,125,3,124,6,100,1,61,0,116,1,
+    124,6,131,1,100,2,107,4,144,1,114,18,124,6,100,14,
+    5,0,25,0,124,0,106,2,55,0,3,0,60,0,124,6,
+    124,0,95,0,100,3,124,0,95,2,110,16,124,6,100,1,
+    25,0,124,0,106,2,23,0,124,0,95,2,124,2,144,1,
+    115,56,124,3,106,3,100,4,100,5,141,1,100,1,25,0,
+    125,3,80,0,124,6,100,1,25,0,125,7,124,6,100,1,
+    25,0,106,3,100,4,100,5,141,1,100,1,25,0,125,8,
+    124,7,124,8,107,3,144,1,114,142,124,0,106,4,160,10,
+    124,6,100,2,100,3,133,2,25,0,161,1,124,0,106,2,
+    23,0,124,0,95,2,124,2,144,1,114,136,124,7,125,3,
+    110,4,124,8,125,3,80,0,124,5,12,0,144,1,115,160,
+    124,1,100,3,107,9,144,1,114,192,124,3,144,1,114,190,
+    124,2,12,0,144,1,114,190,124,3,106,3,100,4,100,5,
+    141,1,100,1,25,0,125,3,80,0,124,4,100,12,107,0,
+    114,98,124,4,100,13,57,0,125,4,113,98,87,0,124,3,
+    83,0,41,15,122,177,32,82,101,97,100,32,111,110,101,32,
+    108,105,110,101,32,102,114,111,109,32,116,104,101,32,105,110,
+    112,117,116,32,115,116,114,101,97,109,32,97,110,100,32,114,
+    101,116,117,114,110,32,116,104,101,10,32,32,32,32,32,32,
+    32,32,32,32,32,32,100,101,99,111,100,101,100,32,100,97,
+    116,97,46,10,10,32,32,32,32,32,32,32,32,32,32,32,
+    32,115,105,122,101,44,32,105,102,32,103,105,118,101,110,44,
+    32,105,115,32,112,97,115,115,101,100,32,97,115,32,115,105,
+    122,101,32,97,114,103,117,109,101,110,116,32,116,111,32,116,
+    104,101,10,32,32,32,32,32,32,32,32,32,32,32,32,114,
+    101,97,100,40,41,32,109,101,116,104,111,100,46,10,10,32,
+    32,32,32,32,32,32,32,114,0,0,0,0,114,104,0,0,
+    0,78,70,41,1,114,105,0,0,0,233,72,0,0,0,84,
+    41,1,114,113,0,0,0,250,1,13,243,1,0,0,0,13,
+    41,2,114,111,0,0,0,114,112,0,0,0,105,64,31,0,
+    0,233,2,0,0,0,233,255,255,255,255,41,11,114,103,0,
+    0,0,114,106,0,0,0,114,102,0,0,0,114,110,0,0,
+    0,114,101,0,0,0,114,107,0,0,0,218,10,105,115,105,
+    110,115,116,97,110,99,101,218,3,115,116,114,218,8,101,110,
+    100,115,119,105,116,104,218,5,98,121,116,101,115,114,85,0,
+    0,0,41,9,114,52,0,0,0,114,111,0,0,0,114,105,
+    0,0,0,218,4,108,105,110,101,90,8,114,101,97,100,115,
+    105,122,101,114,76,0,0,0,114,114,0,0,0,90,12,108,
+    105,110,101,48,119,105,116,104,101,110,100,90,15,108,105,110,
+    101,48,119,105,116,104,111,117,116,101,110,100,114,53,0,0,
+    0,114,53,0,0,0,114,54,0,0,0,218,8,114,101,97,
+    100,108,105,110,101,16,2,0,0,115,94,0,0,0,0,11,
+    6,1,10,1,8,1,14,3,12,1,6,1,4,1,16,1,
+    4,2,8,1,6,2,4,1,14,1,4,4,20,1,20,1,
+    18,2,8,1,12,1,6,1,14,3,8,1,6,1,14,2,
+    18,1,6,1,8,3,16,1,6,1,16,1,2,1,8,1,
+    20,1,10,2,18,1,10,1,6,1,6,2,4,1,2,2,
+    18,1,14,1,16,1,2,1,8,1,12,1,122,21,83,116,
+    114,101,97,109,82,101,97,100,101,114,46,114,101,97,100,108,
+    105,110,101,99,3,0,0,0,0,0,0,0,4,0,0,0,
+    3,0,0,0,67,0,0,0,115,18,0,0,0,124,0,160,
+    0,161,0,125,3,124,3,160,1,124,2,161,1,83,0,41,
+    1,97,83,1,0,0,32,82,101,97,100,32,97,108,108,32,
+    108,105,110,101,115,32,97,118,97,105,108,97,98,108,101,32,
+    111,110,32,116,104,101,32,105,110,112,117,116,32,115,116,114,
+    101,97,109,10,32,32,32,32,32,32,32,32,32,32,32,32,
+    97,110,100,32,114,101,116,117,114,110,32,116,104,101,109,32,
+    97,115,32,97,32,108,105,115,116,46,10,10,32,32,32,32,
+    32,32,32,32,32,32,32,32,76,105,110,101,32,98,114,101,
+    97,107,115,32,97,114,101,32,105,109,112,108,101,109,101,110,
+    116,101,100,32,117,115,105,110,103,32,116,104,101,32,99,111,
+    100,101,99,39,115,32,100,101,99,111,100,101,114,10,32,32,
+    32,32,32,32,32,32,32,32,32,32,109,101,116,104,111,100,
+    32,97,110,100,32,97,114,101,32,105,110,99,108,117,100,101,
+    100,32,105,110,32,116,104,101,32,108,105,115,116,32,101,110,
+    116,114,105,101,115,46,10,10,32,32,32,32,32,32,32,32,
+    32,32,32,32,115,105,122,101,104,105,110,116,44,32,105,102,
+    32,103,105,118,101,110,44,32,105,115,32,105,103,110,111,114,
+    101,100,32,115,105,110,99,101,32,116,104,101,114,101,32,105,
+    115,32,110,111,32,101,102,102,105,99,105,101,110,116,10,32,
+    32,32,32,32,32,32,32,32,32,32,32,119,97,121,32,116,
+    111,32,102,105,110,100,105,110,103,32,116,104,101,32,116,114,
+    117,101,32,101,110,100,45,111,102,45,108,105,110,101,46,10,
+    10,32,32,32,32,32,32,32,32,41,2,114,107,0,0,0,
+    114,110,0,0,0,41,4,114,52,0,0,0,218,8,115,105,
+    122,101,104,105,110,116,114,105,0,0,0,114,76,0,0,0,
+    114,53,0,0,0,114,53,0,0,0,114,54,0,0,0,218,
+    9,114,101,97,100,108,105,110,101,115,91,2,0,0,115,4,
+    0,0,0,0,12,8,1,122,22,83,116,114,101,97,109,82,
+    101,97,100,101,114,46,114,101,97,100,108,105,110,101,115,99,
+    1,0,0,0,0,0,0,0,1,0,0,0,2,0,0,0,
+    67,0,0,0,115,24,0,0,0,100,1,124,0,95,0,124,
+    0,106,1,124,0,95,2,100,2,124,0,95,3,100,2,83,
+    0,41,3,122,227,32,82,101,115,101,116,115,32,116,104,101,
+    32,99,111,100,101,99,32,98,117,102,102,101,114,115,32,117,
+    115,101,100,32,102,111,114,32,107,101,101,112,105,110,103,32,
+    115,116,97,116,101,46,10,10,32,32,32,32,32,32,32,32,
+    32,32,32,32,78,111,116,101,32,116,104,97,116,32,110,111,
+    32,115,116,114,101,97,109,32,114,101,112,111,115,105,116,105,
+    111,110,105,110,103,32,115,104,111,117,108,100,32,116,97,107,
+    101,32,112,108,97,99,101,46,10,32,32,32,32,32,32,32,
+    32,32,32,32,32,84,104,105,115,32,109,101,116,104,111,100,
+    32,105,115,32,112,114,105,109,97,114,105,108,121,32,105,110,
+    116,101,110,100,101,100,32,116,111,32,98,101,32,97,98,108,
+    101,32,116,111,32,114,101,99,111,118,101,114,10,32,32,32,
+    32,32,32,32,32,32,32,32,32,102,114,111,109,32,100,101,
+    99,111,100,105,110,103,32,101,114,114,111,114,115,46,10,10,
+    32,32,32,32,32,32,32,32,114,79,0,0,0,78,41,4,
+    114,99,0,0,0,114,101,0,0,0,114,102,0,0,0,114,
+    103,0,0,0,41,1,114,52,0,0,0,114,53,0,0,0,
+    114,53,0,0,0,114,54,0,0,0,114,70,0,0,0,106,
+    2,0,0,115,6,0,0,0,0,9,6,1,8,1,122,18,
+    83,116,114,101,97,109,82,101,97,100,101,114,46,114,101,115,
+    101,116,114,0,0,0,0,99,3,0,0,0,0,0,0,0,
+    3,0,0,0,4,0,0,0,67,0,0,0,115,26,0,0,
+    0,124,0,106,0,160,1,124,1,124,2,161,2,1,0,124,
+    0,160,2,161,0,1,0,100,1,83,0,41,2,122,112,32,
+    83,101,116,32,116,104,101,32,105,110,112,117,116,32,115,116,
+    114,101,97,109,39,115,32,99,117,114,114,101,110,116,32,112,
+    111,115,105,116,105,111,110,46,10,10,32,32,32,32,32,32,
+    32,32,32,32,32,32,82,101,115,101,116,115,32,116,104,101,
+    32,99,111,100,101,99,32,98,117,102,102,101,114,115,32,117,
+    115,101,100,32,102,111,114,32,107,101,101,112,105,110,103,32,
+    115,116,97,116,101,46,10,32,32,32,32,32,32,32,32,78,
+    41,3,114,82,0,0,0,114,88,0,0,0,114,70,0,0,
+    0,41,3,114,52,0,0,0,114,89,0,0,0,114,90,0,
+    0,0,114,53,0,0,0,114,53,0,0,0,114,54,0,0,
+    0,114,88,0,0,0,119,2,0,0,115,4,0,0,0,0,
+    5,14,1,122,17,83,116,114,101,97,109,82,101,97,100,101,
+    114,46,115,101,101,107,99,1,0,0,0,0,0,0,0,2,
+    0,0,0,2,0,0,0,67,0,0,0,115,24,0,0,0,
+    124,0,160,0,161,0,125,1,124,1,114,16,124,1,83,0,
+    116,1,130,1,100,1,83,0,41,2,122,52,32,82,101,116,
+    117,114,110,32,116,104,101,32,110,101,120,116,32,100,101,99,
+    111,100,101,100,32,108,105,110,101,32,102,114,111,109,32,116,
+    104,101,32,105,110,112,117,116,32,115,116,114,101,97,109,46,
+    78,41,2,114,125,0,0,0,218,13,83,116,111,112,73,116,
+    101,114,97,116,105,111,110,41,2,114,52,0,0,0,114,124,
+    0,0,0,114,53,0,0,0,114,53,0,0,0,114,54,0,
+    0,0,218,8,95,95,110,101,120,116,95,95,127,2,0,0,
+    115,8,0,0,0,0,3,8,1,4,1,4,1,122,21,83,
+    116,114,101,97,109,82,101,97,100,101,114,46,95,95,110,101,
+    120,116,95,95,99,1,0,0,0,0,0,0,0,1,0,0,
+    0,1,0,0,0,67,0,0,0,115,4,0,0,0,124,0,
+    83,0,41,1,78,114,53,0,0,0,41,1,114,52,0,0,
+    0,114,53,0,0,0,114,53,0,0,0,114,54,0,0,0,
+    218,8,95,95,105,116,101,114,95,95,135,2,0,0,115,2,
+    0,0,0,0,1,122,21,83,116,114,101,97,109,82,101,97,
+    100,101,114,46,95,95,105,116,101,114,95,95,99,3,0,0,
+    0,0,0,0,0,3,0,0,0,3,0,0,0,67,0,0,
+    0,115,12,0,0,0,124,2,124,0,106,0,124,1,131,2,
+    83,0,41,1,122,63,32,73,110,104,101,114,105,116,32,97,
+    108,108,32,111,116,104,101,114,32,109,101,116,104,111,100,115,
+    32,102,114,111,109,32,116,104,101,32,117,110,100,101,114,108,
+    121,105,110,103,32,115,116,114,101,97,109,46,10,32,32,32,
+    32,32,32,32,32,41,1,114,82,0,0,0,41,3,114,52,
+    0,0,0,114,47,0,0,0,114,91,0,0,0,114,53,0,
+    0,0,114,53,0,0,0,114,54,0,0,0,114,92,0,0,
+    0,138,2,0,0,115,2,0,0,0,0,5,122,24,83,116,
+    114,101,97,109,82,101,97,100,101,114,46,95,95,103,101,116,
+    97,116,116,114,95,95,99,1,0,0,0,0,0,0,0,1,
+    0,0,0,1,0,0,0,67,0,0,0,115,4,0,0,0,
+    124,0,83,0,41,1,78,114,53,0,0,0,41,1,114,52,
+    0,0,0,114,53,0,0,0,114,53,0,0,0,114,54,0,
+    0,0,114,93,0,0,0,145,2,0,0,115,2,0,0,0,
+    0,1,122,22,83,116,114,101,97,109,82,101,97,100,101,114,
+    46,95,95,101,110,116,101,114,95,95,99,4,0,0,0,0,
+    0,0,0,4,0,0,0,2,0,0,0,67,0,0,0,115,
+    14,0,0,0,124,0,106,0,160,1,161,0,1,0,100,0,
+    83,0,41,1,78,41,2,114,82,0,0,0,114,94,0,0,
+    0,41,4,114,52,0,0,0,114,95,0,0,0,114,96,0,
+    0,0,114,97,0,0,0,114,53,0,0,0,114,53,0,0,
+    0,114,54,0,0,0,114,98,0,0,0,148,2,0,0,115,
+    2,0,0,0,0,1,122,21,83,116,114,101,97,109,82,101,
+    97,100,101,114,46,95,95,101,120,105,116,95,95,41,1,114,
+    62,0,0,0,41,1,114,62,0,0,0,114,119,0,0,0,
+    114,119,0,0,0,41,3,114,119,0,0,0,114,119,0,0,
+    0,70,41,2,78,84,41,2,78,84,41,1,114,0,0,0,
+    0,41,18,114,60,0,0,0,114,56,0,0,0,114,57,0,
+    0,0,114,121,0,0,0,114,100,0,0,0,114,68,0,0,
+    0,114,34,0,0,0,114,107,0,0,0,114,125,0,0,0,
+    114,127,0,0,0,114,70,0,0,0,114,88,0,0,0,114,
+    129,0,0,0,114,130,0,0,0,114,91,0,0,0,114,92,
+    0,0,0,114,93,0,0,0,114,98,0,0,0,114,53,0,
+    0,0,114,53,0,0,0,114,53,0,0,0,114,54,0,0,
+    0,114,23,0,0,0,162,1,0,0,115,26,0,0,0,8,
+    2,4,2,10,25,10,3,10,78,10,75,10,15,8,13,10,
+    8,8,8,8,4,12,6,8,3,99,0,0,0,0,0,0,
+    0,0,0,0,0,0,3,0,0,0,64,0,0,0,115,138,
+    0,0,0,101,0,90,1,100,0,90,2,100,1,90,3,100,
+    2,90,4,100,33,100,4,100,5,132,1,90,5,100,35,100,
+    7,100,8,132,1,90,6,100,36,100,10,100,11,132,1,90,
+    7,100,37,100,12,100,13,132,1,90,8,100,14,100,15,132,
+    0,90,9,100,16,100,17,132,0,90,10,100,18,100,19,132,
+    0,90,11,100,20,100,21,132,0,90,12,100,22,100,23,132,
+    0,90,13,100,38,100,25,100,26,132,1,90,14,101,15,102,
+    1,100,27,100,28,132,1,90,16,100,29,100,30,132,0,90,
+    17,100,31,100,32,132,0,90,18,100,9,83,0,41,39,114,
+    25,0,0,0,97,1,1,0,0,32,83,116,114,101,97,109,
+    82,101,97,100,101,114,87,114,105,116,101,114,32,105,110,115,
+    116,97,110,99,101,115,32,97,108,108,111,119,32,119,114,97,
+    112,112,105,110,103,32,115,116,114,101,97,109,115,32,119,104,
+    105,99,104,10,32,32,32,32,32,32,32,32,119,111,114,107,
+    32,105,110,32,98,111,116,104,32,114,101,97,100,32,97,110,
+    100,32,119,114,105,116,101,32,109,111,100,101,115,46,10,10,
+    32,32,32,32,32,32,32,32,84,104,101,32,100,101,115,105,
+    103,110,32,105,115,32,115,117,99,104,32,116,104,97,116,32,
+    111,110,101,32,99,97,110,32,117,115,101,32,116,104,101,32,
+    102,97,99,116,111,114,121,32,102,117,110,99,116,105,111,110,
+    115,10,32,32,32,32,32,32,32,32,114,101,116,117,114,110,
+    101,100,32,98,121,32,116,104,101,32,99,111,100,101,99,46,
+    108,111,111,107,117,112,40,41,32,102,117,110,99,116,105,111,
+    110,32,116,111,32,99,111,110,115,116,114,117,99,116,32,116,
+    104,101,10,32,32,32,32,32,32,32,32,105,110,115,116,97,
+    110,99,101,46,10,10,32,32,32,32,218,7,117,110,107,110,
+    111,119,110,114,62,0,0,0,99,5,0,0,0,0,0,0,
+    0,5,0,0,0,3,0,0,0,67,0,0,0,115,40,0,
+    0,0,124,1,124,0,95,0,124,2,124,1,124,4,131,2,
+    124,0,95,1,124,3,124,1,124,4,131,2,124,0,95,2,
+    124,4,124,0,95,3,100,1,83,0,41,2,97,82,1,0,
+    0,32,67,114,101,97,116,101,115,32,97,32,83,116,114,101,
+    97,109,82,101,97,100,101,114,87,114,105,116,101,114,32,105,
+    110,115,116,97,110,99,101,46,10,10,32,32,32,32,32,32,
+    32,32,32,32,32,32,115,116,114,101,97,109,32,109,117,115,
+    116,32,98,101,32,97,32,83,116,114,101,97,109,45,108,105,
+    107,101,32,111,98,106,101,99,116,46,10,10,32,32,32,32,
+    32,32,32,32,32,32,32,32,82,101,97,100,101,114,44,32,
+    87,114,105,116,101,114,32,109,117,115,116,32,98,101,32,102,
+    97,99,116,111,114,121,32,102,117,110,99,116,105,111,110,115,
+    32,111,114,32,99,108,97,115,115,101,115,10,32,32,32,32,
+    32,32,32,32,32,32,32,32,112,114,111,118,105,100,105,110,
+    103,32,116,104,101,32,83,116,114,101,97,109,82,101,97,100,
+    101,114,44,32,83,116,114,101,97,109,87,114,105,116,101,114,
+    32,105,110,116,101,114,102,97,99,101,32,114,101,115,112,46,
+    10,10,32,32,32,32,32,32,32,32,32,32,32,32,69,114,
+    114,111,114,32,104,97,110,100,108,105,110,103,32,105,115,32,
+    100,111,110,101,32,105,110,32,116,104,101,32,115,97,109,101,
+    32,119,97,121,32,97,115,32,100,101,102,105,110,101,100,32,
+    102,111,114,32,116,104,101,10,32,32,32,32,32,32,32,32,
+    32,32,32,32,83,116,114,101,97,109,87,114,105,116,101,114,
+    47,82,101,97,100,101,114,115,46,10,10,32,32,32,32,32,
+    32,32,32,78,41,4,114,82,0,0,0,218,6,114,101,97,
+    100,101,114,218,6,119,114,105,116,101,114,114,65,0,0,0,
+    41,5,114,52,0,0,0,114,82,0,0,0,218,6,82,101,
+    97,100,101,114,218,6,87,114,105,116,101,114,114,65,0,0,
+    0,114,53,0,0,0,114,53,0,0,0,114,54,0,0,0,
+    114,68,0,0,0,166,2,0,0,115,8,0,0,0,0,13,
+    6,1,12,1,12,1,122,27,83,116,114,101,97,109,82,101,
+    97,100,101,114,87,114,105,116,101,114,46,95,95,105,110,105,
+    116,95,95,114,104,0,0,0,99,2,0,0,0,0,0,0,
+    0,2,0,0,0,3,0,0,0,67,0,0,0,115,12,0,
+    0,0,124,0,106,0,160,1,124,1,161,1,83,0,41,1,
+    78,41,2,114,132,0,0,0,114,107,0,0,0,41,2,114,
+    52,0,0,0,114,111,0,0,0,114,53,0,0,0,114,53,
+    0,0,0,114,54,0,0,0,114,107,0,0,0,184,2,0,
+    0,115,2,0,0,0,0,2,122,23,83,116,114,101,97,109,
+    82,101,97,100,101,114,87,114,105,116,101,114,46,114,101,97,
+    100,78,99,2,0,0,0,0,0,0,0,2,0,0,0,3,
+    0,0,0,67,0,0,0,115,12,0,0,0,124,0,106,0,
+    160,1,124,1,161,1,83,0,41,1,78,41,2,114,132,0,
+    0,0,114,125,0,0,0,41,2,114,52,0,0,0,114,111,
+    0,0,0,114,53,0,0,0,114,53,0,0,0,114,54,0,
+    0,0,114,125,0,0,0,188,2,0,0,115,2,0,0,0,
+    0,2,122,27,83,116,114,101,97,109,82,101,97,100,101,114,
+    87,114,105,116,101,114,46,114,101,97,100,108,105,110,101,99,
+    2,0,0,0,0,0,0,0,2,0,0,0,3,0,0,0,
+    67,0,0,0,115,12,0,0,0,124,0,106,0,160,1,124,
+    1,161,1,83,0,41,1,78,41,2,114,132,0,0,0,114,
+    127,0,0,0,41,2,114,52,0,0,0,114,126,0,0,0,
+    114,53,0,0,0,114,53,0,0,0,114,54,0,0,0,114,
+    127,0,0,0,192,2,0,0,115,2,0,0,0,0,2,122,
+    28,83,116,114,101,97,109,82,101,97,100,101,114,87,114,105,
+    116,101,114,46,114,101,97,100,108,105,110,101,115,99,1,0,
+    0,0,0,0,0,0,1,0,0,0,2,0,0,0,67,0,
+    0,0,115,10,0,0,0,116,0,124,0,106,1,131,1,83,
+    0,41,1,122,52,32,82,101,116,117,114,110,32,116,104,101,
+    32,110,101,120,116,32,100,101,99,111,100,101,100,32,108,105,
+    110,101,32,102,114,111,109,32,116,104,101,32,105,110,112,117,
+    116,32,115,116,114,101,97,109,46,41,2,218,4,110,101,120,
+    116,114,132,0,0,0,41,1,114,52,0,0,0,114,53,0,
+    0,0,114,53,0,0,0,114,54,0,0,0,114,129,0,0,
+    0,196,2,0,0,115,2,0,0,0,0,3,122,27,83,116,
+    114,101,97,109,82,101,97,100,101,114,87,114,105,116,101,114,
+    46,95,95,110,101,120,116,95,95,99,1,0,0,0,0,0,
+    0,0,1,0,0,0,1,0,0,0,67,0,0,0,115,4,
+    0,0,0,124,0,83,0,41,1,78,114,53,0,0,0,41,
+    1,114,52,0,0,0,114,53,0,0,0,114,53,0,0,0,
+    114,54,0,0,0,114,130,0,0,0,201,2,0,0,115,2,
+    0,0,0,0,1,122,27,83,116,114,101,97,109,82,101,97,
+    100,101,114,87,114,105,116,101,114,46,95,95,105,116,101,114,
+    95,95,99,2,0,0,0,0,0,0,0,2,0,0,0,3,
+    0,0,0,67,0,0,0,115,12,0,0,0,124,0,106,0,
+    160,1,124,1,161,1,83,0,41,1,78,41,2,114,133,0,
+    0,0,114,83,0,0,0,41,2,114,52,0,0,0,114,76,
+    0,0,0,114,53,0,0,0,114,53,0,0,0,114,54,0,
+    0,0,114,83,0,0,0,204,2,0,0,115,2,0,0,0,
+    0,2,122,24,83,116,114,101,97,109,82,101,97,100,101,114,
+    87,114,105,116,101,114,46,119,114,105,116,101,99,2,0,0,
+    0,0,0,0,0,2,0,0,0,3,0,0,0,67,0,0,
+    0,115,12,0,0,0,124,0,106,0,160,1,124,1,161,1,
+    83,0,41,1,78,41,2,114,133,0,0,0,114,87,0,0,
+    0,41,2,114,52,0,0,0,114,86,0,0,0,114,53,0,
+    0,0,114,53,0,0,0,114,54,0,0,0,114,87,0,0,
+    0,208,2,0,0,115,2,0,0,0,0,2,122,29,83,116,
+    114,101,97,109,82,101,97,100,101,114,87,114,105,116,101,114,
+    46,119,114,105,116,101,108,105,110,101,115,99,1,0,0,0,
+    0,0,0,0,1,0,0,0,2,0,0,0,67,0,0,0,
+    115,24,0,0,0,124,0,106,0,160,1,161,0,1,0,124,
+    0,106,2,160,1,161,0,1,0,100,0,83,0,41,1,78,
+    41,3,114,132,0,0,0,114,70,0,0,0,114,133,0,0,
+    0,41,1,114,52,0,0,0,114,53,0,0,0,114,53,0,
+    0,0,114,54,0,0,0,114,70,0,0,0,212,2,0,0,
+    115,4,0,0,0,0,2,10,1,122,24,83,116,114,101,97,
+    109,82,101,97,100,101,114,87,114,105,116,101,114,46,114,101,
+    115,101,116,114,0,0,0,0,99,3,0,0,0,0,0,0,
+    0,3,0,0,0,4,0,0,0,67,0,0,0,115,54,0,
+    0,0,124,0,106,0,160,1,124,1,124,2,161,2,1,0,
+    124,0,106,2,160,3,161,0,1,0,124,2,100,1,107,2,
+    114,50,124,1,100,1,107,2,114,50,124,0,106,4,160,3,
+    161,0,1,0,100,0,83,0,41,2,78,114,0,0,0,0,
+    41,5,114,82,0,0,0,114,88,0,0,0,114,132,0,0,
+    0,114,70,0,0,0,114,133,0,0,0,41,3,114,52,0,
+    0,0,114,89,0,0,0,114,90,0,0,0,114,53,0,0,
+    0,114,53,0,0,0,114,54,0,0,0,114,88,0,0,0,
+    217,2,0,0,115,8,0,0,0,0,1,14,1,10,1,16,
+    1,122,23,83,116,114,101,97,109,82,101,97,100,101,114,87,
+    114,105,116,101,114,46,115,101,101,107,99,3,0,0,0,0,
+    0,0,0,3,0,0,0,3,0,0,0,67,0,0,0,115,
+    12,0,0,0,124,2,124,0,106,0,124,1,131,2,83,0,
+    41,1,122,63,32,73,110,104,101,114,105,116,32,97,108,108,
+    32,111,116,104,101,114,32,109,101,116,104,111,100,115,32,102,
+    114,111,109,32,116,104,101,32,117,110,100,101,114,108,121,105,
+    110,103,32,115,116,114,101,97,109,46,10,32,32,32,32,32,
+    32,32,32,41,1,114,82,0,0,0,41,3,114,52,0,0,
+    0,114,47,0,0,0,114,91,0,0,0,114,53,0,0,0,
+    114,53,0,0,0,114,54,0,0,0,114,92,0,0,0,223,
+    2,0,0,115,2,0,0,0,0,5,122,30,83,116,114,101,
+    97,109,82,101,97,100,101,114,87,114,105,116,101,114,46,95,
+    95,103,101,116,97,116,116,114,95,95,99,1,0,0,0,0,
+    0,0,0,1,0,0,0,1,0,0,0,67,0,0,0,115,
+    4,0,0,0,124,0,83,0,41,1,78,114,53,0,0,0,
+    41,1,114,52,0,0,0,114,53,0,0,0,114,53,0,0,
+    0,114,54,0,0,0,114,93,0,0,0,232,2,0,0,115,
+    2,0,0,0,0,1,122,28,83,116,114,101,97,109,82,101,
+    97,100,101,114,87,114,105,116,101,114,46,95,95,101,110,116,
+    101,114,95,95,99,4,0,0,0,0,0,0,0,4,0,0,
+    0,2,0,0,0,67,0,0,0,115,14,0,0,0,124,0,
+    106,0,160,1,161,0,1,0,100,0,83,0,41,1,78,41,
+    2,114,82,0,0,0,114,94,0,0,0,41,4,114,52,0,
+    0,0,114,95,0,0,0,114,96,0,0,0,114,97,0,0,
+    0,114,53,0,0,0,114,53,0,0,0,114,54,0,0,0,
+    114,98,0,0,0,235,2,0,0,115,2,0,0,0,0,1,
+    122,27,83,116,114,101,97,109,82,101,97,100,101,114,87,114,
+    105,116,101,114,46,95,95,101,120,105,116,95,95,41,1,114,
+    62,0,0,0,114,119,0,0,0,41,1,114,119,0,0,0,
+    41,1,78,41,1,78,41,1,114,0,0,0,0,41,19,114,
+    60,0,0,0,114,56,0,0,0,114,57,0,0,0,114,61,
+    0,0,0,218,8,101,110,99,111,100,105,110,103,114,68,0,
+    0,0,114,107,0,0,0,114,125,0,0,0,114,127,0,0,
+    0,114,129,0,0,0,114,130,0,0,0,114,83,0,0,0,
+    114,87,0,0,0,114,70,0,0,0,114,88,0,0,0,114,
+    91,0,0,0,114,92,0,0,0,114,93,0,0,0,114,98,
+    0,0,0,114,53,0,0,0,114,53,0,0,0,114,53,0,
+    0,0,114,54,0,0,0,114,25,0,0,0,153,2,0,0,
+    115,30,0,0,0,8,9,4,2,4,2,10,18,10,4,10,
+    4,10,4,8,5,8,3,8,4,8,4,8,5,10,7,12,
+    8,8,3,99,0,0,0,0,0,0,0,0,0,0,0,0,
+    3,0,0,0,64,0,0,0,115,132,0,0,0,101,0,90,
+    1,100,0,90,2,100,1,90,3,100,2,90,4,100,2,90,
+    5,100,30,100,4,100,5,132,1,90,6,100,32,100,7,100,
+    8,132,1,90,7,100,33,100,10,100,11,132,1,90,8,100,
+    34,100,12,100,13,132,1,90,9,100,14,100,15,132,0,90,
+    10,100,16,100,17,132,0,90,11,100,18,100,19,132,0,90,
+    12,100,20,100,21,132,0,90,13,100,22,100,23,132,0,90,
+    14,101,15,102,1,100,24,100,25,132,1,90,16,100,26,100,
+    27,132,0,90,17,100,28,100,29,132,0,90,18,100,9,83,
+    0,41,35,114,26,0,0,0,97,66,2,0,0,32,83,116,
+    114,101,97,109,82,101,99,111,100,101,114,32,105,110,115,116,
+    97,110,99,101,115,32,116,114,97,110,115,108,97,116,101,32,
+    100,97,116,97,32,102,114,111,109,32,111,110,101,32,101,110,
+    99,111,100,105,110,103,32,116,111,32,97,110,111,116,104,101,
+    114,46,10,10,32,32,32,32,32,32,32,32,84,104,101,121,
+    32,117,115,101,32,116,104,101,32,99,111,109,112,108,101,116,
+    101,32,115,101,116,32,111,102,32,65,80,73,115,32,114,101,
+    116,117,114,110,101,100,32,98,121,32,116,104,101,10,32,32,
+    32,32,32,32,32,32,99,111,100,101,99,115,46,108,111,111,
+    107,117,112,40,41,32,102,117,110,99,116,105,111,110,32,116,
+    111,32,105,109,112,108,101,109,101,110,116,32,116,104,101,105,
+    114,32,116,97,115,107,46,10,10,32,32,32,32,32,32,32,
+    32,68,97,116,97,32,119,114,105,116,116,101,110,32,116,111,
+    32,116,104,101,32,83,116,114,101,97,109,82,101,99,111,100,
+    101,114,32,105,115,32,102,105,114,115,116,32,100,101,99,111,
+    100,101,100,32,105,110,116,111,32,97,110,10,32,32,32,32,
+    32,32,32,32,105,110,116,101,114,109,101,100,105,97,116,101,
+    32,102,111,114,109,97,116,32,40,100,101,112,101,110,100,105,
+    110,103,32,111,110,32,116,104,101,32,34,100,101,99,111,100,
+    101,34,32,99,111,100,101,99,41,32,97,110,100,32,116,104,
+    101,110,10,32,32,32,32,32,32,32,32,119,114,105,116,116,
+    101,110,32,116,111,32,116,104,101,32,117,110,100,101,114,108,
+    121,105,110,103,32,115,116,114,101,97,109,32,117,115,105,110,
+    103,32,97,110,32,105,110,115,116,97,110,99,101,32,111,102,
+    32,116,104,101,32,112,114,111,118,105,100,101,100,10,32,32,
+    32,32,32,32,32,32,87,114,105,116,101,114,32,99,108,97,
+    115,115,46,10,10,32,32,32,32,32,32,32,32,73,110,32,
+    116,104,101,32,111,116,104,101,114,32,100,105,114,101,99,116,
+    105,111,110,44,32,100,97,116,97,32,105,115,32,114,101,97,
+    100,32,102,114,111,109,32,116,104,101,32,117,110,100,101,114,
+    108,121,105,110,103,32,115,116,114,101,97,109,32,117,115,105,
+    110,103,10,32,32,32,32,32,32,32,32,97,32,82,101,97,
+    100,101,114,32,105,110,115,116,97,110,99,101,32,97,110,100,
+    32,116,104,101,110,32,101,110,99,111,100,101,100,32,97,110,
+    100,32,114,101,116,117,114,110,101,100,32,116,111,32,116,104,
+    101,32,99,97,108,108,101,114,46,10,10,32,32,32,32,114,
+    131,0,0,0,114,62,0,0,0,99,7,0,0,0,0,0,
+    0,0,7,0,0,0,3,0,0,0,67,0,0,0,115,52,
+    0,0,0,124,1,124,0,95,0,124,2,124,0,95,1,124,
+    3,124,0,95,2,124,4,124,1,124,6,131,2,124,0,95,
+    3,124,5,124,1,124,6,131,2,124,0,95,4,124,6,124,
+    0,95,5,100,1,83,0,41,2,97,233,2,0,0,32,67,
+    114,101,97,116,101,115,32,97,32,83,116,114,101,97,109,82,
+    101,99,111,100,101,114,32,105,110,115,116,97,110,99,101,32,
+    119,104,105,99,104,32,105,109,112,108,101,109,101,110,116,115,
+    32,97,32,116,119,111,45,119,97,121,10,32,32,32,32,32,
+    32,32,32,32,32,32,32,99,111,110,118,101,114,115,105,111,
+    110,58,32,101,110,99,111,100,101,32,97,110,100,32,100,101,
+    99,111,100,101,32,119,111,114,107,32,111,110,32,116,104,101,
+    32,102,114,111,110,116,101,110,100,32,40,116,104,101,10,32,
+    32,32,32,32,32,32,32,32,32,32,32,100,97,116,97,32,
+    118,105,115,105,98,108,101,32,116,111,32,46,114,101,97,100,
+    40,41,32,97,110,100,32,46,119,114,105,116,101,40,41,41,
+    32,119,104,105,108,101,32,82,101,97,100,101,114,32,97,110,
+    100,32,87,114,105,116,101,114,10,32,32,32,32,32,32,32,
+    32,32,32,32,32,119,111,114,107,32,111,110,32,116,104,101,
+    32,98,97,99,107,101,110,100,32,40,116,104,101,32,100,97,
+    116,97,32,105,110,32,115,116,114,101,97,109,41,46,10,10,
+    32,32,32,32,32,32,32,32,32,32,32,32,89,111,117,32,
+    99,97,110,32,117,115,101,32,116,104,101,115,101,32,111,98,
+    106,101,99,116,115,32,116,111,32,100,111,32,116,114,97,110,
+    115,112,97,114,101,110,116,10,32,32,32,32,32,32,32,32,
+    32,32,32,32,116,114,97,110,115,99,111,100,105,110,103,115,
+    32,102,114,111,109,32,101,46,103,46,32,108,97,116,105,110,
+    45,49,32,116,111,32,117,116,102,45,56,32,97,110,100,32,
+    98,97,99,107,46,10,10,32,32,32,32,32,32,32,32,32,
+    32,32,32,115,116,114,101,97,109,32,109,117,115,116,32,98,
+    101,32,97,32,102,105,108,101,45,108,105,107,101,32,111,98,
+    106,101,99,116,46,10,10,32,32,32,32,32,32,32,32,32,
+    32,32,32,101,110,99,111,100,101,32,97,110,100,32,100,101,
+    99,111,100,101,32,109,117,115,116,32,97,100,104,101,114,101,
+    32,116,111,32,116,104,101,32,67,111,100,101,99,32,105,110,
+    116,101,114,102,97,99,101,59,32,82,101,97,100,101,114,32,
+    97,110,100,10,32,32,32,32,32,32,32,32,32,32,32,32,
+    87,114,105,116,101,114,32,109,117,115,116,32,98,101,32,102,
+    97,99,116,111,114,121,32,102,117,110,99,116,105,111,110,115,
+    32,111,114,32,99,108,97,115,115,101,115,32,112,114,111,118,
+    105,100,105,110,103,32,116,104,101,10,32,32,32,32,32,32,
+    32,32,32,32,32,32,83,116,114,101,97,109,82,101,97,100,
+    101,114,32,97,110,100,32,83,116,114,101,97,109,87,114,105,
+    116,101,114,32,105,110,116,101,114,102,97,99,101,115,32,114,
+    101,115,112,46,10,10,32,32,32,32,32,32,32,32,32,32,
+    32,32,69,114,114,111,114,32,104,97,110,100,108,105,110,103,
+    32,105,115,32,100,111,110,101,32,105,110,32,116,104,101,32,
+    115,97,109,101,32,119,97,121,32,97,115,32,100,101,102,105,
+    110,101,100,32,102,111,114,32,116,104,101,10,32,32,32,32,
+    32,32,32,32,32,32,32,32,83,116,114,101,97,109,87,114,
+    105,116,101,114,47,82,101,97,100,101,114,115,46,10,10,32,
+    32,32,32,32,32,32,32,78,41,6,114,82,0,0,0,114,
+    33,0,0,0,114,34,0,0,0,114,132,0,0,0,114,133,
+    0,0,0,114,65,0,0,0,41,7,114,52,0,0,0,114,
+    82,0,0,0,114,33,0,0,0,114,34,0,0,0,114,134,
+    0,0,0,114,135,0,0,0,114,65,0,0,0,114,53,0,
+    0,0,114,53,0,0,0,114,54,0,0,0,114,68,0,0,
+    0,4,3,0,0,115,12,0,0,0,0,21,6,1,6,1,
+    6,1,12,1,12,1,122,22,83,116,114,101,97,109,82,101,
+    99,111,100,101,114,46,95,95,105,110,105,116,95,95,114,104,
+    0,0,0,99,2,0,0,0,0,0,0,0,4,0,0,0,
+    4,0,0,0,67,0,0,0,115,34,0,0,0,124,0,106,
+    0,160,1,124,1,161,1,125,2,124,0,160,2,124,2,124,
+    0,106,3,161,2,92,2,125,2,125,3,124,2,83,0,41,
+    1,78,41,4,114,132,0,0,0,114,107,0,0,0,114,33,
+    0,0,0,114,65,0,0,0,41,4,114,52,0,0,0,114,
+    111,0,0,0,114,76,0,0,0,218,12,98,121,116,101,115,
+    101,110,99,111,100,101,100,114,53,0,0,0,114,53,0,0,
+    0,114,54,0,0,0,114,107,0,0,0,32,3,0,0,115,
+    6,0,0,0,0,2,12,1,18,1,122,18,83,116,114,101,
+    97,109,82,101,99,111,100,101,114,46,114,101,97,100,78,99,
+    2,0,0,0,0,0,0,0,4,0,0,0,4,0,0,0,
+    67,0,0,0,115,54,0,0,0,124,1,100,0,107,8,114,
+    20,124,0,106,0,160,1,161,0,125,2,110,12,124,0,106,
+    0,160,1,124,1,161,1,125,2,124,0,160,2,124,2,124,
+    0,106,3,161,2,92,2,125,2,125,3,124,2,83,0,41,
+    1,78,41,4,114,132,0,0,0,114,125,0,0,0,114,33,
+    0,0,0,114,65,0,0,0,41,4,114,52,0,0,0,114,
+    111,0,0,0,114,76,0,0,0,114,138,0,0,0,114,53,
+    0,0,0,114,53,0,0,0,114,54,0,0,0,114,125,0,
+    0,0,38,3,0,0,115,10,0,0,0,0,2,8,1,12,
+    2,12,1,18,1,122,22,83,116,114,101,97,109,82,101,99,
+    111,100,101,114,46,114,101,97,100,108,105,110,101,99,2,0,
+    0,0,0,0,0,0,4,0,0,0,4,0,0,0,67,0,
+    0,0,115,40,0,0,0,124,0,106,0,160,1,161,0,125,
+    2,124,0,160,2,124,2,124,0,106,3,161,2,92,2,125,
+    2,125,3,124,2,106,4,100,1,100,2,141,1,83,0,41,
+    3,78,84,41,1,114,105,0,0,0,41,5,114,132,0,0,
+    0,114,107,0,0,0,114,33,0,0,0,114,65,0,0,0,
+    114,110,0,0,0,41,4,114,52,0,0,0,114,126,0,0,
+    0,114,76,0,0,0,114,138,0,0,0,114,53,0,0,0,
+    114,53,0,0,0,114,54,0,0,0,114,127,0,0,0,47,
+    3,0,0,115,6,0,0,0,0,2,10,1,18,1,122,23,
+    83,116,114,101,97,109,82,101,99,111,100,101,114,46,114,101,
+    97,100,108,105,110,101,115,99,1,0,0,0,0,0,0,0,
+    3,0,0,0,4,0,0,0,67,0,0,0,115,32,0,0,
+    0,116,0,124,0,106,1,131,1,125,1,124,0,160,2,124,
+    1,124,0,106,3,161,2,92,2,125,1,125,2,124,1,83,
+    0,41,1,122,52,32,82,101,116,117,114,110,32,116,104,101,
+    32,110,101,120,116,32,100,101,99,111,100,101,100,32,108,105,
+    110,101,32,102,114,111,109,32,116,104,101,32,105,110,112,117,
+    116,32,115,116,114,101,97,109,46,41,4,114,136,0,0,0,
+    114,132,0,0,0,114,33,0,0,0,114,65,0,0,0,41,
+    3,114,52,0,0,0,114,76,0,0,0,114,138,0,0,0,
+    114,53,0,0,0,114,53,0,0,0,114,54,0,0,0,114,
+    129,0,0,0,53,3,0,0,115,6,0,0,0,0,3,10,
+    1,18,1,122,22,83,116,114,101,97,109,82,101,99,111,100,
+    101,114,46,95,95,110,101,120,116,95,95,99,1,0,0,0,
+    0,0,0,0,1,0,0,0,1,0,0,0,67,0,0,0,
+    115,4,0,0,0,124,0,83,0,41,1,78,114,53,0,0,
+    0,41,1,114,52,0,0,0,114,53,0,0,0,114,53,0,
+    0,0,114,54,0,0,0,114,130,0,0,0,60,3,0,0,
+    115,2,0,0,0,0,1,122,22,83,116,114,101,97,109,82,
+    101,99,111,100,101,114,46,95,95,105,116,101,114,95,95,99,
+    2,0,0,0,0,0,0,0,3,0,0,0,4,0,0,0,
+    67,0,0,0,115,30,0,0,0,124,0,160,0,124,1,124,
+    0,106,1,161,2,92,2,125,1,125,2,124,0,106,2,160,
+    3,124,1,161,1,83,0,41,1,78,41,4,114,34,0,0,
+    0,114,65,0,0,0,114,133,0,0,0,114,83,0,0,0,
+    41,3,114,52,0,0,0,114,76,0,0,0,218,12,98,121,
+    116,101,115,100,101,99,111,100,101,100,114,53,0,0,0,114,
+    53,0,0,0,114,54,0,0,0,114,83,0,0,0,63,3,
+    0,0,115,4,0,0,0,0,2,18,1,122,19,83,116,114,
+    101,97,109,82,101,99,111,100,101,114,46,119,114,105,116,101,
+    99,2,0,0,0,0,0,0,0,4,0,0,0,4,0,0,
+    0,67,0,0,0,115,40,0,0,0,100,1,160,0,124,1,
+    161,1,125,2,124,0,160,1,124,2,124,0,106,2,161,2,
+    92,2,125,2,125,3,124,0,106,3,160,4,124,2,161,1,
+    83,0,41,2,78,114,66,0,0,0,41,5,114,85,0,0,
+    0,114,34,0,0,0,114,65,0,0,0,114,133,0,0,0,
+    114,83,0,0,0,41,4,114,52,0,0,0,114,86,0,0,
+    0,114,76,0,0,0,114,139,0,0,0,114,53,0,0,0,
+    114,53,0,0,0,114,54,0,0,0,114,87,0,0,0,68,
+    3,0,0,115,6,0,0,0,0,2,10,1,18,1,122,24,
+    83,116,114,101,97,109,82,101,99,111,100,101,114,46,119,114,
+    105,116,101,108,105,110,101,115,99,1,0,0,0,0,0,0,
+    0,1,0,0,0,2,0,0,0,67,0,0,0,115,24,0,
+    0,0,124,0,106,0,160,1,161,0,1,0,124,0,106,2,
+    160,1,161,0,1,0,100,0,83,0,41,1,78,41,3,114,
+    132,0,0,0,114,70,0,0,0,114,133,0,0,0,41,1,
+    114,52,0,0,0,114,53,0,0,0,114,53,0,0,0,114,
+    54,0,0,0,114,70,0,0,0,74,3,0,0,115,4,0,
+    0,0,0,2,10,1,122,19,83,116,114,101,97,109,82,101,
+    99,111,100,101,114,46,114,101,115,101,116,99,3,0,0,0,
+    0,0,0,0,3,0,0,0,3,0,0,0,67,0,0,0,
+    115,12,0,0,0,124,2,124,0,106,0,124,1,131,2,83,
+    0,41,1,122,63,32,73,110,104,101,114,105,116,32,97,108,
+    108,32,111,116,104,101,114,32,109,101,116,104,111,100,115,32,
+    102,114,111,109,32,116,104,101,32,117,110,100,101,114,108,121,
+    105,110,103,32,115,116,114,101,97,109,46,10,32,32,32,32,
+    32,32,32,32,41,1,114,82,0,0,0,41,3,114,52,0,
+    0,0,114,47,0,0,0,114,91,0,0,0,114,53,0,0,
+    0,114,53,0,0,0,114,54,0,0,0,114,92,0,0,0,
+    79,3,0,0,115,2,0,0,0,0,5,122,25,83,116,114,
+    101,97,109,82,101,99,111,100,101,114,46,95,95,103,101,116,
+    97,116,116,114,95,95,99,1,0,0,0,0,0,0,0,1,
+    0,0,0,1,0,0,0,67,0,0,0,115,4,0,0,0,
+    124,0,83,0,41,1,78,114,53,0,0,0,41,1,114,52,
+    0,0,0,114,53,0,0,0,114,53,0,0,0,114,54,0,
+    0,0,114,93,0,0,0,86,3,0,0,115,2,0,0,0,
+    0,1,122,23,83,116,114,101,97,109,82,101,99,111,100,101,
+    114,46,95,95,101,110,116,101,114,95,95,99,4,0,0,0,
+    0,0,0,0,4,0,0,0,2,0,0,0,67,0,0,0,
+    115,14,0,0,0,124,0,106,0,160,1,161,0,1,0,100,
+    0,83,0,41,1,78,41,2,114,82,0,0,0,114,94,0,
+    0,0,41,4,114,52,0,0,0,114,95,0,0,0,114,96,
+    0,0,0,114,97,0,0,0,114,53,0,0,0,114,53,0,
+    0,0,114,54,0,0,0,114,98,0,0,0,89,3,0,0,
+    115,2,0,0,0,0,1,122,22,83,116,114,101,97,109,82,
+    101,99,111,100,101,114,46,95,95,101,120,105,116,95,95,41,
+    1,114,62,0,0,0,114,119,0,0,0,41,1,114,119,0,
+    0,0,41,1,78,41,1,78,41,19,114,60,0,0,0,114,
+    56,0,0,0,114,57,0,0,0,114,61,0,0,0,218,13,
+    100,97,116,97,95,101,110,99,111,100,105,110,103,218,13,102,
+    105,108,101,95,101,110,99,111,100,105,110,103,114,68,0,0,
+    0,114,107,0,0,0,114,125,0,0,0,114,127,0,0,0,
+    114,129,0,0,0,114,130,0,0,0,114,83,0,0,0,114,
+    87,0,0,0,114,70,0,0,0,114,91,0,0,0,114,92,
+    0,0,0,114,93,0,0,0,114,98,0,0,0,114,53,0,
+    0,0,114,53,0,0,0,114,53,0,0,0,114,54,0,0,
+    0,114,26,0,0,0,240,2,0,0,115,30,0,0,0,8,
+    15,4,2,4,1,4,3,10,27,10,6,10,9,10,6,8,
+    7,8,3,8,5,8,6,8,6,12,6,8,3,218,1,114,
+    114,62,0,0,0,114,104,0,0,0,99,5,0,0,0,0,
+    0,0,0,8,0,0,0,5,0,0,0,67,0,0,0,115,
+    86,0,0,0,124,2,100,1,107,9,114,24,100,2,124,1,
+    107,7,114,24,124,1,100,2,23,0,125,1,116,0,160,1,
+    124,0,124,1,124,4,161,3,125,5,124,2,100,1,107,8,
+    114,50,124,5,83,0,116,2,124,2,131,1,125,6,116,3,
+    124,5,124,6,106,4,124,6,106,5,124,3,131,4,125,7,
+    124,2,124,7,95,6,124,7,83,0,41,3,97,62,4,0,
+    0,32,79,112,101,110,32,97,110,32,101,110,99,111,100,101,
+    100,32,102,105,108,101,32,117,115,105,110,103,32,116,104,101,
+    32,103,105,118,101,110,32,109,111,100,101,32,97,110,100,32,
+    114,101,116,117,114,110,10,32,32,32,32,32,32,32,32,97,
+    32,119,114,97,112,112,101,100,32,118,101,114,115,105,111,110,
+    32,112,114,111,118,105,100,105,110,103,32,116,114,97,110,115,
+    112,97,114,101,110,116,32,101,110,99,111,100,105,110,103,47,
+    100,101,99,111,100,105,110,103,46,10,10,32,32,32,32,32,
+    32,32,32,78,111,116,101,58,32,84,104,101,32,119,114,97,
+    112,112,101,100,32,118,101,114,115,105,111,110,32,119,105,108,
+    108,32,111,110,108,121,32,97,99,99,101,112,116,32,116,104,
+    101,32,111,98,106,101,99,116,32,102,111,114,109,97,116,10,
+    32,32,32,32,32,32,32,32,100,101,102,105,110,101,100,32,
+    98,121,32,116,104,101,32,99,111,100,101,99,115,44,32,105,
+    46,101,46,32,85,110,105,99,111,100,101,32,111,98,106,101,
+    99,116,115,32,102,111,114,32,109,111,115,116,32,98,117,105,
+    108,116,105,110,10,32,32,32,32,32,32,32,32,99,111,100,
+    101,99,115,46,32,79,117,116,112,117,116,32,105,115,32,97,
+    108,115,111,32,99,111,100,101,99,32,100,101,112,101,110,100,
+    101,110,116,32,97,110,100,32,119,105,108,108,32,117,115,117,
+    97,108,108,121,32,98,101,10,32,32,32,32,32,32,32,32,
+    85,110,105,99,111,100,101,32,97,115,32,119,101,108,108,46,
+    10,10,32,32,32,32,32,32,32,32,85,110,100,101,114,108,
+    121,105,110,103,32,101,110,99,111,100,101,100,32,102,105,108,
+    101,115,32,97,114,101,32,97,108,119,97,121,115,32,111,112,
+    101,110,101,100,32,105,110,32,98,105,110,97,114,121,32,109,
+    111,100,101,46,10,32,32,32,32,32,32,32,32,84,104,101,
+    32,100,101,102,97,117,108,116,32,102,105,108,101,32,109,111,
+    100,101,32,105,115,32,39,114,39,44,32,109,101,97,110,105,
+    110,103,32,116,111,32,111,112,101,110,32,116,104,101,32,102,
+    105,108,101,32,105,110,32,114,101,97,100,32,109,111,100,101,
+    46,10,10,32,32,32,32,32,32,32,32,101,110,99,111,100,
+    105,110,103,32,115,112,101,99,105,102,105,101,115,32,116,104,
+    101,32,101,110,99,111,100,105,110,103,32,119,104,105,99,104,
+    32,105,115,32,116,111,32,98,101,32,117,115,101,100,32,102,
+    111,114,32,116,104,101,10,32,32,32,32,32,32,32,32,102,
+    105,108,101,46,10,10,32,32,32,32,32,32,32,32,101,114,
+    114,111,114,115,32,109,97,121,32,98,101,32,103,105,118,101,
+    110,32,116,111,32,100,101,102,105,110,101,32,116,104,101,32,
+    101,114,114,111,114,32,104,97,110,100,108,105,110,103,46,32,
+    73,116,32,100,101,102,97,117,108,116,115,10,32,32,32,32,
+    32,32,32,32,116,111,32,39,115,116,114,105,99,116,39,32,
+    119,104,105,99,104,32,99,97,117,115,101,115,32,86,97,108,
+    117,101,69,114,114,111,114,115,32,116,111,32,98,101,32,114,
+    97,105,115,101,100,32,105,110,32,99,97,115,101,32,97,110,
+    10,32,32,32,32,32,32,32,32,101,110,99,111,100,105,110,
+    103,32,101,114,114,111,114,32,111,99,99,117,114,115,46,10,
+    10,32,32,32,32,32,32,32,32,98,117,102,102,101,114,105,
+    110,103,32,104,97,115,32,116,104,101,32,115,97,109,101,32,
+    109,101,97,110,105,110,103,32,97,115,32,102,111,114,32,116,
+    104,101,32,98,117,105,108,116,105,110,32,111,112,101,110,40,
+    41,32,65,80,73,46,10,32,32,32,32,32,32,32,32,73,
+    116,32,100,101,102,97,117,108,116,115,32,116,111,32,108,105,
+    110,101,32,98,117,102,102,101,114,101,100,46,10,10,32,32,
+    32,32,32,32,32,32,84,104,101,32,114,101,116,117,114,110,
+    101,100,32,119,114,97,112,112,101,100,32,102,105,108,101,32,
+    111,98,106,101,99,116,32,112,114,111,118,105,100,101,115,32,
+    97,110,32,101,120,116,114,97,32,97,116,116,114,105,98,117,
+    116,101,10,32,32,32,32,32,32,32,32,46,101,110,99,111,
+    100,105,110,103,32,119,104,105,99,104,32,97,108,108,111,119,
+    115,32,113,117,101,114,121,105,110,103,32,116,104,101,32,117,
+    115,101,100,32,101,110,99,111,100,105,110,103,46,32,84,104,
+    105,115,10,32,32,32,32,32,32,32,32,97,116,116,114,105,
+    98,117,116,101,32,105,115,32,111,110,108,121,32,97,118,97,
+    105,108,97,98,108,101,32,105,102,32,97,110,32,101,110,99,
+    111,100,105,110,103,32,119,97,115,32,115,112,101,99,105,102,
+    105,101,100,32,97,115,10,32,32,32,32,32,32,32,32,112,
+    97,114,97,109,101,116,101,114,46,10,10,32,32,32,32,78,
+    218,1,98,41,7,218,8,98,117,105,108,116,105,110,115,114,
+    3,0,0,0,114,2,0,0,0,114,25,0,0,0,114,51,
+    0,0,0,114,50,0,0,0,114,137,0,0,0,41,8,218,
+    8,102,105,108,101,110,97,109,101,218,4,109,111,100,101,114,
+    137,0,0,0,114,65,0,0,0,90,9,98,117,102,102,101,
+    114,105,110,103,218,4,102,105,108,101,90,4,105,110,102,111,
+    90,3,115,114,119,114,53,0,0,0,114,53,0,0,0,114,
+    54,0,0,0,114,3,0,0,0,94,3,0,0,115,20,0,
+    0,0,0,29,8,1,8,2,8,1,14,1,8,1,4,1,
+    8,1,18,2,6,1,99,4,0,0,0,0,0,0,0,7,
+    0,0,0,7,0,0,0,67,0,0,0,115,70,0,0,0,
+    124,2,100,1,107,8,114,12,124,1,125,2,116,0,124,1,
+    131,1,125,4,116,0,124,2,131,1,125,5,116,1,124,0,
+    124,4,106,2,124,4,106,3,124,5,106,4,124,5,106,5,
+    124,3,131,6,125,6,124,1,124,6,95,6,124,2,124,6,
+    95,7,124,6,83,0,41,2,97,218,3,0,0,32,82,101,
+    116,117,114,110,32,97,32,119,114,97,112,112,101,100,32,118,
+    101,114,115,105,111,110,32,111,102,32,102,105,108,101,32,119,
+    104,105,99,104,32,112,114,111,118,105,100,101,115,32,116,114,
+    97,110,115,112,97,114,101,110,116,10,32,32,32,32,32,32,
+    32,32,101,110,99,111,100,105,110,103,32,116,114,97,110,115,
+    108,97,116,105,111,110,46,10,10,32,32,32,32,32,32,32,
+    32,68,97,116,97,32,119,114,105,116,116,101,110,32,116,111,
+    32,116,104,101,32,119,114,97,112,112,101,100,32,102,105,108,
+    101,32,105,115,32,100,101,99,111,100,101,100,32,97,99,99,
+    111,114,100,105,110,103,10,32,32,32,32,32,32,32,32,116,
+    111,32,116,104,101,32,103,105,118,101,110,32,100,97,116,97,
+    95,101,110,99,111,100,105,110,103,32,97,110,100,32,116,104,
+    101,110,32,101,110,99,111,100,101,100,32,116,111,32,116,104,
+    101,32,117,110,100,101,114,108,121,105,110,103,10,32,32,32,
+    32,32,32,32,32,102,105,108,101,32,117,115,105,110,103,32,
+    102,105,108,101,95,101,110,99,111,100,105,110,103,46,32,84,
+    104,101,32,105,110,116,101,114,109,101,100,105,97,116,101,32,
+    100,97,116,97,32,116,121,112,101,10,32,32,32,32,32,32,
+    32,32,119,105,108,108,32,117,115,117,97,108,108,121,32,98,
+    101,32,85,110,105,99,111,100,101,32,98,117,116,32,100,101,
+    112,101,110,100,115,32,111,110,32,116,104,101,32,115,112,101,
+    99,105,102,105,101,100,32,99,111,100,101,99,115,46,10,10,
+    32,32,32,32,32,32,32,32,66,121,116,101,115,32,114,101,
+    97,100,32,102,114,111,109,32,116,104,101,32,102,105,108,101,
+    32,97,114,101,32,100,101,99,111,100,101,100,32,117,115,105,
+    110,103,32,102,105,108,101,95,101,110,99,111,100,105,110,103,
+    32,97,110,100,32,116,104,101,110,10,32,32,32,32,32,32,
+    32,32,112,97,115,115,101,100,32,98,97,99,107,32,116,111,
+    32,116,104,101,32,99,97,108,108,101,114,32,101,110,99,111,
+    100,101,100,32,117,115,105,110,103,32,100,97,116,97,95,101,
+    110,99,111,100,105,110,103,46,10,10,32,32,32,32,32,32,
+    32,32,73,102,32,102,105,108,101,95,101,110,99,111,100,105,
+    110,103,32,105,115,32,110,111,116,32,103,105,118,101,110,44,
+    32,105,116,32,100,101,102,97,117,108,116,115,32,116,111,32,
+    100,97,116,97,95,101,110,99,111,100,105,110,103,46,10,10,
+    32,32,32,32,32,32,32,32,101,114,114,111,114,115,32,109,
+    97,121,32,98,101,32,103,105,118,101,110,32,116,111,32,100,
+    101,102,105,110,101,32,116,104,101,32,101,114,114,111,114,32,
+    104,97,110,100,108,105,110,103,46,32,73,116,32,100,101,102,
+    97,117,108,116,115,10,32,32,32,32,32,32,32,32,116,111,
+    32,39,115,116,114,105,99,116,39,32,119,104,105,99,104,32,
+    99,97,117,115,101,115,32,86,97,108,117,101,69,114,114,111,
+    114,115,32,116,111,32,98,101,32,114,97,105,115,101,100,32,
+    105,110,32,99,97,115,101,32,97,110,10,32,32,32,32,32,
+    32,32,32,101,110,99,111,100,105,110,103,32,101,114,114,111,
+    114,32,111,99,99,117,114,115,46,10,10,32,32,32,32,32,
+    32,32,32,84,104,101,32,114,101,116,117,114,110,101,100,32,
+    119,114,97,112,112,101,100,32,102,105,108,101,32,111,98,106,
+    101,99,116,32,112,114,111,118,105,100,101,115,32,116,119,111,
+    32,101,120,116,114,97,32,97,116,116,114,105,98,117,116,101,
+    115,10,32,32,32,32,32,32,32,32,46,100,97,116,97,95,
+    101,110,99,111,100,105,110,103,32,97,110,100,32,46,102,105,
+    108,101,95,101,110,99,111,100,105,110,103,32,119,104,105,99,
+    104,32,114,101,102,108,101,99,116,32,116,104,101,32,103,105,
+    118,101,110,10,32,32,32,32,32,32,32,32,112,97,114,97,
+    109,101,116,101,114,115,32,111,102,32,116,104,101,32,115,97,
+    109,101,32,110,97,109,101,46,32,84,104,101,32,97,116,116,
+    114,105,98,117,116,101,115,32,99,97,110,32,98,101,32,117,
+    115,101,100,32,102,111,114,10,32,32,32,32,32,32,32,32,
+    105,110,116,114,111,115,112,101,99,116,105,111,110,32,98,121,
+    32,80,121,116,104,111,110,32,112,114,111,103,114,97,109,115,
+    46,10,10,32,32,32,32,78,41,8,114,2,0,0,0,114,
+    26,0,0,0,114,33,0,0,0,114,34,0,0,0,114,51,
+    0,0,0,114,50,0,0,0,114,140,0,0,0,114,141,0,
+    0,0,41,7,114,147,0,0,0,114,140,0,0,0,114,141,
+    0,0,0,114,65,0,0,0,90,9,100,97,116,97,95,105,
+    110,102,111,90,9,102,105,108,101,95,105,110,102,111,90,2,
+    115,114,114,53,0,0,0,114,53,0,0,0,114,54,0,0,
+    0,114,4,0,0,0,136,3,0,0,115,18,0,0,0,0,
+    25,8,1,4,1,8,1,8,1,12,1,14,2,6,1,6,
+    1,99,1,0,0,0,0,0,0,0,1,0,0,0,2,0,
+    0,0,67,0,0,0,115,10,0,0,0,116,0,124,0,131,
+    1,106,1,83,0,41,1,122,158,32,76,111,111,107,117,112,
+    32,117,112,32,116,104,101,32,99,111,100,101,99,32,102,111,
+    114,32,116,104,101,32,103,105,118,101,110,32,101,110,99,111,
+    100,105,110,103,32,97,110,100,32,114,101,116,117,114,110,10,
+    32,32,32,32,32,32,32,32,105,116,115,32,101,110,99,111,
+    100,101,114,32,102,117,110,99,116,105,111,110,46,10,10,32,
+    32,32,32,32,32,32,32,82,97,105,115,101,115,32,97,32,
+    76,111,111,107,117,112,69,114,114,111,114,32,105,110,32,99,
+    97,115,101,32,116,104,101,32,101,110,99,111,100,105,110,103,
+    32,99,97,110,110,111,116,32,98,101,32,102,111,117,110,100,
+    46,10,10,32,32,32,32,41,2,114,2,0,0,0,114,33,
+    0,0,0,41,1,114,137,0,0,0,114,53,0,0,0,114,
+    53,0,0,0,114,54,0,0,0,114,27,0,0,0,174,3,
+    0,0,115,2,0,0,0,0,8,99,1,0,0,0,0,0,
+    0,0,1,0,0,0,2,0,0,0,67,0,0,0,115,10,
+    0,0,0,116,0,124,0,131,1,106,1,83,0,41,1,122,
+    158,32,76,111,111,107,117,112,32,117,112,32,116,104,101,32,
+    99,111,100,101,99,32,102,111,114,32,116,104,101,32,103,105,
+    118,101,110,32,101,110,99,111,100,105,110,103,32,97,110,100,
+    32,114,101,116,117,114,110,10,32,32,32,32,32,32,32,32,
+    105,116,115,32,100,101,99,111,100,101,114,32,102,117,110,99,
+    116,105,111,110,46,10,10,32,32,32,32,32,32,32,32,82,
+    97,105,115,101,115,32,97,32,76,111,111,107,117,112,69,114,
+    114,111,114,32,105,110,32,99,97,115,101,32,116,104,101,32,
+    101,110,99,111,100,105,110,103,32,99,97,110,110,111,116,32,
+    98,101,32,102,111,117,110,100,46,10,10,32,32,32,32,41,
+    2,114,2,0,0,0,114,34,0,0,0,41,1,114,137,0,
+    0,0,114,53,0,0,0,114,53,0,0,0,114,54,0,0,
+    0,114,28,0,0,0,184,3,0,0,115,2,0,0,0,0,
+    8,99,1,0,0,0,0,0,0,0,2,0,0,0,2,0,
+    0,0,67,0,0,0,115,30,0,0,0,116,0,124,0,131,
+    1,106,1,125,1,124,1,100,1,107,8,114,26,116,2,124,
+    0,131,1,130,1,124,1,83,0,41,2,122,247,32,76,111,
+    111,107,117,112,32,117,112,32,116,104,101,32,99,111,100,101,
+    99,32,102,111,114,32,116,104,101,32,103,105,118,101,110,32,
+    101,110,99,111,100,105,110,103,32,97,110,100,32,114,101,116,
+    117,114,110,10,32,32,32,32,32,32,32,32,105,116,115,32,
+    73,110,99,114,101,109,101,110,116,97,108,69,110,99,111,100,
+    101,114,32,99,108,97,115,115,32,111,114,32,102,97,99,116,
+    111,114,121,32,102,117,110,99,116,105,111,110,46,10,10,32,
+    32,32,32,32,32,32,32,82,97,105,115,101,115,32,97,32,
+    76,111,111,107,117,112,69,114,114,111,114,32,105,110,32,99,
+    97,115,101,32,116,104,101,32,101,110,99,111,100,105,110,103,
+    32,99,97,110,110,111,116,32,98,101,32,102,111,117,110,100,
+    10,32,32,32,32,32,32,32,32,111,114,32,116,104,101,32,
+    99,111,100,101,99,115,32,100,111,101,115,110,39,116,32,112,
+    114,111,118,105,100,101,32,97,110,32,105,110,99,114,101,109,
+    101,110,116,97,108,32,101,110,99,111,100,101,114,46,10,10,
+    32,32,32,32,78,41,3,114,2,0,0,0,114,48,0,0,
+    0,218,11,76,111,111,107,117,112,69,114,114,111,114,41,2,
+    114,137,0,0,0,218,7,101,110,99,111,100,101,114,114,53,
+    0,0,0,114,53,0,0,0,114,54,0,0,0,114,29,0,
+    0,0,194,3,0,0,115,8,0,0,0,0,9,10,1,8,
+    1,8,1,99,1,0,0,0,0,0,0,0,2,0,0,0,
+    2,0,0,0,67,0,0,0,115,30,0,0,0,116,0,124,
+    0,131,1,106,1,125,1,124,1,100,1,107,8,114,26,116,
+    2,124,0,131,1,130,1,124,1,83,0,41,2,122,247,32,
+    76,111,111,107,117,112,32,117,112,32,116,104,101,32,99,111,
+    100,101,99,32,102,111,114,32,116,104,101,32,103,105,118,101,
+    110,32,101,110,99,111,100,105,110,103,32,97,110,100,32,114,
+    101,116,117,114,110,10,32,32,32,32,32,32,32,32,105,116,
+    115,32,73,110,99,114,101,109,101,110,116,97,108,68,101,99,
+    111,100,101,114,32,99,108,97,115,115,32,111,114,32,102,97,
+    99,116,111,114,121,32,102,117,110,99,116,105,111,110,46,10,
+    10,32,32,32,32,32,32,32,32,82,97,105,115,101,115,32,
+    97,32,76,111,111,107,117,112,69,114,114,111,114,32,105,110,
+    32,99,97,115,101,32,116,104,101,32,101,110,99,111,100,105,
+    110,103,32,99,97,110,110,111,116,32,98,101,32,102,111,117,
+    110,100,10,32,32,32,32,32,32,32,32,111,114,32,116,104,
+    101,32,99,111,100,101,99,115,32,100,111,101,115,110,39,116,
+    32,112,114,111,118,105,100,101,32,97,110,32,105,110,99,114,
+    101,109,101,110,116,97,108,32,100,101,99,111,100,101,114,46,
+    10,10,32,32,32,32,78,41,3,114,2,0,0,0,114,49,
+    0,0,0,114,148,0,0,0,41,2,114,137,0,0,0,218,
+    7,100,101,99,111,100,101,114,114,53,0,0,0,114,53,0,
+    0,0,114,54,0,0,0,114,30,0,0,0,208,3,0,0,
+    115,8,0,0,0,0,9,10,1,8,1,8,1,99,1,0,
+    0,0,0,0,0,0,1,0,0,0,2,0,0,0,67,0,
+    0,0,115,10,0,0,0,116,0,124,0,131,1,106,1,83,
+    0,41,1,122,180,32,76,111,111,107,117,112,32,117,112,32,
+    116,104,101,32,99,111,100,101,99,32,102,111,114,32,116,104,
+    101,32,103,105,118,101,110,32,101,110,99,111,100,105,110,103,
+    32,97,110,100,32,114,101,116,117,114,110,10,32,32,32,32,
+    32,32,32,32,105,116,115,32,83,116,114,101,97,109,82,101,
+    97,100,101,114,32,99,108,97,115,115,32,111,114,32,102,97,
+    99,116,111,114,121,32,102,117,110,99,116,105,111,110,46,10,
+    10,32,32,32,32,32,32,32,32,82,97,105,115,101,115,32,
+    97,32,76,111,111,107,117,112,69,114,114,111,114,32,105,110,
+    32,99,97,115,101,32,116,104,101,32,101,110,99,111,100,105,
+    110,103,32,99,97,110,110,111,116,32,98,101,32,102,111,117,
+    110,100,46,10,10,32,32,32,32,41,2,114,2,0,0,0,
+    114,51,0,0,0,41,1,114,137,0,0,0,114,53,0,0,
+    0,114,53,0,0,0,114,54,0,0,0,114,31,0,0,0,
+    222,3,0,0,115,2,0,0,0,0,8,99,1,0,0,0,
+    0,0,0,0,1,0,0,0,2,0,0,0,67,0,0,0,
+    115,10,0,0,0,116,0,124,0,131,1,106,1,83,0,41,
+    1,122,180,32,76,111,111,107,117,112,32,117,112,32,116,104,
+    101,32,99,111,100,101,99,32,102,111,114,32,116,104,101,32,
+    103,105,118,101,110,32,101,110,99,111,100,105,110,103,32,97,
+    110,100,32,114,101,116,117,114,110,10,32,32,32,32,32,32,
+    32,32,105,116,115,32,83,116,114,101,97,109,87,114,105,116,
+    101,114,32,99,108,97,115,115,32,111,114,32,102,97,99,116,
+    111,114,121,32,102,117,110,99,116,105,111,110,46,10,10,32,
+    32,32,32,32,32,32,32,82,97,105,115,101,115,32,97,32,
+    76,111,111,107,117,112,69,114,114,111,114,32,105,110,32,99,
+    97,115,101,32,116,104,101,32,101,110,99,111,100,105,110,103,
+    32,99,97,110,110,111,116,32,98,101,32,102,111,117,110,100,
+    46,10,10,32,32,32,32,41,2,114,2,0,0,0,114,50,
+    0,0,0,41,1,114,137,0,0,0,114,53,0,0,0,114,
+    53,0,0,0,114,54,0,0,0,114,32,0,0,0,232,3,
+    0,0,115,2,0,0,0,0,8,99,3,0,0,0,0,0,
+    0,0,7,0,0,0,5,0,0,0,107,0,0,0,115,76,
+    0,0,0,116,0,124,1,131,1,124,2,102,1,124,3,142,
+    1,125,4,120,32,124,0,68,0,93,24,125,5,124,4,160,
+    1,124,5,161,1,125,6,124,6,114,22,124,6,86,0,1,
+    0,113,22,87,0,124,4,160,1,100,1,100,2,161,2,125,
+    6,124,6,114,72,124,6,86,0,1,0,100,3,83,0,41,
+    4,122,191,10,32,32,32,32,69,110,99,111,100,105,110,103,
+    32,105,116,101,114,97,116,111,114,46,10,10,32,32,32,32,
+    69,110,99,111,100,101,115,32,116,104,101,32,105,110,112,117,
+    116,32,115,116,114,105,110,103,115,32,102,114,111,109,32,116,
+    104,101,32,105,116,101,114,97,116,111,114,32,117,115,105,110,
+    103,32,97,110,32,73,110,99,114,101,109,101,110,116,97,108,
+    69,110,99,111,100,101,114,46,10,10,32,32,32,32,101,114,
+    114,111,114,115,32,97,110,100,32,107,119,97,114,103,115,32,
+    97,114,101,32,112,97,115,115,101,100,32,116,104,114,111,117,
+    103,104,32,116,111,32,116,104,101,32,73,110,99,114,101,109,
+    101,110,116,97,108,69,110,99,111,100,101,114,10,32,32,32,
+    32,99,111,110,115,116,114,117,99,116,111,114,46,10,32,32,
+    32,32,114,66,0,0,0,84,78,41,2,114,29,0,0,0,
+    114,33,0,0,0,41,7,218,8,105,116,101,114,97,116,111,
+    114,114,137,0,0,0,114,65,0,0,0,218,6,107,119,97,
+    114,103,115,114,149,0,0,0,114,64,0,0,0,218,6,111,
+    117,116,112,117,116,114,53,0,0,0,114,53,0,0,0,114,
+    54,0,0,0,114,35,0,0,0,242,3,0,0,115,16,0,
+    0,0,0,9,16,1,10,1,10,1,4,1,10,1,12,1,
+    4,1,99,3,0,0,0,0,0,0,0,7,0,0,0,5,
+    0,0,0,107,0,0,0,115,76,0,0,0,116,0,124,1,
+    131,1,124,2,102,1,124,3,142,1,125,4,120,32,124,0,
+    68,0,93,24,125,5,124,4,160,1,124,5,161,1,125,6,
+    124,6,114,22,124,6,86,0,1,0,113,22,87,0,124,4,
+    160,1,100,1,100,2,161,2,125,6,124,6,114,72,124,6,
+    86,0,1,0,100,3,83,0,41,4,122,191,10,32,32,32,
+    32,68,101,99,111,100,105,110,103,32,105,116,101,114,97,116,
+    111,114,46,10,10,32,32,32,32,68,101,99,111,100,101,115,
+    32,116,104,101,32,105,110,112,117,116,32,115,116,114,105,110,
+    103,115,32,102,114,111,109,32,116,104,101,32,105,116,101,114,
+    97,116,111,114,32,117,115,105,110,103,32,97,110,32,73,110,
+    99,114,101,109,101,110,116,97,108,68,101,99,111,100,101,114,
+    46,10,10,32,32,32,32,101,114,114,111,114,115,32,97,110,
+    100,32,107,119,97,114,103,115,32,97,114,101,32,112,97,115,
+    115,101,100,32,116,104,114,111,117,103,104,32,116,111,32,116,
+    104,101,32,73,110,99,114,101,109,101,110,116,97,108,68,101,
+    99,111,100,101,114,10,32,32,32,32,99,111,110,115,116,114,
+    117,99,116,111,114,46,10,32,32,32,32,114,79,0,0,0,
+    84,78,41,2,114,30,0,0,0,114,34,0,0,0,41,7,
+    114,151,0,0,0,114,137,0,0,0,114,65,0,0,0,114,
+    152,0,0,0,114,150,0,0,0,114,64,0,0,0,114,153,
+    0,0,0,114,53,0,0,0,114,53,0,0,0,114,54,0,
+    0,0,114,36,0,0,0,4,4,0,0,115,16,0,0,0,
+    0,9,16,1,10,1,10,1,4,1,10,1,12,1,4,1,
+    99,1,0,0,0,0,0,0,0,1,0,0,0,2,0,0,
+    0,67,0,0,0,115,14,0,0,0,100,1,100,2,132,0,
+    124,0,68,0,131,1,83,0,41,3,122,136,32,109,97,107,
+    101,95,105,100,101,110,116,105,116,121,95,100,105,99,116,40,
+    114,110,103,41,32,45,62,32,100,105,99,116,10,10,32,32,
+    32,32,32,32,32,32,82,101,116,117,114,110,32,97,32,100,
+    105,99,116,105,111,110,97,114,121,32,119,104,101,114,101,32,
+    101,108,101,109,101,110,116,115,32,111,102,32,116,104,101,32,
+    114,110,103,32,115,101,113,117,101,110,99,101,32,97,114,101,
+    10,32,32,32,32,32,32,32,32,109,97,112,112,101,100,32,
+    116,111,32,116,104,101,109,115,101,108,118,101,115,46,10,10,
+    32,32,32,32,99,1,0,0,0,0,0,0,0,2,0,0,
+    0,4,0,0,0,83,0,0,0,115,18,0,0,0,105,0,
+    124,0,93,10,125,1,124,1,124,1,147,2,113,4,83,0,
+    114,53,0,0,0,114,53,0,0,0,41,2,90,2,46,48,
+    218,1,105,114,53,0,0,0,114,53,0,0,0,114,54,0,
+    0,0,250,10,60,100,105,99,116,99,111,109,112,62,32,4,
+    0,0,115,2,0,0,0,6,0,122,38,109,97,107,101,95,
+    105,100,101,110,116,105,116,121,95,100,105,99,116,46,60,108,
+    111,99,97,108,115,62,46,60,100,105,99,116,99,111,109,112,
+    62,114,53,0,0,0,41,1,90,3,114,110,103,114,53,0,
+    0,0,114,53,0,0,0,114,54,0,0,0,218,18,109,97,
+    107,101,95,105,100,101,110,116,105,116,121,95,100,105,99,116,
+    24,4,0,0,115,2,0,0,0,0,8,114,156,0,0,0,
+    99,1,0,0,0,0,0,0,0,4,0,0,0,4,0,0,
+    0,67,0,0,0,115,56,0,0,0,105,0,125,1,120,46,
+    124,0,160,0,161,0,68,0,93,34,92,2,125,2,125,3,
+    124,3,124,1,107,7,114,40,124,2,124,1,124,3,60,0,
+    113,14,100,1,124,1,124,3,60,0,113,14,87,0,124,1,
+    83,0,41,2,97,130,1,0,0,32,67,114,101,97,116,101,
+    115,32,97,110,32,101,110,99,111,100,105,110,103,32,109,97,
+    112,32,102,114,111,109,32,97,32,100,101,99,111,100,105,110,
+    103,32,109,97,112,46,10,10,32,32,32,32,32,32,32,32,
+    73,102,32,97,32,116,97,114,103,101,116,32,109,97,112,112,
+    105,110,103,32,105,110,32,116,104,101,32,100,101,99,111,100,
+    105,110,103,32,109,97,112,32,111,99,99,117,114,115,32,109,
+    117,108,116,105,112,108,101,10,32,32,32,32,32,32,32,32,
+    116,105,109,101,115,44,32,116,104,101,110,32,116,104,97,116,
+    32,116,97,114,103,101,116,32,105,115,32,109,97,112,112,101,
+    100,32,116,111,32,78,111,110,101,32,40,117,110,100,101,102,
+    105,110,101,100,32,109,97,112,112,105,110,103,41,44,10,32,
+    32,32,32,32,32,32,32,99,97,117,115,105,110,103,32,97,
+    110,32,101,120,99,101,112,116,105,111,110,32,119,104,101,110,
+    32,101,110,99,111,117,110,116,101,114,101,100,32,98,121,32,
+    116,104,101,32,99,104,97,114,109,97,112,32,99,111,100,101,
+    99,10,32,32,32,32,32,32,32,32,100,117,114,105,110,103,
+    32,116,114,97,110,115,108,97,116,105,111,110,46,10,10,32,
+    32,32,32,32,32,32,32,79,110,101,32,101,120,97,109,112,
+    108,101,32,119,104,101,114,101,32,116,104,105,115,32,104,97,
+    112,112,101,110,115,32,105,115,32,99,112,56,55,53,46,112,
+    121,32,119,104,105,99,104,32,100,101,99,111,100,101,115,10,
+    32,32,32,32,32,32,32,32,109,117,108,116,105,112,108,101,
+    32,99,104,97,114,97,99,116,101,114,32,116,111,32,92,117,
+    48,48,49,97,46,10,10,32,32,32,32,78,41,1,218,5,
+    105,116,101,109,115,41,4,90,12,100,101,99,111,100,105,110,
+    103,95,109,97,112,218,1,109,218,1,107,218,1,118,114,53,
+    0,0,0,114,53,0,0,0,114,54,0,0,0,218,17,109,
+    97,107,101,95,101,110,99,111,100,105,110,103,95,109,97,112,
+    34,4,0,0,115,12,0,0,0,0,13,4,1,18,1,8,
+    1,10,2,12,1,114,161,0,0,0,218,6,105,103,110,111,
+    114,101,218,7,114,101,112,108,97,99,101,90,17,120,109,108,
+    99,104,97,114,114,101,102,114,101,112,108,97,99,101,90,16,
+    98,97,99,107,115,108,97,115,104,114,101,112,108,97,99,101,
+    90,11,110,97,109,101,114,101,112,108,97,99,101,90,8,95,
+    95,109,97,105,110,95,95,122,7,108,97,116,105,110,45,49,
+    122,5,117,116,102,45,56,41,4,114,142,0,0,0,78,114,
+    62,0,0,0,114,104,0,0,0,41,2,78,114,62,0,0,
+    0,41,1,114,62,0,0,0,41,1,114,62,0,0,0,41,
+    60,114,61,0,0,0,114,144,0,0,0,218,3,115,121,115,
+    90,7,95,99,111,100,101,99,115,218,11,73,109,112,111,114,
+    116,69,114,114,111,114,90,3,119,104,121,218,11,83,121,115,
+    116,101,109,69,114,114,111,114,90,7,95,95,97,108,108,95,
+    95,114,12,0,0,0,114,7,0,0,0,114,14,0,0,0,
+    114,6,0,0,0,114,15,0,0,0,114,17,0,0,0,114,
+    18,0,0,0,218,9,98,121,116,101,111,114,100,101,114,114,
+    5,0,0,0,114,13,0,0,0,114,16,0,0,0,114,9,
+    0,0,0,114,8,0,0,0,114,11,0,0,0,114,10,0,
+    0,0,114,45,0,0,0,114,19,0,0,0,114,20,0,0,
+    0,114,84,0,0,0,114,21,0,0,0,114,74,0,0,0,
+    114,22,0,0,0,114,80,0,0,0,114,24,0,0,0,114,
+    23,0,0,0,114,25,0,0,0,114,26,0,0,0,114,3,
+    0,0,0,114,4,0,0,0,114,27,0,0,0,114,28,0,
+    0,0,114,29,0,0,0,114,30,0,0,0,114,31,0,0,
+    0,114,32,0,0,0,114,35,0,0,0,114,36,0,0,0,
+    114,156,0,0,0,114,161,0,0,0,114,43,0,0,0,114,
+    37,0,0,0,114,38,0,0,0,114,39,0,0,0,114,40,
+    0,0,0,114,41,0,0,0,114,42,0,0,0,114,148,0,
+    0,0,90,6,95,102,97,108,115,101,90,9,101,110,99,111,
+    100,105,110,103,115,114,60,0,0,0,90,6,115,116,100,111,
+    117,116,90,5,115,116,100,105,110,114,53,0,0,0,114,53,
+    0,0,0,114,53,0,0,0,114,54,0,0,0,218,8,60,
+    109,111,100,117,108,101,62,8,0,0,0,115,152,0,0,0,
+    4,2,16,4,2,1,12,1,16,1,30,2,12,1,10,1,
+    8,1,6,1,8,1,4,1,4,1,6,1,6,1,8,1,
+    6,1,2,1,4,1,8,11,4,3,8,3,8,3,4,3,
+    4,2,10,3,8,3,6,5,8,3,4,3,4,1,4,1,
+    4,1,4,5,16,31,14,66,16,40,16,34,16,49,16,43,
+    16,73,16,127,0,120,14,87,14,110,10,42,10,38,8,10,
+    8,10,8,14,8,14,8,10,8,10,10,18,10,20,8,10,
+    8,23,2,1,8,1,8,1,8,1,8,1,8,1,12,1,
+    16,2,4,1,4,1,4,1,4,1,4,1,10,4,4,1,
+    6,1,8,4,10,3,16,3,
+};
+static const unsigned char _Py_M__encodings[] = {
+    99,0,0,0,0,0,0,0,0,0,0,0,0,5,0,0,
+    0,64,0,0,0,115,128,0,0,0,100,0,90,0,100,1,
+    100,2,108,1,90,1,100,1,100,2,108,2,90,2,100,3,
+    100,4,108,3,109,4,90,4,1,0,105,0,90,5,100,5,
+    90,6,100,6,103,1,90,7,101,4,106,4,90,8,71,0,
+    100,7,100,8,132,0,100,8,101,9,101,10,131,4,90,11,
+    100,9,100,10,132,0,90,12,100,11,100,12,132,0,90,13,
+    101,1,160,14,101,13,161,1,1,0,101,2,106,15,100,13,
+    107,2,114,124,100,14,100,15,132,0,90,16,101,1,160,14,
+    101,16,161,1,1,0,100,2,83,0,41,16,97,51,4,0,
+    0,32,83,116,97,110,100,97,114,100,32,34,101,110,99,111,
+    100,105,110,103,115,34,32,80,97,99,107,97,103,101,10,10,
+    32,32,32,32,83,116,97,110,100,97,114,100,32,80,121,116,
+    104,111,110,32,101,110,99,111,100,105,110,103,32,109,111,100,
+    117,108,101,115,32,97,114,101,32,115,116,111,114,101,100,32,
+    105,110,32,116,104,105,115,32,112,97,99,107,97,103,101,10,
+    32,32,32,32,100,105,114,101,99,116,111,114,121,46,10,10,
+    32,32,32,32,67,111,100,101,99,32,109,111,100,117,108,101,
+    115,32,109,117,115,116,32,104,97,118,101,32,110,97,109,101,
+    115,32,99,111,114,114,101,115,112,111,110,100,105,110,103,32,
+    116,111,32,110,111,114,109,97,108,105,122,101,100,32,101,110,
+    99,111,100,105,110,103,10,32,32,32,32,110,97,109,101,115,
+    32,97,115,32,100,101,102,105,110,101,100,32,105,110,32,116,
+    104,101,32,110,111,114,109,97,108,105,122,101,95,101,110,99,
+    111,100,105,110,103,40,41,32,102,117,110,99,116,105,111,110,
+    32,98,101,108,111,119,44,32,101,46,103,46,10,32,32,32,
+    32,39,117,116,102,45,56,39,32,109,117,115,116,32,98,101,
+    32,105,109,112,108,101,109,101,110,116,101,100,32,98,121,32,
+    116,104,101,32,109,111,100,117,108,101,32,39,117,116,102,95,
+    56,46,112,121,39,46,10,10,32,32,32,32,69,97,99,104,
+    32,99,111,100,101,99,32,109,111,100,117,108,101,32,109,117,
+    115,116,32,101,120,112,111,114,116,32,116,104,101,32,102,111,
+    108,108,111,119,105,110,103,32,105,110,116,101,114,102,97,99,
+    101,58,10,10,32,32,32,32,42,32,103,101,116,114,101,103,
+    101,110,116,114,121,40,41,32,45,62,32,99,111,100,101,99,
+    115,46,67,111,100,101,99,73,110,102,111,32,111,98,106,101,
+    99,116,10,32,32,32,32,84,104,101,32,103,101,116,114,101,
+    103,101,110,116,114,121,40,41,32,65,80,73,32,109,117,115,
+    116,32,114,101,116,117,114,110,32,97,32,67,111,100,101,99,
+    73,110,102,111,32,111,98,106,101,99,116,32,119,105,116,104,
+    32,101,110,99,111,100,101,114,44,32,100,101,99,111,100,101,
+    114,44,10,32,32,32,32,105,110,99,114,101,109,101,110,116,
+    97,108,101,110,99,111,100,101,114,44,32,105,110,99,114,101,
+    109,101,110,116,97,108,100,101,99,111,100,101,114,44,32,115,
+    116,114,101,97,109,119,114,105,116,101,114,32,97,110,100,32,
+    115,116,114,101,97,109,114,101,97,100,101,114,10,32,32,32,
+    32,97,116,116,116,114,105,98,117,116,101,115,32,119,104,105,
+    99,104,32,97,100,104,101,114,101,32,116,111,32,116,104,101,
+    32,80,121,116,104,111,110,32,67,111,100,101,99,32,73,110,
+    116,101,114,102,97,99,101,32,83,116,97,110,100,97,114,100,
+    46,10,10,32,32,32,32,73,110,32,97,100,100,105,116,105,
+    111,110,44,32,97,32,109,111,100,117,108,101,32,109,97,121,
+    32,111,112,116,105,111,110,97,108,108,121,32,97,108,115,111,
+    32,100,101,102,105,110,101,32,116,104,101,32,102,111,108,108,
+    111,119,105,110,103,10,32,32,32,32,65,80,73,115,32,119,
+    104,105,99,104,32,97,114,101,32,116,104,101,110,32,117,115,
+    101,100,32,98,121,32,116,104,101,32,112,97,99,107,97,103,
+    101,39,115,32,99,111,100,101,99,32,115,101,97,114,99,104,
+    32,102,117,110,99,116,105,111,110,58,10,10,32,32,32,32,
+    42,32,103,101,116,97,108,105,97,115,101,115,40,41,32,45,
+    62,32,115,101,113,117,101,110,99,101,32,111,102,32,101,110,
+    99,111,100,105,110,103,32,110,97,109,101,32,115,116,114,105,
+    110,103,115,32,116,111,32,117,115,101,32,97,115,32,97,108,
+    105,97,115,101,115,10,10,32,32,32,32,65,108,105,97,115,
+    32,110,97,109,101,115,32,114,101,116,117,114,110,101,100,32,
+    98,121,32,103,101,116,97,108,105,97,115,101,115,40,41,32,
+    109,117,115,116,32,98,101,32,110,111,114,109,97,108,105,122,
+    101,100,32,101,110,99,111,100,105,110,103,10,32,32,32,32,
+    110,97,109,101,115,32,97,115,32,100,101,102,105,110,101,100,
+    32,98,121,32,110,111,114,109,97,108,105,122,101,95,101,110,
+    99,111,100,105,110,103,40,41,46,10,10,87,114,105,116,116,
+    101,110,32,98,121,32,77,97,114,99,45,65,110,100,114,101,
+    32,76,101,109,98,117,114,103,32,40,109,97,108,64,108,101,
+    109,98,117,114,103,46,99,111,109,41,46,10,10,40,99,41,
+    32,67,111,112,121,114,105,103,104,116,32,67,78,82,73,44,
+    32,65,108,108,32,82,105,103,104,116,115,32,82,101,115,101,
+    114,118,101,100,46,32,78,79,32,87,65,82,82,65,78,84,
+    89,46,10,10,233,0,0,0,0,78,233,1,0,0,0,41,
+    1,218,7,97,108,105,97,115,101,115,122,11,45,45,117,110,
+    107,110,111,119,110,45,45,218,1,42,99,0,0,0,0,0,
+    0,0,0,0,0,0,0,1,0,0,0,64,0,0,0,115,
+    12,0,0,0,101,0,90,1,100,0,90,2,100,1,83,0,
+    41,2,218,18,67,111,100,101,99,82,101,103,105,115,116,114,
+    121,69,114,114,111,114,78,41,3,218,8,95,95,110,97,109,
+    101,95,95,218,10,95,95,109,111,100,117,108,101,95,95,218,
+    12,95,95,113,117,97,108,110,97,109,101,95,95,169,0,114,
+    8,0,0,0,114,8,0,0,0,250,30,60,115,116,100,108,
+    105,98,62,47,101,110,99,111,100,105,110,103,115,47,95,95,
+    105,110,105,116,95,95,46,112,121,114,4,0,0,0,40,0,
+    0,0,115,2,0,0,0,8,1,114,4,0,0,0,99,1,
+    0,0,0,0,0,0,0,4,0,0,0,4,0,0,0,67,
+    0,0,0,115,106,0,0,0,116,0,124,0,116,1,131,2,
+    114,20,116,2,124,0,100,1,131,2,125,0,103,0,125,1,
+    100,2,125,2,120,66,124,0,68,0,93,58,125,3,124,3,
+    160,3,161,0,115,54,124,3,100,3,107,2,114,88,124,2,
+    114,72,124,1,114,72,124,1,160,4,100,4,161,1,1,0,
+    124,1,160,4,124,3,161,1,1,0,100,2,125,2,113,34,
+    100,5,125,2,113,34,87,0,100,6,160,5,124,1,161,1,
+    83,0,41,7,97,180,1,0,0,32,78,111,114,109,97,108,
+    105,122,101,32,97,110,32,101,110,99,111,100,105,110,103,32,
+    110,97,109,101,46,10,10,32,32,32,32,32,32,32,32,78,
+    111,114,109,97,108,105,122,97,116,105,111,110,32,119,111,114,
+    107,115,32,97,115,32,102,111,108,108,111,119,115,58,32,97,
+    108,108,32,110,111,110,45,97,108,112,104,97,110,117,109,101,
+    114,105,99,10,32,32,32,32,32,32,32,32,99,104,97,114,
+    97,99,116,101,114,115,32,101,120,99,101,112,116,32,116,104,
+    101,32,100,111,116,32,117,115,101,100,32,102,111,114,32,80,
+    121,116,104,111,110,32,112,97,99,107,97,103,101,32,110,97,
+    109,101,115,32,97,114,101,10,32,32,32,32,32,32,32,32,
+    99,111,108,108,97,112,115,101,100,32,97,110,100,32,114,101,
+    112,108,97,99,101,100,32,119,105,116,104,32,97,32,115,105,
+    110,103,108,101,32,117,110,100,101,114,115,99,111,114,101,44,
+    32,101,46,103,46,32,39,32,32,45,59,35,39,10,32,32,
+    32,32,32,32,32,32,98,101,99,111,109,101,115,32,39,95,
+    39,46,32,76,101,97,100,105,110,103,32,97,110,100,32,116,
+    114,97,105,108,105,110,103,32,117,110,100,101,114,115,99,111,
+    114,101,115,32,97,114,101,32,114,101,109,111,118,101,100,46,
+    10,10,32,32,32,32,32,32,32,32,78,111,116,101,32,116,
+    104,97,116,32,101,110,99,111,100,105,110,103,32,110,97,109,
+    101,115,32,115,104,111,117,108,100,32,98,101,32,65,83,67,
+    73,73,32,111,110,108,121,59,32,105,102,32,116,104,101,121,
+    32,100,111,32,117,115,101,10,32,32,32,32,32,32,32,32,
+    110,111,110,45,65,83,67,73,73,32,99,104,97,114,97,99,
+    116,101,114,115,44,32,116,104,101,115,101,32,109,117,115,116,
+    32,98,101,32,76,97,116,105,110,45,49,32,99,111,109,112,
+    97,116,105,98,108,101,46,10,10,32,32,32,32,218,5,97,
+    115,99,105,105,70,218,1,46,218,1,95,84,218,0,41,6,
+    218,10,105,115,105,110,115,116,97,110,99,101,218,5,98,121,
+    116,101,115,218,3,115,116,114,218,7,105,115,97,108,110,117,
+    109,218,6,97,112,112,101,110,100,218,4,106,111,105,110,41,
+    4,218,8,101,110,99,111,100,105,110,103,90,5,99,104,97,
+    114,115,90,5,112,117,110,99,116,218,1,99,114,8,0,0,
+    0,114,8,0,0,0,114,9,0,0,0,218,18,110,111,114,
+    109,97,108,105,122,101,95,101,110,99,111,100,105,110,103,43,
+    0,0,0,115,24,0,0,0,0,13,10,1,10,2,4,1,
+    4,1,10,1,16,1,8,1,10,1,10,1,6,2,8,1,
+    114,22,0,0,0,99,1,0,0,0,0,0,0,0,10,0,
+    0,0,21,0,0,0,67,0,0,0,115,140,2,0,0,116,
+    0,160,1,124,0,116,2,161,2,125,1,124,1,116,2,107,
+    9,114,24,124,1,83,0,116,3,124,0,131,1,125,2,116,
+    4,160,1,124,2,161,1,112,58,116,4,160,1,124,2,160,
+    5,100,1,100,2,161,2,161,1,125,3,124,3,100,0,107,
+    9,114,78,124,3,124,2,103,2,125,4,110,6,124,2,103,
+    1,125,4,120,78,124,4,68,0,93,66,125,5,124,5,12,
+    0,115,90,100,1,124,5,107,6,114,110,113,90,121,22,116,
+    6,100,3,124,5,23,0,116,7,100,4,100,5,141,3,125,
+    6,87,0,110,20,4,0,116,8,107,10,114,152,1,0,1,
+    0,1,0,89,0,113,90,88,0,80,0,113,90,87,0,100,
+    0,125,6,121,10,124,6,106,9,125,7,87,0,110,24,4,
+    0,116,10,107,10,114,198,1,0,1,0,1,0,100,0,125,
+    6,89,0,110,2,88,0,124,6,100,0,107,8,114,220,100,
+    0,116,0,124,0,60,0,100,0,83,0,124,7,131,0,125,
+    1,116,11,124,1,116,12,106,13,131,2,144,2,115,58,100,
+    6,116,14,124,1,131,1,4,0,3,0,107,1,144,1,111,
+    8,100,7,107,1,110,4,2,0,1,0,144,1,115,36,116,
+    15,100,8,124,6,106,16,124,6,106,17,102,2,22,0,131,
+    1,130,1,116,18,124,1,100,4,25,0,131,1,12,0,144,
+    1,115,216,116,18,124,1,100,9,25,0,131,1,12,0,144,
+    1,115,216,124,1,100,10,25,0,100,0,107,9,144,1,114,
+    98,116,18,124,1,100,10,25,0,131,1,12,0,144,1,115,
+    216,124,1,100,11,25,0,100,0,107,9,144,1,114,128,116,
+    18,124,1,100,11,25,0,131,1,12,0,144,1,115,216,116,
+    14,124,1,131,1,100,6,107,4,144,1,114,172,124,1,100,
+    6,25,0,100,0,107,9,144,1,114,172,116,18,124,1,100,
+    6,25,0,131,1,12,0,144,1,115,216,116,14,124,1,131,
+    1,100,12,107,4,144,1,114,236,124,1,100,12,25,0,100,
+    0,107,9,144,1,114,236,116,18,124,1,100,12,25,0,131,
+    1,12,0,144,1,114,236,116,15,100,13,124,6,106,16,124,
+    6,106,17,102,2,22,0,131,1,130,1,116,14,124,1,131,
+    1,100,7,107,0,144,2,115,8,124,1,100,14,25,0,100,
+    0,107,8,144,2,114,48,124,1,100,15,100,14,116,14,124,
+    1,131,1,24,0,20,0,124,6,106,16,160,19,100,1,100,
+    9,161,2,100,9,25,0,102,1,23,0,55,0,125,1,116,
+    12,106,13,124,1,142,0,125,1,124,1,116,0,124,0,60,
+    0,121,12,124,6,160,20,161,0,125,8,87,0,110,22,4,
+    0,116,10,107,10,144,2,114,100,1,0,1,0,1,0,89,
+    0,110,36,88,0,120,32,124,8,68,0,93,24,125,9,124,
+    9,116,4,107,7,144,2,114,108,124,5,116,4,124,9,60,
+    0,144,2,113,108,87,0,124,1,83,0,41,16,78,114,11,
+    0,0,0,114,12,0,0,0,122,10,101,110,99,111,100,105,
+    110,103,115,46,114,0,0,0,0,41,2,90,8,102,114,111,
+    109,108,105,115,116,90,5,108,101,118,101,108,233,4,0,0,
+    0,233,7,0,0,0,122,35,109,111,100,117,108,101,32,34,
+    37,115,34,32,40,37,115,41,32,102,97,105,108,101,100,32,
+    116,111,32,114,101,103,105,115,116,101,114,114,1,0,0,0,
+    233,2,0,0,0,233,3,0,0,0,233,5,0,0,0,122,
+    39,105,110,99,111,109,112,97,116,105,98,108,101,32,99,111,
+    100,101,99,115,32,105,110,32,109,111,100,117,108,101,32,34,
+    37,115,34,32,40,37,115,41,233,6,0,0,0,41,1,78,
+    41,21,218,6,95,99,97,99,104,101,218,3,103,101,116,218,
+    8,95,117,110,107,110,111,119,110,114,22,0,0,0,218,8,
+    95,97,108,105,97,115,101,115,218,7,114,101,112,108,97,99,
+    101,218,10,95,95,105,109,112,111,114,116,95,95,218,12,95,
+    105,109,112,111,114,116,95,116,97,105,108,218,11,73,109,112,
+    111,114,116,69,114,114,111,114,218,11,103,101,116,114,101,103,
+    101,110,116,114,121,218,14,65,116,116,114,105,98,117,116,101,
+    69,114,114,111,114,114,14,0,0,0,218,6,99,111,100,101,
+    99,115,90,9,67,111,100,101,99,73,110,102,111,218,3,108,
+    101,110,114,4,0,0,0,114,5,0,0,0,90,8,95,95,
+    102,105,108,101,95,95,218,8,99,97,108,108,97,98,108,101,
+    218,5,115,112,108,105,116,90,10,103,101,116,97,108,105,97,
+    115,101,115,41,10,114,20,0,0,0,90,5,101,110,116,114,
+    121,90,13,110,111,114,109,95,101,110,99,111,100,105,110,103,
+    90,16,97,108,105,97,115,101,100,95,101,110,99,111,100,105,
+    110,103,90,8,109,111,100,110,97,109,101,115,90,7,109,111,
+    100,110,97,109,101,90,3,109,111,100,114,37,0,0,0,90,
+    12,99,111,100,101,99,97,108,105,97,115,101,115,90,5,97,
+    108,105,97,115,114,8,0,0,0,114,8,0,0,0,114,9,
+    0,0,0,218,15,115,101,97,114,99,104,95,102,117,110,99,
+    116,105,111,110,71,0,0,0,115,102,0,0,0,0,3,12,
+    1,8,1,4,9,8,1,10,1,18,1,8,1,2,1,8,
+    2,6,1,10,1,14,1,2,1,2,3,10,1,12,1,14,
+    3,6,2,6,2,4,2,2,1,10,1,14,2,10,2,8,
+    2,8,1,4,3,6,1,14,1,32,1,4,1,16,1,32,
+    1,30,1,30,1,44,1,44,1,4,1,16,1,28,1,40,
+    1,10,3,8,4,2,1,12,1,16,1,6,2,10,1,10,
+    1,14,3,114,43,0,0,0,90,5,119,105,110,51,50,99,
+    1,0,0,0,0,0,0,0,3,0,0,0,11,0,0,0,
+    67,0,0,0,115,70,0,0,0,121,44,100,1,100,0,108,
+    0,125,1,124,0,124,1,160,1,100,2,161,1,107,2,114,
+    42,100,1,100,0,108,2,125,2,124,2,106,3,160,4,161,
+    0,83,0,87,0,110,20,4,0,116,5,107,10,114,64,1,
+    0,1,0,1,0,89,0,110,2,88,0,100,0,83,0,41,
+    3,78,114,0,0,0,0,70,41,6,218,11,95,98,111,111,
+    116,108,111,99,97,108,101,90,20,103,101,116,112,114,101,102,
+    101,114,114,101,100,101,110,99,111,100,105,110,103,90,14,101,
+    110,99,111,100,105,110,103,115,46,109,98,99,115,90,4,109,
+    98,99,115,114,37,0,0,0,114,36,0,0,0,41,3,114,
+    20,0,0,0,114,44,0,0,0,90,9,101,110,99,111,100,
+    105,110,103,115,114,8,0,0,0,114,8,0,0,0,114,9,
+    0,0,0,218,11,95,97,108,105,97,115,95,109,98,99,115,
+    159,0,0,0,115,14,0,0,0,0,1,2,1,8,1,14,
+    1,8,1,14,1,14,2,114,45,0,0,0,41,17,218,7,
+    95,95,100,111,99,95,95,114,39,0,0,0,218,3,115,121,
+    115,114,13,0,0,0,114,2,0,0,0,114,29,0,0,0,
+    114,31,0,0,0,114,35,0,0,0,114,32,0,0,0,218,
+    11,76,111,111,107,117,112,69,114,114,111,114,218,11,83,121,
+    115,116,101,109,69,114,114,111,114,114,4,0,0,0,114,22,
+    0,0,0,114,43,0,0,0,90,8,114,101,103,105,115,116,
+    101,114,218,8,112,108,97,116,102,111,114,109,114,45,0,0,
+    0,114,8,0,0,0,114,8,0,0,0,114,8,0,0,0,
+    114,9,0,0,0,218,8,60,109,111,100,117,108,101,62,29,
+    0,0,0,115,28,0,0,0,4,2,8,1,8,1,12,2,
+    4,1,4,1,6,1,6,2,18,3,8,28,8,85,10,2,
+    10,1,8,10,
+};
+static const unsigned char _Py_M__encodings_aliases[] = {
+    99,0,0,0,0,0,0,0,0,0,0,0,0,68,1,0,
+    0,64,0,0,0,115,150,2,0,0,100,0,90,0,100,1,
+    100,1,100,1,100,1,100,1,100,1,100,1,100,1,100,1,
+    100,1,100,1,100,1,100,2,100,2,100,3,100,3,100,4,
+    100,4,100,5,100,6,100,6,100,6,100,6,100,6,100,6,
+    100,6,100,6,100,7,100,7,100,7,100,8,100,8,100,8,
+    100,8,100,9,100,9,100,10,100,10,100,11,100,11,100,12,
+    100,12,100,13,100,13,100,14,100,14,100,15,100,15,100,16,
+    100,16,100,17,100,17,100,18,100,18,100,19,100,19,100,19,
+    100,20,100,20,100,20,100,20,100,21,100,21,100,21,100,22,
+    100,22,100,22,100,22,100,22,100,23,100,23,100,23,100,24,
+    100,24,100,24,100,25,100,25,100,25,100,26,100,26,100,26,
+    100,27,100,27,100,27,100,28,100,28,100,28,100,29,100,29,
+    100,29,100,30,100,30,100,30,100,30,100,31,100,31,100,31,
+    100,32,100,32,100,32,100,33,100,33,100,33,100,34,100,34,
+    100,34,100,35,100,35,100,35,100,36,100,36,100,36,100,36,
+    100,37,100,37,100,37,100,37,100,38,100,38,100,38,100,39,
+    100,39,100,40,100,40,100,40,100,41,100,42,100,42,100,42,
+    100,43,100,43,100,43,100,43,100,43,100,43,100,43,100,44,
+    100,45,100,45,100,45,100,45,100,45,100,45,100,45,100,45,
+    100,46,100,46,100,46,100,47,100,48,100,48,100,48,100,49,
+    100,49,100,49,100,50,100,50,100,50,100,51,100,51,100,52,
+    100,52,100,53,100,53,100,54,100,54,100,55,100,55,100,56,
+    100,56,100,56,100,57,100,57,100,57,100,57,100,57,100,57,
+    100,58,100,58,100,58,100,59,100,59,100,59,100,60,100,60,
+    100,60,100,60,100,60,100,60,100,61,100,61,100,61,100,62,
+    100,62,100,62,100,62,100,62,100,63,100,63,100,63,100,63,
+    100,63,100,63,100,64,100,64,100,64,100,64,100,64,100,64,
+    100,65,100,65,100,65,100,65,100,65,100,65,100,66,100,66,
+    100,66,100,66,100,66,100,67,100,67,100,67,100,67,100,67,
+    100,67,100,67,100,68,100,68,100,68,100,68,100,68,100,68,
+    100,68,100,68,100,69,100,69,100,69,100,69,100,69,100,70,
+    100,70,100,70,100,70,100,70,100,70,100,71,100,71,100,72,
+    100,73,100,73,100,73,100,74,100,74,100,74,100,74,100,74,
+    100,74,100,74,100,74,100,74,100,74,100,74,100,74,100,75,
+    100,76,100,77,100,78,100,78,100,79,100,79,100,80,100,81,
+    100,81,100,82,100,82,100,82,100,82,100,83,100,83,100,83,
+    100,84,100,85,100,85,100,85,100,85,100,86,100,86,100,86,
+    100,87,100,87,100,87,100,88,100,89,100,89,100,89,100,89,
+    100,89,100,90,100,90,100,91,100,91,100,92,100,92,100,93,
+    100,93,100,94,100,95,100,96,100,96,100,96,100,97,100,97,
+    100,97,100,97,100,97,100,98,100,99,100,99,100,85,100,43,
+    100,45,100,3,100,100,144,1,156,67,90,1,100,101,83,0,
+    41,102,97,60,2,0,0,32,69,110,99,111,100,105,110,103,
+    32,65,108,105,97,115,101,115,32,83,117,112,112,111,114,116,
+    10,10,32,32,32,32,84,104,105,115,32,109,111,100,117,108,
+    101,32,105,115,32,117,115,101,100,32,98,121,32,116,104,101,
+    32,101,110,99,111,100,105,110,103,115,32,112,97,99,107,97,
+    103,101,32,115,101,97,114,99,104,32,102,117,110,99,116,105,
+    111,110,32,116,111,10,32,32,32,32,109,97,112,32,101,110,
+    99,111,100,105,110,103,115,32,110,97,109,101,115,32,116,111,
+    32,109,111,100,117,108,101,32,110,97,109,101,115,46,10,10,
+    32,32,32,32,78,111,116,101,32,116,104,97,116,32,116,104,
+    101,32,115,101,97,114,99,104,32,102,117,110,99,116,105,111,
+    110,32,110,111,114,109,97,108,105,122,101,115,32,116,104,101,
+    32,101,110,99,111,100,105,110,103,32,110,97,109,101,115,32,
+    98,101,102,111,114,101,10,32,32,32,32,100,111,105,110,103,
+    32,116,104,101,32,108,111,111,107,117,112,44,32,115,111,32,
+    116,104,101,32,109,97,112,112,105,110,103,32,119,105,108,108,
+    32,104,97,118,101,32,116,111,32,109,97,112,32,110,111,114,
+    109,97,108,105,122,101,100,10,32,32,32,32,101,110,99,111,
+    100,105,110,103,32,110,97,109,101,115,32,116,111,32,109,111,
+    100,117,108,101,32,110,97,109,101,115,46,10,10,32,32,32,
+    32,67,111,110,116,101,110,116,115,58,10,10,32,32,32,32,
+    32,32,32,32,84,104,101,32,102,111,108,108,111,119,105,110,
+    103,32,97,108,105,97,115,101,115,32,100,105,99,116,105,111,
+    110,97,114,121,32,99,111,110,116,97,105,110,115,32,109,97,
+    112,112,105,110,103,115,32,111,102,32,97,108,108,32,73,65,
+    78,65,10,32,32,32,32,32,32,32,32,99,104,97,114,97,
+    99,116,101,114,32,115,101,116,32,110,97,109,101,115,32,102,
+    111,114,32,119,104,105,99,104,32,116,104,101,32,80,121,116,
+    104,111,110,32,99,111,114,101,32,108,105,98,114,97,114,121,
+    32,112,114,111,118,105,100,101,115,10,32,32,32,32,32,32,
+    32,32,99,111,100,101,99,115,46,32,73,110,32,97,100,100,
+    105,116,105,111,110,32,116,111,32,116,104,101,115,101,44,32,
+    97,32,102,101,119,32,80,121,116,104,111,110,32,115,112,101,
+    99,105,102,105,99,32,99,111,100,101,99,10,32,32,32,32,
+    32,32,32,32,97,108,105,97,115,101,115,32,104,97,118,101,
+    32,97,108,115,111,32,98,101,101,110,32,97,100,100,101,100,
+    46,10,10,218,5,97,115,99,105,105,90,12,98,97,115,101,
+    54,52,95,99,111,100,101,99,90,4,98,105,103,53,90,9,
+    98,105,103,53,104,107,115,99,115,90,9,98,122,50,95,99,
+    111,100,101,99,90,5,99,112,48,51,55,90,6,99,112,49,
+    48,50,54,90,6,99,112,49,49,50,53,90,6,99,112,49,
+    49,52,48,90,6,99,112,49,50,53,48,90,6,99,112,49,
+    50,53,49,90,6,99,112,49,50,53,50,90,6,99,112,49,
+    50,53,51,90,6,99,112,49,50,53,52,90,6,99,112,49,
+    50,53,53,90,6,99,112,49,50,53,54,90,6,99,112,49,
+    50,53,55,90,6,99,112,49,50,53,56,90,5,99,112,50,
+    55,51,90,5,99,112,52,50,52,90,5,99,112,52,51,55,
+    90,5,99,112,53,48,48,90,5,99,112,55,55,53,90,5,
+    99,112,56,53,48,90,5,99,112,56,53,50,90,5,99,112,
+    56,53,53,90,5,99,112,56,53,55,90,5,99,112,56,53,
+    56,90,5,99,112,56,54,48,90,5,99,112,56,54,49,90,
+    5,99,112,56,54,50,90,5,99,112,56,54,51,90,5,99,
+    112,56,54,52,90,5,99,112,56,54,53,90,5,99,112,56,
+    54,54,90,5,99,112,56,54,57,90,5,99,112,57,51,50,
+    90,5,99,112,57,52,57,90,5,99,112,57,53,48,90,12,
+    101,117,99,95,106,105,115,95,50,48,48,52,90,12,101,117,
+    99,95,106,105,115,120,48,50,49,51,90,6,101,117,99,95,
+    106,112,90,6,101,117,99,95,107,114,90,7,103,98,49,56,
+    48,51,48,90,6,103,98,50,51,49,50,90,3,103,98,107,
+    90,9,104,101,120,95,99,111,100,101,99,90,9,104,112,95,
+    114,111,109,97,110,56,90,2,104,122,90,10,105,115,111,50,
+    48,50,50,95,106,112,90,12,105,115,111,50,48,50,50,95,
+    106,112,95,49,90,12,105,115,111,50,48,50,50,95,106,112,
+    95,50,90,15,105,115,111,50,48,50,50,95,106,112,95,50,
+    48,48,52,90,12,105,115,111,50,48,50,50,95,106,112,95,
+    51,90,14,105,115,111,50,48,50,50,95,106,112,95,101,120,
+    116,90,10,105,115,111,50,48,50,50,95,107,114,90,10,105,
+    115,111,56,56,53,57,95,49,48,90,10,105,115,111,56,56,
+    53,57,95,49,49,90,10,105,115,111,56,56,53,57,95,49,
+    51,90,10,105,115,111,56,56,53,57,95,49,52,90,10,105,
+    115,111,56,56,53,57,95,49,53,90,10,105,115,111,56,56,
+    53,57,95,49,54,90,9,105,115,111,56,56,53,57,95,50,
+    90,9,105,115,111,56,56,53,57,95,51,90,9,105,115,111,
+    56,56,53,57,95,52,90,9,105,115,111,56,56,53,57,95,
+    53,90,9,105,115,111,56,56,53,57,95,54,90,9,105,115,
+    111,56,56,53,57,95,55,90,9,105,115,111,56,56,53,57,
+    95,56,90,9,105,115,111,56,56,53,57,95,57,90,5,106,
+    111,104,97,98,90,6,107,111,105,56,95,114,90,6,107,122,
+    49,48,52,56,90,7,108,97,116,105,110,95,49,90,12,109,
+    97,99,95,99,121,114,105,108,108,105,99,90,9,109,97,99,
+    95,103,114,101,101,107,90,11,109,97,99,95,105,99,101,108,
+    97,110,100,90,10,109,97,99,95,108,97,116,105,110,50,90,
+    9,109,97,99,95,114,111,109,97,110,90,11,109,97,99,95,
+    116,117,114,107,105,115,104,90,4,109,98,99,115,90,7,112,
+    116,99,112,49,53,52,90,12,113,117,111,112,114,105,95,99,
+    111,100,101,99,90,6,114,111,116,95,49,51,90,9,115,104,
+    105,102,116,95,106,105,115,90,14,115,104,105,102,116,95,106,
+    105,115,95,50,48,48,52,90,14,115,104,105,102,116,95,106,
+    105,115,120,48,50,49,51,90,6,116,97,99,116,105,115,90,
+    7,116,105,115,95,54,50,48,90,6,117,116,102,95,49,54,
+    90,9,117,116,102,95,49,54,95,98,101,90,9,117,116,102,
+    95,49,54,95,108,101,90,6,117,116,102,95,51,50,90,9,
+    117,116,102,95,51,50,95,98,101,90,9,117,116,102,95,51,
+    50,95,108,101,90,5,117,116,102,95,55,90,5,117,116,102,
+    95,56,90,8,117,117,95,99,111,100,101,99,90,10,122,108,
+    105,98,95,99,111,100,101,99,40,67,1,0,0,90,3,54,
+    52,54,122,14,97,110,115,105,95,120,51,46,52,95,49,57,
+    54,56,90,14,97,110,115,105,95,120,51,95,52,95,49,57,
+    54,56,122,14,97,110,115,105,95,120,51,46,52,95,49,57,
+    56,54,90,5,99,112,51,54,55,90,7,99,115,97,115,99,
+    105,105,90,6,105,98,109,51,54,55,90,9,105,115,111,54,
+    52,54,95,117,115,122,16,105,115,111,95,54,52,54,46,105,
+    114,118,95,49,57,57,49,90,8,105,115,111,95,105,114,95,
+    54,90,2,117,115,90,8,117,115,95,97,115,99,105,105,90,
+    6,98,97,115,101,54,52,90,7,98,97,115,101,95,54,52,
+    90,7,98,105,103,53,95,116,119,90,6,99,115,98,105,103,
+    53,90,10,98,105,103,53,95,104,107,115,99,115,90,5,104,
+    107,115,99,115,90,3,98,122,50,90,3,48,51,55,90,8,
+    99,115,105,98,109,48,51,55,90,12,101,98,99,100,105,99,
+    95,99,112,95,99,97,90,12,101,98,99,100,105,99,95,99,
+    112,95,110,108,90,12,101,98,99,100,105,99,95,99,112,95,
+    117,115,90,12,101,98,99,100,105,99,95,99,112,95,119,116,
+    90,6,105,98,109,48,51,55,90,6,105,98,109,48,51,57,
+    90,4,49,48,50,54,90,9,99,115,105,98,109,49,48,50,
+    54,90,7,105,98,109,49,48,50,54,90,4,49,49,50,53,
+    90,7,105,98,109,49,49,50,53,90,6,99,112,56,54,54,
+    117,90,6,114,117,115,99,105,105,90,4,49,49,52,48,90,
+    7,105,98,109,49,49,52,48,90,4,49,50,53,48,90,12,
+    119,105,110,100,111,119,115,95,49,50,53,48,90,4,49,50,
+    53,49,90,12,119,105,110,100,111,119,115,95,49,50,53,49,
+    90,4,49,50,53,50,90,12,119,105,110,100,111,119,115,95,
+    49,50,53,50,90,4,49,50,53,51,90,12,119,105,110,100,
+    111,119,115,95,49,50,53,51,90,4,49,50,53,52,90,12,
+    119,105,110,100,111,119,115,95,49,50,53,52,90,4,49,50,
+    53,53,90,12,119,105,110,100,111,119,115,95,49,50,53,53,
+    90,4,49,50,53,54,90,12,119,105,110,100,111,119,115,95,
+    49,50,53,54,90,4,49,50,53,55,90,12,119,105,110,100,
+    111,119,115,95,49,50,53,55,90,4,49,50,53,56,90,12,
+    119,105,110,100,111,119,115,95,49,50,53,56,90,3,50,55,
+    51,90,6,105,98,109,50,55,51,90,8,99,115,105,98,109,
+    50,55,51,90,3,52,50,52,90,8,99,115,105,98,109,52,
+    50,52,90,12,101,98,99,100,105,99,95,99,112,95,104,101,
+    90,6,105,98,109,52,50,52,90,3,52,51,55,90,16,99,
+    115,112,99,56,99,111,100,101,112,97,103,101,52,51,55,90,
+    6,105,98,109,52,51,55,90,3,53,48,48,90,8,99,115,
+    105,98,109,53,48,48,90,12,101,98,99,100,105,99,95,99,
+    112,95,98,101,90,12,101,98,99,100,105,99,95,99,112,95,
+    99,104,90,6,105,98,109,53,48,48,90,3,55,55,53,90,
+    13,99,115,112,99,55,55,53,98,97,108,116,105,99,90,6,
+    105,98,109,55,55,53,90,3,56,53,48,90,19,99,115,112,
+    99,56,53,48,109,117,108,116,105,108,105,110,103,117,97,108,
+    90,6,105,98,109,56,53,48,90,3,56,53,50,90,8,99,
+    115,112,99,112,56,53,50,90,6,105,98,109,56,53,50,90,
+    3,56,53,53,90,8,99,115,105,98,109,56,53,53,90,6,
+    105,98,109,56,53,53,90,3,56,53,55,90,8,99,115,105,
+    98,109,56,53,55,90,6,105,98,109,56,53,55,90,3,56,
+    53,56,90,8,99,115,105,98,109,56,53,56,90,6,105,98,
+    109,56,53,56,90,3,56,54,48,90,8,99,115,105,98,109,
+    56,54,48,90,6,105,98,109,56,54,48,90,3,56,54,49,
+    90,5,99,112,95,105,115,90,8,99,115,105,98,109,56,54,
+    49,90,6,105,98,109,56,54,49,90,3,56,54,50,90,18,
+    99,115,112,99,56,54,50,108,97,116,105,110,104,101,98,114,
+    101,119,90,6,105,98,109,56,54,50,90,3,56,54,51,90,
+    8,99,115,105,98,109,56,54,51,90,6,105,98,109,56,54,
+    51,90,3,56,54,52,90,8,99,115,105,98,109,56,54,52,
+    90,6,105,98,109,56,54,52,90,3,56,54,53,90,8,99,
+    115,105,98,109,56,54,53,90,6,105,98,109,56,54,53,90,
+    3,56,54,54,90,8,99,115,105,98,109,56,54,54,90,6,
+    105,98,109,56,54,54,90,3,56,54,57,90,5,99,112,95,
+    103,114,90,8,99,115,105,98,109,56,54,57,90,6,105,98,
+    109,56,54,57,90,3,57,51,50,90,5,109,115,57,51,50,
+    90,7,109,115,107,97,110,106,105,90,8,109,115,95,107,97,
+    110,106,105,90,3,57,52,57,90,5,109,115,57,52,57,90,
+    3,117,104,99,90,3,57,53,48,90,5,109,115,57,53,48,
+    90,8,106,105,115,120,48,50,49,51,90,10,101,117,99,106,
+    105,115,50,48,48,52,90,11,101,117,99,95,106,105,115,50,
+    48,48,52,90,11,101,117,99,106,105,115,120,48,50,49,51,
+    90,5,101,117,99,106,112,90,4,117,106,105,115,90,5,117,
+    95,106,105,115,90,5,101,117,99,107,114,90,6,107,111,114,
+    101,97,110,90,7,107,115,99,53,54,48,49,90,9,107,115,
+    95,99,95,53,54,48,49,90,14,107,115,95,99,95,53,54,
+    48,49,95,49,57,56,55,90,7,107,115,120,49,48,48,49,
+    90,9,107,115,95,120,95,49,48,48,49,90,12,103,98,49,
+    56,48,51,48,95,50,48,48,48,90,7,99,104,105,110,101,
+    115,101,90,15,99,115,105,115,111,53,56,103,98,50,51,49,
+    50,56,48,90,6,101,117,99,95,99,110,90,5,101,117,99,
+    99,110,90,12,101,117,99,103,98,50,51,49,50,95,99,110,
+    90,11,103,98,50,51,49,50,95,49,57,56,48,90,9,103,
+    98,50,51,49,50,95,56,48,90,9,105,115,111,95,105,114,
+    95,53,56,90,3,57,51,54,90,5,99,112,57,51,54,90,
+    5,109,115,57,51,54,218,3,104,101,120,90,6,114,111,109,
+    97,110,56,90,2,114,56,90,10,99,115,72,80,82,111,109,
+    97,110,56,90,4,104,122,103,98,90,5,104,122,95,103,98,
+    90,10,104,122,95,103,98,95,50,51,49,50,90,11,99,115,
+    105,115,111,50,48,50,50,106,112,90,9,105,115,111,50,48,
+    50,50,106,112,90,11,105,115,111,95,50,48,50,50,95,106,
+    112,90,11,105,115,111,50,48,50,50,106,112,95,49,90,13,
+    105,115,111,95,50,48,50,50,95,106,112,95,49,90,11,105,
+    115,111,50,48,50,50,106,112,95,50,90,13,105,115,111,95,
+    50,48,50,50,95,106,112,95,50,90,16,105,115,111,95,50,
+    48,50,50,95,106,112,95,50,48,48,52,90,14,105,115,111,
+    50,48,50,50,106,112,95,50,48,48,52,90,11,105,115,111,
+    50,48,50,50,106,112,95,51,90,13,105,115,111,95,50,48,
+    50,50,95,106,112,95,51,90,13,105,115,111,50,48,50,50,
+    106,112,95,101,120,116,90,15,105,115,111,95,50,48,50,50,
+    95,106,112,95,101,120,116,90,11,99,115,105,115,111,50,48,
+    50,50,107,114,90,9,105,115,111,50,48,50,50,107,114,90,
+    11,105,115,111,95,50,48,50,50,95,107,114,90,11,99,115,
+    105,115,111,108,97,116,105,110,54,90,11,105,115,111,95,56,
+    56,53,57,95,49,48,90,16,105,115,111,95,56,56,53,57,
+    95,49,48,95,49,57,57,50,90,10,105,115,111,95,105,114,
+    95,49,53,55,90,2,108,54,90,6,108,97,116,105,110,54,
+    90,4,116,104,97,105,90,11,105,115,111,95,56,56,53,57,
+    95,49,49,90,16,105,115,111,95,56,56,53,57,95,49,49,
+    95,50,48,48,49,90,11,105,115,111,95,56,56,53,57,95,
+    49,51,90,2,108,55,90,6,108,97,116,105,110,55,90,11,
+    105,115,111,95,56,56,53,57,95,49,52,90,16,105,115,111,
+    95,56,56,53,57,95,49,52,95,49,57,57,56,90,10,105,
+    115,111,95,99,101,108,116,105,99,90,10,105,115,111,95,105,
+    114,95,49,57,57,90,2,108,56,90,6,108,97,116,105,110,
+    56,90,11,105,115,111,95,56,56,53,57,95,49,53,90,2,
+    108,57,90,6,108,97,116,105,110,57,90,11,105,115,111,95,
+    56,56,53,57,95,49,54,90,16,105,115,111,95,56,56,53,
+    57,95,49,54,95,50,48,48,49,90,10,105,115,111,95,105,
+    114,95,50,50,54,90,3,108,49,48,90,7,108,97,116,105,
+    110,49,48,90,11,99,115,105,115,111,108,97,116,105,110,50,
+    90,10,105,115,111,95,56,56,53,57,95,50,90,15,105,115,
+    111,95,56,56,53,57,95,50,95,49,57,56,55,90,10,105,
+    115,111,95,105,114,95,49,48,49,90,2,108,50,90,6,108,
+    97,116,105,110,50,90,11,99,115,105,115,111,108,97,116,105,
+    110,51,90,10,105,115,111,95,56,56,53,57,95,51,90,15,
+    105,115,111,95,56,56,53,57,95,51,95,49,57,56,56,90,
+    10,105,115,111,95,105,114,95,49,48,57,90,2,108,51,90,
+    6,108,97,116,105,110,51,90,11,99,115,105,115,111,108,97,
+    116,105,110,52,90,10,105,115,111,95,56,56,53,57,95,52,
+    90,15,105,115,111,95,56,56,53,57,95,52,95,49,57,56,
+    56,90,10,105,115,111,95,105,114,95,49,49,48,90,2,108,
+    52,90,6,108,97,116,105,110,52,90,18,99,115,105,115,111,
+    108,97,116,105,110,99,121,114,105,108,108,105,99,90,8,99,
+    121,114,105,108,108,105,99,90,10,105,115,111,95,56,56,53,
+    57,95,53,90,15,105,115,111,95,56,56,53,57,95,53,95,
+    49,57,56,56,90,10,105,115,111,95,105,114,95,49,52,52,
+    90,6,97,114,97,98,105,99,90,8,97,115,109,111,95,55,
+    48,56,90,16,99,115,105,115,111,108,97,116,105,110,97,114,
+    97,98,105,99,90,8,101,99,109,97,95,49,49,52,90,10,
+    105,115,111,95,56,56,53,57,95,54,90,15,105,115,111,95,
+    56,56,53,57,95,54,95,49,57,56,55,90,10,105,115,111,
+    95,105,114,95,49,50,55,90,15,99,115,105,115,111,108,97,
+    116,105,110,103,114,101,101,107,90,8,101,99,109,97,95,49,
+    49,56,90,8,101,108,111,116,95,57,50,56,90,5,103,114,
+    101,101,107,90,6,103,114,101,101,107,56,90,10,105,115,111,
+    95,56,56,53,57,95,55,90,15,105,115,111,95,56,56,53,
+    57,95,55,95,49,57,56,55,90,10,105,115,111,95,105,114,
+    95,49,50,54,90,16,99,115,105,115,111,108,97,116,105,110,
+    104,101,98,114,101,119,90,6,104,101,98,114,101,119,90,10,
+    105,115,111,95,56,56,53,57,95,56,90,15,105,115,111,95,
+    56,56,53,57,95,56,95,49,57,56,56,90,10,105,115,111,
+    95,105,114,95,49,51,56,90,11,99,115,105,115,111,108,97,
+    116,105,110,53,90,10,105,115,111,95,56,56,53,57,95,57,
+    90,15,105,115,111,95,56,56,53,57,95,57,95,49,57,56,
+    57,90,10,105,115,111,95,105,114,95,49,52,56,90,2,108,
+    53,90,6,108,97,116,105,110,53,90,6,99,112,49,51,54,
+    49,90,6,109,115,49,51,54,49,90,7,99,115,107,111,105,
+    56,114,90,7,107,122,95,49,48,52,56,90,6,114,107,49,
+    48,52,56,90,13,115,116,114,107,49,48,52,56,95,50,48,
+    48,50,90,4,56,56,53,57,90,5,99,112,56,49,57,90,
+    11,99,115,105,115,111,108,97,116,105,110,49,90,6,105,98,
+    109,56,49,57,90,7,105,115,111,56,56,53,57,90,9,105,
+    115,111,56,56,53,57,95,49,90,10,105,115,111,95,56,56,
+    53,57,95,49,90,15,105,115,111,95,56,56,53,57,95,49,
+    95,49,57,56,55,90,10,105,115,111,95,105,114,95,49,48,
+    48,90,2,108,49,90,5,108,97,116,105,110,90,6,108,97,
+    116,105,110,49,90,11,109,97,99,99,121,114,105,108,108,105,
+    99,90,8,109,97,99,103,114,101,101,107,90,10,109,97,99,
+    105,99,101,108,97,110,100,90,16,109,97,99,99,101,110,116,
+    114,97,108,101,117,114,111,112,101,90,9,109,97,99,108,97,
+    116,105,110,50,90,9,109,97,99,105,110,116,111,115,104,90,
+    8,109,97,99,114,111,109,97,110,90,10,109,97,99,116,117,
+    114,107,105,115,104,90,4,97,110,115,105,90,4,100,98,99,
+    115,90,9,99,115,112,116,99,112,49,53,52,90,5,112,116,
+    49,53,52,90,5,99,112,49,53,52,90,14,99,121,114,105,
+    108,108,105,99,95,97,115,105,97,110,90,6,113,117,111,112,
+    114,105,90,16,113,117,111,116,101,100,95,112,114,105,110,116,
+    97,98,108,101,90,15,113,117,111,116,101,100,112,114,105,110,
+    116,97,98,108,101,90,5,114,111,116,49,51,90,10,99,115,
+    115,104,105,102,116,106,105,115,90,8,115,104,105,102,116,106,
+    105,115,90,4,115,106,105,115,90,5,115,95,106,105,115,90,
+    12,115,104,105,102,116,106,105,115,50,48,48,52,90,9,115,
+    106,105,115,95,50,48,48,52,90,10,115,95,106,105,115,95,
+    50,48,48,52,90,13,115,104,105,102,116,106,105,115,120,48,
+    50,49,51,90,9,115,106,105,115,120,48,50,49,51,90,10,
+    115,95,106,105,115,120,48,50,49,51,90,6,116,105,115,50,
+    54,48,90,6,116,105,115,54,50,48,90,9,116,105,115,95,
+    54,50,48,95,48,90,14,116,105,115,95,54,50,48,95,50,
+    53,50,57,95,48,90,14,116,105,115,95,54,50,48,95,50,
+    53,50,57,95,49,90,10,105,115,111,95,105,114,95,49,54,
+    54,90,3,117,49,54,90,5,117,116,102,49,54,90,18,117,
+    110,105,99,111,100,101,98,105,103,117,110,109,97,114,107,101,
+    100,90,8,117,116,102,95,49,54,98,101,90,21,117,110,105,
+    99,111,100,101,108,105,116,116,108,101,117,110,109,97,114,107,
+    101,100,90,8,117,116,102,95,49,54,108,101,90,3,117,51,
+    50,90,5,117,116,102,51,50,90,8,117,116,102,95,51,50,
+    98,101,90,8,117,116,102,95,51,50,108,101,90,2,117,55,
+    90,4,117,116,102,55,90,17,117,110,105,99,111,100,101,95,
+    49,95,49,95,117,116,102,95,55,90,2,117,56,90,3,117,
+    116,102,90,4,117,116,102,56,90,9,117,116,102,56,95,117,
+    99,115,50,90,9,117,116,102,56,95,117,99,115,52,90,2,
+    117,117,218,3,122,105,112,90,4,122,108,105,98,90,14,120,
+    95,109,97,99,95,106,97,112,97,110,101,115,101,90,12,120,
+    95,109,97,99,95,107,111,114,101,97,110,90,18,120,95,109,
+    97,99,95,115,105,109,112,95,99,104,105,110,101,115,101,90,
+    18,120,95,109,97,99,95,116,114,97,100,95,99,104,105,110,
+    101,115,101,78,41,2,218,7,95,95,100,111,99,95,95,90,
+    7,97,108,105,97,115,101,115,169,0,114,4,0,0,0,114,
+    4,0,0,0,122,29,60,115,116,100,108,105,98,62,47,101,
+    110,99,111,100,105,110,103,115,47,97,108,105,97,115,101,115,
+    46,112,121,218,8,60,109,111,100,117,108,101,62,17,0,0,
+    0,115,134,2,0,0,4,6,2,1,2,1,2,1,2,1,
+    2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,3,
+    2,1,2,3,2,1,2,3,2,1,2,3,2,3,2,1,
+    2,1,2,1,2,1,2,1,2,1,2,1,2,3,2,1,
+    2,1,2,3,2,1,2,1,2,1,2,3,2,1,2,3,
+    2,1,2,3,2,1,2,3,2,1,2,3,2,1,2,3,
+    2,1,2,3,2,1,2,3,2,1,2,3,2,1,2,3,
+    2,1,2,3,2,1,2,1,2,3,2,1,2,1,2,1,
+    2,3,2,1,2,1,2,3,2,1,2,1,2,1,2,1,
+    2,3,2,1,2,1,2,3,2,1,2,1,2,3,2,1,
+    2,1,2,3,2,1,2,1,2,3,2,1,2,1,2,3,
+    2,1,2,1,2,3,2,1,2,1,2,3,2,1,2,1,
+    2,1,2,3,2,1,2,1,2,3,2,1,2,1,2,3,
+    2,1,2,1,2,3,2,1,2,1,2,3,2,1,2,1,
+    2,3,2,1,2,1,2,1,2,3,2,1,2,1,2,1,
+    2,3,2,1,2,1,2,3,2,1,2,3,2,1,2,1,
+    2,3,2,3,2,1,2,1,2,3,2,1,2,1,2,1,
+    2,1,2,1,2,1,2,3,2,3,2,1,2,1,2,1,
+    2,1,2,1,2,1,2,1,2,3,2,1,2,1,2,3,
+    2,3,2,1,2,1,2,3,2,1,2,1,2,3,2,1,
+    2,1,2,3,2,1,2,3,2,1,2,3,2,1,2,3,
+    2,1,2,3,2,1,2,3,2,1,2,1,2,3,2,1,
+    2,1,2,1,2,1,2,1,2,3,2,1,2,1,2,3,
+    2,1,2,1,2,3,2,1,2,1,2,1,2,1,2,1,
+    2,3,2,1,2,1,2,3,2,1,2,1,2,1,2,1,
+    2,3,2,1,2,1,2,1,2,1,2,1,2,3,2,1,
+    2,1,2,1,2,1,2,1,2,3,2,1,2,1,2,1,
+    2,1,2,1,2,3,2,1,2,1,2,1,2,1,2,3,
+    2,1,2,1,2,1,2,1,2,1,2,1,2,3,2,1,
+    2,1,2,1,2,1,2,1,2,1,2,1,2,3,2,1,
+    2,1,2,1,2,1,2,3,2,1,2,1,2,1,2,1,
+    2,1,2,3,2,1,2,3,2,3,2,1,2,1,2,9,
+    2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,
+    2,1,2,1,2,1,2,3,2,3,2,3,2,3,2,1,
+    2,3,2,1,2,3,2,3,2,1,2,3,2,1,2,1,
+    2,1,2,3,2,1,2,1,2,3,2,3,2,1,2,1,
+    2,1,2,3,2,1,2,1,2,3,2,1,2,1,2,3,
+    2,3,2,1,2,1,2,1,2,1,2,3,2,1,2,3,
+    2,1,2,3,2,1,2,3,2,1,2,3,2,3,2,3,
+    2,1,2,1,2,3,2,1,2,1,2,1,2,1,2,3,
+    2,3,2,1,2,3,2,1,2,1,2,1,
+};
+static const unsigned char _Py_M__encodings_ascii[] = {
+    99,0,0,0,0,0,0,0,0,0,0,0,0,5,0,0,
+    0,64,0,0,0,115,136,0,0,0,100,0,90,0,100,1,
+    100,2,108,1,90,1,71,0,100,3,100,4,132,0,100,4,
+    101,1,106,2,131,3,90,2,71,0,100,5,100,6,132,0,
+    100,6,101,1,106,3,131,3,90,3,71,0,100,7,100,8,
+    132,0,100,8,101,1,106,4,131,3,90,4,71,0,100,9,
+    100,10,132,0,100,10,101,2,101,1,106,5,131,4,90,5,
+    71,0,100,11,100,12,132,0,100,12,101,2,101,1,106,6,
+    131,4,90,6,71,0,100,13,100,14,132,0,100,14,101,5,
+    101,6,131,4,90,7,100,15,100,16,132,0,90,8,100,2,
+    83,0,41,17,122,129,32,80,121,116,104,111,110,32,39,97,
+    115,99,105,105,39,32,67,111,100,101,99,10,10,10,87,114,
+    105,116,116,101,110,32,98,121,32,77,97,114,99,45,65,110,
+    100,114,101,32,76,101,109,98,117,114,103,32,40,109,97,108,
+    64,108,101,109,98,117,114,103,46,99,111,109,41,46,10,10,
+    40,99,41,32,67,111,112,121,114,105,103,104,116,32,67,78,
+    82,73,44,32,65,108,108,32,82,105,103,104,116,115,32,82,
+    101,115,101,114,118,101,100,46,32,78,79,32,87,65,82,82,
+    65,78,84,89,46,10,10,233,0,0,0,0,78,99,0,0,
+    0,0,0,0,0,0,0,0,0,0,1,0,0,0,64,0,
+    0,0,115,24,0,0,0,101,0,90,1,100,0,90,2,101,
+    3,106,4,90,5,101,3,106,6,90,7,100,1,83,0,41,
+    2,218,5,67,111,100,101,99,78,41,8,218,8,95,95,110,
+    97,109,101,95,95,218,10,95,95,109,111,100,117,108,101,95,
+    95,218,12,95,95,113,117,97,108,110,97,109,101,95,95,218,
+    6,99,111,100,101,99,115,218,12,97,115,99,105,105,95,101,
+    110,99,111,100,101,218,6,101,110,99,111,100,101,218,12,97,
+    115,99,105,105,95,100,101,99,111,100,101,218,6,100,101,99,
+    111,100,101,169,0,114,10,0,0,0,114,10,0,0,0,250,
+    27,60,115,116,100,108,105,98,62,47,101,110,99,111,100,105,
+    110,103,115,47,97,115,99,105,105,46,112,121,114,1,0,0,
+    0,13,0,0,0,115,4,0,0,0,8,4,6,1,114,1,
+    0,0,0,99,0,0,0,0,0,0,0,0,0,0,0,0,
+    3,0,0,0,64,0,0,0,115,22,0,0,0,101,0,90,
+    1,100,0,90,2,100,5,100,2,100,3,132,1,90,3,100,
+    4,83,0,41,6,218,18,73,110,99,114,101,109,101,110,116,
+    97,108,69,110,99,111,100,101,114,70,99,3,0,0,0,0,
+    0,0,0,3,0,0,0,4,0,0,0,67,0,0,0,115,
+    18,0,0,0,116,0,160,1,124,1,124,0,106,2,161,2,
+    100,1,25,0,83,0,41,2,78,114,0,0,0,0,41,3,
+    114,5,0,0,0,114,6,0,0,0,218,6,101,114,114,111,
+    114,115,41,3,218,4,115,101,108,102,218,5,105,110,112,117,
+    116,218,5,102,105,110,97,108,114,10,0,0,0,114,10,0,
+    0,0,114,11,0,0,0,114,7,0,0,0,21,0,0,0,
+    115,2,0,0,0,0,1,122,25,73,110,99,114,101,109,101,
+    110,116,97,108,69,110,99,111,100,101,114,46,101,110,99,111,
+    100,101,78,41,1,70,41,4,114,2,0,0,0,114,3,0,
+    0,0,114,4,0,0,0,114,7,0,0,0,114,10,0,0,
+    0,114,10,0,0,0,114,10,0,0,0,114,11,0,0,0,
+    114,12,0,0,0,20,0,0,0,115,2,0,0,0,8,1,
+    114,12,0,0,0,99,0,0,0,0,0,0,0,0,0,0,
+    0,0,3,0,0,0,64,0,0,0,115,22,0,0,0,101,
+    0,90,1,100,0,90,2,100,5,100,2,100,3,132,1,90,
+    3,100,4,83,0,41,6,218,18,73,110,99,114,101,109,101,
+    110,116,97,108,68,101,99,111,100,101,114,70,99,3,0,0,
+    0,0,0,0,0,3,0,0,0,4,0,0,0,67,0,0,
+    0,115,18,0,0,0,116,0,160,1,124,1,124,0,106,2,
+    161,2,100,1,25,0,83,0,41,2,78,114,0,0,0,0,
+    41,3,114,5,0,0,0,114,8,0,0,0,114,13,0,0,
+    0,41,3,114,14,0,0,0,114,15,0,0,0,114,16,0,
+    0,0,114,10,0,0,0,114,10,0,0,0,114,11,0,0,
+    0,114,9,0,0,0,25,0,0,0,115,2,0,0,0,0,
+    1,122,25,73,110,99,114,101,109,101,110,116,97,108,68,101,
+    99,111,100,101,114,46,100,101,99,111,100,101,78,41,1,70,
+    41,4,114,2,0,0,0,114,3,0,0,0,114,4,0,0,
+    0,114,9,0,0,0,114,10,0,0,0,114,10,0,0,0,
+    114,10,0,0,0,114,11,0,0,0,114,17,0,0,0,24,
+    0,0,0,115,2,0,0,0,8,1,114,17,0,0,0,99,
+    0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,
+    64,0,0,0,115,12,0,0,0,101,0,90,1,100,0,90,
+    2,100,1,83,0,41,2,218,12,83,116,114,101,97,109,87,
+    114,105,116,101,114,78,41,3,114,2,0,0,0,114,3,0,
+    0,0,114,4,0,0,0,114,10,0,0,0,114,10,0,0,
+    0,114,10,0,0,0,114,11,0,0,0,114,18,0,0,0,
+    28,0,0,0,115,2,0,0,0,8,1,114,18,0,0,0,
+    99,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,
+    0,64,0,0,0,115,12,0,0,0,101,0,90,1,100,0,
+    90,2,100,1,83,0,41,2,218,12,83,116,114,101,97,109,
+    82,101,97,100,101,114,78,41,3,114,2,0,0,0,114,3,
+    0,0,0,114,4,0,0,0,114,10,0,0,0,114,10,0,
+    0,0,114,10,0,0,0,114,11,0,0,0,114,19,0,0,
+    0,31,0,0,0,115,2,0,0,0,8,1,114,19,0,0,
+    0,99,0,0,0,0,0,0,0,0,0,0,0,0,1,0,
+    0,0,64,0,0,0,115,24,0,0,0,101,0,90,1,100,
+    0,90,2,101,3,106,4,90,5,101,3,106,6,90,7,100,
+    1,83,0,41,2,218,15,83,116,114,101,97,109,67,111,110,
+    118,101,114,116,101,114,78,41,8,114,2,0,0,0,114,3,
+    0,0,0,114,4,0,0,0,114,5,0,0,0,114,8,0,
+    0,0,114,7,0,0,0,114,6,0,0,0,114,9,0,0,
+    0,114,10,0,0,0,114,10,0,0,0,114,10,0,0,0,
+    114,11,0,0,0,114,20,0,0,0,34,0,0,0,115,4,
+    0,0,0,8,2,6,1,114,20,0,0,0,99,0,0,0,
+    0,0,0,0,0,0,0,0,0,9,0,0,0,67,0,0,
+    0,115,28,0,0,0,116,0,106,1,100,1,116,2,106,3,
+    116,2,106,4,116,5,116,6,116,7,116,8,100,2,141,7,
+    83,0,41,3,78,218,5,97,115,99,105,105,41,7,218,4,
+    110,97,109,101,114,7,0,0,0,114,9,0,0,0,90,18,
+    105,110,99,114,101,109,101,110,116,97,108,101,110,99,111,100,
+    101,114,90,18,105,110,99,114,101,109,101,110,116,97,108,100,
+    101,99,111,100,101,114,90,12,115,116,114,101,97,109,119,114,
+    105,116,101,114,90,12,115,116,114,101,97,109,114,101,97,100,
+    101,114,41,9,114,5,0,0,0,90,9,67,111,100,101,99,
+    73,110,102,111,114,1,0,0,0,114,7,0,0,0,114,9,
+    0,0,0,114,12,0,0,0,114,17,0,0,0,114,18,0,
+    0,0,114,19,0,0,0,114,10,0,0,0,114,10,0,0,
+    0,114,10,0,0,0,114,11,0,0,0,218,11,103,101,116,
+    114,101,103,101,110,116,114,121,41,0,0,0,115,16,0,0,
+    0,0,1,4,1,2,1,4,1,4,1,2,1,2,1,2,
+    1,114,23,0,0,0,41,9,218,7,95,95,100,111,99,95,
+    95,114,5,0,0,0,114,1,0,0,0,114,12,0,0,0,
+    114,17,0,0,0,114,18,0,0,0,114,19,0,0,0,114,
+    20,0,0,0,114,23,0,0,0,114,10,0,0,0,114,10,
+    0,0,0,114,10,0,0,0,114,11,0,0,0,218,8,60,
+    109,111,100,117,108,101,62,8,0,0,0,115,16,0,0,0,
+    4,1,8,4,18,7,18,4,18,4,20,3,20,3,18,7,
+};
+static const unsigned char _Py_M__encodings_latin_1[] = {
+    99,0,0,0,0,0,0,0,0,0,0,0,0,5,0,0,
+    0,64,0,0,0,115,136,0,0,0,100,0,90,0,100,1,
+    100,2,108,1,90,1,71,0,100,3,100,4,132,0,100,4,
+    101,1,106,2,131,3,90,2,71,0,100,5,100,6,132,0,
+    100,6,101,1,106,3,131,3,90,3,71,0,100,7,100,8,
+    132,0,100,8,101,1,106,4,131,3,90,4,71,0,100,9,
+    100,10,132,0,100,10,101,2,101,1,106,5,131,4,90,5,
+    71,0,100,11,100,12,132,0,100,12,101,2,101,1,106,6,
+    131,4,90,6,71,0,100,13,100,14,132,0,100,14,101,5,
+    101,6,131,4,90,7,100,15,100,16,132,0,90,8,100,2,
+    83,0,41,17,122,131,32,80,121,116,104,111,110,32,39,108,
+    97,116,105,110,45,49,39,32,67,111,100,101,99,10,10,10,
+    87,114,105,116,116,101,110,32,98,121,32,77,97,114,99,45,
+    65,110,100,114,101,32,76,101,109,98,117,114,103,32,40,109,
+    97,108,64,108,101,109,98,117,114,103,46,99,111,109,41,46,
+    10,10,40,99,41,32,67,111,112,121,114,105,103,104,116,32,
+    67,78,82,73,44,32,65,108,108,32,82,105,103,104,116,115,
+    32,82,101,115,101,114,118,101,100,46,32,78,79,32,87,65,
+    82,82,65,78,84,89,46,10,10,233,0,0,0,0,78,99,
+    0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,
+    64,0,0,0,115,24,0,0,0,101,0,90,1,100,0,90,
+    2,101,3,106,4,90,5,101,3,106,6,90,7,100,1,83,
+    0,41,2,218,5,67,111,100,101,99,78,41,8,218,8,95,
+    95,110,97,109,101,95,95,218,10,95,95,109,111,100,117,108,
+    101,95,95,218,12,95,95,113,117,97,108,110,97,109,101,95,
+    95,218,6,99,111,100,101,99,115,218,14,108,97,116,105,110,
+    95,49,95,101,110,99,111,100,101,218,6,101,110,99,111,100,
+    101,218,14,108,97,116,105,110,95,49,95,100,101,99,111,100,
+    101,218,6,100,101,99,111,100,101,169,0,114,10,0,0,0,
+    114,10,0,0,0,250,29,60,115,116,100,108,105,98,62,47,
+    101,110,99,111,100,105,110,103,115,47,108,97,116,105,110,95,
+    49,46,112,121,114,1,0,0,0,13,0,0,0,115,4,0,
+    0,0,8,4,6,1,114,1,0,0,0,99,0,0,0,0,
+    0,0,0,0,0,0,0,0,3,0,0,0,64,0,0,0,
+    115,22,0,0,0,101,0,90,1,100,0,90,2,100,5,100,
+    2,100,3,132,1,90,3,100,4,83,0,41,6,218,18,73,
+    110,99,114,101,109,101,110,116,97,108,69,110,99,111,100,101,
+    114,70,99,3,0,0,0,0,0,0,0,3,0,0,0,4,
+    0,0,0,67,0,0,0,115,18,0,0,0,116,0,160,1,
+    124,1,124,0,106,2,161,2,100,1,25,0,83,0,41,2,
+    78,114,0,0,0,0,41,3,114,5,0,0,0,114,6,0,
+    0,0,218,6,101,114,114,111,114,115,41,3,218,4,115,101,
+    108,102,218,5,105,110,112,117,116,218,5,102,105,110,97,108,
+    114,10,0,0,0,114,10,0,0,0,114,11,0,0,0,114,
+    7,0,0,0,21,0,0,0,115,2,0,0,0,0,1,122,
+    25,73,110,99,114,101,109,101,110,116,97,108,69,110,99,111,
+    100,101,114,46,101,110,99,111,100,101,78,41,1,70,41,4,
+    114,2,0,0,0,114,3,0,0,0,114,4,0,0,0,114,
+    7,0,0,0,114,10,0,0,0,114,10,0,0,0,114,10,
+    0,0,0,114,11,0,0,0,114,12,0,0,0,20,0,0,
+    0,115,2,0,0,0,8,1,114,12,0,0,0,99,0,0,
+    0,0,0,0,0,0,0,0,0,0,3,0,0,0,64,0,
+    0,0,115,22,0,0,0,101,0,90,1,100,0,90,2,100,
+    5,100,2,100,3,132,1,90,3,100,4,83,0,41,6,218,
+    18,73,110,99,114,101,109,101,110,116,97,108,68,101,99,111,
+    100,101,114,70,99,3,0,0,0,0,0,0,0,3,0,0,
+    0,4,0,0,0,67,0,0,0,115,18,0,0,0,116,0,
+    160,1,124,1,124,0,106,2,161,2,100,1,25,0,83,0,
+    41,2,78,114,0,0,0,0,41,3,114,5,0,0,0,114,
+    8,0,0,0,114,13,0,0,0,41,3,114,14,0,0,0,
+    114,15,0,0,0,114,16,0,0,0,114,10,0,0,0,114,
+    10,0,0,0,114,11,0,0,0,114,9,0,0,0,25,0,
+    0,0,115,2,0,0,0,0,1,122,25,73,110,99,114,101,
+    109,101,110,116,97,108,68,101,99,111,100,101,114,46,100,101,
+    99,111,100,101,78,41,1,70,41,4,114,2,0,0,0,114,
+    3,0,0,0,114,4,0,0,0,114,9,0,0,0,114,10,
+    0,0,0,114,10,0,0,0,114,10,0,0,0,114,11,0,
+    0,0,114,17,0,0,0,24,0,0,0,115,2,0,0,0,
+    8,1,114,17,0,0,0,99,0,0,0,0,0,0,0,0,
+    0,0,0,0,1,0,0,0,64,0,0,0,115,12,0,0,
+    0,101,0,90,1,100,0,90,2,100,1,83,0,41,2,218,
+    12,83,116,114,101,97,109,87,114,105,116,101,114,78,41,3,
+    114,2,0,0,0,114,3,0,0,0,114,4,0,0,0,114,
+    10,0,0,0,114,10,0,0,0,114,10,0,0,0,114,11,
+    0,0,0,114,18,0,0,0,28,0,0,0,115,2,0,0,
+    0,8,1,114,18,0,0,0,99,0,0,0,0,0,0,0,
+    0,0,0,0,0,1,0,0,0,64,0,0,0,115,12,0,
+    0,0,101,0,90,1,100,0,90,2,100,1,83,0,41,2,
+    218,12,83,116,114,101,97,109,82,101,97,100,101,114,78,41,
+    3,114,2,0,0,0,114,3,0,0,0,114,4,0,0,0,
+    114,10,0,0,0,114,10,0,0,0,114,10,0,0,0,114,
+    11,0,0,0,114,19,0,0,0,31,0,0,0,115,2,0,
+    0,0,8,1,114,19,0,0,0,99,0,0,0,0,0,0,
+    0,0,0,0,0,0,1,0,0,0,64,0,0,0,115,24,
+    0,0,0,101,0,90,1,100,0,90,2,101,3,106,4,90,
+    5,101,3,106,6,90,7,100,1,83,0,41,2,218,15,83,
+    116,114,101,97,109,67,111,110,118,101,114,116,101,114,78,41,
+    8,114,2,0,0,0,114,3,0,0,0,114,4,0,0,0,
+    114,5,0,0,0,114,8,0,0,0,114,7,0,0,0,114,
+    6,0,0,0,114,9,0,0,0,114,10,0,0,0,114,10,
+    0,0,0,114,10,0,0,0,114,11,0,0,0,114,20,0,
+    0,0,34,0,0,0,115,4,0,0,0,8,2,6,1,114,
+    20,0,0,0,99,0,0,0,0,0,0,0,0,0,0,0,
+    0,9,0,0,0,67,0,0,0,115,28,0,0,0,116,0,
+    106,1,100,1,116,2,106,3,116,2,106,4,116,5,116,6,
+    116,7,116,8,100,2,141,7,83,0,41,3,78,122,9,105,
+    115,111,56,56,53,57,45,49,41,7,218,4,110,97,109,101,
+    114,7,0,0,0,114,9,0,0,0,90,18,105,110,99,114,
+    101,109,101,110,116,97,108,101,110,99,111,100,101,114,90,18,
+    105,110,99,114,101,109,101,110,116,97,108,100,101,99,111,100,
+    101,114,90,12,115,116,114,101,97,109,114,101,97,100,101,114,
+    90,12,115,116,114,101,97,109,119,114,105,116,101,114,41,9,
+    114,5,0,0,0,90,9,67,111,100,101,99,73,110,102,111,
+    114,1,0,0,0,114,7,0,0,0,114,9,0,0,0,114,
+    12,0,0,0,114,17,0,0,0,114,19,0,0,0,114,18,
+    0,0,0,114,10,0,0,0,114,10,0,0,0,114,10,0,
+    0,0,114,11,0,0,0,218,11,103,101,116,114,101,103,101,
+    110,116,114,121,41,0,0,0,115,16,0,0,0,0,1,4,
+    1,2,1,4,1,4,1,2,1,2,1,2,1,114,22,0,
+    0,0,41,9,218,7,95,95,100,111,99,95,95,114,5,0,
+    0,0,114,1,0,0,0,114,12,0,0,0,114,17,0,0,
+    0,114,18,0,0,0,114,19,0,0,0,114,20,0,0,0,
+    114,22,0,0,0,114,10,0,0,0,114,10,0,0,0,114,
+    10,0,0,0,114,11,0,0,0,218,8,60,109,111,100,117,
+    108,101,62,8,0,0,0,115,16,0,0,0,4,1,8,4,
+    18,7,18,4,18,4,20,3,20,3,18,7,
+};
+static const unsigned char _Py_M__encodings_utf_8[] = {
+    99,0,0,0,0,0,0,0,0,0,0,0,0,4,0,0,
+    0,64,0,0,0,115,112,0,0,0,100,0,90,0,100,1,
+    100,2,108,1,90,1,101,1,106,2,90,3,100,16,100,4,
+    100,5,132,1,90,4,71,0,100,6,100,7,132,0,100,7,
+    101,1,106,5,131,3,90,5,71,0,100,8,100,9,132,0,
+    100,9,101,1,106,6,131,3,90,7,71,0,100,10,100,11,
+    132,0,100,11,101,1,106,8,131,3,90,8,71,0,100,12,
+    100,13,132,0,100,13,101,1,106,9,131,3,90,9,100,14,
+    100,15,132,0,90,10,100,2,83,0,41,17,122,129,32,80,
+    121,116,104,111,110,32,39,117,116,102,45,56,39,32,67,111,
+    100,101,99,10,10,10,87,114,105,116,116,101,110,32,98,121,
+    32,77,97,114,99,45,65,110,100,114,101,32,76,101,109,98,
+    117,114,103,32,40,109,97,108,64,108,101,109,98,117,114,103,
+    46,99,111,109,41,46,10,10,40,99,41,32,67,111,112,121,
+    114,105,103,104,116,32,67,78,82,73,44,32,65,108,108,32,
+    82,105,103,104,116,115,32,82,101,115,101,114,118,101,100,46,
+    32,78,79,32,87,65,82,82,65,78,84,89,46,10,10,233,
+    0,0,0,0,78,218,6,115,116,114,105,99,116,99,2,0,
+    0,0,0,0,0,0,2,0,0,0,5,0,0,0,67,0,
+    0,0,115,14,0,0,0,116,0,160,1,124,0,124,1,100,
+    1,161,3,83,0,41,2,78,84,41,2,218,6,99,111,100,
+    101,99,115,218,12,117,116,102,95,56,95,100,101,99,111,100,
+    101,41,2,218,5,105,110,112,117,116,218,6,101,114,114,111,
+    114,115,169,0,114,6,0,0,0,250,27,60,115,116,100,108,
+    105,98,62,47,101,110,99,111,100,105,110,103,115,47,117,116,
+    102,95,56,46,112,121,218,6,100,101,99,111,100,101,15,0,
+    0,0,115,2,0,0,0,0,1,114,8,0,0,0,99,0,
+    0,0,0,0,0,0,0,0,0,0,0,3,0,0,0,64,
+    0,0,0,115,22,0,0,0,101,0,90,1,100,0,90,2,
+    100,5,100,2,100,3,132,1,90,3,100,4,83,0,41,6,
+    218,18,73,110,99,114,101,109,101,110,116,97,108,69,110,99,
+    111,100,101,114,70,99,3,0,0,0,0,0,0,0,3,0,
+    0,0,4,0,0,0,67,0,0,0,115,18,0,0,0,116,
+    0,160,1,124,1,124,0,106,2,161,2,100,1,25,0,83,
+    0,41,2,78,114,0,0,0,0,41,3,114,2,0,0,0,
+    218,12,117,116,102,95,56,95,101,110,99,111,100,101,114,5,
+    0,0,0,41,3,90,4,115,101,108,102,114,4,0,0,0,
+    90,5,102,105,110,97,108,114,6,0,0,0,114,6,0,0,
+    0,114,7,0,0,0,218,6,101,110,99,111,100,101,19,0,
+    0,0,115,2,0,0,0,0,1,122,25,73,110,99,114,101,
+    109,101,110,116,97,108,69,110,99,111,100,101,114,46,101,110,
+    99,111,100,101,78,41,1,70,41,4,218,8,95,95,110,97,
+    109,101,95,95,218,10,95,95,109,111,100,117,108,101,95,95,
+    218,12,95,95,113,117,97,108,110,97,109,101,95,95,114,11,
+    0,0,0,114,6,0,0,0,114,6,0,0,0,114,6,0,
+    0,0,114,7,0,0,0,114,9,0,0,0,18,0,0,0,
+    115,2,0,0,0,8,1,114,9,0,0,0,99,0,0,0,
+    0,0,0,0,0,0,0,0,0,1,0,0,0,64,0,0,
+    0,115,18,0,0,0,101,0,90,1,100,0,90,2,101,3,
+    106,4,90,5,100,1,83,0,41,2,218,18,73,110,99,114,
+    101,109,101,110,116,97,108,68,101,99,111,100,101,114,78,41,
+    6,114,12,0,0,0,114,13,0,0,0,114,14,0,0,0,
+    114,2,0,0,0,114,3,0,0,0,90,14,95,98,117,102,
+    102,101,114,95,100,101,99,111,100,101,114,6,0,0,0,114,
+    6,0,0,0,114,6,0,0,0,114,7,0,0,0,114,15,
+    0,0,0,22,0,0,0,115,2,0,0,0,8,1,114,15,
+    0,0,0,99,0,0,0,0,0,0,0,0,0,0,0,0,
+    1,0,0,0,64,0,0,0,115,18,0,0,0,101,0,90,
+    1,100,0,90,2,101,3,106,4,90,5,100,1,83,0,41,
+    2,218,12,83,116,114,101,97,109,87,114,105,116,101,114,78,
+    41,6,114,12,0,0,0,114,13,0,0,0,114,14,0,0,
+    0,114,2,0,0,0,114,10,0,0,0,114,11,0,0,0,
+    114,6,0,0,0,114,6,0,0,0,114,6,0,0,0,114,
+    7,0,0,0,114,16,0,0,0,25,0,0,0,115,2,0,
+    0,0,8,1,114,16,0,0,0,99,0,0,0,0,0,0,
+    0,0,0,0,0,0,1,0,0,0,64,0,0,0,115,18,
+    0,0,0,101,0,90,1,100,0,90,2,101,3,106,4,90,
+    5,100,1,83,0,41,2,218,12,83,116,114,101,97,109,82,
+    101,97,100,101,114,78,41,6,114,12,0,0,0,114,13,0,
+    0,0,114,14,0,0,0,114,2,0,0,0,114,3,0,0,
+    0,114,8,0,0,0,114,6,0,0,0,114,6,0,0,0,
+    114,6,0,0,0,114,7,0,0,0,114,17,0,0,0,28,
+    0,0,0,115,2,0,0,0,8,1,114,17,0,0,0,99,
+    0,0,0,0,0,0,0,0,0,0,0,0,9,0,0,0,
+    67,0,0,0,115,24,0,0,0,116,0,106,1,100,1,116,
+    2,116,3,116,4,116,5,116,6,116,7,100,2,141,7,83,
+    0,41,3,78,122,5,117,116,102,45,56,41,7,218,4,110,
+    97,109,101,114,11,0,0,0,114,8,0,0,0,90,18,105,
+    110,99,114,101,109,101,110,116,97,108,101,110,99,111,100,101,
+    114,90,18,105,110,99,114,101,109,101,110,116,97,108,100,101,
+    99,111,100,101,114,90,12,115,116,114,101,97,109,114,101,97,
+    100,101,114,90,12,115,116,114,101,97,109,119,114,105,116,101,
+    114,41,8,114,2,0,0,0,90,9,67,111,100,101,99,73,
+    110,102,111,114,11,0,0,0,114,8,0,0,0,114,9,0,
+    0,0,114,15,0,0,0,114,17,0,0,0,114,16,0,0,
+    0,114,6,0,0,0,114,6,0,0,0,114,6,0,0,0,
+    114,7,0,0,0,218,11,103,101,116,114,101,103,101,110,116,
+    114,121,33,0,0,0,115,16,0,0,0,0,1,4,1,2,
+    1,2,1,2,1,2,1,2,1,2,1,114,19,0,0,0,
+    41,1,114,1,0,0,0,41,11,218,7,95,95,100,111,99,
+    95,95,114,2,0,0,0,114,10,0,0,0,114,11,0,0,
+    0,114,8,0,0,0,114,9,0,0,0,90,26,66,117,102,
+    102,101,114,101,100,73,110,99,114,101,109,101,110,116,97,108,
+    68,101,99,111,100,101,114,114,15,0,0,0,114,16,0,0,
+    0,114,17,0,0,0,114,19,0,0,0,114,6,0,0,0,
+    114,6,0,0,0,114,6,0,0,0,114,7,0,0,0,218,
+    8,60,109,111,100,117,108,101,62,8,0,0,0,115,16,0,
+    0,0,4,1,8,4,6,2,10,3,18,4,18,3,18,3,
+    18,5,
+};
+static const unsigned char _Py_M__io[] = {
+    99,0,0,0,0,0,0,0,0,0,0,0,0,18,0,0,
+    0,64,0,0,0,115,108,1,0,0,100,0,90,0,100,1,
+    90,1,100,2,100,3,100,4,100,5,100,6,100,7,100,8,
+    100,9,100,10,100,11,100,12,100,13,100,14,100,15,100,16,
+    100,17,100,18,100,19,103,18,90,2,100,20,100,21,108,3,
+    90,3,100,20,100,21,108,4,90,4,100,20,100,22,108,3,
+    109,5,90,5,109,6,90,6,109,7,90,7,109,8,90,8,
+    109,9,90,9,109,10,90,10,109,11,90,11,109,12,90,12,
+    109,13,90,13,109,14,90,14,109,15,90,15,109,16,90,16,
+    109,17,90,17,1,0,101,3,106,8,90,18,100,23,101,7,
+    95,19,100,20,90,20,100,24,90,21,100,25,90,22,71,0,
+    100,26,100,4,132,0,100,4,101,3,106,23,101,4,106,24,
+    100,27,141,4,90,25,71,0,100,28,100,5,132,0,100,5,
+    101,3,106,26,101,25,131,4,90,27,71,0,100,29,100,9,
+    132,0,100,9,101,3,106,28,101,25,131,4,90,29,71,0,
+    100,30,100,14,132,0,100,14,101,3,106,30,101,25,131,4,
+    90,31,101,27,160,32,101,9,161,1,1,0,120,34,101,10,
+    101,12,101,13,101,15,101,14,102,5,68,0,93,16,90,33,
+    101,29,160,32,101,33,161,1,1,0,144,1,113,2,87,0,
+    120,28,101,11,101,17,102,2,68,0,93,16,90,33,101,31,
+    160,32,101,33,161,1,1,0,144,1,113,32,87,0,91,33,
+    121,16,100,20,100,31,108,3,109,34,90,34,1,0,87,0,
+    110,22,4,0,101,35,107,10,144,1,114,92,1,0,1,0,
+    1,0,89,0,110,12,88,0,101,27,160,32,101,34,161,1,
+    1,0,100,21,83,0,41,32,97,193,5,0,0,84,104,101,
+    32,105,111,32,109,111,100,117,108,101,32,112,114,111,118,105,
+    100,101,115,32,116,104,101,32,80,121,116,104,111,110,32,105,
+    110,116,101,114,102,97,99,101,115,32,116,111,32,115,116,114,
+    101,97,109,32,104,97,110,100,108,105,110,103,46,32,84,104,
+    101,10,98,117,105,108,116,105,110,32,111,112,101,110,32,102,
+    117,110,99,116,105,111,110,32,105,115,32,100,101,102,105,110,
+    101,100,32,105,110,32,116,104,105,115,32,109,111,100,117,108,
+    101,46,10,10,65,116,32,116,104,101,32,116,111,112,32,111,
+    102,32,116,104,101,32,73,47,79,32,104,105,101,114,97,114,
+    99,104,121,32,105,115,32,116,104,101,32,97,98,115,116,114,
+    97,99,116,32,98,97,115,101,32,99,108,97,115,115,32,73,
+    79,66,97,115,101,46,32,73,116,10,100,101,102,105,110,101,
+    115,32,116,104,101,32,98,97,115,105,99,32,105,110,116,101,
+    114,102,97,99,101,32,116,111,32,97,32,115,116,114,101,97,
+    109,46,32,78,111,116,101,44,32,104,111,119,101,118,101,114,
+    44,32,116,104,97,116,32,116,104,101,114,101,32,105,115,32,
+    110,111,10,115,101,112,97,114,97,116,105,111,110,32,98,101,
+    116,119,101,101,110,32,114,101,97,100,105,110,103,32,97,110,
+    100,32,119,114,105,116,105,110,103,32,116,111,32,115,116,114,
+    101,97,109,115,59,32,105,109,112,108,101,109,101,110,116,97,
+    116,105,111,110,115,32,97,114,101,10,97,108,108,111,119,101,
+    100,32,116,111,32,114,97,105,115,101,32,97,110,32,79,83,
+    69,114,114,111,114,32,105,102,32,116,104,101,121,32,100,111,
+    32,110,111,116,32,115,117,112,112,111,114,116,32,97,32,103,
+    105,118,101,110,32,111,112,101,114,97,116,105,111,110,46,10,
+    10,69,120,116,101,110,100,105,110,103,32,73,79,66,97,115,
+    101,32,105,115,32,82,97,119,73,79,66,97,115,101,32,119,
+    104,105,99,104,32,100,101,97,108,115,32,115,105,109,112,108,
+    121,32,119,105,116,104,32,116,104,101,32,114,101,97,100,105,
+    110,103,32,97,110,100,10,119,114,105,116,105,110,103,32,111,
+    102,32,114,97,119,32,98,121,116,101,115,32,116,111,32,97,
+    32,115,116,114,101,97,109,46,32,70,105,108,101,73,79,32,
+    115,117,98,99,108,97,115,115,101,115,32,82,97,119,73,79,
+    66,97,115,101,32,116,111,32,112,114,111,118,105,100,101,10,
+    97,110,32,105,110,116,101,114,102,97,99,101,32,116,111,32,
+    79,83,32,102,105,108,101,115,46,10,10,66,117,102,102,101,
+    114,101,100,73,79,66,97,115,101,32,100,101,97,108,115,32,
+    119,105,116,104,32,98,117,102,102,101,114,105,110,103,32,111,
+    110,32,97,32,114,97,119,32,98,121,116,101,32,115,116,114,
+    101,97,109,32,40,82,97,119,73,79,66,97,115,101,41,46,
+    32,73,116,115,10,115,117,98,99,108,97,115,115,101,115,44,
+    32,66,117,102,102,101,114,101,100,87,114,105,116,101,114,44,
+    32,66,117,102,102,101,114,101,100,82,101,97,100,101,114,44,
+    32,97,110,100,32,66,117,102,102,101,114,101,100,82,87,80,
+    97,105,114,32,98,117,102,102,101,114,10,115,116,114,101,97,
+    109,115,32,116,104,97,116,32,97,114,101,32,114,101,97,100,
+    97,98,108,101,44,32,119,114,105,116,97,98,108,101,44,32,
+    97,110,100,32,98,111,116,104,32,114,101,115,112,101,99,116,
+    105,118,101,108,121,46,10,66,117,102,102,101,114,101,100,82,
+    97,110,100,111,109,32,112,114,111,118,105,100,101,115,32,97,
+    32,98,117,102,102,101,114,101,100,32,105,110,116,101,114,102,
+    97,99,101,32,116,111,32,114,97,110,100,111,109,32,97,99,
+    99,101,115,115,10,115,116,114,101,97,109,115,46,32,66,121,
+    116,101,115,73,79,32,105,115,32,97,32,115,105,109,112,108,
+    101,32,115,116,114,101,97,109,32,111,102,32,105,110,45,109,
+    101,109,111,114,121,32,98,121,116,101,115,46,10,10,65,110,
+    111,116,104,101,114,32,73,79,66,97,115,101,32,115,117,98,
+    99,108,97,115,115,44,32,84,101,120,116,73,79,66,97,115,
+    101,44,32,100,101,97,108,115,32,119,105,116,104,32,116,104,
+    101,32,101,110,99,111,100,105,110,103,32,97,110,100,32,100,
+    101,99,111,100,105,110,103,10,111,102,32,115,116,114,101,97,
+    109,115,32,105,110,116,111,32,116,101,120,116,46,32,84,101,
+    120,116,73,79,87,114,97,112,112,101,114,44,32,119,104,105,
+    99,104,32,101,120,116,101,110,100,115,32,105,116,44,32,105,
+    115,32,97,32,98,117,102,102,101,114,101,100,32,116,101,120,
+    116,10,105,110,116,101,114,102,97,99,101,32,116,111,32,97,
+    32,98,117,102,102,101,114,101,100,32,114,97,119,32,115,116,
+    114,101,97,109,32,40,96,66,117,102,102,101,114,101,100,73,
+    79,66,97,115,101,96,41,46,32,70,105,110,97,108,108,121,
+    44,32,83,116,114,105,110,103,73,79,10,105,115,32,97,110,
+    32,105,110,45,109,101,109,111,114,121,32,115,116,114,101,97,
+    109,32,102,111,114,32,116,101,120,116,46,10,10,65,114,103,
+    117,109,101,110,116,32,110,97,109,101,115,32,97,114,101,32,
+    110,111,116,32,112,97,114,116,32,111,102,32,116,104,101,32,
+    115,112,101,99,105,102,105,99,97,116,105,111,110,44,32,97,
+    110,100,32,111,110,108,121,32,116,104,101,32,97,114,103,117,
+    109,101,110,116,115,10,111,102,32,111,112,101,110,40,41,32,
+    97,114,101,32,105,110,116,101,110,100,101,100,32,116,111,32,
+    98,101,32,117,115,101,100,32,97,115,32,107,101,121,119,111,
+    114,100,32,97,114,103,117,109,101,110,116,115,46,10,10,100,
+    97,116,97,58,10,10,68,69,70,65,85,76,84,95,66,85,
+    70,70,69,82,95,83,73,90,69,10,10,32,32,32,65,110,
+    32,105,110,116,32,99,111,110,116,97,105,110,105,110,103,32,
+    116,104,101,32,100,101,102,97,117,108,116,32,98,117,102,102,
+    101,114,32,115,105,122,101,32,117,115,101,100,32,98,121,32,
+    116,104,101,32,109,111,100,117,108,101,39,115,32,98,117,102,
+    102,101,114,101,100,10,32,32,32,73,47,79,32,99,108,97,
+    115,115,101,115,46,32,111,112,101,110,40,41,32,117,115,101,
+    115,32,116,104,101,32,102,105,108,101,39,115,32,98,108,107,
+    115,105,122,101,32,40,97,115,32,111,98,116,97,105,110,101,
+    100,32,98,121,32,111,115,46,115,116,97,116,41,32,105,102,
+    10,32,32,32,112,111,115,115,105,98,108,101,46,10,122,235,
+    71,117,105,100,111,32,118,97,110,32,82,111,115,115,117,109,
+    32,60,103,117,105,100,111,64,112,121,116,104,111,110,46,111,
+    114,103,62,44,32,77,105,107,101,32,86,101,114,100,111,110,
+    101,32,60,109,105,107,101,46,118,101,114,100,111,110,101,64,
+    103,109,97,105,108,46,99,111,109,62,44,32,77,97,114,107,
+    32,82,117,115,115,101,108,108,32,60,109,97,114,107,46,114,
+    117,115,115,101,108,108,64,122,101,110,46,99,111,46,117,107,
+    62,44,32,65,110,116,111,105,110,101,32,80,105,116,114,111,
+    117,32,60,115,111,108,105,112,115,105,115,64,112,105,116,114,
+    111,117,46,110,101,116,62,44,32,65,109,97,117,114,121,32,
+    70,111,114,103,101,111,116,32,100,39,65,114,99,32,60,97,
+    109,97,117,114,121,102,97,64,103,109,97,105,108,46,99,111,
+    109,62,44,32,66,101,110,106,97,109,105,110,32,80,101,116,
+    101,114,115,111,110,32,60,98,101,110,106,97,109,105,110,64,
+    112,121,116,104,111,110,46,111,114,103,62,218,15,66,108,111,
+    99,107,105,110,103,73,79,69,114,114,111,114,218,4,111,112,
+    101,110,218,6,73,79,66,97,115,101,218,9,82,97,119,73,
+    79,66,97,115,101,218,6,70,105,108,101,73,79,218,7,66,
+    121,116,101,115,73,79,218,8,83,116,114,105,110,103,73,79,
+    218,14,66,117,102,102,101,114,101,100,73,79,66,97,115,101,
+    218,14,66,117,102,102,101,114,101,100,82,101,97,100,101,114,
+    218,14,66,117,102,102,101,114,101,100,87,114,105,116,101,114,
+    218,14,66,117,102,102,101,114,101,100,82,87,80,97,105,114,
+    218,14,66,117,102,102,101,114,101,100,82,97,110,100,111,109,
+    218,10,84,101,120,116,73,79,66,97,115,101,218,13,84,101,
+    120,116,73,79,87,114,97,112,112,101,114,218,20,85,110,115,
+    117,112,112,111,114,116,101,100,79,112,101,114,97,116,105,111,
+    110,218,8,83,69,69,75,95,83,69,84,218,8,83,69,69,
+    75,95,67,85,82,218,8,83,69,69,75,95,69,78,68,233,
+    0,0,0,0,78,41,13,218,19,68,69,70,65,85,76,84,
+    95,66,85,70,70,69,82,95,83,73,90,69,114,0,0,0,
+    0,114,14,0,0,0,114,1,0,0,0,114,4,0,0,0,
+    114,5,0,0,0,114,6,0,0,0,114,8,0,0,0,114,
+    9,0,0,0,114,10,0,0,0,114,11,0,0,0,218,25,
+    73,110,99,114,101,109,101,110,116,97,108,78,101,119,108,105,
+    110,101,68,101,99,111,100,101,114,114,13,0,0,0,90,2,
+    105,111,233,1,0,0,0,233,2,0,0,0,99,0,0,0,
+    0,0,0,0,0,0,0,0,0,1,0,0,0,64,0,0,
+    0,115,20,0,0,0,101,0,90,1,100,0,90,2,101,3,
+    106,4,106,5,90,5,100,1,83,0,41,2,114,2,0,0,
+    0,78,41,6,218,8,95,95,110,97,109,101,95,95,218,10,
+    95,95,109,111,100,117,108,101,95,95,218,12,95,95,113,117,
+    97,108,110,97,109,101,95,95,218,3,95,105,111,218,7,95,
+    73,79,66,97,115,101,218,7,95,95,100,111,99,95,95,169,
+    0,114,29,0,0,0,114,29,0,0,0,250,14,60,115,116,
+    100,108,105,98,62,47,105,111,46,112,121,114,2,0,0,0,
+    72,0,0,0,115,2,0,0,0,8,1,41,1,90,9,109,
+    101,116,97,99,108,97,115,115,99,0,0,0,0,0,0,0,
+    0,0,0,0,0,1,0,0,0,64,0,0,0,115,20,0,
+    0,0,101,0,90,1,100,0,90,2,101,3,106,4,106,5,
+    90,5,100,1,83,0,41,2,114,3,0,0,0,78,41,6,
+    114,23,0,0,0,114,24,0,0,0,114,25,0,0,0,114,
+    26,0,0,0,218,10,95,82,97,119,73,79,66,97,115,101,
+    114,28,0,0,0,114,29,0,0,0,114,29,0,0,0,114,
+    29,0,0,0,114,30,0,0,0,114,3,0,0,0,75,0,
+    0,0,115,2,0,0,0,8,1,99,0,0,0,0,0,0,
+    0,0,0,0,0,0,1,0,0,0,64,0,0,0,115,20,
+    0,0,0,101,0,90,1,100,0,90,2,101,3,106,4,106,
+    5,90,5,100,1,83,0,41,2,114,7,0,0,0,78,41,
+    6,114,23,0,0,0,114,24,0,0,0,114,25,0,0,0,
+    114,26,0,0,0,218,15,95,66,117,102,102,101,114,101,100,
+    73,79,66,97,115,101,114,28,0,0,0,114,29,0,0,0,
+    114,29,0,0,0,114,29,0,0,0,114,30,0,0,0,114,
+    7,0,0,0,78,0,0,0,115,2,0,0,0,8,1,99,
+    0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,
+    64,0,0,0,115,20,0,0,0,101,0,90,1,100,0,90,
+    2,101,3,106,4,106,5,90,5,100,1,83,0,41,2,114,
+    12,0,0,0,78,41,6,114,23,0,0,0,114,24,0,0,
+    0,114,25,0,0,0,114,26,0,0,0,218,11,95,84,101,
+    120,116,73,79,66,97,115,101,114,28,0,0,0,114,29,0,
+    0,0,114,29,0,0,0,114,29,0,0,0,114,30,0,0,
+    0,114,12,0,0,0,81,0,0,0,115,2,0,0,0,8,
+    1,41,1,218,17,95,87,105,110,100,111,119,115,67,111,110,
+    115,111,108,101,73,79,41,36,114,28,0,0,0,90,10,95,
+    95,97,117,116,104,111,114,95,95,90,7,95,95,97,108,108,
+    95,95,114,26,0,0,0,90,3,97,98,99,114,19,0,0,
+    0,114,0,0,0,0,114,14,0,0,0,114,1,0,0,0,
+    114,4,0,0,0,114,5,0,0,0,114,6,0,0,0,114,
+    8,0,0,0,114,9,0,0,0,114,10,0,0,0,114,11,
+    0,0,0,114,20,0,0,0,114,13,0,0,0,90,11,79,
+    112,101,110,87,114,97,112,112,101,114,114,24,0,0,0,114,
+    15,0,0,0,114,16,0,0,0,114,17,0,0,0,114,27,
+    0,0,0,90,7,65,66,67,77,101,116,97,114,2,0,0,
+    0,114,31,0,0,0,114,3,0,0,0,114,32,0,0,0,
+    114,7,0,0,0,114,33,0,0,0,114,12,0,0,0,90,
+    8,114,101,103,105,115,116,101,114,90,5,107,108,97,115,115,
+    114,34,0,0,0,218,11,73,109,112,111,114,116,69,114,114,
+    111,114,114,29,0,0,0,114,29,0,0,0,114,29,0,0,
+    0,114,30,0,0,0,218,8,60,109,111,100,117,108,101,62,
+    34,0,0,0,115,60,0,0,0,4,3,4,7,10,1,6,
+    1,6,1,6,1,12,3,8,1,8,2,60,5,6,3,6,
+    3,4,1,4,1,4,5,24,3,20,3,20,3,20,3,10,
+    2,10,1,10,1,16,2,14,1,16,1,2,2,2,1,16,
+    1,16,1,6,2,
+};
+static const unsigned char _Py_M___bootlocale[] = {
+    99,0,0,0,0,0,0,0,0,0,0,0,0,11,0,0,
+    0,64,0,0,0,115,122,0,0,0,100,0,90,0,100,1,
+    100,2,108,1,90,1,100,1,100,2,108,2,90,2,101,1,
+    106,3,160,4,100,3,161,1,114,44,100,11,100,5,100,6,
+    132,1,90,5,110,74,121,10,101,2,106,6,1,0,87,0,
+    110,52,4,0,101,7,107,10,114,106,1,0,1,0,1,0,
+    101,8,101,1,100,7,131,2,114,92,100,12,100,8,100,6,
+    132,1,90,5,110,10,100,13,100,9,100,6,132,1,90,5,
+    89,0,110,12,88,0,100,14,100,10,100,6,132,1,90,5,
+    100,2,83,0,41,15,122,208,65,32,109,105,110,105,109,97,
+    108,32,115,117,98,115,101,116,32,111,102,32,116,104,101,32,
+    108,111,99,97,108,101,32,109,111,100,117,108,101,32,117,115,
+    101,100,32,97,116,32,105,110,116,101,114,112,114,101,116,101,
+    114,32,115,116,97,114,116,117,112,10,40,105,109,112,111,114,
+    116,101,100,32,98,121,32,116,104,101,32,95,105,111,32,109,
+    111,100,117,108,101,41,44,32,105,110,32,111,114,100,101,114,
+    32,116,111,32,114,101,100,117,99,101,32,115,116,97,114,116,
+    117,112,32,116,105,109,101,46,10,10,68,111,110,39,116,32,
+    105,109,112,111,114,116,32,100,105,114,101,99,116,108,121,32,
+    102,114,111,109,32,116,104,105,114,100,45,112,97,114,116,121,
+    32,99,111,100,101,59,32,117,115,101,32,116,104,101,32,96,
+    108,111,99,97,108,101,96,32,109,111,100,117,108,101,32,105,
+    110,115,116,101,97,100,33,10,233,0,0,0,0,78,90,3,
+    119,105,110,84,99,1,0,0,0,0,0,0,0,1,0,0,
+    0,2,0,0,0,67,0,0,0,115,12,0,0,0,116,0,
+    160,1,161,0,100,1,25,0,83,0,41,2,78,233,1,0,
+    0,0,41,2,218,7,95,108,111,99,97,108,101,90,17,95,
+    103,101,116,100,101,102,97,117,108,116,108,111,99,97,108,101,
+    41,1,218,12,100,111,95,115,101,116,108,111,99,97,108,101,
+    169,0,114,4,0,0,0,250,23,60,115,116,100,108,105,98,
+    62,47,95,98,111,111,116,108,111,99,97,108,101,46,112,121,
+    218,20,103,101,116,112,114,101,102,101,114,114,101,100,101,110,
+    99,111,100,105,110,103,11,0,0,0,115,2,0,0,0,0,
+    1,114,6,0,0,0,90,18,103,101,116,97,110,100,114,111,
+    105,100,97,112,105,108,101,118,101,108,99,1,0,0,0,0,
+    0,0,0,1,0,0,0,1,0,0,0,67,0,0,0,115,
+    4,0,0,0,100,1,83,0,41,2,78,122,5,85,84,70,
+    45,56,114,4,0,0,0,41,1,114,3,0,0,0,114,4,
+    0,0,0,114,4,0,0,0,114,5,0,0,0,114,6,0,
+    0,0,20,0,0,0,115,2,0,0,0,0,1,99,1,0,
+    0,0,0,0,0,0,2,0,0,0,3,0,0,0,67,0,
+    0,0,115,18,0,0,0,100,1,100,0,108,0,125,1,124,
+    1,160,1,124,0,161,1,83,0,41,2,78,114,0,0,0,
+    0,41,2,218,6,108,111,99,97,108,101,114,6,0,0,0,
+    41,2,114,3,0,0,0,114,7,0,0,0,114,4,0,0,
+    0,114,4,0,0,0,114,5,0,0,0,114,6,0,0,0,
+    23,0,0,0,115,4,0,0,0,0,3,8,1,99,1,0,
+    0,0,0,0,0,0,2,0,0,0,3,0,0,0,67,0,
+    0,0,115,46,0,0,0,124,0,12,0,115,10,116,0,130,
+    1,116,1,160,2,116,1,106,3,161,1,125,1,124,1,12,
+    0,114,42,116,4,106,5,100,1,107,2,114,42,100,2,125,
+    1,124,1,83,0,41,3,78,90,6,100,97,114,119,105,110,
+    122,5,85,84,70,45,56,41,6,218,14,65,115,115,101,114,
+    116,105,111,110,69,114,114,111,114,114,2,0,0,0,90,11,
+    110,108,95,108,97,110,103,105,110,102,111,218,7,67,79,68,
+    69,83,69,84,218,3,115,121,115,218,8,112,108,97,116,102,
+    111,114,109,41,2,114,3,0,0,0,90,6,114,101,115,117,
+    108,116,114,4,0,0,0,114,4,0,0,0,114,5,0,0,
+    0,114,6,0,0,0,29,0,0,0,115,10,0,0,0,0,
+    1,10,1,12,1,16,7,4,1,41,1,84,41,1,84,41,
+    1,84,41,1,84,41,9,218,7,95,95,100,111,99,95,95,
+    114,10,0,0,0,114,2,0,0,0,114,11,0,0,0,218,
+    10,115,116,97,114,116,115,119,105,116,104,114,6,0,0,0,
+    114,9,0,0,0,218,14,65,116,116,114,105,98,117,116,101,
+    69,114,114,111,114,218,7,104,97,115,97,116,116,114,114,4,
+    0,0,0,114,4,0,0,0,114,4,0,0,0,114,5,0,
+    0,0,218,8,60,109,111,100,117,108,101,62,5,0,0,0,
+    115,22,0,0,0,4,2,8,1,8,2,12,1,12,3,2,
+    1,10,1,14,1,10,3,12,3,16,6,
+};
+static const unsigned char _Py_M__os[] = {
+    99,0,0,0,0,0,0,0,0,0,0,0,0,48,0,0,
+    0,64,0,0,0,115,234,6,0,0,100,0,90,0,100,1,
+    100,2,108,1,90,1,100,1,100,2,108,2,90,2,100,1,
+    100,2,108,3,90,3,100,1,100,2,108,4,90,5,101,2,
+    106,6,90,7,100,3,100,4,100,5,100,6,100,7,100,8,
+    100,9,100,10,100,11,100,12,100,13,100,14,100,15,100,16,
+    100,17,100,18,100,19,100,20,100,21,103,19,90,8,100,22,
+    100,23,132,0,90,9,100,24,100,25,132,0,90,10,100,26,
+    101,7,107,6,114,244,100,26,90,11,100,27,90,12,100,1,
+    100,28,108,13,84,0,121,26,100,1,100,29,108,13,109,14,
+    90,14,1,0,101,8,160,15,100,30,161,1,1,0,87,0,
+    110,20,4,0,101,16,107,10,114,170,1,0,1,0,1,0,
+    89,0,110,2,88,0,100,1,100,2,108,17,90,18,121,16,
+    100,1,100,31,108,13,109,19,90,19,1,0,87,0,110,20,
+    4,0,101,16,107,10,114,216,1,0,1,0,1,0,89,0,
+    110,2,88,0,100,1,100,2,108,13,90,13,101,8,160,20,
+    101,10,101,13,131,1,161,1,1,0,91,13,110,158,100,32,
+    101,7,107,6,144,1,114,138,100,32,90,11,100,33,90,12,
+    100,1,100,28,108,21,84,0,121,26,100,1,100,29,108,21,
+    109,14,90,14,1,0,101,8,160,15,100,30,161,1,1,0,
+    87,0,110,22,4,0,101,16,107,10,144,1,114,62,1,0,
+    1,0,1,0,89,0,110,2,88,0,100,1,100,2,108,22,
+    90,18,100,1,100,2,108,21,90,21,101,8,160,20,101,10,
+    101,21,131,1,161,1,1,0,91,21,121,16,100,1,100,31,
+    108,21,109,19,90,19,1,0,87,0,110,22,4,0,101,16,
+    107,10,144,1,114,134,1,0,1,0,1,0,89,0,110,2,
+    88,0,110,8,101,16,100,34,131,1,130,1,101,18,101,2,
+    106,23,100,35,60,0,100,1,100,36,108,24,109,25,90,25,
+    109,26,90,26,109,27,90,27,109,28,90,28,109,29,90,29,
+    109,30,90,30,109,31,90,31,109,32,90,32,1,0,91,7,
+    101,9,100,37,131,1,144,3,114,188,101,33,131,0,90,34,
+    100,38,100,39,132,0,90,35,101,36,131,0,90,37,101,35,
+    100,40,100,41,131,2,1,0,101,35,100,42,100,43,131,2,
+    1,0,101,35,100,44,100,45,131,2,1,0,101,35,100,46,
+    100,47,131,2,1,0,101,35,100,48,100,49,131,2,1,0,
+    101,35,100,50,100,51,131,2,1,0,101,35,100,52,100,53,
+    131,2,1,0,101,35,100,54,100,55,131,2,1,0,101,35,
+    100,56,100,57,131,2,1,0,101,35,100,58,100,59,131,2,
+    1,0,101,35,100,60,100,61,131,2,1,0,101,35,100,62,
+    100,63,131,2,1,0,101,35,100,64,100,65,131,2,1,0,
+    101,35,100,66,100,67,131,2,1,0,101,35,100,66,100,68,
+    131,2,1,0,101,35,100,69,100,49,131,2,1,0,101,37,
+    90,38,101,36,131,0,90,37,101,35,100,40,100,41,131,2,
+    1,0,101,37,90,39,101,36,131,0,90,37,101,35,100,70,
+    100,71,131,2,1,0,101,35,100,72,100,43,131,2,1,0,
+    101,35,100,73,100,45,131,2,1,0,101,35,100,74,100,75,
+    131,2,1,0,101,35,100,76,100,77,131,2,1,0,101,37,
+    160,40,101,4,161,1,1,0,101,35,100,78,100,79,131,2,
+    1,0,101,35,100,80,100,49,131,2,1,0,101,35,100,81,
+    100,49,131,2,1,0,101,35,100,82,100,83,131,2,1,0,
+    101,9,100,84,131,1,144,3,114,36,101,9,100,85,131,1,
+    144,3,114,36,101,35,100,86,100,84,131,2,1,0,101,37,
+    90,41,101,36,131,0,90,37,101,35,100,40,100,41,131,2,
+    1,0,101,35,100,44,100,45,131,2,1,0,101,35,100,46,
+    100,47,131,2,1,0,101,35,100,87,100,88,131,2,1,0,
+    101,35,100,89,100,43,131,2,1,0,101,9,100,90,131,1,
+    144,3,114,116,101,35,100,91,100,45,131,2,1,0,101,35,
+    100,50,100,51,131,2,1,0,101,35,100,92,100,49,131,2,
+    1,0,101,35,100,93,100,47,131,2,1,0,101,35,100,46,
+    100,47,131,2,1,0,101,35,100,69,100,49,131,2,1,0,
+    101,35,100,94,100,47,131,2,1,0,101,37,90,42,91,37,
+    91,19,91,34,91,35,100,1,90,43,100,95,90,44,100,96,
+    90,45,100,182,100,99,100,100,132,1,90,46,100,101,100,102,
+    132,0,90,47,100,103,100,104,132,0,90,48,101,8,160,20,
+    100,100,100,102,100,104,103,3,161,1,1,0,100,183,100,106,
+    100,107,132,1,90,49,101,8,160,15,100,107,161,1,1,0,
+    101,50,101,4,104,2,101,38,107,1,144,4,114,70,101,51,
+    101,4,104,2,101,41,107,1,144,4,114,70,100,184,100,98,
+    100,2,100,109,156,2,100,110,100,111,132,3,90,52,100,112,
+    100,113,132,0,90,53,101,8,160,15,100,111,161,1,1,0,
+    121,8,101,54,1,0,87,0,110,26,4,0,101,55,107,10,
+    144,4,114,104,1,0,1,0,1,0,105,0,90,54,89,0,
+    110,2,88,0,100,114,100,115,132,0,90,56,100,116,100,117,
+    132,0,90,57,100,118,100,119,132,0,90,58,100,120,100,121,
+    132,0,90,59,100,122,100,123,132,0,90,60,100,124,100,125,
+    132,0,90,61,101,8,160,20,100,115,100,117,100,119,100,121,
+    100,123,100,125,103,6,161,1,1,0,100,185,100,126,100,127,
+    132,1,90,62,100,186,100,128,100,18,132,1,90,63,100,1,
+    100,129,108,64,109,65,90,65,1,0,71,0,100,130,100,131,
+    132,0,100,131,101,65,131,3,90,66,121,8,101,67,90,68,
+    87,0,110,30,4,0,101,55,107,10,144,5,114,6,1,0,
+    1,0,1,0,100,132,100,133,132,0,90,68,89,0,110,22,
+    88,0,100,134,101,8,107,7,144,5,114,28,101,8,160,15,
+    100,134,161,1,1,0,121,8,101,69,90,70,87,0,110,30,
+    4,0,101,55,107,10,144,5,114,66,1,0,1,0,1,0,
+    100,135,100,133,132,0,90,70,89,0,110,22,88,0,100,136,
+    101,8,107,7,144,5,114,88,101,8,160,15,100,136,161,1,
+    1,0,100,137,100,138,132,0,90,71,101,71,131,0,90,54,
+    91,71,100,187,100,139,100,140,132,1,90,72,101,11,100,32,
+    107,3,90,73,101,8,160,20,100,188,161,1,1,0,101,73,
+    144,5,114,190,100,142,100,143,132,0,90,74,101,66,101,54,
+    106,75,101,74,101,76,101,74,101,76,101,68,101,70,131,7,
+    90,77,91,74,100,189,100,144,100,145,132,1,90,78,101,8,
+    160,20,100,190,161,1,1,0,100,147,100,148,132,0,90,79,
+    101,79,131,0,92,2,90,80,90,81,91,79,101,9,100,149,
+    131,1,144,6,114,72,101,9,100,150,131,1,12,0,144,6,
+    114,72,101,9,100,151,131,1,144,6,114,72,100,1,90,82,
+    100,95,4,0,90,83,90,84,101,8,160,20,100,152,100,153,
+    100,154,103,3,161,1,1,0,100,155,100,156,132,0,90,85,
+    100,157,100,150,132,0,90,86,100,158,100,159,132,0,90,87,
+    100,160,100,161,132,0,90,88,100,162,100,163,132,0,90,89,
+    101,8,160,20,100,150,100,159,100,161,100,163,103,4,161,1,
+    1,0,101,9,100,150,131,1,144,6,114,112,100,164,100,165,
+    132,0,90,90,100,166,100,167,132,0,90,91,101,8,160,20,
+    100,165,100,167,103,2,161,1,1,0,101,9,100,161,131,1,
+    144,6,114,152,100,168,100,169,132,0,90,92,100,170,100,171,
+    132,0,90,93,101,8,160,20,100,169,100,171,103,2,161,1,
+    1,0,100,192,100,173,100,20,132,1,90,94,71,0,100,174,
+    100,175,132,0,100,175,131,2,90,95,100,176,100,19,132,0,
+    90,96,100,177,100,178,132,0,90,97,101,9,100,179,131,1,
+    144,6,115,212,101,97,90,98,100,179,101,98,95,99,71,0,
+    100,180,100,181,132,0,100,181,101,1,106,100,131,3,90,101,
+    100,2,83,0,41,193,97,78,4,0,0,79,83,32,114,111,
+    117,116,105,110,101,115,32,102,111,114,32,78,84,32,111,114,
+    32,80,111,115,105,120,32,100,101,112,101,110,100,105,110,103,
+    32,111,110,32,119,104,97,116,32,115,121,115,116,101,109,32,
+    119,101,39,114,101,32,111,110,46,10,10,84,104,105,115,32,
+    101,120,112,111,114,116,115,58,10,32,32,45,32,97,108,108,
+    32,102,117,110,99,116,105,111,110,115,32,102,114,111,109,32,
+    112,111,115,105,120,32,111,114,32,110,116,44,32,101,46,103,
+    46,32,117,110,108,105,110,107,44,32,115,116,97,116,44,32,
+    101,116,99,46,10,32,32,45,32,111,115,46,112,97,116,104,
+    32,105,115,32,101,105,116,104,101,114,32,112,111,115,105,120,
+    112,97,116,104,32,111,114,32,110,116,112,97,116,104,10,32,
+    32,45,32,111,115,46,110,97,109,101,32,105,115,32,101,105,
+    116,104,101,114,32,39,112,111,115,105,120,39,32,111,114,32,
+    39,110,116,39,10,32,32,45,32,111,115,46,99,117,114,100,
+    105,114,32,105,115,32,97,32,115,116,114,105,110,103,32,114,
+    101,112,114,101,115,101,110,116,105,110,103,32,116,104,101,32,
+    99,117,114,114,101,110,116,32,100,105,114,101,99,116,111,114,
+    121,32,40,97,108,119,97,121,115,32,39,46,39,41,10,32,
+    32,45,32,111,115,46,112,97,114,100,105,114,32,105,115,32,
+    97,32,115,116,114,105,110,103,32,114,101,112,114,101,115,101,
+    110,116,105,110,103,32,116,104,101,32,112,97,114,101,110,116,
+    32,100,105,114,101,99,116,111,114,121,32,40,97,108,119,97,
+    121,115,32,39,46,46,39,41,10,32,32,45,32,111,115,46,
+    115,101,112,32,105,115,32,116,104,101,32,40,111,114,32,97,
+    32,109,111,115,116,32,99,111,109,109,111,110,41,32,112,97,
+    116,104,110,97,109,101,32,115,101,112,97,114,97,116,111,114,
+    32,40,39,47,39,32,111,114,32,39,92,92,39,41,10,32,
+    32,45,32,111,115,46,101,120,116,115,101,112,32,105,115,32,
+    116,104,101,32,101,120,116,101,110,115,105,111,110,32,115,101,
+    112,97,114,97,116,111,114,32,40,97,108,119,97,121,115,32,
+    39,46,39,41,10,32,32,45,32,111,115,46,97,108,116,115,
+    101,112,32,105,115,32,116,104,101,32,97,108,116,101,114,110,
+    97,116,101,32,112,97,116,104,110,97,109,101,32,115,101,112,
+    97,114,97,116,111,114,32,40,78,111,110,101,32,111,114,32,
+    39,47,39,41,10,32,32,45,32,111,115,46,112,97,116,104,
+    115,101,112,32,105,115,32,116,104,101,32,99,111,109,112,111,
+    110,101,110,116,32,115,101,112,97,114,97,116,111,114,32,117,
+    115,101,100,32,105,110,32,36,80,65,84,72,32,101,116,99,
+    10,32,32,45,32,111,115,46,108,105,110,101,115,101,112,32,
+    105,115,32,116,104,101,32,108,105,110,101,32,115,101,112,97,
+    114,97,116,111,114,32,105,110,32,116,101,120,116,32,102,105,
+    108,101,115,32,40,39,92,114,39,32,111,114,32,39,92,110,
+    39,32,111,114,32,39,92,114,92,110,39,41,10,32,32,45,
+    32,111,115,46,100,101,102,112,97,116,104,32,105,115,32,116,
+    104,101,32,100,101,102,97,117,108,116,32,115,101,97,114,99,
+    104,32,112,97,116,104,32,102,111,114,32,101,120,101,99,117,
+    116,97,98,108,101,115,10,32,32,45,32,111,115,46,100,101,
+    118,110,117,108,108,32,105,115,32,116,104,101,32,102,105,108,
+    101,32,112,97,116,104,32,111,102,32,116,104,101,32,110,117,
+    108,108,32,100,101,118,105,99,101,32,40,39,47,100,101,118,
+    47,110,117,108,108,39,44,32,101,116,99,46,41,10,10,80,
+    114,111,103,114,97,109,115,32,116,104,97,116,32,105,109,112,
+    111,114,116,32,97,110,100,32,117,115,101,32,39,111,115,39,
+    32,115,116,97,110,100,32,97,32,98,101,116,116,101,114,32,
+    99,104,97,110,99,101,32,111,102,32,98,101,105,110,103,10,
+    112,111,114,116,97,98,108,101,32,98,101,116,119,101,101,110,
+    32,100,105,102,102,101,114,101,110,116,32,112,108,97,116,102,
+    111,114,109,115,46,32,32,79,102,32,99,111,117,114,115,101,
+    44,32,116,104,101,121,32,109,117,115,116,32,116,104,101,110,
+    10,111,110,108,121,32,117,115,101,32,102,117,110,99,116,105,
+    111,110,115,32,116,104,97,116,32,97,114,101,32,100,101,102,
+    105,110,101,100,32,98,121,32,97,108,108,32,112,108,97,116,
+    102,111,114,109,115,32,40,101,46,103,46,44,32,117,110,108,
+    105,110,107,10,97,110,100,32,111,112,101,110,100,105,114,41,
+    44,32,97,110,100,32,108,101,97,118,101,32,97,108,108,32,
+    112,97,116,104,110,97,109,101,32,109,97,110,105,112,117,108,
+    97,116,105,111,110,32,116,111,32,111,115,46,112,97,116,104,
+    10,40,101,46,103,46,44,32,115,112,108,105,116,32,97,110,
+    100,32,106,111,105,110,41,46,10,233,0,0,0,0,78,218,
+    6,97,108,116,115,101,112,218,6,99,117,114,100,105,114,218,
+    6,112,97,114,100,105,114,218,3,115,101,112,218,7,112,97,
+    116,104,115,101,112,218,7,108,105,110,101,115,101,112,218,7,
+    100,101,102,112,97,116,104,218,4,110,97,109,101,218,4,112,
+    97,116,104,218,7,100,101,118,110,117,108,108,218,8,83,69,
+    69,75,95,83,69,84,218,8,83,69,69,75,95,67,85,82,
+    218,8,83,69,69,75,95,69,78,68,218,8,102,115,101,110,
+    99,111,100,101,218,8,102,115,100,101,99,111,100,101,218,13,
+    103,101,116,95,101,120,101,99,95,112,97,116,104,218,6,102,
+    100,111,112,101,110,218,5,112,111,112,101,110,218,6,101,120,
+    116,115,101,112,99,1,0,0,0,0,0,0,0,1,0,0,
+    0,2,0,0,0,67,0,0,0,115,10,0,0,0,124,0,
+    116,0,131,0,107,6,83,0,41,1,78,41,1,218,7,103,
+    108,111,98,97,108,115,41,1,114,8,0,0,0,169,0,114,
+    21,0,0,0,250,14,60,115,116,100,108,105,98,62,47,111,
+    115,46,112,121,218,7,95,101,120,105,115,116,115,37,0,0,
+    0,115,2,0,0,0,0,1,114,23,0,0,0,99,1,0,
+    0,0,0,0,0,0,1,0,0,0,11,0,0,0,67,0,
+    0,0,115,50,0,0,0,121,10,116,0,124,0,106,1,131,
+    1,83,0,4,0,116,2,107,10,114,44,1,0,1,0,1,
+    0,100,1,100,2,132,0,116,3,124,0,131,1,68,0,131,
+    1,83,0,88,0,100,0,83,0,41,3,78,99,1,0,0,
+    0,0,0,0,0,2,0,0,0,4,0,0,0,83,0,0,
+    0,115,28,0,0,0,103,0,124,0,93,20,125,1,124,1,
+    100,0,25,0,100,1,107,3,114,4,124,1,145,2,113,4,
+    83,0,41,2,114,0,0,0,0,218,1,95,114,21,0,0,
+    0,41,2,218,2,46,48,218,1,110,114,21,0,0,0,114,
+    21,0,0,0,114,22,0,0,0,250,10,60,108,105,115,116,
+    99,111,109,112,62,44,0,0,0,115,2,0,0,0,6,0,
+    122,37,95,103,101,116,95,101,120,112,111,114,116,115,95,108,
+    105,115,116,46,60,108,111,99,97,108,115,62,46,60,108,105,
+    115,116,99,111,109,112,62,41,4,218,4,108,105,115,116,218,
+    7,95,95,97,108,108,95,95,218,14,65,116,116,114,105,98,
+    117,116,101,69,114,114,111,114,218,3,100,105,114,41,1,90,
+    6,109,111,100,117,108,101,114,21,0,0,0,114,21,0,0,
+    0,114,22,0,0,0,218,17,95,103,101,116,95,101,120,112,
+    111,114,116,115,95,108,105,115,116,40,0,0,0,115,8,0,
+    0,0,0,1,2,1,10,1,14,1,114,32,0,0,0,218,
+    5,112,111,115,105,120,250,1,10,41,1,218,1,42,41,1,
+    218,5,95,101,120,105,116,114,36,0,0,0,41,1,218,15,
+    95,104,97,118,101,95,102,117,110,99,116,105,111,110,115,218,
+    2,110,116,122,2,13,10,122,27,110,111,32,111,115,32,115,
+    112,101,99,105,102,105,99,32,109,111,100,117,108,101,32,102,
+    111,117,110,100,122,7,111,115,46,112,97,116,104,41,8,114,
+    2,0,0,0,114,3,0,0,0,114,4,0,0,0,114,5,
+    0,0,0,114,7,0,0,0,114,19,0,0,0,114,1,0,
+    0,0,114,10,0,0,0,114,37,0,0,0,99,2,0,0,
+    0,0,0,0,0,2,0,0,0,4,0,0,0,67,0,0,
+    0,115,34,0,0,0,124,1,116,0,107,6,114,30,124,0,
+    116,1,107,6,114,30,116,2,160,3,116,0,124,1,25,0,
+    161,1,1,0,100,0,83,0,41,1,78,41,4,218,8,95,
+    103,108,111,98,97,108,115,114,37,0,0,0,218,4,95,115,
+    101,116,218,3,97,100,100,41,2,218,3,115,116,114,90,2,
+    102,110,114,21,0,0,0,114,21,0,0,0,114,22,0,0,
+    0,218,4,95,97,100,100,100,0,0,0,115,4,0,0,0,
+    0,1,16,1,114,43,0,0,0,90,14,72,65,86,69,95,
+    70,65,67,67,69,83,83,65,84,90,6,97,99,99,101,115,
+    115,90,13,72,65,86,69,95,70,67,72,77,79,68,65,84,
+    90,5,99,104,109,111,100,90,13,72,65,86,69,95,70,67,
+    72,79,87,78,65,84,90,5,99,104,111,119,110,90,12,72,
+    65,86,69,95,70,83,84,65,84,65,84,218,4,115,116,97,
+    116,90,14,72,65,86,69,95,70,85,84,73,77,69,83,65,
+    84,90,5,117,116,105,109,101,90,11,72,65,86,69,95,76,
+    73,78,75,65,84,90,4,108,105,110,107,90,12,72,65,86,
+    69,95,77,75,68,73,82,65,84,218,5,109,107,100,105,114,
+    90,13,72,65,86,69,95,77,75,70,73,70,79,65,84,90,
+    6,109,107,102,105,102,111,90,12,72,65,86,69,95,77,75,
+    78,79,68,65,84,90,5,109,107,110,111,100,90,11,72,65,
+    86,69,95,79,80,69,78,65,84,218,4,111,112,101,110,90,
+    15,72,65,86,69,95,82,69,65,68,76,73,78,75,65,84,
+    90,8,114,101,97,100,108,105,110,107,90,13,72,65,86,69,
+    95,82,69,78,65,77,69,65,84,218,6,114,101,110,97,109,
+    101,90,14,72,65,86,69,95,83,89,77,76,73,78,75,65,
+    84,90,7,115,121,109,108,105,110,107,90,13,72,65,86,69,
+    95,85,78,76,73,78,75,65,84,90,6,117,110,108,105,110,
+    107,218,5,114,109,100,105,114,90,14,72,65,86,69,95,85,
+    84,73,77,69,78,83,65,84,90,11,72,65,86,69,95,70,
+    67,72,68,73,82,90,5,99,104,100,105,114,90,11,72,65,
+    86,69,95,70,67,72,77,79,68,90,11,72,65,86,69,95,
+    70,67,72,79,87,78,90,14,72,65,86,69,95,70,68,79,
+    80,69,78,68,73,82,218,7,108,105,115,116,100,105,114,90,
+    12,72,65,86,69,95,70,69,88,69,67,86,69,218,6,101,
+    120,101,99,118,101,90,14,72,65,86,69,95,70,84,82,85,
+    78,67,65,84,69,90,8,116,114,117,110,99,97,116,101,90,
+    13,72,65,86,69,95,70,85,84,73,77,69,78,83,90,12,
+    72,65,86,69,95,70,85,84,73,77,69,83,90,14,72,65,
+    86,69,95,70,80,65,84,72,67,79,78,70,90,8,112,97,
+    116,104,99,111,110,102,90,7,115,116,97,116,118,102,115,90,
+    8,102,115,116,97,116,118,102,115,90,13,72,65,86,69,95,
+    70,83,84,65,84,86,70,83,90,13,72,65,86,69,95,76,
+    67,72,70,76,65,71,83,90,7,99,104,102,108,97,103,115,
+    90,11,72,65,86,69,95,76,67,72,77,79,68,90,6,108,
+    99,104,111,119,110,90,11,72,65,86,69,95,76,67,72,79,
+    87,78,90,12,72,65,86,69,95,76,85,84,73,77,69,83,
+    90,10,72,65,86,69,95,76,83,84,65,84,90,10,77,83,
+    95,87,73,78,68,79,87,83,233,1,0,0,0,233,2,0,
+    0,0,233,255,1,0,0,70,99,3,0,0,0,0,0,0,
+    0,6,0,0,0,19,0,0,0,67,0,0,0,115,186,0,
+    0,0,116,0,160,1,124,0,161,1,92,2,125,3,125,4,
+    124,4,115,32,116,0,160,1,124,3,161,1,92,2,125,3,
+    125,4,124,3,114,126,124,4,114,126,116,0,160,2,124,3,
+    161,1,12,0,114,126,121,16,116,3,124,3,124,1,124,2,
+    131,3,1,0,87,0,110,20,4,0,116,4,107,10,114,88,
+    1,0,1,0,1,0,89,0,110,2,88,0,116,5,125,5,
+    116,6,124,4,116,7,131,2,114,114,116,7,116,5,100,1,
+    131,2,125,5,124,4,124,5,107,2,114,126,100,2,83,0,
+    121,14,116,8,124,0,124,1,131,2,1,0,87,0,110,40,
+    4,0,116,9,107,10,114,180,1,0,1,0,1,0,124,2,
+    12,0,115,174,116,0,160,10,124,0,161,1,12,0,114,176,
+    130,0,89,0,110,2,88,0,100,2,83,0,41,3,97,139,
+    1,0,0,109,97,107,101,100,105,114,115,40,110,97,109,101,
+    32,91,44,32,109,111,100,101,61,48,111,55,55,55,93,91,
+    44,32,101,120,105,115,116,95,111,107,61,70,97,108,115,101,
+    93,41,10,10,32,32,32,32,83,117,112,101,114,45,109,107,
+    100,105,114,59,32,99,114,101,97,116,101,32,97,32,108,101,
+    97,102,32,100,105,114,101,99,116,111,114,121,32,97,110,100,
+    32,97,108,108,32,105,110,116,101,114,109,101,100,105,97,116,
+    101,32,111,110,101,115,46,32,32,87,111,114,107,115,32,108,
+    105,107,101,10,32,32,32,32,109,107,100,105,114,44,32,101,
+    120,99,101,112,116,32,116,104,97,116,32,97,110,121,32,105,
+    110,116,101,114,109,101,100,105,97,116,101,32,112,97,116,104,
+    32,115,101,103,109,101,110,116,32,40,110,111,116,32,106,117,
+    115,116,32,116,104,101,32,114,105,103,104,116,109,111,115,116,
+    41,10,32,32,32,32,119,105,108,108,32,98,101,32,99,114,
+    101,97,116,101,100,32,105,102,32,105,116,32,100,111,101,115,
+    32,110,111,116,32,101,120,105,115,116,46,32,73,102,32,116,
+    104,101,32,116,97,114,103,101,116,32,100,105,114,101,99,116,
+    111,114,121,32,97,108,114,101,97,100,121,10,32,32,32,32,
+    101,120,105,115,116,115,44,32,114,97,105,115,101,32,97,110,
+    32,79,83,69,114,114,111,114,32,105,102,32,101,120,105,115,
+    116,95,111,107,32,105,115,32,70,97,108,115,101,46,32,79,
+    116,104,101,114,119,105,115,101,32,110,111,32,101,120,99,101,
+    112,116,105,111,110,32,105,115,10,32,32,32,32,114,97,105,
+    115,101,100,46,32,32,84,104,105,115,32,105,115,32,114,101,
+    99,117,114,115,105,118,101,46,10,10,32,32,32,32,90,5,
+    65,83,67,73,73,78,41,11,114,9,0,0,0,218,5,115,
+    112,108,105,116,218,6,101,120,105,115,116,115,218,8,109,97,
+    107,101,100,105,114,115,218,15,70,105,108,101,69,120,105,115,
+    116,115,69,114,114,111,114,114,2,0,0,0,218,10,105,115,
+    105,110,115,116,97,110,99,101,218,5,98,121,116,101,115,114,
+    45,0,0,0,218,7,79,83,69,114,114,111,114,90,5,105,
+    115,100,105,114,41,6,114,8,0,0,0,218,4,109,111,100,
+    101,90,8,101,120,105,115,116,95,111,107,218,4,104,101,97,
+    100,218,4,116,97,105,108,90,4,99,100,105,114,114,21,0,
+    0,0,114,21,0,0,0,114,22,0,0,0,114,56,0,0,
+    0,195,0,0,0,115,36,0,0,0,0,10,14,1,4,1,
+    14,1,20,1,2,1,16,1,14,2,6,1,4,1,10,1,
+    10,1,8,1,4,1,2,1,14,1,14,3,18,1,114,56,
+    0,0,0,99,1,0,0,0,0,0,0,0,3,0,0,0,
+    11,0,0,0,67,0,0,0,115,108,0,0,0,116,0,124,
+    0,131,1,1,0,116,1,160,2,124,0,161,1,92,2,125,
+    1,125,2,124,2,115,40,116,1,160,2,124,1,161,1,92,
+    2,125,1,125,2,120,62,124,1,114,102,124,2,114,102,121,
+    12,116,0,124,1,131,1,1,0,87,0,110,22,4,0,116,
+    3,107,10,114,84,1,0,1,0,1,0,80,0,89,0,110,
+    2,88,0,116,1,160,2,124,1,161,1,92,2,125,1,125,
+    2,113,42,87,0,100,1,83,0,41,2,97,172,1,0,0,
+    114,101,109,111,118,101,100,105,114,115,40,110,97,109,101,41,
+    10,10,32,32,32,32,83,117,112,101,114,45,114,109,100,105,
+    114,59,32,114,101,109,111,118,101,32,97,32,108,101,97,102,
+    32,100,105,114,101,99,116,111,114,121,32,97,110,100,32,97,
+    108,108,32,101,109,112,116,121,32,105,110,116,101,114,109,101,
+    100,105,97,116,101,10,32,32,32,32,111,110,101,115,46,32,
+    32,87,111,114,107,115,32,108,105,107,101,32,114,109,100,105,
+    114,32,101,120,99,101,112,116,32,116,104,97,116,44,32,105,
+    102,32,116,104,101,32,108,101,97,102,32,100,105,114,101,99,
+    116,111,114,121,32,105,115,10,32,32,32,32,115,117,99,99,
+    101,115,115,102,117,108,108,121,32,114,101,109,111,118,101,100,
+    44,32,100,105,114,101,99,116,111,114,105,101,115,32,99,111,
+    114,114,101,115,112,111,110,100,105,110,103,32,116,111,32,114,
+    105,103,104,116,109,111,115,116,32,112,97,116,104,10,32,32,
+    32,32,115,101,103,109,101,110,116,115,32,119,105,108,108,32,
+    98,101,32,112,114,117,110,101,100,32,97,119,97,121,32,117,
+    110,116,105,108,32,101,105,116,104,101,114,32,116,104,101,32,
+    119,104,111,108,101,32,112,97,116,104,32,105,115,10,32,32,
+    32,32,99,111,110,115,117,109,101,100,32,111,114,32,97,110,
+    32,101,114,114,111,114,32,111,99,99,117,114,115,46,32,32,
+    69,114,114,111,114,115,32,100,117,114,105,110,103,32,116,104,
+    105,115,32,108,97,116,116,101,114,32,112,104,97,115,101,32,
+    97,114,101,10,32,32,32,32,105,103,110,111,114,101,100,32,
+    45,45,32,116,104,101,121,32,103,101,110,101,114,97,108,108,
+    121,32,109,101,97,110,32,116,104,97,116,32,97,32,100,105,
+    114,101,99,116,111,114,121,32,119,97,115,32,110,111,116,32,
+    101,109,112,116,121,46,10,10,32,32,32,32,78,41,4,114,
+    48,0,0,0,114,9,0,0,0,114,54,0,0,0,114,60,
+    0,0,0,41,3,114,8,0,0,0,114,62,0,0,0,114,
+    63,0,0,0,114,21,0,0,0,114,21,0,0,0,114,22,
+    0,0,0,218,10,114,101,109,111,118,101,100,105,114,115,227,
+    0,0,0,115,20,0,0,0,0,11,8,1,14,1,4,1,
+    14,1,10,1,2,1,12,1,14,1,8,1,114,64,0,0,
+    0,99,2,0,0,0,0,0,0,0,4,0,0,0,11,0,
+    0,0,67,0,0,0,115,112,0,0,0,116,0,160,1,124,
+    1,161,1,92,2,125,2,125,3,124,2,114,42,124,3,114,
+    42,116,0,160,2,124,2,161,1,12,0,114,42,116,3,124,
+    2,131,1,1,0,116,4,124,0,124,1,131,2,1,0,116,
+    0,160,1,124,0,161,1,92,2,125,2,125,3,124,2,114,
+    108,124,3,114,108,121,12,116,5,124,2,131,1,1,0,87,
+    0,110,20,4,0,116,6,107,10,114,106,1,0,1,0,1,
+    0,89,0,110,2,88,0,100,1,83,0,41,2,97,60,2,
+    0,0,114,101,110,97,109,101,115,40,111,108,100,44,32,110,
+    101,119,41,10,10,32,32,32,32,83,117,112,101,114,45,114,
+    101,110,97,109,101,59,32,99,114,101,97,116,101,32,100,105,
+    114,101,99,116,111,114,105,101,115,32,97,115,32,110,101,99,
+    101,115,115,97,114,121,32,97,110,100,32,100,101,108,101,116,
+    101,32,97,110,121,32,108,101,102,116,10,32,32,32,32,101,
+    109,112,116,121,46,32,32,87,111,114,107,115,32,108,105,107,
+    101,32,114,101,110,97,109,101,44,32,101,120,99,101,112,116,
+    32,99,114,101,97,116,105,111,110,32,111,102,32,97,110,121,
+    32,105,110,116,101,114,109,101,100,105,97,116,101,10,32,32,
+    32,32,100,105,114,101,99,116,111,114,105,101,115,32,110,101,
+    101,100,101,100,32,116,111,32,109,97,107,101,32,116,104,101,
+    32,110,101,119,32,112,97,116,104,110,97,109,101,32,103,111,
+    111,100,32,105,115,32,97,116,116,101,109,112,116,101,100,10,
+    32,32,32,32,102,105,114,115,116,46,32,32,65,102,116,101,
+    114,32,116,104,101,32,114,101,110,97,109,101,44,32,100,105,
+    114,101,99,116,111,114,105,101,115,32,99,111,114,114,101,115,
+    112,111,110,100,105,110,103,32,116,111,32,114,105,103,104,116,
+    109,111,115,116,10,32,32,32,32,112,97,116,104,32,115,101,
+    103,109,101,110,116,115,32,111,102,32,116,104,101,32,111,108,
+    100,32,110,97,109,101,32,119,105,108,108,32,98,101,32,112,
+    114,117,110,101,100,32,117,110,116,105,108,32,101,105,116,104,
+    101,114,32,116,104,101,10,32,32,32,32,119,104,111,108,101,
+    32,112,97,116,104,32,105,115,32,99,111,110,115,117,109,101,
+    100,32,111,114,32,97,32,110,111,110,101,109,112,116,121,32,
+    100,105,114,101,99,116,111,114,121,32,105,115,32,102,111,117,
+    110,100,46,10,10,32,32,32,32,78,111,116,101,58,32,116,
+    104,105,115,32,102,117,110,99,116,105,111,110,32,99,97,110,
+    32,102,97,105,108,32,119,105,116,104,32,116,104,101,32,110,
+    101,119,32,100,105,114,101,99,116,111,114,121,32,115,116,114,
+    117,99,116,117,114,101,32,109,97,100,101,10,32,32,32,32,
+    105,102,32,121,111,117,32,108,97,99,107,32,112,101,114,109,
+    105,115,115,105,111,110,115,32,110,101,101,100,101,100,32,116,
+    111,32,117,110,108,105,110,107,32,116,104,101,32,108,101,97,
+    102,32,100,105,114,101,99,116,111,114,121,32,111,114,10,32,
+    32,32,32,102,105,108,101,46,10,10,32,32,32,32,78,41,
+    7,114,9,0,0,0,114,54,0,0,0,114,55,0,0,0,
+    114,56,0,0,0,114,47,0,0,0,114,64,0,0,0,114,
+    60,0,0,0,41,4,90,3,111,108,100,90,3,110,101,119,
+    114,62,0,0,0,114,63,0,0,0,114,21,0,0,0,114,
+    21,0,0,0,114,22,0,0,0,218,7,114,101,110,97,109,
+    101,115,249,0,0,0,115,20,0,0,0,0,15,14,1,20,
+    1,8,1,10,1,14,1,8,1,2,1,12,1,14,1,114,
+    65,0,0,0,84,99,4,0,0,0,0,0,0,0,17,0,
+    0,0,54,0,0,0,99,0,0,0,115,244,1,0,0,116,
+    0,124,0,131,1,125,0,103,0,125,4,103,0,125,5,103,
+    0,125,6,121,12,116,1,124,0,131,1,125,7,87,0,110,
+    48,4,0,116,2,107,10,114,80,1,0,125,8,1,0,122,
+    20,124,2,100,1,107,9,114,66,124,2,124,8,131,1,1,
+    0,100,1,83,0,100,1,125,8,126,8,88,0,110,2,88,
+    0,124,7,144,1,143,0,1,0,144,0,120,246,121,40,121,
+    12,116,3,124,7,131,1,125,9,87,0,110,22,4,0,116,
+    4,107,10,114,130,1,0,1,0,1,0,80,0,89,0,110,
+    2,88,0,87,0,110,48,4,0,116,2,107,10,114,182,1,
+    0,125,8,1,0,122,20,124,2,100,1,107,9,114,168,124,
+    2,124,8,131,1,1,0,100,1,83,0,100,1,125,8,126,
+    8,88,0,110,2,88,0,121,12,124,9,160,5,161,0,125,
+    10,87,0,110,24,4,0,116,2,107,10,114,220,1,0,1,
+    0,1,0,100,2,125,10,89,0,110,2,88,0,124,10,114,
+    240,124,4,160,6,124,9,106,7,161,1,1,0,110,12,124,
+    5,160,6,124,9,106,7,161,1,1,0,124,1,12,0,114,
+    94,124,10,114,94,124,3,144,1,114,18,100,3,125,11,110,
+    46,121,12,124,9,160,8,161,0,125,12,87,0,110,26,4,
+    0,116,2,107,10,144,1,114,56,1,0,1,0,1,0,100,
+    2,125,12,89,0,110,2,88,0,124,12,12,0,125,11,124,
+    11,114,94,124,6,160,6,124,9,106,9,161,1,1,0,113,
+    94,87,0,87,0,100,1,81,0,82,0,88,0,124,1,144,
+    1,114,192,124,0,124,4,124,5,102,3,86,0,1,0,116,
+    9,106,10,116,9,106,11,2,0,125,13,125,14,120,112,124,
+    4,68,0,93,54,125,15,124,14,124,0,124,15,131,2,125,
+    16,124,3,144,1,115,164,124,13,124,16,131,1,12,0,144,
+    1,114,132,116,12,124,16,124,1,124,2,124,3,131,4,69,
+    0,100,1,72,0,1,0,144,1,113,132,87,0,110,48,120,
+    34,124,6,68,0,93,26,125,16,116,12,124,16,124,1,124,
+    2,124,3,131,4,69,0,100,1,72,0,1,0,144,1,113,
+    198,87,0,124,0,124,4,124,5,102,3,86,0,1,0,100,
+    1,83,0,41,4,97,227,10,0,0,68,105,114,101,99,116,
+    111,114,121,32,116,114,101,101,32,103,101,110,101,114,97,116,
+    111,114,46,10,10,32,32,32,32,70,111,114,32,101,97,99,
+    104,32,100,105,114,101,99,116,111,114,121,32,105,110,32,116,
+    104,101,32,100,105,114,101,99,116,111,114,121,32,116,114,101,
+    101,32,114,111,111,116,101,100,32,97,116,32,116,111,112,32,
+    40,105,110,99,108,117,100,105,110,103,32,116,111,112,10,32,
+    32,32,32,105,116,115,101,108,102,44,32,98,117,116,32,101,
+    120,99,108,117,100,105,110,103,32,39,46,39,32,97,110,100,
+    32,39,46,46,39,41,44,32,121,105,101,108,100,115,32,97,
+    32,51,45,116,117,112,108,101,10,10,32,32,32,32,32,32,
+    32,32,100,105,114,112,97,116,104,44,32,100,105,114,110,97,
+    109,101,115,44,32,102,105,108,101,110,97,109,101,115,10,10,
+    32,32,32,32,100,105,114,112,97,116,104,32,105,115,32,97,
+    32,115,116,114,105,110,103,44,32,116,104,101,32,112,97,116,
+    104,32,116,111,32,116,104,101,32,100,105,114,101,99,116,111,
+    114,121,46,32,32,100,105,114,110,97,109,101,115,32,105,115,
+    32,97,32,108,105,115,116,32,111,102,10,32,32,32,32,116,
+    104,101,32,110,97,109,101,115,32,111,102,32,116,104,101,32,
+    115,117,98,100,105,114,101,99,116,111,114,105,101,115,32,105,
+    110,32,100,105,114,112,97,116,104,32,40,101,120,99,108,117,
+    100,105,110,103,32,39,46,39,32,97,110,100,32,39,46,46,
+    39,41,46,10,32,32,32,32,102,105,108,101,110,97,109,101,
+    115,32,105,115,32,97,32,108,105,115,116,32,111,102,32,116,
+    104,101,32,110,97,109,101,115,32,111,102,32,116,104,101,32,
+    110,111,110,45,100,105,114,101,99,116,111,114,121,32,102,105,
+    108,101,115,32,105,110,32,100,105,114,112,97,116,104,46,10,
+    32,32,32,32,78,111,116,101,32,116,104,97,116,32,116,104,
+    101,32,110,97,109,101,115,32,105,110,32,116,104,101,32,108,
+    105,115,116,115,32,97,114,101,32,106,117,115,116,32,110,97,
+    109,101,115,44,32,119,105,116,104,32,110,111,32,112,97,116,
+    104,32,99,111,109,112,111,110,101,110,116,115,46,10,32,32,
+    32,32,84,111,32,103,101,116,32,97,32,102,117,108,108,32,
+    112,97,116,104,32,40,119,104,105,99,104,32,98,101,103,105,
+    110,115,32,119,105,116,104,32,116,111,112,41,32,116,111,32,
+    97,32,102,105,108,101,32,111,114,32,100,105,114,101,99,116,
+    111,114,121,32,105,110,10,32,32,32,32,100,105,114,112,97,
+    116,104,44,32,100,111,32,111,115,46,112,97,116,104,46,106,
+    111,105,110,40,100,105,114,112,97,116,104,44,32,110,97,109,
+    101,41,46,10,10,32,32,32,32,73,102,32,111,112,116,105,
+    111,110,97,108,32,97,114,103,32,39,116,111,112,100,111,119,
+    110,39,32,105,115,32,116,114,117,101,32,111,114,32,110,111,
+    116,32,115,112,101,99,105,102,105,101,100,44,32,116,104,101,
+    32,116,114,105,112,108,101,32,102,111,114,32,97,10,32,32,
+    32,32,100,105,114,101,99,116,111,114,121,32,105,115,32,103,
+    101,110,101,114,97,116,101,100,32,98,101,102,111,114,101,32,
+    116,104,101,32,116,114,105,112,108,101,115,32,102,111,114,32,
+    97,110,121,32,111,102,32,105,116,115,32,115,117,98,100,105,
+    114,101,99,116,111,114,105,101,115,10,32,32,32,32,40,100,
+    105,114,101,99,116,111,114,105,101,115,32,97,114,101,32,103,
+    101,110,101,114,97,116,101,100,32,116,111,112,32,100,111,119,
+    110,41,46,32,32,73,102,32,116,111,112,100,111,119,110,32,
+    105,115,32,102,97,108,115,101,44,32,116,104,101,32,116,114,
+    105,112,108,101,10,32,32,32,32,102,111,114,32,97,32,100,
+    105,114,101,99,116,111,114,121,32,105,115,32,103,101,110,101,
+    114,97,116,101,100,32,97,102,116,101,114,32,116,104,101,32,
+    116,114,105,112,108,101,115,32,102,111,114,32,97,108,108,32,
+    111,102,32,105,116,115,10,32,32,32,32,115,117,98,100,105,
+    114,101,99,116,111,114,105,101,115,32,40,100,105,114,101,99,
+    116,111,114,105,101,115,32,97,114,101,32,103,101,110,101,114,
+    97,116,101,100,32,98,111,116,116,111,109,32,117,112,41,46,
+    10,10,32,32,32,32,87,104,101,110,32,116,111,112,100,111,
+    119,110,32,105,115,32,116,114,117,101,44,32,116,104,101,32,
+    99,97,108,108,101,114,32,99,97,110,32,109,111,100,105,102,
+    121,32,116,104,101,32,100,105,114,110,97,109,101,115,32,108,
+    105,115,116,32,105,110,45,112,108,97,99,101,10,32,32,32,
+    32,40,101,46,103,46,44,32,118,105,97,32,100,101,108,32,
+    111,114,32,115,108,105,99,101,32,97,115,115,105,103,110,109,
+    101,110,116,41,44,32,97,110,100,32,119,97,108,107,32,119,
+    105,108,108,32,111,110,108,121,32,114,101,99,117,114,115,101,
+    32,105,110,116,111,32,116,104,101,10,32,32,32,32,115,117,
+    98,100,105,114,101,99,116,111,114,105,101,115,32,119,104,111,
+    115,101,32,110,97,109,101,115,32,114,101,109,97,105,110,32,
+    105,110,32,100,105,114,110,97,109,101,115,59,32,116,104,105,
+    115,32,99,97,110,32,98,101,32,117,115,101,100,32,116,111,
+    32,112,114,117,110,101,32,116,104,101,10,32,32,32,32,115,
+    101,97,114,99,104,44,32,111,114,32,116,111,32,105,109,112,
+    111,115,101,32,97,32,115,112,101,99,105,102,105,99,32,111,
+    114,100,101,114,32,111,102,32,118,105,115,105,116,105,110,103,
+    46,32,32,77,111,100,105,102,121,105,110,103,32,100,105,114,
+    110,97,109,101,115,32,119,104,101,110,10,32,32,32,32,116,
+    111,112,100,111,119,110,32,105,115,32,102,97,108,115,101,32,
+    105,115,32,105,110,101,102,102,101,99,116,105,118,101,44,32,
+    115,105,110,99,101,32,116,104,101,32,100,105,114,101,99,116,
+    111,114,105,101,115,32,105,110,32,100,105,114,110,97,109,101,
+    115,32,104,97,118,101,10,32,32,32,32,97,108,114,101,97,
+    100,121,32,98,101,101,110,32,103,101,110,101,114,97,116,101,
+    100,32,98,121,32,116,104,101,32,116,105,109,101,32,100,105,
+    114,110,97,109,101,115,32,105,116,115,101,108,102,32,105,115,
+    32,103,101,110,101,114,97,116,101,100,46,32,78,111,32,109,
+    97,116,116,101,114,10,32,32,32,32,116,104,101,32,118,97,
+    108,117,101,32,111,102,32,116,111,112,100,111,119,110,44,32,
+    116,104,101,32,108,105,115,116,32,111,102,32,115,117,98,100,
+    105,114,101,99,116,111,114,105,101,115,32,105,115,32,114,101,
+    116,114,105,101,118,101,100,32,98,101,102,111,114,101,32,116,
+    104,101,10,32,32,32,32,116,117,112,108,101,115,32,102,111,
+    114,32,116,104,101,32,100,105,114,101,99,116,111,114,121,32,
+    97,110,100,32,105,116,115,32,115,117,98,100,105,114,101,99,
+    116,111,114,105,101,115,32,97,114,101,32,103,101,110,101,114,
+    97,116,101,100,46,10,10,32,32,32,32,66,121,32,100,101,
+    102,97,117,108,116,32,101,114,114,111,114,115,32,102,114,111,
+    109,32,116,104,101,32,111,115,46,115,99,97,110,100,105,114,
+    40,41,32,99,97,108,108,32,97,114,101,32,105,103,110,111,
+    114,101,100,46,32,32,73,102,10,32,32,32,32,111,112,116,
+    105,111,110,97,108,32,97,114,103,32,39,111,110,101,114,114,
+    111,114,39,32,105,115,32,115,112,101,99,105,102,105,101,100,
+    44,32,105,116,32,115,104,111,117,108,100,32,98,101,32,97,
+    32,102,117,110,99,116,105,111,110,59,32,105,116,10,32,32,
+    32,32,119,105,108,108,32,98,101,32,99,97,108,108,101,100,
+    32,119,105,116,104,32,111,110,101,32,97,114,103,117,109,101,
+    110,116,44,32,97,110,32,79,83,69,114,114,111,114,32,105,
+    110,115,116,97,110,99,101,46,32,32,73,116,32,99,97,110,
+    10,32,32,32,32,114,101,112,111,114,116,32,116,104,101,32,
+    101,114,114,111,114,32,116,111,32,99,111,110,116,105,110,117,
+    101,32,119,105,116,104,32,116,104,101,32,119,97,108,107,44,
+    32,111,114,32,114,97,105,115,101,32,116,104,101,32,101,120,
+    99,101,112,116,105,111,110,10,32,32,32,32,116,111,32,97,
+    98,111,114,116,32,116,104,101,32,119,97,108,107,46,32,32,
+    78,111,116,101,32,116,104,97,116,32,116,104,101,32,102,105,
+    108,101,110,97,109,101,32,105,115,32,97,118,97,105,108,97,
+    98,108,101,32,97,115,32,116,104,101,10,32,32,32,32,102,
+    105,108,101,110,97,109,101,32,97,116,116,114,105,98,117,116,
+    101,32,111,102,32,116,104,101,32,101,120,99,101,112,116,105,
+    111,110,32,111,98,106,101,99,116,46,10,10,32,32,32,32,
+    66,121,32,100,101,102,97,117,108,116,44,32,111,115,46,119,
+    97,108,107,32,100,111,101,115,32,110,111,116,32,102,111,108,
+    108,111,119,32,115,121,109,98,111,108,105,99,32,108,105,110,
+    107,115,32,116,111,32,115,117,98,100,105,114,101,99,116,111,
+    114,105,101,115,32,111,110,10,32,32,32,32,115,121,115,116,
+    101,109,115,32,116,104,97,116,32,115,117,112,112,111,114,116,
+    32,116,104,101,109,46,32,32,73,110,32,111,114,100,101,114,
+    32,116,111,32,103,101,116,32,116,104,105,115,32,102,117,110,
+    99,116,105,111,110,97,108,105,116,121,44,32,115,101,116,32,
+    116,104,101,10,32,32,32,32,111,112,116,105,111,110,97,108,
+    32,97,114,103,117,109,101,110,116,32,39,102,111,108,108,111,
+    119,108,105,110,107,115,39,32,116,111,32,116,114,117,101,46,
+    10,10,32,32,32,32,67,97,117,116,105,111,110,58,32,32,
+    105,102,32,121,111,117,32,112,97,115,115,32,97,32,114,101,
+    108,97,116,105,118,101,32,112,97,116,104,110,97,109,101,32,
+    102,111,114,32,116,111,112,44,32,100,111,110,39,116,32,99,
+    104,97,110,103,101,32,116,104,101,10,32,32,32,32,99,117,
+    114,114,101,110,116,32,119,111,114,107,105,110,103,32,100,105,
+    114,101,99,116,111,114,121,32,98,101,116,119,101,101,110,32,
+    114,101,115,117,109,112,116,105,111,110,115,32,111,102,32,119,
+    97,108,107,46,32,32,119,97,108,107,32,110,101,118,101,114,
+    10,32,32,32,32,99,104,97,110,103,101,115,32,116,104,101,
+    32,99,117,114,114,101,110,116,32,100,105,114,101,99,116,111,
+    114,121,44,32,97,110,100,32,97,115,115,117,109,101,115,32,
+    116,104,97,116,32,116,104,101,32,99,108,105,101,110,116,32,
+    100,111,101,115,110,39,116,10,32,32,32,32,101,105,116,104,
+    101,114,46,10,10,32,32,32,32,69,120,97,109,112,108,101,
+    58,10,10,32,32,32,32,105,109,112,111,114,116,32,111,115,
+    10,32,32,32,32,102,114,111,109,32,111,115,46,112,97,116,
+    104,32,105,109,112,111,114,116,32,106,111,105,110,44,32,103,
+    101,116,115,105,122,101,10,32,32,32,32,102,111,114,32,114,
+    111,111,116,44,32,100,105,114,115,44,32,102,105,108,101,115,
+    32,105,110,32,111,115,46,119,97,108,107,40,39,112,121,116,
+    104,111,110,47,76,105,98,47,101,109,97,105,108,39,41,58,
+    10,32,32,32,32,32,32,32,32,112,114,105,110,116,40,114,
+    111,111,116,44,32,34,99,111,110,115,117,109,101,115,34,44,
+    32,101,110,100,61,34,34,41,10,32,32,32,32,32,32,32,
+    32,112,114,105,110,116,40,115,117,109,40,91,103,101,116,115,
+    105,122,101,40,106,111,105,110,40,114,111,111,116,44,32,110,
+    97,109,101,41,41,32,102,111,114,32,110,97,109,101,32,105,
+    110,32,102,105,108,101,115,93,41,44,32,101,110,100,61,34,
+    34,41,10,32,32,32,32,32,32,32,32,112,114,105,110,116,
+    40,34,98,121,116,101,115,32,105,110,34,44,32,108,101,110,
+    40,102,105,108,101,115,41,44,32,34,110,111,110,45,100,105,
+    114,101,99,116,111,114,121,32,102,105,108,101,115,34,41,10,
+    32,32,32,32,32,32,32,32,105,102,32,39,67,86,83,39,
+    32,105,110,32,100,105,114,115,58,10,32,32,32,32,32,32,
+    32,32,32,32,32,32,100,105,114,115,46,114,101,109,111,118,
+    101,40,39,67,86,83,39,41,32,32,35,32,100,111,110,39,
+    116,32,118,105,115,105,116,32,67,86,83,32,100,105,114,101,
+    99,116,111,114,105,101,115,10,10,32,32,32,32,78,70,84,
+    41,13,218,6,102,115,112,97,116,104,90,7,115,99,97,110,
+    100,105,114,114,60,0,0,0,218,4,110,101,120,116,218,13,
+    83,116,111,112,73,116,101,114,97,116,105,111,110,218,6,105,
+    115,95,100,105,114,218,6,97,112,112,101,110,100,114,8,0,
+    0,0,218,10,105,115,95,115,121,109,108,105,110,107,114,9,
+    0,0,0,218,6,105,115,108,105,110,107,218,4,106,111,105,
+    110,218,4,119,97,108,107,41,17,218,3,116,111,112,218,7,
+    116,111,112,100,111,119,110,218,7,111,110,101,114,114,111,114,
+    90,11,102,111,108,108,111,119,108,105,110,107,115,218,4,100,
+    105,114,115,218,7,110,111,110,100,105,114,115,90,9,119,97,
+    108,107,95,100,105,114,115,90,10,115,99,97,110,100,105,114,
+    95,105,116,90,5,101,114,114,111,114,90,5,101,110,116,114,
+    121,114,69,0,0,0,90,9,119,97,108,107,95,105,110,116,
+    111,114,71,0,0,0,114,72,0,0,0,114,73,0,0,0,
+    90,7,100,105,114,110,97,109,101,90,8,110,101,119,95,112,
+    97,116,104,114,21,0,0,0,114,21,0,0,0,114,22,0,
+    0,0,114,74,0,0,0,21,1,0,0,115,96,0,0,0,
+    0,58,8,1,4,1,4,1,4,7,2,3,12,1,16,1,
+    8,1,8,1,16,2,8,1,4,1,2,1,2,1,12,1,
+    14,1,12,1,16,1,8,1,8,1,16,2,2,1,12,1,
+    14,3,10,2,4,1,14,2,12,2,10,3,6,1,6,2,
+    2,1,12,1,16,4,10,1,6,2,4,1,26,3,6,1,
+    12,3,14,1,10,1,10,5,18,1,28,3,10,1,26,2,
+    114,74,0,0,0,218,1,46,41,2,218,15,102,111,108,108,
+    111,119,95,115,121,109,108,105,110,107,115,218,6,100,105,114,
+    95,102,100,99,3,0,0,0,2,0,0,0,7,0,0,0,
+    12,0,0,0,99,0,0,0,115,134,0,0,0,116,0,124,
+    0,116,1,131,2,12,0,115,24,116,2,124,0,100,1,131,
+    2,12,0,114,32,116,3,124,0,131,1,125,0,116,4,124,
+    0,100,2,124,4,100,3,141,3,125,5,116,5,124,0,116,
+    6,124,4,100,4,141,3,125,6,122,58,124,3,115,94,116,
+    7,160,8,124,5,106,9,161,1,114,116,116,10,160,11,124,
+    5,116,4,124,6,131,1,161,2,114,116,116,12,124,6,124,
+    0,124,1,124,2,124,3,131,5,69,0,100,5,72,0,1,
+    0,87,0,100,5,116,13,124,6,131,1,1,0,88,0,100,
+    5,83,0,41,6,97,4,5,0,0,68,105,114,101,99,116,
+    111,114,121,32,116,114,101,101,32,103,101,110,101,114,97,116,
+    111,114,46,10,10,32,32,32,32,32,32,32,32,84,104,105,
+    115,32,98,101,104,97,118,101,115,32,101,120,97,99,116,108,
+    121,32,108,105,107,101,32,119,97,108,107,40,41,44,32,101,
+    120,99,101,112,116,32,116,104,97,116,32,105,116,32,121,105,
+    101,108,100,115,32,97,32,52,45,116,117,112,108,101,10,10,
+    32,32,32,32,32,32,32,32,32,32,32,32,100,105,114,112,
+    97,116,104,44,32,100,105,114,110,97,109,101,115,44,32,102,
+    105,108,101,110,97,109,101,115,44,32,100,105,114,102,100,10,
+    10,32,32,32,32,32,32,32,32,96,100,105,114,112,97,116,
+    104,96,44,32,96,100,105,114,110,97,109,101,115,96,32,97,
+    110,100,32,96,102,105,108,101,110,97,109,101,115,96,32,97,
+    114,101,32,105,100,101,110,116,105,99,97,108,32,116,111,32,
+    119,97,108,107,40,41,32,111,117,116,112,117,116,44,10,32,
+    32,32,32,32,32,32,32,97,110,100,32,96,100,105,114,102,
+    100,96,32,105,115,32,97,32,102,105,108,101,32,100,101,115,
+    99,114,105,112,116,111,114,32,114,101,102,101,114,114,105,110,
+    103,32,116,111,32,116,104,101,32,100,105,114,101,99,116,111,
+    114,121,32,96,100,105,114,112,97,116,104,96,46,10,10,32,
+    32,32,32,32,32,32,32,84,104,101,32,97,100,118,97,110,
+    116,97,103,101,32,111,102,32,102,119,97,108,107,40,41,32,
+    111,118,101,114,32,119,97,108,107,40,41,32,105,115,32,116,
+    104,97,116,32,105,116,39,115,32,115,97,102,101,32,97,103,
+    97,105,110,115,116,32,115,121,109,108,105,110,107,10,32,32,
+    32,32,32,32,32,32,114,97,99,101,115,32,40,119,104,101,
+    110,32,102,111,108,108,111,119,95,115,121,109,108,105,110,107,
+    115,32,105,115,32,70,97,108,115,101,41,46,10,10,32,32,
+    32,32,32,32,32,32,73,102,32,100,105,114,95,102,100,32,
+    105,115,32,110,111,116,32,78,111,110,101,44,32,105,116,32,
+    115,104,111,117,108,100,32,98,101,32,97,32,102,105,108,101,
+    32,100,101,115,99,114,105,112,116,111,114,32,111,112,101,110,
+    32,116,111,32,97,32,100,105,114,101,99,116,111,114,121,44,
+    10,32,32,32,32,32,32,32,32,32,32,97,110,100,32,116,
+    111,112,32,115,104,111,117,108,100,32,98,101,32,114,101,108,
+    97,116,105,118,101,59,32,116,111,112,32,119,105,108,108,32,
+    116,104,101,110,32,98,101,32,114,101,108,97,116,105,118,101,
+    32,116,111,32,116,104,97,116,32,100,105,114,101,99,116,111,
+    114,121,46,10,32,32,32,32,32,32,32,32,32,32,40,100,
+    105,114,95,102,100,32,105,115,32,97,108,119,97,121,115,32,
+    115,117,112,112,111,114,116,101,100,32,102,111,114,32,102,119,
+    97,108,107,46,41,10,10,32,32,32,32,32,32,32,32,67,
+    97,117,116,105,111,110,58,10,32,32,32,32,32,32,32,32,
+    83,105,110,99,101,32,102,119,97,108,107,40,41,32,121,105,
+    101,108,100,115,32,102,105,108,101,32,100,101,115,99,114,105,
+    112,116,111,114,115,44,32,116,104,111,115,101,32,97,114,101,
+    32,111,110,108,121,32,118,97,108,105,100,32,117,110,116,105,
+    108,32,116,104,101,10,32,32,32,32,32,32,32,32,110,101,
+    120,116,32,105,116,101,114,97,116,105,111,110,32,115,116,101,
+    112,44,32,115,111,32,121,111,117,32,115,104,111,117,108,100,
+    32,100,117,112,40,41,32,116,104,101,109,32,105,102,32,121,
+    111,117,32,119,97,110,116,32,116,111,32,107,101,101,112,32,
+    116,104,101,109,10,32,32,32,32,32,32,32,32,102,111,114,
+    32,97,32,108,111,110,103,101,114,32,112,101,114,105,111,100,
+    46,10,10,32,32,32,32,32,32,32,32,69,120,97,109,112,
+    108,101,58,10,10,32,32,32,32,32,32,32,32,105,109,112,
+    111,114,116,32,111,115,10,32,32,32,32,32,32,32,32,102,
+    111,114,32,114,111,111,116,44,32,100,105,114,115,44,32,102,
+    105,108,101,115,44,32,114,111,111,116,102,100,32,105,110,32,
+    111,115,46,102,119,97,108,107,40,39,112,121,116,104,111,110,
+    47,76,105,98,47,101,109,97,105,108,39,41,58,10,32,32,
+    32,32,32,32,32,32,32,32,32,32,112,114,105,110,116,40,
+    114,111,111,116,44,32,34,99,111,110,115,117,109,101,115,34,
+    44,32,101,110,100,61,34,34,41,10,32,32,32,32,32,32,
+    32,32,32,32,32,32,112,114,105,110,116,40,115,117,109,40,
+    91,111,115,46,115,116,97,116,40,110,97,109,101,44,32,100,
+    105,114,95,102,100,61,114,111,111,116,102,100,41,46,115,116,
+    95,115,105,122,101,32,102,111,114,32,110,97,109,101,32,105,
+    110,32,102,105,108,101,115,93,41,44,10,32,32,32,32,32,
+    32,32,32,32,32,32,32,32,32,32,32,32,32,101,110,100,
+    61,34,34,41,10,32,32,32,32,32,32,32,32,32,32,32,
+    32,112,114,105,110,116,40,34,98,121,116,101,115,32,105,110,
+    34,44,32,108,101,110,40,102,105,108,101,115,41,44,32,34,
+    110,111,110,45,100,105,114,101,99,116,111,114,121,32,102,105,
+    108,101,115,34,41,10,32,32,32,32,32,32,32,32,32,32,
+    32,32,105,102,32,39,67,86,83,39,32,105,110,32,100,105,
+    114,115,58,10,32,32,32,32,32,32,32,32,32,32,32,32,
+    32,32,32,32,100,105,114,115,46,114,101,109,111,118,101,40,
+    39,67,86,83,39,41,32,32,35,32,100,111,110,39,116,32,
+    118,105,115,105,116,32,67,86,83,32,100,105,114,101,99,116,
+    111,114,105,101,115,10,32,32,32,32,32,32,32,32,218,9,
+    95,95,105,110,100,101,120,95,95,70,41,2,114,81,0,0,
+    0,114,82,0,0,0,41,1,114,82,0,0,0,78,41,14,
+    114,58,0,0,0,218,3,105,110,116,218,7,104,97,115,97,
+    116,116,114,114,66,0,0,0,114,44,0,0,0,114,46,0,
+    0,0,218,8,79,95,82,68,79,78,76,89,218,2,115,116,
+    218,7,83,95,73,83,68,73,82,218,7,115,116,95,109,111,
+    100,101,114,9,0,0,0,218,8,115,97,109,101,115,116,97,
+    116,218,6,95,102,119,97,108,107,218,5,99,108,111,115,101,
+    41,7,114,75,0,0,0,114,76,0,0,0,114,77,0,0,
+    0,114,81,0,0,0,114,82,0,0,0,218,7,111,114,105,
+    103,95,115,116,218,5,116,111,112,102,100,114,21,0,0,0,
+    114,21,0,0,0,114,22,0,0,0,218,5,102,119,97,108,
+    107,165,1,0,0,115,18,0,0,0,0,33,24,1,8,3,
+    14,1,14,1,2,1,16,1,16,1,26,2,114,95,0,0,
+    0,99,5,0,0,0,0,0,0,0,13,0,0,0,27,0,
+    0,0,99,0,0,0,115,124,1,0,0,116,0,124,0,131,
+    1,125,5,103,0,103,0,2,0,125,6,125,7,120,140,124,
+    5,68,0,93,132,125,8,121,46,116,1,160,2,116,3,124,
+    8,124,0,100,1,141,2,106,4,161,1,114,62,124,6,160,
+    5,124,8,161,1,1,0,110,10,124,7,160,5,124,8,161,
+    1,1,0,87,0,113,24,4,0,116,6,107,10,114,154,1,
+    0,1,0,1,0,121,36,116,1,160,7,116,3,124,8,124,
+    0,100,2,100,3,141,3,106,4,161,1,114,124,124,7,160,
+    5,124,8,161,1,1,0,87,0,110,22,4,0,116,6,107,
+    10,114,148,1,0,1,0,1,0,119,24,89,0,110,2,88,
+    0,89,0,113,24,88,0,113,24,87,0,124,2,114,178,124,
+    1,124,6,124,7,124,0,102,4,86,0,1,0,120,176,124,
+    6,68,0,93,168,125,8,121,32,116,3,124,8,124,0,124,
+    4,100,3,141,3,125,9,116,8,124,8,116,9,124,0,100,
+    1,141,3,125,10,87,0,110,56,4,0,116,6,107,10,144,
+    1,114,20,1,0,125,11,1,0,122,26,124,3,100,0,107,
+    9,144,1,114,2,124,3,124,11,131,1,1,0,119,184,87,
+    0,89,0,100,0,100,0,125,11,126,11,88,0,110,2,88,
+    0,122,62,124,4,144,1,115,48,116,10,160,11,124,9,116,
+    3,124,10,131,1,161,2,144,1,114,82,116,10,160,12,124,
+    1,124,8,161,2,125,12,116,13,124,10,124,12,124,2,124,
+    3,124,4,131,5,69,0,100,0,72,0,1,0,87,0,100,
+    0,116,14,124,10,131,1,1,0,88,0,113,184,87,0,124,
+    2,144,1,115,120,124,1,124,6,124,7,124,0,102,4,86,
+    0,1,0,100,0,83,0,41,4,78,41,1,114,82,0,0,
+    0,70,41,2,114,82,0,0,0,114,81,0,0,0,41,15,
+    114,49,0,0,0,114,87,0,0,0,114,88,0,0,0,114,
+    44,0,0,0,114,89,0,0,0,114,70,0,0,0,114,60,
+    0,0,0,90,7,83,95,73,83,76,78,75,114,46,0,0,
+    0,114,86,0,0,0,114,9,0,0,0,114,90,0,0,0,
+    114,73,0,0,0,114,91,0,0,0,114,92,0,0,0,41,
+    13,114,94,0,0,0,90,7,116,111,112,112,97,116,104,114,
+    76,0,0,0,114,77,0,0,0,114,81,0,0,0,90,5,
+    110,97,109,101,115,114,78,0,0,0,114,79,0,0,0,114,
+    8,0,0,0,114,93,0,0,0,90,5,100,105,114,102,100,
+    90,3,101,114,114,90,7,100,105,114,112,97,116,104,114,21,
+    0,0,0,114,21,0,0,0,114,22,0,0,0,114,91,0,
+    0,0,211,1,0,0,115,60,0,0,0,0,5,8,1,10,
+    1,10,1,2,5,20,1,12,2,14,1,14,1,2,2,22,
+    2,14,1,14,1,18,2,4,1,14,2,10,1,2,1,14,
+    1,18,1,18,1,10,1,8,1,20,1,2,1,24,1,12,
+    1,26,2,14,2,6,1,114,91,0,0,0,99,1,0,0,
+    0,0,0,0,0,2,0,0,0,3,0,0,0,71,0,0,
+    0,115,14,0,0,0,116,0,124,0,124,1,131,2,1,0,
+    100,1,83,0,41,2,122,112,101,120,101,99,108,40,102,105,
+    108,101,44,32,42,97,114,103,115,41,10,10,32,32,32,32,
+    69,120,101,99,117,116,101,32,116,104,101,32,101,120,101,99,
+    117,116,97,98,108,101,32,102,105,108,101,32,119,105,116,104,
+    32,97,114,103,117,109,101,110,116,32,108,105,115,116,32,97,
+    114,103,115,44,32,114,101,112,108,97,99,105,110,103,32,116,
+    104,101,10,32,32,32,32,99,117,114,114,101,110,116,32,112,
+    114,111,99,101,115,115,46,32,78,41,1,218,5,101,120,101,
+    99,118,41,2,218,4,102,105,108,101,218,4,97,114,103,115,
+    114,21,0,0,0,114,21,0,0,0,114,22,0,0,0,218,
+    5,101,120,101,99,108,10,2,0,0,115,2,0,0,0,0,
+    5,114,99,0,0,0,99,1,0,0,0,0,0,0,0,3,
+    0,0,0,5,0,0,0,71,0,0,0,115,32,0,0,0,
+    124,1,100,3,25,0,125,2,116,0,124,0,124,1,100,2,
+    100,4,133,2,25,0,124,2,131,3,1,0,100,2,83,0,
+    41,5,122,138,101,120,101,99,108,101,40,102,105,108,101,44,
+    32,42,97,114,103,115,44,32,101,110,118,41,10,10,32,32,
+    32,32,69,120,101,99,117,116,101,32,116,104,101,32,101,120,
+    101,99,117,116,97,98,108,101,32,102,105,108,101,32,119,105,
+    116,104,32,97,114,103,117,109,101,110,116,32,108,105,115,116,
+    32,97,114,103,115,32,97,110,100,10,32,32,32,32,101,110,
+    118,105,114,111,110,109,101,110,116,32,101,110,118,44,32,114,
+    101,112,108,97,99,105,110,103,32,116,104,101,32,99,117,114,
+    114,101,110,116,32,112,114,111,99,101,115,115,46,32,114,51,
+    0,0,0,78,233,255,255,255,255,114,100,0,0,0,41,1,
+    114,50,0,0,0,41,3,114,97,0,0,0,114,98,0,0,
+    0,218,3,101,110,118,114,21,0,0,0,114,21,0,0,0,
+    114,22,0,0,0,218,6,101,120,101,99,108,101,17,2,0,
+    0,115,4,0,0,0,0,5,8,1,114,102,0,0,0,99,
+    1,0,0,0,0,0,0,0,2,0,0,0,3,0,0,0,
+    71,0,0,0,115,14,0,0,0,116,0,124,0,124,1,131,
+    2,1,0,100,1,83,0,41,2,122,149,101,120,101,99,108,
+    112,40,102,105,108,101,44,32,42,97,114,103,115,41,10,10,
+    32,32,32,32,69,120,101,99,117,116,101,32,116,104,101,32,
+    101,120,101,99,117,116,97,98,108,101,32,102,105,108,101,32,
+    40,119,104,105,99,104,32,105,115,32,115,101,97,114,99,104,
+    101,100,32,102,111,114,32,97,108,111,110,103,32,36,80,65,
+    84,72,41,10,32,32,32,32,119,105,116,104,32,97,114,103,
+    117,109,101,110,116,32,108,105,115,116,32,97,114,103,115,44,
+    32,114,101,112,108,97,99,105,110,103,32,116,104,101,32,99,
+    117,114,114,101,110,116,32,112,114,111,99,101,115,115,46,32,
+    78,41,1,218,6,101,120,101,99,118,112,41,2,114,97,0,
+    0,0,114,98,0,0,0,114,21,0,0,0,114,21,0,0,
+    0,114,22,0,0,0,218,6,101,120,101,99,108,112,25,2,
+    0,0,115,2,0,0,0,0,5,114,104,0,0,0,99,1,
+    0,0,0,0,0,0,0,3,0,0,0,5,0,0,0,71,
+    0,0,0,115,32,0,0,0,124,1,100,3,25,0,125,2,
+    116,0,124,0,124,1,100,2,100,4,133,2,25,0,124,2,
+    131,3,1,0,100,2,83,0,41,5,122,179,101,120,101,99,
+    108,112,101,40,102,105,108,101,44,32,42,97,114,103,115,44,
+    32,101,110,118,41,10,10,32,32,32,32,69,120,101,99,117,
+    116,101,32,116,104,101,32,101,120,101,99,117,116,97,98,108,
+    101,32,102,105,108,101,32,40,119,104,105,99,104,32,105,115,
+    32,115,101,97,114,99,104,101,100,32,102,111,114,32,97,108,
+    111,110,103,32,36,80,65,84,72,41,10,32,32,32,32,119,
+    105,116,104,32,97,114,103,117,109,101,110,116,32,108,105,115,
+    116,32,97,114,103,115,32,97,110,100,32,101,110,118,105,114,
+    111,110,109,101,110,116,32,101,110,118,44,32,114,101,112,108,
+    97,99,105,110,103,32,116,104,101,32,99,117,114,114,101,110,
+    116,10,32,32,32,32,112,114,111,99,101,115,115,46,32,114,
+    51,0,0,0,78,114,100,0,0,0,114,100,0,0,0,41,
+    1,218,7,101,120,101,99,118,112,101,41,3,114,97,0,0,
+    0,114,98,0,0,0,114,101,0,0,0,114,21,0,0,0,
+    114,21,0,0,0,114,22,0,0,0,218,7,101,120,101,99,
+    108,112,101,32,2,0,0,115,4,0,0,0,0,6,8,1,
+    114,106,0,0,0,99,2,0,0,0,0,0,0,0,2,0,
+    0,0,3,0,0,0,67,0,0,0,115,14,0,0,0,116,
+    0,124,0,124,1,131,2,1,0,100,1,83,0,41,2,122,
+    192,101,120,101,99,118,112,40,102,105,108,101,44,32,97,114,
+    103,115,41,10,10,32,32,32,32,69,120,101,99,117,116,101,
+    32,116,104,101,32,101,120,101,99,117,116,97,98,108,101,32,
+    102,105,108,101,32,40,119,104,105,99,104,32,105,115,32,115,
+    101,97,114,99,104,101,100,32,102,111,114,32,97,108,111,110,
+    103,32,36,80,65,84,72,41,10,32,32,32,32,119,105,116,
+    104,32,97,114,103,117,109,101,110,116,32,108,105,115,116,32,
+    97,114,103,115,44,32,114,101,112,108,97,99,105,110,103,32,
+    116,104,101,32,99,117,114,114,101,110,116,32,112,114,111,99,
+    101,115,115,46,10,32,32,32,32,97,114,103,115,32,109,97,
+    121,32,98,101,32,97,32,108,105,115,116,32,111,114,32,116,
+    117,112,108,101,32,111,102,32,115,116,114,105,110,103,115,46,
+    32,78,41,1,218,8,95,101,120,101,99,118,112,101,41,2,
+    114,97,0,0,0,114,98,0,0,0,114,21,0,0,0,114,
+    21,0,0,0,114,22,0,0,0,114,103,0,0,0,41,2,
+    0,0,115,2,0,0,0,0,6,114,103,0,0,0,99,3,
+    0,0,0,0,0,0,0,3,0,0,0,4,0,0,0,67,
+    0,0,0,115,16,0,0,0,116,0,124,0,124,1,124,2,
+    131,3,1,0,100,1,83,0,41,2,122,223,101,120,101,99,
+    118,112,101,40,102,105,108,101,44,32,97,114,103,115,44,32,
+    101,110,118,41,10,10,32,32,32,32,69,120,101,99,117,116,
+    101,32,116,104,101,32,101,120,101,99,117,116,97,98,108,101,
+    32,102,105,108,101,32,40,119,104,105,99,104,32,105,115,32,
+    115,101,97,114,99,104,101,100,32,102,111,114,32,97,108,111,
+    110,103,32,36,80,65,84,72,41,10,32,32,32,32,119,105,
+    116,104,32,97,114,103,117,109,101,110,116,32,108,105,115,116,
+    32,97,114,103,115,32,97,110,100,32,101,110,118,105,114,111,
+    110,109,101,110,116,32,101,110,118,32,44,32,114,101,112,108,
+    97,99,105,110,103,32,116,104,101,10,32,32,32,32,99,117,
+    114,114,101,110,116,32,112,114,111,99,101,115,115,46,10,32,
+    32,32,32,97,114,103,115,32,109,97,121,32,98,101,32,97,
+    32,108,105,115,116,32,111,114,32,116,117,112,108,101,32,111,
+    102,32,115,116,114,105,110,103,115,46,32,78,41,1,114,107,
+    0,0,0,41,3,114,97,0,0,0,114,98,0,0,0,114,
+    101,0,0,0,114,21,0,0,0,114,21,0,0,0,114,22,
+    0,0,0,114,105,0,0,0,49,2,0,0,115,2,0,0,
+    0,0,7,114,105,0,0,0,99,3,0,0,0,0,0,0,
+    0,15,0,0,0,18,0,0,0,67,0,0,0,115,28,1,
+    0,0,124,2,100,0,107,9,114,22,116,0,125,3,124,1,
+    124,2,102,2,125,4,110,14,116,1,125,3,124,1,102,1,
+    125,4,116,2,125,2,116,3,160,4,124,0,161,1,92,2,
+    125,5,125,6,124,5,114,72,124,3,124,0,102,1,124,4,
+    158,2,142,0,1,0,100,0,83,0,100,0,4,0,125,7,
+    125,8,100,0,125,9,116,5,124,2,131,1,125,10,116,6,
+    100,1,107,3,114,118,116,7,124,0,131,1,125,0,116,8,
+    116,7,124,10,131,2,125,10,120,134,124,10,68,0,93,126,
+    125,11,116,3,160,9,124,11,124,0,161,2,125,12,121,18,
+    124,3,124,12,102,1,124,4,158,2,142,0,1,0,87,0,
+    113,124,4,0,116,10,107,10,114,248,1,0,125,13,1,0,
+    122,62,124,13,125,7,116,11,160,12,161,0,100,2,25,0,
+    125,14,124,13,106,13,116,13,106,14,107,3,114,232,124,13,
+    106,13,116,13,106,15,107,3,114,232,124,8,100,0,107,8,
+    114,232,124,13,125,8,124,14,125,9,87,0,89,0,100,0,
+    100,0,125,13,126,13,88,0,113,124,88,0,113,124,87,0,
+    124,8,144,1,114,14,124,8,160,16,124,9,161,1,130,1,
+    124,7,160,16,124,14,161,1,130,1,100,0,83,0,41,3,
+    78,114,38,0,0,0,114,52,0,0,0,41,17,114,50,0,
+    0,0,114,96,0,0,0,218,7,101,110,118,105,114,111,110,
+    114,9,0,0,0,114,54,0,0,0,114,16,0,0,0,114,
+    8,0,0,0,114,14,0,0,0,218,3,109,97,112,114,73,
+    0,0,0,114,60,0,0,0,218,3,115,121,115,218,8,101,
+    120,99,95,105,110,102,111,218,5,101,114,114,110,111,90,6,
+    69,78,79,69,78,84,90,7,69,78,79,84,68,73,82,218,
+    14,119,105,116,104,95,116,114,97,99,101,98,97,99,107,41,
+    15,114,97,0,0,0,114,98,0,0,0,114,101,0,0,0,
+    90,9,101,120,101,99,95,102,117,110,99,90,7,97,114,103,
+    114,101,115,116,114,62,0,0,0,114,63,0,0,0,90,8,
+    108,97,115,116,95,101,120,99,90,9,115,97,118,101,100,95,
+    101,120,99,90,8,115,97,118,101,100,95,116,98,218,9,112,
+    97,116,104,95,108,105,115,116,114,31,0,0,0,90,8,102,
+    117,108,108,110,97,109,101,218,1,101,90,2,116,98,114,21,
+    0,0,0,114,21,0,0,0,114,22,0,0,0,114,107,0,
+    0,0,60,2,0,0,115,60,0,0,0,0,1,8,1,4,
+    1,10,2,4,1,6,1,4,2,14,1,4,1,14,1,4,
+    1,8,1,4,1,8,1,8,1,8,1,10,1,10,1,12,
+    1,2,1,18,1,16,1,4,1,12,1,24,1,8,1,4,
+    1,26,1,6,1,10,1,114,107,0,0,0,99,1,0,0,
+    0,0,0,0,0,4,0,0,0,27,0,0,0,67,0,0,
+    0,115,202,0,0,0,100,1,100,2,108,0,125,1,124,0,
+    100,2,107,8,114,20,116,1,125,0,124,1,160,2,161,0,
+    143,146,1,0,124,1,160,3,100,3,116,4,161,2,1,0,
+    121,14,124,0,160,5,100,4,161,1,125,2,87,0,110,24,
+    4,0,116,6,107,10,114,80,1,0,1,0,1,0,100,2,
+    125,2,89,0,110,2,88,0,116,7,114,170,121,12,124,0,
+    100,5,25,0,125,3,87,0,110,24,4,0,116,8,116,6,
+    102,2,107,10,114,122,1,0,1,0,1,0,89,0,110,22,
+    88,0,124,2,100,2,107,9,114,140,116,9,100,6,131,1,
+    130,1,124,3,125,2,124,2,100,2,107,9,114,170,116,10,
+    124,2,116,11,131,2,114,170,116,12,124,2,131,1,125,2,
+    87,0,100,2,81,0,82,0,88,0,124,2,100,2,107,8,
+    114,192,116,13,125,2,124,2,160,14,116,15,161,1,83,0,
+    41,7,122,243,82,101,116,117,114,110,115,32,116,104,101,32,
+    115,101,113,117,101,110,99,101,32,111,102,32,100,105,114,101,
+    99,116,111,114,105,101,115,32,116,104,97,116,32,119,105,108,
+    108,32,98,101,32,115,101,97,114,99,104,101,100,32,102,111,
+    114,32,116,104,101,10,32,32,32,32,110,97,109,101,100,32,
+    101,120,101,99,117,116,97,98,108,101,32,40,115,105,109,105,
+    108,97,114,32,116,111,32,97,32,115,104,101,108,108,41,32,
+    119,104,101,110,32,108,97,117,110,99,104,105,110,103,32,97,
+    32,112,114,111,99,101,115,115,46,10,10,32,32,32,32,42,
+    101,110,118,42,32,109,117,115,116,32,98,101,32,97,110,32,
+    101,110,118,105,114,111,110,109,101,110,116,32,118,97,114,105,
+    97,98,108,101,32,100,105,99,116,32,111,114,32,78,111,110,
+    101,46,32,32,73,102,32,42,101,110,118,42,32,105,115,32,
+    78,111,110,101,44,10,32,32,32,32,111,115,46,101,110,118,
+    105,114,111,110,32,119,105,108,108,32,98,101,32,117,115,101,
+    100,46,10,32,32,32,32,114,0,0,0,0,78,218,6,105,
+    103,110,111,114,101,90,4,80,65,84,72,115,4,0,0,0,
+    80,65,84,72,122,42,101,110,118,32,99,97,110,110,111,116,
+    32,99,111,110,116,97,105,110,32,39,80,65,84,72,39,32,
+    97,110,100,32,98,39,80,65,84,72,39,32,107,101,121,115,
+    41,16,218,8,119,97,114,110,105,110,103,115,114,108,0,0,
+    0,90,14,99,97,116,99,104,95,119,97,114,110,105,110,103,
+    115,90,12,115,105,109,112,108,101,102,105,108,116,101,114,218,
+    12,66,121,116,101,115,87,97,114,110,105,110,103,218,3,103,
+    101,116,218,9,84,121,112,101,69,114,114,111,114,218,22,115,
+    117,112,112,111,114,116,115,95,98,121,116,101,115,95,101,110,
+    118,105,114,111,110,218,8,75,101,121,69,114,114,111,114,218,
+    10,86,97,108,117,101,69,114,114,111,114,114,58,0,0,0,
+    114,59,0,0,0,114,15,0,0,0,114,7,0,0,0,114,
+    54,0,0,0,114,5,0,0,0,41,4,114,101,0,0,0,
+    114,117,0,0,0,114,114,0,0,0,90,10,112,97,116,104,
+    95,108,105,115,116,98,114,21,0,0,0,114,21,0,0,0,
+    114,22,0,0,0,114,16,0,0,0,95,2,0,0,115,46,
+    0,0,0,0,10,8,2,8,1,4,4,10,1,12,2,2,
+    1,14,1,14,1,10,2,4,1,2,1,12,1,18,1,6,
+    2,8,1,2,1,6,1,4,2,18,1,18,2,8,1,4,
+    1,41,1,218,14,77,117,116,97,98,108,101,77,97,112,112,
+    105,110,103,99,0,0,0,0,0,0,0,0,0,0,0,0,
+    2,0,0,0,64,0,0,0,115,84,0,0,0,101,0,90,
+    1,100,0,90,2,100,1,100,2,132,0,90,3,100,3,100,
+    4,132,0,90,4,100,5,100,6,132,0,90,5,100,7,100,
+    8,132,0,90,6,100,9,100,10,132,0,90,7,100,11,100,
+    12,132,0,90,8,100,13,100,14,132,0,90,9,100,15,100,
+    16,132,0,90,10,100,17,100,18,132,0,90,11,100,19,83,
+    0,41,20,218,8,95,69,110,118,105,114,111,110,99,8,0,
+    0,0,0,0,0,0,8,0,0,0,2,0,0,0,67,0,
+    0,0,115,46,0,0,0,124,2,124,0,95,0,124,3,124,
+    0,95,1,124,4,124,0,95,2,124,5,124,0,95,3,124,
+    6,124,0,95,4,124,7,124,0,95,5,124,1,124,0,95,
+    6,100,0,83,0,41,1,78,41,7,218,9,101,110,99,111,
+    100,101,107,101,121,218,9,100,101,99,111,100,101,107,101,121,
+    218,11,101,110,99,111,100,101,118,97,108,117,101,218,11,100,
+    101,99,111,100,101,118,97,108,117,101,218,6,112,117,116,101,
+    110,118,218,8,117,110,115,101,116,101,110,118,218,5,95,100,
+    97,116,97,41,8,218,4,115,101,108,102,218,4,100,97,116,
+    97,114,126,0,0,0,114,127,0,0,0,114,128,0,0,0,
+    114,129,0,0,0,114,130,0,0,0,114,131,0,0,0,114,
+    21,0,0,0,114,21,0,0,0,114,22,0,0,0,218,8,
+    95,95,105,110,105,116,95,95,143,2,0,0,115,14,0,0,
+    0,0,1,6,1,6,1,6,1,6,1,6,1,6,1,122,
+    17,95,69,110,118,105,114,111,110,46,95,95,105,110,105,116,
+    95,95,99,2,0,0,0,0,0,0,0,3,0,0,0,11,
+    0,0,0,67,0,0,0,115,62,0,0,0,121,20,124,0,
+    106,0,124,0,160,1,124,1,161,1,25,0,125,2,87,0,
+    110,30,4,0,116,2,107,10,114,50,1,0,1,0,1,0,
+    116,2,124,1,131,1,100,0,130,2,89,0,110,2,88,0,
+    124,0,160,3,124,2,161,1,83,0,41,1,78,41,4,114,
+    132,0,0,0,114,126,0,0,0,114,122,0,0,0,114,129,
+    0,0,0,41,3,114,133,0,0,0,218,3,107,101,121,218,
+    5,118,97,108,117,101,114,21,0,0,0,114,21,0,0,0,
+    114,22,0,0,0,218,11,95,95,103,101,116,105,116,101,109,
+    95,95,152,2,0,0,115,10,0,0,0,0,1,2,1,20,
+    1,14,2,16,1,122,20,95,69,110,118,105,114,111,110,46,
+    95,95,103,101,116,105,116,101,109,95,95,99,3,0,0,0,
+    0,0,0,0,3,0,0,0,4,0,0,0,67,0,0,0,
+    115,46,0,0,0,124,0,160,0,124,1,161,1,125,1,124,
+    0,160,1,124,2,161,1,125,2,124,0,160,2,124,1,124,
+    2,161,2,1,0,124,2,124,0,106,3,124,1,60,0,100,
+    0,83,0,41,1,78,41,4,114,126,0,0,0,114,128,0,
+    0,0,114,130,0,0,0,114,132,0,0,0,41,3,114,133,
+    0,0,0,114,136,0,0,0,114,137,0,0,0,114,21,0,
+    0,0,114,21,0,0,0,114,22,0,0,0,218,11,95,95,
+    115,101,116,105,116,101,109,95,95,160,2,0,0,115,8,0,
+    0,0,0,1,10,1,10,1,12,1,122,20,95,69,110,118,
+    105,114,111,110,46,95,95,115,101,116,105,116,101,109,95,95,
+    99,2,0,0,0,0,0,0,0,3,0,0,0,11,0,0,
+    0,67,0,0,0,115,68,0,0,0,124,0,160,0,124,1,
+    161,1,125,2,124,0,160,1,124,2,161,1,1,0,121,12,
+    124,0,106,2,124,2,61,0,87,0,110,30,4,0,116,3,
+    107,10,114,62,1,0,1,0,1,0,116,3,124,1,131,1,
+    100,0,130,2,89,0,110,2,88,0,100,0,83,0,41,1,
+    78,41,4,114,126,0,0,0,114,131,0,0,0,114,132,0,
+    0,0,114,122,0,0,0,41,3,114,133,0,0,0,114,136,
+    0,0,0,90,10,101,110,99,111,100,101,100,107,101,121,114,
+    21,0,0,0,114,21,0,0,0,114,22,0,0,0,218,11,
+    95,95,100,101,108,105,116,101,109,95,95,166,2,0,0,115,
+    12,0,0,0,0,1,10,1,10,1,2,1,12,1,14,2,
+    122,20,95,69,110,118,105,114,111,110,46,95,95,100,101,108,
+    105,116,101,109,95,95,99,1,0,0,0,0,0,0,0,2,
+    0,0,0,4,0,0,0,99,0,0,0,115,32,0,0,0,
+    120,26,124,0,106,0,68,0,93,16,125,1,124,0,160,1,
+    124,1,161,1,86,0,1,0,113,8,87,0,100,0,83,0,
+    41,1,78,41,2,114,132,0,0,0,114,127,0,0,0,41,
+    2,114,133,0,0,0,114,136,0,0,0,114,21,0,0,0,
+    114,21,0,0,0,114,22,0,0,0,218,8,95,95,105,116,
+    101,114,95,95,175,2,0,0,115,4,0,0,0,0,1,12,
+    1,122,17,95,69,110,118,105,114,111,110,46,95,95,105,116,
+    101,114,95,95,99,1,0,0,0,0,0,0,0,1,0,0,
+    0,2,0,0,0,67,0,0,0,115,10,0,0,0,116,0,
+    124,0,106,1,131,1,83,0,41,1,78,41,2,218,3,108,
+    101,110,114,132,0,0,0,41,1,114,133,0,0,0,114,21,
+    0,0,0,114,21,0,0,0,114,22,0,0,0,218,7,95,
+    95,108,101,110,95,95,179,2,0,0,115,2,0,0,0,0,
+    1,122,16,95,69,110,118,105,114,111,110,46,95,95,108,101,
+    110,95,95,99,1,0,0,0,0,0,0,0,1,0,0,0,
+    7,0,0,0,3,0,0,0,115,36,0,0,0,100,1,160,
+    0,100,2,160,1,135,0,102,1,100,3,100,4,132,8,136,
+    0,106,2,160,3,161,0,68,0,131,1,161,1,161,1,83,
+    0,41,5,78,122,15,101,110,118,105,114,111,110,40,123,123,
+    123,125,125,125,41,122,2,44,32,99,1,0,0,0,0,0,
+    0,0,3,0,0,0,7,0,0,0,51,0,0,0,115,42,
+    0,0,0,124,0,93,34,92,2,125,1,125,2,100,0,160,
+    0,136,0,160,1,124,1,161,1,136,0,160,2,124,2,161,
+    1,161,2,86,0,1,0,113,2,100,1,83,0,41,2,122,
+    10,123,33,114,125,58,32,123,33,114,125,78,41,3,218,6,
+    102,111,114,109,97,116,114,127,0,0,0,114,129,0,0,0,
+    41,3,114,25,0,0,0,114,136,0,0,0,114,137,0,0,
+    0,41,1,114,133,0,0,0,114,21,0,0,0,114,22,0,
+    0,0,250,9,60,103,101,110,101,120,112,114,62,184,2,0,
+    0,115,2,0,0,0,4,1,122,36,95,69,110,118,105,114,
+    111,110,46,95,95,114,101,112,114,95,95,46,60,108,111,99,
+    97,108,115,62,46,60,103,101,110,101,120,112,114,62,41,4,
+    114,144,0,0,0,114,73,0,0,0,114,132,0,0,0,218,
+    5,105,116,101,109,115,41,1,114,133,0,0,0,114,21,0,
+    0,0,41,1,114,133,0,0,0,114,22,0,0,0,218,8,
+    95,95,114,101,112,114,95,95,182,2,0,0,115,6,0,0,
+    0,0,1,8,1,10,1,122,17,95,69,110,118,105,114,111,
+    110,46,95,95,114,101,112,114,95,95,99,1,0,0,0,0,
+    0,0,0,1,0,0,0,2,0,0,0,67,0,0,0,115,
+    8,0,0,0,116,0,124,0,131,1,83,0,41,1,78,41,
+    1,218,4,100,105,99,116,41,1,114,133,0,0,0,114,21,
+    0,0,0,114,21,0,0,0,114,22,0,0,0,218,4,99,
+    111,112,121,187,2,0,0,115,2,0,0,0,0,1,122,13,
+    95,69,110,118,105,114,111,110,46,99,111,112,121,99,3,0,
+    0,0,0,0,0,0,3,0,0,0,3,0,0,0,67,0,
+    0,0,115,24,0,0,0,124,1,124,0,107,7,114,16,124,
+    2,124,0,124,1,60,0,124,0,124,1,25,0,83,0,41,
+    1,78,114,21,0,0,0,41,3,114,133,0,0,0,114,136,
+    0,0,0,114,137,0,0,0,114,21,0,0,0,114,21,0,
+    0,0,114,22,0,0,0,218,10,115,101,116,100,101,102,97,
+    117,108,116,190,2,0,0,115,6,0,0,0,0,1,8,1,
+    8,1,122,19,95,69,110,118,105,114,111,110,46,115,101,116,
+    100,101,102,97,117,108,116,78,41,12,218,8,95,95,110,97,
+    109,101,95,95,218,10,95,95,109,111,100,117,108,101,95,95,
+    218,12,95,95,113,117,97,108,110,97,109,101,95,95,114,135,
+    0,0,0,114,138,0,0,0,114,139,0,0,0,114,140,0,
+    0,0,114,141,0,0,0,114,143,0,0,0,114,147,0,0,
+    0,114,149,0,0,0,114,150,0,0,0,114,21,0,0,0,
+    114,21,0,0,0,114,21,0,0,0,114,22,0,0,0,114,
+    125,0,0,0,142,2,0,0,115,18,0,0,0,8,1,8,
+    9,8,8,8,6,8,9,8,4,8,3,8,5,8,3,114,
+    125,0,0,0,99,2,0,0,0,0,0,0,0,2,0,0,
+    0,1,0,0,0,67,0,0,0,115,4,0,0,0,100,0,
+    83,0,41,1,78,114,21,0,0,0,41,2,114,136,0,0,
+    0,114,137,0,0,0,114,21,0,0,0,114,21,0,0,0,
+    114,22,0,0,0,218,8,60,108,97,109,98,100,97,62,198,
+    2,0,0,115,0,0,0,0,114,154,0,0,0,114,130,0,
+    0,0,99,1,0,0,0,0,0,0,0,1,0,0,0,3,
+    0,0,0,67,0,0,0,115,10,0,0,0,116,0,124,0,
+    100,1,131,2,83,0,41,2,78,218,0,41,1,218,7,95,
+    112,117,116,101,110,118,41,1,114,136,0,0,0,114,21,0,
+    0,0,114,21,0,0,0,114,22,0,0,0,114,154,0,0,
+    0,206,2,0,0,115,0,0,0,0,114,131,0,0,0,99,
+    0,0,0,0,0,0,0,0,6,0,0,0,8,0,0,0,
+    3,0,0,0,115,136,0,0,0,116,0,100,1,107,2,114,
+    76,100,2,100,3,132,0,125,0,124,0,137,0,116,1,125,
+    1,135,0,102,1,100,4,100,5,132,8,125,2,105,0,125,
+    3,120,74,116,2,160,3,161,0,68,0,93,20,92,2,125,
+    4,125,5,124,5,124,3,124,2,124,4,131,1,60,0,113,
+    50,87,0,110,40,116,4,160,5,161,0,137,1,135,1,102,
+    1,100,6,100,7,132,8,137,0,135,1,102,1,100,8,100,
+    9,132,8,125,1,136,0,125,2,116,2,125,3,116,6,124,
+    3,124,2,124,1,136,0,124,1,116,7,116,8,131,7,83,
+    0,41,10,78,114,38,0,0,0,99,1,0,0,0,0,0,
+    0,0,1,0,0,0,4,0,0,0,83,0,0,0,115,32,
+    0,0,0,116,0,124,0,116,1,131,2,115,28,116,2,100,
+    1,116,3,124,0,131,1,106,4,22,0,131,1,130,1,124,
+    0,83,0,41,2,78,122,20,115,116,114,32,101,120,112,101,
+    99,116,101,100,44,32,110,111,116,32,37,115,41,5,114,58,
+    0,0,0,114,42,0,0,0,114,120,0,0,0,218,4,116,
+    121,112,101,114,151,0,0,0,41,1,114,137,0,0,0,114,
+    21,0,0,0,114,21,0,0,0,114,22,0,0,0,218,9,
+    99,104,101,99,107,95,115,116,114,214,2,0,0,115,6,0,
+    0,0,0,1,10,1,18,1,122,33,95,99,114,101,97,116,
+    101,101,110,118,105,114,111,110,46,60,108,111,99,97,108,115,
+    62,46,99,104,101,99,107,95,115,116,114,99,1,0,0,0,
+    0,0,0,0,1,0,0,0,2,0,0,0,19,0,0,0,
+    115,12,0,0,0,136,0,124,0,131,1,160,0,161,0,83,
+    0,41,1,78,41,1,218,5,117,112,112,101,114,41,1,114,
+    136,0,0,0,41,1,218,6,101,110,99,111,100,101,114,21,
+    0,0,0,114,22,0,0,0,114,126,0,0,0,220,2,0,
+    0,115,2,0,0,0,0,1,122,33,95,99,114,101,97,116,
+    101,101,110,118,105,114,111,110,46,60,108,111,99,97,108,115,
+    62,46,101,110,99,111,100,101,107,101,121,99,1,0,0,0,
+    0,0,0,0,1,0,0,0,4,0,0,0,19,0,0,0,
+    115,40,0,0,0,116,0,124,0,116,1,131,2,115,28,116,
+    2,100,1,116,3,124,0,131,1,106,4,22,0,131,1,130,
+    1,124,0,160,5,136,0,100,2,161,2,83,0,41,3,78,
+    122,20,115,116,114,32,101,120,112,101,99,116,101,100,44,32,
+    110,111,116,32,37,115,218,15,115,117,114,114,111,103,97,116,
+    101,101,115,99,97,112,101,41,6,114,58,0,0,0,114,42,
+    0,0,0,114,120,0,0,0,114,157,0,0,0,114,151,0,
+    0,0,114,160,0,0,0,41,1,114,137,0,0,0,41,1,
+    218,8,101,110,99,111,100,105,110,103,114,21,0,0,0,114,
+    22,0,0,0,114,160,0,0,0,228,2,0,0,115,6,0,
+    0,0,0,1,10,1,18,1,122,30,95,99,114,101,97,116,
+    101,101,110,118,105,114,111,110,46,60,108,111,99,97,108,115,
+    62,46,101,110,99,111,100,101,99,1,0,0,0,0,0,0,
+    0,1,0,0,0,4,0,0,0,19,0,0,0,115,12,0,
+    0,0,124,0,160,0,136,0,100,1,161,2,83,0,41,2,
+    78,114,161,0,0,0,41,1,218,6,100,101,99,111,100,101,
+    41,1,114,137,0,0,0,41,1,114,162,0,0,0,114,21,
+    0,0,0,114,22,0,0,0,114,163,0,0,0,232,2,0,
+    0,115,2,0,0,0,0,1,122,30,95,99,114,101,97,116,
+    101,101,110,118,105,114,111,110,46,60,108,111,99,97,108,115,
+    62,46,100,101,99,111,100,101,41,9,114,8,0,0,0,114,
+    42,0,0,0,114,108,0,0,0,114,146,0,0,0,114,110,
+    0,0,0,218,21,103,101,116,102,105,108,101,115,121,115,116,
+    101,109,101,110,99,111,100,105,110,103,114,125,0,0,0,114,
+    156,0,0,0,218,9,95,117,110,115,101,116,101,110,118,41,
+    6,114,158,0,0,0,114,163,0,0,0,114,126,0,0,0,
+    114,134,0,0,0,114,136,0,0,0,114,137,0,0,0,114,
+    21,0,0,0,41,2,114,160,0,0,0,114,162,0,0,0,
+    114,22,0,0,0,218,14,95,99,114,101,97,116,101,101,110,
+    118,105,114,111,110,211,2,0,0,115,34,0,0,0,0,1,
+    8,2,8,4,4,1,4,1,12,2,4,1,18,1,18,3,
+    8,1,12,4,12,2,4,1,4,1,4,1,4,1,4,1,
+    114,166,0,0,0,99,2,0,0,0,0,0,0,0,2,0,
+    0,0,4,0,0,0,67,0,0,0,115,12,0,0,0,116,
+    0,160,1,124,0,124,1,161,2,83,0,41,1,122,169,71,
+    101,116,32,97,110,32,101,110,118,105,114,111,110,109,101,110,
+    116,32,118,97,114,105,97,98,108,101,44,32,114,101,116,117,
+    114,110,32,78,111,110,101,32,105,102,32,105,116,32,100,111,
+    101,115,110,39,116,32,101,120,105,115,116,46,10,32,32,32,
+    32,84,104,101,32,111,112,116,105,111,110,97,108,32,115,101,
+    99,111,110,100,32,97,114,103,117,109,101,110,116,32,99,97,
+    110,32,115,112,101,99,105,102,121,32,97,110,32,97,108,116,
+    101,114,110,97,116,101,32,100,101,102,97,117,108,116,46,10,
+    32,32,32,32,107,101,121,44,32,100,101,102,97,117,108,116,
+    32,97,110,100,32,116,104,101,32,114,101,115,117,108,116,32,
+    97,114,101,32,115,116,114,46,41,2,114,108,0,0,0,114,
+    119,0,0,0,41,2,114,136,0,0,0,218,7,100,101,102,
+    97,117,108,116,114,21,0,0,0,114,21,0,0,0,114,22,
+    0,0,0,218,6,103,101,116,101,110,118,246,2,0,0,115,
+    2,0,0,0,0,4,114,168,0,0,0,114,121,0,0,0,
+    99,1,0,0,0,0,0,0,0,1,0,0,0,4,0,0,
+    0,67,0,0,0,115,32,0,0,0,116,0,124,0,116,1,
+    131,2,115,28,116,2,100,1,116,3,124,0,131,1,106,4,
+    22,0,131,1,130,1,124,0,83,0,41,2,78,122,22,98,
+    121,116,101,115,32,101,120,112,101,99,116,101,100,44,32,110,
+    111,116,32,37,115,41,5,114,58,0,0,0,114,59,0,0,
+    0,114,120,0,0,0,114,157,0,0,0,114,151,0,0,0,
+    41,1,114,137,0,0,0,114,21,0,0,0,114,21,0,0,
+    0,114,22,0,0,0,218,12,95,99,104,101,99,107,95,98,
+    121,116,101,115,0,3,0,0,115,6,0,0,0,0,1,10,
+    1,18,1,114,169,0,0,0,99,2,0,0,0,0,0,0,
+    0,2,0,0,0,4,0,0,0,67,0,0,0,115,12,0,
+    0,0,116,0,160,1,124,0,124,1,161,2,83,0,41,1,
+    122,179,71,101,116,32,97,110,32,101,110,118,105,114,111,110,
+    109,101,110,116,32,118,97,114,105,97,98,108,101,44,32,114,
+    101,116,117,114,110,32,78,111,110,101,32,105,102,32,105,116,
+    32,100,111,101,115,110,39,116,32,101,120,105,115,116,46,10,
+    32,32,32,32,32,32,32,32,84,104,101,32,111,112,116,105,
+    111,110,97,108,32,115,101,99,111,110,100,32,97,114,103,117,
+    109,101,110,116,32,99,97,110,32,115,112,101,99,105,102,121,
+    32,97,110,32,97,108,116,101,114,110,97,116,101,32,100,101,
+    102,97,117,108,116,46,10,32,32,32,32,32,32,32,32,107,
+    101,121,44,32,100,101,102,97,117,108,116,32,97,110,100,32,
+    116,104,101,32,114,101,115,117,108,116,32,97,114,101,32,98,
+    121,116,101,115,46,41,2,218,8,101,110,118,105,114,111,110,
+    98,114,119,0,0,0,41,2,114,136,0,0,0,114,167,0,
+    0,0,114,21,0,0,0,114,21,0,0,0,114,22,0,0,
+    0,218,7,103,101,116,101,110,118,98,12,3,0,0,115,2,
+    0,0,0,0,4,114,171,0,0,0,114,170,0,0,0,99,
+    0,0,0,0,0,0,0,0,2,0,0,0,3,0,0,0,
+    3,0,0,0,115,52,0,0,0,116,0,160,1,161,0,137,
+    0,116,0,160,2,161,0,137,1,135,0,135,1,102,2,100,
+    1,100,2,132,8,125,0,135,0,135,1,102,2,100,3,100,
+    4,132,8,125,1,124,0,124,1,102,2,83,0,41,5,78,
+    99,1,0,0,0,0,0,0,0,1,0,0,0,4,0,0,
+    0,19,0,0,0,115,38,0,0,0,116,0,124,0,131,1,
+    125,0,116,1,124,0,116,2,131,2,114,30,124,0,160,3,
+    136,0,136,1,161,2,83,0,124,0,83,0,100,1,83,0,
+    41,2,97,23,1,0,0,69,110,99,111,100,101,32,102,105,
+    108,101,110,97,109,101,32,40,97,110,32,111,115,46,80,97,
+    116,104,76,105,107,101,44,32,98,121,116,101,115,44,32,111,
+    114,32,115,116,114,41,32,116,111,32,116,104,101,32,102,105,
+    108,101,115,121,115,116,101,109,10,32,32,32,32,32,32,32,
+    32,101,110,99,111,100,105,110,103,32,119,105,116,104,32,39,
+    115,117,114,114,111,103,97,116,101,101,115,99,97,112,101,39,
+    32,101,114,114,111,114,32,104,97,110,100,108,101,114,44,32,
+    114,101,116,117,114,110,32,98,121,116,101,115,32,117,110,99,
+    104,97,110,103,101,100,46,10,32,32,32,32,32,32,32,32,
+    79,110,32,87,105,110,100,111,119,115,44,32,117,115,101,32,
+    39,115,116,114,105,99,116,39,32,101,114,114,111,114,32,104,
+    97,110,100,108,101,114,32,105,102,32,116,104,101,32,102,105,
+    108,101,32,115,121,115,116,101,109,32,101,110,99,111,100,105,
+    110,103,32,105,115,10,32,32,32,32,32,32,32,32,39,109,
+    98,99,115,39,32,40,119,104,105,99,104,32,105,115,32,116,
+    104,101,32,100,101,102,97,117,108,116,32,101,110,99,111,100,
+    105,110,103,41,46,10,32,32,32,32,32,32,32,32,78,41,
+    4,114,66,0,0,0,114,58,0,0,0,114,42,0,0,0,
+    114,160,0,0,0,41,1,218,8,102,105,108,101,110,97,109,
+    101,41,2,114,162,0,0,0,218,6,101,114,114,111,114,115,
+    114,21,0,0,0,114,22,0,0,0,114,14,0,0,0,24,
+    3,0,0,115,8,0,0,0,0,6,8,1,10,1,12,2,
+    122,26,95,102,115,99,111,100,101,99,46,60,108,111,99,97,
+    108,115,62,46,102,115,101,110,99,111,100,101,99,1,0,0,
+    0,0,0,0,0,1,0,0,0,4,0,0,0,19,0,0,
+    0,115,38,0,0,0,116,0,124,0,131,1,125,0,116,1,
+    124,0,116,2,131,2,114,30,124,0,160,3,136,0,136,1,
+    161,2,83,0,124,0,83,0,100,1,83,0,41,2,97,23,
+    1,0,0,68,101,99,111,100,101,32,102,105,108,101,110,97,
+    109,101,32,40,97,110,32,111,115,46,80,97,116,104,76,105,
+    107,101,44,32,98,121,116,101,115,44,32,111,114,32,115,116,
+    114,41,32,102,114,111,109,32,116,104,101,32,102,105,108,101,
+    115,121,115,116,101,109,10,32,32,32,32,32,32,32,32,101,
+    110,99,111,100,105,110,103,32,119,105,116,104,32,39,115,117,
+    114,114,111,103,97,116,101,101,115,99,97,112,101,39,32,101,
+    114,114,111,114,32,104,97,110,100,108,101,114,44,32,114,101,
+    116,117,114,110,32,115,116,114,32,117,110,99,104,97,110,103,
+    101,100,46,32,79,110,10,32,32,32,32,32,32,32,32,87,
+    105,110,100,111,119,115,44,32,117,115,101,32,39,115,116,114,
+    105,99,116,39,32,101,114,114,111,114,32,104,97,110,100,108,
+    101,114,32,105,102,32,116,104,101,32,102,105,108,101,32,115,
+    121,115,116,101,109,32,101,110,99,111,100,105,110,103,32,105,
+    115,10,32,32,32,32,32,32,32,32,39,109,98,99,115,39,
+    32,40,119,104,105,99,104,32,105,115,32,116,104,101,32,100,
+    101,102,97,117,108,116,32,101,110,99,111,100,105,110,103,41,
+    46,10,32,32,32,32,32,32,32,32,78,41,4,114,66,0,
+    0,0,114,58,0,0,0,114,59,0,0,0,114,163,0,0,
+    0,41,1,114,172,0,0,0,41,2,114,162,0,0,0,114,
+    173,0,0,0,114,21,0,0,0,114,22,0,0,0,114,15,
+    0,0,0,36,3,0,0,115,8,0,0,0,0,6,8,1,
+    10,1,12,2,122,26,95,102,115,99,111,100,101,99,46,60,
+    108,111,99,97,108,115,62,46,102,115,100,101,99,111,100,101,
+    41,3,114,110,0,0,0,114,164,0,0,0,218,25,103,101,
+    116,102,105,108,101,115,121,115,116,101,109,101,110,99,111,100,
+    101,101,114,114,111,114,115,41,2,114,14,0,0,0,114,15,
+    0,0,0,114,21,0,0,0,41,2,114,162,0,0,0,114,
+    173,0,0,0,114,22,0,0,0,218,8,95,102,115,99,111,
+    100,101,99,20,3,0,0,115,10,0,0,0,0,1,8,1,
+    8,2,14,12,14,12,114,175,0,0,0,218,4,102,111,114,
+    107,218,6,115,112,97,119,110,118,114,96,0,0,0,218,6,
+    80,95,87,65,73,84,218,8,80,95,78,79,87,65,73,84,
+    218,9,80,95,78,79,87,65,73,84,79,99,5,0,0,0,
+    0,0,0,0,8,0,0,0,10,0,0,0,67,0,0,0,
+    115,206,0,0,0,116,0,124,2,116,1,116,2,102,2,131,
+    2,115,22,116,3,100,1,131,1,130,1,124,2,12,0,115,
+    38,124,2,100,2,25,0,12,0,114,46,116,4,100,3,131,
+    1,130,1,116,5,131,0,125,5,124,5,115,116,121,36,124,
+    3,100,0,107,8,114,78,124,4,124,1,124,2,131,2,1,
+    0,110,12,124,4,124,1,124,2,124,3,131,3,1,0,87,
+    0,113,202,1,0,1,0,1,0,116,6,100,4,131,1,1,
+    0,89,0,113,202,88,0,110,86,124,0,116,7,107,2,114,
+    128,124,5,83,0,120,72,116,8,124,5,100,2,131,2,92,
+    2,125,6,125,7,116,9,124,7,131,1,114,156,113,130,113,
+    130,116,10,124,7,131,1,114,174,116,11,124,7,131,1,11,
+    0,83,0,116,12,124,7,131,1,114,190,116,13,124,7,131,
+    1,83,0,116,14,100,5,131,1,130,1,113,130,87,0,100,
+    0,83,0,41,6,78,122,30,97,114,103,118,32,109,117,115,
+    116,32,98,101,32,97,32,116,117,112,108,101,32,111,114,32,
+    97,32,108,105,115,116,114,0,0,0,0,122,34,97,114,103,
+    118,32,102,105,114,115,116,32,101,108,101,109,101,110,116,32,
+    99,97,110,110,111,116,32,98,101,32,101,109,112,116,121,233,
+    127,0,0,0,122,34,78,111,116,32,115,116,111,112,112,101,
+    100,44,32,115,105,103,110,97,108,101,100,32,111,114,32,101,
+    120,105,116,101,100,63,63,63,41,15,114,58,0,0,0,218,
+    5,116,117,112,108,101,114,28,0,0,0,114,120,0,0,0,
+    114,123,0,0,0,114,176,0,0,0,114,36,0,0,0,114,
+    179,0,0,0,90,7,119,97,105,116,112,105,100,90,10,87,
+    73,70,83,84,79,80,80,69,68,90,11,87,73,70,83,73,
+    71,78,65,76,69,68,90,8,87,84,69,82,77,83,73,71,
+    90,9,87,73,70,69,88,73,84,69,68,90,11,87,69,88,
+    73,84,83,84,65,84,85,83,114,60,0,0,0,41,8,114,
+    61,0,0,0,114,97,0,0,0,114,98,0,0,0,114,101,
+    0,0,0,90,4,102,117,110,99,90,3,112,105,100,90,4,
+    119,112,105,100,90,3,115,116,115,114,21,0,0,0,114,21,
+    0,0,0,114,22,0,0,0,218,9,95,115,112,97,119,110,
+    118,101,102,65,3,0,0,115,46,0,0,0,0,2,14,1,
+    8,1,16,1,8,1,6,1,4,2,2,1,8,1,12,2,
+    16,1,6,1,16,3,8,1,4,1,2,1,14,1,8,1,
+    4,1,8,1,10,1,8,1,8,2,114,183,0,0,0,99,
+    3,0,0,0,0,0,0,0,3,0,0,0,6,0,0,0,
+    67,0,0,0,115,16,0,0,0,116,0,124,0,124,1,124,
+    2,100,1,116,1,131,5,83,0,41,2,97,21,1,0,0,
+    115,112,97,119,110,118,40,109,111,100,101,44,32,102,105,108,
+    101,44,32,97,114,103,115,41,32,45,62,32,105,110,116,101,
+    103,101,114,10,10,69,120,101,99,117,116,101,32,102,105,108,
+    101,32,119,105,116,104,32,97,114,103,117,109,101,110,116,115,
+    32,102,114,111,109,32,97,114,103,115,32,105,110,32,97,32,
+    115,117,98,112,114,111,99,101,115,115,46,10,73,102,32,109,
+    111,100,101,32,61,61,32,80,95,78,79,87,65,73,84,32,
+    114,101,116,117,114,110,32,116,104,101,32,112,105,100,32,111,
+    102,32,116,104,101,32,112,114,111,99,101,115,115,46,10,73,
+    102,32,109,111,100,101,32,61,61,32,80,95,87,65,73,84,
+    32,114,101,116,117,114,110,32,116,104,101,32,112,114,111,99,
+    101,115,115,39,115,32,101,120,105,116,32,99,111,100,101,32,
+    105,102,32,105,116,32,101,120,105,116,115,32,110,111,114,109,
+    97,108,108,121,59,10,111,116,104,101,114,119,105,115,101,32,
+    114,101,116,117,114,110,32,45,83,73,71,44,32,119,104,101,
+    114,101,32,83,73,71,32,105,115,32,116,104,101,32,115,105,
+    103,110,97,108,32,116,104,97,116,32,107,105,108,108,101,100,
+    32,105,116,46,32,78,41,2,114,183,0,0,0,114,96,0,
+    0,0,41,3,114,61,0,0,0,114,97,0,0,0,114,98,
+    0,0,0,114,21,0,0,0,114,21,0,0,0,114,22,0,
+    0,0,114,177,0,0,0,96,3,0,0,115,2,0,0,0,
+    0,7,99,4,0,0,0,0,0,0,0,4,0,0,0,6,
+    0,0,0,67,0,0,0,115,16,0,0,0,116,0,124,0,
+    124,1,124,2,124,3,116,1,131,5,83,0,41,1,97,58,
+    1,0,0,115,112,97,119,110,118,101,40,109,111,100,101,44,
+    32,102,105,108,101,44,32,97,114,103,115,44,32,101,110,118,
+    41,32,45,62,32,105,110,116,101,103,101,114,10,10,69,120,
+    101,99,117,116,101,32,102,105,108,101,32,119,105,116,104,32,
+    97,114,103,117,109,101,110,116,115,32,102,114,111,109,32,97,
+    114,103,115,32,105,110,32,97,32,115,117,98,112,114,111,99,
+    101,115,115,32,119,105,116,104,32,116,104,101,10,115,112,101,
+    99,105,102,105,101,100,32,101,110,118,105,114,111,110,109,101,
+    110,116,46,10,73,102,32,109,111,100,101,32,61,61,32,80,
+    95,78,79,87,65,73,84,32,114,101,116,117,114,110,32,116,
+    104,101,32,112,105,100,32,111,102,32,116,104,101,32,112,114,
+    111,99,101,115,115,46,10,73,102,32,109,111,100,101,32,61,
+    61,32,80,95,87,65,73,84,32,114,101,116,117,114,110,32,
+    116,104,101,32,112,114,111,99,101,115,115,39,115,32,101,120,
+    105,116,32,99,111,100,101,32,105,102,32,105,116,32,101,120,
+    105,116,115,32,110,111,114,109,97,108,108,121,59,10,111,116,
+    104,101,114,119,105,115,101,32,114,101,116,117,114,110,32,45,
+    83,73,71,44,32,119,104,101,114,101,32,83,73,71,32,105,
+    115,32,116,104,101,32,115,105,103,110,97,108,32,116,104,97,
+    116,32,107,105,108,108,101,100,32,105,116,46,32,41,2,114,
+    183,0,0,0,114,50,0,0,0,41,4,114,61,0,0,0,
+    114,97,0,0,0,114,98,0,0,0,114,101,0,0,0,114,
+    21,0,0,0,114,21,0,0,0,114,22,0,0,0,218,7,
+    115,112,97,119,110,118,101,105,3,0,0,115,2,0,0,0,
+    0,8,114,184,0,0,0,99,3,0,0,0,0,0,0,0,
+    3,0,0,0,6,0,0,0,67,0,0,0,115,16,0,0,
+    0,116,0,124,0,124,1,124,2,100,1,116,1,131,5,83,
+    0,41,2,97,56,1,0,0,115,112,97,119,110,118,112,40,
+    109,111,100,101,44,32,102,105,108,101,44,32,97,114,103,115,
+    41,32,45,62,32,105,110,116,101,103,101,114,10,10,69,120,
+    101,99,117,116,101,32,102,105,108,101,32,40,119,104,105,99,
+    104,32,105,115,32,108,111,111,107,101,100,32,102,111,114,32,
+    97,108,111,110,103,32,36,80,65,84,72,41,32,119,105,116,
+    104,32,97,114,103,117,109,101,110,116,115,32,102,114,111,109,
+    10,97,114,103,115,32,105,110,32,97,32,115,117,98,112,114,
+    111,99,101,115,115,46,10,73,102,32,109,111,100,101,32,61,
+    61,32,80,95,78,79,87,65,73,84,32,114,101,116,117,114,
+    110,32,116,104,101,32,112,105,100,32,111,102,32,116,104,101,
+    32,112,114,111,99,101,115,115,46,10,73,102,32,109,111,100,
+    101,32,61,61,32,80,95,87,65,73,84,32,114,101,116,117,
+    114,110,32,116,104,101,32,112,114,111,99,101,115,115,39,115,
+    32,101,120,105,116,32,99,111,100,101,32,105,102,32,105,116,
+    32,101,120,105,116,115,32,110,111,114,109,97,108,108,121,59,
+    10,111,116,104,101,114,119,105,115,101,32,114,101,116,117,114,
+    110,32,45,83,73,71,44,32,119,104,101,114,101,32,83,73,
+    71,32,105,115,32,116,104,101,32,115,105,103,110,97,108,32,
+    116,104,97,116,32,107,105,108,108,101,100,32,105,116,46,32,
+    78,41,2,114,183,0,0,0,114,103,0,0,0,41,3,114,
+    61,0,0,0,114,97,0,0,0,114,98,0,0,0,114,21,
+    0,0,0,114,21,0,0,0,114,22,0,0,0,218,7,115,
+    112,97,119,110,118,112,117,3,0,0,115,2,0,0,0,0,
+    8,114,185,0,0,0,99,4,0,0,0,0,0,0,0,4,
+    0,0,0,6,0,0,0,67,0,0,0,115,16,0,0,0,
+    116,0,124,0,124,1,124,2,124,3,116,1,131,5,83,0,
+    41,1,97,92,1,0,0,115,112,97,119,110,118,112,101,40,
+    109,111,100,101,44,32,102,105,108,101,44,32,97,114,103,115,
+    44,32,101,110,118,41,32,45,62,32,105,110,116,101,103,101,
+    114,10,10,69,120,101,99,117,116,101,32,102,105,108,101,32,
+    40,119,104,105,99,104,32,105,115,32,108,111,111,107,101,100,
+    32,102,111,114,32,97,108,111,110,103,32,36,80,65,84,72,
+    41,32,119,105,116,104,32,97,114,103,117,109,101,110,116,115,
+    32,102,114,111,109,10,97,114,103,115,32,105,110,32,97,32,
+    115,117,98,112,114,111,99,101,115,115,32,119,105,116,104,32,
+    116,104,101,32,115,117,112,112,108,105,101,100,32,101,110,118,
+    105,114,111,110,109,101,110,116,46,10,73,102,32,109,111,100,
+    101,32,61,61,32,80,95,78,79,87,65,73,84,32,114,101,
+    116,117,114,110,32,116,104,101,32,112,105,100,32,111,102,32,
+    116,104,101,32,112,114,111,99,101,115,115,46,10,73,102,32,
+    109,111,100,101,32,61,61,32,80,95,87,65,73,84,32,114,
+    101,116,117,114,110,32,116,104,101,32,112,114,111,99,101,115,
+    115,39,115,32,101,120,105,116,32,99,111,100,101,32,105,102,
+    32,105,116,32,101,120,105,116,115,32,110,111,114,109,97,108,
+    108,121,59,10,111,116,104,101,114,119,105,115,101,32,114,101,
+    116,117,114,110,32,45,83,73,71,44,32,119,104,101,114,101,
+    32,83,73,71,32,105,115,32,116,104,101,32,115,105,103,110,
+    97,108,32,116,104,97,116,32,107,105,108,108,101,100,32,105,
+    116,46,32,41,2,114,183,0,0,0,114,105,0,0,0,41,
+    4,114,61,0,0,0,114,97,0,0,0,114,98,0,0,0,
+    114,101,0,0,0,114,21,0,0,0,114,21,0,0,0,114,
+    22,0,0,0,218,8,115,112,97,119,110,118,112,101,127,3,
+    0,0,115,2,0,0,0,0,8,114,186,0,0,0,99,2,
+    0,0,0,0,0,0,0,3,0,0,0,4,0,0,0,71,
+    0,0,0,115,12,0,0,0,116,0,124,0,124,1,124,2,
+    131,3,83,0,41,1,97,22,1,0,0,115,112,97,119,110,
+    108,40,109,111,100,101,44,32,102,105,108,101,44,32,42,97,
+    114,103,115,41,32,45,62,32,105,110,116,101,103,101,114,10,
+    10,69,120,101,99,117,116,101,32,102,105,108,101,32,119,105,
+    116,104,32,97,114,103,117,109,101,110,116,115,32,102,114,111,
+    109,32,97,114,103,115,32,105,110,32,97,32,115,117,98,112,
+    114,111,99,101,115,115,46,10,73,102,32,109,111,100,101,32,
+    61,61,32,80,95,78,79,87,65,73,84,32,114,101,116,117,
+    114,110,32,116,104,101,32,112,105,100,32,111,102,32,116,104,
+    101,32,112,114,111,99,101,115,115,46,10,73,102,32,109,111,
+    100,101,32,61,61,32,80,95,87,65,73,84,32,114,101,116,
+    117,114,110,32,116,104,101,32,112,114,111,99,101,115,115,39,
+    115,32,101,120,105,116,32,99,111,100,101,32,105,102,32,105,
+    116,32,101,120,105,116,115,32,110,111,114,109,97,108,108,121,
+    59,10,111,116,104,101,114,119,105,115,101,32,114,101,116,117,
+    114,110,32,45,83,73,71,44,32,119,104,101,114,101,32,83,
+    73,71,32,105,115,32,116,104,101,32,115,105,103,110,97,108,
+    32,116,104,97,116,32,107,105,108,108,101,100,32,105,116,46,
+    32,41,1,114,177,0,0,0,41,3,114,61,0,0,0,114,
+    97,0,0,0,114,98,0,0,0,114,21,0,0,0,114,21,
+    0,0,0,114,22,0,0,0,218,6,115,112,97,119,110,108,
+    145,3,0,0,115,2,0,0,0,0,7,114,187,0,0,0,
+    99,2,0,0,0,0,0,0,0,4,0,0,0,6,0,0,
+    0,71,0,0,0,115,30,0,0,0,124,2,100,3,25,0,
+    125,3,116,0,124,0,124,1,124,2,100,2,100,4,133,2,
+    25,0,124,3,131,4,83,0,41,5,97,58,1,0,0,115,
+    112,97,119,110,108,101,40,109,111,100,101,44,32,102,105,108,
+    101,44,32,42,97,114,103,115,44,32,101,110,118,41,32,45,
+    62,32,105,110,116,101,103,101,114,10,10,69,120,101,99,117,
+    116,101,32,102,105,108,101,32,119,105,116,104,32,97,114,103,
+    117,109,101,110,116,115,32,102,114,111,109,32,97,114,103,115,
+    32,105,110,32,97,32,115,117,98,112,114,111,99,101,115,115,
+    32,119,105,116,104,32,116,104,101,10,115,117,112,112,108,105,
+    101,100,32,101,110,118,105,114,111,110,109,101,110,116,46,10,
+    73,102,32,109,111,100,101,32,61,61,32,80,95,78,79,87,
+    65,73,84,32,114,101,116,117,114,110,32,116,104,101,32,112,
+    105,100,32,111,102,32,116,104,101,32,112,114,111,99,101,115,
+    115,46,10,73,102,32,109,111,100,101,32,61,61,32,80,95,
+    87,65,73,84,32,114,101,116,117,114,110,32,116,104,101,32,
+    112,114,111,99,101,115,115,39,115,32,101,120,105,116,32,99,
+    111,100,101,32,105,102,32,105,116,32,101,120,105,116,115,32,
+    110,111,114,109,97,108,108,121,59,10,111,116,104,101,114,119,
+    105,115,101,32,114,101,116,117,114,110,32,45,83,73,71,44,
+    32,119,104,101,114,101,32,83,73,71,32,105,115,32,116,104,
+    101,32,115,105,103,110,97,108,32,116,104,97,116,32,107,105,
+    108,108,101,100,32,105,116,46,32,114,51,0,0,0,78,114,
+    100,0,0,0,114,100,0,0,0,41,1,114,184,0,0,0,
+    41,4,114,61,0,0,0,114,97,0,0,0,114,98,0,0,
+    0,114,101,0,0,0,114,21,0,0,0,114,21,0,0,0,
+    114,22,0,0,0,218,7,115,112,97,119,110,108,101,154,3,
+    0,0,115,4,0,0,0,0,8,8,1,114,188,0,0,0,
+    99,2,0,0,0,0,0,0,0,3,0,0,0,4,0,0,
+    0,71,0,0,0,115,12,0,0,0,116,0,124,0,124,1,
+    124,2,131,3,83,0,41,1,97,87,1,0,0,115,112,97,
+    119,110,108,112,40,109,111,100,101,44,32,102,105,108,101,44,
+    32,42,97,114,103,115,41,32,45,62,32,105,110,116,101,103,
+    101,114,10,10,69,120,101,99,117,116,101,32,102,105,108,101,
+    32,40,119,104,105,99,104,32,105,115,32,108,111,111,107,101,
+    100,32,102,111,114,32,97,108,111,110,103,32,36,80,65,84,
+    72,41,32,119,105,116,104,32,97,114,103,117,109,101,110,116,
+    115,32,102,114,111,109,10,97,114,103,115,32,105,110,32,97,
+    32,115,117,98,112,114,111,99,101,115,115,32,119,105,116,104,
+    32,116,104,101,32,115,117,112,112,108,105,101,100,32,101,110,
+    118,105,114,111,110,109,101,110,116,46,10,73,102,32,109,111,
+    100,101,32,61,61,32,80,95,78,79,87,65,73,84,32,114,
+    101,116,117,114,110,32,116,104,101,32,112,105,100,32,111,102,
+    32,116,104,101,32,112,114,111,99,101,115,115,46,10,73,102,
+    32,109,111,100,101,32,61,61,32,80,95,87,65,73,84,32,
+    114,101,116,117,114,110,32,116,104,101,32,112,114,111,99,101,
+    115,115,39,115,32,101,120,105,116,32,99,111,100,101,32,105,
+    102,32,105,116,32,101,120,105,116,115,32,110,111,114,109,97,
+    108,108,121,59,10,111,116,104,101,114,119,105,115,101,32,114,
+    101,116,117,114,110,32,45,83,73,71,44,32,119,104,101,114,
+    101,32,83,73,71,32,105,115,32,116,104,101,32,115,105,103,
+    110,97,108,32,116,104,97,116,32,107,105,108,108,101,100,32,
+    105,116,46,32,41,1,114,185,0,0,0,41,3,114,61,0,
+    0,0,114,97,0,0,0,114,98,0,0,0,114,21,0,0,
+    0,114,21,0,0,0,114,22,0,0,0,218,7,115,112,97,
+    119,110,108,112,172,3,0,0,115,2,0,0,0,0,8,114,
+    189,0,0,0,99,2,0,0,0,0,0,0,0,4,0,0,
+    0,6,0,0,0,71,0,0,0,115,30,0,0,0,124,2,
+    100,3,25,0,125,3,116,0,124,0,124,1,124,2,100,2,
+    100,4,133,2,25,0,124,3,131,4,83,0,41,5,97,93,
+    1,0,0,115,112,97,119,110,108,112,101,40,109,111,100,101,
+    44,32,102,105,108,101,44,32,42,97,114,103,115,44,32,101,
+    110,118,41,32,45,62,32,105,110,116,101,103,101,114,10,10,
+    69,120,101,99,117,116,101,32,102,105,108,101,32,40,119,104,
+    105,99,104,32,105,115,32,108,111,111,107,101,100,32,102,111,
+    114,32,97,108,111,110,103,32,36,80,65,84,72,41,32,119,
+    105,116,104,32,97,114,103,117,109,101,110,116,115,32,102,114,
+    111,109,10,97,114,103,115,32,105,110,32,97,32,115,117,98,
+    112,114,111,99,101,115,115,32,119,105,116,104,32,116,104,101,
+    32,115,117,112,112,108,105,101,100,32,101,110,118,105,114,111,
+    110,109,101,110,116,46,10,73,102,32,109,111,100,101,32,61,
+    61,32,80,95,78,79,87,65,73,84,32,114,101,116,117,114,
+    110,32,116,104,101,32,112,105,100,32,111,102,32,116,104,101,
+    32,112,114,111,99,101,115,115,46,10,73,102,32,109,111,100,
+    101,32,61,61,32,80,95,87,65,73,84,32,114,101,116,117,
+    114,110,32,116,104,101,32,112,114,111,99,101,115,115,39,115,
+    32,101,120,105,116,32,99,111,100,101,32,105,102,32,105,116,
+    32,101,120,105,116,115,32,110,111,114,109,97,108,108,121,59,
+    10,111,116,104,101,114,119,105,115,101,32,114,101,116,117,114,
+    110,32,45,83,73,71,44,32,119,104,101,114,101,32,83,73,
+    71,32,105,115,32,116,104,101,32,115,105,103,110,97,108,32,
+    116,104,97,116,32,107,105,108,108,101,100,32,105,116,46,32,
+    114,51,0,0,0,78,114,100,0,0,0,114,100,0,0,0,
+    41,1,114,186,0,0,0,41,4,114,61,0,0,0,114,97,
+    0,0,0,114,98,0,0,0,114,101,0,0,0,114,21,0,
+    0,0,114,21,0,0,0,114,22,0,0,0,218,8,115,112,
+    97,119,110,108,112,101,182,3,0,0,115,4,0,0,0,0,
+    8,8,1,114,190,0,0,0,218,1,114,99,3,0,0,0,
+    0,0,0,0,6,0,0,0,6,0,0,0,67,0,0,0,
+    115,174,0,0,0,116,0,124,0,116,1,131,2,115,26,116,
+    2,100,1,116,3,124,0,131,1,22,0,131,1,130,1,124,
+    1,100,10,107,7,114,46,116,4,100,4,124,1,22,0,131,
+    1,130,1,124,2,100,5,107,2,115,62,124,2,100,0,107,
+    8,114,70,116,4,100,6,131,1,130,1,100,5,100,0,108,
+    5,125,3,100,5,100,0,108,6,125,4,124,1,100,2,107,
+    2,114,132,124,3,106,7,124,0,100,7,124,3,106,8,124,
+    2,100,8,141,4,125,5,116,9,124,4,160,10,124,5,106,
+    11,161,1,124,5,131,2,83,0,124,3,106,7,124,0,100,
+    7,124,3,106,8,124,2,100,9,141,4,125,5,116,9,124,
+    4,160,10,124,5,106,12,161,1,124,5,131,2,83,0,100,
+    0,83,0,41,11,78,122,38,105,110,118,97,108,105,100,32,
+    99,109,100,32,116,121,112,101,32,40,37,115,44,32,101,120,
+    112,101,99,116,101,100,32,115,116,114,105,110,103,41,114,191,
+    0,0,0,218,1,119,122,15,105,110,118,97,108,105,100,32,
+    109,111,100,101,32,37,114,114,0,0,0,0,122,43,112,111,
+    112,101,110,40,41,32,100,111,101,115,32,110,111,116,32,115,
+    117,112,112,111,114,116,32,117,110,98,117,102,102,101,114,101,
+    100,32,115,116,114,101,97,109,115,84,41,3,218,5,115,104,
+    101,108,108,218,6,115,116,100,111,117,116,218,7,98,117,102,
+    115,105,122,101,41,3,114,193,0,0,0,218,5,115,116,100,
+    105,110,114,195,0,0,0,41,2,114,191,0,0,0,114,192,
+    0,0,0,41,13,114,58,0,0,0,114,42,0,0,0,114,
+    120,0,0,0,114,157,0,0,0,114,123,0,0,0,218,10,
+    115,117,98,112,114,111,99,101,115,115,218,2,105,111,90,5,
+    80,111,112,101,110,90,4,80,73,80,69,218,11,95,119,114,
+    97,112,95,99,108,111,115,101,90,13,84,101,120,116,73,79,
+    87,114,97,112,112,101,114,114,194,0,0,0,114,196,0,0,
+    0,41,6,90,3,99,109,100,114,61,0,0,0,90,9,98,
+    117,102,102,101,114,105,110,103,114,197,0,0,0,114,198,0,
+    0,0,218,4,112,114,111,99,114,21,0,0,0,114,21,0,
+    0,0,114,22,0,0,0,114,18,0,0,0,198,3,0,0,
+    115,36,0,0,0,0,1,10,1,16,1,8,1,12,1,16,
+    1,8,1,16,1,8,1,6,1,2,1,4,1,8,1,18,
+    2,6,1,2,1,4,1,8,1,99,0,0,0,0,0,0,
+    0,0,0,0,0,0,2,0,0,0,64,0,0,0,115,60,
+    0,0,0,101,0,90,1,100,0,90,2,100,1,100,2,132,
+    0,90,3,100,3,100,4,132,0,90,4,100,5,100,6,132,
+    0,90,5,100,7,100,8,132,0,90,6,100,9,100,10,132,
+    0,90,7,100,11,100,12,132,0,90,8,100,13,83,0,41,
+    14,114,199,0,0,0,99,3,0,0,0,0,0,0,0,3,
+    0,0,0,2,0,0,0,67,0,0,0,115,16,0,0,0,
+    124,1,124,0,95,0,124,2,124,0,95,1,100,0,83,0,
+    41,1,78,41,2,218,7,95,115,116,114,101,97,109,218,5,
+    95,112,114,111,99,41,3,114,133,0,0,0,90,6,115,116,
+    114,101,97,109,114,200,0,0,0,114,21,0,0,0,114,21,
+    0,0,0,114,22,0,0,0,114,135,0,0,0,221,3,0,
+    0,115,4,0,0,0,0,1,6,1,122,20,95,119,114,97,
+    112,95,99,108,111,115,101,46,95,95,105,110,105,116,95,95,
+    99,1,0,0,0,0,0,0,0,2,0,0,0,2,0,0,
+    0,67,0,0,0,115,56,0,0,0,124,0,106,0,160,1,
+    161,0,1,0,124,0,106,2,160,3,161,0,125,1,124,1,
+    100,1,107,2,114,32,100,0,83,0,116,4,100,2,107,2,
+    114,44,124,1,83,0,124,1,100,3,62,0,83,0,100,0,
+    83,0,41,4,78,114,0,0,0,0,114,38,0,0,0,233,
+    8,0,0,0,41,5,114,201,0,0,0,114,92,0,0,0,
+    114,202,0,0,0,90,4,119,97,105,116,114,8,0,0,0,
+    41,2,114,133,0,0,0,90,10,114,101,116,117,114,110,99,
+    111,100,101,114,21,0,0,0,114,21,0,0,0,114,22,0,
+    0,0,114,92,0,0,0,224,3,0,0,115,14,0,0,0,
+    0,1,10,1,10,1,8,1,4,1,8,1,4,2,122,17,
+    95,119,114,97,112,95,99,108,111,115,101,46,99,108,111,115,
+    101,99,1,0,0,0,0,0,0,0,1,0,0,0,1,0,
+    0,0,67,0,0,0,115,4,0,0,0,124,0,83,0,41,
+    1,78,114,21,0,0,0,41,1,114,133,0,0,0,114,21,
+    0,0,0,114,21,0,0,0,114,22,0,0,0,218,9,95,
+    95,101,110,116,101,114,95,95,233,3,0,0,115,2,0,0,
+    0,0,1,122,21,95,119,114,97,112,95,99,108,111,115,101,
+    46,95,95,101,110,116,101,114,95,95,99,1,0,0,0,0,
+    0,0,0,2,0,0,0,2,0,0,0,71,0,0,0,115,
+    12,0,0,0,124,0,160,0,161,0,1,0,100,0,83,0,
+    41,1,78,41,1,114,92,0,0,0,41,2,114,133,0,0,
+    0,114,98,0,0,0,114,21,0,0,0,114,21,0,0,0,
+    114,22,0,0,0,218,8,95,95,101,120,105,116,95,95,235,
+    3,0,0,115,2,0,0,0,0,1,122,20,95,119,114,97,
+    112,95,99,108,111,115,101,46,95,95,101,120,105,116,95,95,
+    99,2,0,0,0,0,0,0,0,2,0,0,0,3,0,0,
+    0,67,0,0,0,115,12,0,0,0,116,0,124,0,106,1,
+    124,1,131,2,83,0,41,1,78,41,2,218,7,103,101,116,
+    97,116,116,114,114,201,0,0,0,41,2,114,133,0,0,0,
+    114,8,0,0,0,114,21,0,0,0,114,21,0,0,0,114,
+    22,0,0,0,218,11,95,95,103,101,116,97,116,116,114,95,
+    95,237,3,0,0,115,2,0,0,0,0,1,122,23,95,119,
+    114,97,112,95,99,108,111,115,101,46,95,95,103,101,116,97,
+    116,116,114,95,95,99,1,0,0,0,0,0,0,0,1,0,
+    0,0,2,0,0,0,67,0,0,0,115,10,0,0,0,116,
+    0,124,0,106,1,131,1,83,0,41,1,78,41,2,218,4,
+    105,116,101,114,114,201,0,0,0,41,1,114,133,0,0,0,
+    114,21,0,0,0,114,21,0,0,0,114,22,0,0,0,114,
+    141,0,0,0,239,3,0,0,115,2,0,0,0,0,1,122,
+    20,95,119,114,97,112,95,99,108,111,115,101,46,95,95,105,
+    116,101,114,95,95,78,41,9,114,151,0,0,0,114,152,0,
+    0,0,114,153,0,0,0,114,135,0,0,0,114,92,0,0,
+    0,114,204,0,0,0,114,205,0,0,0,114,207,0,0,0,
+    114,141,0,0,0,114,21,0,0,0,114,21,0,0,0,114,
+    21,0,0,0,114,22,0,0,0,114,199,0,0,0,220,3,
+    0,0,115,12,0,0,0,8,1,8,3,8,9,8,2,8,
+    2,8,2,114,199,0,0,0,99,1,0,0,0,0,0,0,
+    0,4,0,0,0,4,0,0,0,79,0,0,0,115,52,0,
+    0,0,116,0,124,0,116,1,131,2,115,26,116,2,100,1,
+    116,3,124,0,131,1,22,0,131,1,130,1,100,2,100,0,
+    108,4,125,3,124,3,106,5,124,0,102,1,124,1,158,2,
+    124,2,142,1,83,0,41,3,78,122,38,105,110,118,97,108,
+    105,100,32,102,100,32,116,121,112,101,32,40,37,115,44,32,
+    101,120,112,101,99,116,101,100,32,105,110,116,101,103,101,114,
+    41,114,0,0,0,0,41,6,114,58,0,0,0,114,84,0,
+    0,0,114,120,0,0,0,114,157,0,0,0,114,198,0,0,
+    0,114,46,0,0,0,41,4,90,2,102,100,114,98,0,0,
+    0,90,6,107,119,97,114,103,115,114,198,0,0,0,114,21,
+    0,0,0,114,21,0,0,0,114,22,0,0,0,114,17,0,
+    0,0,243,3,0,0,115,8,0,0,0,0,1,10,1,16,
+    1,8,1,99,1,0,0,0,0,0,0,0,3,0,0,0,
+    14,0,0,0,67,0,0,0,115,136,0,0,0,116,0,124,
+    0,116,1,116,2,102,2,131,2,114,18,124,0,83,0,116,
+    3,124,0,131,1,125,1,121,14,124,1,160,4,124,0,161,
+    1,125,2,87,0,110,48,4,0,116,5,107,10,114,88,1,
+    0,1,0,1,0,116,6,124,1,100,1,131,2,114,70,130,
+    0,110,14,116,7,100,2,124,1,106,8,23,0,131,1,130,
+    1,89,0,110,2,88,0,116,0,124,2,116,1,116,2,102,
+    2,131,2,114,108,124,2,83,0,116,7,100,3,160,9,124,
+    1,106,8,116,3,124,2,131,1,106,8,161,2,131,1,130,
+    1,100,4,83,0,41,5,97,97,1,0,0,82,101,116,117,
+    114,110,32,116,104,101,32,112,97,116,104,32,114,101,112,114,
+    101,115,101,110,116,97,116,105,111,110,32,111,102,32,97,32,
+    112,97,116,104,45,108,105,107,101,32,111,98,106,101,99,116,
+    46,10,10,32,32,32,32,73,102,32,115,116,114,32,111,114,
+    32,98,121,116,101,115,32,105,115,32,112,97,115,115,101,100,
+    32,105,110,44,32,105,116,32,105,115,32,114,101,116,117,114,
+    110,101,100,32,117,110,99,104,97,110,103,101,100,46,32,79,
+    116,104,101,114,119,105,115,101,32,116,104,101,10,32,32,32,
+    32,111,115,46,80,97,116,104,76,105,107,101,32,105,110,116,
+    101,114,102,97,99,101,32,105,115,32,117,115,101,100,32,116,
+    111,32,103,101,116,32,116,104,101,32,112,97,116,104,32,114,
+    101,112,114,101,115,101,110,116,97,116,105,111,110,46,32,73,
+    102,32,116,104,101,10,32,32,32,32,112,97,116,104,32,114,
+    101,112,114,101,115,101,110,116,97,116,105,111,110,32,105,115,
+    32,110,111,116,32,115,116,114,32,111,114,32,98,121,116,101,
+    115,44,32,84,121,112,101,69,114,114,111,114,32,105,115,32,
+    114,97,105,115,101,100,46,32,73,102,32,116,104,101,10,32,
+    32,32,32,112,114,111,118,105,100,101,100,32,112,97,116,104,
+    32,105,115,32,110,111,116,32,115,116,114,44,32,98,121,116,
+    101,115,44,32,111,114,32,111,115,46,80,97,116,104,76,105,
+    107,101,44,32,84,121,112,101,69,114,114,111,114,32,105,115,
+    32,114,97,105,115,101,100,46,10,32,32,32,32,218,10,95,
+    95,102,115,112,97,116,104,95,95,122,47,101,120,112,101,99,
+    116,101,100,32,115,116,114,44,32,98,121,116,101,115,32,111,
+    114,32,111,115,46,80,97,116,104,76,105,107,101,32,111,98,
+    106,101,99,116,44,32,110,111,116,32,122,55,101,120,112,101,
+    99,116,101,100,32,123,125,46,95,95,102,115,112,97,116,104,
+    95,95,40,41,32,116,111,32,114,101,116,117,114,110,32,115,
+    116,114,32,111,114,32,98,121,116,101,115,44,32,110,111,116,
+    32,123,125,78,41,10,114,58,0,0,0,114,42,0,0,0,
+    114,59,0,0,0,114,157,0,0,0,114,209,0,0,0,114,
+    30,0,0,0,114,85,0,0,0,114,120,0,0,0,114,151,
+    0,0,0,114,144,0,0,0,41,3,114,9,0,0,0,90,
+    9,112,97,116,104,95,116,121,112,101,90,9,112,97,116,104,
+    95,114,101,112,114,114,21,0,0,0,114,21,0,0,0,114,
+    22,0,0,0,218,7,95,102,115,112,97,116,104,252,3,0,
+    0,115,30,0,0,0,0,8,14,1,4,4,8,1,2,1,
+    14,1,14,1,10,1,4,2,4,1,16,1,14,1,4,2,
+    6,1,4,1,114,210,0,0,0,114,66,0,0,0,99,0,
+    0,0,0,0,0,0,0,0,0,0,0,3,0,0,0,64,
+    0,0,0,115,42,0,0,0,101,0,90,1,100,0,90,2,
+    100,1,90,3,101,4,106,5,100,2,100,3,132,0,131,1,
+    90,6,101,7,100,4,100,5,132,0,131,1,90,8,100,6,
+    83,0,41,7,218,8,80,97,116,104,76,105,107,101,122,67,
+    65,98,115,116,114,97,99,116,32,98,97,115,101,32,99,108,
+    97,115,115,32,102,111,114,32,105,109,112,108,101,109,101,110,
+    116,105,110,103,32,116,104,101,32,102,105,108,101,32,115,121,
+    115,116,101,109,32,112,97,116,104,32,112,114,111,116,111,99,
+    111,108,46,99,1,0,0,0,0,0,0,0,1,0,0,0,
+    1,0,0,0,67,0,0,0,115,8,0,0,0,116,0,130,
+    1,100,1,83,0,41,2,122,57,82,101,116,117,114,110,32,
+    116,104,101,32,102,105,108,101,32,115,121,115,116,101,109,32,
+    112,97,116,104,32,114,101,112,114,101,115,101,110,116,97,116,
+    105,111,110,32,111,102,32,116,104,101,32,111,98,106,101,99,
+    116,46,78,41,1,218,19,78,111,116,73,109,112,108,101,109,
+    101,110,116,101,100,69,114,114,111,114,41,1,114,133,0,0,
+    0,114,21,0,0,0,114,21,0,0,0,114,22,0,0,0,
+    114,209,0,0,0,36,4,0,0,115,2,0,0,0,0,3,
+    122,19,80,97,116,104,76,105,107,101,46,95,95,102,115,112,
+    97,116,104,95,95,99,2,0,0,0,0,0,0,0,2,0,
+    0,0,3,0,0,0,67,0,0,0,115,10,0,0,0,116,
+    0,124,1,100,1,131,2,83,0,41,2,78,114,209,0,0,
+    0,41,1,114,85,0,0,0,41,2,90,3,99,108,115,90,
+    8,115,117,98,99,108,97,115,115,114,21,0,0,0,114,21,
+    0,0,0,114,22,0,0,0,218,16,95,95,115,117,98,99,
+    108,97,115,115,104,111,111,107,95,95,41,4,0,0,115,2,
+    0,0,0,0,2,122,25,80,97,116,104,76,105,107,101,46,
+    95,95,115,117,98,99,108,97,115,115,104,111,111,107,95,95,
+    78,41,9,114,151,0,0,0,114,152,0,0,0,114,153,0,
+    0,0,218,7,95,95,100,111,99,95,95,218,3,97,98,99,
+    90,14,97,98,115,116,114,97,99,116,109,101,116,104,111,100,
+    114,209,0,0,0,218,11,99,108,97,115,115,109,101,116,104,
+    111,100,114,213,0,0,0,114,21,0,0,0,114,21,0,0,
+    0,114,21,0,0,0,114,22,0,0,0,114,211,0,0,0,
+    32,4,0,0,115,6,0,0,0,8,2,4,2,14,5,114,
+    211,0,0,0,41,2,114,53,0,0,0,70,41,3,84,78,
+    70,41,3,114,80,0,0,0,84,78,41,1,78,41,1,78,
+    41,1,78,41,2,114,168,0,0,0,114,121,0,0,0,41,
+    1,78,41,2,114,170,0,0,0,114,171,0,0,0,114,100,
+    0,0,0,41,2,114,191,0,0,0,114,100,0,0,0,41,
+    102,114,214,0,0,0,114,215,0,0,0,114,110,0,0,0,
+    114,112,0,0,0,114,44,0,0,0,114,87,0,0,0,218,
+    20,98,117,105,108,116,105,110,95,109,111,100,117,108,101,95,
+    110,97,109,101,115,90,6,95,110,97,109,101,115,114,29,0,
+    0,0,114,23,0,0,0,114,32,0,0,0,114,8,0,0,
+    0,114,6,0,0,0,114,33,0,0,0,114,36,0,0,0,
+    114,70,0,0,0,218,11,73,109,112,111,114,116,69,114,114,
+    111,114,90,9,112,111,115,105,120,112,97,116,104,114,9,0,
+    0,0,114,37,0,0,0,218,6,101,120,116,101,110,100,114,
+    38,0,0,0,90,6,110,116,112,97,116,104,218,7,109,111,
+    100,117,108,101,115,90,7,111,115,46,112,97,116,104,114,2,
+    0,0,0,114,3,0,0,0,114,4,0,0,0,114,5,0,
+    0,0,114,7,0,0,0,114,19,0,0,0,114,1,0,0,
+    0,114,10,0,0,0,114,20,0,0,0,114,39,0,0,0,
+    114,43,0,0,0,218,3,115,101,116,114,40,0,0,0,90,
+    15,115,117,112,112,111,114,116,115,95,100,105,114,95,102,100,
+    90,22,115,117,112,112,111,114,116,115,95,101,102,102,101,99,
+    116,105,118,101,95,105,100,115,114,41,0,0,0,90,11,115,
+    117,112,112,111,114,116,115,95,102,100,90,24,115,117,112,112,
+    111,114,116,115,95,102,111,108,108,111,119,95,115,121,109,108,
+    105,110,107,115,114,11,0,0,0,114,12,0,0,0,114,13,
+    0,0,0,114,56,0,0,0,114,64,0,0,0,114,65,0,
+    0,0,114,74,0,0,0,114,46,0,0,0,114,49,0,0,
+    0,114,95,0,0,0,114,91,0,0,0,114,108,0,0,0,
+    218,9,78,97,109,101,69,114,114,111,114,114,99,0,0,0,
+    114,102,0,0,0,114,104,0,0,0,114,106,0,0,0,114,
+    103,0,0,0,114,105,0,0,0,114,107,0,0,0,114,16,
+    0,0,0,90,16,95,99,111,108,108,101,99,116,105,111,110,
+    115,95,97,98,99,114,124,0,0,0,114,125,0,0,0,114,
+    130,0,0,0,114,156,0,0,0,114,131,0,0,0,114,165,
+    0,0,0,114,166,0,0,0,114,168,0,0,0,114,121,0,
+    0,0,114,169,0,0,0,114,132,0,0,0,114,59,0,0,
+    0,114,170,0,0,0,114,171,0,0,0,114,175,0,0,0,
+    114,14,0,0,0,114,15,0,0,0,114,178,0,0,0,114,
+    179,0,0,0,114,180,0,0,0,114,183,0,0,0,114,177,
+    0,0,0,114,184,0,0,0,114,185,0,0,0,114,186,0,
+    0,0,114,187,0,0,0,114,188,0,0,0,114,189,0,0,
+    0,114,190,0,0,0,114,18,0,0,0,114,199,0,0,0,
+    114,17,0,0,0,114,210,0,0,0,114,66,0,0,0,114,
+    151,0,0,0,90,3,65,66,67,114,211,0,0,0,114,21,
+    0,0,0,114,21,0,0,0,114,21,0,0,0,114,22,0,
+    0,0,218,8,60,109,111,100,117,108,101,62,22,0,0,0,
+    115,124,1,0,0,4,3,8,1,16,1,8,2,6,3,12,
+    1,12,1,10,1,8,2,8,3,8,8,8,1,4,1,4,
+    1,8,1,2,1,12,1,14,1,14,1,6,1,8,2,2,
+    1,16,1,14,1,6,2,8,1,14,1,4,2,10,1,4,
+    1,4,1,8,1,2,1,12,1,14,1,16,1,6,1,8,
+    2,8,1,14,1,2,2,2,1,16,1,16,1,8,3,8,
+    2,10,1,40,3,2,3,10,1,6,1,8,4,6,1,10,
+    1,10,1,10,1,10,1,10,1,10,1,10,1,10,1,10,
+    1,10,1,10,1,10,1,10,1,10,1,10,1,10,1,4,
+    2,6,1,10,1,4,2,6,1,10,1,10,1,10,1,10,
+    1,10,1,10,1,10,1,10,1,10,1,10,1,20,1,10,
+    1,4,2,6,1,10,22,10,1,10,1,10,1,10,1,10,
+    1,10,1,10,1,10,1,10,1,10,1,10,1,10,1,4,
+    2,2,1,2,1,2,1,2,6,4,1,4,1,4,5,10,
+    32,8,22,8,26,16,2,10,127,0,13,10,2,28,2,18,
+    46,8,47,10,3,2,1,8,1,16,1,10,2,8,7,8,
+    8,8,7,8,9,8,8,8,9,22,2,10,35,10,45,12,
+    2,16,53,2,1,8,1,16,1,14,2,10,1,10,2,2,
+    1,8,1,16,1,14,2,10,1,10,2,8,31,6,1,2,
+    3,10,6,8,1,10,2,6,1,8,6,6,1,4,1,4,
+    1,8,1,2,2,10,6,10,2,8,30,10,1,2,3,32,
+    2,4,1,8,2,16,6,8,31,8,9,8,12,8,10,8,
+    11,18,3,10,4,8,9,8,12,14,3,10,3,8,10,8,
+    12,14,4,10,22,14,23,8,9,8,31,10,1,4,1,6,
+    3,
+};
+static const unsigned char _Py_M__stat[] = {
+    99,0,0,0,0,0,0,0,0,0,0,0,0,13,0,0,
+    0,64,0,0,0,115,34,2,0,0,100,0,90,0,100,1,
+    90,1,100,2,90,2,100,3,90,3,100,4,90,4,100,5,
+    90,5,100,6,90,6,100,7,90,7,100,8,90,8,100,9,
+    90,9,100,10,90,10,100,11,100,12,132,0,90,11,100,13,
+    100,14,132,0,90,12,100,15,90,13,100,16,90,14,100,17,
+    90,15,100,18,90,16,100,19,90,17,100,20,90,18,100,21,
+    90,19,100,22,100,23,132,0,90,20,100,24,100,25,132,0,
+    90,21,100,26,100,27,132,0,90,22,100,28,100,29,132,0,
+    90,23,100,30,100,31,132,0,90,24,100,32,100,33,132,0,
+    90,25,100,34,100,35,132,0,90,26,100,36,90,27,100,37,
+    90,28,101,28,90,29,100,38,90,30,100,39,90,31,100,40,
+    90,32,100,41,90,33,100,42,90,34,100,39,90,35,100,40,
+    90,36,100,41,90,37,100,43,90,38,100,44,90,39,100,45,
+    90,40,100,9,90,41,100,8,90,42,100,5,90,43,100,3,
+    90,44,100,2,90,45,100,2,90,46,100,3,90,47,100,5,
+    90,48,100,9,90,49,100,45,90,50,100,44,90,51,100,18,
+    90,52,100,46,90,53,100,47,90,54,100,48,90,55,100,49,
+    90,56,100,50,90,57,101,18,100,51,102,2,101,16,100,52,
+    102,2,101,15,100,53,102,2,101,13,100,54,102,2,101,14,
+    100,55,102,2,101,17,100,56,102,2,102,6,101,35,100,57,
+    102,2,102,1,101,36,100,58,102,2,102,1,101,37,101,27,
+    66,0,100,59,102,2,101,27,100,60,102,2,101,37,100,61,
+    102,2,102,3,101,39,100,57,102,2,102,1,101,40,100,58,
+    102,2,102,1,101,41,101,28,66,0,100,59,102,2,101,28,
+    100,60,102,2,101,41,100,61,102,2,102,3,101,43,100,57,
+    102,2,102,1,101,44,100,58,102,2,102,1,101,45,101,30,
+    66,0,100,62,102,2,101,30,100,63,102,2,101,45,100,61,
+    102,2,102,3,102,10,90,58,100,64,100,65,132,0,90,59,
+    100,44,90,60,100,36,90,61,100,41,90,62,100,45,90,63,
+    100,15,90,64,100,3,90,65,100,18,90,66,100,40,90,67,
+    100,16,90,68,100,47,90,69,100,19,90,70,100,2,90,71,
+    100,37,90,72,100,38,90,73,100,5,90,74,100,39,90,75,
+    100,46,90,76,121,12,100,1,100,66,108,77,84,0,87,0,
+    110,22,4,0,101,78,107,10,144,2,114,28,1,0,1,0,
+    1,0,89,0,110,2,88,0,100,67,83,0,41,68,122,111,
+    67,111,110,115,116,97,110,116,115,47,102,117,110,99,116,105,
+    111,110,115,32,102,111,114,32,105,110,116,101,114,112,114,101,
+    116,105,110,103,32,114,101,115,117,108,116,115,32,111,102,32,
+    111,115,46,115,116,97,116,40,41,32,97,110,100,32,111,115,
+    46,108,115,116,97,116,40,41,46,10,10,83,117,103,103,101,
+    115,116,101,100,32,117,115,97,103,101,58,32,102,114,111,109,
+    32,115,116,97,116,32,105,109,112,111,114,116,32,42,10,233,
+    0,0,0,0,233,1,0,0,0,233,2,0,0,0,233,3,
+    0,0,0,233,4,0,0,0,233,5,0,0,0,233,6,0,
+    0,0,233,7,0,0,0,233,8,0,0,0,233,9,0,0,
+    0,99,1,0,0,0,0,0,0,0,1,0,0,0,2,0,
+    0,0,67,0,0,0,115,8,0,0,0,124,0,100,1,64,
+    0,83,0,41,2,122,77,82,101,116,117,114,110,32,116,104,
+    101,32,112,111,114,116,105,111,110,32,111,102,32,116,104,101,
+    32,102,105,108,101,39,115,32,109,111,100,101,32,116,104,97,
+    116,32,99,97,110,32,98,101,32,115,101,116,32,98,121,10,
+    32,32,32,32,111,115,46,99,104,109,111,100,40,41,46,10,
+    32,32,32,32,105,255,15,0,0,169,0,41,1,218,4,109,
+    111,100,101,114,10,0,0,0,114,10,0,0,0,250,16,60,
+    115,116,100,108,105,98,62,47,115,116,97,116,46,112,121,218,
+    7,83,95,73,77,79,68,69,21,0,0,0,115,2,0,0,
+    0,0,4,114,13,0,0,0,99,1,0,0,0,0,0,0,
+    0,1,0,0,0,2,0,0,0,67,0,0,0,115,8,0,
+    0,0,124,0,100,1,64,0,83,0,41,2,122,76,82,101,
+    116,117,114,110,32,116,104,101,32,112,111,114,116,105,111,110,
+    32,111,102,32,116,104,101,32,102,105,108,101,39,115,32,109,
+    111,100,101,32,116,104,97,116,32,100,101,115,99,114,105,98,
+    101,115,32,116,104,101,10,32,32,32,32,102,105,108,101,32,
+    116,121,112,101,46,10,32,32,32,32,105,0,240,0,0,114,
+    10,0,0,0,41,1,114,11,0,0,0,114,10,0,0,0,
+    114,10,0,0,0,114,12,0,0,0,218,6,83,95,73,70,
+    77,84,27,0,0,0,115,2,0,0,0,0,4,114,14,0,
+    0,0,105,0,64,0,0,105,0,32,0,0,105,0,96,0,
+    0,105,0,128,0,0,105,0,16,0,0,105,0,160,0,0,
+    105,0,192,0,0,99,1,0,0,0,0,0,0,0,1,0,
+    0,0,2,0,0,0,67,0,0,0,115,12,0,0,0,116,
+    0,124,0,131,1,116,1,107,2,83,0,41,1,122,40,82,
+    101,116,117,114,110,32,84,114,117,101,32,105,102,32,109,111,
+    100,101,32,105,115,32,102,114,111,109,32,97,32,100,105,114,
+    101,99,116,111,114,121,46,41,2,114,14,0,0,0,218,7,
+    83,95,73,70,68,73,82,41,1,114,11,0,0,0,114,10,
+    0,0,0,114,10,0,0,0,114,12,0,0,0,218,7,83,
+    95,73,83,68,73,82,46,0,0,0,115,2,0,0,0,0,
+    2,114,16,0,0,0,99,1,0,0,0,0,0,0,0,1,
+    0,0,0,2,0,0,0,67,0,0,0,115,12,0,0,0,
+    116,0,124,0,131,1,116,1,107,2,83,0,41,1,122,60,
+    82,101,116,117,114,110,32,84,114,117,101,32,105,102,32,109,
+    111,100,101,32,105,115,32,102,114,111,109,32,97,32,99,104,
+    97,114,97,99,116,101,114,32,115,112,101,99,105,97,108,32,
+    100,101,118,105,99,101,32,102,105,108,101,46,41,2,114,14,
+    0,0,0,218,7,83,95,73,70,67,72,82,41,1,114,11,
+    0,0,0,114,10,0,0,0,114,10,0,0,0,114,12,0,
+    0,0,218,7,83,95,73,83,67,72,82,50,0,0,0,115,
+    2,0,0,0,0,2,114,18,0,0,0,99,1,0,0,0,
+    0,0,0,0,1,0,0,0,2,0,0,0,67,0,0,0,
+    115,12,0,0,0,116,0,124,0,131,1,116,1,107,2,83,
+    0,41,1,122,56,82,101,116,117,114,110,32,84,114,117,101,
+    32,105,102,32,109,111,100,101,32,105,115,32,102,114,111,109,
+    32,97,32,98,108,111,99,107,32,115,112,101,99,105,97,108,
+    32,100,101,118,105,99,101,32,102,105,108,101,46,41,2,114,
+    14,0,0,0,218,7,83,95,73,70,66,76,75,41,1,114,
+    11,0,0,0,114,10,0,0,0,114,10,0,0,0,114,12,
+    0,0,0,218,7,83,95,73,83,66,76,75,54,0,0,0,
+    115,2,0,0,0,0,2,114,20,0,0,0,99,1,0,0,
+    0,0,0,0,0,1,0,0,0,2,0,0,0,67,0,0,
+    0,115,12,0,0,0,116,0,124,0,131,1,116,1,107,2,
+    83,0,41,1,122,43,82,101,116,117,114,110,32,84,114,117,
+    101,32,105,102,32,109,111,100,101,32,105,115,32,102,114,111,
+    109,32,97,32,114,101,103,117,108,97,114,32,102,105,108,101,
+    46,41,2,114,14,0,0,0,218,7,83,95,73,70,82,69,
+    71,41,1,114,11,0,0,0,114,10,0,0,0,114,10,0,
+    0,0,114,12,0,0,0,218,7,83,95,73,83,82,69,71,
+    58,0,0,0,115,2,0,0,0,0,2,114,22,0,0,0,
+    99,1,0,0,0,0,0,0,0,1,0,0,0,2,0,0,
+    0,67,0,0,0,115,12,0,0,0,116,0,124,0,131,1,
+    116,1,107,2,83,0,41,1,122,48,82,101,116,117,114,110,
+    32,84,114,117,101,32,105,102,32,109,111,100,101,32,105,115,
+    32,102,114,111,109,32,97,32,70,73,70,79,32,40,110,97,
+    109,101,100,32,112,105,112,101,41,46,41,2,114,14,0,0,
+    0,218,7,83,95,73,70,73,70,79,41,1,114,11,0,0,
+    0,114,10,0,0,0,114,10,0,0,0,114,12,0,0,0,
+    218,8,83,95,73,83,70,73,70,79,62,0,0,0,115,2,
+    0,0,0,0,2,114,24,0,0,0,99,1,0,0,0,0,
+    0,0,0,1,0,0,0,2,0,0,0,67,0,0,0,115,
+    12,0,0,0,116,0,124,0,131,1,116,1,107,2,83,0,
+    41,1,122,44,82,101,116,117,114,110,32,84,114,117,101,32,
+    105,102,32,109,111,100,101,32,105,115,32,102,114,111,109,32,
+    97,32,115,121,109,98,111,108,105,99,32,108,105,110,107,46,
+    41,2,114,14,0,0,0,218,7,83,95,73,70,76,78,75,
+    41,1,114,11,0,0,0,114,10,0,0,0,114,10,0,0,
+    0,114,12,0,0,0,218,7,83,95,73,83,76,78,75,66,
+    0,0,0,115,2,0,0,0,0,2,114,26,0,0,0,99,
+    1,0,0,0,0,0,0,0,1,0,0,0,2,0,0,0,
+    67,0,0,0,115,12,0,0,0,116,0,124,0,131,1,116,
+    1,107,2,83,0,41,1,122,37,82,101,116,117,114,110,32,
+    84,114,117,101,32,105,102,32,109,111,100,101,32,105,115,32,
+    102,114,111,109,32,97,32,115,111,99,107,101,116,46,41,2,
+    114,14,0,0,0,218,8,83,95,73,70,83,79,67,75,41,
+    1,114,11,0,0,0,114,10,0,0,0,114,10,0,0,0,
+    114,12,0,0,0,218,8,83,95,73,83,83,79,67,75,70,
+    0,0,0,115,2,0,0,0,0,2,114,28,0,0,0,105,
+    0,8,0,0,105,0,4,0,0,105,0,2,0,0,233,0,
+    1,0,0,233,128,0,0,0,233,64,0,0,0,105,192,1,
+    0,0,233,56,0,0,0,233,32,0,0,0,233,16,0,0,
+    0,105,0,0,1,0,105,0,0,2,0,105,0,0,4,0,
+    105,0,0,16,0,105,0,0,32,0,218,1,108,250,1,45,
+    218,1,98,218,1,100,218,1,99,218,1,112,218,1,114,218,
+    1,119,218,1,115,218,1,83,218,1,120,218,1,116,218,1,
+    84,99,1,0,0,0,0,0,0,0,5,0,0,0,5,0,
+    0,0,67,0,0,0,115,80,0,0,0,103,0,125,1,120,
+    64,116,0,68,0,93,56,125,2,120,50,124,2,68,0,93,
+    32,92,2,125,3,125,4,124,0,124,3,64,0,124,3,107,
+    2,114,20,124,1,160,1,124,4,161,1,1,0,80,0,113,
+    20,87,0,124,1,160,1,100,1,161,1,1,0,113,10,87,
+    0,100,2,160,2,124,1,161,1,83,0,41,3,122,59,67,
+    111,110,118,101,114,116,32,97,32,102,105,108,101,39,115,32,
+    109,111,100,101,32,116,111,32,97,32,115,116,114,105,110,103,
+    32,111,102,32,116,104,101,32,102,111,114,109,32,39,45,114,
+    119,120,114,119,120,114,119,120,39,46,114,36,0,0,0,218,
+    0,41,3,218,15,95,102,105,108,101,109,111,100,101,95,116,
+    97,98,108,101,218,6,97,112,112,101,110,100,218,4,106,111,
+    105,110,41,5,114,11,0,0,0,90,4,112,101,114,109,90,
+    5,116,97,98,108,101,90,3,98,105,116,90,4,99,104,97,
+    114,114,10,0,0,0,114,10,0,0,0,114,12,0,0,0,
+    218,8,102,105,108,101,109,111,100,101,139,0,0,0,115,16,
+    0,0,0,0,2,4,1,10,1,14,1,12,1,10,1,6,
+    2,14,1,114,52,0,0,0,41,1,218,1,42,78,41,79,
+    218,7,95,95,100,111,99,95,95,90,7,83,84,95,77,79,
+    68,69,90,6,83,84,95,73,78,79,90,6,83,84,95,68,
+    69,86,90,8,83,84,95,78,76,73,78,75,90,6,83,84,
+    95,85,73,68,90,6,83,84,95,71,73,68,90,7,83,84,
+    95,83,73,90,69,90,8,83,84,95,65,84,73,77,69,90,
+    8,83,84,95,77,84,73,77,69,90,8,83,84,95,67,84,
+    73,77,69,114,13,0,0,0,114,14,0,0,0,114,15,0,
+    0,0,114,17,0,0,0,114,19,0,0,0,114,21,0,0,
+    0,114,23,0,0,0,114,25,0,0,0,114,27,0,0,0,
+    114,16,0,0,0,114,18,0,0,0,114,20,0,0,0,114,
+    22,0,0,0,114,24,0,0,0,114,26,0,0,0,114,28,
+    0,0,0,90,7,83,95,73,83,85,73,68,90,7,83,95,
+    73,83,71,73,68,90,7,83,95,69,78,70,77,84,90,7,
+    83,95,73,83,86,84,88,90,7,83,95,73,82,69,65,68,
+    90,8,83,95,73,87,82,73,84,69,90,7,83,95,73,69,
+    88,69,67,90,7,83,95,73,82,87,88,85,90,7,83,95,
+    73,82,85,83,82,90,7,83,95,73,87,85,83,82,90,7,
+    83,95,73,88,85,83,82,90,7,83,95,73,82,87,88,71,
+    90,7,83,95,73,82,71,82,80,90,7,83,95,73,87,71,
+    82,80,90,7,83,95,73,88,71,82,80,90,7,83,95,73,
+    82,87,88,79,90,7,83,95,73,82,79,84,72,90,7,83,
+    95,73,87,79,84,72,90,7,83,95,73,88,79,84,72,90,
+    9,85,70,95,78,79,68,85,77,80,90,12,85,70,95,73,
+    77,77,85,84,65,66,76,69,90,9,85,70,95,65,80,80,
+    69,78,68,90,9,85,70,95,79,80,65,81,85,69,90,11,
+    85,70,95,78,79,85,78,76,73,78,75,90,13,85,70,95,
+    67,79,77,80,82,69,83,83,69,68,90,9,85,70,95,72,
+    73,68,68,69,78,90,11,83,70,95,65,82,67,72,73,86,
+    69,68,90,12,83,70,95,73,77,77,85,84,65,66,76,69,
+    90,9,83,70,95,65,80,80,69,78,68,90,11,83,70,95,
+    78,79,85,78,76,73,78,75,90,11,83,70,95,83,78,65,
+    80,83,72,79,84,114,49,0,0,0,114,52,0,0,0,90,
+    22,70,73,76,69,95,65,84,84,82,73,66,85,84,69,95,
+    65,82,67,72,73,86,69,90,25,70,73,76,69,95,65,84,
+    84,82,73,66,85,84,69,95,67,79,77,80,82,69,83,83,
+    69,68,90,21,70,73,76,69,95,65,84,84,82,73,66,85,
+    84,69,95,68,69,86,73,67,69,90,24,70,73,76,69,95,
+    65,84,84,82,73,66,85,84,69,95,68,73,82,69,67,84,
+    79,82,89,90,24,70,73,76,69,95,65,84,84,82,73,66,
+    85,84,69,95,69,78,67,82,89,80,84,69,68,90,21,70,
+    73,76,69,95,65,84,84,82,73,66,85,84,69,95,72,73,
+    68,68,69,78,90,31,70,73,76,69,95,65,84,84,82,73,
+    66,85,84,69,95,73,78,84,69,71,82,73,84,89,95,83,
+    84,82,69,65,77,90,21,70,73,76,69,95,65,84,84,82,
+    73,66,85,84,69,95,78,79,82,77,65,76,90,34,70,73,
+    76,69,95,65,84,84,82,73,66,85,84,69,95,78,79,84,
+    95,67,79,78,84,69,78,84,95,73,78,68,69,88,69,68,
+    90,28,70,73,76,69,95,65,84,84,82,73,66,85,84,69,
+    95,78,79,95,83,67,82,85,66,95,68,65,84,65,90,22,
+    70,73,76,69,95,65,84,84,82,73,66,85,84,69,95,79,
+    70,70,76,73,78,69,90,23,70,73,76,69,95,65,84,84,
+    82,73,66,85,84,69,95,82,69,65,68,79,78,76,89,90,
+    28,70,73,76,69,95,65,84,84,82,73,66,85,84,69,95,
+    82,69,80,65,82,83,69,95,80,79,73,78,84,90,26,70,
+    73,76,69,95,65,84,84,82,73,66,85,84,69,95,83,80,
+    65,82,83,69,95,70,73,76,69,90,21,70,73,76,69,95,
+    65,84,84,82,73,66,85,84,69,95,83,89,83,84,69,77,
+    90,24,70,73,76,69,95,65,84,84,82,73,66,85,84,69,
+    95,84,69,77,80,79,82,65,82,89,90,22,70,73,76,69,
+    95,65,84,84,82,73,66,85,84,69,95,86,73,82,84,85,
+    65,76,90,5,95,115,116,97,116,218,11,73,109,112,111,114,
+    116,69,114,114,111,114,114,10,0,0,0,114,10,0,0,0,
+    114,10,0,0,0,114,12,0,0,0,218,8,60,109,111,100,
+    117,108,101,62,4,0,0,0,115,200,0,0,0,4,4,4,
+    1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,
+    1,4,4,8,6,8,9,4,1,4,1,4,1,4,1,4,
+    1,4,1,4,4,8,4,8,4,8,4,8,4,8,4,8,
+    4,8,6,4,1,4,1,4,1,4,1,4,1,4,1,4,
+    1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,
+    1,4,1,4,1,4,1,4,4,4,1,4,1,4,1,4,
+    1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,
+    4,6,1,6,1,6,1,6,1,6,1,8,2,8,1,8,
+    1,10,1,6,1,8,2,8,1,8,1,10,1,6,1,8,
+    2,8,1,8,1,10,1,6,1,12,3,8,16,4,1,4,
+    1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,
+    1,4,1,4,1,4,1,4,1,4,1,4,1,4,4,2,
+    1,12,1,16,1,
+};
+static const unsigned char _Py_M__posixpath[] = {
+    99,0,0,0,0,0,0,0,0,0,0,0,0,38,0,0,
+    0,64,0,0,0,115,94,1,0,0,100,0,90,0,100,1,
+    100,2,108,1,90,1,100,1,100,2,108,2,90,2,100,1,
+    100,2,108,3,90,3,100,1,100,2,108,4,90,4,100,1,
+    100,3,108,4,84,0,100,4,100,5,100,6,100,7,100,8,
+    100,9,100,10,100,11,100,12,100,13,100,14,100,15,100,16,
+    100,17,100,18,100,19,100,20,100,21,100,22,100,23,100,24,
+    100,25,100,26,100,27,100,28,100,29,100,30,100,31,100,32,
+    100,33,100,34,100,35,100,36,100,37,100,38,100,39,100,40,
+    100,41,103,38,90,5,100,42,90,6,100,43,90,7,100,42,
+    90,8,100,44,90,9,100,45,90,10,100,46,90,11,100,2,
+    90,12,100,47,90,13,100,48,100,49,132,0,90,14,100,50,
+    100,4,132,0,90,15,100,51,100,5,132,0,90,16,100,52,
+    100,6,132,0,90,17,100,53,100,8,132,0,90,18,100,54,
+    100,9,132,0,90,19,101,4,106,20,106,0,101,19,95,0,
+    100,55,100,7,132,0,90,21,100,56,100,10,132,0,90,22,
+    100,57,100,11,132,0,90,23,100,58,100,17,132,0,90,24,
+    100,59,100,19,132,0,90,25,100,60,100,22,132,0,90,26,
+    100,61,100,23,132,0,90,27,100,2,97,28,100,2,97,29,
+    100,62,100,24,132,0,90,30,100,63,100,25,132,0,90,31,
+    100,64,100,26,132,0,90,32,100,65,100,38,132,0,90,33,
+    100,66,100,67,132,0,90,34,101,2,106,35,100,68,107,2,
+    90,36,100,71,100,69,100,40,132,1,90,37,100,70,100,41,
+    132,0,90,38,100,2,83,0,41,72,97,231,1,0,0,67,
+    111,109,109,111,110,32,111,112,101,114,97,116,105,111,110,115,
+    32,111,110,32,80,111,115,105,120,32,112,97,116,104,110,97,
+    109,101,115,46,10,10,73,110,115,116,101,97,100,32,111,102,
+    32,105,109,112,111,114,116,105,110,103,32,116,104,105,115,32,
+    109,111,100,117,108,101,32,100,105,114,101,99,116,108,121,44,
+    32,105,109,112,111,114,116,32,111,115,32,97,110,100,32,114,
+    101,102,101,114,32,116,111,10,116,104,105,115,32,109,111,100,
+    117,108,101,32,97,115,32,111,115,46,112,97,116,104,46,32,
+    32,84,104,101,32,34,111,115,46,112,97,116,104,34,32,110,
+    97,109,101,32,105,115,32,97,110,32,97,108,105,97,115,32,
+    102,111,114,32,116,104,105,115,10,109,111,100,117,108,101,32,
+    111,110,32,80,111,115,105,120,32,115,121,115,116,101,109,115,
+    59,32,111,110,32,111,116,104,101,114,32,115,121,115,116,101,
+    109,115,32,40,101,46,103,46,32,77,97,99,44,32,87,105,
+    110,100,111,119,115,41,44,10,111,115,46,112,97,116,104,32,
+    112,114,111,118,105,100,101,115,32,116,104,101,32,115,97,109,
+    101,32,111,112,101,114,97,116,105,111,110,115,32,105,110,32,
+    97,32,109,97,110,110,101,114,32,115,112,101,99,105,102,105,
+    99,32,116,111,32,116,104,97,116,10,112,108,97,116,102,111,
+    114,109,44,32,97,110,100,32,105,115,32,97,110,32,97,108,
+    105,97,115,32,116,111,32,97,110,111,116,104,101,114,32,109,
+    111,100,117,108,101,32,40,101,46,103,46,32,109,97,99,112,
+    97,116,104,44,32,110,116,112,97,116,104,41,46,10,10,83,
+    111,109,101,32,111,102,32,116,104,105,115,32,99,97,110,32,
+    97,99,116,117,97,108,108,121,32,98,101,32,117,115,101,102,
+    117,108,32,111,110,32,110,111,110,45,80,111,115,105,120,32,
+    115,121,115,116,101,109,115,32,116,111,111,44,32,101,46,103,
+    46,10,102,111,114,32,109,97,110,105,112,117,108,97,116,105,
+    111,110,32,111,102,32,116,104,101,32,112,97,116,104,110,97,
+    109,101,32,99,111,109,112,111,110,101,110,116,32,111,102,32,
+    85,82,76,115,46,10,233,0,0,0,0,78,41,1,218,1,
+    42,218,8,110,111,114,109,99,97,115,101,218,5,105,115,97,
+    98,115,218,4,106,111,105,110,218,10,115,112,108,105,116,100,
+    114,105,118,101,218,5,115,112,108,105,116,218,8,115,112,108,
+    105,116,101,120,116,218,8,98,97,115,101,110,97,109,101,218,
+    7,100,105,114,110,97,109,101,218,12,99,111,109,109,111,110,
+    112,114,101,102,105,120,90,7,103,101,116,115,105,122,101,90,
+    8,103,101,116,109,116,105,109,101,90,8,103,101,116,97,116,
+    105,109,101,90,8,103,101,116,99,116,105,109,101,218,6,105,
+    115,108,105,110,107,90,6,101,120,105,115,116,115,218,7,108,
+    101,120,105,115,116,115,90,5,105,115,100,105,114,90,6,105,
+    115,102,105,108,101,218,7,105,115,109,111,117,110,116,218,10,
+    101,120,112,97,110,100,117,115,101,114,218,10,101,120,112,97,
+    110,100,118,97,114,115,218,8,110,111,114,109,112,97,116,104,
+    218,7,97,98,115,112,97,116,104,90,8,115,97,109,101,102,
+    105,108,101,90,12,115,97,109,101,111,112,101,110,102,105,108,
+    101,90,8,115,97,109,101,115,116,97,116,218,6,99,117,114,
+    100,105,114,218,6,112,97,114,100,105,114,218,3,115,101,112,
+    218,7,112,97,116,104,115,101,112,218,7,100,101,102,112,97,
+    116,104,218,6,97,108,116,115,101,112,218,6,101,120,116,115,
+    101,112,218,7,100,101,118,110,117,108,108,218,8,114,101,97,
+    108,112,97,116,104,218,26,115,117,112,112,111,114,116,115,95,
+    117,110,105,99,111,100,101,95,102,105,108,101,110,97,109,101,
+    115,218,7,114,101,108,112,97,116,104,218,10,99,111,109,109,
+    111,110,112,97,116,104,218,1,46,122,2,46,46,250,1,47,
+    250,1,58,122,14,58,47,98,105,110,58,47,117,115,114,47,
+    98,105,110,122,9,47,100,101,118,47,110,117,108,108,99,1,
+    0,0,0,0,0,0,0,1,0,0,0,3,0,0,0,67,
+    0,0,0,115,22,0,0,0,116,0,124,0,116,1,131,2,
+    114,14,100,1,83,0,100,2,83,0,100,0,83,0,41,3,
+    78,243,1,0,0,0,47,114,31,0,0,0,41,2,218,10,
+    105,115,105,110,115,116,97,110,99,101,218,5,98,121,116,101,
+    115,41,1,218,4,112,97,116,104,169,0,114,37,0,0,0,
+    250,21,60,115,116,100,108,105,98,62,47,112,111,115,105,120,
+    112,97,116,104,46,112,121,218,8,95,103,101,116,95,115,101,
+    112,39,0,0,0,115,6,0,0,0,0,1,10,1,4,2,
+    114,39,0,0,0,99,1,0,0,0,0,0,0,0,1,0,
+    0,0,4,0,0,0,67,0,0,0,115,46,0,0,0,116,
+    0,160,1,124,0,161,1,125,0,116,2,124,0,116,3,116,
+    4,102,2,131,2,115,42,116,5,100,1,160,6,124,0,106,
+    7,106,8,161,1,131,1,130,1,124,0,83,0,41,2,122,
+    54,78,111,114,109,97,108,105,122,101,32,99,97,115,101,32,
+    111,102,32,112,97,116,104,110,97,109,101,46,32,32,72,97,
+    115,32,110,111,32,101,102,102,101,99,116,32,117,110,100,101,
+    114,32,80,111,115,105,120,122,50,110,111,114,109,99,97,115,
+    101,40,41,32,97,114,103,117,109,101,110,116,32,109,117,115,
+    116,32,98,101,32,115,116,114,32,111,114,32,98,121,116,101,
+    115,44,32,110,111,116,32,39,123,125,39,41,9,218,2,111,
+    115,218,6,102,115,112,97,116,104,114,34,0,0,0,114,35,
+    0,0,0,218,3,115,116,114,218,9,84,121,112,101,69,114,
+    114,111,114,218,6,102,111,114,109,97,116,218,9,95,95,99,
+    108,97,115,115,95,95,218,8,95,95,110,97,109,101,95,95,
+    41,1,218,1,115,114,37,0,0,0,114,37,0,0,0,114,
+    38,0,0,0,114,2,0,0,0,50,0,0,0,115,10,0,
+    0,0,0,2,10,1,14,1,6,1,12,1,99,1,0,0,
+    0,0,0,0,0,2,0,0,0,3,0,0,0,67,0,0,
+    0,115,28,0,0,0,116,0,160,1,124,0,161,1,125,0,
+    116,2,124,0,131,1,125,1,124,0,160,3,124,1,161,1,
+    83,0,41,1,122,31,84,101,115,116,32,119,104,101,116,104,
+    101,114,32,97,32,112,97,116,104,32,105,115,32,97,98,115,
+    111,108,117,116,101,41,4,114,40,0,0,0,114,41,0,0,
+    0,114,39,0,0,0,218,10,115,116,97,114,116,115,119,105,
+    116,104,41,2,114,47,0,0,0,114,20,0,0,0,114,37,
+    0,0,0,114,37,0,0,0,114,38,0,0,0,114,3,0,
+    0,0,62,0,0,0,115,6,0,0,0,0,2,10,1,8,
+    1,99,1,0,0,0,0,0,0,0,5,0,0,0,13,0,
+    0,0,71,0,0,0,115,174,0,0,0,116,0,160,1,124,
+    0,161,1,125,0,116,2,124,0,131,1,125,2,124,0,125,
+    3,121,100,124,1,115,44,124,3,100,1,100,2,133,2,25,
+    0,124,2,23,0,1,0,120,74,116,3,116,0,106,1,124,
+    1,131,2,68,0,93,58,125,4,124,4,160,4,124,2,161,
+    1,114,78,124,4,125,3,113,58,124,3,12,0,115,94,124,
+    3,160,5,124,2,161,1,114,104,124,3,124,4,55,0,125,
+    3,113,58,124,3,124,2,124,4,23,0,55,0,125,3,113,
+    58,87,0,87,0,110,46,4,0,116,6,116,7,116,8,102,
+    3,107,10,114,168,1,0,1,0,1,0,116,9,106,10,100,
+    3,124,0,102,2,124,1,158,2,142,0,1,0,130,0,89,
+    0,110,2,88,0,124,3,83,0,41,4,122,230,74,111,105,
+    110,32,116,119,111,32,111,114,32,109,111,114,101,32,112,97,
+    116,104,110,97,109,101,32,99,111,109,112,111,110,101,110,116,
+    115,44,32,105,110,115,101,114,116,105,110,103,32,39,47,39,
+    32,97,115,32,110,101,101,100,101,100,46,10,32,32,32,32,
+    73,102,32,97,110,121,32,99,111,109,112,111,110,101,110,116,
+    32,105,115,32,97,110,32,97,98,115,111,108,117,116,101,32,
+    112,97,116,104,44,32,97,108,108,32,112,114,101,118,105,111,
+    117,115,32,112,97,116,104,32,99,111,109,112,111,110,101,110,
+    116,115,10,32,32,32,32,119,105,108,108,32,98,101,32,100,
+    105,115,99,97,114,100,101,100,46,32,32,65,110,32,101,109,
+    112,116,121,32,108,97,115,116,32,112,97,114,116,32,119,105,
+    108,108,32,114,101,115,117,108,116,32,105,110,32,97,32,112,
+    97,116,104,32,116,104,97,116,10,32,32,32,32,101,110,100,
+    115,32,119,105,116,104,32,97,32,115,101,112,97,114,97,116,
+    111,114,46,78,114,0,0,0,0,114,4,0,0,0,41,11,
+    114,40,0,0,0,114,41,0,0,0,114,39,0,0,0,218,
+    3,109,97,112,114,48,0,0,0,218,8,101,110,100,115,119,
+    105,116,104,114,43,0,0,0,218,14,65,116,116,114,105,98,
+    117,116,101,69,114,114,111,114,218,12,66,121,116,101,115,87,
+    97,114,110,105,110,103,218,11,103,101,110,101,114,105,99,112,
+    97,116,104,218,16,95,99,104,101,99,107,95,97,114,103,95,
+    116,121,112,101,115,41,5,218,1,97,218,1,112,114,20,0,
+    0,0,114,36,0,0,0,218,1,98,114,37,0,0,0,114,
+    37,0,0,0,114,38,0,0,0,114,4,0,0,0,73,0,
+    0,0,115,32,0,0,0,0,5,10,1,8,1,4,1,2,
+    1,4,1,16,1,18,1,10,1,6,1,16,1,10,2,20,
+    1,20,1,18,1,8,1,99,1,0,0,0,0,0,0,0,
+    5,0,0,0,4,0,0,0,67,0,0,0,115,96,0,0,
+    0,116,0,160,1,124,0,161,1,125,0,116,2,124,0,131,
+    1,125,1,124,0,160,3,124,1,161,1,100,1,23,0,125,
+    2,124,0,100,2,124,2,133,2,25,0,124,0,124,2,100,
+    2,133,2,25,0,2,0,125,3,125,4,124,3,114,88,124,
+    3,124,1,116,4,124,3,131,1,20,0,107,3,114,88,124,
+    3,160,5,124,1,161,1,125,3,124,3,124,4,102,2,83,
+    0,41,3,122,128,83,112,108,105,116,32,97,32,112,97,116,
+    104,110,97,109,101,46,32,32,82,101,116,117,114,110,115,32,
+    116,117,112,108,101,32,34,40,104,101,97,100,44,32,116,97,
+    105,108,41,34,32,119,104,101,114,101,32,34,116,97,105,108,
+    34,32,105,115,10,32,32,32,32,101,118,101,114,121,116,104,
+    105,110,103,32,97,102,116,101,114,32,116,104,101,32,102,105,
+    110,97,108,32,115,108,97,115,104,46,32,32,69,105,116,104,
+    101,114,32,112,97,114,116,32,109,97,121,32,98,101,32,101,
+    109,112,116,121,46,233,1,0,0,0,78,41,6,114,40,0,
+    0,0,114,41,0,0,0,114,39,0,0,0,218,5,114,102,
+    105,110,100,218,3,108,101,110,218,6,114,115,116,114,105,112,
+    41,5,114,56,0,0,0,114,20,0,0,0,218,1,105,218,
+    4,104,101,97,100,218,4,116,97,105,108,114,37,0,0,0,
+    114,37,0,0,0,114,38,0,0,0,114,6,0,0,0,102,
+    0,0,0,115,14,0,0,0,0,3,10,1,8,1,14,1,
+    26,1,20,1,10,1,99,1,0,0,0,0,0,0,0,3,
+    0,0,0,6,0,0,0,67,0,0,0,115,54,0,0,0,
+    116,0,160,1,124,0,161,1,125,0,116,2,124,0,116,3,
+    131,2,114,30,100,1,125,1,100,2,125,2,110,8,100,3,
+    125,1,100,4,125,2,116,4,160,5,124,0,124,1,100,0,
+    124,2,161,4,83,0,41,5,78,114,33,0,0,0,243,1,
+    0,0,0,46,114,31,0,0,0,114,30,0,0,0,41,6,
+    114,40,0,0,0,114,41,0,0,0,114,34,0,0,0,114,
+    35,0,0,0,114,53,0,0,0,218,9,95,115,112,108,105,
+    116,101,120,116,41,3,114,56,0,0,0,114,20,0,0,0,
+    114,24,0,0,0,114,37,0,0,0,114,37,0,0,0,114,
+    38,0,0,0,114,7,0,0,0,119,0,0,0,115,14,0,
+    0,0,0,1,10,1,10,1,4,1,6,2,4,1,4,1,
+    99,1,0,0,0,0,0,0,0,1,0,0,0,3,0,0,
+    0,67,0,0,0,115,26,0,0,0,116,0,160,1,124,0,
+    161,1,125,0,124,0,100,1,100,2,133,2,25,0,124,0,
+    102,2,83,0,41,3,122,74,83,112,108,105,116,32,97,32,
+    112,97,116,104,110,97,109,101,32,105,110,116,111,32,100,114,
+    105,118,101,32,97,110,100,32,112,97,116,104,46,32,79,110,
+    32,80,111,115,105,120,44,32,100,114,105,118,101,32,105,115,
+    32,97,108,119,97,121,115,10,32,32,32,32,101,109,112,116,
+    121,46,78,114,0,0,0,0,41,2,114,40,0,0,0,114,
+    41,0,0,0,41,1,114,56,0,0,0,114,37,0,0,0,
+    114,37,0,0,0,114,38,0,0,0,114,5,0,0,0,133,
+    0,0,0,115,4,0,0,0,0,3,10,1,99,1,0,0,
+    0,0,0,0,0,3,0,0,0,3,0,0,0,67,0,0,
+    0,115,44,0,0,0,116,0,160,1,124,0,161,1,125,0,
+    116,2,124,0,131,1,125,1,124,0,160,3,124,1,161,1,
+    100,1,23,0,125,2,124,0,124,2,100,2,133,2,25,0,
+    83,0,41,3,122,41,82,101,116,117,114,110,115,32,116,104,
+    101,32,102,105,110,97,108,32,99,111,109,112,111,110,101,110,
+    116,32,111,102,32,97,32,112,97,116,104,110,97,109,101,114,
+    58,0,0,0,78,41,4,114,40,0,0,0,114,41,0,0,
+    0,114,39,0,0,0,114,59,0,0,0,41,3,114,56,0,
+    0,0,114,20,0,0,0,114,62,0,0,0,114,37,0,0,
+    0,114,37,0,0,0,114,38,0,0,0,114,8,0,0,0,
+    142,0,0,0,115,8,0,0,0,0,2,10,1,8,1,14,
+    1,99,1,0,0,0,0,0,0,0,4,0,0,0,4,0,
+    0,0,67,0,0,0,115,78,0,0,0,116,0,160,1,124,
+    0,161,1,125,0,116,2,124,0,131,1,125,1,124,0,160,
+    3,124,1,161,1,100,1,23,0,125,2,124,0,100,2,124,
+    2,133,2,25,0,125,3,124,3,114,74,124,3,124,1,116,
+    4,124,3,131,1,20,0,107,3,114,74,124,3,160,5,124,
+    1,161,1,125,3,124,3,83,0,41,3,122,45,82,101,116,
+    117,114,110,115,32,116,104,101,32,100,105,114,101,99,116,111,
+    114,121,32,99,111,109,112,111,110,101,110,116,32,111,102,32,
+    97,32,112,97,116,104,110,97,109,101,114,58,0,0,0,78,
+    41,6,114,40,0,0,0,114,41,0,0,0,114,39,0,0,
+    0,114,59,0,0,0,114,60,0,0,0,114,61,0,0,0,
+    41,4,114,56,0,0,0,114,20,0,0,0,114,62,0,0,
+    0,114,63,0,0,0,114,37,0,0,0,114,37,0,0,0,
+    114,38,0,0,0,114,9,0,0,0,152,0,0,0,115,14,
+    0,0,0,0,2,10,1,8,1,14,1,12,1,20,1,10,
+    1,99,1,0,0,0,0,0,0,0,2,0,0,0,12,0,
+    0,0,67,0,0,0,115,52,0,0,0,121,14,116,0,160,
+    1,124,0,161,1,125,1,87,0,110,24,4,0,116,2,116,
+    3,102,2,107,10,114,38,1,0,1,0,1,0,100,1,83,
+    0,88,0,116,4,160,5,124,1,106,6,161,1,83,0,41,
+    2,122,38,84,101,115,116,32,119,104,101,116,104,101,114,32,
+    97,32,112,97,116,104,32,105,115,32,97,32,115,121,109,98,
+    111,108,105,99,32,108,105,110,107,70,41,7,114,40,0,0,
+    0,218,5,108,115,116,97,116,218,7,79,83,69,114,114,111,
+    114,114,51,0,0,0,218,4,115,116,97,116,218,7,83,95,
+    73,83,76,78,75,218,7,115,116,95,109,111,100,101,41,2,
+    114,36,0,0,0,90,2,115,116,114,37,0,0,0,114,37,
+    0,0,0,114,38,0,0,0,114,11,0,0,0,166,0,0,
+    0,115,10,0,0,0,0,2,2,1,14,1,18,1,6,1,
+    99,1,0,0,0,0,0,0,0,1,0,0,0,11,0,0,
+    0,67,0,0,0,115,40,0,0,0,121,14,116,0,160,1,
+    124,0,161,1,1,0,87,0,110,20,4,0,116,2,107,10,
+    114,34,1,0,1,0,1,0,100,1,83,0,88,0,100,2,
+    83,0,41,3,122,67,84,101,115,116,32,119,104,101,116,104,
+    101,114,32,97,32,112,97,116,104,32,101,120,105,115,116,115,
+    46,32,32,82,101,116,117,114,110,115,32,84,114,117,101,32,
+    102,111,114,32,98,114,111,107,101,110,32,115,121,109,98,111,
+    108,105,99,32,108,105,110,107,115,70,84,41,3,114,40,0,
+    0,0,114,67,0,0,0,114,68,0,0,0,41,1,114,36,
+    0,0,0,114,37,0,0,0,114,37,0,0,0,114,38,0,
+    0,0,114,12,0,0,0,176,0,0,0,115,10,0,0,0,
+    0,2,2,1,14,1,14,1,6,1,99,1,0,0,0,0,
+    0,0,0,8,0,0,0,19,0,0,0,67,0,0,0,115,
+    180,0,0,0,121,14,116,0,160,1,124,0,161,1,125,1,
+    87,0,110,20,4,0,116,2,107,10,114,34,1,0,1,0,
+    1,0,100,1,83,0,88,0,116,3,160,4,124,1,106,5,
+    161,1,114,52,100,1,83,0,116,6,124,0,116,7,131,2,
+    114,74,116,8,124,0,100,2,131,2,125,2,110,10,116,8,
+    124,0,100,3,131,2,125,2,116,9,124,2,131,1,125,2,
+    121,14,116,0,160,1,124,2,161,1,125,3,87,0,110,20,
+    4,0,116,2,107,10,114,126,1,0,1,0,1,0,100,1,
+    83,0,88,0,124,1,106,10,125,4,124,3,106,10,125,5,
+    124,4,124,5,107,3,114,152,100,4,83,0,124,1,106,11,
+    125,6,124,3,106,11,125,7,124,6,124,7,107,2,114,176,
+    100,4,83,0,100,1,83,0,41,5,122,36,84,101,115,116,
+    32,119,104,101,116,104,101,114,32,97,32,112,97,116,104,32,
+    105,115,32,97,32,109,111,117,110,116,32,112,111,105,110,116,
+    70,115,2,0,0,0,46,46,122,2,46,46,84,41,12,114,
+    40,0,0,0,114,67,0,0,0,114,68,0,0,0,114,69,
+    0,0,0,114,70,0,0,0,114,71,0,0,0,114,34,0,
+    0,0,114,35,0,0,0,114,4,0,0,0,114,26,0,0,
+    0,90,6,115,116,95,100,101,118,90,6,115,116,95,105,110,
+    111,41,8,114,36,0,0,0,218,2,115,49,90,6,112,97,
+    114,101,110,116,218,2,115,50,90,4,100,101,118,49,90,4,
+    100,101,118,50,90,4,105,110,111,49,90,4,105,110,111,50,
+    114,37,0,0,0,114,37,0,0,0,114,38,0,0,0,114,
+    13,0,0,0,188,0,0,0,115,46,0,0,0,0,2,2,
+    1,14,1,14,2,6,3,12,1,4,2,10,1,12,2,10,
+    1,8,1,2,1,14,1,14,1,6,2,6,1,6,1,8,
+    1,4,1,6,1,6,1,8,1,4,1,99,1,0,0,0,
+    0,0,0,0,9,0,0,0,12,0,0,0,67,0,0,0,
+    115,24,1,0,0,116,0,160,1,124,0,161,1,125,0,116,
+    2,124,0,116,3,131,2,114,26,100,1,125,1,110,4,100,
+    2,125,1,124,0,160,4,124,1,161,1,115,44,124,0,83,
+    0,116,5,124,0,131,1,125,2,124,0,160,6,124,2,100,
+    3,161,2,125,3,124,3,100,4,107,0,114,80,116,7,124,
+    0,131,1,125,3,124,3,100,3,107,2,114,136,100,5,116,
+    0,106,8,107,7,114,124,100,4,100,6,108,9,125,4,124,
+    4,160,10,116,0,160,11,161,0,161,1,106,12,125,5,113,
+    218,116,0,106,8,100,5,25,0,125,5,110,82,100,4,100,
+    6,108,9,125,4,124,0,100,3,124,3,133,2,25,0,125,
+    6,116,2,124,6,116,3,131,2,114,176,116,13,124,6,100,
+    7,131,2,125,6,121,14,124,4,160,14,124,6,161,1,125,
+    7,87,0,110,20,4,0,116,15,107,10,114,210,1,0,1,
+    0,1,0,124,0,83,0,88,0,124,7,106,12,125,5,116,
+    2,124,0,116,3,131,2,114,244,116,0,160,16,124,5,161,
+    1,125,5,100,8,125,8,110,4,100,9,125,8,124,5,160,
+    17,124,8,161,1,125,5,124,5,124,0,124,3,100,6,133,
+    2,25,0,23,0,144,1,112,22,124,8,83,0,41,10,122,
+    79,69,120,112,97,110,100,32,126,32,97,110,100,32,126,117,
+    115,101,114,32,99,111,110,115,116,114,117,99,116,105,111,110,
+    115,46,32,32,73,102,32,117,115,101,114,32,111,114,32,36,
+    72,79,77,69,32,105,115,32,117,110,107,110,111,119,110,44,
+    10,32,32,32,32,100,111,32,110,111,116,104,105,110,103,46,
+    243,1,0,0,0,126,250,1,126,114,58,0,0,0,114,0,
+    0,0,0,90,4,72,79,77,69,78,218,5,65,83,67,73,
+    73,114,33,0,0,0,114,31,0,0,0,41,18,114,40,0,
+    0,0,114,41,0,0,0,114,34,0,0,0,114,35,0,0,
+    0,114,48,0,0,0,114,39,0,0,0,218,4,102,105,110,
+    100,114,60,0,0,0,218,7,101,110,118,105,114,111,110,218,
+    3,112,119,100,90,8,103,101,116,112,119,117,105,100,90,6,
+    103,101,116,117,105,100,90,6,112,119,95,100,105,114,114,42,
+    0,0,0,90,8,103,101,116,112,119,110,97,109,218,8,75,
+    101,121,69,114,114,111,114,218,8,102,115,101,110,99,111,100,
+    101,114,61,0,0,0,41,9,114,36,0,0,0,90,5,116,
+    105,108,100,101,114,20,0,0,0,114,62,0,0,0,114,79,
+    0,0,0,90,8,117,115,101,114,104,111,109,101,218,4,110,
+    97,109,101,90,5,112,119,101,110,116,90,4,114,111,111,116,
+    114,37,0,0,0,114,37,0,0,0,114,38,0,0,0,114,
+    14,0,0,0,230,0,0,0,115,60,0,0,0,0,3,10,
+    1,10,1,6,2,4,1,10,1,4,1,8,1,12,1,8,
+    1,8,1,8,1,10,1,8,1,18,2,12,2,8,1,12,
+    1,10,1,10,1,2,1,14,1,14,1,6,1,6,1,10,
+    1,10,1,6,2,4,1,10,1,99,1,0,0,0,0,0,
+    0,0,12,0,0,0,12,0,0,0,67,0,0,0,115,92,
+    1,0,0,116,0,160,1,124,0,161,1,125,0,116,2,124,
+    0,116,3,131,2,114,86,100,1,124,0,107,7,114,32,124,
+    0,83,0,116,4,115,58,100,2,100,3,108,5,125,1,124,
+    1,160,6,100,4,124,1,106,7,161,2,97,4,116,4,106,
+    8,125,2,100,5,125,3,100,6,125,4,116,9,116,0,100,
+    7,100,3,131,3,125,5,110,58,100,8,124,0,107,7,114,
+    98,124,0,83,0,116,10,115,124,100,2,100,3,108,5,125,
+    1,124,1,160,6,100,9,124,1,106,7,161,2,97,10,116,
+    10,106,8,125,2,100,10,125,3,100,11,125,4,116,0,106,
+    11,125,5,100,2,125,6,120,194,124,2,124,0,124,6,131,
+    2,125,7,124,7,115,166,80,0,124,7,160,12,100,2,161,
+    1,92,2,125,6,125,8,124,7,160,13,100,12,161,1,125,
+    9,124,9,160,14,124,3,161,1,114,222,124,9,160,15,124,
+    4,161,1,114,222,124,9,100,12,100,13,133,2,25,0,125,
+    9,121,46,124,5,100,3,107,8,144,1,114,2,116,0,160,
+    16,116,0,106,11,116,0,160,17,124,9,161,1,25,0,161,
+    1,125,10,110,8,124,5,124,9,25,0,125,10,87,0,110,
+    26,4,0,116,18,107,10,144,1,114,38,1,0,1,0,1,
+    0,124,8,125,6,89,0,113,150,88,0,124,0,124,8,100,
+    3,133,2,25,0,125,11,124,0,100,3,124,6,133,2,25,
+    0,124,10,23,0,125,0,116,19,124,0,131,1,125,6,124,
+    0,124,11,55,0,125,0,113,150,87,0,124,0,83,0,41,
+    14,122,90,69,120,112,97,110,100,32,115,104,101,108,108,32,
+    118,97,114,105,97,98,108,101,115,32,111,102,32,102,111,114,
+    109,32,36,118,97,114,32,97,110,100,32,36,123,118,97,114,
+    125,46,32,32,85,110,107,110,111,119,110,32,118,97,114,105,
+    97,98,108,101,115,10,32,32,32,32,97,114,101,32,108,101,
+    102,116,32,117,110,99,104,97,110,103,101,100,46,243,1,0,
+    0,0,36,114,0,0,0,0,78,115,17,0,0,0,92,36,
+    40,92,119,43,124,92,123,91,94,125,93,42,92,125,41,243,
+    1,0,0,0,123,243,1,0,0,0,125,90,8,101,110,118,
+    105,114,111,110,98,250,1,36,122,17,92,36,40,92,119,43,
+    124,92,123,91,94,125,93,42,92,125,41,250,1,123,250,1,
+    125,114,58,0,0,0,233,255,255,255,255,41,20,114,40,0,
+    0,0,114,41,0,0,0,114,34,0,0,0,114,35,0,0,
+    0,218,9,95,118,97,114,112,114,111,103,98,218,2,114,101,
+    218,7,99,111,109,112,105,108,101,114,76,0,0,0,218,6,
+    115,101,97,114,99,104,218,7,103,101,116,97,116,116,114,218,
+    8,95,118,97,114,112,114,111,103,114,78,0,0,0,90,4,
+    115,112,97,110,90,5,103,114,111,117,112,114,48,0,0,0,
+    114,50,0,0,0,114,81,0,0,0,90,8,102,115,100,101,
+    99,111,100,101,114,80,0,0,0,114,60,0,0,0,41,12,
+    114,36,0,0,0,114,91,0,0,0,114,93,0,0,0,218,
+    5,115,116,97,114,116,218,3,101,110,100,114,78,0,0,0,
+    114,62,0,0,0,218,1,109,218,1,106,114,82,0,0,0,
+    218,5,118,97,108,117,101,114,64,0,0,0,114,37,0,0,
+    0,114,37,0,0,0,114,38,0,0,0,114,15,0,0,0,
+    20,1,0,0,115,80,0,0,0,0,3,10,2,10,1,8,
+    1,4,1,4,1,8,1,14,1,6,1,4,1,4,1,14,
+    2,8,1,4,1,4,1,8,1,14,1,6,1,4,1,4,
+    1,6,1,4,1,2,1,10,1,4,1,2,1,14,1,10,
+    1,20,1,12,1,2,1,10,1,24,2,12,1,16,1,10,
+    2,12,1,16,1,8,1,12,1,99,1,0,0,0,0,0,
+    0,0,9,0,0,0,4,0,0,0,67,0,0,0,115,254,
+    0,0,0,116,0,160,1,124,0,161,1,125,0,116,2,124,
+    0,116,3,131,2,114,38,100,1,125,1,100,2,125,2,100,
+    3,125,3,100,4,125,4,110,16,100,5,125,1,100,6,125,
+    2,100,7,125,3,100,8,125,4,124,0,124,2,107,2,114,
+    66,124,3,83,0,124,0,160,4,124,1,161,1,125,5,124,
+    5,114,114,124,0,160,4,124,1,100,9,20,0,161,1,114,
+    114,124,0,160,4,124,1,100,10,20,0,161,1,12,0,114,
+    114,100,9,125,5,124,0,160,5,124,1,161,1,125,6,103,
+    0,125,7,120,86,124,6,68,0,93,78,125,8,124,8,124,
+    2,124,3,102,2,107,6,114,152,113,134,124,8,124,4,107,
+    3,115,188,124,5,12,0,114,172,124,7,12,0,115,188,124,
+    7,114,200,124,7,100,12,25,0,124,4,107,2,114,200,124,
+    7,160,6,124,8,161,1,1,0,113,134,124,7,114,134,124,
+    7,160,7,161,0,1,0,113,134,87,0,124,7,125,6,124,
+    1,160,8,124,6,161,1,125,0,124,5,114,246,124,1,124,
+    5,20,0,124,0,23,0,125,0,124,0,112,252,124,3,83,
+    0,41,13,122,48,78,111,114,109,97,108,105,122,101,32,112,
+    97,116,104,44,32,101,108,105,109,105,110,97,116,105,110,103,
+    32,100,111,117,98,108,101,32,115,108,97,115,104,101,115,44,
+    32,101,116,99,46,114,33,0,0,0,243,0,0,0,0,114,
+    65,0,0,0,115,2,0,0,0,46,46,114,31,0,0,0,
+    218,0,114,30,0,0,0,122,2,46,46,233,2,0,0,0,
+    233,3,0,0,0,114,58,0,0,0,114,89,0,0,0,41,
+    9,114,40,0,0,0,114,41,0,0,0,114,34,0,0,0,
+    114,35,0,0,0,114,48,0,0,0,114,6,0,0,0,218,
+    6,97,112,112,101,110,100,218,3,112,111,112,114,4,0,0,
+    0,41,9,114,36,0,0,0,114,20,0,0,0,90,5,101,
+    109,112,116,121,90,3,100,111,116,90,6,100,111,116,100,111,
+    116,90,15,105,110,105,116,105,97,108,95,115,108,97,115,104,
+    101,115,90,5,99,111,109,112,115,90,9,110,101,119,95,99,
+    111,109,112,115,90,4,99,111,109,112,114,37,0,0,0,114,
+    37,0,0,0,114,38,0,0,0,114,16,0,0,0,73,1,
+    0,0,115,62,0,0,0,0,2,10,1,10,1,4,1,4,
+    1,4,1,6,2,4,1,4,1,4,1,4,1,8,1,4,
+    1,10,3,4,1,30,1,4,1,10,1,4,1,10,1,12,
+    1,2,1,20,1,16,1,12,1,4,1,12,1,4,1,10,
+    1,4,1,12,1,99,1,0,0,0,0,0,0,0,2,0,
+    0,0,3,0,0,0,67,0,0,0,115,64,0,0,0,116,
+    0,160,1,124,0,161,1,125,0,116,2,124,0,131,1,115,
+    56,116,3,124,0,116,4,131,2,114,38,116,0,160,5,161,
+    0,125,1,110,8,116,0,160,6,161,0,125,1,116,7,124,
+    1,124,0,131,2,125,0,116,8,124,0,131,1,83,0,41,
+    1,122,24,82,101,116,117,114,110,32,97,110,32,97,98,115,
+    111,108,117,116,101,32,112,97,116,104,46,41,9,114,40,0,
+    0,0,114,41,0,0,0,114,3,0,0,0,114,34,0,0,
+    0,114,35,0,0,0,90,7,103,101,116,99,119,100,98,90,
+    6,103,101,116,99,119,100,114,4,0,0,0,114,16,0,0,
+    0,41,2,114,36,0,0,0,90,3,99,119,100,114,37,0,
+    0,0,114,37,0,0,0,114,38,0,0,0,114,17,0,0,
+    0,111,1,0,0,115,14,0,0,0,0,2,10,1,8,1,
+    10,1,10,2,8,1,10,1,99,1,0,0,0,0,0,0,
+    0,3,0,0,0,4,0,0,0,67,0,0,0,115,42,0,
+    0,0,116,0,160,1,124,0,161,1,125,0,116,2,124,0,
+    100,1,100,2,133,2,25,0,124,0,105,0,131,3,92,2,
+    125,1,125,2,116,3,124,1,131,1,83,0,41,3,122,108,
+    82,101,116,117,114,110,32,116,104,101,32,99,97,110,111,110,
+    105,99,97,108,32,112,97,116,104,32,111,102,32,116,104,101,
+    32,115,112,101,99,105,102,105,101,100,32,102,105,108,101,110,
+    97,109,101,44,32,101,108,105,109,105,110,97,116,105,110,103,
+    32,97,110,121,10,115,121,109,98,111,108,105,99,32,108,105,
+    110,107,115,32,101,110,99,111,117,110,116,101,114,101,100,32,
+    105,110,32,116,104,101,32,112,97,116,104,46,78,114,0,0,
+    0,0,41,4,114,40,0,0,0,114,41,0,0,0,218,13,
+    95,106,111,105,110,114,101,97,108,112,97,116,104,114,17,0,
+    0,0,41,3,218,8,102,105,108,101,110,97,109,101,114,36,
+    0,0,0,218,2,111,107,114,37,0,0,0,114,37,0,0,
+    0,114,38,0,0,0,114,26,0,0,0,126,1,0,0,115,
+    6,0,0,0,0,3,10,1,24,1,99,3,0,0,0,0,
+    0,0,0,10,0,0,0,5,0,0,0,67,0,0,0,115,
+    30,1,0,0,116,0,124,0,116,1,131,2,114,24,100,1,
+    125,3,100,2,125,4,100,3,125,5,110,12,100,4,125,3,
+    100,5,125,4,100,6,125,5,116,2,124,1,131,1,114,60,
+    124,1,100,7,100,0,133,2,25,0,125,1,124,3,125,0,
+    120,216,124,1,144,1,114,20,124,1,160,3,124,3,161,1,
+    92,3,125,6,125,7,125,1,124,6,12,0,115,62,124,6,
+    124,4,107,2,114,100,113,62,124,6,124,5,107,2,114,152,
+    124,0,114,146,116,4,124,0,131,1,92,2,125,0,125,6,
+    124,6,124,5,107,2,114,150,116,5,124,0,124,5,124,5,
+    131,3,125,0,113,62,124,5,125,0,113,62,116,5,124,0,
+    124,6,131,2,125,8,116,6,124,8,131,1,115,176,124,8,
+    125,0,113,62,124,8,124,2,107,6,114,216,124,2,124,8,
+    25,0,125,0,124,0,100,0,107,9,114,202,113,62,116,5,
+    124,8,124,1,131,2,100,8,102,2,83,0,100,0,124,2,
+    124,8,60,0,116,7,124,0,116,8,160,9,124,8,161,1,
+    124,2,131,3,92,2,125,0,125,9,124,9,144,1,115,10,
+    116,5,124,0,124,1,131,2,100,8,102,2,83,0,124,0,
+    124,2,124,8,60,0,113,62,87,0,124,0,100,9,102,2,
+    83,0,41,10,78,114,33,0,0,0,114,65,0,0,0,115,
+    2,0,0,0,46,46,114,31,0,0,0,114,30,0,0,0,
+    122,2,46,46,114,58,0,0,0,70,84,41,10,114,34,0,
+    0,0,114,35,0,0,0,114,3,0,0,0,218,9,112,97,
+    114,116,105,116,105,111,110,114,6,0,0,0,114,4,0,0,
+    0,114,11,0,0,0,114,107,0,0,0,114,40,0,0,0,
+    90,8,114,101,97,100,108,105,110,107,41,10,114,36,0,0,
+    0,90,4,114,101,115,116,90,4,115,101,101,110,114,20,0,
+    0,0,114,18,0,0,0,114,19,0,0,0,114,82,0,0,
+    0,218,1,95,90,7,110,101,119,112,97,116,104,114,109,0,
+    0,0,114,37,0,0,0,114,37,0,0,0,114,38,0,0,
+    0,114,107,0,0,0,135,1,0,0,115,72,0,0,0,0,
+    1,10,1,4,1,4,1,6,2,4,1,4,1,4,2,8,
+    1,12,1,4,2,8,1,16,1,14,2,2,1,8,2,4,
+    1,12,1,8,1,14,2,4,1,2,1,10,1,8,1,4,
+    1,2,2,8,2,8,1,8,2,2,3,14,1,8,1,22,
+    1,6,1,14,1,12,2,114,107,0,0,0,90,6,100,97,
+    114,119,105,110,99,2,0,0,0,0,0,0,0,9,0,0,
+    0,14,0,0,0,67,0,0,0,115,242,0,0,0,124,0,
+    115,12,116,0,100,1,131,1,130,1,116,1,160,2,124,0,
+    161,1,125,0,116,3,124,0,116,4,131,2,114,46,100,2,
+    125,2,100,3,125,3,100,4,125,4,110,12,100,5,125,2,
+    100,6,125,3,100,7,125,4,124,1,100,8,107,8,114,72,
+    124,2,125,1,110,10,116,1,160,2,124,1,161,1,125,1,
+    121,110,100,9,100,10,132,0,116,5,124,1,131,1,160,6,
+    124,3,161,1,68,0,131,1,125,5,100,11,100,10,132,0,
+    116,5,124,0,131,1,160,6,124,3,161,1,68,0,131,1,
+    125,6,116,7,116,8,124,5,124,6,103,2,131,1,131,1,
+    125,7,124,4,103,1,116,7,124,5,131,1,124,7,24,0,
+    20,0,124,6,124,7,100,8,133,2,25,0,23,0,125,8,
+    124,8,115,186,124,2,83,0,116,9,124,8,142,0,83,0,
+    4,0,116,10,116,11,116,12,116,13,102,4,107,10,114,236,
+    1,0,1,0,1,0,116,14,160,15,100,12,124,0,124,1,
+    161,3,1,0,130,0,89,0,110,2,88,0,100,8,83,0,
+    41,13,122,35,82,101,116,117,114,110,32,97,32,114,101,108,
+    97,116,105,118,101,32,118,101,114,115,105,111,110,32,111,102,
+    32,97,32,112,97,116,104,122,17,110,111,32,112,97,116,104,
+    32,115,112,101,99,105,102,105,101,100,114,65,0,0,0,114,
+    33,0,0,0,115,2,0,0,0,46,46,114,30,0,0,0,
+    114,31,0,0,0,122,2,46,46,78,99,1,0,0,0,0,
+    0,0,0,2,0,0,0,3,0,0,0,83,0,0,0,115,
+    20,0,0,0,103,0,124,0,93,12,125,1,124,1,114,4,
+    124,1,145,2,113,4,83,0,114,37,0,0,0,114,37,0,
+    0,0,41,2,218,2,46,48,218,1,120,114,37,0,0,0,
+    114,37,0,0,0,114,38,0,0,0,250,10,60,108,105,115,
+    116,99,111,109,112,62,210,1,0,0,115,2,0,0,0,6,
+    0,122,27,114,101,108,112,97,116,104,46,60,108,111,99,97,
+    108,115,62,46,60,108,105,115,116,99,111,109,112,62,99,1,
+    0,0,0,0,0,0,0,2,0,0,0,3,0,0,0,83,
+    0,0,0,115,20,0,0,0,103,0,124,0,93,12,125,1,
+    124,1,114,4,124,1,145,2,113,4,83,0,114,37,0,0,
+    0,114,37,0,0,0,41,2,114,112,0,0,0,114,113,0,
+    0,0,114,37,0,0,0,114,37,0,0,0,114,38,0,0,
+    0,114,114,0,0,0,211,1,0,0,115,2,0,0,0,6,
+    0,114,28,0,0,0,41,16,218,10,86,97,108,117,101,69,
+    114,114,111,114,114,40,0,0,0,114,41,0,0,0,114,34,
+    0,0,0,114,35,0,0,0,114,17,0,0,0,114,6,0,
+    0,0,114,60,0,0,0,114,10,0,0,0,114,4,0,0,
+    0,114,43,0,0,0,114,51,0,0,0,114,52,0,0,0,
+    218,18,68,101,112,114,101,99,97,116,105,111,110,87,97,114,
+    110,105,110,103,114,53,0,0,0,114,54,0,0,0,41,9,
+    114,36,0,0,0,114,96,0,0,0,114,18,0,0,0,114,
+    20,0,0,0,114,19,0,0,0,90,10,115,116,97,114,116,
+    95,108,105,115,116,90,9,112,97,116,104,95,108,105,115,116,
+    114,62,0,0,0,90,8,114,101,108,95,108,105,115,116,114,
+    37,0,0,0,114,37,0,0,0,114,38,0,0,0,114,28,
+    0,0,0,188,1,0,0,115,48,0,0,0,0,3,4,1,
+    8,2,10,1,10,1,4,1,4,1,6,2,4,1,4,1,
+    4,2,8,1,6,2,10,2,2,1,24,1,24,2,16,2,
+    30,1,4,1,4,1,8,1,22,1,14,1,99,1,0,0,
+    0,0,0,0,0,9,0,0,0,18,0,0,0,3,0,0,
+    0,115,50,1,0,0,124,0,115,12,116,0,100,1,131,1,
+    130,1,116,1,116,2,116,3,106,4,124,0,131,2,131,1,
+    125,0,116,5,124,0,100,2,25,0,116,6,131,2,114,52,
+    100,3,137,1,100,4,137,0,110,8,100,5,137,1,100,6,
+    137,0,121,198,135,1,102,1,100,7,100,8,132,8,124,0,
+    68,0,131,1,125,1,121,28,116,7,135,1,102,1,100,9,
+    100,10,132,8,124,0,68,0,131,1,131,1,92,1,125,2,
+    87,0,110,30,4,0,116,0,107,10,114,138,1,0,1,0,
+    1,0,116,0,100,11,131,1,100,12,130,2,89,0,110,2,
+    88,0,135,0,102,1,100,13,100,8,132,8,124,1,68,0,
+    131,1,125,1,116,8,124,1,131,1,125,3,116,9,124,1,
+    131,1,125,4,124,3,125,5,120,46,116,10,124,3,131,1,
+    68,0,93,34,92,2,125,6,125,7,124,7,124,4,124,6,
+    25,0,107,3,114,188,124,3,100,12,124,6,133,2,25,0,
+    125,5,80,0,113,188,87,0,124,2,114,234,136,1,110,10,
+    136,1,100,12,100,2,133,2,25,0,125,8,124,8,136,1,
+    160,11,124,5,161,1,23,0,83,0,4,0,116,12,116,13,
+    102,2,107,10,144,1,114,44,1,0,1,0,1,0,116,14,
+    106,15,100,15,124,0,158,2,142,0,1,0,130,0,89,0,
+    110,2,88,0,100,12,83,0,41,16,122,68,71,105,118,101,
+    110,32,97,32,115,101,113,117,101,110,99,101,32,111,102,32,
+    112,97,116,104,32,110,97,109,101,115,44,32,114,101,116,117,
+    114,110,115,32,116,104,101,32,108,111,110,103,101,115,116,32,
+    99,111,109,109,111,110,32,115,117,98,45,112,97,116,104,46,
+    122,37,99,111,109,109,111,110,112,97,116,104,40,41,32,97,
+    114,103,32,105,115,32,97,110,32,101,109,112,116,121,32,115,
+    101,113,117,101,110,99,101,114,0,0,0,0,114,33,0,0,
+    0,114,65,0,0,0,114,31,0,0,0,114,30,0,0,0,
+    99,1,0,0,0,0,0,0,0,2,0,0,0,5,0,0,
+    0,19,0,0,0,115,22,0,0,0,103,0,124,0,93,14,
+    125,1,124,1,160,0,136,0,161,1,145,2,113,4,83,0,
+    114,37,0,0,0,41,1,114,6,0,0,0,41,2,114,112,
+    0,0,0,114,36,0,0,0,41,1,114,20,0,0,0,114,
+    37,0,0,0,114,38,0,0,0,114,114,0,0,0,244,1,
+    0,0,115,2,0,0,0,6,0,122,30,99,111,109,109,111,
+    110,112,97,116,104,46,60,108,111,99,97,108,115,62,46,60,
+    108,105,115,116,99,111,109,112,62,99,1,0,0,0,0,0,
+    0,0,2,0,0,0,4,0,0,0,51,0,0,0,115,30,
+    0,0,0,124,0,93,22,125,1,124,1,100,0,100,1,133,
+    2,25,0,136,0,107,2,86,0,1,0,113,2,100,0,83,
+    0,41,2,78,114,58,0,0,0,114,37,0,0,0,41,2,
+    114,112,0,0,0,114,56,0,0,0,41,1,114,20,0,0,
+    0,114,37,0,0,0,114,38,0,0,0,250,9,60,103,101,
+    110,101,120,112,114,62,247,1,0,0,115,2,0,0,0,4,
+    0,122,29,99,111,109,109,111,110,112,97,116,104,46,60,108,
+    111,99,97,108,115,62,46,60,103,101,110,101,120,112,114,62,
+    122,37,67,97,110,39,116,32,109,105,120,32,97,98,115,111,
+    108,117,116,101,32,97,110,100,32,114,101,108,97,116,105,118,
+    101,32,112,97,116,104,115,78,99,1,0,0,0,0,0,0,
+    0,2,0,0,0,5,0,0,0,19,0,0,0,115,30,0,
+    0,0,103,0,124,0,93,22,125,1,135,0,102,1,100,0,
+    100,1,132,8,124,1,68,0,131,1,145,2,113,4,83,0,
+    41,2,99,1,0,0,0,0,0,0,0,2,0,0,0,4,
+    0,0,0,19,0,0,0,115,28,0,0,0,103,0,124,0,
+    93,20,125,1,124,1,114,4,124,1,136,0,107,3,114,4,
+    124,1,145,2,113,4,83,0,114,37,0,0,0,114,37,0,
+    0,0,41,2,114,112,0,0,0,218,1,99,41,1,114,18,
+    0,0,0,114,37,0,0,0,114,38,0,0,0,114,114,0,
+    0,0,251,1,0,0,115,2,0,0,0,6,0,122,41,99,
+    111,109,109,111,110,112,97,116,104,46,60,108,111,99,97,108,
+    115,62,46,60,108,105,115,116,99,111,109,112,62,46,60,108,
+    105,115,116,99,111,109,112,62,114,37,0,0,0,41,2,114,
+    112,0,0,0,114,47,0,0,0,41,1,114,18,0,0,0,
+    114,37,0,0,0,114,38,0,0,0,114,114,0,0,0,251,
+    1,0,0,115,2,0,0,0,6,0,114,29,0,0,0,41,
+    1,114,29,0,0,0,41,16,114,115,0,0,0,218,5,116,
+    117,112,108,101,114,49,0,0,0,114,40,0,0,0,114,41,
+    0,0,0,114,34,0,0,0,114,35,0,0,0,218,3,115,
+    101,116,218,3,109,105,110,218,3,109,97,120,218,9,101,110,
+    117,109,101,114,97,116,101,114,4,0,0,0,114,43,0,0,
+    0,114,51,0,0,0,114,53,0,0,0,114,54,0,0,0,
+    41,9,90,5,112,97,116,104,115,90,11,115,112,108,105,116,
+    95,112,97,116,104,115,114,3,0,0,0,114,72,0,0,0,
+    114,73,0,0,0,90,6,99,111,109,109,111,110,114,62,0,
+    0,0,114,118,0,0,0,218,6,112,114,101,102,105,120,114,
+    37,0,0,0,41,2,114,18,0,0,0,114,20,0,0,0,
+    114,38,0,0,0,114,29,0,0,0,229,1,0,0,115,54,
+    0,0,0,0,3,4,1,8,2,16,1,14,1,4,1,6,
+    2,4,1,4,2,2,1,18,2,2,1,28,1,14,1,16,
+    2,18,1,8,1,8,1,4,1,18,1,12,1,12,1,6,
+    2,20,1,14,1,20,1,14,1,41,1,78,41,39,218,7,
+    95,95,100,111,99,95,95,114,40,0,0,0,218,3,115,121,
+    115,114,69,0,0,0,114,53,0,0,0,90,7,95,95,97,
+    108,108,95,95,114,18,0,0,0,114,19,0,0,0,114,24,
+    0,0,0,114,20,0,0,0,114,21,0,0,0,114,22,0,
+    0,0,114,23,0,0,0,114,25,0,0,0,114,39,0,0,
+    0,114,2,0,0,0,114,3,0,0,0,114,4,0,0,0,
+    114,6,0,0,0,114,7,0,0,0,114,66,0,0,0,114,
+    5,0,0,0,114,8,0,0,0,114,9,0,0,0,114,11,
+    0,0,0,114,12,0,0,0,114,13,0,0,0,114,14,0,
+    0,0,114,95,0,0,0,114,90,0,0,0,114,15,0,0,
+    0,114,16,0,0,0,114,17,0,0,0,114,26,0,0,0,
+    114,107,0,0,0,218,8,112,108,97,116,102,111,114,109,114,
+    27,0,0,0,114,28,0,0,0,114,29,0,0,0,114,37,
+    0,0,0,114,37,0,0,0,114,37,0,0,0,114,38,0,
+    0,0,218,8,60,109,111,100,117,108,101,62,11,0,0,0,
+    115,90,0,0,0,4,2,8,1,8,1,8,1,8,1,8,
+    2,12,1,10,1,14,1,10,1,6,1,14,1,8,1,6,
+    4,4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,
+    2,8,11,8,12,8,11,8,29,8,17,8,9,10,5,8,
+    9,8,10,8,14,8,10,8,12,8,42,8,43,4,1,4,
+    2,8,53,8,38,8,15,8,9,8,51,10,2,10,41,
+};
+static const unsigned char _Py_M__ntpath[] = {
+    99,0,0,0,0,0,0,0,0,0,0,0,0,38,0,0,
+    0,64,0,0,0,115,48,2,0,0,100,0,90,0,100,1,
+    100,2,108,1,90,1,100,1,100,2,108,2,90,2,100,1,
+    100,2,108,3,90,3,100,1,100,2,108,4,90,4,100,1,
+    100,3,108,4,84,0,100,4,100,5,100,6,100,7,100,8,
+    100,9,100,10,100,11,100,12,100,13,100,14,100,15,100,16,
+    100,17,100,18,100,19,100,20,100,21,100,22,100,23,100,24,
+    100,25,100,26,100,27,100,28,100,29,100,30,100,31,100,32,
+    100,33,100,34,100,35,100,36,100,37,100,38,100,39,100,40,
+    100,41,103,38,90,5,100,42,90,6,100,43,90,7,100,42,
+    90,8,100,44,90,9,100,45,90,10,100,46,90,11,100,47,
+    90,12,100,48,90,13,100,49,100,50,132,0,90,14,100,51,
+    100,4,132,0,90,15,100,52,100,5,132,0,90,16,100,53,
+    100,6,132,0,90,17,100,54,100,7,132,0,90,18,100,55,
+    100,8,132,0,90,19,100,56,100,9,132,0,90,20,101,4,
+    106,21,106,0,101,20,95,0,100,57,100,10,132,0,90,22,
+    100,58,100,11,132,0,90,23,100,59,100,17,132,0,90,24,
+    100,60,100,19,132,0,90,25,121,16,100,1,100,61,108,26,
+    109,27,90,27,1,0,87,0,110,26,4,0,101,28,107,10,
+    144,1,114,40,1,0,1,0,1,0,100,2,90,27,89,0,
+    110,2,88,0,100,62,100,22,132,0,90,29,100,63,100,23,
+    132,0,90,30,100,64,100,24,132,0,90,31,100,65,100,25,
+    132,0,90,32,121,16,100,1,100,66,108,26,109,33,90,33,
+    1,0,87,0,110,30,4,0,101,28,107,10,144,1,114,120,
+    1,0,1,0,1,0,100,67,100,26,132,0,90,34,89,0,
+    110,10,88,0,100,68,100,26,132,0,90,34,101,34,90,35,
+    101,36,101,2,100,69,131,2,144,1,111,160,101,2,160,37,
+    161,0,100,70,25,0,100,71,107,5,90,38,100,79,100,72,
+    100,37,132,1,90,39,100,73,100,41,132,0,90,40,121,44,
+    101,2,160,37,161,0,100,2,100,71,133,2,25,0,100,80,
+    107,5,144,1,114,218,100,1,100,75,108,26,109,41,90,41,
+    1,0,110,4,101,28,130,1,87,0,110,34,4,0,101,42,
+    101,28,102,2,107,10,144,2,114,2,1,0,1,0,1,0,
+    100,76,100,77,132,0,90,41,89,0,110,2,88,0,121,16,
+    100,1,100,78,108,26,109,43,90,44,1,0,87,0,110,22,
+    4,0,101,28,107,10,144,2,114,42,1,0,1,0,1,0,
+    89,0,110,2,88,0,100,2,83,0,41,81,122,144,67,111,
+    109,109,111,110,32,112,97,116,104,110,97,109,101,32,109,97,
+    110,105,112,117,108,97,116,105,111,110,115,44,32,87,105,110,
+    100,111,119,115,78,84,47,57,53,32,118,101,114,115,105,111,
+    110,46,10,10,73,110,115,116,101,97,100,32,111,102,32,105,
+    109,112,111,114,116,105,110,103,32,116,104,105,115,32,109,111,
+    100,117,108,101,32,100,105,114,101,99,116,108,121,44,32,105,
+    109,112,111,114,116,32,111,115,32,97,110,100,32,114,101,102,
+    101,114,32,116,111,32,116,104,105,115,10,109,111,100,117,108,
+    101,32,97,115,32,111,115,46,112,97,116,104,46,10,233,0,
+    0,0,0,78,41,1,218,1,42,218,8,110,111,114,109,99,
+    97,115,101,218,5,105,115,97,98,115,218,4,106,111,105,110,
+    218,10,115,112,108,105,116,100,114,105,118,101,218,5,115,112,
+    108,105,116,218,8,115,112,108,105,116,101,120,116,218,8,98,
+    97,115,101,110,97,109,101,218,7,100,105,114,110,97,109,101,
+    90,12,99,111,109,109,111,110,112,114,101,102,105,120,90,7,
+    103,101,116,115,105,122,101,90,8,103,101,116,109,116,105,109,
+    101,90,8,103,101,116,97,116,105,109,101,90,8,103,101,116,
+    99,116,105,109,101,218,6,105,115,108,105,110,107,90,6,101,
+    120,105,115,116,115,218,7,108,101,120,105,115,116,115,218,5,
+    105,115,100,105,114,90,6,105,115,102,105,108,101,218,7,105,
+    115,109,111,117,110,116,218,10,101,120,112,97,110,100,117,115,
+    101,114,218,10,101,120,112,97,110,100,118,97,114,115,218,8,
+    110,111,114,109,112,97,116,104,218,7,97,98,115,112,97,116,
+    104,218,6,99,117,114,100,105,114,218,6,112,97,114,100,105,
+    114,218,3,115,101,112,218,7,112,97,116,104,115,101,112,218,
+    7,100,101,102,112,97,116,104,218,6,97,108,116,115,101,112,
+    218,6,101,120,116,115,101,112,218,7,100,101,118,110,117,108,
+    108,218,8,114,101,97,108,112,97,116,104,218,26,115,117,112,
+    112,111,114,116,115,95,117,110,105,99,111,100,101,95,102,105,
+    108,101,110,97,109,101,115,218,7,114,101,108,112,97,116,104,
+    90,8,115,97,109,101,102,105,108,101,90,12,115,97,109,101,
+    111,112,101,110,102,105,108,101,90,8,115,97,109,101,115,116,
+    97,116,218,10,99,111,109,109,111,110,112,97,116,104,218,1,
+    46,122,2,46,46,250,1,92,250,1,59,250,1,47,122,8,
+    46,59,67,58,92,98,105,110,90,3,110,117,108,99,1,0,
+    0,0,0,0,0,0,1,0,0,0,3,0,0,0,67,0,
+    0,0,115,22,0,0,0,116,0,124,0,116,1,131,2,114,
+    14,100,1,83,0,100,2,83,0,100,0,83,0,41,3,78,
+    115,2,0,0,0,92,47,122,2,92,47,41,2,218,10,105,
+    115,105,110,115,116,97,110,99,101,218,5,98,121,116,101,115,
+    41,1,218,4,112,97,116,104,169,0,114,37,0,0,0,250,
+    18,60,115,116,100,108,105,98,62,47,110,116,112,97,116,104,
+    46,112,121,218,13,95,103,101,116,95,98,111,116,104,115,101,
+    112,115,33,0,0,0,115,6,0,0,0,0,1,10,1,4,
+    2,114,39,0,0,0,99,1,0,0,0,0,0,0,0,1,
+    0,0,0,12,0,0,0,67,0,0,0,115,120,0,0,0,
+    116,0,160,1,124,0,161,1,125,0,121,46,116,2,124,0,
+    116,3,131,2,114,38,124,0,160,4,100,1,100,2,161,2,
+    160,5,161,0,83,0,124,0,160,4,100,3,100,4,161,2,
+    160,5,161,0,83,0,87,0,110,58,4,0,116,6,116,7,
+    102,2,107,10,114,114,1,0,1,0,1,0,116,2,124,0,
+    116,3,116,8,102,2,131,2,115,108,116,6,100,5,124,0,
+    106,9,106,10,22,0,131,1,100,6,130,2,130,0,89,0,
+    110,2,88,0,100,6,83,0,41,7,122,97,78,111,114,109,
+    97,108,105,122,101,32,99,97,115,101,32,111,102,32,112,97,
+    116,104,110,97,109,101,46,10,10,32,32,32,32,77,97,107,
+    101,115,32,97,108,108,32,99,104,97,114,97,99,116,101,114,
+    115,32,108,111,119,101,114,99,97,115,101,32,97,110,100,32,
+    97,108,108,32,115,108,97,115,104,101,115,32,105,110,116,111,
+    32,98,97,99,107,115,108,97,115,104,101,115,46,243,1,0,
+    0,0,47,243,1,0,0,0,92,114,33,0,0,0,114,31,
+    0,0,0,122,48,110,111,114,109,99,97,115,101,40,41,32,
+    97,114,103,117,109,101,110,116,32,109,117,115,116,32,98,101,
+    32,115,116,114,32,111,114,32,98,121,116,101,115,44,32,110,
+    111,116,32,37,114,78,41,11,218,2,111,115,218,6,102,115,
+    112,97,116,104,114,34,0,0,0,114,35,0,0,0,218,7,
+    114,101,112,108,97,99,101,218,5,108,111,119,101,114,218,9,
+    84,121,112,101,69,114,114,111,114,218,14,65,116,116,114,105,
+    98,117,116,101,69,114,114,111,114,218,3,115,116,114,218,9,
+    95,95,99,108,97,115,115,95,95,218,8,95,95,110,97,109,
+    101,95,95,41,1,218,1,115,114,37,0,0,0,114,37,0,
+    0,0,114,38,0,0,0,114,2,0,0,0,43,0,0,0,
+    115,20,0,0,0,0,4,10,1,2,1,10,1,16,2,20,
+    1,18,1,14,1,4,1,14,1,99,1,0,0,0,0,0,
+    0,0,1,0,0,0,3,0,0,0,67,0,0,0,115,50,
+    0,0,0,116,0,160,1,124,0,161,1,125,0,116,2,124,
+    0,131,1,100,1,25,0,125,0,116,3,124,0,131,1,100,
+    2,107,4,111,48,124,0,100,2,25,0,116,4,124,0,131,
+    1,107,6,83,0,41,3,122,31,84,101,115,116,32,119,104,
+    101,116,104,101,114,32,97,32,112,97,116,104,32,105,115,32,
+    97,98,115,111,108,117,116,101,233,1,0,0,0,114,0,0,
+    0,0,41,5,114,42,0,0,0,114,43,0,0,0,114,5,
+    0,0,0,218,3,108,101,110,114,39,0,0,0,41,1,114,
+    51,0,0,0,114,37,0,0,0,114,37,0,0,0,114,38,
+    0,0,0,114,3,0,0,0,66,0,0,0,115,6,0,0,
+    0,0,2,10,1,12,1,99,1,0,0,0,0,0,0,0,
+    10,0,0,0,13,0,0,0,71,0,0,0,115,86,1,0,
+    0,116,0,160,1,124,0,161,1,125,0,116,2,124,0,116,
+    3,131,2,114,34,100,1,125,2,100,2,125,3,100,3,125,
+    4,110,12,100,4,125,2,100,5,125,3,100,6,125,4,121,
+    242,124,1,115,68,124,0,100,0,100,7,133,2,25,0,124,
+    2,23,0,1,0,116,4,124,0,131,1,92,2,125,5,125,
+    6,120,144,116,5,116,0,106,1,124,1,131,2,68,0,93,
+    128,125,7,116,4,124,7,131,1,92,2,125,8,125,9,124,
+    9,114,148,124,9,100,7,25,0,124,3,107,6,114,148,124,
+    8,115,136,124,5,12,0,114,140,124,8,125,5,124,9,125,
+    6,113,94,110,42,124,8,114,190,124,8,124,5,107,3,114,
+    190,124,8,160,6,161,0,124,5,160,6,161,0,107,3,114,
+    186,124,8,125,5,124,9,125,6,113,94,124,8,125,5,124,
+    6,114,214,124,6,100,10,25,0,124,3,107,7,114,214,124,
+    6,124,2,23,0,125,6,124,6,124,9,23,0,125,6,113,
+    94,87,0,124,6,144,1,114,26,124,6,100,7,25,0,124,
+    3,107,7,144,1,114,26,124,5,144,1,114,26,124,5,100,
+    11,100,0,133,2,25,0,124,4,107,3,144,1,114,26,124,
+    5,124,2,23,0,124,6,23,0,83,0,124,5,124,6,23,
+    0,83,0,4,0,116,7,116,8,116,9,102,3,107,10,144,
+    1,114,80,1,0,1,0,1,0,116,10,106,11,100,9,124,
+    0,102,2,124,1,158,2,142,0,1,0,130,0,89,0,110,
+    2,88,0,100,0,83,0,41,12,78,114,41,0,0,0,115,
+    2,0,0,0,92,47,243,1,0,0,0,58,114,31,0,0,
+    0,122,2,92,47,250,1,58,114,0,0,0,0,114,52,0,
+    0,0,114,4,0,0,0,233,255,255,255,255,114,56,0,0,
+    0,41,12,114,42,0,0,0,114,43,0,0,0,114,34,0,
+    0,0,114,35,0,0,0,114,5,0,0,0,218,3,109,97,
+    112,114,45,0,0,0,114,46,0,0,0,114,47,0,0,0,
+    218,12,66,121,116,101,115,87,97,114,110,105,110,103,218,11,
+    103,101,110,101,114,105,99,112,97,116,104,218,16,95,99,104,
+    101,99,107,95,97,114,103,95,116,121,112,101,115,41,10,114,
+    36,0,0,0,218,5,112,97,116,104,115,114,20,0,0,0,
+    218,4,115,101,112,115,218,5,99,111,108,111,110,90,12,114,
+    101,115,117,108,116,95,100,114,105,118,101,90,11,114,101,115,
+    117,108,116,95,112,97,116,104,218,1,112,90,7,112,95,100,
+    114,105,118,101,90,6,112,95,112,97,116,104,114,37,0,0,
+    0,114,37,0,0,0,114,38,0,0,0,114,4,0,0,0,
+    74,0,0,0,115,70,0,0,0,0,1,10,1,10,1,4,
+    1,4,1,6,2,4,1,4,1,4,1,2,1,4,1,16,
+    1,12,1,18,1,12,1,16,2,10,1,4,1,4,1,4,
+    1,12,1,16,2,4,1,4,1,2,2,4,2,16,1,8,
+    1,12,2,20,1,24,1,12,1,8,1,22,1,18,1,99,
+    1,0,0,0,0,0,0,0,7,0,0,0,5,0,0,0,
+    67,0,0,0,115,30,1,0,0,116,0,160,1,124,0,161,
+    1,125,0,116,2,124,0,131,1,100,1,107,5,144,1,114,
+    14,116,3,124,0,116,4,131,2,114,48,100,2,125,1,100,
+    3,125,2,100,4,125,3,110,12,100,5,125,1,100,6,125,
+    2,100,7,125,3,124,0,160,5,124,2,124,1,161,2,125,
+    4,124,4,100,8,100,1,133,2,25,0,124,1,100,1,20,
+    0,107,2,114,228,124,4,100,1,100,9,133,2,25,0,124,
+    1,107,3,114,228,124,4,160,6,124,1,100,1,161,2,125,
+    5,124,5,100,12,107,2,114,144,124,0,100,11,100,8,133,
+    2,25,0,124,0,102,2,83,0,124,4,160,6,124,1,124,
+    5,100,10,23,0,161,2,125,6,124,6,124,5,100,10,23,
+    0,107,2,114,188,124,0,100,11,100,8,133,2,25,0,124,
+    0,102,2,83,0,124,6,100,13,107,2,114,204,116,2,124,
+    0,131,1,125,6,124,0,100,11,124,6,133,2,25,0,124,
+    0,124,6,100,11,133,2,25,0,102,2,83,0,124,4,100,
+    10,100,1,133,2,25,0,124,3,107,2,144,1,114,14,124,
+    0,100,11,100,1,133,2,25,0,124,0,100,1,100,11,133,
+    2,25,0,102,2,83,0,124,0,100,11,100,8,133,2,25,
+    0,124,0,102,2,83,0,41,14,97,218,2,0,0,83,112,
+    108,105,116,32,97,32,112,97,116,104,110,97,109,101,32,105,
+    110,116,111,32,100,114,105,118,101,47,85,78,67,32,115,104,
+    97,114,101,112,111,105,110,116,32,97,110,100,32,114,101,108,
+    97,116,105,118,101,32,112,97,116,104,32,115,112,101,99,105,
+    102,105,101,114,115,46,10,32,32,32,32,82,101,116,117,114,
+    110,115,32,97,32,50,45,116,117,112,108,101,32,40,100,114,
+    105,118,101,95,111,114,95,117,110,99,44,32,112,97,116,104,
+    41,59,32,101,105,116,104,101,114,32,112,97,114,116,32,109,
+    97,121,32,98,101,32,101,109,112,116,121,46,10,10,32,32,
+    32,32,73,102,32,121,111,117,32,97,115,115,105,103,110,10,
+    32,32,32,32,32,32,32,32,114,101,115,117,108,116,32,61,
+    32,115,112,108,105,116,100,114,105,118,101,40,112,41,10,32,
+    32,32,32,73,116,32,105,115,32,97,108,119,97,121,115,32,
+    116,114,117,101,32,116,104,97,116,58,10,32,32,32,32,32,
+    32,32,32,114,101,115,117,108,116,91,48,93,32,43,32,114,
+    101,115,117,108,116,91,49,93,32,61,61,32,112,10,10,32,
+    32,32,32,73,102,32,116,104,101,32,112,97,116,104,32,99,
+    111,110,116,97,105,110,101,100,32,97,32,100,114,105,118,101,
+    32,108,101,116,116,101,114,44,32,100,114,105,118,101,95,111,
+    114,95,117,110,99,32,119,105,108,108,32,99,111,110,116,97,
+    105,110,32,101,118,101,114,121,116,104,105,110,103,10,32,32,
+    32,32,117,112,32,116,111,32,97,110,100,32,105,110,99,108,
+    117,100,105,110,103,32,116,104,101,32,99,111,108,111,110,46,
+    32,32,101,46,103,46,32,115,112,108,105,116,100,114,105,118,
+    101,40,34,99,58,47,100,105,114,34,41,32,114,101,116,117,
+    114,110,115,32,40,34,99,58,34,44,32,34,47,100,105,114,
+    34,41,10,10,32,32,32,32,73,102,32,116,104,101,32,112,
+    97,116,104,32,99,111,110,116,97,105,110,101,100,32,97,32,
+    85,78,67,32,112,97,116,104,44,32,116,104,101,32,100,114,
+    105,118,101,95,111,114,95,117,110,99,32,119,105,108,108,32,
+    99,111,110,116,97,105,110,32,116,104,101,32,104,111,115,116,
+    32,110,97,109,101,10,32,32,32,32,97,110,100,32,115,104,
+    97,114,101,32,117,112,32,116,111,32,98,117,116,32,110,111,
+    116,32,105,110,99,108,117,100,105,110,103,32,116,104,101,32,
+    102,111,117,114,116,104,32,100,105,114,101,99,116,111,114,121,
+    32,115,101,112,97,114,97,116,111,114,32,99,104,97,114,97,
+    99,116,101,114,46,10,32,32,32,32,101,46,103,46,32,115,
+    112,108,105,116,100,114,105,118,101,40,34,47,47,104,111,115,
+    116,47,99,111,109,112,117,116,101,114,47,100,105,114,34,41,
+    32,114,101,116,117,114,110,115,32,40,34,47,47,104,111,115,
+    116,47,99,111,109,112,117,116,101,114,34,44,32,34,47,100,
+    105,114,34,41,10,10,32,32,32,32,80,97,116,104,115,32,
+    99,97,110,110,111,116,32,99,111,110,116,97,105,110,32,98,
+    111,116,104,32,97,32,100,114,105,118,101,32,108,101,116,116,
+    101,114,32,97,110,100,32,97,32,85,78,67,32,112,97,116,
+    104,46,10,10,32,32,32,32,233,2,0,0,0,114,41,0,
+    0,0,114,40,0,0,0,114,54,0,0,0,114,31,0,0,
+    0,114,33,0,0,0,114,55,0,0,0,114,0,0,0,0,
+    233,3,0,0,0,114,52,0,0,0,78,114,56,0,0,0,
+    114,56,0,0,0,41,7,114,42,0,0,0,114,43,0,0,
+    0,114,53,0,0,0,114,34,0,0,0,114,35,0,0,0,
+    114,44,0,0,0,218,4,102,105,110,100,41,7,114,64,0,
+    0,0,114,20,0,0,0,114,23,0,0,0,114,63,0,0,
+    0,90,5,110,111,114,109,112,218,5,105,110,100,101,120,90,
+    6,105,110,100,101,120,50,114,37,0,0,0,114,37,0,0,
+    0,114,38,0,0,0,114,5,0,0,0,121,0,0,0,115,
+    46,0,0,0,0,19,10,1,14,1,10,1,4,1,4,1,
+    6,2,4,1,4,1,4,1,12,1,36,5,12,1,8,1,
+    16,1,16,3,12,1,16,1,8,1,8,1,24,1,18,1,
+    24,1,99,1,0,0,0,0,0,0,0,6,0,0,0,4,
+    0,0,0,67,0,0,0,115,124,0,0,0,116,0,160,1,
+    124,0,161,1,125,0,116,2,124,0,131,1,125,1,116,3,
+    124,0,131,1,92,2,125,2,125,0,116,4,124,0,131,1,
+    125,3,120,32,124,3,114,70,124,0,124,3,100,1,24,0,
+    25,0,124,1,107,7,114,70,124,3,100,1,56,0,125,3,
+    113,40,87,0,124,0,100,2,124,3,133,2,25,0,124,0,
+    124,3,100,2,133,2,25,0,2,0,125,4,125,5,124,4,
+    160,5,124,1,161,1,112,110,124,4,125,4,124,2,124,4,
+    23,0,124,5,102,2,83,0,41,3,122,126,83,112,108,105,
+    116,32,97,32,112,97,116,104,110,97,109,101,46,10,10,32,
+    32,32,32,82,101,116,117,114,110,32,116,117,112,108,101,32,
+    40,104,101,97,100,44,32,116,97,105,108,41,32,119,104,101,
+    114,101,32,116,97,105,108,32,105,115,32,101,118,101,114,121,
+    116,104,105,110,103,32,97,102,116,101,114,32,116,104,101,32,
+    102,105,110,97,108,32,115,108,97,115,104,46,10,32,32,32,
+    32,69,105,116,104,101,114,32,112,97,114,116,32,109,97,121,
+    32,98,101,32,101,109,112,116,121,46,114,52,0,0,0,78,
+    41,6,114,42,0,0,0,114,43,0,0,0,114,39,0,0,
+    0,114,5,0,0,0,114,53,0,0,0,218,6,114,115,116,
+    114,105,112,41,6,114,64,0,0,0,114,62,0,0,0,218,
+    1,100,218,1,105,90,4,104,101,97,100,90,4,116,97,105,
+    108,114,37,0,0,0,114,37,0,0,0,114,38,0,0,0,
+    114,6,0,0,0,177,0,0,0,115,18,0,0,0,0,5,
+    10,1,8,1,12,2,8,1,22,1,12,1,26,2,14,1,
+    99,1,0,0,0,0,0,0,0,1,0,0,0,6,0,0,
+    0,67,0,0,0,115,56,0,0,0,116,0,160,1,124,0,
+    161,1,125,0,116,2,124,0,116,3,131,2,114,36,116,4,
+    160,5,124,0,100,1,100,2,100,3,161,4,83,0,116,4,
+    160,5,124,0,100,4,100,5,100,6,161,4,83,0,100,0,
+    83,0,41,7,78,114,41,0,0,0,114,40,0,0,0,243,
+    1,0,0,0,46,114,31,0,0,0,114,33,0,0,0,114,
+    30,0,0,0,41,6,114,42,0,0,0,114,43,0,0,0,
+    114,34,0,0,0,114,35,0,0,0,114,59,0,0,0,218,
+    9,95,115,112,108,105,116,101,120,116,41,1,114,64,0,0,
+    0,114,37,0,0,0,114,37,0,0,0,114,38,0,0,0,
+    114,7,0,0,0,200,0,0,0,115,8,0,0,0,0,1,
+    10,1,10,1,16,2,99,1,0,0,0,0,0,0,0,1,
+    0,0,0,2,0,0,0,67,0,0,0,115,12,0,0,0,
+    116,0,124,0,131,1,100,1,25,0,83,0,41,2,122,41,
+    82,101,116,117,114,110,115,32,116,104,101,32,102,105,110,97,
+    108,32,99,111,109,112,111,110,101,110,116,32,111,102,32,97,
+    32,112,97,116,104,110,97,109,101,114,52,0,0,0,41,1,
+    114,6,0,0,0,41,1,114,64,0,0,0,114,37,0,0,
+    0,114,37,0,0,0,114,38,0,0,0,114,8,0,0,0,
+    211,0,0,0,115,2,0,0,0,0,2,99,1,0,0,0,
+    0,0,0,0,1,0,0,0,2,0,0,0,67,0,0,0,
+    115,12,0,0,0,116,0,124,0,131,1,100,1,25,0,83,
+    0,41,2,122,45,82,101,116,117,114,110,115,32,116,104,101,
+    32,100,105,114,101,99,116,111,114,121,32,99,111,109,112,111,
+    110,101,110,116,32,111,102,32,97,32,112,97,116,104,110,97,
+    109,101,114,0,0,0,0,41,1,114,6,0,0,0,41,1,
+    114,64,0,0,0,114,37,0,0,0,114,37,0,0,0,114,
+    38,0,0,0,114,9,0,0,0,218,0,0,0,115,2,0,
+    0,0,0,2,99,1,0,0,0,0,0,0,0,2,0,0,
+    0,12,0,0,0,67,0,0,0,115,52,0,0,0,121,14,
+    116,0,160,1,124,0,161,1,125,1,87,0,110,24,4,0,
+    116,2,116,3,102,2,107,10,114,38,1,0,1,0,1,0,
+    100,1,83,0,88,0,116,4,160,5,124,1,106,6,161,1,
+    83,0,41,2,122,104,84,101,115,116,32,119,104,101,116,104,
+    101,114,32,97,32,112,97,116,104,32,105,115,32,97,32,115,
+    121,109,98,111,108,105,99,32,108,105,110,107,46,10,32,32,
+    32,32,84,104,105,115,32,119,105,108,108,32,97,108,119,97,
+    121,115,32,114,101,116,117,114,110,32,102,97,108,115,101,32,
+    102,111,114,32,87,105,110,100,111,119,115,32,112,114,105,111,
+    114,32,116,111,32,54,46,48,46,10,32,32,32,32,70,41,
+    7,114,42,0,0,0,218,5,108,115,116,97,116,218,7,79,
+    83,69,114,114,111,114,114,47,0,0,0,218,4,115,116,97,
+    116,90,7,83,95,73,83,76,78,75,90,7,115,116,95,109,
+    111,100,101,41,2,114,36,0,0,0,218,2,115,116,114,37,
+    0,0,0,114,37,0,0,0,114,38,0,0,0,114,10,0,
+    0,0,225,0,0,0,115,10,0,0,0,0,4,2,1,14,
+    1,18,1,6,1,99,1,0,0,0,0,0,0,0,2,0,
+    0,0,11,0,0,0,67,0,0,0,115,40,0,0,0,121,
+    14,116,0,160,1,124,0,161,1,125,1,87,0,110,20,4,
+    0,116,2,107,10,114,34,1,0,1,0,1,0,100,1,83,
+    0,88,0,100,2,83,0,41,3,122,67,84,101,115,116,32,
+    119,104,101,116,104,101,114,32,97,32,112,97,116,104,32,101,
+    120,105,115,116,115,46,32,32,82,101,116,117,114,110,115,32,
+    84,114,117,101,32,102,111,114,32,98,114,111,107,101,110,32,
+    115,121,109,98,111,108,105,99,32,108,105,110,107,115,70,84,
+    41,3,114,42,0,0,0,114,74,0,0,0,114,75,0,0,
+    0,41,2,114,36,0,0,0,114,77,0,0,0,114,37,0,
+    0,0,114,37,0,0,0,114,38,0,0,0,114,11,0,0,
+    0,237,0,0,0,115,10,0,0,0,0,2,2,1,14,1,
+    14,1,6,1,41,1,218,18,95,103,101,116,118,111,108,117,
+    109,101,112,97,116,104,110,97,109,101,99,1,0,0,0,0,
+    0,0,0,4,0,0,0,4,0,0,0,67,0,0,0,115,
+    116,0,0,0,116,0,160,1,124,0,161,1,125,0,116,2,
+    124,0,131,1,125,1,116,3,124,0,131,1,125,0,116,4,
+    124,0,131,1,92,2,125,2,125,3,124,2,114,68,124,2,
+    100,1,25,0,124,1,107,6,114,68,124,3,12,0,112,66,
+    124,3,124,1,107,6,83,0,124,3,124,1,107,6,114,80,
+    100,2,83,0,116,5,114,108,124,0,160,6,124,1,161,1,
+    116,5,124,0,131,1,160,6,124,1,161,1,107,2,83,0,
+    100,3,83,0,100,4,83,0,41,5,122,97,84,101,115,116,
+    32,119,104,101,116,104,101,114,32,97,32,112,97,116,104,32,
+    105,115,32,97,32,109,111,117,110,116,32,112,111,105,110,116,
+    32,40,97,32,100,114,105,118,101,32,114,111,111,116,44,32,
+    116,104,101,32,114,111,111,116,32,111,102,32,97,10,32,32,
+    32,32,115,104,97,114,101,44,32,111,114,32,97,32,109,111,
+    117,110,116,101,100,32,118,111,108,117,109,101,41,114,0,0,
+    0,0,84,70,78,41,7,114,42,0,0,0,114,43,0,0,
+    0,114,39,0,0,0,114,17,0,0,0,114,5,0,0,0,
+    114,78,0,0,0,114,69,0,0,0,41,4,114,36,0,0,
+    0,114,62,0,0,0,90,4,114,111,111,116,90,4,114,101,
+    115,116,114,37,0,0,0,114,37,0,0,0,114,38,0,0,
+    0,114,13,0,0,0,3,1,0,0,115,22,0,0,0,0,
+    3,10,1,8,1,8,1,12,1,16,1,14,1,8,1,4,
+    2,4,1,24,2,99,1,0,0,0,0,0,0,0,6,0,
+    0,0,13,0,0,0,67,0,0,0,115,22,1,0,0,116,
+    0,160,1,124,0,161,1,125,0,116,2,124,0,116,3,131,
+    2,114,26,100,1,125,1,110,4,100,2,125,1,124,0,160,
+    4,124,1,161,1,115,44,124,0,83,0,100,3,116,5,124,
+    0,131,1,2,0,125,2,125,3,120,36,124,2,124,3,107,
+    0,114,94,124,0,124,2,25,0,116,6,124,0,131,1,107,
+    7,114,94,124,2,100,3,55,0,125,2,113,60,87,0,100,
+    4,116,0,106,7,107,6,114,118,116,0,106,7,100,4,25,
+    0,125,4,110,92,100,5,116,0,106,7,107,6,114,140,116,
+    0,106,7,100,5,25,0,125,4,110,70,100,6,116,0,106,
+    7,107,7,114,154,124,0,83,0,121,14,116,0,106,7,100,
+    7,25,0,125,5,87,0,110,24,4,0,116,8,107,10,114,
+    192,1,0,1,0,1,0,100,8,125,5,89,0,110,2,88,
+    0,116,9,124,5,116,0,106,7,100,6,25,0,131,2,125,
+    4,116,2,124,0,116,3,131,2,114,230,116,0,160,10,124,
+    4,161,1,125,4,124,2,100,3,107,3,144,1,114,6,116,
+    9,116,11,124,4,131,1,124,0,100,3,124,2,133,2,25,
+    0,131,2,125,4,124,4,124,0,124,2,100,9,133,2,25,
+    0,23,0,83,0,41,10,122,76,69,120,112,97,110,100,32,
+    126,32,97,110,100,32,126,117,115,101,114,32,99,111,110,115,
+    116,114,117,99,116,115,46,10,10,32,32,32,32,73,102,32,
+    117,115,101,114,32,111,114,32,36,72,79,77,69,32,105,115,
+    32,117,110,107,110,111,119,110,44,32,100,111,32,110,111,116,
+    104,105,110,103,46,243,1,0,0,0,126,250,1,126,114,52,
+    0,0,0,90,4,72,79,77,69,90,11,85,83,69,82,80,
+    82,79,70,73,76,69,90,8,72,79,77,69,80,65,84,72,
+    90,9,72,79,77,69,68,82,73,86,69,218,0,78,41,12,
+    114,42,0,0,0,114,43,0,0,0,114,34,0,0,0,114,
+    35,0,0,0,218,10,115,116,97,114,116,115,119,105,116,104,
+    114,53,0,0,0,114,39,0,0,0,218,7,101,110,118,105,
+    114,111,110,218,8,75,101,121,69,114,114,111,114,114,4,0,
+    0,0,218,8,102,115,101,110,99,111,100,101,114,9,0,0,
+    0,41,6,114,36,0,0,0,90,5,116,105,108,100,101,114,
+    71,0,0,0,218,1,110,90,8,117,115,101,114,104,111,109,
+    101,218,5,100,114,105,118,101,114,37,0,0,0,114,37,0,
+    0,0,114,38,0,0,0,114,14,0,0,0,30,1,0,0,
+    115,50,0,0,0,0,4,10,1,10,1,6,2,4,1,10,
+    1,4,1,14,1,26,1,12,2,10,1,12,1,10,1,12,
+    1,10,1,4,2,2,1,14,1,14,1,10,1,16,2,10,
+    1,10,2,10,1,22,2,99,1,0,0,0,0,0,0,0,
+    15,0,0,0,20,0,0,0,67,0,0,0,115,60,4,0,
+    0,116,0,160,1,124,0,161,1,125,0,116,2,124,0,116,
+    3,131,2,114,104,100,1,124,0,107,7,114,40,100,2,124,
+    0,107,7,114,40,124,0,83,0,100,3,100,4,108,4,125,
+    1,116,3,124,1,106,5,124,1,106,6,23,0,100,5,23,
+    0,100,6,131,2,125,2,100,7,125,3,100,2,125,4,100,
+    8,125,5,100,9,125,6,100,1,125,7,116,7,116,0,100,
+    10,100,4,131,3,125,8,110,70,100,11,124,0,107,7,114,
+    124,100,12,124,0,107,7,114,124,124,0,83,0,100,3,100,
+    4,108,4,125,1,124,1,106,5,124,1,106,6,23,0,100,
+    5,23,0,125,2,100,13,125,3,100,12,125,4,100,14,125,
+    5,100,15,125,6,100,11,125,7,116,0,106,8,125,8,124,
+    0,100,4,100,3,133,2,25,0,125,9,100,3,125,10,116,
+    9,124,0,131,1,125,11,144,3,120,110,124,10,124,11,107,
+    0,144,4,114,54,124,0,124,10,124,10,100,16,23,0,133,
+    2,25,0,125,12,124,12,124,3,107,2,144,1,114,92,124,
+    0,124,10,100,16,23,0,100,4,133,2,25,0,125,0,116,
+    9,124,0,131,1,125,11,121,38,124,0,160,10,124,12,161,
+    1,125,10,124,9,124,12,124,0,100,4,124,10,100,16,23,
+    0,133,2,25,0,23,0,55,0,125,9,87,0,110,42,4,
+    0,116,11,107,10,144,1,114,86,1,0,1,0,1,0,124,
+    9,124,12,124,0,23,0,55,0,125,9,124,11,100,16,24,
+    0,125,10,89,0,110,2,88,0,144,2,110,208,124,12,124,
+    4,107,2,144,2,114,78,124,0,124,10,100,16,23,0,124,
+    10,100,17,23,0,133,2,25,0,124,4,107,2,144,1,114,
+    146,124,9,124,12,55,0,125,9,124,10,100,16,55,0,125,
+    10,110,184,124,0,124,10,100,16,23,0,100,4,133,2,25,
+    0,125,0,116,9,124,0,131,1,125,11,121,14,124,0,160,
+    10,124,4,161,1,125,10,87,0,110,42,4,0,116,11,107,
+    10,144,1,114,226,1,0,1,0,1,0,124,9,124,4,124,
+    0,23,0,55,0,125,9,124,11,100,16,24,0,125,10,89,
+    0,110,104,88,0,124,0,100,4,124,10,133,2,25,0,125,
+    13,121,46,124,8,100,4,107,8,144,2,114,20,116,0,160,
+    12,116,0,106,8,116,0,160,13,124,13,161,1,25,0,161,
+    1,125,14,110,8,124,8,124,13,25,0,125,14,87,0,110,
+    34,4,0,116,14,107,10,144,2,114,64,1,0,1,0,1,
+    0,124,4,124,13,23,0,124,4,23,0,125,14,89,0,110,
+    2,88,0,124,9,124,14,55,0,125,9,144,1,110,222,124,
+    12,124,7,107,2,144,4,114,36,124,0,124,10,100,16,23,
+    0,124,10,100,17,23,0,133,2,25,0,124,7,107,2,144,
+    2,114,134,124,9,124,12,55,0,125,9,124,10,100,16,55,
+    0,125,10,144,4,113,44,124,0,124,10,100,16,23,0,124,
+    10,100,17,23,0,133,2,25,0,124,5,107,2,144,3,114,
+    98,124,0,124,10,100,17,23,0,100,4,133,2,25,0,125,
+    0,116,9,124,0,131,1,125,11,121,14,124,0,160,10,124,
+    6,161,1,125,10,87,0,110,46,4,0,116,11,107,10,144,
+    2,114,244,1,0,1,0,1,0,124,9,124,7,124,5,23,
+    0,124,0,23,0,55,0,125,9,124,11,100,16,24,0,125,
+    10,89,0,110,108,88,0,124,0,100,4,124,10,133,2,25,
+    0,125,13,121,46,124,8,100,4,107,8,144,3,114,38,116,
+    0,160,12,116,0,106,8,116,0,160,13,124,13,161,1,25,
+    0,161,1,125,14,110,8,124,8,124,13,25,0,125,14,87,
+    0,110,38,4,0,116,14,107,10,144,3,114,86,1,0,1,
+    0,1,0,124,7,124,5,23,0,124,13,23,0,124,6,23,
+    0,125,14,89,0,110,2,88,0,124,9,124,14,55,0,125,
+    9,110,192,124,0,100,4,100,3,133,2,25,0,125,13,124,
+    10,100,16,55,0,125,10,124,0,124,10,124,10,100,16,23,
+    0,133,2,25,0,125,12,120,54,124,12,144,3,114,188,124,
+    12,124,2,107,6,144,3,114,188,124,13,124,12,55,0,125,
+    13,124,10,100,16,55,0,125,10,124,0,124,10,124,10,100,
+    16,23,0,133,2,25,0,125,12,144,3,113,136,87,0,121,
+    46,124,8,100,4,107,8,144,3,114,226,116,0,160,12,116,
+    0,106,8,116,0,160,13,124,13,161,1,25,0,161,1,125,
+    14,110,8,124,8,124,13,25,0,125,14,87,0,110,30,4,
+    0,116,14,107,10,144,4,114,10,1,0,1,0,1,0,124,
+    7,124,13,23,0,125,14,89,0,110,2,88,0,124,9,124,
+    14,55,0,125,9,124,12,144,4,114,44,124,10,100,16,56,
+    0,125,10,110,8,124,9,124,12,55,0,125,9,124,10,100,
+    16,55,0,125,10,113,202,87,0,124,9,83,0,41,18,122,
+    102,69,120,112,97,110,100,32,115,104,101,108,108,32,118,97,
+    114,105,97,98,108,101,115,32,111,102,32,116,104,101,32,102,
+    111,114,109,115,32,36,118,97,114,44,32,36,123,118,97,114,
+    125,32,97,110,100,32,37,118,97,114,37,46,10,10,32,32,
+    32,32,85,110,107,110,111,119,110,32,118,97,114,105,97,98,
+    108,101,115,32,97,114,101,32,108,101,102,116,32,117,110,99,
+    104,97,110,103,101,100,46,243,1,0,0,0,36,243,1,0,
+    0,0,37,114,0,0,0,0,78,122,2,95,45,218,5,97,
+    115,99,105,105,243,1,0,0,0,39,243,1,0,0,0,123,
+    243,1,0,0,0,125,90,8,101,110,118,105,114,111,110,98,
+    250,1,36,250,1,37,250,1,39,250,1,123,250,1,125,114,
+    52,0,0,0,114,65,0,0,0,41,15,114,42,0,0,0,
+    114,43,0,0,0,114,34,0,0,0,114,35,0,0,0,218,
+    6,115,116,114,105,110,103,90,13,97,115,99,105,105,95,108,
+    101,116,116,101,114,115,90,6,100,105,103,105,116,115,218,7,
+    103,101,116,97,116,116,114,114,83,0,0,0,114,53,0,0,
+    0,114,68,0,0,0,218,10,86,97,108,117,101,69,114,114,
+    111,114,114,85,0,0,0,90,8,102,115,100,101,99,111,100,
+    101,114,84,0,0,0,41,15,114,36,0,0,0,114,99,0,
+    0,0,90,8,118,97,114,99,104,97,114,115,90,5,113,117,
+    111,116,101,90,7,112,101,114,99,101,110,116,90,5,98,114,
+    97,99,101,90,6,114,98,114,97,99,101,90,6,100,111,108,
+    108,97,114,114,83,0,0,0,90,3,114,101,115,114,68,0,
+    0,0,90,7,112,97,116,104,108,101,110,218,1,99,90,3,
+    118,97,114,218,5,118,97,108,117,101,114,37,0,0,0,114,
+    37,0,0,0,114,38,0,0,0,114,15,0,0,0,80,1,
+    0,0,115,188,0,0,0,0,4,10,1,10,1,16,1,4,
+    1,8,1,22,1,4,1,4,1,4,1,4,1,4,1,14,
+    2,16,1,4,1,8,1,16,1,4,1,4,1,4,1,4,
+    1,4,1,6,1,12,1,4,1,8,1,14,1,16,1,10,
+    1,16,1,8,1,2,1,10,1,28,1,16,1,12,1,18,
+    1,10,1,26,1,8,1,10,2,16,1,8,1,2,1,14,
+    1,16,1,12,1,14,2,12,1,2,1,10,1,24,2,12,
+    1,16,1,18,1,12,1,10,1,26,1,8,1,12,1,26,
+    1,16,1,8,1,2,1,14,1,16,1,16,1,14,2,12,
+    1,2,1,10,1,24,2,12,1,16,1,22,1,10,2,12,
+    1,8,1,16,1,18,1,8,1,8,1,22,1,2,1,10,
+    1,24,2,12,1,16,1,14,1,8,1,6,1,10,2,8,
+    1,12,1,99,1,0,0,0,0,0,0,0,9,0,0,0,
+    4,0,0,0,67,0,0,0,115,92,1,0,0,116,0,160,
+    1,124,0,161,1,125,0,116,2,124,0,116,3,131,2,114,
+    42,100,1,125,1,100,2,125,2,100,3,125,3,100,4,125,
+    4,100,15,125,5,110,20,100,7,125,1,100,8,125,2,100,
+    9,125,3,100,10,125,4,100,16,125,5,124,0,160,4,124,
+    5,161,1,114,76,124,0,83,0,124,0,160,5,124,2,124,
+    1,161,2,125,0,116,6,124,0,131,1,92,2,125,6,125,
+    0,124,0,160,4,124,1,161,1,114,128,124,6,124,1,55,
+    0,125,6,124,0,160,7,124,1,161,1,125,0,124,0,160,
+    8,124,1,161,1,125,7,100,13,125,8,120,164,124,8,116,
+    9,124,7,131,1,107,0,144,1,114,50,124,7,124,8,25,
+    0,12,0,115,180,124,7,124,8,25,0,124,3,107,2,114,
+    188,124,7,124,8,61,0,113,144,124,7,124,8,25,0,124,
+    4,107,2,144,1,114,40,124,8,100,13,107,4,111,224,124,
+    7,124,8,100,14,24,0,25,0,124,4,107,3,144,1,114,
+    0,124,7,124,8,100,14,24,0,124,8,100,14,23,0,133,
+    2,61,0,124,8,100,14,56,0,125,8,110,38,124,8,100,
+    13,107,2,144,1,114,30,124,6,160,10,124,1,161,1,144,
+    1,114,30,124,7,124,8,61,0,110,8,124,8,100,14,55,
+    0,125,8,113,144,124,8,100,14,55,0,125,8,113,144,87,
+    0,124,6,12,0,144,1,114,78,124,7,12,0,144,1,114,
+    78,124,7,160,11,124,3,161,1,1,0,124,6,124,1,160,
+    12,124,7,161,1,23,0,83,0,41,17,122,48,78,111,114,
+    109,97,108,105,122,101,32,112,97,116,104,44,32,101,108,105,
+    109,105,110,97,116,105,110,103,32,100,111,117,98,108,101,32,
+    115,108,97,115,104,101,115,44,32,101,116,99,46,114,41,0,
+    0,0,114,40,0,0,0,114,72,0,0,0,115,2,0,0,
+    0,46,46,243,4,0,0,0,92,92,46,92,243,4,0,0,
+    0,92,92,63,92,114,31,0,0,0,114,33,0,0,0,114,
+    30,0,0,0,122,2,46,46,250,4,92,92,46,92,250,4,
+    92,92,63,92,114,0,0,0,0,114,52,0,0,0,41,2,
+    114,104,0,0,0,114,105,0,0,0,41,2,114,106,0,0,
+    0,114,107,0,0,0,41,13,114,42,0,0,0,114,43,0,
+    0,0,114,34,0,0,0,114,35,0,0,0,114,82,0,0,
+    0,114,44,0,0,0,114,5,0,0,0,218,6,108,115,116,
+    114,105,112,114,6,0,0,0,114,53,0,0,0,218,8,101,
+    110,100,115,119,105,116,104,218,6,97,112,112,101,110,100,114,
+    4,0,0,0,41,9,114,36,0,0,0,114,20,0,0,0,
+    114,23,0,0,0,114,18,0,0,0,114,19,0,0,0,90,
+    16,115,112,101,99,105,97,108,95,112,114,101,102,105,120,101,
+    115,218,6,112,114,101,102,105,120,90,5,99,111,109,112,115,
+    114,71,0,0,0,114,37,0,0,0,114,37,0,0,0,114,
+    38,0,0,0,114,16,0,0,0,193,1,0,0,115,70,0,
+    0,0,0,2,10,1,10,1,4,1,4,1,4,1,4,1,
+    6,2,4,1,4,1,4,1,4,1,4,1,10,5,4,1,
+    12,1,12,3,10,1,8,1,10,2,10,1,4,1,16,1,
+    22,1,8,1,14,1,26,1,18,1,10,1,22,1,8,2,
+    10,2,12,2,16,1,10,1,41,1,218,16,95,103,101,116,
+    102,117,108,108,112,97,116,104,110,97,109,101,99,1,0,0,
+    0,0,0,0,0,2,0,0,0,3,0,0,0,67,0,0,
+    0,115,64,0,0,0,116,0,160,1,124,0,161,1,125,0,
+    116,2,124,0,131,1,115,56,116,3,124,0,116,4,131,2,
+    114,38,116,0,160,5,161,0,125,1,110,8,116,0,160,6,
+    161,0,125,1,116,7,124,1,124,0,131,2,125,0,116,8,
+    124,0,131,1,83,0,41,1,122,38,82,101,116,117,114,110,
+    32,116,104,101,32,97,98,115,111,108,117,116,101,32,118,101,
+    114,115,105,111,110,32,111,102,32,97,32,112,97,116,104,46,
+    41,9,114,42,0,0,0,114,43,0,0,0,114,3,0,0,
+    0,114,34,0,0,0,114,35,0,0,0,218,7,103,101,116,
+    99,119,100,98,218,6,103,101,116,99,119,100,114,4,0,0,
+    0,114,16,0,0,0,41,2,114,36,0,0,0,90,3,99,
+    119,100,114,37,0,0,0,114,37,0,0,0,114,38,0,0,
+    0,114,17,0,0,0,248,1,0,0,115,14,0,0,0,0,
+    2,10,1,8,1,10,1,10,2,8,1,10,1,99,1,0,
+    0,0,0,0,0,0,1,0,0,0,11,0,0,0,67,0,
+    0,0,115,86,0,0,0,124,0,114,50,116,0,160,1,124,
+    0,161,1,125,0,121,12,116,2,124,0,131,1,125,0,87,
+    0,113,78,4,0,116,3,107,10,114,46,1,0,1,0,1,
+    0,89,0,113,78,88,0,110,28,116,4,124,0,116,5,131,
+    2,114,70,116,0,160,6,161,0,125,0,110,8,116,0,160,
+    7,161,0,125,0,116,8,124,0,131,1,83,0,41,1,122,
+    38,82,101,116,117,114,110,32,116,104,101,32,97,98,115,111,
+    108,117,116,101,32,118,101,114,115,105,111,110,32,111,102,32,
+    97,32,112,97,116,104,46,41,9,114,42,0,0,0,114,43,
+    0,0,0,114,112,0,0,0,114,75,0,0,0,114,34,0,
+    0,0,114,35,0,0,0,114,113,0,0,0,114,114,0,0,
+    0,114,16,0,0,0,41,1,114,36,0,0,0,114,37,0,
+    0,0,114,37,0,0,0,114,38,0,0,0,114,17,0,0,
+    0,4,2,0,0,115,20,0,0,0,0,3,4,1,10,1,
+    2,1,12,1,14,1,8,1,10,1,10,2,8,1,218,17,
+    103,101,116,119,105,110,100,111,119,115,118,101,114,115,105,111,
+    110,114,66,0,0,0,114,65,0,0,0,99,2,0,0,0,
+    0,0,0,0,17,0,0,0,15,0,0,0,67,0,0,0,
+    115,100,1,0,0,116,0,160,1,124,0,161,1,125,0,116,
+    2,124,0,116,3,131,2,114,34,100,1,125,2,100,2,125,
+    3,100,3,125,4,110,12,100,4,125,2,100,5,125,3,100,
+    6,125,4,124,1,100,7,107,8,114,58,124,3,125,1,124,
+    0,115,70,116,4,100,8,131,1,130,1,116,0,160,1,124,
+    1,161,1,125,1,121,222,116,5,116,6,124,1,131,1,131,
+    1,125,5,116,5,116,6,124,0,131,1,131,1,125,6,116,
+    7,124,5,131,1,92,2,125,7,125,8,116,7,124,6,131,
+    1,92,2,125,9,125,10,116,8,124,7,131,1,116,8,124,
+    9,131,1,107,3,114,162,116,4,100,9,124,9,124,7,102,
+    2,22,0,131,1,130,1,100,10,100,11,132,0,124,8,160,
+    9,124,2,161,1,68,0,131,1,125,11,100,12,100,11,132,
+    0,124,10,160,9,124,2,161,1,68,0,131,1,125,12,100,
+    13,125,13,120,48,116,10,124,11,124,12,131,2,68,0,93,
+    34,92,2,125,14,125,15,116,8,124,14,131,1,116,8,124,
+    15,131,1,107,3,114,244,80,0,124,13,100,14,55,0,125,
+    13,113,218,87,0,124,4,103,1,116,11,124,11,131,1,124,
+    13,24,0,20,0,124,12,124,13,100,7,133,2,25,0,23,
+    0,125,16,124,16,144,1,115,40,124,3,83,0,116,12,124,
+    16,142,0,83,0,4,0,116,13,116,4,116,14,116,15,116,
+    16,102,5,107,10,144,1,114,94,1,0,1,0,1,0,116,
+    17,160,18,100,15,124,0,124,1,161,3,1,0,130,0,89,
+    0,110,2,88,0,100,7,83,0,41,16,122,35,82,101,116,
+    117,114,110,32,97,32,114,101,108,97,116,105,118,101,32,118,
+    101,114,115,105,111,110,32,111,102,32,97,32,112,97,116,104,
+    114,41,0,0,0,114,72,0,0,0,115,2,0,0,0,46,
+    46,114,31,0,0,0,114,30,0,0,0,122,2,46,46,78,
+    122,17,110,111,32,112,97,116,104,32,115,112,101,99,105,102,
+    105,101,100,122,38,112,97,116,104,32,105,115,32,111,110,32,
+    109,111,117,110,116,32,37,114,44,32,115,116,97,114,116,32,
+    111,110,32,109,111,117,110,116,32,37,114,99,1,0,0,0,
+    0,0,0,0,2,0,0,0,3,0,0,0,83,0,0,0,
+    115,20,0,0,0,103,0,124,0,93,12,125,1,124,1,114,
+    4,124,1,145,2,113,4,83,0,114,37,0,0,0,114,37,
+    0,0,0,41,2,218,2,46,48,218,1,120,114,37,0,0,
+    0,114,37,0,0,0,114,38,0,0,0,250,10,60,108,105,
+    115,116,99,111,109,112,62,53,2,0,0,115,2,0,0,0,
+    6,0,122,27,114,101,108,112,97,116,104,46,60,108,111,99,
+    97,108,115,62,46,60,108,105,115,116,99,111,109,112,62,99,
+    1,0,0,0,0,0,0,0,2,0,0,0,3,0,0,0,
+    83,0,0,0,115,20,0,0,0,103,0,124,0,93,12,125,
+    1,124,1,114,4,124,1,145,2,113,4,83,0,114,37,0,
+    0,0,114,37,0,0,0,41,2,114,116,0,0,0,114,117,
+    0,0,0,114,37,0,0,0,114,37,0,0,0,114,38,0,
+    0,0,114,118,0,0,0,54,2,0,0,115,2,0,0,0,
+    6,0,114,0,0,0,0,114,52,0,0,0,114,28,0,0,
+    0,41,19,114,42,0,0,0,114,43,0,0,0,114,34,0,
+    0,0,114,35,0,0,0,114,101,0,0,0,114,17,0,0,
+    0,114,16,0,0,0,114,5,0,0,0,114,2,0,0,0,
+    114,6,0,0,0,218,3,122,105,112,114,53,0,0,0,114,
+    4,0,0,0,114,46,0,0,0,114,47,0,0,0,114,58,
+    0,0,0,218,18,68,101,112,114,101,99,97,116,105,111,110,
+    87,97,114,110,105,110,103,114,59,0,0,0,114,60,0,0,
+    0,41,17,114,36,0,0,0,218,5,115,116,97,114,116,114,
+    20,0,0,0,114,18,0,0,0,114,19,0,0,0,90,9,
+    115,116,97,114,116,95,97,98,115,90,8,112,97,116,104,95,
+    97,98,115,90,11,115,116,97,114,116,95,100,114,105,118,101,
+    90,10,115,116,97,114,116,95,114,101,115,116,90,10,112,97,
+    116,104,95,100,114,105,118,101,90,9,112,97,116,104,95,114,
+    101,115,116,90,10,115,116,97,114,116,95,108,105,115,116,90,
+    9,112,97,116,104,95,108,105,115,116,114,71,0,0,0,90,
+    2,101,49,90,2,101,50,90,8,114,101,108,95,108,105,115,
+    116,114,37,0,0,0,114,37,0,0,0,114,38,0,0,0,
+    114,28,0,0,0,25,2,0,0,115,70,0,0,0,0,2,
+    10,1,10,1,4,1,4,1,6,2,4,1,4,1,4,2,
+    8,1,4,2,4,1,8,2,10,1,2,1,12,1,12,1,
+    12,1,12,1,16,1,4,1,12,2,20,1,20,2,4,1,
+    20,1,16,1,2,1,12,2,30,1,6,1,4,1,8,1,
+    26,1,14,1,99,1,0,0,0,0,0,0,0,12,0,0,
+    0,19,0,0,0,3,0,0,0,115,180,1,0,0,124,0,
+    115,12,116,0,100,1,131,1,130,1,116,1,116,2,116,3,
+    106,4,124,0,131,2,131,1,125,0,116,5,124,0,100,2,
+    25,0,116,6,131,2,114,56,100,3,137,2,100,4,137,0,
+    100,5,137,1,110,12,100,6,137,2,100,7,137,0,100,8,
+    137,1,144,1,121,62,135,0,135,2,102,2,100,9,100,10,
+    132,8,124,0,68,0,131,1,125,1,135,2,102,1,100,11,
+    100,10,132,8,124,1,68,0,131,1,125,2,121,28,116,7,
+    135,2,102,1,100,12,100,13,132,8,124,1,68,0,131,1,
+    131,1,92,1,125,3,87,0,110,30,4,0,116,0,107,10,
+    114,168,1,0,1,0,1,0,116,0,100,14,131,1,100,15,
+    130,2,89,0,110,2,88,0,116,8,116,7,100,16,100,13,
+    132,0,124,1,68,0,131,1,131,1,131,1,100,17,107,3,
+    114,204,116,0,100,18,131,1,130,1,116,9,124,0,100,2,
+    25,0,160,10,136,0,136,2,161,2,131,1,92,2,125,4,
+    125,5,124,5,160,11,136,2,161,1,125,6,135,1,102,1,
+    100,19,100,10,132,8,124,6,68,0,131,1,125,6,135,1,
+    102,1,100,20,100,10,132,8,124,2,68,0,131,1,125,2,
+    116,12,124,2,131,1,125,7,116,13,124,2,131,1,125,8,
+    120,66,116,14,124,7,131,1,68,0,93,38,92,2,125,9,
+    125,10,124,10,124,8,124,9,25,0,107,3,144,1,114,44,
+    124,6,100,15,124,9,133,2,25,0,125,6,80,0,144,1,
+    113,44,87,0,124,6,100,15,116,8,124,7,131,1,133,2,
+    25,0,125,6,124,3,144,1,114,116,124,4,136,2,23,0,
+    110,2,124,4,125,11,124,11,136,2,160,15,124,6,161,1,
+    23,0,83,0,4,0,116,16,116,17,102,2,107,10,144,1,
+    114,174,1,0,1,0,1,0,116,18,106,19,100,22,124,0,
+    158,2,142,0,1,0,130,0,89,0,110,2,88,0,100,15,
+    83,0,41,23,122,68,71,105,118,101,110,32,97,32,115,101,
+    113,117,101,110,99,101,32,111,102,32,112,97,116,104,32,110,
+    97,109,101,115,44,32,114,101,116,117,114,110,115,32,116,104,
+    101,32,108,111,110,103,101,115,116,32,99,111,109,109,111,110,
+    32,115,117,98,45,112,97,116,104,46,122,37,99,111,109,109,
+    111,110,112,97,116,104,40,41,32,97,114,103,32,105,115,32,
+    97,110,32,101,109,112,116,121,32,115,101,113,117,101,110,99,
+    101,114,0,0,0,0,114,41,0,0,0,114,40,0,0,0,
+    114,72,0,0,0,114,31,0,0,0,114,33,0,0,0,114,
+    30,0,0,0,99,1,0,0,0,0,0,0,0,2,0,0,
+    0,7,0,0,0,19,0,0,0,115,32,0,0,0,103,0,
+    124,0,93,24,125,1,116,0,124,1,160,1,136,0,136,1,
+    161,2,160,2,161,0,131,1,145,2,113,4,83,0,114,37,
+    0,0,0,41,3,114,5,0,0,0,114,44,0,0,0,114,
+    45,0,0,0,41,2,114,116,0,0,0,114,64,0,0,0,
+    41,2,114,23,0,0,0,114,20,0,0,0,114,37,0,0,
+    0,114,38,0,0,0,114,118,0,0,0,98,2,0,0,115,
+    2,0,0,0,6,0,122,30,99,111,109,109,111,110,112,97,
+    116,104,46,60,108,111,99,97,108,115,62,46,60,108,105,115,
+    116,99,111,109,112,62,99,1,0,0,0,0,0,0,0,3,
+    0,0,0,5,0,0,0,19,0,0,0,115,26,0,0,0,
+    103,0,124,0,93,18,92,2,125,1,125,2,124,2,160,0,
+    136,0,161,1,145,2,113,4,83,0,114,37,0,0,0,41,
+    1,114,6,0,0,0,41,3,114,116,0,0,0,114,70,0,
+    0,0,114,64,0,0,0,41,1,114,20,0,0,0,114,37,
+    0,0,0,114,38,0,0,0,114,118,0,0,0,99,2,0,
+    0,115,2,0,0,0,6,0,99,1,0,0,0,0,0,0,
+    0,3,0,0,0,4,0,0,0,51,0,0,0,115,34,0,
+    0,0,124,0,93,26,92,2,125,1,125,2,124,2,100,0,
+    100,1,133,2,25,0,136,0,107,2,86,0,1,0,113,2,
+    100,0,83,0,41,2,78,114,52,0,0,0,114,37,0,0,
+    0,41,3,114,116,0,0,0,114,70,0,0,0,114,64,0,
+    0,0,41,1,114,20,0,0,0,114,37,0,0,0,114,38,
+    0,0,0,250,9,60,103,101,110,101,120,112,114,62,102,2,
+    0,0,115,2,0,0,0,4,0,122,29,99,111,109,109,111,
+    110,112,97,116,104,46,60,108,111,99,97,108,115,62,46,60,
+    103,101,110,101,120,112,114,62,122,37,67,97,110,39,116,32,
+    109,105,120,32,97,98,115,111,108,117,116,101,32,97,110,100,
+    32,114,101,108,97,116,105,118,101,32,112,97,116,104,115,78,
+    99,1,0,0,0,0,0,0,0,3,0,0,0,3,0,0,
+    0,115,0,0,0,115,22,0,0,0,124,0,93,14,92,2,
+    125,1,125,2,124,1,86,0,1,0,113,2,100,0,83,0,
+    41,1,78,114,37,0,0,0,41,3,114,116,0,0,0,114,
+    70,0,0,0,114,64,0,0,0,114,37,0,0,0,114,37,
+    0,0,0,114,38,0,0,0,114,122,0,0,0,109,2,0,
+    0,115,2,0,0,0,4,0,114,52,0,0,0,122,31,80,
+    97,116,104,115,32,100,111,110,39,116,32,104,97,118,101,32,
+    116,104,101,32,115,97,109,101,32,100,114,105,118,101,99,1,
+    0,0,0,0,0,0,0,2,0,0,0,4,0,0,0,19,
+    0,0,0,115,28,0,0,0,103,0,124,0,93,20,125,1,
+    124,1,114,4,124,1,136,0,107,3,114,4,124,1,145,2,
+    113,4,83,0,114,37,0,0,0,114,37,0,0,0,41,2,
+    114,116,0,0,0,114,102,0,0,0,41,1,114,18,0,0,
+    0,114,37,0,0,0,114,38,0,0,0,114,118,0,0,0,
+    114,2,0,0,115,2,0,0,0,6,0,99,1,0,0,0,
+    0,0,0,0,2,0,0,0,5,0,0,0,19,0,0,0,
+    115,30,0,0,0,103,0,124,0,93,22,125,1,135,0,102,
+    1,100,0,100,1,132,8,124,1,68,0,131,1,145,2,113,
+    4,83,0,41,2,99,1,0,0,0,0,0,0,0,2,0,
+    0,0,4,0,0,0,19,0,0,0,115,28,0,0,0,103,
+    0,124,0,93,20,125,1,124,1,114,4,124,1,136,0,107,
+    3,114,4,124,1,145,2,113,4,83,0,114,37,0,0,0,
+    114,37,0,0,0,41,2,114,116,0,0,0,114,102,0,0,
+    0,41,1,114,18,0,0,0,114,37,0,0,0,114,38,0,
+    0,0,114,118,0,0,0,116,2,0,0,115,2,0,0,0,
+    6,0,122,41,99,111,109,109,111,110,112,97,116,104,46,60,
+    108,111,99,97,108,115,62,46,60,108,105,115,116,99,111,109,
+    112,62,46,60,108,105,115,116,99,111,109,112,62,114,37,0,
+    0,0,41,2,114,116,0,0,0,114,51,0,0,0,41,1,
+    114,18,0,0,0,114,37,0,0,0,114,38,0,0,0,114,
+    118,0,0,0,116,2,0,0,115,2,0,0,0,6,0,114,
+    29,0,0,0,41,1,114,29,0,0,0,41,20,114,101,0,
+    0,0,218,5,116,117,112,108,101,114,57,0,0,0,114,42,
+    0,0,0,114,43,0,0,0,114,34,0,0,0,114,35,0,
+    0,0,218,3,115,101,116,114,53,0,0,0,114,5,0,0,
+    0,114,44,0,0,0,114,6,0,0,0,218,3,109,105,110,
+    218,3,109,97,120,218,9,101,110,117,109,101,114,97,116,101,
+    114,4,0,0,0,114,46,0,0,0,114,47,0,0,0,114,
+    59,0,0,0,114,60,0,0,0,41,12,114,61,0,0,0,
+    90,11,100,114,105,118,101,115,112,108,105,116,115,90,11,115,
+    112,108,105,116,95,112,97,116,104,115,114,3,0,0,0,114,
+    87,0,0,0,114,36,0,0,0,90,6,99,111,109,109,111,
+    110,90,2,115,49,90,2,115,50,114,71,0,0,0,114,102,
+    0,0,0,114,111,0,0,0,114,37,0,0,0,41,3,114,
+    23,0,0,0,114,18,0,0,0,114,20,0,0,0,114,38,
+    0,0,0,114,29,0,0,0,81,2,0,0,115,70,0,0,
+    0,0,3,4,1,8,2,16,1,14,1,4,1,4,1,6,
+    2,4,1,4,1,4,2,4,1,20,1,18,2,2,1,28,
+    1,14,1,16,5,26,1,8,2,24,1,10,1,18,2,18,
+    1,8,1,8,1,18,1,14,1,12,1,8,2,16,2,18,
+    1,14,1,20,1,14,1,233,6,0,0,0,41,1,218,17,
+    95,103,101,116,102,105,110,97,108,112,97,116,104,110,97,109,
+    101,99,1,0,0,0,0,0,0,0,1,0,0,0,3,0,
+    0,0,67,0,0,0,115,12,0,0,0,116,0,116,1,124,
+    0,131,1,131,1,83,0,41,1,78,41,2,114,2,0,0,
+    0,114,17,0,0,0,41,1,218,1,102,114,37,0,0,0,
+    114,37,0,0,0,114,38,0,0,0,114,129,0,0,0,146,
+    2,0,0,115,2,0,0,0,0,1,114,129,0,0,0,41,
+    1,218,6,95,105,115,100,105,114,41,1,78,41,2,114,128,
+    0,0,0,114,0,0,0,0,41,45,218,7,95,95,100,111,
+    99,95,95,114,42,0,0,0,218,3,115,121,115,114,76,0,
+    0,0,114,59,0,0,0,90,7,95,95,97,108,108,95,95,
+    114,18,0,0,0,114,19,0,0,0,114,24,0,0,0,114,
+    20,0,0,0,114,21,0,0,0,114,23,0,0,0,114,22,
+    0,0,0,114,25,0,0,0,114,39,0,0,0,114,2,0,
+    0,0,114,3,0,0,0,114,4,0,0,0,114,5,0,0,
+    0,114,6,0,0,0,114,7,0,0,0,114,73,0,0,0,
+    114,8,0,0,0,114,9,0,0,0,114,10,0,0,0,114,
+    11,0,0,0,90,2,110,116,114,78,0,0,0,218,11,73,
+    109,112,111,114,116,69,114,114,111,114,114,13,0,0,0,114,
+    14,0,0,0,114,15,0,0,0,114,16,0,0,0,114,112,
+    0,0,0,114,17,0,0,0,114,26,0,0,0,218,7,104,
+    97,115,97,116,116,114,114,115,0,0,0,114,27,0,0,0,
+    114,28,0,0,0,114,29,0,0,0,114,129,0,0,0,114,
+    47,0,0,0,114,131,0,0,0,114,12,0,0,0,114,37,
+    0,0,0,114,37,0,0,0,114,37,0,0,0,114,38,0,
+    0,0,218,8,60,109,111,100,117,108,101,62,6,0,0,0,
+    115,120,0,0,0,4,2,8,1,8,1,8,1,8,1,8,
+    2,12,1,10,1,14,1,10,1,12,1,10,1,12,4,4,
+    1,4,1,4,1,4,1,4,1,4,1,4,1,4,2,8,
+    10,8,23,8,8,8,47,8,56,8,23,8,6,10,5,8,
+    7,8,7,8,12,8,18,2,1,16,1,16,1,10,1,8,
+    27,8,50,8,113,8,51,2,1,16,2,16,1,14,12,8,
+    16,4,2,12,1,16,2,10,56,8,53,2,3,22,1,14,
+    2,8,1,20,5,14,4,2,5,16,1,16,2,
+};
+static const unsigned char _Py_M__genericpath[] = {
+    99,0,0,0,0,0,0,0,0,0,0,0,0,11,0,0,
+    0,64,0,0,0,115,154,0,0,0,100,0,90,0,100,1,
+    100,2,108,1,90,1,100,1,100,2,108,2,90,2,100,3,
+    100,4,100,5,100,6,100,7,100,8,100,9,100,10,100,11,
+    100,12,100,13,103,11,90,3,100,14,100,4,132,0,90,4,
+    100,15,100,10,132,0,90,5,100,16,100,9,132,0,90,6,
+    100,17,100,8,132,0,90,7,100,18,100,7,132,0,90,8,
+    100,19,100,5,132,0,90,9,100,20,100,6,132,0,90,10,
+    100,21,100,3,132,0,90,11,100,22,100,13,132,0,90,12,
+    100,23,100,11,132,0,90,13,100,24,100,12,132,0,90,14,
+    100,25,100,26,132,0,90,15,100,27,100,28,132,0,90,16,
+    100,2,83,0,41,29,122,152,10,80,97,116,104,32,111,112,
+    101,114,97,116,105,111,110,115,32,99,111,109,109,111,110,32,
+    116,111,32,109,111,114,101,32,116,104,97,110,32,111,110,101,
+    32,79,83,10,68,111,32,110,111,116,32,117,115,101,32,100,
+    105,114,101,99,116,108,121,46,32,32,84,104,101,32,79,83,
+    32,115,112,101,99,105,102,105,99,32,109,111,100,117,108,101,
+    115,32,105,109,112,111,114,116,32,116,104,101,32,97,112,112,
+    114,111,112,114,105,97,116,101,10,102,117,110,99,116,105,111,
+    110,115,32,102,114,111,109,32,116,104,105,115,32,109,111,100,
+    117,108,101,32,116,104,101,109,115,101,108,118,101,115,46,10,
+    233,0,0,0,0,78,218,12,99,111,109,109,111,110,112,114,
+    101,102,105,120,218,6,101,120,105,115,116,115,218,8,103,101,
+    116,97,116,105,109,101,218,8,103,101,116,99,116,105,109,101,
+    218,8,103,101,116,109,116,105,109,101,218,7,103,101,116,115,
+    105,122,101,218,5,105,115,100,105,114,218,6,105,115,102,105,
+    108,101,218,8,115,97,109,101,102,105,108,101,218,12,115,97,
+    109,101,111,112,101,110,102,105,108,101,218,8,115,97,109,101,
+    115,116,97,116,99,1,0,0,0,0,0,0,0,1,0,0,
+    0,11,0,0,0,67,0,0,0,115,40,0,0,0,121,14,
+    116,0,160,1,124,0,161,1,1,0,87,0,110,20,4,0,
+    116,2,107,10,114,34,1,0,1,0,1,0,100,1,83,0,
+    88,0,100,2,83,0,41,3,122,68,84,101,115,116,32,119,
+    104,101,116,104,101,114,32,97,32,112,97,116,104,32,101,120,
+    105,115,116,115,46,32,32,82,101,116,117,114,110,115,32,70,
+    97,108,115,101,32,102,111,114,32,98,114,111,107,101,110,32,
+    115,121,109,98,111,108,105,99,32,108,105,110,107,115,70,84,
+    41,3,218,2,111,115,218,4,115,116,97,116,218,7,79,83,
+    69,114,114,111,114,41,1,218,4,112,97,116,104,169,0,114,
+    16,0,0,0,250,23,60,115,116,100,108,105,98,62,47,103,
+    101,110,101,114,105,99,112,97,116,104,46,112,121,114,2,0,
+    0,0,16,0,0,0,115,10,0,0,0,0,2,2,1,14,
+    1,14,1,6,1,99,1,0,0,0,0,0,0,0,2,0,
+    0,0,11,0,0,0,67,0,0,0,115,48,0,0,0,121,
+    14,116,0,160,1,124,0,161,1,125,1,87,0,110,20,4,
+    0,116,2,107,10,114,34,1,0,1,0,1,0,100,1,83,
+    0,88,0,116,1,160,3,124,1,106,4,161,1,83,0,41,
+    2,122,37,84,101,115,116,32,119,104,101,116,104,101,114,32,
+    97,32,112,97,116,104,32,105,115,32,97,32,114,101,103,117,
+    108,97,114,32,102,105,108,101,70,41,5,114,12,0,0,0,
+    114,13,0,0,0,114,14,0,0,0,90,7,83,95,73,83,
+    82,69,71,218,7,115,116,95,109,111,100,101,41,2,114,15,
+    0,0,0,218,2,115,116,114,16,0,0,0,114,16,0,0,
+    0,114,17,0,0,0,114,8,0,0,0,27,0,0,0,115,
+    10,0,0,0,0,2,2,1,14,1,14,1,6,1,99,1,
+    0,0,0,0,0,0,0,2,0,0,0,11,0,0,0,67,
+    0,0,0,115,48,0,0,0,121,14,116,0,160,1,124,0,
+    161,1,125,1,87,0,110,20,4,0,116,2,107,10,114,34,
+    1,0,1,0,1,0,100,1,83,0,88,0,116,1,160,3,
+    124,1,106,4,161,1,83,0,41,2,122,60,82,101,116,117,
+    114,110,32,116,114,117,101,32,105,102,32,116,104,101,32,112,
+    97,116,104,110,97,109,101,32,114,101,102,101,114,115,32,116,
+    111,32,97,110,32,101,120,105,115,116,105,110,103,32,100,105,
+    114,101,99,116,111,114,121,46,70,41,5,114,12,0,0,0,
+    114,13,0,0,0,114,14,0,0,0,90,7,83,95,73,83,
+    68,73,82,114,18,0,0,0,41,2,218,1,115,114,19,0,
+    0,0,114,16,0,0,0,114,16,0,0,0,114,17,0,0,
+    0,114,7,0,0,0,39,0,0,0,115,10,0,0,0,0,
+    2,2,1,14,1,14,1,6,1,99,1,0,0,0,0,0,
+    0,0,1,0,0,0,3,0,0,0,67,0,0,0,115,12,
+    0,0,0,116,0,160,1,124,0,161,1,106,2,83,0,41,
+    1,122,49,82,101,116,117,114,110,32,116,104,101,32,115,105,
+    122,101,32,111,102,32,97,32,102,105,108,101,44,32,114,101,
+    112,111,114,116,101,100,32,98,121,32,111,115,46,115,116,97,
+    116,40,41,46,41,3,114,12,0,0,0,114,13,0,0,0,
+    90,7,115,116,95,115,105,122,101,41,1,218,8,102,105,108,
+    101,110,97,109,101,114,16,0,0,0,114,16,0,0,0,114,
+    17,0,0,0,114,6,0,0,0,48,0,0,0,115,2,0,
+    0,0,0,2,99,1,0,0,0,0,0,0,0,1,0,0,
+    0,3,0,0,0,67,0,0,0,115,12,0,0,0,116,0,
+    160,1,124,0,161,1,106,2,83,0,41,1,122,67,82,101,
+    116,117,114,110,32,116,104,101,32,108,97,115,116,32,109,111,
+    100,105,102,105,99,97,116,105,111,110,32,116,105,109,101,32,
+    111,102,32,97,32,102,105,108,101,44,32,114,101,112,111,114,
+    116,101,100,32,98,121,32,111,115,46,115,116,97,116,40,41,
+    46,41,3,114,12,0,0,0,114,13,0,0,0,90,8,115,
+    116,95,109,116,105,109,101,41,1,114,21,0,0,0,114,16,
+    0,0,0,114,16,0,0,0,114,17,0,0,0,114,5,0,
+    0,0,53,0,0,0,115,2,0,0,0,0,2,99,1,0,
+    0,0,0,0,0,0,1,0,0,0,3,0,0,0,67,0,
+    0,0,115,12,0,0,0,116,0,160,1,124,0,161,1,106,
+    2,83,0,41,1,122,61,82,101,116,117,114,110,32,116,104,
+    101,32,108,97,115,116,32,97,99,99,101,115,115,32,116,105,
+    109,101,32,111,102,32,97,32,102,105,108,101,44,32,114,101,
+    112,111,114,116,101,100,32,98,121,32,111,115,46,115,116,97,
+    116,40,41,46,41,3,114,12,0,0,0,114,13,0,0,0,
+    90,8,115,116,95,97,116,105,109,101,41,1,114,21,0,0,
+    0,114,16,0,0,0,114,16,0,0,0,114,17,0,0,0,
+    114,3,0,0,0,58,0,0,0,115,2,0,0,0,0,2,
+    99,1,0,0,0,0,0,0,0,1,0,0,0,3,0,0,
+    0,67,0,0,0,115,12,0,0,0,116,0,160,1,124,0,
+    161,1,106,2,83,0,41,1,122,65,82,101,116,117,114,110,
+    32,116,104,101,32,109,101,116,97,100,97,116,97,32,99,104,
+    97,110,103,101,32,116,105,109,101,32,111,102,32,97,32,102,
+    105,108,101,44,32,114,101,112,111,114,116,101,100,32,98,121,
+    32,111,115,46,115,116,97,116,40,41,46,41,3,114,12,0,
+    0,0,114,13,0,0,0,90,8,115,116,95,99,116,105,109,
+    101,41,1,114,21,0,0,0,114,16,0,0,0,114,16,0,
+    0,0,114,17,0,0,0,114,4,0,0,0,63,0,0,0,
+    115,2,0,0,0,0,2,99,1,0,0,0,0,0,0,0,
+    5,0,0,0,4,0,0,0,67,0,0,0,115,108,0,0,
+    0,124,0,115,8,100,1,83,0,116,0,124,0,100,2,25,
+    0,116,1,116,2,102,2,131,2,115,42,116,2,116,3,116,
+    4,106,5,124,0,131,2,131,1,125,0,116,6,124,0,131,
+    1,125,1,116,7,124,0,131,1,125,2,120,44,116,8,124,
+    1,131,1,68,0,93,32,92,2,125,3,125,4,124,4,124,
+    2,124,3,25,0,107,3,114,68,124,1,100,3,124,3,133,
+    2,25,0,83,0,113,68,87,0,124,1,83,0,41,4,122,
+    71,71,105,118,101,110,32,97,32,108,105,115,116,32,111,102,
+    32,112,97,116,104,110,97,109,101,115,44,32,114,101,116,117,
+    114,110,115,32,116,104,101,32,108,111,110,103,101,115,116,32,
+    99,111,109,109,111,110,32,108,101,97,100,105,110,103,32,99,
+    111,109,112,111,110,101,110,116,218,0,114,0,0,0,0,78,
+    41,9,218,10,105,115,105,110,115,116,97,110,99,101,218,4,
+    108,105,115,116,218,5,116,117,112,108,101,218,3,109,97,112,
+    114,12,0,0,0,90,6,102,115,112,97,116,104,218,3,109,
+    105,110,218,3,109,97,120,218,9,101,110,117,109,101,114,97,
+    116,101,41,5,218,1,109,218,2,115,49,218,2,115,50,218,
+    1,105,218,1,99,114,16,0,0,0,114,16,0,0,0,114,
+    17,0,0,0,114,1,0,0,0,69,0,0,0,115,20,0,
+    0,0,0,2,4,0,4,5,18,1,16,1,8,1,8,1,
+    18,1,12,1,16,1,99,2,0,0,0,0,0,0,0,2,
+    0,0,0,2,0,0,0,67,0,0,0,115,24,0,0,0,
+    124,0,106,0,124,1,106,0,107,2,111,22,124,0,106,1,
+    124,1,106,1,107,2,83,0,41,1,122,53,84,101,115,116,
+    32,119,104,101,116,104,101,114,32,116,119,111,32,115,116,97,
+    116,32,98,117,102,102,101,114,115,32,114,101,102,101,114,101,
+    110,99,101,32,116,104,101,32,115,97,109,101,32,102,105,108,
+    101,41,2,90,6,115,116,95,105,110,111,90,6,115,116,95,
+    100,101,118,41,2,114,31,0,0,0,114,32,0,0,0,114,
+    16,0,0,0,114,16,0,0,0,114,17,0,0,0,114,11,
+    0,0,0,87,0,0,0,115,4,0,0,0,0,2,12,1,
+    99,2,0,0,0,0,0,0,0,4,0,0,0,3,0,0,
+    0,67,0,0,0,115,30,0,0,0,116,0,160,1,124,0,
+    161,1,125,2,116,0,160,1,124,1,161,1,125,3,116,2,
+    124,2,124,3,131,2,83,0,41,1,122,57,84,101,115,116,
+    32,119,104,101,116,104,101,114,32,116,119,111,32,112,97,116,
+    104,110,97,109,101,115,32,114,101,102,101,114,101,110,99,101,
+    32,116,104,101,32,115,97,109,101,32,97,99,116,117,97,108,
+    32,102,105,108,101,41,3,114,12,0,0,0,114,13,0,0,
+    0,114,11,0,0,0,41,4,90,2,102,49,90,2,102,50,
+    114,31,0,0,0,114,32,0,0,0,114,16,0,0,0,114,
+    16,0,0,0,114,17,0,0,0,114,9,0,0,0,94,0,
+    0,0,115,6,0,0,0,0,2,10,1,10,1,99,2,0,
+    0,0,0,0,0,0,4,0,0,0,3,0,0,0,67,0,
+    0,0,115,30,0,0,0,116,0,160,1,124,0,161,1,125,
+    2,116,0,160,1,124,1,161,1,125,3,116,2,124,2,124,
+    3,131,2,83,0,41,1,122,58,84,101,115,116,32,119,104,
+    101,116,104,101,114,32,116,119,111,32,111,112,101,110,32,102,
+    105,108,101,32,111,98,106,101,99,116,115,32,114,101,102,101,
+    114,101,110,99,101,32,116,104,101,32,115,97,109,101,32,102,
+    105,108,101,41,3,114,12,0,0,0,90,5,102,115,116,97,
+    116,114,11,0,0,0,41,4,90,3,102,112,49,90,3,102,
+    112,50,114,31,0,0,0,114,32,0,0,0,114,16,0,0,
+    0,114,16,0,0,0,114,17,0,0,0,114,10,0,0,0,
+    103,0,0,0,115,6,0,0,0,0,2,10,1,10,1,99,
+    4,0,0,0,0,0,0,0,8,0,0,0,4,0,0,0,
+    67,0,0,0,115,142,0,0,0,124,0,160,0,124,1,161,
+    1,125,4,124,2,114,34,124,0,160,0,124,2,161,1,125,
+    5,116,1,124,4,124,5,131,2,125,4,124,0,160,0,124,
+    3,161,1,125,6,124,6,124,4,107,4,114,126,124,4,100,
+    1,23,0,125,7,120,64,124,7,124,6,107,0,114,124,124,
+    0,124,7,124,7,100,1,23,0,133,2,25,0,124,3,107,
+    3,114,114,124,0,100,2,124,6,133,2,25,0,124,0,124,
+    6,100,2,133,2,25,0,102,2,83,0,124,7,100,1,55,
+    0,125,7,113,62,87,0,124,0,124,0,100,2,100,3,133,
+    2,25,0,102,2,83,0,41,4,122,164,83,112,108,105,116,
+    32,116,104,101,32,101,120,116,101,110,115,105,111,110,32,102,
+    114,111,109,32,97,32,112,97,116,104,110,97,109,101,46,10,
+    10,32,32,32,32,69,120,116,101,110,115,105,111,110,32,105,
+    115,32,101,118,101,114,121,116,104,105,110,103,32,102,114,111,
+    109,32,116,104,101,32,108,97,115,116,32,100,111,116,32,116,
+    111,32,116,104,101,32,101,110,100,44,32,105,103,110,111,114,
+    105,110,103,10,32,32,32,32,108,101,97,100,105,110,103,32,
+    100,111,116,115,46,32,32,82,101,116,117,114,110,115,32,34,
+    40,114,111,111,116,44,32,101,120,116,41,34,59,32,101,120,
+    116,32,109,97,121,32,98,101,32,101,109,112,116,121,46,233,
+    1,0,0,0,78,114,0,0,0,0,41,2,218,5,114,102,
+    105,110,100,114,28,0,0,0,41,8,218,1,112,90,3,115,
+    101,112,90,6,97,108,116,115,101,112,90,6,101,120,116,115,
+    101,112,90,8,115,101,112,73,110,100,101,120,90,11,97,108,
+    116,115,101,112,73,110,100,101,120,90,8,100,111,116,73,110,
+    100,101,120,90,13,102,105,108,101,110,97,109,101,73,110,100,
+    101,120,114,16,0,0,0,114,16,0,0,0,114,17,0,0,
+    0,218,9,95,115,112,108,105,116,101,120,116,117,0,0,0,
+    115,24,0,0,0,0,7,10,1,4,1,10,1,10,2,10,
+    1,8,2,8,1,10,1,20,1,24,1,12,2,114,38,0,
+    0,0,99,1,0,0,0,0,0,0,0,5,0,0,0,5,
+    0,0,0,71,0,0,0,115,98,0,0,0,100,1,4,0,
+    125,2,125,3,120,66,124,1,68,0,93,58,125,4,116,0,
+    124,4,116,1,131,2,114,34,100,2,125,2,113,14,116,0,
+    124,4,116,2,131,2,114,50,100,2,125,3,113,14,116,3,
+    100,3,124,0,124,4,106,4,106,5,102,2,22,0,131,1,
+    100,0,130,2,113,14,87,0,124,2,114,94,124,3,114,94,
+    116,3,100,4,131,1,100,0,130,2,100,0,83,0,41,5,
+    78,70,84,122,42,37,115,40,41,32,97,114,103,117,109,101,
+    110,116,32,109,117,115,116,32,98,101,32,115,116,114,32,111,
+    114,32,98,121,116,101,115,44,32,110,111,116,32,37,114,122,
+    46,67,97,110,39,116,32,109,105,120,32,115,116,114,105,110,
+    103,115,32,97,110,100,32,98,121,116,101,115,32,105,110,32,
+    112,97,116,104,32,99,111,109,112,111,110,101,110,116,115,41,
+    6,114,23,0,0,0,218,3,115,116,114,218,5,98,121,116,
+    101,115,218,9,84,121,112,101,69,114,114,111,114,218,9,95,
+    95,99,108,97,115,115,95,95,218,8,95,95,110,97,109,101,
+    95,95,41,5,90,8,102,117,110,99,110,97,109,101,218,4,
+    97,114,103,115,90,6,104,97,115,115,116,114,90,8,104,97,
+    115,98,121,116,101,115,114,20,0,0,0,114,16,0,0,0,
+    114,16,0,0,0,114,17,0,0,0,218,16,95,99,104,101,
+    99,107,95,97,114,103,95,116,121,112,101,115,140,0,0,0,
+    115,20,0,0,0,0,1,8,1,10,1,10,1,6,1,10,
+    1,6,2,4,1,22,1,8,1,114,45,0,0,0,41,17,
+    218,7,95,95,100,111,99,95,95,114,12,0,0,0,114,13,
+    0,0,0,90,7,95,95,97,108,108,95,95,114,2,0,0,
+    0,114,8,0,0,0,114,7,0,0,0,114,6,0,0,0,
+    114,5,0,0,0,114,3,0,0,0,114,4,0,0,0,114,
+    1,0,0,0,114,11,0,0,0,114,9,0,0,0,114,10,
+    0,0,0,114,38,0,0,0,114,45,0,0,0,114,16,0,
+    0,0,114,16,0,0,0,114,16,0,0,0,114,17,0,0,
+    0,218,8,60,109,111,100,117,108,101,62,5,0,0,0,115,
+    36,0,0,0,4,1,8,1,8,2,10,1,10,1,6,5,
+    8,11,8,12,8,9,8,5,8,5,8,5,8,6,8,18,
+    8,7,8,9,8,14,8,23,
+};
+static const unsigned char _Py_M___collections_abc[] = {
+    99,0,0,0,0,0,0,0,0,0,0,0,0,25,0,0,
+    0,64,0,0,0,115,110,4,0,0,100,0,90,0,100,1,
+    100,2,108,1,109,2,90,2,109,3,90,3,1,0,100,1,
+    100,3,108,4,90,4,100,4,100,5,100,6,100,7,100,8,
+    100,9,100,10,100,11,100,12,100,13,100,14,100,15,100,16,
+    100,17,100,18,100,19,100,20,100,21,100,22,100,23,100,24,
+    100,25,100,26,100,27,100,28,103,25,90,5,100,29,90,6,
+    101,7,101,8,100,30,131,1,131,1,90,9,101,7,101,8,
+    101,10,131,0,131,1,131,1,90,11,101,7,101,8,105,0,
+    160,12,161,0,131,1,131,1,90,13,101,7,101,8,105,0,
+    160,14,161,0,131,1,131,1,90,15,101,7,101,8,105,0,
+    160,16,161,0,131,1,131,1,90,17,101,7,101,8,103,0,
+    131,1,131,1,90,18,101,7,101,8,101,19,103,0,131,1,
+    131,1,131,1,90,20,101,7,101,8,101,21,100,1,131,1,
+    131,1,131,1,90,22,101,7,101,8,101,21,100,68,131,1,
+    131,1,131,1,90,23,101,7,101,8,101,24,131,0,131,1,
+    131,1,90,25,101,7,101,8,100,33,131,1,131,1,90,26,
+    101,7,101,8,102,0,131,1,131,1,90,27,101,7,101,8,
+    101,28,131,0,131,1,131,1,90,29,101,7,105,0,160,12,
+    161,0,131,1,90,30,101,7,105,0,160,14,161,0,131,1,
+    90,31,101,7,105,0,160,16,161,0,131,1,90,32,101,7,
+    101,7,106,33,131,1,90,34,101,7,100,34,100,35,132,0,
+    131,0,131,1,90,35,100,36,100,37,132,0,90,36,101,36,
+    131,0,90,36,101,7,101,36,131,1,90,37,101,36,160,38,
+    161,0,1,0,91,36,100,38,100,39,132,0,90,39,101,39,
+    131,0,90,39,101,7,101,39,131,1,90,40,91,39,100,40,
+    100,41,132,0,90,41,71,0,100,42,100,9,132,0,100,9,
+    101,2,100,43,141,3,90,42,71,0,100,44,100,4,132,0,
+    100,4,101,2,100,43,141,3,90,43,71,0,100,45,100,5,
+    132,0,100,5,101,43,131,3,90,44,101,44,160,45,101,37,
+    161,1,1,0,71,0,100,46,100,6,132,0,100,6,101,2,
+    100,43,141,3,90,46,71,0,100,47,100,7,132,0,100,7,
+    101,46,131,3,90,47,71,0,100,48,100,8,132,0,100,8,
+    101,47,131,3,90,48,101,48,160,45,101,40,161,1,1,0,
+    71,0,100,49,100,10,132,0,100,10,101,2,100,43,141,3,
+    90,49,71,0,100,50,100,11,132,0,100,11,101,49,131,3,
+    90,50,101,50,160,45,101,9,161,1,1,0,101,50,160,45,
+    101,11,161,1,1,0,101,50,160,45,101,13,161,1,1,0,
+    101,50,160,45,101,15,161,1,1,0,101,50,160,45,101,17,
+    161,1,1,0,101,50,160,45,101,18,161,1,1,0,101,50,
+    160,45,101,20,161,1,1,0,101,50,160,45,101,22,161,1,
+    1,0,101,50,160,45,101,23,161,1,1,0,101,50,160,45,
+    101,25,161,1,1,0,101,50,160,45,101,26,161,1,1,0,
+    101,50,160,45,101,27,161,1,1,0,101,50,160,45,101,29,
+    161,1,1,0,71,0,100,51,100,13,132,0,100,13,101,49,
+    131,3,90,51,71,0,100,52,100,12,132,0,100,12,101,50,
+    131,3,90,52,101,52,160,45,101,35,161,1,1,0,71,0,
+    100,53,100,14,132,0,100,14,101,2,100,43,141,3,90,53,
+    71,0,100,54,100,15,132,0,100,15,101,2,100,43,141,3,
+    90,54,71,0,100,55,100,17,132,0,100,17,101,53,101,49,
+    101,54,131,5,90,55,71,0,100,56,100,16,132,0,100,16,
+    101,2,100,43,141,3,90,56,71,0,100,57,100,18,132,0,
+    100,18,101,55,131,3,90,57,101,57,160,45,101,58,161,1,
+    1,0,71,0,100,58,100,19,132,0,100,19,101,57,131,3,
+    90,59,101,59,160,45,101,24,161,1,1,0,71,0,100,59,
+    100,20,132,0,100,20,101,55,131,3,90,60,101,60,160,45,
+    101,34,161,1,1,0,71,0,100,60,100,22,132,0,100,22,
+    101,53,131,3,90,61,71,0,100,61,100,23,132,0,100,23,
+    101,61,101,57,131,4,90,62,101,62,160,45,101,30,161,1,
+    1,0,71,0,100,62,100,24,132,0,100,24,101,61,101,57,
+    131,4,90,63,101,63,160,45,101,32,161,1,1,0,71,0,
+    100,63,100,25,132,0,100,25,101,61,131,3,90,64,101,64,
+    160,45,101,31,161,1,1,0,71,0,100,64,100,21,132,0,
+    100,21,101,60,131,3,90,65,101,65,160,45,101,66,161,1,
+    1,0,71,0,100,65,100,26,132,0,100,26,101,51,101,55,
+    131,4,90,67,101,67,160,45,101,68,161,1,1,0,101,67,
+    160,45,101,69,161,1,1,0,101,67,160,45,101,21,161,1,
+    1,0,101,67,160,45,101,70,161,1,1,0,71,0,100,66,
+    100,28,132,0,100,28,101,67,131,3,90,71,101,71,160,45,
+    101,72,161,1,1,0,101,71,160,45,101,10,161,1,1,0,
+    71,0,100,67,100,27,132,0,100,27,101,67,131,3,90,73,
+    101,73,160,45,101,74,161,1,1,0,101,73,160,45,101,10,
+    161,1,1,0,100,3,83,0,41,69,122,106,65,98,115,116,
+    114,97,99,116,32,66,97,115,101,32,67,108,97,115,115,101,
+    115,32,40,65,66,67,115,41,32,102,111,114,32,99,111,108,
+    108,101,99,116,105,111,110,115,44,32,97,99,99,111,114,100,
+    105,110,103,32,116,111,32,80,69,80,32,51,49,49,57,46,
+    10,10,85,110,105,116,32,116,101,115,116,115,32,97,114,101,
+    32,105,110,32,116,101,115,116,95,99,111,108,108,101,99,116,
+    105,111,110,115,46,10,233,0,0,0,0,41,2,218,7,65,
+    66,67,77,101,116,97,218,14,97,98,115,116,114,97,99,116,
+    109,101,116,104,111,100,78,218,9,65,119,97,105,116,97,98,
+    108,101,218,9,67,111,114,111,117,116,105,110,101,218,13,65,
+    115,121,110,99,73,116,101,114,97,98,108,101,218,13,65,115,
+    121,110,99,73,116,101,114,97,116,111,114,218,14,65,115,121,
+    110,99,71,101,110,101,114,97,116,111,114,218,8,72,97,115,
+    104,97,98,108,101,218,8,73,116,101,114,97,98,108,101,218,
+    8,73,116,101,114,97,116,111,114,218,9,71,101,110,101,114,
+    97,116,111,114,218,10,82,101,118,101,114,115,105,98,108,101,
+    218,5,83,105,122,101,100,218,9,67,111,110,116,97,105,110,
+    101,114,218,8,67,97,108,108,97,98,108,101,218,10,67,111,
+    108,108,101,99,116,105,111,110,218,3,83,101,116,218,10,77,
+    117,116,97,98,108,101,83,101,116,218,7,77,97,112,112,105,
+    110,103,218,14,77,117,116,97,98,108,101,77,97,112,112,105,
+    110,103,218,11,77,97,112,112,105,110,103,86,105,101,119,218,
+    8,75,101,121,115,86,105,101,119,218,9,73,116,101,109,115,
+    86,105,101,119,218,10,86,97,108,117,101,115,86,105,101,119,
+    218,8,83,101,113,117,101,110,99,101,218,15,77,117,116,97,
+    98,108,101,83,101,113,117,101,110,99,101,218,10,66,121,116,
+    101,83,116,114,105,110,103,122,15,99,111,108,108,101,99,116,
+    105,111,110,115,46,97,98,99,243,0,0,0,0,233,1,0,
+    0,0,105,232,3,0,0,218,0,99,0,0,0,0,0,0,
+    0,0,0,0,0,0,1,0,0,0,99,0,0,0,115,6,
+    0,0,0,100,0,86,0,83,0,41,1,78,169,0,114,31,
+    0,0,0,114,31,0,0,0,114,31,0,0,0,250,28,60,
+    115,116,100,108,105,98,62,47,95,99,111,108,108,101,99,116,
+    105,111,110,115,95,97,98,99,46,112,121,218,8,60,108,97,
+    109,98,100,97,62,56,0,0,0,115,0,0,0,0,114,33,
+    0,0,0,99,0,0,0,0,0,0,0,0,0,0,0,0,
+    1,0,0,0,195,0,0,0,115,4,0,0,0,100,0,83,
+    0,41,1,78,114,31,0,0,0,114,31,0,0,0,114,31,
+    0,0,0,114,31,0,0,0,114,32,0,0,0,218,5,95,
+    99,111,114,111,58,0,0,0,115,0,0,0,0,114,34,0,
+    0,0,99,0,0,0,0,0,0,0,0,0,0,0,0,1,
+    0,0,0,67,2,0,0,115,10,0,0,0,100,0,86,0,
+    1,0,100,0,83,0,41,1,78,114,31,0,0,0,114,31,
+    0,0,0,114,31,0,0,0,114,31,0,0,0,114,32,0,
+    0,0,218,3,95,97,103,64,0,0,0,115,0,0,0,0,
+    114,35,0,0,0,99,1,0,0,0,0,0,0,0,5,0,
+    0,0,4,0,0,0,71,0,0,0,115,72,0,0,0,124,
+    0,106,0,125,2,120,60,124,1,68,0,93,52,125,3,120,
+    46,124,2,68,0,93,34,125,4,124,3,124,4,106,1,107,
+    6,114,22,124,4,106,1,124,3,25,0,100,0,107,8,114,
+    54,116,2,83,0,80,0,113,22,87,0,116,2,83,0,113,
+    12,87,0,100,1,83,0,41,2,78,84,41,3,218,7,95,
+    95,109,114,111,95,95,218,8,95,95,100,105,99,116,95,95,
+    218,14,78,111,116,73,109,112,108,101,109,101,110,116,101,100,
+    41,5,218,1,67,90,7,109,101,116,104,111,100,115,218,3,
+    109,114,111,90,6,109,101,116,104,111,100,218,1,66,114,31,
+    0,0,0,114,31,0,0,0,114,32,0,0,0,218,14,95,
+    99,104,101,99,107,95,109,101,116,104,111,100,115,72,0,0,
+    0,115,18,0,0,0,0,1,6,1,10,1,10,1,10,1,
+    14,1,4,1,6,2,8,1,114,42,0,0,0,99,0,0,
+    0,0,0,0,0,0,0,0,0,0,3,0,0,0,64,0,
+    0,0,115,40,0,0,0,101,0,90,1,100,0,90,2,102,
+    0,90,3,101,4,100,1,100,2,132,0,131,1,90,5,101,
+    6,100,3,100,4,132,0,131,1,90,7,100,5,83,0,41,
+    6,114,8,0,0,0,99,1,0,0,0,0,0,0,0,1,
+    0,0,0,1,0,0,0,67,0,0,0,115,4,0,0,0,
+    100,1,83,0,41,2,78,114,0,0,0,0,114,31,0,0,
+    0,41,1,218,4,115,101,108,102,114,31,0,0,0,114,31,
+    0,0,0,114,32,0,0,0,218,8,95,95,104,97,115,104,
+    95,95,88,0,0,0,115,2,0,0,0,0,2,122,17,72,
+    97,115,104,97,98,108,101,46,95,95,104,97,115,104,95,95,
+    99,2,0,0,0,0,0,0,0,2,0,0,0,3,0,0,
+    0,67,0,0,0,115,22,0,0,0,124,0,116,0,107,8,
+    114,18,116,1,124,1,100,1,131,2,83,0,116,2,83,0,
+    41,2,78,114,44,0,0,0,41,3,114,8,0,0,0,114,
+    42,0,0,0,114,38,0,0,0,41,2,218,3,99,108,115,
+    114,39,0,0,0,114,31,0,0,0,114,31,0,0,0,114,
+    32,0,0,0,218,16,95,95,115,117,98,99,108,97,115,115,
+    104,111,111,107,95,95,92,0,0,0,115,6,0,0,0,0,
+    2,8,1,10,1,122,25,72,97,115,104,97,98,108,101,46,
+    95,95,115,117,98,99,108,97,115,115,104,111,111,107,95,95,
+    78,41,8,218,8,95,95,110,97,109,101,95,95,218,10,95,
+    95,109,111,100,117,108,101,95,95,218,12,95,95,113,117,97,
+    108,110,97,109,101,95,95,218,9,95,95,115,108,111,116,115,
+    95,95,114,2,0,0,0,114,44,0,0,0,218,11,99,108,
+    97,115,115,109,101,116,104,111,100,114,46,0,0,0,114,31,
+    0,0,0,114,31,0,0,0,114,31,0,0,0,114,32,0,
+    0,0,114,8,0,0,0,84,0,0,0,115,6,0,0,0,
+    8,2,4,2,12,4,41,1,90,9,109,101,116,97,99,108,
+    97,115,115,99,0,0,0,0,0,0,0,0,0,0,0,0,
+    3,0,0,0,64,0,0,0,115,40,0,0,0,101,0,90,
+    1,100,0,90,2,102,0,90,3,101,4,100,1,100,2,132,
+    0,131,1,90,5,101,6,100,3,100,4,132,0,131,1,90,
+    7,100,5,83,0,41,6,114,3,0,0,0,99,1,0,0,
+    0,0,0,0,0,1,0,0,0,1,0,0,0,99,0,0,
+    0,115,10,0,0,0,100,0,86,0,1,0,100,0,83,0,
+    41,1,78,114,31,0,0,0,41,1,114,43,0,0,0,114,
+    31,0,0,0,114,31,0,0,0,114,32,0,0,0,218,9,
+    95,95,97,119,97,105,116,95,95,103,0,0,0,115,2,0,
+    0,0,0,2,122,19,65,119,97,105,116,97,98,108,101,46,
+    95,95,97,119,97,105,116,95,95,99,2,0,0,0,0,0,
+    0,0,2,0,0,0,3,0,0,0,67,0,0,0,115,22,
+    0,0,0,124,0,116,0,107,8,114,18,116,1,124,1,100,
+    1,131,2,83,0,116,2,83,0,41,2,78,114,52,0,0,
+    0,41,3,114,3,0,0,0,114,42,0,0,0,114,38,0,
+    0,0,41,2,114,45,0,0,0,114,39,0,0,0,114,31,
+    0,0,0,114,31,0,0,0,114,32,0,0,0,114,46,0,
+    0,0,107,0,0,0,115,6,0,0,0,0,2,8,1,10,
+    1,122,26,65,119,97,105,116,97,98,108,101,46,95,95,115,
+    117,98,99,108,97,115,115,104,111,111,107,95,95,78,41,8,
+    114,47,0,0,0,114,48,0,0,0,114,49,0,0,0,114,
+    50,0,0,0,114,2,0,0,0,114,52,0,0,0,114,51,
+    0,0,0,114,46,0,0,0,114,31,0,0,0,114,31,0,
+    0,0,114,31,0,0,0,114,32,0,0,0,114,3,0,0,
+    0,99,0,0,0,115,6,0,0,0,8,2,4,2,12,4,
+    99,0,0,0,0,0,0,0,0,0,0,0,0,4,0,0,
+    0,64,0,0,0,115,62,0,0,0,101,0,90,1,100,0,
+    90,2,102,0,90,3,101,4,100,1,100,2,132,0,131,1,
+    90,5,101,4,100,10,100,4,100,5,132,1,131,1,90,6,
+    100,6,100,7,132,0,90,7,101,8,100,8,100,9,132,0,
+    131,1,90,9,100,3,83,0,41,11,114,4,0,0,0,99,
+    2,0,0,0,0,0,0,0,2,0,0,0,1,0,0,0,
+    67,0,0,0,115,8,0,0,0,116,0,130,1,100,1,83,
+    0,41,2,122,99,83,101,110,100,32,97,32,118,97,108,117,
+    101,32,105,110,116,111,32,116,104,101,32,99,111,114,111,117,
+    116,105,110,101,46,10,32,32,32,32,32,32,32,32,82,101,
+    116,117,114,110,32,110,101,120,116,32,121,105,101,108,100,101,
+    100,32,118,97,108,117,101,32,111,114,32,114,97,105,115,101,
+    32,83,116,111,112,73,116,101,114,97,116,105,111,110,46,10,
+    32,32,32,32,32,32,32,32,78,41,1,218,13,83,116,111,
+    112,73,116,101,114,97,116,105,111,110,41,2,114,43,0,0,
+    0,218,5,118,97,108,117,101,114,31,0,0,0,114,31,0,
+    0,0,114,32,0,0,0,218,4,115,101,110,100,118,0,0,
+    0,115,2,0,0,0,0,5,122,14,67,111,114,111,117,116,
+    105,110,101,46,115,101,110,100,78,99,4,0,0,0,0,0,
+    0,0,4,0,0,0,3,0,0,0,67,0,0,0,115,52,
+    0,0,0,124,2,100,1,107,8,114,26,124,3,100,1,107,
+    8,114,20,124,1,130,1,124,1,131,0,125,2,124,3,100,
+    1,107,9,114,44,124,2,160,0,124,3,161,1,125,2,124,
+    2,130,1,100,1,83,0,41,2,122,103,82,97,105,115,101,
+    32,97,110,32,101,120,99,101,112,116,105,111,110,32,105,110,
+    32,116,104,101,32,99,111,114,111,117,116,105,110,101,46,10,
+    32,32,32,32,32,32,32,32,82,101,116,117,114,110,32,110,
+    101,120,116,32,121,105,101,108,100,101,100,32,118,97,108,117,
+    101,32,111,114,32,114,97,105,115,101,32,83,116,111,112,73,
+    116,101,114,97,116,105,111,110,46,10,32,32,32,32,32,32,
+    32,32,78,41,1,218,14,119,105,116,104,95,116,114,97,99,
+    101,98,97,99,107,41,4,114,43,0,0,0,218,3,116,121,
+    112,218,3,118,97,108,218,2,116,98,114,31,0,0,0,114,
+    31,0,0,0,114,32,0,0,0,218,5,116,104,114,111,119,
+    125,0,0,0,115,14,0,0,0,0,5,8,1,8,1,4,
+    1,6,1,8,1,10,1,122,15,67,111,114,111,117,116,105,
+    110,101,46,116,104,114,111,119,99,1,0,0,0,0,0,0,
+    0,1,0,0,0,12,0,0,0,67,0,0,0,115,52,0,
+    0,0,121,14,124,0,160,0,116,1,161,1,1,0,87,0,
+    110,24,4,0,116,1,116,2,102,2,107,10,114,38,1,0,
+    1,0,1,0,89,0,110,10,88,0,116,3,100,1,131,1,
+    130,1,100,2,83,0,41,3,122,46,82,97,105,115,101,32,
+    71,101,110,101,114,97,116,111,114,69,120,105,116,32,105,110,
+    115,105,100,101,32,99,111,114,111,117,116,105,110,101,46,10,
+    32,32,32,32,32,32,32,32,122,31,99,111,114,111,117,116,
+    105,110,101,32,105,103,110,111,114,101,100,32,71,101,110,101,
+    114,97,116,111,114,69,120,105,116,78,41,4,114,60,0,0,
+    0,218,13,71,101,110,101,114,97,116,111,114,69,120,105,116,
+    114,53,0,0,0,218,12,82,117,110,116,105,109,101,69,114,
+    114,111,114,41,1,114,43,0,0,0,114,31,0,0,0,114,
+    31,0,0,0,114,32,0,0,0,218,5,99,108,111,115,101,
+    138,0,0,0,115,10,0,0,0,0,3,2,1,14,1,18,
+    1,6,2,122,15,67,111,114,111,117,116,105,110,101,46,99,
+    108,111,115,101,99,2,0,0,0,0,0,0,0,2,0,0,
+    0,6,0,0,0,67,0,0,0,115,28,0,0,0,124,0,
+    116,0,107,8,114,24,116,1,124,1,100,1,100,2,100,3,
+    100,4,131,5,83,0,116,2,83,0,41,5,78,114,52,0,
+    0,0,114,55,0,0,0,114,60,0,0,0,114,63,0,0,
+    0,41,3,114,4,0,0,0,114,42,0,0,0,114,38,0,
+    0,0,41,2,114,45,0,0,0,114,39,0,0,0,114,31,
+    0,0,0,114,31,0,0,0,114,32,0,0,0,114,46,0,
+    0,0,148,0,0,0,115,6,0,0,0,0,2,8,1,16,
+    1,122,26,67,111,114,111,117,116,105,110,101,46,95,95,115,
+    117,98,99,108,97,115,115,104,111,111,107,95,95,41,2,78,
+    78,41,10,114,47,0,0,0,114,48,0,0,0,114,49,0,
+    0,0,114,50,0,0,0,114,2,0,0,0,114,55,0,0,
+    0,114,60,0,0,0,114,63,0,0,0,114,51,0,0,0,
+    114,46,0,0,0,114,31,0,0,0,114,31,0,0,0,114,
+    31,0,0,0,114,32,0,0,0,114,4,0,0,0,114,0,
+    0,0,115,12,0,0,0,8,2,4,2,12,7,2,1,12,
+    12,8,10,99,0,0,0,0,0,0,0,0,0,0,0,0,
+    3,0,0,0,64,0,0,0,115,40,0,0,0,101,0,90,
+    1,100,0,90,2,102,0,90,3,101,4,100,1,100,2,132,
+    0,131,1,90,5,101,6,100,3,100,4,132,0,131,1,90,
+    7,100,5,83,0,41,6,114,5,0,0,0,99,1,0,0,
+    0,0,0,0,0,1,0,0,0,1,0,0,0,67,0,0,
+    0,115,6,0,0,0,116,0,131,0,83,0,41,1,78,41,
+    1,114,6,0,0,0,41,1,114,43,0,0,0,114,31,0,
+    0,0,114,31,0,0,0,114,32,0,0,0,218,9,95,95,
+    97,105,116,101,114,95,95,162,0,0,0,115,2,0,0,0,
+    0,2,122,23,65,115,121,110,99,73,116,101,114,97,98,108,
+    101,46,95,95,97,105,116,101,114,95,95,99,2,0,0,0,
+    0,0,0,0,2,0,0,0,3,0,0,0,67,0,0,0,
+    115,22,0,0,0,124,0,116,0,107,8,114,18,116,1,124,
+    1,100,1,131,2,83,0,116,2,83,0,41,2,78,114,64,
+    0,0,0,41,3,114,5,0,0,0,114,42,0,0,0,114,
+    38,0,0,0,41,2,114,45,0,0,0,114,39,0,0,0,
+    114,31,0,0,0,114,31,0,0,0,114,32,0,0,0,114,
+    46,0,0,0,166,0,0,0,115,6,0,0,0,0,2,8,
+    1,10,1,122,30,65,115,121,110,99,73,116,101,114,97,98,
+    108,101,46,95,95,115,117,98,99,108,97,115,115,104,111,111,
+    107,95,95,78,41,8,114,47,0,0,0,114,48,0,0,0,
+    114,49,0,0,0,114,50,0,0,0,114,2,0,0,0,114,
+    64,0,0,0,114,51,0,0,0,114,46,0,0,0,114,31,
+    0,0,0,114,31,0,0,0,114,31,0,0,0,114,32,0,
+    0,0,114,5,0,0,0,158,0,0,0,115,6,0,0,0,
+    8,2,4,2,12,4,99,0,0,0,0,0,0,0,0,0,
+    0,0,0,3,0,0,0,64,0,0,0,115,48,0,0,0,
+    101,0,90,1,100,0,90,2,102,0,90,3,101,4,100,1,
+    100,2,132,0,131,1,90,5,100,3,100,4,132,0,90,6,
+    101,7,100,5,100,6,132,0,131,1,90,8,100,7,83,0,
+    41,8,114,6,0,0,0,99,1,0,0,0,0,0,0,0,
+    1,0,0,0,1,0,0,0,195,0,0,0,115,8,0,0,
+    0,116,0,130,1,100,1,83,0,41,2,122,64,82,101,116,
+    117,114,110,32,116,104,101,32,110,101,120,116,32,105,116,101,
+    109,32,111,114,32,114,97,105,115,101,32,83,116,111,112,65,
+    115,121,110,99,73,116,101,114,97,116,105,111,110,32,119,104,
+    101,110,32,101,120,104,97,117,115,116,101,100,46,78,41,1,
+    218,18,83,116,111,112,65,115,121,110,99,73,116,101,114,97,
+    116,105,111,110,41,1,114,43,0,0,0,114,31,0,0,0,
+    114,31,0,0,0,114,32,0,0,0,218,9,95,95,97,110,
+    101,120,116,95,95,177,0,0,0,115,2,0,0,0,0,3,
+    122,23,65,115,121,110,99,73,116,101,114,97,116,111,114,46,
+    95,95,97,110,101,120,116,95,95,99,1,0,0,0,0,0,
+    0,0,1,0,0,0,1,0,0,0,67,0,0,0,115,4,
+    0,0,0,124,0,83,0,41,1,78,114,31,0,0,0,41,
+    1,114,43,0,0,0,114,31,0,0,0,114,31,0,0,0,
+    114,32,0,0,0,114,64,0,0,0,182,0,0,0,115,2,
+    0,0,0,0,1,122,23,65,115,121,110,99,73,116,101,114,
+    97,116,111,114,46,95,95,97,105,116,101,114,95,95,99,2,
+    0,0,0,0,0,0,0,2,0,0,0,4,0,0,0,67,
+    0,0,0,115,24,0,0,0,124,0,116,0,107,8,114,20,
+    116,1,124,1,100,1,100,2,131,3,83,0,116,2,83,0,
+    41,3,78,114,66,0,0,0,114,64,0,0,0,41,3,114,
+    6,0,0,0,114,42,0,0,0,114,38,0,0,0,41,2,
+    114,45,0,0,0,114,39,0,0,0,114,31,0,0,0,114,
+    31,0,0,0,114,32,0,0,0,114,46,0,0,0,185,0,
+    0,0,115,6,0,0,0,0,2,8,1,12,1,122,30,65,
+    115,121,110,99,73,116,101,114,97,116,111,114,46,95,95,115,
+    117,98,99,108,97,115,115,104,111,111,107,95,95,78,41,9,
+    114,47,0,0,0,114,48,0,0,0,114,49,0,0,0,114,
+    50,0,0,0,114,2,0,0,0,114,66,0,0,0,114,64,
+    0,0,0,114,51,0,0,0,114,46,0,0,0,114,31,0,
+    0,0,114,31,0,0,0,114,31,0,0,0,114,32,0,0,
+    0,114,6,0,0,0,173,0,0,0,115,8,0,0,0,8,
+    2,4,2,12,5,8,3,99,0,0,0,0,0,0,0,0,
+    0,0,0,0,4,0,0,0,64,0,0,0,115,70,0,0,
+    0,101,0,90,1,100,0,90,2,102,0,90,3,100,1,100,
+    2,132,0,90,4,101,5,100,3,100,4,132,0,131,1,90,
+    6,101,5,100,12,100,6,100,7,132,1,131,1,90,7,100,
+    8,100,9,132,0,90,8,101,9,100,10,100,11,132,0,131,
+    1,90,10,100,5,83,0,41,13,114,7,0,0,0,99,1,
+    0,0,0,0,0,0,0,1,0,0,0,3,0,0,0,195,
+    0,0,0,115,16,0,0,0,124,0,160,0,100,1,161,1,
+    73,0,100,1,72,0,83,0,41,2,122,112,82,101,116,117,
+    114,110,32,116,104,101,32,110,101,120,116,32,105,116,101,109,
+    32,102,114,111,109,32,116,104,101,32,97,115,121,110,99,104,
+    114,111,110,111,117,115,32,103,101,110,101,114,97,116,111,114,
+    46,10,32,32,32,32,32,32,32,32,87,104,101,110,32,101,
+    120,104,97,117,115,116,101,100,44,32,114,97,105,115,101,32,
+    83,116,111,112,65,115,121,110,99,73,116,101,114,97,116,105,
+    111,110,46,10,32,32,32,32,32,32,32,32,78,41,1,218,
+    5,97,115,101,110,100,41,1,114,43,0,0,0,114,31,0,
+    0,0,114,31,0,0,0,114,32,0,0,0,114,66,0,0,
+    0,196,0,0,0,115,2,0,0,0,0,4,122,24,65,115,
+    121,110,99,71,101,110,101,114,97,116,111,114,46,95,95,97,
+    110,101,120,116,95,95,99,2,0,0,0,0,0,0,0,2,
+    0,0,0,1,0,0,0,195,0,0,0,115,8,0,0,0,
+    116,0,130,1,100,1,83,0,41,2,122,117,83,101,110,100,
+    32,97,32,118,97,108,117,101,32,105,110,116,111,32,116,104,
+    101,32,97,115,121,110,99,104,114,111,110,111,117,115,32,103,
+    101,110,101,114,97,116,111,114,46,10,32,32,32,32,32,32,
+    32,32,82,101,116,117,114,110,32,110,101,120,116,32,121,105,
+    101,108,100,101,100,32,118,97,108,117,101,32,111,114,32,114,
+    97,105,115,101,32,83,116,111,112,65,115,121,110,99,73,116,
+    101,114,97,116,105,111,110,46,10,32,32,32,32,32,32,32,
+    32,78,41,1,114,65,0,0,0,41,2,114,43,0,0,0,
+    114,54,0,0,0,114,31,0,0,0,114,31,0,0,0,114,
+    32,0,0,0,114,67,0,0,0,202,0,0,0,115,2,0,
+    0,0,0,5,122,20,65,115,121,110,99,71,101,110,101,114,
+    97,116,111,114,46,97,115,101,110,100,78,99,4,0,0,0,
+    0,0,0,0,4,0,0,0,3,0,0,0,195,0,0,0,
+    115,52,0,0,0,124,2,100,1,107,8,114,26,124,3,100,
+    1,107,8,114,20,124,1,130,1,124,1,131,0,125,2,124,
+    3,100,1,107,9,114,44,124,2,160,0,124,3,161,1,125,
+    2,124,2,130,1,100,1,83,0,41,2,122,121,82,97,105,
+    115,101,32,97,110,32,101,120,99,101,112,116,105,111,110,32,
+    105,110,32,116,104,101,32,97,115,121,110,99,104,114,111,110,
+    111,117,115,32,103,101,110,101,114,97,116,111,114,46,10,32,
+    32,32,32,32,32,32,32,82,101,116,117,114,110,32,110,101,
+    120,116,32,121,105,101,108,100,101,100,32,118,97,108,117,101,
+    32,111,114,32,114,97,105,115,101,32,83,116,111,112,65,115,
+    121,110,99,73,116,101,114,97,116,105,111,110,46,10,32,32,
+    32,32,32,32,32,32,78,41,1,114,56,0,0,0,41,4,
+    114,43,0,0,0,114,57,0,0,0,114,58,0,0,0,114,
+    59,0,0,0,114,31,0,0,0,114,31,0,0,0,114,32,
+    0,0,0,218,6,97,116,104,114,111,119,209,0,0,0,115,
+    14,0,0,0,0,5,8,1,8,1,4,1,6,1,8,1,
+    10,1,122,21,65,115,121,110,99,71,101,110,101,114,97,116,
+    111,114,46,97,116,104,114,111,119,99,1,0,0,0,0,0,
+    0,0,1,0,0,0,12,0,0,0,195,0,0,0,115,58,
+    0,0,0,121,20,124,0,160,0,116,1,161,1,73,0,100,
+    1,72,0,1,0,87,0,110,24,4,0,116,1,116,2,102,
+    2,107,10,114,44,1,0,1,0,1,0,89,0,110,10,88,
+    0,116,3,100,2,131,1,130,1,100,1,83,0,41,3,122,
+    46,82,97,105,115,101,32,71,101,110,101,114,97,116,111,114,
+    69,120,105,116,32,105,110,115,105,100,101,32,99,111,114,111,
+    117,116,105,110,101,46,10,32,32,32,32,32,32,32,32,78,
+    122,44,97,115,121,110,99,104,114,111,110,111,117,115,32,103,
+    101,110,101,114,97,116,111,114,32,105,103,110,111,114,101,100,
+    32,71,101,110,101,114,97,116,111,114,69,120,105,116,41,4,
+    114,68,0,0,0,114,61,0,0,0,114,65,0,0,0,114,
+    62,0,0,0,41,1,114,43,0,0,0,114,31,0,0,0,
+    114,31,0,0,0,114,32,0,0,0,218,6,97,99,108,111,
+    115,101,222,0,0,0,115,10,0,0,0,0,3,2,1,20,
+    1,18,1,6,2,122,21,65,115,121,110,99,71,101,110,101,
+    114,97,116,111,114,46,97,99,108,111,115,101,99,2,0,0,
+    0,0,0,0,0,2,0,0,0,7,0,0,0,67,0,0,
+    0,115,30,0,0,0,124,0,116,0,107,8,114,26,116,1,
+    124,1,100,1,100,2,100,3,100,4,100,5,131,6,83,0,
+    116,2,83,0,41,6,78,114,64,0,0,0,114,66,0,0,
+    0,114,67,0,0,0,114,68,0,0,0,114,69,0,0,0,
+    41,3,114,7,0,0,0,114,42,0,0,0,114,38,0,0,
+    0,41,2,114,45,0,0,0,114,39,0,0,0,114,31,0,
+    0,0,114,31,0,0,0,114,32,0,0,0,114,46,0,0,
+    0,232,0,0,0,115,8,0,0,0,0,2,8,1,8,1,
+    10,1,122,31,65,115,121,110,99,71,101,110,101,114,97,116,
+    111,114,46,95,95,115,117,98,99,108,97,115,115,104,111,111,
+    107,95,95,41,2,78,78,41,11,114,47,0,0,0,114,48,
+    0,0,0,114,49,0,0,0,114,50,0,0,0,114,66,0,
+    0,0,114,2,0,0,0,114,67,0,0,0,114,68,0,0,
+    0,114,69,0,0,0,114,51,0,0,0,114,46,0,0,0,
+    114,31,0,0,0,114,31,0,0,0,114,31,0,0,0,114,
+    32,0,0,0,114,7,0,0,0,192,0,0,0,115,14,0,
+    0,0,8,2,4,2,8,6,12,7,2,1,12,12,8,10,
+    99,0,0,0,0,0,0,0,0,0,0,0,0,3,0,0,
+    0,64,0,0,0,115,40,0,0,0,101,0,90,1,100,0,
+    90,2,102,0,90,3,101,4,100,1,100,2,132,0,131,1,
+    90,5,101,6,100,3,100,4,132,0,131,1,90,7,100,5,
+    83,0,41,6,114,9,0,0,0,99,1,0,0,0,0,0,
+    0,0,1,0,0,0,1,0,0,0,99,0,0,0,115,4,
+    0,0,0,100,0,83,0,41,1,78,114,31,0,0,0,41,
+    1,114,43,0,0,0,114,31,0,0,0,114,31,0,0,0,
+    114,32,0,0,0,218,8,95,95,105,116,101,114,95,95,247,
+    0,0,0,115,2,0,0,0,0,2,122,17,73,116,101,114,
+    97,98,108,101,46,95,95,105,116,101,114,95,95,99,2,0,
+    0,0,0,0,0,0,2,0,0,0,3,0,0,0,67,0,
+    0,0,115,22,0,0,0,124,0,116,0,107,8,114,18,116,
+    1,124,1,100,1,131,2,83,0,116,2,83,0,41,2,78,
+    114,70,0,0,0,41,3,114,9,0,0,0,114,42,0,0,
+    0,114,38,0,0,0,41,2,114,45,0,0,0,114,39,0,
+    0,0,114,31,0,0,0,114,31,0,0,0,114,32,0,0,
+    0,114,46,0,0,0,252,0,0,0,115,6,0,0,0,0,
+    2,8,1,10,1,122,25,73,116,101,114,97,98,108,101,46,
+    95,95,115,117,98,99,108,97,115,115,104,111,111,107,95,95,
+    78,41,8,114,47,0,0,0,114,48,0,0,0,114,49,0,
+    0,0,114,50,0,0,0,114,2,0,0,0,114,70,0,0,
+    0,114,51,0,0,0,114,46,0,0,0,114,31,0,0,0,
+    114,31,0,0,0,114,31,0,0,0,114,32,0,0,0,114,
+    9,0,0,0,243,0,0,0,115,6,0,0,0,8,2,4,
+    2,12,5,99,0,0,0,0,0,0,0,0,0,0,0,0,
+    3,0,0,0,64,0,0,0,115,48,0,0,0,101,0,90,
+    1,100,0,90,2,102,0,90,3,101,4,100,1,100,2,132,
+    0,131,1,90,5,100,3,100,4,132,0,90,6,101,7,100,
+    5,100,6,132,0,131,1,90,8,100,7,83,0,41,8,114,
+    10,0,0,0,99,1,0,0,0,0,0,0,0,1,0,0,
+    0,1,0,0,0,67,0,0,0,115,8,0,0,0,116,0,
+    130,1,100,1,83,0,41,2,122,75,82,101,116,117,114,110,
+    32,116,104,101,32,110,101,120,116,32,105,116,101,109,32,102,
+    114,111,109,32,116,104,101,32,105,116,101,114,97,116,111,114,
+    46,32,87,104,101,110,32,101,120,104,97,117,115,116,101,100,
+    44,32,114,97,105,115,101,32,83,116,111,112,73,116,101,114,
+    97,116,105,111,110,78,41,1,114,53,0,0,0,41,1,114,
+    43,0,0,0,114,31,0,0,0,114,31,0,0,0,114,32,
+    0,0,0,218,8,95,95,110,101,120,116,95,95,7,1,0,
+    0,115,2,0,0,0,0,3,122,17,73,116,101,114,97,116,
+    111,114,46,95,95,110,101,120,116,95,95,99,1,0,0,0,
+    0,0,0,0,1,0,0,0,1,0,0,0,67,0,0,0,
+    115,4,0,0,0,124,0,83,0,41,1,78,114,31,0,0,
+    0,41,1,114,43,0,0,0,114,31,0,0,0,114,31,0,
+    0,0,114,32,0,0,0,114,70,0,0,0,12,1,0,0,
+    115,2,0,0,0,0,1,122,17,73,116,101,114,97,116,111,
+    114,46,95,95,105,116,101,114,95,95,99,2,0,0,0,0,
+    0,0,0,2,0,0,0,4,0,0,0,67,0,0,0,115,
+    24,0,0,0,124,0,116,0,107,8,114,20,116,1,124,1,
+    100,1,100,2,131,3,83,0,116,2,83,0,41,3,78,114,
+    70,0,0,0,114,71,0,0,0,41,3,114,10,0,0,0,
+    114,42,0,0,0,114,38,0,0,0,41,2,114,45,0,0,
+    0,114,39,0,0,0,114,31,0,0,0,114,31,0,0,0,
+    114,32,0,0,0,114,46,0,0,0,15,1,0,0,115,6,
+    0,0,0,0,2,8,1,12,1,122,25,73,116,101,114,97,
+    116,111,114,46,95,95,115,117,98,99,108,97,115,115,104,111,
+    111,107,95,95,78,41,9,114,47,0,0,0,114,48,0,0,
+    0,114,49,0,0,0,114,50,0,0,0,114,2,0,0,0,
+    114,71,0,0,0,114,70,0,0,0,114,51,0,0,0,114,
+    46,0,0,0,114,31,0,0,0,114,31,0,0,0,114,31,
+    0,0,0,114,32,0,0,0,114,10,0,0,0,3,1,0,
+    0,115,8,0,0,0,8,2,4,2,12,5,8,3,99,0,
+    0,0,0,0,0,0,0,0,0,0,0,3,0,0,0,64,
+    0,0,0,115,40,0,0,0,101,0,90,1,100,0,90,2,
+    102,0,90,3,101,4,100,1,100,2,132,0,131,1,90,5,
+    101,6,100,3,100,4,132,0,131,1,90,7,100,5,83,0,
+    41,6,114,12,0,0,0,99,1,0,0,0,0,0,0,0,
+    1,0,0,0,1,0,0,0,99,0,0,0,115,4,0,0,
+    0,100,0,83,0,41,1,78,114,31,0,0,0,41,1,114,
+    43,0,0,0,114,31,0,0,0,114,31,0,0,0,114,32,
+    0,0,0,218,12,95,95,114,101,118,101,114,115,101,100,95,
+    95,41,1,0,0,115,2,0,0,0,0,2,122,23,82,101,
+    118,101,114,115,105,98,108,101,46,95,95,114,101,118,101,114,
+    115,101,100,95,95,99,2,0,0,0,0,0,0,0,2,0,
+    0,0,4,0,0,0,67,0,0,0,115,24,0,0,0,124,
+    0,116,0,107,8,114,20,116,1,124,1,100,1,100,2,131,
+    3,83,0,116,2,83,0,41,3,78,114,72,0,0,0,114,
+    70,0,0,0,41,3,114,12,0,0,0,114,42,0,0,0,
+    114,38,0,0,0,41,2,114,45,0,0,0,114,39,0,0,
+    0,114,31,0,0,0,114,31,0,0,0,114,32,0,0,0,
+    114,46,0,0,0,46,1,0,0,115,6,0,0,0,0,2,
+    8,1,12,1,122,27,82,101,118,101,114,115,105,98,108,101,
+    46,95,95,115,117,98,99,108,97,115,115,104,111,111,107,95,
+    95,78,41,8,114,47,0,0,0,114,48,0,0,0,114,49,
+    0,0,0,114,50,0,0,0,114,2,0,0,0,114,72,0,
+    0,0,114,51,0,0,0,114,46,0,0,0,114,31,0,0,
+    0,114,31,0,0,0,114,31,0,0,0,114,32,0,0,0,
+    114,12,0,0,0,37,1,0,0,115,6,0,0,0,8,2,
+    4,2,12,5,99,0,0,0,0,0,0,0,0,0,0,0,
+    0,4,0,0,0,64,0,0,0,115,70,0,0,0,101,0,
+    90,1,100,0,90,2,102,0,90,3,100,1,100,2,132,0,
+    90,4,101,5,100,3,100,4,132,0,131,1,90,6,101,5,
+    100,12,100,6,100,7,132,1,131,1,90,7,100,8,100,9,
+    132,0,90,8,101,9,100,10,100,11,132,0,131,1,90,10,
+    100,5,83,0,41,13,114,11,0,0,0,99,1,0,0,0,
+    0,0,0,0,1,0,0,0,3,0,0,0,67,0,0,0,
+    115,10,0,0,0,124,0,160,0,100,1,161,1,83,0,41,
+    2,122,94,82,101,116,117,114,110,32,116,104,101,32,110,101,
+    120,116,32,105,116,101,109,32,102,114,111,109,32,116,104,101,
+    32,103,101,110,101,114,97,116,111,114,46,10,32,32,32,32,
+    32,32,32,32,87,104,101,110,32,101,120,104,97,117,115,116,
+    101,100,44,32,114,97,105,115,101,32,83,116,111,112,73,116,
+    101,114,97,116,105,111,110,46,10,32,32,32,32,32,32,32,
+    32,78,41,1,114,55,0,0,0,41,1,114,43,0,0,0,
+    114,31,0,0,0,114,31,0,0,0,114,32,0,0,0,114,
+    71,0,0,0,57,1,0,0,115,2,0,0,0,0,4,122,
+    18,71,101,110,101,114,97,116,111,114,46,95,95,110,101,120,
+    116,95,95,99,2,0,0,0,0,0,0,0,2,0,0,0,
+    1,0,0,0,67,0,0,0,115,8,0,0,0,116,0,130,
+    1,100,1,83,0,41,2,122,99,83,101,110,100,32,97,32,
+    118,97,108,117,101,32,105,110,116,111,32,116,104,101,32,103,
+    101,110,101,114,97,116,111,114,46,10,32,32,32,32,32,32,
+    32,32,82,101,116,117,114,110,32,110,101,120,116,32,121,105,
+    101,108,100,101,100,32,118,97,108,117,101,32,111,114,32,114,
+    97,105,115,101,32,83,116,111,112,73,116,101,114,97,116,105,
+    111,110,46,10,32,32,32,32,32,32,32,32,78,41,1,114,
+    53,0,0,0,41,2,114,43,0,0,0,114,54,0,0,0,
+    114,31,0,0,0,114,31,0,0,0,114,32,0,0,0,114,
+    55,0,0,0,63,1,0,0,115,2,0,0,0,0,5,122,
+    14,71,101,110,101,114,97,116,111,114,46,115,101,110,100,78,
+    99,4,0,0,0,0,0,0,0,4,0,0,0,3,0,0,
+    0,67,0,0,0,115,52,0,0,0,124,2,100,1,107,8,
+    114,26,124,3,100,1,107,8,114,20,124,1,130,1,124,1,
+    131,0,125,2,124,3,100,1,107,9,114,44,124,2,160,0,
+    124,3,161,1,125,2,124,2,130,1,100,1,83,0,41,2,
+    122,103,82,97,105,115,101,32,97,110,32,101,120,99,101,112,
+    116,105,111,110,32,105,110,32,116,104,101,32,103,101,110,101,
+    114,97,116,111,114,46,10,32,32,32,32,32,32,32,32,82,
+    101,116,117,114,110,32,110,101,120,116,32,121,105,101,108,100,
+    101,100,32,118,97,108,117,101,32,111,114,32,114,97,105,115,
+    101,32,83,116,111,112,73,116,101,114,97,116,105,111,110,46,
+    10,32,32,32,32,32,32,32,32,78,41,1,114,56,0,0,
+    0,41,4,114,43,0,0,0,114,57,0,0,0,114,58,0,
+    0,0,114,59,0,0,0,114,31,0,0,0,114,31,0,0,
+    0,114,32,0,0,0,114,60,0,0,0,70,1,0,0,115,
+    14,0,0,0,0,5,8,1,8,1,4,1,6,1,8,1,
+    10,1,122,15,71,101,110,101,114,97,116,111,114,46,116,104,
+    114,111,119,99,1,0,0,0,0,0,0,0,1,0,0,0,
+    12,0,0,0,67,0,0,0,115,52,0,0,0,121,14,124,
+    0,160,0,116,1,161,1,1,0,87,0,110,24,4,0,116,
+    1,116,2,102,2,107,10,114,38,1,0,1,0,1,0,89,
+    0,110,10,88,0,116,3,100,1,131,1,130,1,100,2,83,
+    0,41,3,122,46,82,97,105,115,101,32,71,101,110,101,114,
+    97,116,111,114,69,120,105,116,32,105,110,115,105,100,101,32,
+    103,101,110,101,114,97,116,111,114,46,10,32,32,32,32,32,
+    32,32,32,122,31,103,101,110,101,114,97,116,111,114,32,105,
+    103,110,111,114,101,100,32,71,101,110,101,114,97,116,111,114,
+    69,120,105,116,78,41,4,114,60,0,0,0,114,61,0,0,
+    0,114,53,0,0,0,114,62,0,0,0,41,1,114,43,0,
+    0,0,114,31,0,0,0,114,31,0,0,0,114,32,0,0,
+    0,114,63,0,0,0,83,1,0,0,115,10,0,0,0,0,
+    3,2,1,14,1,18,1,6,2,122,15,71,101,110,101,114,
+    97,116,111,114,46,99,108,111,115,101,99,2,0,0,0,0,
+    0,0,0,2,0,0,0,7,0,0,0,67,0,0,0,115,
+    30,0,0,0,124,0,116,0,107,8,114,26,116,1,124,1,
+    100,1,100,2,100,3,100,4,100,5,131,6,83,0,116,2,
+    83,0,41,6,78,114,70,0,0,0,114,71,0,0,0,114,
+    55,0,0,0,114,60,0,0,0,114,63,0,0,0,41,3,
+    114,11,0,0,0,114,42,0,0,0,114,38,0,0,0,41,
+    2,114,45,0,0,0,114,39,0,0,0,114,31,0,0,0,
+    114,31,0,0,0,114,32,0,0,0,114,46,0,0,0,93,
+    1,0,0,115,8,0,0,0,0,2,8,1,8,1,10,1,
+    122,26,71,101,110,101,114,97,116,111,114,46,95,95,115,117,
+    98,99,108,97,115,115,104,111,111,107,95,95,41,2,78,78,
+    41,11,114,47,0,0,0,114,48,0,0,0,114,49,0,0,
+    0,114,50,0,0,0,114,71,0,0,0,114,2,0,0,0,
+    114,55,0,0,0,114,60,0,0,0,114,63,0,0,0,114,
+    51,0,0,0,114,46,0,0,0,114,31,0,0,0,114,31,
+    0,0,0,114,31,0,0,0,114,32,0,0,0,114,11,0,
+    0,0,53,1,0,0,115,14,0,0,0,8,2,4,2,8,
+    6,12,7,2,1,12,12,8,10,99,0,0,0,0,0,0,
+    0,0,0,0,0,0,3,0,0,0,64,0,0,0,115,40,
+    0,0,0,101,0,90,1,100,0,90,2,102,0,90,3,101,
+    4,100,1,100,2,132,0,131,1,90,5,101,6,100,3,100,
+    4,132,0,131,1,90,7,100,5,83,0,41,6,114,13,0,
+    0,0,99,1,0,0,0,0,0,0,0,1,0,0,0,1,
+    0,0,0,67,0,0,0,115,4,0,0,0,100,1,83,0,
+    41,2,78,114,0,0,0,0,114,31,0,0,0,41,1,114,
+    43,0,0,0,114,31,0,0,0,114,31,0,0,0,114,32,
+    0,0,0,218,7,95,95,108,101,110,95,95,107,1,0,0,
+    115,2,0,0,0,0,2,122,13,83,105,122,101,100,46,95,
+    95,108,101,110,95,95,99,2,0,0,0,0,0,0,0,2,
+    0,0,0,3,0,0,0,67,0,0,0,115,22,0,0,0,
+    124,0,116,0,107,8,114,18,116,1,124,1,100,1,131,2,
+    83,0,116,2,83,0,41,2,78,114,73,0,0,0,41,3,
+    114,13,0,0,0,114,42,0,0,0,114,38,0,0,0,41,
+    2,114,45,0,0,0,114,39,0,0,0,114,31,0,0,0,
+    114,31,0,0,0,114,32,0,0,0,114,46,0,0,0,111,
+    1,0,0,115,6,0,0,0,0,2,8,1,10,1,122,22,
+    83,105,122,101,100,46,95,95,115,117,98,99,108,97,115,115,
+    104,111,111,107,95,95,78,41,8,114,47,0,0,0,114,48,
+    0,0,0,114,49,0,0,0,114,50,0,0,0,114,2,0,
+    0,0,114,73,0,0,0,114,51,0,0,0,114,46,0,0,
+    0,114,31,0,0,0,114,31,0,0,0,114,31,0,0,0,
+    114,32,0,0,0,114,13,0,0,0,103,1,0,0,115,6,
+    0,0,0,8,2,4,2,12,4,99,0,0,0,0,0,0,
+    0,0,0,0,0,0,3,0,0,0,64,0,0,0,115,40,
+    0,0,0,101,0,90,1,100,0,90,2,102,0,90,3,101,
+    4,100,1,100,2,132,0,131,1,90,5,101,6,100,3,100,
+    4,132,0,131,1,90,7,100,5,83,0,41,6,114,14,0,
+    0,0,99,2,0,0,0,0,0,0,0,2,0,0,0,1,
+    0,0,0,67,0,0,0,115,4,0,0,0,100,1,83,0,
+    41,2,78,70,114,31,0,0,0,41,2,114,43,0,0,0,
+    218,1,120,114,31,0,0,0,114,31,0,0,0,114,32,0,
+    0,0,218,12,95,95,99,111,110,116,97,105,110,115,95,95,
+    122,1,0,0,115,2,0,0,0,0,2,122,22,67,111,110,
+    116,97,105,110,101,114,46,95,95,99,111,110,116,97,105,110,
+    115,95,95,99,2,0,0,0,0,0,0,0,2,0,0,0,
+    3,0,0,0,67,0,0,0,115,22,0,0,0,124,0,116,
+    0,107,8,114,18,116,1,124,1,100,1,131,2,83,0,116,
+    2,83,0,41,2,78,114,75,0,0,0,41,3,114,14,0,
+    0,0,114,42,0,0,0,114,38,0,0,0,41,2,114,45,
+    0,0,0,114,39,0,0,0,114,31,0,0,0,114,31,0,
+    0,0,114,32,0,0,0,114,46,0,0,0,126,1,0,0,
+    115,6,0,0,0,0,2,8,1,10,1,122,26,67,111,110,
+    116,97,105,110,101,114,46,95,95,115,117,98,99,108,97,115,
+    115,104,111,111,107,95,95,78,41,8,114,47,0,0,0,114,
+    48,0,0,0,114,49,0,0,0,114,50,0,0,0,114,2,
+    0,0,0,114,75,0,0,0,114,51,0,0,0,114,46,0,
+    0,0,114,31,0,0,0,114,31,0,0,0,114,31,0,0,
+    0,114,32,0,0,0,114,14,0,0,0,118,1,0,0,115,
+    6,0,0,0,8,2,4,2,12,4,99,0,0,0,0,0,
+    0,0,0,0,0,0,0,3,0,0,0,64,0,0,0,115,
+    28,0,0,0,101,0,90,1,100,0,90,2,102,0,90,3,
+    101,4,100,1,100,2,132,0,131,1,90,5,100,3,83,0,
+    41,4,114,16,0,0,0,99,2,0,0,0,0,0,0,0,
+    2,0,0,0,5,0,0,0,67,0,0,0,115,26,0,0,
+    0,124,0,116,0,107,8,114,22,116,1,124,1,100,1,100,
+    2,100,3,131,4,83,0,116,2,83,0,41,4,78,114,73,
+    0,0,0,114,70,0,0,0,114,75,0,0,0,41,3,114,
+    16,0,0,0,114,42,0,0,0,114,38,0,0,0,41,2,
+    114,45,0,0,0,114,39,0,0,0,114,31,0,0,0,114,
+    31,0,0,0,114,32,0,0,0,114,46,0,0,0,136,1,
+    0,0,115,6,0,0,0,0,2,8,1,14,1,122,27,67,
+    111,108,108,101,99,116,105,111,110,46,95,95,115,117,98,99,
+    108,97,115,115,104,111,111,107,95,95,78,41,6,114,47,0,
+    0,0,114,48,0,0,0,114,49,0,0,0,114,50,0,0,
+    0,114,51,0,0,0,114,46,0,0,0,114,31,0,0,0,
+    114,31,0,0,0,114,31,0,0,0,114,32,0,0,0,114,
+    16,0,0,0,132,1,0,0,115,4,0,0,0,8,2,4,
+    2,99,0,0,0,0,0,0,0,0,0,0,0,0,3,0,
+    0,0,64,0,0,0,115,40,0,0,0,101,0,90,1,100,
+    0,90,2,102,0,90,3,101,4,100,1,100,2,132,0,131,
+    1,90,5,101,6,100,3,100,4,132,0,131,1,90,7,100,
+    5,83,0,41,6,114,15,0,0,0,99,1,0,0,0,0,
+    0,0,0,3,0,0,0,1,0,0,0,79,0,0,0,115,
+    4,0,0,0,100,1,83,0,41,2,78,70,114,31,0,0,
+    0,41,3,114,43,0,0,0,218,4,97,114,103,115,218,4,
+    107,119,100,115,114,31,0,0,0,114,31,0,0,0,114,32,
+    0,0,0,218,8,95,95,99,97,108,108,95,95,146,1,0,
+    0,115,2,0,0,0,0,2,122,17,67,97,108,108,97,98,
+    108,101,46,95,95,99,97,108,108,95,95,99,2,0,0,0,
+    0,0,0,0,2,0,0,0,3,0,0,0,67,0,0,0,
+    115,22,0,0,0,124,0,116,0,107,8,114,18,116,1,124,
+    1,100,1,131,2,83,0,116,2,83,0,41,2,78,114,78,
+    0,0,0,41,3,114,15,0,0,0,114,42,0,0,0,114,
+    38,0,0,0,41,2,114,45,0,0,0,114,39,0,0,0,
+    114,31,0,0,0,114,31,0,0,0,114,32,0,0,0,114,
+    46,0,0,0,150,1,0,0,115,6,0,0,0,0,2,8,
+    1,10,1,122,25,67,97,108,108,97,98,108,101,46,95,95,
+    115,117,98,99,108,97,115,115,104,111,111,107,95,95,78,41,
+    8,114,47,0,0,0,114,48,0,0,0,114,49,0,0,0,
+    114,50,0,0,0,114,2,0,0,0,114,78,0,0,0,114,
+    51,0,0,0,114,46,0,0,0,114,31,0,0,0,114,31,
+    0,0,0,114,31,0,0,0,114,32,0,0,0,114,15,0,
+    0,0,142,1,0,0,115,6,0,0,0,8,2,4,2,12,
+    4,99,0,0,0,0,0,0,0,0,0,0,0,0,3,0,
+    0,0,64,0,0,0,115,140,0,0,0,101,0,90,1,100,
+    0,90,2,100,1,90,3,102,0,90,4,100,2,100,3,132,
+    0,90,5,100,4,100,5,132,0,90,6,100,6,100,7,132,
+    0,90,7,100,8,100,9,132,0,90,8,100,10,100,11,132,
+    0,90,9,101,10,100,12,100,13,132,0,131,1,90,11,100,
+    14,100,15,132,0,90,12,101,12,90,13,100,16,100,17,132,
+    0,90,14,100,18,100,19,132,0,90,15,101,15,90,16,100,
+    20,100,21,132,0,90,17,100,22,100,23,132,0,90,18,100,
+    24,100,25,132,0,90,19,101,19,90,20,100,26,100,27,132,
+    0,90,21,100,28,83,0,41,29,114,17,0,0,0,97,90,
+    1,0,0,65,32,115,101,116,32,105,115,32,97,32,102,105,
+    110,105,116,101,44,32,105,116,101,114,97,98,108,101,32,99,
+    111,110,116,97,105,110,101,114,46,10,10,32,32,32,32,84,
+    104,105,115,32,99,108,97,115,115,32,112,114,111,118,105,100,
+    101,115,32,99,111,110,99,114,101,116,101,32,103,101,110,101,
+    114,105,99,32,105,109,112,108,101,109,101,110,116,97,116,105,
+    111,110,115,32,111,102,32,97,108,108,10,32,32,32,32,109,
+    101,116,104,111,100,115,32,101,120,99,101,112,116,32,102,111,
+    114,32,95,95,99,111,110,116,97,105,110,115,95,95,44,32,
+    95,95,105,116,101,114,95,95,32,97,110,100,32,95,95,108,
+    101,110,95,95,46,10,10,32,32,32,32,84,111,32,111,118,
+    101,114,114,105,100,101,32,116,104,101,32,99,111,109,112,97,
+    114,105,115,111,110,115,32,40,112,114,101,115,117,109,97,98,
+    108,121,32,102,111,114,32,115,112,101,101,100,44,32,97,115,
+    32,116,104,101,10,32,32,32,32,115,101,109,97,110,116,105,
+    99,115,32,97,114,101,32,102,105,120,101,100,41,44,32,114,
+    101,100,101,102,105,110,101,32,95,95,108,101,95,95,32,97,
+    110,100,32,95,95,103,101,95,95,44,10,32,32,32,32,116,
+    104,101,110,32,116,104,101,32,111,116,104,101,114,32,111,112,
+    101,114,97,116,105,111,110,115,32,119,105,108,108,32,97,117,
+    116,111,109,97,116,105,99,97,108,108,121,32,102,111,108,108,
+    111,119,32,115,117,105,116,46,10,32,32,32,32,99,2,0,
+    0,0,0,0,0,0,3,0,0,0,3,0,0,0,67,0,
+    0,0,115,64,0,0,0,116,0,124,1,116,1,131,2,115,
+    14,116,2,83,0,116,3,124,0,131,1,116,3,124,1,131,
+    1,107,4,114,34,100,1,83,0,120,24,124,0,68,0,93,
+    16,125,2,124,2,124,1,107,7,114,40,100,1,83,0,113,
+    40,87,0,100,2,83,0,41,3,78,70,84,41,4,218,10,
+    105,115,105,110,115,116,97,110,99,101,114,17,0,0,0,114,
+    38,0,0,0,218,3,108,101,110,41,3,114,43,0,0,0,
+    218,5,111,116,104,101,114,218,4,101,108,101,109,114,31,0,
+    0,0,114,31,0,0,0,114,32,0,0,0,218,6,95,95,
+    108,101,95,95,174,1,0,0,115,16,0,0,0,0,1,10,
+    1,4,1,16,1,4,1,10,1,8,1,8,1,122,10,83,
+    101,116,46,95,95,108,101,95,95,99,2,0,0,0,0,0,
+    0,0,2,0,0,0,3,0,0,0,67,0,0,0,115,40,
+    0,0,0,116,0,124,1,116,1,131,2,115,14,116,2,83,
+    0,116,3,124,0,131,1,116,3,124,1,131,1,107,0,111,
+    38,124,0,160,4,124,1,161,1,83,0,41,1,78,41,5,
+    114,79,0,0,0,114,17,0,0,0,114,38,0,0,0,114,
+    80,0,0,0,114,83,0,0,0,41,2,114,43,0,0,0,
+    114,81,0,0,0,114,31,0,0,0,114,31,0,0,0,114,
+    32,0,0,0,218,6,95,95,108,116,95,95,184,1,0,0,
+    115,6,0,0,0,0,1,10,1,4,1,122,10,83,101,116,
+    46,95,95,108,116,95,95,99,2,0,0,0,0,0,0,0,
+    2,0,0,0,3,0,0,0,67,0,0,0,115,40,0,0,
+    0,116,0,124,1,116,1,131,2,115,14,116,2,83,0,116,
+    3,124,0,131,1,116,3,124,1,131,1,107,4,111,38,124,
+    0,160,4,124,1,161,1,83,0,41,1,78,41,5,114,79,
+    0,0,0,114,17,0,0,0,114,38,0,0,0,114,80,0,
+    0,0,218,6,95,95,103,101,95,95,41,2,114,43,0,0,
+    0,114,81,0,0,0,114,31,0,0,0,114,31,0,0,0,
+    114,32,0,0,0,218,6,95,95,103,116,95,95,189,1,0,
+    0,115,6,0,0,0,0,1,10,1,4,1,122,10,83,101,
+    116,46,95,95,103,116,95,95,99,2,0,0,0,0,0,0,
+    0,3,0,0,0,3,0,0,0,67,0,0,0,115,64,0,
+    0,0,116,0,124,1,116,1,131,2,115,14,116,2,83,0,
+    116,3,124,0,131,1,116,3,124,1,131,1,107,0,114,34,
+    100,1,83,0,120,24,124,1,68,0,93,16,125,2,124,2,
+    124,0,107,7,114,40,100,1,83,0,113,40,87,0,100,2,
+    83,0,41,3,78,70,84,41,4,114,79,0,0,0,114,17,
+    0,0,0,114,38,0,0,0,114,80,0,0,0,41,3,114,
+    43,0,0,0,114,81,0,0,0,114,82,0,0,0,114,31,
+    0,0,0,114,31,0,0,0,114,32,0,0,0,114,85,0,
+    0,0,194,1,0,0,115,16,0,0,0,0,1,10,1,4,
+    1,16,1,4,1,10,1,8,1,8,1,122,10,83,101,116,
+    46,95,95,103,101,95,95,99,2,0,0,0,0,0,0,0,
+    2,0,0,0,3,0,0,0,67,0,0,0,115,40,0,0,
+    0,116,0,124,1,116,1,131,2,115,14,116,2,83,0,116,
+    3,124,0,131,1,116,3,124,1,131,1,107,2,111,38,124,
+    0,160,4,124,1,161,1,83,0,41,1,78,41,5,114,79,
+    0,0,0,114,17,0,0,0,114,38,0,0,0,114,80,0,
+    0,0,114,83,0,0,0,41,2,114,43,0,0,0,114,81,
+    0,0,0,114,31,0,0,0,114,31,0,0,0,114,32,0,
+    0,0,218,6,95,95,101,113,95,95,204,1,0,0,115,6,
+    0,0,0,0,1,10,1,4,1,122,10,83,101,116,46,95,
+    95,101,113,95,95,99,2,0,0,0,0,0,0,0,2,0,
+    0,0,2,0,0,0,67,0,0,0,115,8,0,0,0,124,
+    0,124,1,131,1,83,0,41,1,122,188,67,111,110,115,116,
+    114,117,99,116,32,97,110,32,105,110,115,116,97,110,99,101,
+    32,111,102,32,116,104,101,32,99,108,97,115,115,32,102,114,
+    111,109,32,97,110,121,32,105,116,101,114,97,98,108,101,32,
+    105,110,112,117,116,46,10,10,32,32,32,32,32,32,32,32,
+    77,117,115,116,32,111,118,101,114,114,105,100,101,32,116,104,
+    105,115,32,109,101,116,104,111,100,32,105,102,32,116,104,101,
+    32,99,108,97,115,115,32,99,111,110,115,116,114,117,99,116,
+    111,114,32,115,105,103,110,97,116,117,114,101,10,32,32,32,
+    32,32,32,32,32,100,111,101,115,32,110,111,116,32,97,99,
+    99,101,112,116,32,97,110,32,105,116,101,114,97,98,108,101,
+    32,102,111,114,32,97,110,32,105,110,112,117,116,46,10,32,
+    32,32,32,32,32,32,32,114,31,0,0,0,41,2,114,45,
+    0,0,0,218,2,105,116,114,31,0,0,0,114,31,0,0,
+    0,114,32,0,0,0,218,14,95,102,114,111,109,95,105,116,
+    101,114,97,98,108,101,209,1,0,0,115,2,0,0,0,0,
+    7,122,18,83,101,116,46,95,102,114,111,109,95,105,116,101,
+    114,97,98,108,101,99,2,0,0,0,0,0,0,0,2,0,
+    0,0,5,0,0,0,3,0,0,0,115,38,0,0,0,116,
+    0,124,1,116,1,131,2,115,14,116,2,83,0,136,0,160,
+    3,135,0,102,1,100,1,100,2,132,8,124,1,68,0,131,
+    1,161,1,83,0,41,3,78,99,1,0,0,0,0,0,0,
+    0,2,0,0,0,3,0,0,0,51,0,0,0,115,26,0,
+    0,0,124,0,93,18,125,1,124,1,136,0,107,6,114,2,
+    124,1,86,0,1,0,113,2,100,0,83,0,41,1,78,114,
+    31,0,0,0,41,2,218,2,46,48,114,54,0,0,0,41,
+    1,114,43,0,0,0,114,31,0,0,0,114,32,0,0,0,
+    250,9,60,103,101,110,101,120,112,114,62,221,1,0,0,115,
+    2,0,0,0,4,0,122,30,83,101,116,46,95,95,97,110,
+    100,95,95,46,60,108,111,99,97,108,115,62,46,60,103,101,
+    110,101,120,112,114,62,41,4,114,79,0,0,0,114,9,0,
+    0,0,114,38,0,0,0,114,89,0,0,0,41,2,114,43,
+    0,0,0,114,81,0,0,0,114,31,0,0,0,41,1,114,
+    43,0,0,0,114,32,0,0,0,218,7,95,95,97,110,100,
+    95,95,218,1,0,0,115,6,0,0,0,0,1,10,1,4,
+    1,122,11,83,101,116,46,95,95,97,110,100,95,95,99,2,
+    0,0,0,0,0,0,0,3,0,0,0,3,0,0,0,67,
+    0,0,0,115,30,0,0,0,120,24,124,1,68,0,93,16,
+    125,2,124,2,124,0,107,6,114,6,100,1,83,0,113,6,
+    87,0,100,2,83,0,41,3,122,49,82,101,116,117,114,110,
+    32,84,114,117,101,32,105,102,32,116,119,111,32,115,101,116,
+    115,32,104,97,118,101,32,97,32,110,117,108,108,32,105,110,
+    116,101,114,115,101,99,116,105,111,110,46,70,84,114,31,0,
+    0,0,41,3,114,43,0,0,0,114,81,0,0,0,114,54,
+    0,0,0,114,31,0,0,0,114,31,0,0,0,114,32,0,
+    0,0,218,10,105,115,100,105,115,106,111,105,110,116,225,1,
+    0,0,115,8,0,0,0,0,2,10,1,8,1,8,1,122,
+    14,83,101,116,46,105,115,100,105,115,106,111,105,110,116,99,
+    2,0,0,0,0,0,0,0,3,0,0,0,3,0,0,0,
+    67,0,0,0,115,42,0,0,0,116,0,124,1,116,1,131,
+    2,115,14,116,2,83,0,100,1,100,2,132,0,124,0,124,
+    1,102,2,68,0,131,1,125,2,124,0,160,3,124,2,161,
+    1,83,0,41,3,78,99,1,0,0,0,0,0,0,0,3,
+    0,0,0,3,0,0,0,115,0,0,0,115,28,0,0,0,
+    124,0,93,20,125,1,124,1,68,0,93,10,125,2,124,2,
+    86,0,1,0,113,10,113,2,100,0,83,0,41,1,78,114,
+    31,0,0,0,41,3,114,90,0,0,0,218,1,115,218,1,
+    101,114,31,0,0,0,114,31,0,0,0,114,32,0,0,0,
+    114,91,0,0,0,235,1,0,0,115,2,0,0,0,4,0,
+    122,29,83,101,116,46,95,95,111,114,95,95,46,60,108,111,
+    99,97,108,115,62,46,60,103,101,110,101,120,112,114,62,41,
+    4,114,79,0,0,0,114,9,0,0,0,114,38,0,0,0,
+    114,89,0,0,0,41,3,114,43,0,0,0,114,81,0,0,
+    0,90,5,99,104,97,105,110,114,31,0,0,0,114,31,0,
+    0,0,114,32,0,0,0,218,6,95,95,111,114,95,95,232,
+    1,0,0,115,8,0,0,0,0,1,10,1,4,1,18,1,
+    122,10,83,101,116,46,95,95,111,114,95,95,99,2,0,0,
+    0,0,0,0,0,2,0,0,0,5,0,0,0,3,0,0,
+    0,115,58,0,0,0,116,0,136,0,116,1,131,2,115,34,
+    116,0,136,0,116,2,131,2,115,24,116,3,83,0,124,0,
+    160,4,136,0,161,1,137,0,124,0,160,4,135,0,102,1,
+    100,1,100,2,132,8,124,0,68,0,131,1,161,1,83,0,
+    41,3,78,99,1,0,0,0,0,0,0,0,2,0,0,0,
+    3,0,0,0,51,0,0,0,115,26,0,0,0,124,0,93,
+    18,125,1,124,1,136,0,107,7,114,2,124,1,86,0,1,
+    0,113,2,100,0,83,0,41,1,78,114,31,0,0,0,41,
+    2,114,90,0,0,0,114,54,0,0,0,41,1,114,81,0,
+    0,0,114,31,0,0,0,114,32,0,0,0,114,91,0,0,
+    0,245,1,0,0,115,4,0,0,0,4,0,2,1,122,30,
+    83,101,116,46,95,95,115,117,98,95,95,46,60,108,111,99,
+    97,108,115,62,46,60,103,101,110,101,120,112,114,62,41,5,
+    114,79,0,0,0,114,17,0,0,0,114,9,0,0,0,114,
+    38,0,0,0,114,89,0,0,0,41,2,114,43,0,0,0,
+    114,81,0,0,0,114,31,0,0,0,41,1,114,81,0,0,
+    0,114,32,0,0,0,218,7,95,95,115,117,98,95,95,240,
+    1,0,0,115,10,0,0,0,0,1,10,1,10,1,4,1,
+    10,1,122,11,83,101,116,46,95,95,115,117,98,95,95,99,
+    2,0,0,0,0,0,0,0,2,0,0,0,5,0,0,0,
+    3,0,0,0,115,58,0,0,0,116,0,124,1,116,1,131,
+    2,115,34,116,0,124,1,116,2,131,2,115,24,116,3,83,
+    0,136,0,160,4,124,1,161,1,125,1,136,0,160,4,135,
+    0,102,1,100,1,100,2,132,8,124,1,68,0,131,1,161,
+    1,83,0,41,3,78,99,1,0,0,0,0,0,0,0,2,
+    0,0,0,3,0,0,0,51,0,0,0,115,26,0,0,0,
+    124,0,93,18,125,1,124,1,136,0,107,7,114,2,124,1,
+    86,0,1,0,113,2,100,0,83,0,41,1,78,114,31,0,
+    0,0,41,2,114,90,0,0,0,114,54,0,0,0,41,1,
+    114,43,0,0,0,114,31,0,0,0,114,32,0,0,0,114,
+    91,0,0,0,253,1,0,0,115,4,0,0,0,4,0,2,
+    1,122,31,83,101,116,46,95,95,114,115,117,98,95,95,46,
+    60,108,111,99,97,108,115,62,46,60,103,101,110,101,120,112,
+    114,62,41,5,114,79,0,0,0,114,17,0,0,0,114,9,
+    0,0,0,114,38,0,0,0,114,89,0,0,0,41,2,114,
+    43,0,0,0,114,81,0,0,0,114,31,0,0,0,41,1,
+    114,43,0,0,0,114,32,0,0,0,218,8,95,95,114,115,
+    117,98,95,95,248,1,0,0,115,10,0,0,0,0,1,10,
+    1,10,1,4,1,10,1,122,12,83,101,116,46,95,95,114,
+    115,117,98,95,95,99,2,0,0,0,0,0,0,0,2,0,
+    0,0,3,0,0,0,67,0,0,0,115,50,0,0,0,116,
+    0,124,1,116,1,131,2,115,34,116,0,124,1,116,2,131,
+    2,115,24,116,3,83,0,124,0,160,4,124,1,161,1,125,
+    1,124,0,124,1,24,0,124,1,124,0,24,0,66,0,83,
+    0,41,1,78,41,5,114,79,0,0,0,114,17,0,0,0,
+    114,9,0,0,0,114,38,0,0,0,114,89,0,0,0,41,
+    2,114,43,0,0,0,114,81,0,0,0,114,31,0,0,0,
+    114,31,0,0,0,114,32,0,0,0,218,7,95,95,120,111,
+    114,95,95,0,2,0,0,115,10,0,0,0,0,1,10,1,
+    10,1,4,1,10,1,122,11,83,101,116,46,95,95,120,111,
+    114,95,95,99,1,0,0,0,0,0,0,0,7,0,0,0,
+    5,0,0,0,67,0,0,0,115,156,0,0,0,116,0,106,
+    1,125,1,100,1,124,1,20,0,100,2,23,0,125,2,116,
+    2,124,0,131,1,125,3,100,3,124,3,100,2,23,0,20,
+    0,125,4,124,4,124,2,77,0,125,4,120,52,124,0,68,
+    0,93,44,125,5,116,3,124,5,131,1,125,6,124,4,124,
+    6,124,6,100,4,62,0,65,0,100,5,65,0,100,6,20,
+    0,78,0,125,4,124,4,124,2,77,0,125,4,113,52,87,
+    0,124,4,100,7,20,0,100,8,23,0,125,4,124,4,124,
+    2,77,0,125,4,124,4,124,1,107,4,114,140,124,4,124,
+    2,100,2,23,0,56,0,125,4,124,4,100,10,107,2,114,
+    152,100,9,125,4,124,4,83,0,41,11,97,43,2,0,0,
+    67,111,109,112,117,116,101,32,116,104,101,32,104,97,115,104,
+    32,118,97,108,117,101,32,111,102,32,97,32,115,101,116,46,
+    10,10,32,32,32,32,32,32,32,32,78,111,116,101,32,116,
+    104,97,116,32,119,101,32,100,111,110,39,116,32,100,101,102,
+    105,110,101,32,95,95,104,97,115,104,95,95,58,32,110,111,
+    116,32,97,108,108,32,115,101,116,115,32,97,114,101,32,104,
+    97,115,104,97,98,108,101,46,10,32,32,32,32,32,32,32,
+    32,66,117,116,32,105,102,32,121,111,117,32,100,101,102,105,
+    110,101,32,97,32,104,97,115,104,97,98,108,101,32,115,101,
+    116,32,116,121,112,101,44,32,105,116,115,32,95,95,104,97,
+    115,104,95,95,32,115,104,111,117,108,100,10,32,32,32,32,
+    32,32,32,32,99,97,108,108,32,116,104,105,115,32,102,117,
+    110,99,116,105,111,110,46,10,10,32,32,32,32,32,32,32,
+    32,84,104,105,115,32,109,117,115,116,32,98,101,32,99,111,
+    109,112,97,116,105,98,108,101,32,95,95,101,113,95,95,46,
+    10,10,32,32,32,32,32,32,32,32,65,108,108,32,115,101,
+    116,115,32,111,117,103,104,116,32,116,111,32,99,111,109,112,
+    97,114,101,32,101,113,117,97,108,32,105,102,32,116,104,101,
+    121,32,99,111,110,116,97,105,110,32,116,104,101,32,115,97,
+    109,101,10,32,32,32,32,32,32,32,32,101,108,101,109,101,
+    110,116,115,44,32,114,101,103,97,114,100,108,101,115,115,32,
+    111,102,32,104,111,119,32,116,104,101,121,32,97,114,101,32,
+    105,109,112,108,101,109,101,110,116,101,100,44,32,97,110,100,
+    10,32,32,32,32,32,32,32,32,114,101,103,97,114,100,108,
+    101,115,115,32,111,102,32,116,104,101,32,111,114,100,101,114,
+    32,111,102,32,116,104,101,32,101,108,101,109,101,110,116,115,
+    59,32,115,111,32,116,104,101,114,101,39,115,32,110,111,116,
+    32,109,117,99,104,10,32,32,32,32,32,32,32,32,102,114,
+    101,101,100,111,109,32,102,111,114,32,95,95,101,113,95,95,
+    32,111,114,32,95,95,104,97,115,104,95,95,46,32,32,87,
+    101,32,109,97,116,99,104,32,116,104,101,32,97,108,103,111,
+    114,105,116,104,109,32,117,115,101,100,10,32,32,32,32,32,
+    32,32,32,98,121,32,116,104,101,32,98,117,105,108,116,45,
+    105,110,32,102,114,111,122,101,110,115,101,116,32,116,121,112,
+    101,46,10,32,32,32,32,32,32,32,32,233,2,0,0,0,
+    114,29,0,0,0,105,77,239,232,114,233,16,0,0,0,105,
+    179,77,91,5,108,3,0,0,0,215,52,126,50,3,0,105,
+    205,13,1,0,105,227,195,17,54,105,193,199,56,35,233,255,
+    255,255,255,41,4,218,3,115,121,115,218,7,109,97,120,115,
+    105,122,101,114,80,0,0,0,218,4,104,97,115,104,41,7,
+    114,43,0,0,0,90,3,77,65,88,90,4,77,65,83,75,
+    218,1,110,218,1,104,114,74,0,0,0,90,2,104,120,114,
+    31,0,0,0,114,31,0,0,0,114,32,0,0,0,218,5,
+    95,104,97,115,104,9,2,0,0,115,32,0,0,0,0,15,
+    6,1,12,1,8,1,12,1,8,1,10,1,8,1,24,1,
+    12,1,12,1,8,1,8,1,12,1,8,1,4,1,122,9,
+    83,101,116,46,95,104,97,115,104,78,41,22,114,47,0,0,
+    0,114,48,0,0,0,114,49,0,0,0,218,7,95,95,100,
+    111,99,95,95,114,50,0,0,0,114,83,0,0,0,114,84,
+    0,0,0,114,86,0,0,0,114,85,0,0,0,114,87,0,
+    0,0,114,51,0,0,0,114,89,0,0,0,114,92,0,0,
+    0,218,8,95,95,114,97,110,100,95,95,114,93,0,0,0,
+    114,96,0,0,0,218,7,95,95,114,111,114,95,95,114,97,
+    0,0,0,114,98,0,0,0,114,99,0,0,0,218,8,95,
+    95,114,120,111,114,95,95,114,108,0,0,0,114,31,0,0,
+    0,114,31,0,0,0,114,31,0,0,0,114,32,0,0,0,
+    114,17,0,0,0,160,1,0,0,115,36,0,0,0,8,10,
+    4,2,4,2,8,10,8,5,8,5,8,10,8,5,12,9,
+    8,5,4,2,8,7,8,6,4,2,8,8,8,8,8,7,
+    4,2,99,0,0,0,0,0,0,0,0,0,0,0,0,3,
+    0,0,0,64,0,0,0,115,100,0,0,0,101,0,90,1,
+    100,0,90,2,100,1,90,3,102,0,90,4,101,5,100,2,
+    100,3,132,0,131,1,90,6,101,5,100,4,100,5,132,0,
+    131,1,90,7,100,6,100,7,132,0,90,8,100,8,100,9,
+    132,0,90,9,100,10,100,11,132,0,90,10,100,12,100,13,
+    132,0,90,11,100,14,100,15,132,0,90,12,100,16,100,17,
+    132,0,90,13,100,18,100,19,132,0,90,14,100,20,83,0,
+    41,21,114,18,0,0,0,97,135,1,0,0,65,32,109,117,
+    116,97,98,108,101,32,115,101,116,32,105,115,32,97,32,102,
+    105,110,105,116,101,44,32,105,116,101,114,97,98,108,101,32,
+    99,111,110,116,97,105,110,101,114,46,10,10,32,32,32,32,
+    84,104,105,115,32,99,108,97,115,115,32,112,114,111,118,105,
+    100,101,115,32,99,111,110,99,114,101,116,101,32,103,101,110,
+    101,114,105,99,32,105,109,112,108,101,109,101,110,116,97,116,
+    105,111,110,115,32,111,102,32,97,108,108,10,32,32,32,32,
+    109,101,116,104,111,100,115,32,101,120,99,101,112,116,32,102,
+    111,114,32,95,95,99,111,110,116,97,105,110,115,95,95,44,
+    32,95,95,105,116,101,114,95,95,44,32,95,95,108,101,110,
+    95,95,44,10,32,32,32,32,97,100,100,40,41,44,32,97,
+    110,100,32,100,105,115,99,97,114,100,40,41,46,10,10,32,
+    32,32,32,84,111,32,111,118,101,114,114,105,100,101,32,116,
+    104,101,32,99,111,109,112,97,114,105,115,111,110,115,32,40,
+    112,114,101,115,117,109,97,98,108,121,32,102,111,114,32,115,
+    112,101,101,100,44,32,97,115,32,116,104,101,10,32,32,32,
+    32,115,101,109,97,110,116,105,99,115,32,97,114,101,32,102,
+    105,120,101,100,41,44,32,97,108,108,32,121,111,117,32,104,
+    97,118,101,32,116,111,32,100,111,32,105,115,32,114,101,100,
+    101,102,105,110,101,32,95,95,108,101,95,95,32,97,110,100,
+    10,32,32,32,32,116,104,101,110,32,116,104,101,32,111,116,
+    104,101,114,32,111,112,101,114,97,116,105,111,110,115,32,119,
+    105,108,108,32,97,117,116,111,109,97,116,105,99,97,108,108,
+    121,32,102,111,108,108,111,119,32,115,117,105,116,46,10,32,
+    32,32,32,99,2,0,0,0,0,0,0,0,2,0,0,0,
+    1,0,0,0,67,0,0,0,115,8,0,0,0,116,0,130,
+    1,100,1,83,0,41,2,122,15,65,100,100,32,97,110,32,
+    101,108,101,109,101,110,116,46,78,41,1,218,19,78,111,116,
+    73,109,112,108,101,109,101,110,116,101,100,69,114,114,111,114,
+    41,2,114,43,0,0,0,114,54,0,0,0,114,31,0,0,
+    0,114,31,0,0,0,114,32,0,0,0,218,3,97,100,100,
+    58,2,0,0,115,2,0,0,0,0,3,122,14,77,117,116,
+    97,98,108,101,83,101,116,46,97,100,100,99,2,0,0,0,
+    0,0,0,0,2,0,0,0,1,0,0,0,67,0,0,0,
+    115,8,0,0,0,116,0,130,1,100,1,83,0,41,2,122,
+    56,82,101,109,111,118,101,32,97,110,32,101,108,101,109,101,
+    110,116,46,32,32,68,111,32,110,111,116,32,114,97,105,115,
+    101,32,97,110,32,101,120,99,101,112,116,105,111,110,32,105,
+    102,32,97,98,115,101,110,116,46,78,41,1,114,113,0,0,
+    0,41,2,114,43,0,0,0,114,54,0,0,0,114,31,0,
+    0,0,114,31,0,0,0,114,32,0,0,0,218,7,100,105,
+    115,99,97,114,100,63,2,0,0,115,2,0,0,0,0,3,
+    122,18,77,117,116,97,98,108,101,83,101,116,46,100,105,115,
+    99,97,114,100,99,2,0,0,0,0,0,0,0,2,0,0,
+    0,3,0,0,0,67,0,0,0,115,30,0,0,0,124,1,
+    124,0,107,7,114,16,116,0,124,1,131,1,130,1,124,0,
+    160,1,124,1,161,1,1,0,100,1,83,0,41,2,122,53,
+    82,101,109,111,118,101,32,97,110,32,101,108,101,109,101,110,
+    116,46,32,73,102,32,110,111,116,32,97,32,109,101,109,98,
+    101,114,44,32,114,97,105,115,101,32,97,32,75,101,121,69,
+    114,114,111,114,46,78,41,2,218,8,75,101,121,69,114,114,
+    111,114,114,115,0,0,0,41,2,114,43,0,0,0,114,54,
+    0,0,0,114,31,0,0,0,114,31,0,0,0,114,32,0,
+    0,0,218,6,114,101,109,111,118,101,68,2,0,0,115,6,
+    0,0,0,0,2,8,1,8,1,122,17,77,117,116,97,98,
+    108,101,83,101,116,46,114,101,109,111,118,101,99,1,0,0,
+    0,0,0,0,0,3,0,0,0,11,0,0,0,67,0,0,
+    0,115,60,0,0,0,116,0,124,0,131,1,125,1,121,12,
+    116,1,124,1,131,1,125,2,87,0,110,24,4,0,116,2,
+    107,10,114,44,1,0,1,0,1,0,116,3,130,1,89,0,
+    110,2,88,0,124,0,160,4,124,2,161,1,1,0,124,2,
+    83,0,41,1,122,50,82,101,116,117,114,110,32,116,104,101,
+    32,112,111,112,112,101,100,32,118,97,108,117,101,46,32,32,
+    82,97,105,115,101,32,75,101,121,69,114,114,111,114,32,105,
+    102,32,101,109,112,116,121,46,41,5,218,4,105,116,101,114,
+    218,4,110,101,120,116,114,53,0,0,0,114,116,0,0,0,
+    114,115,0,0,0,41,3,114,43,0,0,0,114,88,0,0,
+    0,114,54,0,0,0,114,31,0,0,0,114,31,0,0,0,
+    114,32,0,0,0,218,3,112,111,112,74,2,0,0,115,14,
+    0,0,0,0,2,8,1,2,1,12,1,14,1,10,1,10,
+    1,122,14,77,117,116,97,98,108,101,83,101,116,46,112,111,
+    112,99,1,0,0,0,0,0,0,0,1,0,0,0,11,0,
+    0,0,67,0,0,0,115,44,0,0,0,121,18,120,12,124,
+    0,160,0,161,0,1,0,113,4,87,0,87,0,110,20,4,
+    0,116,1,107,10,114,38,1,0,1,0,1,0,89,0,110,
+    2,88,0,100,1,83,0,41,2,122,54,84,104,105,115,32,
+    105,115,32,115,108,111,119,32,40,99,114,101,97,116,101,115,
+    32,78,32,110,101,119,32,105,116,101,114,97,116,111,114,115,
+    33,41,32,98,117,116,32,101,102,102,101,99,116,105,118,101,
+    46,78,41,2,114,120,0,0,0,114,116,0,0,0,41,1,
+    114,43,0,0,0,114,31,0,0,0,114,31,0,0,0,114,
+    32,0,0,0,218,5,99,108,101,97,114,84,2,0,0,115,
+    10,0,0,0,0,2,2,1,2,1,16,1,14,1,122,16,
+    77,117,116,97,98,108,101,83,101,116,46,99,108,101,97,114,
+    99,2,0,0,0,0,0,0,0,3,0,0,0,4,0,0,
+    0,67,0,0,0,115,28,0,0,0,120,22,124,1,68,0,
+    93,14,125,2,124,0,160,0,124,2,161,1,1,0,113,6,
+    87,0,124,0,83,0,41,1,78,41,1,114,114,0,0,0,
+    41,3,114,43,0,0,0,114,88,0,0,0,114,54,0,0,
+    0,114,31,0,0,0,114,31,0,0,0,114,32,0,0,0,
+    218,7,95,95,105,111,114,95,95,92,2,0,0,115,6,0,
+    0,0,0,1,10,1,14,1,122,18,77,117,116,97,98,108,
+    101,83,101,116,46,95,95,105,111,114,95,95,99,2,0,0,
+    0,0,0,0,0,3,0,0,0,4,0,0,0,67,0,0,
+    0,115,32,0,0,0,120,26,124,0,124,1,24,0,68,0,
+    93,14,125,2,124,0,160,0,124,2,161,1,1,0,113,10,
+    87,0,124,0,83,0,41,1,78,41,1,114,115,0,0,0,
+    41,3,114,43,0,0,0,114,88,0,0,0,114,54,0,0,
+    0,114,31,0,0,0,114,31,0,0,0,114,32,0,0,0,
+    218,8,95,95,105,97,110,100,95,95,97,2,0,0,115,6,
+    0,0,0,0,1,14,1,14,1,122,19,77,117,116,97,98,
+    108,101,83,101,116,46,95,95,105,97,110,100,95,95,99,2,
+    0,0,0,0,0,0,0,3,0,0,0,4,0,0,0,67,
+    0,0,0,115,86,0,0,0,124,1,124,0,107,8,114,18,
+    124,0,160,0,161,0,1,0,110,64,116,1,124,1,116,2,
+    131,2,115,38,124,0,160,3,124,1,161,1,125,1,120,42,
+    124,1,68,0,93,34,125,2,124,2,124,0,107,6,114,68,
+    124,0,160,4,124,2,161,1,1,0,113,44,124,0,160,5,
+    124,2,161,1,1,0,113,44,87,0,124,0,83,0,41,1,
+    78,41,6,114,121,0,0,0,114,79,0,0,0,114,17,0,
+    0,0,114,89,0,0,0,114,115,0,0,0,114,114,0,0,
+    0,41,3,114,43,0,0,0,114,88,0,0,0,114,54,0,
+    0,0,114,31,0,0,0,114,31,0,0,0,114,32,0,0,
+    0,218,8,95,95,105,120,111,114,95,95,102,2,0,0,115,
+    18,0,0,0,0,1,8,1,10,2,10,1,10,1,10,1,
+    8,1,12,2,14,1,122,19,77,117,116,97,98,108,101,83,
+    101,116,46,95,95,105,120,111,114,95,95,99,2,0,0,0,
+    0,0,0,0,3,0,0,0,4,0,0,0,67,0,0,0,
+    115,46,0,0,0,124,1,124,0,107,8,114,18,124,0,160,
+    0,161,0,1,0,110,24,120,22,124,1,68,0,93,14,125,
+    2,124,0,160,1,124,2,161,1,1,0,113,24,87,0,124,
+    0,83,0,41,1,78,41,2,114,121,0,0,0,114,115,0,
+    0,0,41,3,114,43,0,0,0,114,88,0,0,0,114,54,
+    0,0,0,114,31,0,0,0,114,31,0,0,0,114,32,0,
+    0,0,218,8,95,95,105,115,117,98,95,95,115,2,0,0,
+    115,10,0,0,0,0,1,8,1,10,2,10,1,14,1,122,
+    19,77,117,116,97,98,108,101,83,101,116,46,95,95,105,115,
+    117,98,95,95,78,41,15,114,47,0,0,0,114,48,0,0,
+    0,114,49,0,0,0,114,109,0,0,0,114,50,0,0,0,
+    114,2,0,0,0,114,114,0,0,0,114,115,0,0,0,114,
+    117,0,0,0,114,120,0,0,0,114,121,0,0,0,114,122,
+    0,0,0,114,123,0,0,0,114,124,0,0,0,114,125,0,
+    0,0,114,31,0,0,0,114,31,0,0,0,114,31,0,0,
+    0,114,32,0,0,0,114,18,0,0,0,44,2,0,0,115,
+    22,0,0,0,8,10,4,2,4,2,12,5,12,5,8,6,
+    8,10,8,8,8,5,8,5,8,13,99,0,0,0,0,0,
+    0,0,0,0,0,0,0,3,0,0,0,64,0,0,0,115,
+    82,0,0,0,101,0,90,1,100,0,90,2,102,0,90,3,
+    101,4,100,1,100,2,132,0,131,1,90,5,100,16,100,4,
+    100,5,132,1,90,6,100,6,100,7,132,0,90,7,100,8,
+    100,9,132,0,90,8,100,10,100,11,132,0,90,9,100,12,
+    100,13,132,0,90,10,100,14,100,15,132,0,90,11,100,3,
+    90,12,100,3,83,0,41,17,114,19,0,0,0,99,2,0,
+    0,0,0,0,0,0,2,0,0,0,1,0,0,0,67,0,
+    0,0,115,8,0,0,0,116,0,130,1,100,0,83,0,41,
+    1,78,41,1,114,116,0,0,0,41,2,114,43,0,0,0,
+    218,3,107,101,121,114,31,0,0,0,114,31,0,0,0,114,
+    32,0,0,0,218,11,95,95,103,101,116,105,116,101,109,95,
+    95,141,2,0,0,115,2,0,0,0,0,2,122,19,77,97,
+    112,112,105,110,103,46,95,95,103,101,116,105,116,101,109,95,
+    95,78,99,3,0,0,0,0,0,0,0,3,0,0,0,11,
+    0,0,0,67,0,0,0,115,34,0,0,0,121,8,124,0,
+    124,1,25,0,83,0,4,0,116,0,107,10,114,28,1,0,
+    1,0,1,0,124,2,83,0,88,0,100,1,83,0,41,2,
+    122,60,68,46,103,101,116,40,107,91,44,100,93,41,32,45,
+    62,32,68,91,107,93,32,105,102,32,107,32,105,110,32,68,
+    44,32,101,108,115,101,32,100,46,32,32,100,32,100,101,102,
+    97,117,108,116,115,32,116,111,32,78,111,110,101,46,78,41,
+    1,114,116,0,0,0,41,3,114,43,0,0,0,114,126,0,
+    0,0,218,7,100,101,102,97,117,108,116,114,31,0,0,0,
+    114,31,0,0,0,114,32,0,0,0,218,3,103,101,116,145,
+    2,0,0,115,8,0,0,0,0,2,2,1,8,1,14,1,
+    122,11,77,97,112,112,105,110,103,46,103,101,116,99,2,0,
+    0,0,0,0,0,0,2,0,0,0,11,0,0,0,67,0,
+    0,0,115,42,0,0,0,121,12,124,0,124,1,25,0,1,
+    0,87,0,110,20,4,0,116,0,107,10,114,32,1,0,1,
+    0,1,0,100,1,83,0,88,0,100,2,83,0,100,0,83,
+    0,41,3,78,70,84,41,1,114,116,0,0,0,41,2,114,
+    43,0,0,0,114,126,0,0,0,114,31,0,0,0,114,31,
+    0,0,0,114,32,0,0,0,114,75,0,0,0,152,2,0,
+    0,115,10,0,0,0,0,1,2,1,12,1,14,1,6,2,
+    122,20,77,97,112,112,105,110,103,46,95,95,99,111,110,116,
+    97,105,110,115,95,95,99,1,0,0,0,0,0,0,0,1,
+    0,0,0,2,0,0,0,67,0,0,0,115,8,0,0,0,
+    116,0,124,0,131,1,83,0,41,1,122,58,68,46,107,101,
+    121,115,40,41,32,45,62,32,97,32,115,101,116,45,108,105,
+    107,101,32,111,98,106,101,99,116,32,112,114,111,118,105,100,
+    105,110,103,32,97,32,118,105,101,119,32,111,110,32,68,39,
+    115,32,107,101,121,115,41,1,114,22,0,0,0,41,1,114,
+    43,0,0,0,114,31,0,0,0,114,31,0,0,0,114,32,
+    0,0,0,218,4,107,101,121,115,160,2,0,0,115,2,0,
+    0,0,0,2,122,12,77,97,112,112,105,110,103,46,107,101,
+    121,115,99,1,0,0,0,0,0,0,0,1,0,0,0,2,
+    0,0,0,67,0,0,0,115,8,0,0,0,116,0,124,0,
+    131,1,83,0,41,1,122,60,68,46,105,116,101,109,115,40,
+    41,32,45,62,32,97,32,115,101,116,45,108,105,107,101,32,
+    111,98,106,101,99,116,32,112,114,111,118,105,100,105,110,103,
+    32,97,32,118,105,101,119,32,111,110,32,68,39,115,32,105,
+    116,101,109,115,41,1,114,23,0,0,0,41,1,114,43,0,
+    0,0,114,31,0,0,0,114,31,0,0,0,114,32,0,0,
+    0,218,5,105,116,101,109,115,164,2,0,0,115,2,0,0,
+    0,0,2,122,13,77,97,112,112,105,110,103,46,105,116,101,
+    109,115,99,1,0,0,0,0,0,0,0,1,0,0,0,2,
+    0,0,0,67,0,0,0,115,8,0,0,0,116,0,124,0,
+    131,1,83,0,41,1,122,54,68,46,118,97,108,117,101,115,
+    40,41,32,45,62,32,97,110,32,111,98,106,101,99,116,32,
+    112,114,111,118,105,100,105,110,103,32,97,32,118,105,101,119,
+    32,111,110,32,68,39,115,32,118,97,108,117,101,115,41,1,
+    114,24,0,0,0,41,1,114,43,0,0,0,114,31,0,0,
+    0,114,31,0,0,0,114,32,0,0,0,218,6,118,97,108,
+    117,101,115,168,2,0,0,115,2,0,0,0,0,2,122,14,
+    77,97,112,112,105,110,103,46,118,97,108,117,101,115,99,2,
+    0,0,0,0,0,0,0,2,0,0,0,4,0,0,0,67,
+    0,0,0,115,38,0,0,0,116,0,124,1,116,1,131,2,
+    115,14,116,2,83,0,116,3,124,0,160,4,161,0,131,1,
+    116,3,124,1,160,4,161,0,131,1,107,2,83,0,41,1,
+    78,41,5,114,79,0,0,0,114,19,0,0,0,114,38,0,
+    0,0,218,4,100,105,99,116,114,131,0,0,0,41,2,114,
+    43,0,0,0,114,81,0,0,0,114,31,0,0,0,114,31,
+    0,0,0,114,32,0,0,0,114,87,0,0,0,172,2,0,
+    0,115,6,0,0,0,0,1,10,1,4,1,122,14,77,97,
+    112,112,105,110,103,46,95,95,101,113,95,95,41,1,78,41,
+    13,114,47,0,0,0,114,48,0,0,0,114,49,0,0,0,
+    114,50,0,0,0,114,2,0,0,0,114,127,0,0,0,114,
+    129,0,0,0,114,75,0,0,0,114,130,0,0,0,114,131,
+    0,0,0,114,132,0,0,0,114,87,0,0,0,114,72,0,
+    0,0,114,31,0,0,0,114,31,0,0,0,114,31,0,0,
+    0,114,32,0,0,0,114,19,0,0,0,129,2,0,0,115,
+    18,0,0,0,8,2,4,10,12,4,10,7,8,8,8,4,
+    8,4,8,4,8,5,99,0,0,0,0,0,0,0,0,0,
+    0,0,0,2,0,0,0,64,0,0,0,115,40,0,0,0,
+    101,0,90,1,100,0,90,2,100,9,90,3,100,2,100,3,
+    132,0,90,4,100,4,100,5,132,0,90,5,100,6,100,7,
+    132,0,90,6,100,8,83,0,41,10,114,21,0,0,0,218,
+    8,95,109,97,112,112,105,110,103,99,2,0,0,0,0,0,
+    0,0,2,0,0,0,2,0,0,0,67,0,0,0,115,10,
+    0,0,0,124,1,124,0,95,0,100,0,83,0,41,1,78,
+    41,1,114,134,0,0,0,41,2,114,43,0,0,0,90,7,
+    109,97,112,112,105,110,103,114,31,0,0,0,114,31,0,0,
+    0,114,32,0,0,0,218,8,95,95,105,110,105,116,95,95,
+    186,2,0,0,115,2,0,0,0,0,1,122,20,77,97,112,
+    112,105,110,103,86,105,101,119,46,95,95,105,110,105,116,95,
+    95,99,1,0,0,0,0,0,0,0,1,0,0,0,2,0,
+    0,0,67,0,0,0,115,10,0,0,0,116,0,124,0,106,
+    1,131,1,83,0,41,1,78,41,2,114,80,0,0,0,114,
+    134,0,0,0,41,1,114,43,0,0,0,114,31,0,0,0,
+    114,31,0,0,0,114,32,0,0,0,114,73,0,0,0,189,
+    2,0,0,115,2,0,0,0,0,1,122,19,77,97,112,112,
+    105,110,103,86,105,101,119,46,95,95,108,101,110,95,95,99,
+    1,0,0,0,0,0,0,0,1,0,0,0,3,0,0,0,
+    67,0,0,0,115,10,0,0,0,100,1,160,0,124,0,161,
+    1,83,0,41,2,78,122,38,123,48,46,95,95,99,108,97,
+    115,115,95,95,46,95,95,110,97,109,101,95,95,125,40,123,
+    48,46,95,109,97,112,112,105,110,103,33,114,125,41,41,1,
+    218,6,102,111,114,109,97,116,41,1,114,43,0,0,0,114,
+    31,0,0,0,114,31,0,0,0,114,32,0,0,0,218,8,
+    95,95,114,101,112,114,95,95,192,2,0,0,115,2,0,0,
+    0,0,1,122,20,77,97,112,112,105,110,103,86,105,101,119,
+    46,95,95,114,101,112,114,95,95,78,41,1,114,134,0,0,
+    0,41,7,114,47,0,0,0,114,48,0,0,0,114,49,0,
+    0,0,114,50,0,0,0,114,135,0,0,0,114,73,0,0,
+    0,114,137,0,0,0,114,31,0,0,0,114,31,0,0,0,
+    114,31,0,0,0,114,32,0,0,0,114,21,0,0,0,182,
+    2,0,0,115,8,0,0,0,8,2,4,2,8,3,8,3,
+    99,0,0,0,0,0,0,0,0,0,0,0,0,3,0,0,
+    0,64,0,0,0,115,44,0,0,0,101,0,90,1,100,0,
+    90,2,102,0,90,3,101,4,100,1,100,2,132,0,131,1,
+    90,5,100,3,100,4,132,0,90,6,100,5,100,6,132,0,
+    90,7,100,7,83,0,41,8,114,22,0,0,0,99,2,0,
+    0,0,0,0,0,0,2,0,0,0,2,0,0,0,67,0,
+    0,0,115,8,0,0,0,116,0,124,1,131,1,83,0,41,
+    1,78,41,1,218,3,115,101,116,41,2,114,43,0,0,0,
+    114,88,0,0,0,114,31,0,0,0,114,31,0,0,0,114,
+    32,0,0,0,114,89,0,0,0,200,2,0,0,115,2,0,
+    0,0,0,2,122,23,75,101,121,115,86,105,101,119,46,95,
+    102,114,111,109,95,105,116,101,114,97,98,108,101,99,2,0,
+    0,0,0,0,0,0,2,0,0,0,2,0,0,0,67,0,
+    0,0,115,10,0,0,0,124,1,124,0,106,0,107,6,83,
+    0,41,1,78,41,1,114,134,0,0,0,41,2,114,43,0,
+    0,0,114,126,0,0,0,114,31,0,0,0,114,31,0,0,
+    0,114,32,0,0,0,114,75,0,0,0,204,2,0,0,115,
+    2,0,0,0,0,1,122,21,75,101,121,115,86,105,101,119,
+    46,95,95,99,111,110,116,97,105,110,115,95,95,99,1,0,
+    0,0,0,0,0,0,1,0,0,0,2,0,0,0,99,0,
+    0,0,115,16,0,0,0,124,0,106,0,69,0,100,0,72,
+    0,1,0,100,0,83,0,41,1,78,41,1,114,134,0,0,
+    0,41,1,114,43,0,0,0,114,31,0,0,0,114,31,0,
+    0,0,114,32,0,0,0,114,70,0,0,0,207,2,0,0,
+    115,2,0,0,0,0,1,122,17,75,101,121,115,86,105,101,
+    119,46,95,95,105,116,101,114,95,95,78,41,8,114,47,0,
+    0,0,114,48,0,0,0,114,49,0,0,0,114,50,0,0,
+    0,114,51,0,0,0,114,89,0,0,0,114,75,0,0,0,
+    114,70,0,0,0,114,31,0,0,0,114,31,0,0,0,114,
+    31,0,0,0,114,32,0,0,0,114,22,0,0,0,196,2,
+    0,0,115,8,0,0,0,8,2,4,2,12,4,8,3,99,
+    0,0,0,0,0,0,0,0,0,0,0,0,3,0,0,0,
+    64,0,0,0,115,44,0,0,0,101,0,90,1,100,0,90,
+    2,102,0,90,3,101,4,100,1,100,2,132,0,131,1,90,
+    5,100,3,100,4,132,0,90,6,100,5,100,6,132,0,90,
+    7,100,7,83,0,41,8,114,23,0,0,0,99,2,0,0,
+    0,0,0,0,0,2,0,0,0,2,0,0,0,67,0,0,
+    0,115,8,0,0,0,116,0,124,1,131,1,83,0,41,1,
+    78,41,1,114,138,0,0,0,41,2,114,43,0,0,0,114,
+    88,0,0,0,114,31,0,0,0,114,31,0,0,0,114,32,
+    0,0,0,114,89,0,0,0,217,2,0,0,115,2,0,0,
+    0,0,2,122,24,73,116,101,109,115,86,105,101,119,46,95,
+    102,114,111,109,95,105,116,101,114,97,98,108,101,99,2,0,
+    0,0,0,0,0,0,5,0,0,0,11,0,0,0,67,0,
+    0,0,115,64,0,0,0,124,1,92,2,125,2,125,3,121,
+    14,124,0,106,0,124,2,25,0,125,4,87,0,110,20,4,
+    0,116,1,107,10,114,42,1,0,1,0,1,0,100,1,83,
+    0,88,0,124,4,124,3,107,8,112,58,124,4,124,3,107,
+    2,83,0,100,0,83,0,41,2,78,70,41,2,114,134,0,
+    0,0,114,116,0,0,0,41,5,114,43,0,0,0,90,4,
+    105,116,101,109,114,126,0,0,0,114,54,0,0,0,218,1,
+    118,114,31,0,0,0,114,31,0,0,0,114,32,0,0,0,
+    114,75,0,0,0,221,2,0,0,115,12,0,0,0,0,1,
+    8,1,2,1,14,1,14,1,6,2,122,22,73,116,101,109,
+    115,86,105,101,119,46,95,95,99,111,110,116,97,105,110,115,
+    95,95,99,1,0,0,0,0,0,0,0,2,0,0,0,4,
+    0,0,0,99,0,0,0,115,36,0,0,0,120,30,124,0,
+    106,0,68,0,93,20,125,1,124,1,124,0,106,0,124,1,
+    25,0,102,2,86,0,1,0,113,8,87,0,100,0,83,0,
+    41,1,78,41,1,114,134,0,0,0,41,2,114,43,0,0,
+    0,114,126,0,0,0,114,31,0,0,0,114,31,0,0,0,
+    114,32,0,0,0,114,70,0,0,0,230,2,0,0,115,4,
+    0,0,0,0,1,12,1,122,18,73,116,101,109,115,86,105,
+    101,119,46,95,95,105,116,101,114,95,95,78,41,8,114,47,
+    0,0,0,114,48,0,0,0,114,49,0,0,0,114,50,0,
+    0,0,114,51,0,0,0,114,89,0,0,0,114,75,0,0,
+    0,114,70,0,0,0,114,31,0,0,0,114,31,0,0,0,
+    114,31,0,0,0,114,32,0,0,0,114,23,0,0,0,213,
+    2,0,0,115,8,0,0,0,8,2,4,2,12,4,8,9,
+    99,0,0,0,0,0,0,0,0,0,0,0,0,2,0,0,
+    0,64,0,0,0,115,32,0,0,0,101,0,90,1,100,0,
+    90,2,102,0,90,3,100,1,100,2,132,0,90,4,100,3,
+    100,4,132,0,90,5,100,5,83,0,41,6,114,24,0,0,
+    0,99,2,0,0,0,0,0,0,0,4,0,0,0,3,0,
+    0,0,67,0,0,0,115,50,0,0,0,120,44,124,0,106,
+    0,68,0,93,34,125,2,124,0,106,0,124,2,25,0,125,
+    3,124,3,124,1,107,8,115,38,124,3,124,1,107,2,114,
+    8,100,1,83,0,113,8,87,0,100,2,83,0,41,3,78,
+    84,70,41,1,114,134,0,0,0,41,4,114,43,0,0,0,
+    114,54,0,0,0,114,126,0,0,0,114,139,0,0,0,114,
+    31,0,0,0,114,31,0,0,0,114,32,0,0,0,114,75,
+    0,0,0,241,2,0,0,115,10,0,0,0,0,1,12,1,
+    10,1,16,1,8,1,122,23,86,97,108,117,101,115,86,105,
+    101,119,46,95,95,99,111,110,116,97,105,110,115,95,95,99,
+    1,0,0,0,0,0,0,0,2,0,0,0,3,0,0,0,
+    99,0,0,0,115,32,0,0,0,120,26,124,0,106,0,68,
+    0,93,16,125,1,124,0,106,0,124,1,25,0,86,0,1,
+    0,113,8,87,0,100,0,83,0,41,1,78,41,1,114,134,
+    0,0,0,41,2,114,43,0,0,0,114,126,0,0,0,114,
+    31,0,0,0,114,31,0,0,0,114,32,0,0,0,114,70,
+    0,0,0,248,2,0,0,115,4,0,0,0,0,1,12,1,
+    122,19,86,97,108,117,101,115,86,105,101,119,46,95,95,105,
+    116,101,114,95,95,78,41,6,114,47,0,0,0,114,48,0,
+    0,0,114,49,0,0,0,114,50,0,0,0,114,75,0,0,
+    0,114,70,0,0,0,114,31,0,0,0,114,31,0,0,0,
+    114,31,0,0,0,114,32,0,0,0,114,24,0,0,0,237,
+    2,0,0,115,6,0,0,0,8,2,4,2,8,7,99,0,
+    0,0,0,0,0,0,0,0,0,0,0,3,0,0,0,64,
+    0,0,0,115,92,0,0,0,101,0,90,1,100,0,90,2,
+    102,0,90,3,101,4,100,1,100,2,132,0,131,1,90,5,
+    101,4,100,3,100,4,132,0,131,1,90,6,101,7,131,0,
+    90,8,101,8,102,1,100,5,100,6,132,1,90,9,100,7,
+    100,8,132,0,90,10,100,9,100,10,132,0,90,11,100,11,
+    100,12,132,0,90,12,100,16,100,14,100,15,132,1,90,13,
+    100,13,83,0,41,17,114,20,0,0,0,99,3,0,0,0,
+    0,0,0,0,3,0,0,0,1,0,0,0,67,0,0,0,
+    115,8,0,0,0,116,0,130,1,100,0,83,0,41,1,78,
+    41,1,114,116,0,0,0,41,3,114,43,0,0,0,114,126,
+    0,0,0,114,54,0,0,0,114,31,0,0,0,114,31,0,
+    0,0,114,32,0,0,0,218,11,95,95,115,101,116,105,116,
+    101,109,95,95,12,3,0,0,115,2,0,0,0,0,2,122,
+    26,77,117,116,97,98,108,101,77,97,112,112,105,110,103,46,
+    95,95,115,101,116,105,116,101,109,95,95,99,2,0,0,0,
+    0,0,0,0,2,0,0,0,1,0,0,0,67,0,0,0,
+    115,8,0,0,0,116,0,130,1,100,0,83,0,41,1,78,
+    41,1,114,116,0,0,0,41,2,114,43,0,0,0,114,126,
+    0,0,0,114,31,0,0,0,114,31,0,0,0,114,32,0,
+    0,0,218,11,95,95,100,101,108,105,116,101,109,95,95,16,
+    3,0,0,115,2,0,0,0,0,2,122,26,77,117,116,97,
+    98,108,101,77,97,112,112,105,110,103,46,95,95,100,101,108,
+    105,116,101,109,95,95,99,3,0,0,0,0,0,0,0,4,
+    0,0,0,11,0,0,0,67,0,0,0,115,60,0,0,0,
+    121,12,124,0,124,1,25,0,125,3,87,0,110,32,4,0,
+    116,0,107,10,114,44,1,0,1,0,1,0,124,2,124,0,
+    106,1,107,8,114,40,130,0,124,2,83,0,88,0,124,0,
+    124,1,61,0,124,3,83,0,100,1,83,0,41,2,122,169,
+    68,46,112,111,112,40,107,91,44,100,93,41,32,45,62,32,
+    118,44,32,114,101,109,111,118,101,32,115,112,101,99,105,102,
+    105,101,100,32,107,101,121,32,97,110,100,32,114,101,116,117,
+    114,110,32,116,104,101,32,99,111,114,114,101,115,112,111,110,
+    100,105,110,103,32,118,97,108,117,101,46,10,32,32,32,32,
+    32,32,32,32,32,32,73,102,32,107,101,121,32,105,115,32,
+    110,111,116,32,102,111,117,110,100,44,32,100,32,105,115,32,
+    114,101,116,117,114,110,101,100,32,105,102,32,103,105,118,101,
+    110,44,32,111,116,104,101,114,119,105,115,101,32,75,101,121,
+    69,114,114,111,114,32,105,115,32,114,97,105,115,101,100,46,
+    10,32,32,32,32,32,32,32,32,78,41,2,114,116,0,0,
+    0,218,23,95,77,117,116,97,98,108,101,77,97,112,112,105,
+    110,103,95,95,109,97,114,107,101,114,41,4,114,43,0,0,
+    0,114,126,0,0,0,114,128,0,0,0,114,54,0,0,0,
+    114,31,0,0,0,114,31,0,0,0,114,32,0,0,0,114,
+    120,0,0,0,22,3,0,0,115,16,0,0,0,0,4,2,
+    1,12,1,14,1,10,1,2,1,6,2,6,1,122,18,77,
+    117,116,97,98,108,101,77,97,112,112,105,110,103,46,112,111,
+    112,99,1,0,0,0,0,0,0,0,3,0,0,0,11,0,
+    0,0,67,0,0,0,115,64,0,0,0,121,16,116,0,116,
+    1,124,0,131,1,131,1,125,1,87,0,110,24,4,0,116,
+    2,107,10,114,40,1,0,1,0,1,0,116,3,130,1,89,
+    0,110,2,88,0,124,0,124,1,25,0,125,2,124,0,124,
+    1,61,0,124,1,124,2,102,2,83,0,41,1,122,131,68,
+    46,112,111,112,105,116,101,109,40,41,32,45,62,32,40,107,
+    44,32,118,41,44,32,114,101,109,111,118,101,32,97,110,100,
+    32,114,101,116,117,114,110,32,115,111,109,101,32,40,107,101,
+    121,44,32,118,97,108,117,101,41,32,112,97,105,114,10,32,
+    32,32,32,32,32,32,32,32,32,32,97,115,32,97,32,50,
+    45,116,117,112,108,101,59,32,98,117,116,32,114,97,105,115,
+    101,32,75,101,121,69,114,114,111,114,32,105,102,32,68,32,
+    105,115,32,101,109,112,116,121,46,10,32,32,32,32,32,32,
+    32,32,41,4,114,119,0,0,0,114,118,0,0,0,114,53,
+    0,0,0,114,116,0,0,0,41,3,114,43,0,0,0,114,
+    126,0,0,0,114,54,0,0,0,114,31,0,0,0,114,31,
+    0,0,0,114,32,0,0,0,218,7,112,111,112,105,116,101,
+    109,36,3,0,0,115,14,0,0,0,0,4,2,1,16,1,
+    14,1,10,1,8,1,6,1,122,22,77,117,116,97,98,108,
+    101,77,97,112,112,105,110,103,46,112,111,112,105,116,101,109,
+    99,1,0,0,0,0,0,0,0,1,0,0,0,11,0,0,
+    0,67,0,0,0,115,44,0,0,0,121,18,120,12,124,0,
+    160,0,161,0,1,0,113,4,87,0,87,0,110,20,4,0,
+    116,1,107,10,114,38,1,0,1,0,1,0,89,0,110,2,
+    88,0,100,1,83,0,41,2,122,44,68,46,99,108,101,97,
+    114,40,41,32,45,62,32,78,111,110,101,46,32,32,82,101,
+    109,111,118,101,32,97,108,108,32,105,116,101,109,115,32,102,
+    114,111,109,32,68,46,78,41,2,114,143,0,0,0,114,116,
+    0,0,0,41,1,114,43,0,0,0,114,31,0,0,0,114,
+    31,0,0,0,114,32,0,0,0,114,121,0,0,0,48,3,
+    0,0,115,10,0,0,0,0,2,2,1,2,1,16,1,14,
+    1,122,20,77,117,116,97,98,108,101,77,97,112,112,105,110,
+    103,46,99,108,101,97,114,99,0,0,0,0,0,0,0,0,
+    6,0,0,0,4,0,0,0,79,0,0,0,115,200,0,0,
+    0,124,0,115,12,116,0,100,1,131,1,130,1,124,0,94,
+    1,125,2,125,0,116,1,124,0,131,1,100,2,107,4,114,
+    48,116,0,100,3,116,1,124,0,131,1,22,0,131,1,130,
+    1,124,0,114,166,124,0,100,4,25,0,125,3,116,2,124,
+    3,116,3,131,2,114,98,120,94,124,3,68,0,93,16,125,
+    4,124,3,124,4,25,0,124,2,124,4,60,0,113,76,87,
+    0,110,68,116,4,124,3,100,5,131,2,114,140,120,56,124,
+    3,160,5,161,0,68,0,93,16,125,4,124,3,124,4,25,
+    0,124,2,124,4,60,0,113,118,87,0,110,26,120,24,124,
+    3,68,0,93,16,92,2,125,4,125,5,124,5,124,2,124,
+    4,60,0,113,146,87,0,120,28,124,1,160,6,161,0,68,
+    0,93,16,92,2,125,4,125,5,124,5,124,2,124,4,60,
+    0,113,176,87,0,100,6,83,0,41,7,97,75,1,0,0,
+    32,68,46,117,112,100,97,116,101,40,91,69,44,32,93,42,
+    42,70,41,32,45,62,32,78,111,110,101,46,32,32,85,112,
+    100,97,116,101,32,68,32,102,114,111,109,32,109,97,112,112,
+    105,110,103,47,105,116,101,114,97,98,108,101,32,69,32,97,
+    110,100,32,70,46,10,32,32,32,32,32,32,32,32,32,32,
+    32,32,73,102,32,69,32,112,114,101,115,101,110,116,32,97,
+    110,100,32,104,97,115,32,97,32,46,107,101,121,115,40,41,
+    32,109,101,116,104,111,100,44,32,100,111,101,115,58,32,32,
+    32,32,32,102,111,114,32,107,32,105,110,32,69,58,32,68,
+    91,107,93,32,61,32,69,91,107,93,10,32,32,32,32,32,
+    32,32,32,32,32,32,32,73,102,32,69,32,112,114,101,115,
+    101,110,116,32,97,110,100,32,108,97,99,107,115,32,46,107,
+    101,121,115,40,41,32,109,101,116,104,111,100,44,32,100,111,
+    101,115,58,32,32,32,32,32,102,111,114,32,40,107,44,32,
+    118,41,32,105,110,32,69,58,32,68,91,107,93,32,61,32,
+    118,10,32,32,32,32,32,32,32,32,32,32,32,32,73,110,
+    32,101,105,116,104,101,114,32,99,97,115,101,44,32,116,104,
+    105,115,32,105,115,32,102,111,108,108,111,119,101,100,32,98,
+    121,58,32,102,111,114,32,107,44,32,118,32,105,110,32,70,
+    46,105,116,101,109,115,40,41,58,32,68,91,107,93,32,61,
+    32,118,10,32,32,32,32,32,32,32,32,122,64,100,101,115,
+    99,114,105,112,116,111,114,32,39,117,112,100,97,116,101,39,
+    32,111,102,32,39,77,117,116,97,98,108,101,77,97,112,112,
+    105,110,103,39,32,111,98,106,101,99,116,32,110,101,101,100,
+    115,32,97,110,32,97,114,103,117,109,101,110,116,114,29,0,
+    0,0,122,43,117,112,100,97,116,101,32,101,120,112,101,99,
+    116,101,100,32,97,116,32,109,111,115,116,32,49,32,97,114,
+    103,117,109,101,110,116,115,44,32,103,111,116,32,37,100,114,
+    0,0,0,0,114,130,0,0,0,78,41,7,218,9,84,121,
+    112,101,69,114,114,111,114,114,80,0,0,0,114,79,0,0,
+    0,114,19,0,0,0,218,7,104,97,115,97,116,116,114,114,
+    130,0,0,0,114,131,0,0,0,41,6,114,76,0,0,0,
+    114,77,0,0,0,114,43,0,0,0,114,81,0,0,0,114,
+    126,0,0,0,114,54,0,0,0,114,31,0,0,0,114,31,
+    0,0,0,114,32,0,0,0,218,6,117,112,100,97,116,101,
+    56,3,0,0,115,36,0,0,0,0,6,4,1,8,2,8,
+    1,12,1,4,1,12,1,4,1,8,1,10,1,10,1,18,
+    1,10,1,14,1,18,2,14,1,12,1,18,1,122,21,77,
+    117,116,97,98,108,101,77,97,112,112,105,110,103,46,117,112,
+    100,97,116,101,78,99,3,0,0,0,0,0,0,0,3,0,
+    0,0,11,0,0,0,67,0,0,0,115,42,0,0,0,121,
+    8,124,0,124,1,25,0,83,0,4,0,116,0,107,10,114,
+    36,1,0,1,0,1,0,124,2,124,0,124,1,60,0,89,
+    0,110,2,88,0,124,2,83,0,41,1,122,64,68,46,115,
+    101,116,100,101,102,97,117,108,116,40,107,91,44,100,93,41,
+    32,45,62,32,68,46,103,101,116,40,107,44,100,41,44,32,
+    97,108,115,111,32,115,101,116,32,68,91,107,93,61,100,32,
+    105,102,32,107,32,110,111,116,32,105,110,32,68,41,1,114,
+    116,0,0,0,41,3,114,43,0,0,0,114,126,0,0,0,
+    114,128,0,0,0,114,31,0,0,0,114,31,0,0,0,114,
+    32,0,0,0,218,10,115,101,116,100,101,102,97,117,108,116,
+    83,3,0,0,115,10,0,0,0,0,2,2,1,8,1,14,
+    1,14,1,122,25,77,117,116,97,98,108,101,77,97,112,112,
+    105,110,103,46,115,101,116,100,101,102,97,117,108,116,41,1,
+    78,41,14,114,47,0,0,0,114,48,0,0,0,114,49,0,
+    0,0,114,50,0,0,0,114,2,0,0,0,114,140,0,0,
+    0,114,141,0,0,0,218,6,111,98,106,101,99,116,114,142,
+    0,0,0,114,120,0,0,0,114,143,0,0,0,114,121,0,
+    0,0,114,146,0,0,0,114,147,0,0,0,114,31,0,0,
+    0,114,31,0,0,0,114,31,0,0,0,114,32,0,0,0,
+    114,20,0,0,0,255,2,0,0,115,18,0,0,0,8,2,
+    4,11,12,4,12,4,6,2,12,14,8,12,8,8,8,27,
+    99,0,0,0,0,0,0,0,0,0,0,0,0,3,0,0,
+    0,64,0,0,0,115,74,0,0,0,101,0,90,1,100,0,
+    90,2,100,1,90,3,102,0,90,4,101,5,100,2,100,3,
+    132,0,131,1,90,6,100,4,100,5,132,0,90,7,100,6,
+    100,7,132,0,90,8,100,8,100,9,132,0,90,9,100,16,
+    100,12,100,13,132,1,90,10,100,14,100,15,132,0,90,11,
+    100,11,83,0,41,17,114,25,0,0,0,122,138,65,108,108,
+    32,116,104,101,32,111,112,101,114,97,116,105,111,110,115,32,
+    111,110,32,97,32,114,101,97,100,45,111,110,108,121,32,115,
+    101,113,117,101,110,99,101,46,10,10,32,32,32,32,67,111,
+    110,99,114,101,116,101,32,115,117,98,99,108,97,115,115,101,
+    115,32,109,117,115,116,32,111,118,101,114,114,105,100,101,32,
+    95,95,110,101,119,95,95,32,111,114,32,95,95,105,110,105,
+    116,95,95,44,10,32,32,32,32,95,95,103,101,116,105,116,
+    101,109,95,95,44,32,97,110,100,32,95,95,108,101,110,95,
+    95,46,10,32,32,32,32,99,2,0,0,0,0,0,0,0,
+    2,0,0,0,1,0,0,0,67,0,0,0,115,8,0,0,
+    0,116,0,130,1,100,0,83,0,41,1,78,41,1,218,10,
+    73,110,100,101,120,69,114,114,111,114,41,2,114,43,0,0,
+    0,218,5,105,110,100,101,120,114,31,0,0,0,114,31,0,
+    0,0,114,32,0,0,0,114,127,0,0,0,107,3,0,0,
+    115,2,0,0,0,0,2,122,20,83,101,113,117,101,110,99,
+    101,46,95,95,103,101,116,105,116,101,109,95,95,99,1,0,
+    0,0,0,0,0,0,3,0,0,0,11,0,0,0,99,0,
+    0,0,115,62,0,0,0,100,1,125,1,121,32,120,26,124,
+    0,124,1,25,0,125,2,124,2,86,0,1,0,124,1,100,
+    2,55,0,125,1,113,8,87,0,87,0,110,20,4,0,116,
+    0,107,10,114,56,1,0,1,0,1,0,100,0,83,0,88,
+    0,100,0,83,0,41,3,78,114,0,0,0,0,114,29,0,
+    0,0,41,1,114,149,0,0,0,41,3,114,43,0,0,0,
+    218,1,105,114,139,0,0,0,114,31,0,0,0,114,31,0,
+    0,0,114,32,0,0,0,114,70,0,0,0,111,3,0,0,
+    115,16,0,0,0,0,1,4,1,2,1,2,1,8,1,6,
+    1,16,1,14,1,122,17,83,101,113,117,101,110,99,101,46,
+    95,95,105,116,101,114,95,95,99,2,0,0,0,0,0,0,
+    0,3,0,0,0,3,0,0,0,67,0,0,0,115,38,0,
+    0,0,120,32,124,0,68,0,93,24,125,2,124,2,124,1,
+    107,8,115,26,124,2,124,1,107,2,114,6,100,1,83,0,
+    113,6,87,0,100,2,83,0,41,3,78,84,70,114,31,0,
+    0,0,41,3,114,43,0,0,0,114,54,0,0,0,114,139,
+    0,0,0,114,31,0,0,0,114,31,0,0,0,114,32,0,
+    0,0,114,75,0,0,0,121,3,0,0,115,8,0,0,0,
+    0,1,10,1,16,1,8,1,122,21,83,101,113,117,101,110,
+    99,101,46,95,95,99,111,110,116,97,105,110,115,95,95,99,
+    1,0,0,0,0,0,0,0,2,0,0,0,4,0,0,0,
+    99,0,0,0,115,40,0,0,0,120,34,116,0,116,1,116,
+    2,124,0,131,1,131,1,131,1,68,0,93,14,125,1,124,
+    0,124,1,25,0,86,0,1,0,113,18,87,0,100,0,83,
+    0,41,1,78,41,3,218,8,114,101,118,101,114,115,101,100,
+    218,5,114,97,110,103,101,114,80,0,0,0,41,2,114,43,
+    0,0,0,114,151,0,0,0,114,31,0,0,0,114,31,0,
+    0,0,114,32,0,0,0,114,72,0,0,0,127,3,0,0,
+    115,4,0,0,0,0,1,22,1,122,21,83,101,113,117,101,
+    110,99,101,46,95,95,114,101,118,101,114,115,101,100,95,95,
+    114,0,0,0,0,78,99,4,0,0,0,0,0,0,0,5,
+    0,0,0,11,0,0,0,67,0,0,0,115,148,0,0,0,
+    124,2,100,1,107,9,114,34,124,2,100,2,107,0,114,34,
+    116,0,116,1,124,0,131,1,124,2,23,0,100,2,131,2,
+    125,2,124,3,100,1,107,9,114,62,124,3,100,2,107,0,
+    114,62,124,3,116,1,124,0,131,1,55,0,125,3,124,2,
+    125,4,120,72,124,3,100,1,107,8,115,84,124,4,124,3,
+    107,0,114,138,121,20,124,0,124,4,25,0,124,1,107,2,
+    114,102,124,4,83,0,87,0,110,22,4,0,116,2,107,10,
+    114,126,1,0,1,0,1,0,80,0,89,0,110,2,88,0,
+    124,4,100,3,55,0,125,4,113,68,87,0,116,3,130,1,
+    100,1,83,0,41,4,122,141,83,46,105,110,100,101,120,40,
+    118,97,108,117,101,44,32,91,115,116,97,114,116,44,32,91,
+    115,116,111,112,93,93,41,32,45,62,32,105,110,116,101,103,
+    101,114,32,45,45,32,114,101,116,117,114,110,32,102,105,114,
+    115,116,32,105,110,100,101,120,32,111,102,32,118,97,108,117,
+    101,46,10,32,32,32,32,32,32,32,32,32,32,32,82,97,
+    105,115,101,115,32,86,97,108,117,101,69,114,114,111,114,32,
+    105,102,32,116,104,101,32,118,97,108,117,101,32,105,115,32,
+    110,111,116,32,112,114,101,115,101,110,116,46,10,32,32,32,
+    32,32,32,32,32,78,114,0,0,0,0,114,29,0,0,0,
+    41,4,218,3,109,97,120,114,80,0,0,0,114,149,0,0,
+    0,218,10,86,97,108,117,101,69,114,114,111,114,41,5,114,
+    43,0,0,0,114,54,0,0,0,218,5,115,116,97,114,116,
+    218,4,115,116,111,112,114,151,0,0,0,114,31,0,0,0,
+    114,31,0,0,0,114,32,0,0,0,114,150,0,0,0,131,
+    3,0,0,115,26,0,0,0,0,4,16,1,18,1,16,1,
+    12,2,4,1,18,1,2,1,12,1,8,1,14,1,8,1,
+    12,1,122,14,83,101,113,117,101,110,99,101,46,105,110,100,
+    101,120,99,2,0,0,0,0,0,0,0,2,0,0,0,4,
+    0,0,0,3,0,0,0,115,22,0,0,0,116,0,135,0,
+    102,1,100,1,100,2,132,8,124,0,68,0,131,1,131,1,
+    83,0,41,3,122,66,83,46,99,111,117,110,116,40,118,97,
+    108,117,101,41,32,45,62,32,105,110,116,101,103,101,114,32,
+    45,45,32,114,101,116,117,114,110,32,110,117,109,98,101,114,
+    32,111,102,32,111,99,99,117,114,114,101,110,99,101,115,32,
+    111,102,32,118,97,108,117,101,99,1,0,0,0,0,0,0,
+    0,2,0,0,0,3,0,0,0,51,0,0,0,115,26,0,
+    0,0,124,0,93,18,125,1,124,1,136,0,107,2,114,2,
+    100,0,86,0,1,0,113,2,100,1,83,0,41,2,114,29,
+    0,0,0,78,114,31,0,0,0,41,2,114,90,0,0,0,
+    114,139,0,0,0,41,1,114,54,0,0,0,114,31,0,0,
+    0,114,32,0,0,0,114,91,0,0,0,152,3,0,0,115,
+    2,0,0,0,4,0,122,33,83,101,113,117,101,110,99,101,
+    46,99,111,117,110,116,46,60,108,111,99,97,108,115,62,46,
+    60,103,101,110,101,120,112,114,62,41,1,218,3,115,117,109,
+    41,2,114,43,0,0,0,114,54,0,0,0,114,31,0,0,
+    0,41,1,114,54,0,0,0,114,32,0,0,0,218,5,99,
+    111,117,110,116,150,3,0,0,115,2,0,0,0,0,2,122,
+    14,83,101,113,117,101,110,99,101,46,99,111,117,110,116,41,
+    2,114,0,0,0,0,78,41,12,114,47,0,0,0,114,48,
+    0,0,0,114,49,0,0,0,114,109,0,0,0,114,50,0,
+    0,0,114,2,0,0,0,114,127,0,0,0,114,70,0,0,
+    0,114,75,0,0,0,114,72,0,0,0,114,150,0,0,0,
+    114,159,0,0,0,114,31,0,0,0,114,31,0,0,0,114,
+    31,0,0,0,114,32,0,0,0,114,25,0,0,0,97,3,
+    0,0,115,16,0,0,0,8,6,4,2,4,2,12,4,8,
+    10,8,6,8,4,10,19,99,0,0,0,0,0,0,0,0,
+    0,0,0,0,1,0,0,0,64,0,0,0,115,20,0,0,
+    0,101,0,90,1,100,0,90,2,100,1,90,3,102,0,90,
+    4,100,2,83,0,41,3,114,27,0,0,0,122,77,84,104,
+    105,115,32,117,110,105,102,105,101,115,32,98,121,116,101,115,
+    32,97,110,100,32,98,121,116,101,97,114,114,97,121,46,10,
+    10,32,32,32,32,88,88,88,32,83,104,111,117,108,100,32,
+    97,100,100,32,97,108,108,32,116,104,101,105,114,32,109,101,
+    116,104,111,100,115,46,10,32,32,32,32,78,41,5,114,47,
+    0,0,0,114,48,0,0,0,114,49,0,0,0,114,109,0,
+    0,0,114,50,0,0,0,114,31,0,0,0,114,31,0,0,
+    0,114,31,0,0,0,114,32,0,0,0,114,27,0,0,0,
+    160,3,0,0,115,4,0,0,0,8,5,4,2,99,0,0,
+    0,0,0,0,0,0,0,0,0,0,3,0,0,0,64,0,
+    0,0,115,110,0,0,0,101,0,90,1,100,0,90,2,102,
+    0,90,3,101,4,100,1,100,2,132,0,131,1,90,5,101,
+    4,100,3,100,4,132,0,131,1,90,6,101,4,100,5,100,
+    6,132,0,131,1,90,7,100,7,100,8,132,0,90,8,100,
+    9,100,10,132,0,90,9,100,11,100,12,132,0,90,10,100,
+    13,100,14,132,0,90,11,100,24,100,16,100,17,132,1,90,
+    12,100,18,100,19,132,0,90,13,100,20,100,21,132,0,90,
+    14,100,22,83,0,41,25,114,26,0,0,0,99,3,0,0,
+    0,0,0,0,0,3,0,0,0,1,0,0,0,67,0,0,
+    0,115,8,0,0,0,116,0,130,1,100,0,83,0,41,1,
+    78,41,1,114,149,0,0,0,41,3,114,43,0,0,0,114,
+    150,0,0,0,114,54,0,0,0,114,31,0,0,0,114,31,
+    0,0,0,114,32,0,0,0,114,140,0,0,0,184,3,0,
+    0,115,2,0,0,0,0,2,122,27,77,117,116,97,98,108,
+    101,83,101,113,117,101,110,99,101,46,95,95,115,101,116,105,
+    116,101,109,95,95,99,2,0,0,0,0,0,0,0,2,0,
+    0,0,1,0,0,0,67,0,0,0,115,8,0,0,0,116,
+    0,130,1,100,0,83,0,41,1,78,41,1,114,149,0,0,
+    0,41,2,114,43,0,0,0,114,150,0,0,0,114,31,0,
+    0,0,114,31,0,0,0,114,32,0,0,0,114,141,0,0,
+    0,188,3,0,0,115,2,0,0,0,0,2,122,27,77,117,
+    116,97,98,108,101,83,101,113,117,101,110,99,101,46,95,95,
+    100,101,108,105,116,101,109,95,95,99,3,0,0,0,0,0,
+    0,0,3,0,0,0,1,0,0,0,67,0,0,0,115,8,
+    0,0,0,116,0,130,1,100,1,83,0,41,2,122,51,83,
+    46,105,110,115,101,114,116,40,105,110,100,101,120,44,32,118,
+    97,108,117,101,41,32,45,45,32,105,110,115,101,114,116,32,
+    118,97,108,117,101,32,98,101,102,111,114,101,32,105,110,100,
+    101,120,78,41,1,114,149,0,0,0,41,3,114,43,0,0,
+    0,114,150,0,0,0,114,54,0,0,0,114,31,0,0,0,
+    114,31,0,0,0,114,32,0,0,0,218,6,105,110,115,101,
+    114,116,192,3,0,0,115,2,0,0,0,0,3,122,22,77,
+    117,116,97,98,108,101,83,101,113,117,101,110,99,101,46,105,
+    110,115,101,114,116,99,2,0,0,0,0,0,0,0,2,0,
+    0,0,4,0,0,0,67,0,0,0,115,20,0,0,0,124,
+    0,160,0,116,1,124,0,131,1,124,1,161,2,1,0,100,
+    1,83,0,41,2,122,58,83,46,97,112,112,101,110,100,40,
+    118,97,108,117,101,41,32,45,45,32,97,112,112,101,110,100,
+    32,118,97,108,117,101,32,116,111,32,116,104,101,32,101,110,
+    100,32,111,102,32,116,104,101,32,115,101,113,117,101,110,99,
+    101,78,41,2,114,160,0,0,0,114,80,0,0,0,41,2,
+    114,43,0,0,0,114,54,0,0,0,114,31,0,0,0,114,
+    31,0,0,0,114,32,0,0,0,218,6,97,112,112,101,110,
+    100,197,3,0,0,115,2,0,0,0,0,2,122,22,77,117,
+    116,97,98,108,101,83,101,113,117,101,110,99,101,46,97,112,
+    112,101,110,100,99,1,0,0,0,0,0,0,0,1,0,0,
+    0,11,0,0,0,67,0,0,0,115,44,0,0,0,121,18,
+    120,12,124,0,160,0,161,0,1,0,113,4,87,0,87,0,
+    110,20,4,0,116,1,107,10,114,38,1,0,1,0,1,0,
+    89,0,110,2,88,0,100,1,83,0,41,2,122,44,83,46,
+    99,108,101,97,114,40,41,32,45,62,32,78,111,110,101,32,
+    45,45,32,114,101,109,111,118,101,32,97,108,108,32,105,116,
+    101,109,115,32,102,114,111,109,32,83,78,41,2,114,120,0,
+    0,0,114,149,0,0,0,41,1,114,43,0,0,0,114,31,
+    0,0,0,114,31,0,0,0,114,32,0,0,0,114,121,0,
+    0,0,201,3,0,0,115,10,0,0,0,0,2,2,1,2,
+    1,16,1,14,1,122,21,77,117,116,97,98,108,101,83,101,
+    113,117,101,110,99,101,46,99,108,101,97,114,99,1,0,0,
+    0,0,0,0,0,3,0,0,0,5,0,0,0,67,0,0,
+    0,115,76,0,0,0,116,0,124,0,131,1,125,1,120,62,
+    116,1,124,1,100,1,26,0,131,1,68,0,93,46,125,2,
+    124,0,124,1,124,2,24,0,100,2,24,0,25,0,124,0,
+    124,2,25,0,2,0,124,0,124,2,60,0,124,0,124,1,
+    124,2,24,0,100,2,24,0,60,0,113,22,87,0,100,3,
+    83,0,41,4,122,33,83,46,114,101,118,101,114,115,101,40,
+    41,32,45,45,32,114,101,118,101,114,115,101,32,42,73,78,
+    32,80,76,65,67,69,42,114,100,0,0,0,114,29,0,0,
+    0,78,41,2,114,80,0,0,0,114,153,0,0,0,41,3,
+    114,43,0,0,0,114,106,0,0,0,114,151,0,0,0,114,
+    31,0,0,0,114,31,0,0,0,114,32,0,0,0,218,7,
+    114,101,118,101,114,115,101,209,3,0,0,115,6,0,0,0,
+    0,2,8,1,18,1,122,23,77,117,116,97,98,108,101,83,
+    101,113,117,101,110,99,101,46,114,101,118,101,114,115,101,99,
+    2,0,0,0,0,0,0,0,3,0,0,0,4,0,0,0,
+    67,0,0,0,115,28,0,0,0,120,22,124,1,68,0,93,
+    14,125,2,124,0,160,0,124,2,161,1,1,0,113,6,87,
+    0,100,1,83,0,41,2,122,77,83,46,101,120,116,101,110,
+    100,40,105,116,101,114,97,98,108,101,41,32,45,45,32,101,
+    120,116,101,110,100,32,115,101,113,117,101,110,99,101,32,98,
+    121,32,97,112,112,101,110,100,105,110,103,32,101,108,101,109,
+    101,110,116,115,32,102,114,111,109,32,116,104,101,32,105,116,
+    101,114,97,98,108,101,78,41,1,114,161,0,0,0,41,3,
+    114,43,0,0,0,114,132,0,0,0,114,139,0,0,0,114,
+    31,0,0,0,114,31,0,0,0,114,32,0,0,0,218,6,
+    101,120,116,101,110,100,215,3,0,0,115,4,0,0,0,0,
+    2,10,1,122,22,77,117,116,97,98,108,101,83,101,113,117,
+    101,110,99,101,46,101,120,116,101,110,100,114,29,0,0,0,
+    99,2,0,0,0,0,0,0,0,3,0,0,0,2,0,0,
+    0,67,0,0,0,115,18,0,0,0,124,0,124,1,25,0,
+    125,2,124,0,124,1,61,0,124,2,83,0,41,1,122,153,
+    83,46,112,111,112,40,91,105,110,100,101,120,93,41,32,45,
+    62,32,105,116,101,109,32,45,45,32,114,101,109,111,118,101,
+    32,97,110,100,32,114,101,116,117,114,110,32,105,116,101,109,
+    32,97,116,32,105,110,100,101,120,32,40,100,101,102,97,117,
+    108,116,32,108,97,115,116,41,46,10,32,32,32,32,32,32,
+    32,32,32,32,32,82,97,105,115,101,32,73,110,100,101,120,
+    69,114,114,111,114,32,105,102,32,108,105,115,116,32,105,115,
+    32,101,109,112,116,121,32,111,114,32,105,110,100,101,120,32,
+    105,115,32,111,117,116,32,111,102,32,114,97,110,103,101,46,
+    10,32,32,32,32,32,32,32,32,114,31,0,0,0,41,3,
+    114,43,0,0,0,114,150,0,0,0,114,139,0,0,0,114,
+    31,0,0,0,114,31,0,0,0,114,32,0,0,0,114,120,
+    0,0,0,220,3,0,0,115,6,0,0,0,0,4,8,1,
+    6,1,122,19,77,117,116,97,98,108,101,83,101,113,117,101,
+    110,99,101,46,112,111,112,99,2,0,0,0,0,0,0,0,
+    2,0,0,0,4,0,0,0,67,0,0,0,115,16,0,0,
+    0,124,0,124,0,160,0,124,1,161,1,61,0,100,1,83,
+    0,41,2,122,118,83,46,114,101,109,111,118,101,40,118,97,
+    108,117,101,41,32,45,45,32,114,101,109,111,118,101,32,102,
+    105,114,115,116,32,111,99,99,117,114,114,101,110,99,101,32,
+    111,102,32,118,97,108,117,101,46,10,32,32,32,32,32,32,
+    32,32,32,32,32,82,97,105,115,101,32,86,97,108,117,101,
+    69,114,114,111,114,32,105,102,32,116,104,101,32,118,97,108,
+    117,101,32,105,115,32,110,111,116,32,112,114,101,115,101,110,
+    116,46,10,32,32,32,32,32,32,32,32,78,41,1,114,150,
+    0,0,0,41,2,114,43,0,0,0,114,54,0,0,0,114,
+    31,0,0,0,114,31,0,0,0,114,32,0,0,0,114,117,
+    0,0,0,228,3,0,0,115,2,0,0,0,0,4,122,22,
+    77,117,116,97,98,108,101,83,101,113,117,101,110,99,101,46,
+    114,101,109,111,118,101,99,2,0,0,0,0,0,0,0,2,
+    0,0,0,3,0,0,0,67,0,0,0,115,14,0,0,0,
+    124,0,160,0,124,1,161,1,1,0,124,0,83,0,41,1,
+    78,41,1,114,163,0,0,0,41,2,114,43,0,0,0,114,
+    132,0,0,0,114,31,0,0,0,114,31,0,0,0,114,32,
+    0,0,0,218,8,95,95,105,97,100,100,95,95,234,3,0,
+    0,115,4,0,0,0,0,1,10,1,122,24,77,117,116,97,
+    98,108,101,83,101,113,117,101,110,99,101,46,95,95,105,97,
+    100,100,95,95,78,114,102,0,0,0,41,1,114,102,0,0,
+    0,41,15,114,47,0,0,0,114,48,0,0,0,114,49,0,
+    0,0,114,50,0,0,0,114,2,0,0,0,114,140,0,0,
+    0,114,141,0,0,0,114,160,0,0,0,114,161,0,0,0,
+    114,121,0,0,0,114,162,0,0,0,114,163,0,0,0,114,
+    120,0,0,0,114,117,0,0,0,114,164,0,0,0,114,31,
+    0,0,0,114,31,0,0,0,114,31,0,0,0,114,32,0,
+    0,0,114,26,0,0,0,173,3,0,0,115,22,0,0,0,
+    8,2,4,9,12,4,12,4,12,5,8,4,8,8,8,6,
+    8,5,10,8,8,6,108,67,0,0,0,0,0,0,0,0,
+    0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+    0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+    0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+    0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+    0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+    0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+    0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+    0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+    4,41,75,114,109,0,0,0,90,3,97,98,99,114,1,0,
+    0,0,114,2,0,0,0,114,103,0,0,0,90,7,95,95,
+    97,108,108,95,95,114,47,0,0,0,218,4,116,121,112,101,
+    114,118,0,0,0,90,14,98,121,116,101,115,95,105,116,101,
+    114,97,116,111,114,218,9,98,121,116,101,97,114,114,97,121,
+    90,18,98,121,116,101,97,114,114,97,121,95,105,116,101,114,
+    97,116,111,114,114,130,0,0,0,90,16,100,105,99,116,95,
+    107,101,121,105,116,101,114,97,116,111,114,114,132,0,0,0,
+    90,18,100,105,99,116,95,118,97,108,117,101,105,116,101,114,
+    97,116,111,114,114,131,0,0,0,90,17,100,105,99,116,95,
+    105,116,101,109,105,116,101,114,97,116,111,114,90,13,108,105,
+    115,116,95,105,116,101,114,97,116,111,114,114,152,0,0,0,
+    90,20,108,105,115,116,95,114,101,118,101,114,115,101,105,116,
+    101,114,97,116,111,114,114,153,0,0,0,90,14,114,97,110,
+    103,101,95,105,116,101,114,97,116,111,114,90,18,108,111,110,
+    103,114,97,110,103,101,95,105,116,101,114,97,116,111,114,114,
+    138,0,0,0,90,12,115,101,116,95,105,116,101,114,97,116,
+    111,114,90,12,115,116,114,95,105,116,101,114,97,116,111,114,
+    90,14,116,117,112,108,101,95,105,116,101,114,97,116,111,114,
+    218,3,122,105,112,90,12,122,105,112,95,105,116,101,114,97,
+    116,111,114,90,9,100,105,99,116,95,107,101,121,115,90,11,
+    100,105,99,116,95,118,97,108,117,101,115,90,10,100,105,99,
+    116,95,105,116,101,109,115,114,37,0,0,0,90,12,109,97,
+    112,112,105,110,103,112,114,111,120,121,90,9,103,101,110,101,
+    114,97,116,111,114,114,34,0,0,0,90,9,99,111,114,111,
+    117,116,105,110,101,114,63,0,0,0,114,35,0,0,0,90,
+    15,97,115,121,110,99,95,103,101,110,101,114,97,116,111,114,
+    114,42,0,0,0,114,8,0,0,0,114,3,0,0,0,114,
+    4,0,0,0,90,8,114,101,103,105,115,116,101,114,114,5,
+    0,0,0,114,6,0,0,0,114,7,0,0,0,114,9,0,
+    0,0,114,10,0,0,0,114,12,0,0,0,114,11,0,0,
+    0,114,13,0,0,0,114,14,0,0,0,114,16,0,0,0,
+    114,15,0,0,0,114,17,0,0,0,218,9,102,114,111,122,
+    101,110,115,101,116,114,18,0,0,0,114,19,0,0,0,114,
+    21,0,0,0,114,22,0,0,0,114,23,0,0,0,114,24,
+    0,0,0,114,20,0,0,0,114,133,0,0,0,114,25,0,
+    0,0,218,5,116,117,112,108,101,218,3,115,116,114,218,10,
+    109,101,109,111,114,121,118,105,101,119,114,27,0,0,0,218,
+    5,98,121,116,101,115,114,26,0,0,0,218,4,108,105,115,
+    116,114,31,0,0,0,114,31,0,0,0,114,31,0,0,0,
+    114,32,0,0,0,218,8,60,109,111,100,117,108,101,62,7,
+    0,0,0,115,194,0,0,0,4,2,16,1,8,2,4,1,
+    6,1,10,1,8,1,4,1,4,1,8,1,4,1,6,7,
+    4,9,12,1,14,2,16,1,16,1,16,1,12,1,16,1,
+    16,1,16,1,14,1,12,1,12,1,14,2,12,1,12,1,
+    12,2,10,1,14,2,8,1,6,1,8,1,8,1,2,2,
+    8,1,6,1,8,1,2,5,8,12,18,15,18,15,16,41,
+    10,3,18,15,16,19,16,48,10,3,18,16,16,18,10,1,
+    10,2,10,1,10,1,10,1,10,1,10,1,10,1,10,1,
+    10,1,10,1,10,1,10,3,16,16,16,47,10,3,18,15,
+    18,14,20,10,18,18,16,127,0,10,10,3,16,79,10,6,
+    16,50,10,3,16,14,18,14,10,3,18,21,10,3,16,15,
+    10,3,16,92,10,6,18,57,10,1,10,1,10,1,10,3,
+    16,9,10,1,10,3,16,65,10,1,
+};
+static const unsigned char _Py_M__site[] = {
+    99,0,0,0,0,0,0,0,0,0,0,0,0,3,0,0,
+    0,64,0,0,0,115,22,1,0,0,100,0,90,0,100,1,
+    100,2,108,1,90,1,100,1,100,2,108,2,90,2,100,1,
+    100,2,108,3,90,3,100,1,100,2,108,4,90,4,101,1,
+    106,5,101,1,106,6,103,2,97,7,100,2,97,8,100,2,
+    97,9,100,2,97,10,100,3,100,4,132,0,90,11,100,5,
+    100,6,132,0,90,12,100,7,100,8,132,0,90,13,100,9,
+    100,10,132,0,90,14,100,11,100,12,132,0,90,15,100,48,
+    100,13,100,14,132,1,90,16,100,15,100,16,132,0,90,17,
+    100,17,100,18,132,0,90,18,100,19,100,20,132,0,90,19,
+    100,21,100,22,132,0,90,20,100,49,100,23,100,24,132,1,
+    90,21,100,50,100,25,100,26,132,1,90,22,100,27,100,28,
+    132,0,90,23,100,29,100,30,132,0,90,24,100,31,100,32,
+    132,0,90,25,100,33,100,34,132,0,90,26,100,35,100,36,
+    132,0,90,27,100,37,100,38,132,0,90,28,100,39,100,40,
+    132,0,90,29,100,41,100,42,132,0,90,30,100,43,100,44,
+    132,0,90,31,101,1,106,32,106,33,144,0,115,250,101,31,
+    131,0,1,0,100,45,100,46,132,0,90,34,101,35,100,47,
+    107,2,144,1,114,18,101,34,131,0,1,0,100,2,83,0,
+    41,51,97,182,11,0,0,65,112,112,101,110,100,32,109,111,
+    100,117,108,101,32,115,101,97,114,99,104,32,112,97,116,104,
+    115,32,102,111,114,32,116,104,105,114,100,45,112,97,114,116,
+    121,32,112,97,99,107,97,103,101,115,32,116,111,32,115,121,
+    115,46,112,97,116,104,46,10,10,42,42,42,42,42,42,42,
+    42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,
+    42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,
+    42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,
+    42,42,42,42,42,42,42,42,42,10,42,32,84,104,105,115,
+    32,109,111,100,117,108,101,32,105,115,32,97,117,116,111,109,
+    97,116,105,99,97,108,108,121,32,105,109,112,111,114,116,101,
+    100,32,100,117,114,105,110,103,32,105,110,105,116,105,97,108,
+    105,122,97,116,105,111,110,46,32,42,10,42,42,42,42,42,
+    42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,
+    42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,
+    42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,
+    42,42,42,42,42,42,42,42,42,42,42,10,10,84,104,105,
+    115,32,119,105,108,108,32,97,112,112,101,110,100,32,115,105,
+    116,101,45,115,112,101,99,105,102,105,99,32,112,97,116,104,
+    115,32,116,111,32,116,104,101,32,109,111,100,117,108,101,32,
+    115,101,97,114,99,104,32,112,97,116,104,46,32,32,79,110,
+    10,85,110,105,120,32,40,105,110,99,108,117,100,105,110,103,
+    32,77,97,99,32,79,83,88,41,44,32,105,116,32,115,116,
+    97,114,116,115,32,119,105,116,104,32,115,121,115,46,112,114,
+    101,102,105,120,32,97,110,100,10,115,121,115,46,101,120,101,
+    99,95,112,114,101,102,105,120,32,40,105,102,32,100,105,102,
+    102,101,114,101,110,116,41,32,97,110,100,32,97,112,112,101,
+    110,100,115,10,108,105,98,47,112,121,116,104,111,110,60,118,
+    101,114,115,105,111,110,62,47,115,105,116,101,45,112,97,99,
+    107,97,103,101,115,46,10,79,110,32,111,116,104,101,114,32,
+    112,108,97,116,102,111,114,109,115,32,40,115,117,99,104,32,
+    97,115,32,87,105,110,100,111,119,115,41,44,32,105,116,32,
+    116,114,105,101,115,32,101,97,99,104,32,111,102,32,116,104,
+    101,10,112,114,101,102,105,120,101,115,32,100,105,114,101,99,
+    116,108,121,44,32,97,115,32,119,101,108,108,32,97,115,32,
+    119,105,116,104,32,108,105,98,47,115,105,116,101,45,112,97,
+    99,107,97,103,101,115,32,97,112,112,101,110,100,101,100,46,
+    32,32,84,104,101,10,114,101,115,117,108,116,105,110,103,32,
+    100,105,114,101,99,116,111,114,105,101,115,44,32,105,102,32,
+    116,104,101,121,32,101,120,105,115,116,44,32,97,114,101,32,
+    97,112,112,101,110,100,101,100,32,116,111,32,115,121,115,46,
+    112,97,116,104,44,32,97,110,100,10,97,108,115,111,32,105,
+    110,115,112,101,99,116,101,100,32,102,111,114,32,112,97,116,
+    104,32,99,111,110,102,105,103,117,114,97,116,105,111,110,32,
+    102,105,108,101,115,46,10,10,73,102,32,97,32,102,105,108,
+    101,32,110,97,109,101,100,32,34,112,121,118,101,110,118,46,
+    99,102,103,34,32,101,120,105,115,116,115,32,111,110,101,32,
+    100,105,114,101,99,116,111,114,121,32,97,98,111,118,101,32,
+    115,121,115,46,101,120,101,99,117,116,97,98,108,101,44,10,
+    115,121,115,46,112,114,101,102,105,120,32,97,110,100,32,115,
+    121,115,46,101,120,101,99,95,112,114,101,102,105,120,32,97,
+    114,101,32,115,101,116,32,116,111,32,116,104,97,116,32,100,
+    105,114,101,99,116,111,114,121,32,97,110,100,10,105,116,32,
+    105,115,32,97,108,115,111,32,99,104,101,99,107,101,100,32,
+    102,111,114,32,115,105,116,101,45,112,97,99,107,97,103,101,
+    115,32,40,115,121,115,46,98,97,115,101,95,112,114,101,102,
+    105,120,32,97,110,100,10,115,121,115,46,98,97,115,101,95,
+    101,120,101,99,95,112,114,101,102,105,120,32,119,105,108,108,
+    32,97,108,119,97,121,115,32,98,101,32,116,104,101,32,34,
+    114,101,97,108,34,32,112,114,101,102,105,120,101,115,32,111,
+    102,32,116,104,101,32,80,121,116,104,111,110,10,105,110,115,
+    116,97,108,108,97,116,105,111,110,41,46,32,73,102,32,34,
+    112,121,118,101,110,118,46,99,102,103,34,32,40,97,32,98,
+    111,111,116,115,116,114,97,112,32,99,111,110,102,105,103,117,
+    114,97,116,105,111,110,32,102,105,108,101,41,32,99,111,110,
+    116,97,105,110,115,10,116,104,101,32,107,101,121,32,34,105,
+    110,99,108,117,100,101,45,115,121,115,116,101,109,45,115,105,
+    116,101,45,112,97,99,107,97,103,101,115,34,32,115,101,116,
+    32,116,111,32,97,110,121,116,104,105,110,103,32,111,116,104,
+    101,114,32,116,104,97,110,32,34,102,97,108,115,101,34,10,
+    40,99,97,115,101,45,105,110,115,101,110,115,105,116,105,118,
+    101,41,44,32,116,104,101,32,115,121,115,116,101,109,45,108,
+    101,118,101,108,32,112,114,101,102,105,120,101,115,32,119,105,
+    108,108,32,115,116,105,108,108,32,97,108,115,111,32,98,101,
+    10,115,101,97,114,99,104,101,100,32,102,111,114,32,115,105,
+    116,101,45,112,97,99,107,97,103,101,115,59,32,111,116,104,
+    101,114,119,105,115,101,32,116,104,101,121,32,119,111,110,39,
+    116,46,10,10,65,108,108,32,111,102,32,116,104,101,32,114,
+    101,115,117,108,116,105,110,103,32,115,105,116,101,45,115,112,
+    101,99,105,102,105,99,32,100,105,114,101,99,116,111,114,105,
+    101,115,44,32,105,102,32,116,104,101,121,32,101,120,105,115,
+    116,44,32,97,114,101,10,97,112,112,101,110,100,101,100,32,
+    116,111,32,115,121,115,46,112,97,116,104,44,32,97,110,100,
+    32,97,108,115,111,32,105,110,115,112,101,99,116,101,100,32,
+    102,111,114,32,112,97,116,104,32,99,111,110,102,105,103,117,
+    114,97,116,105,111,110,10,102,105,108,101,115,46,10,10,65,
+    32,112,97,116,104,32,99,111,110,102,105,103,117,114,97,116,
+    105,111,110,32,102,105,108,101,32,105,115,32,97,32,102,105,
+    108,101,32,119,104,111,115,101,32,110,97,109,101,32,104,97,
+    115,32,116,104,101,32,102,111,114,109,10,60,112,97,99,107,
+    97,103,101,62,46,112,116,104,59,32,105,116,115,32,99,111,
+    110,116,101,110,116,115,32,97,114,101,32,97,100,100,105,116,
+    105,111,110,97,108,32,100,105,114,101,99,116,111,114,105,101,
+    115,32,40,111,110,101,32,112,101,114,32,108,105,110,101,41,
+    10,116,111,32,98,101,32,97,100,100,101,100,32,116,111,32,
+    115,121,115,46,112,97,116,104,46,32,32,78,111,110,45,101,
+    120,105,115,116,105,110,103,32,100,105,114,101,99,116,111,114,
+    105,101,115,32,40,111,114,10,110,111,110,45,100,105,114,101,
+    99,116,111,114,105,101,115,41,32,97,114,101,32,110,101,118,
+    101,114,32,97,100,100,101,100,32,116,111,32,115,121,115,46,
+    112,97,116,104,59,32,110,111,32,100,105,114,101,99,116,111,
+    114,121,32,105,115,32,97,100,100,101,100,32,116,111,10,115,
+    121,115,46,112,97,116,104,32,109,111,114,101,32,116,104,97,
+    110,32,111,110,99,101,46,32,32,66,108,97,110,107,32,108,
+    105,110,101,115,32,97,110,100,32,108,105,110,101,115,32,98,
+    101,103,105,110,110,105,110,103,32,119,105,116,104,10,39,35,
+    39,32,97,114,101,32,115,107,105,112,112,101,100,46,32,76,
+    105,110,101,115,32,115,116,97,114,116,105,110,103,32,119,105,
+    116,104,32,39,105,109,112,111,114,116,39,32,97,114,101,32,
+    101,120,101,99,117,116,101,100,46,10,10,70,111,114,32,101,
+    120,97,109,112,108,101,44,32,115,117,112,112,111,115,101,32,
+    115,121,115,46,112,114,101,102,105,120,32,97,110,100,32,115,
+    121,115,46,101,120,101,99,95,112,114,101,102,105,120,32,97,
+    114,101,32,115,101,116,32,116,111,10,47,117,115,114,47,108,
+    111,99,97,108,32,97,110,100,32,116,104,101,114,101,32,105,
+    115,32,97,32,100,105,114,101,99,116,111,114,121,32,47,117,
+    115,114,47,108,111,99,97,108,47,108,105,98,47,112,121,116,
+    104,111,110,50,46,53,47,115,105,116,101,45,112,97,99,107,
+    97,103,101,115,10,119,105,116,104,32,116,104,114,101,101,32,
+    115,117,98,100,105,114,101,99,116,111,114,105,101,115,44,32,
+    102,111,111,44,32,98,97,114,32,97,110,100,32,115,112,97,
+    109,44,32,97,110,100,32,116,119,111,32,112,97,116,104,10,
+    99,111,110,102,105,103,117,114,97,116,105,111,110,32,102,105,
+    108,101,115,44,32,102,111,111,46,112,116,104,32,97,110,100,
+    32,98,97,114,46,112,116,104,46,32,32,65,115,115,117,109,
+    101,32,102,111,111,46,112,116,104,32,99,111,110,116,97,105,
+    110,115,32,116,104,101,10,102,111,108,108,111,119,105,110,103,
+    58,10,10,32,32,35,32,102,111,111,32,112,97,99,107,97,
+    103,101,32,99,111,110,102,105,103,117,114,97,116,105,111,110,
+    10,32,32,102,111,111,10,32,32,98,97,114,10,32,32,98,
+    108,101,116,99,104,10,10,97,110,100,32,98,97,114,46,112,
+    116,104,32,99,111,110,116,97,105,110,115,58,10,10,32,32,
+    35,32,98,97,114,32,112,97,99,107,97,103,101,32,99,111,
+    110,102,105,103,117,114,97,116,105,111,110,10,32,32,98,97,
+    114,10,10,84,104,101,110,32,116,104,101,32,102,111,108,108,
+    111,119,105,110,103,32,100,105,114,101,99,116,111,114,105,101,
+    115,32,97,114,101,32,97,100,100,101,100,32,116,111,32,115,
+    121,115,46,112,97,116,104,44,32,105,110,32,116,104,105,115,
+    32,111,114,100,101,114,58,10,10,32,32,47,117,115,114,47,
+    108,111,99,97,108,47,108,105,98,47,112,121,116,104,111,110,
+    50,46,53,47,115,105,116,101,45,112,97,99,107,97,103,101,
+    115,47,98,97,114,10,32,32,47,117,115,114,47,108,111,99,
+    97,108,47,108,105,98,47,112,121,116,104,111,110,50,46,53,
+    47,115,105,116,101,45,112,97,99,107,97,103,101,115,47,102,
+    111,111,10,10,78,111,116,101,32,116,104,97,116,32,98,108,
+    101,116,99,104,32,105,115,32,111,109,105,116,116,101,100,32,
+    98,101,99,97,117,115,101,32,105,116,32,100,111,101,115,110,
+    39,116,32,101,120,105,115,116,59,32,98,97,114,32,112,114,
+    101,99,101,100,101,115,32,102,111,111,10,98,101,99,97,117,
+    115,101,32,98,97,114,46,112,116,104,32,99,111,109,101,115,
+    32,97,108,112,104,97,98,101,116,105,99,97,108,108,121,32,
+    98,101,102,111,114,101,32,102,111,111,46,112,116,104,59,32,
+    97,110,100,32,115,112,97,109,32,105,115,10,111,109,105,116,
+    116,101,100,32,98,101,99,97,117,115,101,32,105,116,32,105,
+    115,32,110,111,116,32,109,101,110,116,105,111,110,101,100,32,
+    105,110,32,101,105,116,104,101,114,32,112,97,116,104,32,99,
+    111,110,102,105,103,117,114,97,116,105,111,110,32,102,105,108,
+    101,46,10,10,84,104,101,32,114,101,97,100,108,105,110,101,
+    32,109,111,100,117,108,101,32,105,115,32,97,108,115,111,32,
+    97,117,116,111,109,97,116,105,99,97,108,108,121,32,99,111,
+    110,102,105,103,117,114,101,100,32,116,111,32,101,110,97,98,
+    108,101,10,99,111,109,112,108,101,116,105,111,110,32,102,111,
+    114,32,115,121,115,116,101,109,115,32,116,104,97,116,32,115,
+    117,112,112,111,114,116,32,105,116,46,32,32,84,104,105,115,
+    32,99,97,110,32,98,101,32,111,118,101,114,114,105,100,100,
+    101,110,32,105,110,10,115,105,116,101,99,117,115,116,111,109,
+    105,122,101,44,32,117,115,101,114,99,117,115,116,111,109,105,
+    122,101,32,111,114,32,80,89,84,72,79,78,83,84,65,82,
+    84,85,80,46,32,32,83,116,97,114,116,105,110,103,32,80,
+    121,116,104,111,110,32,105,110,10,105,115,111,108,97,116,101,
+    100,32,109,111,100,101,32,40,45,73,41,32,100,105,115,97,
+    98,108,101,115,32,97,117,116,111,109,97,116,105,99,32,114,
+    101,97,100,108,105,110,101,32,99,111,110,102,105,103,117,114,
+    97,116,105,111,110,46,10,10,65,102,116,101,114,32,116,104,
+    101,115,101,32,111,112,101,114,97,116,105,111,110,115,44,32,
+    97,110,32,97,116,116,101,109,112,116,32,105,115,32,109,97,
+    100,101,32,116,111,32,105,109,112,111,114,116,32,97,32,109,
+    111,100,117,108,101,10,110,97,109,101,100,32,115,105,116,101,
+    99,117,115,116,111,109,105,122,101,44,32,119,104,105,99,104,
+    32,99,97,110,32,112,101,114,102,111,114,109,32,97,114,98,
+    105,116,114,97,114,121,32,97,100,100,105,116,105,111,110,97,
+    108,10,115,105,116,101,45,115,112,101,99,105,102,105,99,32,
+    99,117,115,116,111,109,105,122,97,116,105,111,110,115,46,32,
+    32,73,102,32,116,104,105,115,32,105,109,112,111,114,116,32,
+    102,97,105,108,115,32,119,105,116,104,32,97,110,10,73,109,
+    112,111,114,116,69,114,114,111,114,32,101,120,99,101,112,116,
+    105,111,110,44,32,105,116,32,105,115,32,115,105,108,101,110,
+    116,108,121,32,105,103,110,111,114,101,100,46,10,233,0,0,
+    0,0,78,99,0,0,0,0,0,0,0,0,2,0,0,0,
+    13,0,0,0,71,0,0,0,115,66,0,0,0,116,0,106,
+    1,106,2,124,0,142,0,125,1,121,16,116,0,106,1,160,
+    3,124,1,161,1,125,1,87,0,110,20,4,0,116,4,107,
+    10,114,48,1,0,1,0,1,0,89,0,110,2,88,0,124,
+    1,116,0,106,1,160,5,124,1,161,1,102,2,83,0,41,
+    1,78,41,6,218,2,111,115,218,4,112,97,116,104,218,4,
+    106,111,105,110,218,7,97,98,115,112,97,116,104,218,7,79,
+    83,69,114,114,111,114,90,8,110,111,114,109,99,97,115,101,
+    41,2,90,5,112,97,116,104,115,218,3,100,105,114,169,0,
+    114,7,0,0,0,250,16,60,115,116,100,108,105,98,62,47,
+    115,105,116,101,46,112,121,218,8,109,97,107,101,112,97,116,
+    104,90,0,0,0,115,12,0,0,0,0,1,12,1,2,1,
+    16,1,14,1,6,1,114,9,0,0,0,99,0,0,0,0,
+    0,0,0,0,1,0,0,0,21,0,0,0,67,0,0,0,
+    115,146,0,0,0,120,140,116,0,116,1,106,2,160,3,161,
+    0,131,1,68,0,93,122,125,0,116,4,116,4,124,0,100,
+    1,100,2,131,3,100,3,100,2,131,3,100,6,107,7,114,
+    46,113,16,121,20,116,5,106,6,160,7,124,0,106,8,161,
+    1,124,0,95,8,87,0,110,24,4,0,116,9,116,10,102,
+    2,107,10,114,90,1,0,1,0,1,0,89,0,110,2,88,
+    0,121,20,116,5,106,6,160,7,124,0,106,11,161,1,124,
+    0,95,11,87,0,113,16,4,0,116,9,116,10,102,2,107,
+    10,114,136,1,0,1,0,1,0,89,0,113,16,88,0,113,
+    16,87,0,100,2,83,0,41,7,122,69,83,101,116,32,97,
+    108,108,32,109,111,100,117,108,101,32,95,95,102,105,108,101,
+    95,95,32,97,110,100,32,95,95,99,97,99,104,101,100,95,
+    95,32,97,116,116,114,105,98,117,116,101,115,32,116,111,32,
+    97,110,32,97,98,115,111,108,117,116,101,32,112,97,116,104,
+    218,10,95,95,108,111,97,100,101,114,95,95,78,218,10,95,
+    95,109,111,100,117,108,101,95,95,218,17,95,102,114,111,122,
+    101,110,95,105,109,112,111,114,116,108,105,98,218,26,95,102,
+    114,111,122,101,110,95,105,109,112,111,114,116,108,105,98,95,
+    101,120,116,101,114,110,97,108,41,2,114,12,0,0,0,114,
+    13,0,0,0,41,12,218,3,115,101,116,218,3,115,121,115,
+    218,7,109,111,100,117,108,101,115,218,6,118,97,108,117,101,
+    115,218,7,103,101,116,97,116,116,114,114,1,0,0,0,114,
+    2,0,0,0,114,4,0,0,0,218,8,95,95,102,105,108,
+    101,95,95,218,14,65,116,116,114,105,98,117,116,101,69,114,
+    114,111,114,114,5,0,0,0,90,10,95,95,99,97,99,104,
+    101,100,95,95,41,1,218,1,109,114,7,0,0,0,114,7,
+    0,0,0,114,8,0,0,0,218,9,97,98,115,95,112,97,
+    116,104,115,99,0,0,0,115,24,0,0,0,0,2,20,1,
+    18,1,6,1,2,1,2,1,20,1,18,1,6,1,2,1,
+    20,1,18,1,114,22,0,0,0,99,0,0,0,0,0,0,
+    0,0,4,0,0,0,4,0,0,0,67,0,0,0,115,84,
+    0,0,0,103,0,125,0,116,0,131,0,125,1,120,54,116,
+    1,106,2,68,0,93,44,125,2,116,3,124,2,131,1,92,
+    2,125,2,125,3,124,3,124,1,107,7,114,18,124,0,160,
+    4,124,2,161,1,1,0,124,1,160,5,124,3,161,1,1,
+    0,113,18,87,0,124,0,116,1,106,2,100,1,100,1,133,
+    2,60,0,124,1,83,0,41,2,122,75,32,82,101,109,111,
+    118,101,32,100,117,112,108,105,99,97,116,101,32,101,110,116,
+    114,105,101,115,32,102,114,111,109,32,115,121,115,46,112,97,
+    116,104,32,97,108,111,110,103,32,119,105,116,104,32,109,97,
+    107,105,110,103,32,116,104,101,109,10,32,32,32,32,97,98,
+    115,111,108,117,116,101,78,41,6,114,14,0,0,0,114,15,
+    0,0,0,114,2,0,0,0,114,9,0,0,0,218,6,97,
+    112,112,101,110,100,218,3,97,100,100,41,4,218,1,76,218,
+    11,107,110,111,119,110,95,112,97,116,104,115,114,6,0,0,
+    0,218,7,100,105,114,99,97,115,101,114,7,0,0,0,114,
+    7,0,0,0,114,8,0,0,0,218,14,114,101,109,111,118,
+    101,100,117,112,112,97,116,104,115,115,0,0,0,115,18,0,
+    0,0,0,5,4,1,6,1,12,4,12,1,8,1,10,1,
+    14,1,14,1,114,28,0,0,0,99,0,0,0,0,0,0,
+    0,0,4,0,0,0,12,0,0,0,67,0,0,0,115,88,
+    0,0,0,116,0,131,0,125,0,120,76,116,1,106,2,68,
+    0,93,66,125,1,121,38,116,3,106,2,160,4,124,1,161,
+    1,114,54,116,5,124,1,131,1,92,2,125,2,125,3,124,
+    0,160,6,124,3,161,1,1,0,87,0,113,14,4,0,116,
+    7,107,10,114,78,1,0,1,0,1,0,119,14,89,0,113,
+    14,88,0,113,14,87,0,124,0,83,0,41,1,122,69,82,
+    101,116,117,114,110,32,97,32,115,101,116,32,99,111,110,116,
+    97,105,110,105,110,103,32,97,108,108,32,101,120,105,115,116,
+    105,110,103,32,102,105,108,101,32,115,121,115,116,101,109,32,
+    105,116,101,109,115,32,102,114,111,109,32,115,121,115,46,112,
+    97,116,104,46,41,8,114,14,0,0,0,114,15,0,0,0,
+    114,2,0,0,0,114,1,0,0,0,218,6,101,120,105,115,
+    116,115,114,9,0,0,0,114,24,0,0,0,218,9,84,121,
+    112,101,69,114,114,111,114,41,4,218,1,100,90,4,105,116,
+    101,109,218,1,95,90,8,105,116,101,109,99,97,115,101,114,
+    7,0,0,0,114,7,0,0,0,114,8,0,0,0,218,14,
+    95,105,110,105,116,95,112,97,116,104,105,110,102,111,134,0,
+    0,0,115,18,0,0,0,0,2,6,1,12,1,2,1,12,
+    1,12,1,14,1,14,1,12,1,114,33,0,0,0,99,3,
+    0,0,0,0,0,0,0,12,0,0,0,29,0,0,0,67,
+    0,0,0,115,112,1,0,0,124,2,100,1,107,8,114,20,
+    116,0,131,0,125,2,100,2,125,3,110,4,100,3,125,3,
+    116,1,106,2,160,3,124,0,124,1,161,2,125,4,121,14,
+    116,4,124,4,100,4,131,2,125,5,87,0,110,20,4,0,
+    116,5,107,10,114,72,1,0,1,0,1,0,100,1,83,0,
+    88,0,124,5,144,1,143,12,1,0,144,1,120,2,116,6,
+    124,5,131,1,68,0,93,246,92,2,125,6,125,7,124,7,
+    160,7,100,5,161,1,114,114,113,94,121,88,124,7,160,7,
+    100,14,161,1,114,136,116,8,124,7,131,1,1,0,119,94,
+    124,7,160,9,161,0,125,7,116,10,124,0,124,7,131,2,
+    92,2,125,8,125,9,124,9,124,2,107,7,114,200,116,1,
+    106,2,160,11,124,8,161,1,114,200,116,12,106,2,160,13,
+    124,8,161,1,1,0,124,2,160,14,124,9,161,1,1,0,
+    87,0,113,94,4,0,116,15,107,10,144,1,114,82,1,0,
+    1,0,1,0,116,16,100,8,160,17,124,6,100,9,23,0,
+    124,4,161,2,116,12,106,18,100,10,141,2,1,0,100,11,
+    100,1,108,19,125,10,120,62,124,10,106,20,116,12,160,21,
+    161,0,142,0,68,0,93,44,125,11,120,36,124,11,160,22,
+    161,0,68,0,93,24,125,7,116,16,100,12,124,7,23,0,
+    116,12,106,18,100,10,141,2,1,0,144,1,113,28,87,0,
+    144,1,113,14,87,0,116,16,100,13,116,12,106,18,100,10,
+    141,2,1,0,80,0,89,0,113,94,88,0,113,94,87,0,
+    87,0,100,1,81,0,82,0,88,0,124,3,144,1,114,108,
+    100,1,125,2,124,2,83,0,41,15,122,214,80,114,111,99,
+    101,115,115,32,97,32,46,112,116,104,32,102,105,108,101,32,
+    119,105,116,104,105,110,32,116,104,101,32,115,105,116,101,45,
+    112,97,99,107,97,103,101,115,32,100,105,114,101,99,116,111,
+    114,121,58,10,32,32,32,32,32,32,32,70,111,114,32,101,
+    97,99,104,32,108,105,110,101,32,105,110,32,116,104,101,32,
+    102,105,108,101,44,32,101,105,116,104,101,114,32,99,111,109,
+    98,105,110,101,32,105,116,32,119,105,116,104,32,115,105,116,
+    101,100,105,114,32,116,111,32,97,32,112,97,116,104,10,32,
+    32,32,32,32,32,32,97,110,100,32,97,100,100,32,116,104,
+    97,116,32,116,111,32,107,110,111,119,110,95,112,97,116,104,
+    115,44,32,111,114,32,101,120,101,99,117,116,101,32,105,116,
+    32,105,102,32,105,116,32,115,116,97,114,116,115,32,119,105,
+    116,104,32,39,105,109,112,111,114,116,32,39,46,10,32,32,
+    32,32,78,84,70,218,1,114,250,1,35,250,7,105,109,112,
+    111,114,116,32,250,7,105,109,112,111,114,116,9,122,34,69,
+    114,114,111,114,32,112,114,111,99,101,115,115,105,110,103,32,
+    108,105,110,101,32,123,58,100,125,32,111,102,32,123,125,58,
+    10,233,1,0,0,0,41,1,90,4,102,105,108,101,114,0,
+    0,0,0,122,2,32,32,122,26,10,82,101,109,97,105,110,
+    100,101,114,32,111,102,32,102,105,108,101,32,105,103,110,111,
+    114,101,100,41,2,114,36,0,0,0,114,37,0,0,0,41,
+    23,114,33,0,0,0,114,1,0,0,0,114,2,0,0,0,
+    114,3,0,0,0,218,4,111,112,101,110,114,5,0,0,0,
+    218,9,101,110,117,109,101,114,97,116,101,218,10,115,116,97,
+    114,116,115,119,105,116,104,218,4,101,120,101,99,218,6,114,
+    115,116,114,105,112,114,9,0,0,0,114,29,0,0,0,114,
+    15,0,0,0,114,23,0,0,0,114,24,0,0,0,218,9,
+    69,120,99,101,112,116,105,111,110,218,5,112,114,105,110,116,
+    218,6,102,111,114,109,97,116,218,6,115,116,100,101,114,114,
+    218,9,116,114,97,99,101,98,97,99,107,90,16,102,111,114,
+    109,97,116,95,101,120,99,101,112,116,105,111,110,218,8,101,
+    120,99,95,105,110,102,111,218,10,115,112,108,105,116,108,105,
+    110,101,115,41,12,218,7,115,105,116,101,100,105,114,218,4,
+    110,97,109,101,114,26,0,0,0,218,5,114,101,115,101,116,
+    90,8,102,117,108,108,110,97,109,101,218,1,102,218,1,110,
+    218,4,108,105,110,101,114,6,0,0,0,114,27,0,0,0,
+    114,48,0,0,0,90,6,114,101,99,111,114,100,114,7,0,
+    0,0,114,7,0,0,0,114,8,0,0,0,218,10,97,100,
+    100,112,97,99,107,97,103,101,147,0,0,0,115,68,0,0,
+    0,0,5,8,1,6,1,6,2,4,1,14,1,2,1,14,
+    1,14,1,6,1,8,1,20,1,10,1,2,1,2,1,10,
+    1,8,1,2,1,8,1,14,1,20,1,12,1,14,1,16,
+    1,16,1,10,1,8,1,20,1,14,1,30,1,14,1,22,
+    1,6,1,4,1,114,57,0,0,0,99,2,0,0,0,0,
+    0,0,0,6,0,0,0,13,0,0,0,67,0,0,0,115,
+    158,0,0,0,124,1,100,1,107,8,114,20,116,0,131,0,
+    125,1,100,2,125,2,110,4,100,3,125,2,116,1,124,0,
+    131,1,92,2,125,0,125,3,124,3,124,1,107,7,114,66,
+    116,2,106,3,160,4,124,0,161,1,1,0,124,1,160,5,
+    124,3,161,1,1,0,121,14,116,6,160,7,124,0,161,1,
+    125,4,87,0,110,20,4,0,116,8,107,10,114,100,1,0,
+    1,0,1,0,100,1,83,0,88,0,100,4,100,5,132,0,
+    124,4,68,0,131,1,125,4,120,28,116,9,124,4,131,1,
+    68,0,93,16,125,5,116,10,124,0,124,5,124,1,131,3,
+    1,0,113,126,87,0,124,2,114,154,100,1,125,1,124,1,
+    83,0,41,6,122,84,65,100,100,32,39,115,105,116,101,100,
+    105,114,39,32,97,114,103,117,109,101,110,116,32,116,111,32,
+    115,121,115,46,112,97,116,104,32,105,102,32,109,105,115,115,
+    105,110,103,32,97,110,100,32,104,97,110,100,108,101,32,46,
+    112,116,104,32,102,105,108,101,115,32,105,110,10,32,32,32,
+    32,39,115,105,116,101,100,105,114,39,78,84,70,99,1,0,
+    0,0,0,0,0,0,2,0,0,0,5,0,0,0,83,0,
+    0,0,115,26,0,0,0,103,0,124,0,93,18,125,1,124,
+    1,160,0,100,0,161,1,114,4,124,1,145,2,113,4,83,
+    0,41,1,122,4,46,112,116,104,41,1,218,8,101,110,100,
+    115,119,105,116,104,41,2,218,2,46,48,114,52,0,0,0,
+    114,7,0,0,0,114,7,0,0,0,114,8,0,0,0,250,
+    10,60,108,105,115,116,99,111,109,112,62,205,0,0,0,115,
+    2,0,0,0,6,0,122,30,97,100,100,115,105,116,101,100,
+    105,114,46,60,108,111,99,97,108,115,62,46,60,108,105,115,
+    116,99,111,109,112,62,41,11,114,33,0,0,0,114,9,0,
+    0,0,114,15,0,0,0,114,2,0,0,0,114,23,0,0,
+    0,114,24,0,0,0,114,1,0,0,0,90,7,108,105,115,
+    116,100,105,114,114,5,0,0,0,218,6,115,111,114,116,101,
+    100,114,57,0,0,0,41,6,114,51,0,0,0,114,26,0,
+    0,0,114,53,0,0,0,90,11,115,105,116,101,100,105,114,
+    99,97,115,101,90,5,110,97,109,101,115,114,52,0,0,0,
+    114,7,0,0,0,114,7,0,0,0,114,8,0,0,0,218,
+    10,97,100,100,115,105,116,101,100,105,114,189,0,0,0,115,
+    36,0,0,0,0,3,8,1,6,1,6,2,4,1,12,1,
+    8,1,12,1,10,1,2,1,14,1,14,1,6,1,14,1,
+    14,1,16,1,4,1,4,1,114,62,0,0,0,99,0,0,
+    0,0,0,0,0,0,0,0,0,0,3,0,0,0,67,0,
+    0,0,115,96,0,0,0,116,0,106,1,106,2,114,12,100,
+    1,83,0,116,3,116,4,100,2,131,2,114,52,116,3,116,
+    4,100,3,131,2,114,52,116,4,160,5,161,0,116,4,160,
+    6,161,0,107,3,114,52,100,4,83,0,116,3,116,4,100,
+    5,131,2,114,92,116,3,116,4,100,6,131,2,114,92,116,
+    4,160,7,161,0,116,4,160,8,161,0,107,3,114,92,100,
+    4,83,0,100,7,83,0,41,8,97,44,1,0,0,67,104,
+    101,99,107,32,105,102,32,117,115,101,114,32,115,105,116,101,
+    32,100,105,114,101,99,116,111,114,121,32,105,115,32,115,97,
+    102,101,32,102,111,114,32,105,110,99,108,117,115,105,111,110,
+    10,10,32,32,32,32,84,104,101,32,102,117,110,99,116,105,
+    111,110,32,116,101,115,116,115,32,102,111,114,32,116,104,101,
+    32,99,111,109,109,97,110,100,32,108,105,110,101,32,102,108,
+    97,103,32,40,105,110,99,108,117,100,105,110,103,32,101,110,
+    118,105,114,111,110,109,101,110,116,32,118,97,114,41,44,10,
+    32,32,32,32,112,114,111,99,101,115,115,32,117,105,100,47,
+    103,105,100,32,101,113,117,97,108,32,116,111,32,101,102,102,
+    101,99,116,105,118,101,32,117,105,100,47,103,105,100,46,10,
+    10,32,32,32,32,78,111,110,101,58,32,68,105,115,97,98,
+    108,101,100,32,102,111,114,32,115,101,99,117,114,105,116,121,
+    32,114,101,97,115,111,110,115,10,32,32,32,32,70,97,108,
+    115,101,58,32,68,105,115,97,98,108,101,100,32,98,121,32,
+    117,115,101,114,32,40,99,111,109,109,97,110,100,32,108,105,
+    110,101,32,111,112,116,105,111,110,41,10,32,32,32,32,84,
+    114,117,101,58,32,83,97,102,101,32,97,110,100,32,101,110,
+    97,98,108,101,100,10,32,32,32,32,70,218,6,103,101,116,
+    117,105,100,218,7,103,101,116,101,117,105,100,78,218,6,103,
+    101,116,103,105,100,218,7,103,101,116,101,103,105,100,84,41,
+    9,114,15,0,0,0,218,5,102,108,97,103,115,218,12,110,
+    111,95,117,115,101,114,95,115,105,116,101,218,7,104,97,115,
+    97,116,116,114,114,1,0,0,0,114,64,0,0,0,114,63,
+    0,0,0,114,66,0,0,0,114,65,0,0,0,114,7,0,
+    0,0,114,7,0,0,0,114,7,0,0,0,114,8,0,0,
+    0,218,20,99,104,101,99,107,95,101,110,97,98,108,101,117,
+    115,101,114,115,105,116,101,213,0,0,0,115,18,0,0,0,
+    0,10,8,1,4,2,20,2,16,1,4,1,20,2,16,1,
+    4,2,114,70,0,0,0,99,0,0,0,0,0,0,0,0,
+    1,0,0,0,2,0,0,0,67,0,0,0,115,36,0,0,
+    0,116,0,100,1,107,9,114,12,116,0,83,0,100,2,100,
+    3,108,1,109,2,125,0,1,0,124,0,100,4,131,1,97,
+    0,116,0,83,0,41,5,122,203,82,101,116,117,114,110,115,
+    32,116,104,101,32,96,117,115,101,114,32,98,97,115,101,96,
+    32,100,105,114,101,99,116,111,114,121,32,112,97,116,104,46,
+    10,10,32,32,32,32,84,104,101,32,96,117,115,101,114,32,
+    98,97,115,101,96,32,100,105,114,101,99,116,111,114,121,32,
+    99,97,110,32,98,101,32,117,115,101,100,32,116,111,32,115,
+    116,111,114,101,32,100,97,116,97,46,32,73,102,32,116,104,
+    101,32,103,108,111,98,97,108,10,32,32,32,32,118,97,114,
+    105,97,98,108,101,32,96,96,85,83,69,82,95,66,65,83,
+    69,96,96,32,105,115,32,110,111,116,32,105,110,105,116,105,
+    97,108,105,122,101,100,32,121,101,116,44,32,116,104,105,115,
+    32,102,117,110,99,116,105,111,110,32,119,105,108,108,32,97,
+    108,115,111,32,115,101,116,10,32,32,32,32,105,116,46,10,
+    32,32,32,32,78,114,0,0,0,0,41,1,218,14,103,101,
+    116,95,99,111,110,102,105,103,95,118,97,114,90,8,117,115,
+    101,114,98,97,115,101,41,3,218,9,85,83,69,82,95,66,
+    65,83,69,218,9,115,121,115,99,111,110,102,105,103,114,71,
+    0,0,0,41,1,114,71,0,0,0,114,7,0,0,0,114,
+    7,0,0,0,114,8,0,0,0,218,11,103,101,116,117,115,
+    101,114,98,97,115,101,237,0,0,0,115,10,0,0,0,0,
+    8,8,1,4,1,12,1,8,1,114,74,0,0,0,99,0,
+    0,0,0,0,0,0,0,3,0,0,0,4,0,0,0,67,
+    0,0,0,115,94,0,0,0,116,0,131,0,125,0,116,1,
+    100,1,107,9,114,18,116,1,83,0,100,2,100,3,108,2,
+    109,3,125,1,1,0,116,4,106,5,100,4,107,2,114,74,
+    100,2,100,5,108,2,109,6,125,2,1,0,124,2,100,6,
+    131,1,114,74,124,1,100,7,100,8,131,2,97,1,116,1,
+    83,0,124,1,100,7,100,9,116,7,106,8,22,0,131,2,
+    97,1,116,1,83,0,41,10,122,162,82,101,116,117,114,110,
+    115,32,116,104,101,32,117,115,101,114,45,115,112,101,99,105,
+    102,105,99,32,115,105,116,101,45,112,97,99,107,97,103,101,
+    115,32,100,105,114,101,99,116,111,114,121,32,112,97,116,104,
+    46,10,10,32,32,32,32,73,102,32,116,104,101,32,103,108,
+    111,98,97,108,32,118,97,114,105,97,98,108,101,32,96,96,
+    85,83,69,82,95,83,73,84,69,96,96,32,105,115,32,110,
+    111,116,32,105,110,105,116,105,97,108,105,122,101,100,32,121,
+    101,116,44,32,116,104,105,115,10,32,32,32,32,102,117,110,
+    99,116,105,111,110,32,119,105,108,108,32,97,108,115,111,32,
+    115,101,116,32,105,116,46,10,32,32,32,32,78,114,0,0,
+    0,0,41,1,218,8,103,101,116,95,112,97,116,104,218,6,
+    100,97,114,119,105,110,41,1,114,71,0,0,0,218,15,80,
+    89,84,72,79,78,70,82,65,77,69,87,79,82,75,90,7,
+    112,117,114,101,108,105,98,90,18,111,115,120,95,102,114,97,
+    109,101,119,111,114,107,95,117,115,101,114,122,7,37,115,95,
+    117,115,101,114,41,9,114,74,0,0,0,218,9,85,83,69,
+    82,95,83,73,84,69,114,73,0,0,0,114,75,0,0,0,
+    114,15,0,0,0,218,8,112,108,97,116,102,111,114,109,114,
+    71,0,0,0,114,1,0,0,0,114,52,0,0,0,41,3,
+    218,9,117,115,101,114,95,98,97,115,101,114,75,0,0,0,
+    114,71,0,0,0,114,7,0,0,0,114,7,0,0,0,114,
+    8,0,0,0,218,19,103,101,116,117,115,101,114,115,105,116,
+    101,112,97,99,107,97,103,101,115,251,0,0,0,115,22,0,
+    0,0,0,7,6,2,8,1,4,2,12,2,10,1,12,1,
+    8,1,10,1,4,2,16,1,114,81,0,0,0,99,1,0,
+    0,0,0,0,0,0,2,0,0,0,3,0,0,0,67,0,
+    0,0,115,36,0,0,0,116,0,131,0,125,1,116,1,114,
+    32,116,2,106,3,160,4,124,1,161,1,114,32,116,5,124,
+    1,124,0,131,2,1,0,124,0,83,0,41,1,122,134,65,
+    100,100,32,97,32,112,101,114,32,117,115,101,114,32,115,105,
+    116,101,45,112,97,99,107,97,103,101,32,116,111,32,115,121,
+    115,46,112,97,116,104,10,10,32,32,32,32,69,97,99,104,
+    32,117,115,101,114,32,104,97,115,32,105,116,115,32,111,119,
+    110,32,112,121,116,104,111,110,32,100,105,114,101,99,116,111,
+    114,121,32,119,105,116,104,32,115,105,116,101,45,112,97,99,
+    107,97,103,101,115,32,105,110,32,116,104,101,10,32,32,32,
+    32,104,111,109,101,32,100,105,114,101,99,116,111,114,121,46,
+    10,32,32,32,32,41,6,114,81,0,0,0,218,16,69,78,
+    65,66,76,69,95,85,83,69,82,95,83,73,84,69,114,1,
+    0,0,0,114,2,0,0,0,218,5,105,115,100,105,114,114,
+    62,0,0,0,41,2,114,26,0,0,0,218,9,117,115,101,
+    114,95,115,105,116,101,114,7,0,0,0,114,7,0,0,0,
+    114,8,0,0,0,218,19,97,100,100,117,115,101,114,115,105,
+    116,101,112,97,99,107,97,103,101,115,18,1,0,0,115,8,
+    0,0,0,0,8,6,2,16,1,10,1,114,85,0,0,0,
+    99,1,0,0,0,0,0,0,0,6,0,0,0,11,0,0,
+    0,67,0,0,0,115,220,0,0,0,103,0,125,1,116,0,
+    131,0,125,2,124,0,100,1,107,8,114,22,116,1,125,0,
+    120,192,124,0,68,0,93,184,125,3,124,3,12,0,115,28,
+    124,3,124,2,107,6,114,48,113,28,124,2,160,2,124,3,
+    161,1,1,0,116,3,106,4,100,2,107,2,114,108,124,1,
+    160,5,116,3,106,6,160,7,124,3,100,3,100,4,116,8,
+    106,9,100,1,100,5,133,2,25,0,22,0,100,6,161,4,
+    161,1,1,0,110,32,124,1,160,5,124,3,161,1,1,0,
+    124,1,160,5,116,3,106,6,160,7,124,3,100,3,100,6,
+    161,3,161,1,1,0,116,8,106,10,100,7,107,2,114,28,
+    100,8,100,9,108,11,109,12,125,4,1,0,124,4,100,10,
+    131,1,125,5,124,5,114,28,124,1,160,5,116,3,106,6,
+    160,7,100,11,124,5,100,12,116,8,106,9,100,1,100,5,
+    133,2,25,0,22,0,100,6,161,4,161,1,1,0,113,28,
+    87,0,124,1,83,0,41,13,97,30,1,0,0,82,101,116,
+    117,114,110,115,32,97,32,108,105,115,116,32,99,111,110,116,
+    97,105,110,105,110,103,32,97,108,108,32,103,108,111,98,97,
+    108,32,115,105,116,101,45,112,97,99,107,97,103,101,115,32,
+    100,105,114,101,99,116,111,114,105,101,115,46,10,10,32,32,
+    32,32,70,111,114,32,101,97,99,104,32,100,105,114,101,99,
+    116,111,114,121,32,112,114,101,115,101,110,116,32,105,110,32,
+    96,96,112,114,101,102,105,120,101,115,96,96,32,40,111,114,
+    32,116,104,101,32,103,108,111,98,97,108,32,96,96,80,82,
+    69,70,73,88,69,83,96,96,41,44,10,32,32,32,32,116,
+    104,105,115,32,102,117,110,99,116,105,111,110,32,119,105,108,
+    108,32,102,105,110,100,32,105,116,115,32,96,115,105,116,101,
+    45,112,97,99,107,97,103,101,115,96,32,115,117,98,100,105,
+    114,101,99,116,111,114,121,32,100,101,112,101,110,100,105,110,
+    103,32,111,110,32,116,104,101,10,32,32,32,32,115,121,115,
+    116,101,109,32,101,110,118,105,114,111,110,109,101,110,116,44,
+    32,97,110,100,32,119,105,108,108,32,114,101,116,117,114,110,
+    32,97,32,108,105,115,116,32,111,102,32,102,117,108,108,32,
+    112,97,116,104,115,46,10,32,32,32,32,78,250,1,47,90,
+    3,108,105,98,122,11,112,121,116,104,111,110,37,100,46,37,
+    100,233,2,0,0,0,122,13,115,105,116,101,45,112,97,99,
+    107,97,103,101,115,114,76,0,0,0,114,0,0,0,0,41,
+    1,114,71,0,0,0,114,77,0,0,0,122,8,47,76,105,
+    98,114,97,114,121,122,5,37,100,46,37,100,41,13,114,14,
+    0,0,0,218,8,80,82,69,70,73,88,69,83,114,24,0,
+    0,0,114,1,0,0,0,218,3,115,101,112,114,23,0,0,
+    0,114,2,0,0,0,114,3,0,0,0,114,15,0,0,0,
+    218,12,118,101,114,115,105,111,110,95,105,110,102,111,114,79,
+    0,0,0,114,73,0,0,0,114,71,0,0,0,41,6,218,
+    8,112,114,101,102,105,120,101,115,90,12,115,105,116,101,112,
+    97,99,107,97,103,101,115,90,4,115,101,101,110,218,6,112,
+    114,101,102,105,120,114,71,0,0,0,90,9,102,114,97,109,
+    101,119,111,114,107,114,7,0,0,0,114,7,0,0,0,114,
+    8,0,0,0,218,15,103,101,116,115,105,116,101,112,97,99,
+    107,97,103,101,115,32,1,0,0,115,44,0,0,0,0,7,
+    4,1,6,2,8,1,4,2,10,1,14,1,2,1,10,2,
+    10,1,14,1,16,1,10,2,10,1,22,1,10,3,12,1,
+    8,1,4,1,4,1,10,1,28,1,114,93,0,0,0,99,
+    2,0,0,0,0,0,0,0,3,0,0,0,4,0,0,0,
+    67,0,0,0,115,44,0,0,0,120,38,116,0,124,1,131,
+    1,68,0,93,26,125,2,116,1,106,2,160,3,124,2,161,
+    1,114,10,116,4,124,2,124,0,131,2,1,0,113,10,87,
+    0,124,0,83,0,41,1,122,29,65,100,100,32,115,105,116,
+    101,45,112,97,99,107,97,103,101,115,32,116,111,32,115,121,
+    115,46,112,97,116,104,41,5,114,93,0,0,0,114,1,0,
+    0,0,114,2,0,0,0,114,83,0,0,0,114,62,0,0,
+    0,41,3,114,26,0,0,0,114,91,0,0,0,114,51,0,
+    0,0,114,7,0,0,0,114,7,0,0,0,114,8,0,0,
+    0,218,15,97,100,100,115,105,116,101,112,97,99,107,97,103,
+    101,115,68,1,0,0,115,8,0,0,0,0,2,14,1,12,
+    1,14,2,114,94,0,0,0,99,0,0,0,0,0,0,0,
+    0,1,0,0,0,4,0,0,0,67,0,0,0,115,52,0,
+    0,0,116,0,106,1,100,1,107,2,114,16,100,2,125,0,
+    110,4,100,3,125,0,116,2,160,3,100,4,124,0,161,2,
+    116,4,95,5,116,2,160,3,100,5,124,0,161,2,116,4,
+    95,6,100,6,83,0,41,7,122,173,68,101,102,105,110,101,
+    32,110,101,119,32,98,117,105,108,116,105,110,115,32,39,113,
+    117,105,116,39,32,97,110,100,32,39,101,120,105,116,39,46,
+    10,10,32,32,32,32,84,104,101,115,101,32,97,114,101,32,
+    111,98,106,101,99,116,115,32,119,104,105,99,104,32,109,97,
+    107,101,32,116,104,101,32,105,110,116,101,114,112,114,101,116,
+    101,114,32,101,120,105,116,32,119,104,101,110,32,99,97,108,
+    108,101,100,46,10,32,32,32,32,84,104,101,32,114,101,112,
+    114,32,111,102,32,101,97,99,104,32,111,98,106,101,99,116,
+    32,99,111,110,116,97,105,110,115,32,97,32,104,105,110,116,
+    32,97,116,32,104,111,119,32,105,116,32,119,111,114,107,115,
+    46,10,10,32,32,32,32,250,1,92,122,18,67,116,114,108,
+    45,90,32,112,108,117,115,32,82,101,116,117,114,110,122,17,
+    67,116,114,108,45,68,32,40,105,46,101,46,32,69,79,70,
+    41,218,4,113,117,105,116,218,4,101,120,105,116,78,41,7,
+    114,1,0,0,0,114,89,0,0,0,218,13,95,115,105,116,
+    101,98,117,105,108,116,105,110,115,90,7,81,117,105,116,116,
+    101,114,218,8,98,117,105,108,116,105,110,115,114,96,0,0,
+    0,114,97,0,0,0,41,1,90,3,101,111,102,114,7,0,
+    0,0,114,7,0,0,0,114,8,0,0,0,218,7,115,101,
+    116,113,117,105,116,76,1,0,0,115,10,0,0,0,0,7,
+    10,1,6,2,4,2,14,1,114,100,0,0,0,99,0,0,
+    0,0,0,0,0,0,3,0,0,0,6,0,0,0,67,0,
+    0,0,115,164,0,0,0,116,0,160,1,100,1,116,2,106,
+    3,161,2,116,4,95,3,116,2,106,5,100,2,100,3,133,
+    2,25,0,100,4,107,2,114,50,116,0,160,1,100,5,100,
+    6,161,2,116,4,95,6,110,14,116,0,160,1,100,5,100,
+    7,161,2,116,4,95,6,103,0,103,0,2,0,125,0,125,
+    1,116,7,116,8,100,8,131,2,114,142,116,8,106,9,160,
+    10,116,8,106,11,161,1,125,2,124,0,160,12,100,9,100,
+    10,103,2,161,1,1,0,124,1,160,12,116,8,106,9,160,
+    13,124,2,116,8,106,14,161,2,124,2,116,8,106,15,103,
+    3,161,1,1,0,116,0,160,1,100,11,100,12,124,0,124,
+    1,161,4,116,4,95,16,100,2,83,0,41,13,122,41,83,
+    101,116,32,39,99,111,112,121,114,105,103,104,116,39,32,97,
+    110,100,32,39,99,114,101,100,105,116,115,39,32,105,110,32,
+    98,117,105,108,116,105,110,115,218,9,99,111,112,121,114,105,
+    103,104,116,78,233,4,0,0,0,90,4,106,97,118,97,218,
+    7,99,114,101,100,105,116,115,122,63,74,121,116,104,111,110,
+    32,105,115,32,109,97,105,110,116,97,105,110,101,100,32,98,
+    121,32,116,104,101,32,74,121,116,104,111,110,32,100,101,118,
+    101,108,111,112,101,114,115,32,40,119,119,119,46,106,121,116,
+    104,111,110,46,111,114,103,41,46,122,158,32,32,32,32,84,
+    104,97,110,107,115,32,116,111,32,67,87,73,44,32,67,78,
+    82,73,44,32,66,101,79,112,101,110,46,99,111,109,44,32,
+    90,111,112,101,32,67,111,114,112,111,114,97,116,105,111,110,
+    32,97,110,100,32,97,32,99,97,115,116,32,111,102,32,116,
+    104,111,117,115,97,110,100,115,10,32,32,32,32,102,111,114,
+    32,115,117,112,112,111,114,116,105,110,103,32,80,121,116,104,
+    111,110,32,100,101,118,101,108,111,112,109,101,110,116,46,32,
+    32,83,101,101,32,119,119,119,46,112,121,116,104,111,110,46,
+    111,114,103,32,102,111,114,32,109,111,114,101,32,105,110,102,
+    111,114,109,97,116,105,111,110,46,114,19,0,0,0,122,11,
+    76,73,67,69,78,83,69,46,116,120,116,90,7,76,73,67,
+    69,78,83,69,218,7,108,105,99,101,110,115,101,122,39,83,
+    101,101,32,104,116,116,112,115,58,47,47,119,119,119,46,112,
+    121,116,104,111,110,46,111,114,103,47,112,115,102,47,108,105,
+    99,101,110,115,101,47,41,17,114,98,0,0,0,90,8,95,
+    80,114,105,110,116,101,114,114,15,0,0,0,114,101,0,0,
+    0,114,99,0,0,0,114,79,0,0,0,114,103,0,0,0,
+    114,69,0,0,0,114,1,0,0,0,114,2,0,0,0,218,
+    7,100,105,114,110,97,109,101,114,19,0,0,0,218,6,101,
+    120,116,101,110,100,114,3,0,0,0,90,6,112,97,114,100,
+    105,114,90,6,99,117,114,100,105,114,114,104,0,0,0,41,
+    3,90,5,102,105,108,101,115,90,4,100,105,114,115,90,4,
+    104,101,114,101,114,7,0,0,0,114,7,0,0,0,114,8,
+    0,0,0,218,12,115,101,116,99,111,112,121,114,105,103,104,
+    116,92,1,0,0,115,32,0,0,0,0,2,16,1,18,1,
+    4,1,2,1,10,2,6,2,8,1,10,3,10,1,14,1,
+    14,1,30,1,4,1,2,1,2,1,114,107,0,0,0,99,
+    0,0,0,0,0,0,0,0,0,0,0,0,2,0,0,0,
+    67,0,0,0,115,14,0,0,0,116,0,160,1,161,0,116,
+    2,95,3,100,0,83,0,41,1,78,41,4,114,98,0,0,
+    0,90,7,95,72,101,108,112,101,114,114,99,0,0,0,218,
+    4,104,101,108,112,114,7,0,0,0,114,7,0,0,0,114,
+    7,0,0,0,114,8,0,0,0,218,9,115,101,116,104,101,
+    108,112,101,114,116,1,0,0,115,2,0,0,0,0,1,114,
+    109,0,0,0,99,0,0,0,0,0,0,0,0,1,0,0,
+    0,2,0,0,0,67,0,0,0,115,18,0,0,0,100,1,
+    100,2,132,0,125,0,124,0,116,0,95,1,100,3,83,0,
+    41,4,97,106,1,0,0,69,110,97,98,108,101,32,100,101,
+    102,97,117,108,116,32,114,101,97,100,108,105,110,101,32,99,
+    111,110,102,105,103,117,114,97,116,105,111,110,32,111,110,32,
+    105,110,116,101,114,97,99,116,105,118,101,32,112,114,111,109,
+    112,116,115,44,32,98,121,10,32,32,32,32,114,101,103,105,
+    115,116,101,114,105,110,103,32,97,32,115,121,115,46,95,95,
+    105,110,116,101,114,97,99,116,105,118,101,104,111,111,107,95,
+    95,46,10,10,32,32,32,32,73,102,32,116,104,101,32,114,
+    101,97,100,108,105,110,101,32,109,111,100,117,108,101,32,99,
+    97,110,32,98,101,32,105,109,112,111,114,116,101,100,44,32,
+    116,104,101,32,104,111,111,107,32,119,105,108,108,32,115,101,
+    116,32,116,104,101,32,84,97,98,32,107,101,121,10,32,32,
+    32,32,97,115,32,99,111,109,112,108,101,116,105,111,110,32,
+    107,101,121,32,97,110,100,32,114,101,103,105,115,116,101,114,
+    32,126,47,46,112,121,116,104,111,110,95,104,105,115,116,111,
+    114,121,32,97,115,32,104,105,115,116,111,114,121,32,102,105,
+    108,101,46,10,32,32,32,32,84,104,105,115,32,99,97,110,
+    32,98,101,32,111,118,101,114,114,105,100,100,101,110,32,105,
+    110,32,116,104,101,32,115,105,116,101,99,117,115,116,111,109,
+    105,122,101,32,111,114,32,117,115,101,114,99,117,115,116,111,
+    109,105,122,101,32,109,111,100,117,108,101,44,10,32,32,32,
+    32,111,114,32,105,110,32,97,32,80,89,84,72,79,78,83,
+    84,65,82,84,85,80,32,102,105,108,101,46,10,32,32,32,
+    32,99,0,0,0,0,0,0,0,0,5,0,0,0,28,0,
+    0,0,83,0,0,0,115,222,0,0,0,100,1,100,0,108,
+    0,125,0,121,20,100,1,100,0,108,1,125,1,100,1,100,
+    0,108,2,125,2,87,0,110,20,4,0,116,3,107,10,114,
+    48,1,0,1,0,1,0,100,0,83,0,88,0,116,4,124,
+    1,100,2,100,3,131,3,125,3,124,3,100,0,107,9,114,
+    90,100,4,124,3,107,6,114,90,124,1,160,5,100,5,161,
+    1,1,0,110,10,124,1,160,5,100,6,161,1,1,0,121,
+    12,124,1,160,6,161,0,1,0,87,0,110,20,4,0,116,
+    7,107,10,114,132,1,0,1,0,1,0,89,0,110,2,88,
+    0,124,1,160,8,161,0,100,1,107,2,114,218,116,9,106,
+    10,160,11,116,9,106,10,160,12,100,7,161,1,100,8,161,
+    2,125,4,121,14,124,1,160,13,124,4,161,1,1,0,87,
+    0,110,20,4,0,116,14,107,10,114,202,1,0,1,0,1,
+    0,89,0,110,2,88,0,124,0,160,15,124,1,106,16,124,
+    4,161,2,1,0,100,0,83,0,41,9,78,114,0,0,0,
+    0,218,7,95,95,100,111,99,95,95,218,0,90,7,108,105,
+    98,101,100,105,116,122,19,98,105,110,100,32,94,73,32,114,
+    108,95,99,111,109,112,108,101,116,101,122,13,116,97,98,58,
+    32,99,111,109,112,108,101,116,101,250,1,126,122,15,46,112,
+    121,116,104,111,110,95,104,105,115,116,111,114,121,41,17,218,
+    6,97,116,101,120,105,116,218,8,114,101,97,100,108,105,110,
+    101,218,11,114,108,99,111,109,112,108,101,116,101,114,218,11,
+    73,109,112,111,114,116,69,114,114,111,114,114,18,0,0,0,
+    90,14,112,97,114,115,101,95,97,110,100,95,98,105,110,100,
+    90,14,114,101,97,100,95,105,110,105,116,95,102,105,108,101,
+    114,5,0,0,0,90,26,103,101,116,95,99,117,114,114,101,
+    110,116,95,104,105,115,116,111,114,121,95,108,101,110,103,116,
+    104,114,1,0,0,0,114,2,0,0,0,114,3,0,0,0,
+    90,10,101,120,112,97,110,100,117,115,101,114,90,17,114,101,
+    97,100,95,104,105,115,116,111,114,121,95,102,105,108,101,218,
+    7,73,79,69,114,114,111,114,90,8,114,101,103,105,115,116,
+    101,114,90,18,119,114,105,116,101,95,104,105,115,116,111,114,
+    121,95,102,105,108,101,41,5,114,113,0,0,0,114,114,0,
+    0,0,114,115,0,0,0,90,12,114,101,97,100,108,105,110,
+    101,95,100,111,99,90,7,104,105,115,116,111,114,121,114,7,
+    0,0,0,114,7,0,0,0,114,8,0,0,0,218,17,114,
+    101,103,105,115,116,101,114,95,114,101,97,100,108,105,110,101,
+    128,1,0,0,115,44,0,0,0,0,1,8,1,2,1,8,
+    1,12,1,14,1,6,4,12,1,16,1,12,2,10,2,2,
+    1,12,1,14,5,6,2,12,6,16,1,6,1,2,1,14,
+    1,14,1,6,1,122,44,101,110,97,98,108,101,114,108,99,
+    111,109,112,108,101,116,101,114,46,60,108,111,99,97,108,115,
+    62,46,114,101,103,105,115,116,101,114,95,114,101,97,100,108,
+    105,110,101,78,41,2,114,15,0,0,0,90,19,95,95,105,
+    110,116,101,114,97,99,116,105,118,101,104,111,111,107,95,95,
+    41,1,114,118,0,0,0,114,7,0,0,0,114,7,0,0,
+    0,114,8,0,0,0,218,17,101,110,97,98,108,101,114,108,
+    99,111,109,112,108,101,116,101,114,119,1,0,0,115,4,0,
+    0,0,0,9,8,39,114,119,0,0,0,99,1,0,0,0,
+    0,0,0,0,14,0,0,0,11,0,0,0,67,0,0,0,
+    115,70,1,0,0,116,0,106,1,125,1,116,2,106,3,100,
+    1,107,2,114,36,100,2,124,1,107,6,114,36,116,0,106,
+    1,100,2,25,0,125,2,110,6,116,2,106,4,125,2,116,
+    0,106,5,160,6,116,0,106,5,160,7,124,2,161,1,161,
+    1,92,2,125,3,125,4,116,0,106,5,160,8,124,3,161,
+    1,125,5,100,0,116,2,95,9,100,3,125,6,100,4,100,
+    5,132,0,116,0,106,5,160,10,124,3,124,6,161,2,116,
+    0,106,5,160,10,124,5,124,6,161,2,102,2,68,0,131,
+    1,125,7,124,7,144,1,114,66,124,7,100,6,25,0,125,
+    8,100,7,125,9,116,11,124,8,100,8,100,9,141,2,143,
+    96,125,10,120,88,124,10,68,0,93,80,125,11,100,10,124,
+    11,107,6,114,164,124,11,160,12,100,10,161,1,92,3,125,
+    12,125,4,125,13,124,12,160,13,161,0,160,14,161,0,125,
+    12,124,13,160,13,161,0,125,13,124,12,100,11,107,2,114,
+    230,124,13,160,14,161,0,125,9,113,164,124,12,100,12,107,
+    2,114,164,124,13,116,2,95,9,113,164,87,0,87,0,100,
+    0,81,0,82,0,88,0,124,5,4,0,116,2,95,15,116,
+    2,95,16,116,17,124,0,116,2,106,15,103,1,131,2,1,
+    0,124,9,100,7,107,2,144,1,114,54,116,18,160,19,100,
+    6,116,2,106,15,161,2,1,0,110,12,116,2,106,15,103,
+    1,97,18,100,13,97,20,124,0,83,0,41,14,78,114,76,
+    0,0,0,90,19,95,95,80,89,86,69,78,86,95,76,65,
+    85,78,67,72,69,82,95,95,122,10,112,121,118,101,110,118,
+    46,99,102,103,99,1,0,0,0,0,0,0,0,2,0,0,
+    0,5,0,0,0,83,0,0,0,115,28,0,0,0,103,0,
+    124,0,93,20,125,1,116,0,106,1,160,2,124,1,161,1,
+    114,4,124,1,145,2,113,4,83,0,114,7,0,0,0,41,
+    3,114,1,0,0,0,114,2,0,0,0,90,6,105,115,102,
+    105,108,101,41,2,114,59,0,0,0,90,8,99,111,110,102,
+    102,105,108,101,114,7,0,0,0,114,7,0,0,0,114,8,
+    0,0,0,114,60,0,0,0,182,1,0,0,115,4,0,0,
+    0,6,0,2,4,122,24,118,101,110,118,46,60,108,111,99,
+    97,108,115,62,46,60,108,105,115,116,99,111,109,112,62,114,
+    0,0,0,0,90,4,116,114,117,101,122,5,117,116,102,45,
+    56,41,1,218,8,101,110,99,111,100,105,110,103,250,1,61,
+    122,28,105,110,99,108,117,100,101,45,115,121,115,116,101,109,
+    45,115,105,116,101,45,112,97,99,107,97,103,101,115,90,4,
+    104,111,109,101,70,41,21,114,1,0,0,0,218,7,101,110,
+    118,105,114,111,110,114,15,0,0,0,114,79,0,0,0,218,
+    10,101,120,101,99,117,116,97,98,108,101,114,2,0,0,0,
+    218,5,115,112,108,105,116,114,4,0,0,0,114,105,0,0,
+    0,90,5,95,104,111,109,101,114,3,0,0,0,114,39,0,
+    0,0,218,9,112,97,114,116,105,116,105,111,110,218,5,115,
+    116,114,105,112,218,5,108,111,119,101,114,114,92,0,0,0,
+    218,11,101,120,101,99,95,112,114,101,102,105,120,114,94,0,
+    0,0,114,88,0,0,0,218,6,105,110,115,101,114,116,114,
+    82,0,0,0,41,14,114,26,0,0,0,90,3,101,110,118,
+    114,123,0,0,0,90,7,101,120,101,95,100,105,114,114,32,
+    0,0,0,90,11,115,105,116,101,95,112,114,101,102,105,120,
+    90,13,99,111,110,102,95,98,97,115,101,110,97,109,101,90,
+    15,99,97,110,100,105,100,97,116,101,95,99,111,110,102,115,
+    90,12,118,105,114,116,117,97,108,95,99,111,110,102,90,11,
+    115,121,115,116,101,109,95,115,105,116,101,114,54,0,0,0,
+    114,56,0,0,0,90,3,107,101,121,218,5,118,97,108,117,
+    101,114,7,0,0,0,114,7,0,0,0,114,8,0,0,0,
+    218,4,118,101,110,118,169,1,0,0,115,62,0,0,0,0,
+    3,6,1,18,1,12,2,6,1,24,1,12,1,6,1,4,
+    2,6,1,12,1,20,5,6,1,8,1,4,3,14,1,10,
+    1,8,1,16,1,12,1,8,1,8,1,10,1,8,1,20,
+    2,12,3,14,4,10,1,16,2,8,1,4,2,114,131,0,
+    0,0,99,0,0,0,0,0,0,0,0,3,0,0,0,22,
+    0,0,0,67,0,0,0,115,154,0,0,0,121,66,121,12,
+    100,1,100,2,108,0,125,0,87,0,110,48,4,0,116,1,
+    107,10,114,62,1,0,125,1,1,0,122,20,124,1,106,2,
+    100,3,107,2,114,44,110,2,130,0,87,0,89,0,100,2,
+    100,2,125,1,126,1,88,0,110,2,88,0,87,0,110,82,
+    4,0,116,3,107,10,114,148,1,0,125,2,1,0,122,54,
+    116,4,106,5,106,6,114,108,116,4,106,7,116,4,160,8,
+    161,0,142,0,1,0,110,24,116,4,106,9,160,10,100,4,
+    124,2,106,11,106,12,124,2,102,2,22,0,161,1,1,0,
+    87,0,89,0,100,2,100,2,125,2,126,2,88,0,110,2,
+    88,0,100,2,83,0,41,5,122,44,82,117,110,32,99,117,
+    115,116,111,109,32,115,105,116,101,32,115,112,101,99,105,102,
+    105,99,32,99,111,100,101,44,32,105,102,32,97,118,97,105,
+    108,97,98,108,101,46,114,0,0,0,0,78,218,13,115,105,
+    116,101,99,117,115,116,111,109,105,122,101,122,64,69,114,114,
+    111,114,32,105,110,32,115,105,116,101,99,117,115,116,111,109,
+    105,122,101,59,32,115,101,116,32,80,89,84,72,79,78,86,
+    69,82,66,79,83,69,32,102,111,114,32,116,114,97,99,101,
+    98,97,99,107,58,10,37,115,58,32,37,115,10,41,13,114,
+    132,0,0,0,114,116,0,0,0,114,52,0,0,0,114,44,
+    0,0,0,114,15,0,0,0,114,67,0,0,0,218,7,118,
+    101,114,98,111,115,101,218,10,101,120,99,101,112,116,104,111,
+    111,107,114,49,0,0,0,114,47,0,0,0,218,5,119,114,
+    105,116,101,218,9,95,95,99,108,97,115,115,95,95,218,8,
+    95,95,110,97,109,101,95,95,41,3,114,132,0,0,0,218,
+    3,101,120,99,218,3,101,114,114,114,7,0,0,0,114,7,
+    0,0,0,114,8,0,0,0,218,17,101,120,101,99,115,105,
+    116,101,99,117,115,116,111,109,105,122,101,221,1,0,0,115,
+    26,0,0,0,0,2,2,1,2,1,12,1,16,1,10,1,
+    2,2,24,1,16,1,8,1,16,2,6,1,2,2,114,140,
+    0,0,0,99,0,0,0,0,0,0,0,0,3,0,0,0,
+    22,0,0,0,67,0,0,0,115,154,0,0,0,121,66,121,
+    12,100,1,100,2,108,0,125,0,87,0,110,48,4,0,116,
+    1,107,10,114,62,1,0,125,1,1,0,122,20,124,1,106,
+    2,100,3,107,2,114,44,110,2,130,0,87,0,89,0,100,
+    2,100,2,125,1,126,1,88,0,110,2,88,0,87,0,110,
+    82,4,0,116,3,107,10,114,148,1,0,125,2,1,0,122,
+    54,116,4,106,5,106,6,114,108,116,4,106,7,116,4,160,
+    8,161,0,142,0,1,0,110,24,116,4,106,9,160,10,100,
+    4,124,2,106,11,106,12,124,2,102,2,22,0,161,1,1,
+    0,87,0,89,0,100,2,100,2,125,2,126,2,88,0,110,
+    2,88,0,100,2,83,0,41,5,122,44,82,117,110,32,99,
+    117,115,116,111,109,32,117,115,101,114,32,115,112,101,99,105,
+    102,105,99,32,99,111,100,101,44,32,105,102,32,97,118,97,
+    105,108,97,98,108,101,46,114,0,0,0,0,78,218,13,117,
+    115,101,114,99,117,115,116,111,109,105,122,101,122,64,69,114,
+    114,111,114,32,105,110,32,117,115,101,114,99,117,115,116,111,
+    109,105,122,101,59,32,115,101,116,32,80,89,84,72,79,78,
+    86,69,82,66,79,83,69,32,102,111,114,32,116,114,97,99,
+    101,98,97,99,107,58,10,37,115,58,32,37,115,10,41,13,
+    114,141,0,0,0,114,116,0,0,0,114,52,0,0,0,114,
+    44,0,0,0,114,15,0,0,0,114,67,0,0,0,114,133,
+    0,0,0,114,134,0,0,0,114,49,0,0,0,114,47,0,
+    0,0,114,135,0,0,0,114,136,0,0,0,114,137,0,0,
+    0,41,3,114,141,0,0,0,114,138,0,0,0,114,139,0,
+    0,0,114,7,0,0,0,114,7,0,0,0,114,8,0,0,
+    0,218,17,101,120,101,99,117,115,101,114,99,117,115,116,111,
+    109,105,122,101,241,1,0,0,115,26,0,0,0,0,2,2,
+    1,2,1,12,1,16,1,10,1,2,2,24,1,16,1,8,
+    1,16,2,6,1,2,2,114,142,0,0,0,99,0,0,0,
+    0,0,0,0,0,3,0,0,0,4,0,0,0,67,0,0,
+    0,115,116,0,0,0,116,0,106,1,160,2,100,1,161,1,
+    125,0,124,0,100,2,107,8,114,46,116,0,106,3,106,4,
+    12,0,114,46,116,5,106,6,160,2,100,3,161,1,114,46,
+    100,4,125,0,124,0,100,2,107,8,114,58,100,2,83,0,
+    116,7,124,0,116,8,131,2,114,78,124,0,160,9,100,5,
+    161,1,110,2,102,0,125,1,100,6,100,2,108,10,125,2,
+    124,2,106,11,160,12,100,7,100,8,132,0,124,1,68,0,
+    131,1,161,1,1,0,100,2,83,0,41,9,97,13,1,0,
+    0,69,110,97,98,108,101,32,108,97,122,121,32,105,109,112,
+    111,114,116,115,32,105,102,32,114,101,113,117,101,115,116,101,
+    100,32,111,110,32,116,104,101,32,99,111,109,109,97,110,100,
+    32,108,105,110,101,46,10,10,32,32,32,32,84,104,105,115,
+    32,105,115,32,100,111,110,101,32,98,121,32,116,104,101,32,
+    45,88,32,108,97,122,121,105,109,112,111,114,116,115,32,111,
+    112,116,105,111,110,44,32,119,104,111,115,101,32,118,97,108,
+    117,101,32,99,97,110,32,108,105,115,116,32,109,111,100,117,
+    108,101,115,10,32,32,32,32,116,111,32,105,109,112,111,114,
+    116,32,101,97,103,101,114,108,121,32,40,45,88,32,108,97,
+    122,121,105,109,112,111,114,116,115,61,110,97,109,101,44,110,
+    97,109,101,41,44,32,111,114,32,98,121,32,115,101,116,116,
+    105,110,103,32,116,104,101,10,32,32,32,32,80,89,84,72,
+    79,78,76,65,90,89,73,77,80,79,82,84,83,32,101,110,
+    118,105,114,111,110,109,101,110,116,32,118,97,114,105,97,98,
+    108,101,32,116,111,32,97,32,110,111,110,45,101,109,112,116,
+    121,32,115,116,114,105,110,103,46,10,32,32,32,32,90,11,
+    108,97,122,121,105,109,112,111,114,116,115,78,90,17,80,89,
+    84,72,79,78,76,65,90,89,73,77,80,79,82,84,83,84,
+    250,1,44,114,0,0,0,0,99,1,0,0,0,0,0,0,
+    0,2,0,0,0,3,0,0,0,115,0,0,0,115,30,0,
+    0,0,124,0,93,22,125,1,124,1,160,0,161,0,114,2,
+    124,1,160,0,161,0,86,0,1,0,113,2,100,0,83,0,
+    41,1,78,41,1,114,126,0,0,0,41,2,114,59,0,0,
+    0,114,52,0,0,0,114,7,0,0,0,114,7,0,0,0,
+    114,8,0,0,0,250,9,60,103,101,110,101,120,112,114,62,
+    20,2,0,0,115,4,0,0,0,4,0,2,1,122,36,101,
+    110,97,98,108,101,108,97,122,121,105,109,112,111,114,116,115,
+    46,60,108,111,99,97,108,115,62,46,60,103,101,110,101,120,
+    112,114,62,41,13,114,15,0,0,0,218,9,95,120,111,112,
+    116,105,111,110,115,218,3,103,101,116,114,67,0,0,0,218,
+    18,105,103,110,111,114,101,95,101,110,118,105,114,111,110,109,
+    101,110,116,114,1,0,0,0,114,122,0,0,0,218,10,105,
+    115,105,110,115,116,97,110,99,101,218,3,115,116,114,114,124,
+    0,0,0,90,14,105,109,112,111,114,116,108,105,98,46,117,
+    116,105,108,90,4,117,116,105,108,90,19,101,110,97,98,108,
+    101,95,108,97,122,121,95,105,109,112,111,114,116,115,41,3,
+    90,6,111,112,116,105,111,110,90,7,101,120,99,108,117,100,
+    101,90,9,105,109,112,111,114,116,108,105,98,114,7,0,0,
+    0,114,7,0,0,0,114,8,0,0,0,218,17,101,110,97,
+    98,108,101,108,97,122,121,105,109,112,111,114,116,115,5,2,
+    0,0,115,18,0,0,0,0,7,12,1,18,1,12,1,4,
+    1,8,1,4,1,24,1,8,1,114,150,0,0,0,99,0,
+    0,0,0,0,0,0,0,1,0,0,0,2,0,0,0,67,
+    0,0,0,115,108,0,0,0,116,0,131,0,1,0,116,1,
+    131,0,125,0,116,2,124,0,131,1,125,0,116,3,100,1,
+    107,8,114,34,116,4,131,0,97,3,116,5,124,0,131,1,
+    125,0,116,6,124,0,131,1,125,0,116,7,131,0,1,0,
+    116,8,131,0,1,0,116,9,131,0,1,0,116,10,106,11,
+    106,12,115,82,116,13,131,0,1,0,116,14,131,0,1,0,
+    116,3,114,98,116,15,131,0,1,0,116,16,131,0,1,0,
+    100,1,83,0,41,2,122,207,65,100,100,32,115,116,97,110,
+    100,97,114,100,32,115,105,116,101,45,115,112,101,99,105,102,
+    105,99,32,100,105,114,101,99,116,111,114,105,101,115,32,116,
+    111,32,116,104,101,32,109,111,100,117,108,101,32,115,101,97,
+    114,99,104,32,112,97,116,104,46,10,10,32,32,32,32,84,
+    104,105,115,32,102,117,110,99,116,105,111,110,32,105,115,32,
+    99,97,108,108,101,100,32,97,117,116,111,109,97,116,105,99,
+    97,108,108,121,32,119,104,101,110,32,116,104,105,115,32,109,
+    111,100,117,108,101,32,105,115,32,105,109,112,111,114,116,101,
+    100,44,10,32,32,32,32,117,110,108,101,115,115,32,116,104,
+    101,32,112,121,116,104,111,110,32,105,110,116,101,114,112,114,
+    101,116,101,114,32,119,97,115,32,115,116,97,114,116,101,100,
+    32,119,105,116,104,32,116,104,101,32,45,83,32,102,108,97,
+    103,46,10,32,32,32,32,78,41,17,114,22,0,0,0,114,
+    28,0,0,0,114,131,0,0,0,114,82,0,0,0,114,70,
+    0,0,0,114,85,0,0,0,114,94,0,0,0,114,100,0,
+    0,0,114,107,0,0,0,114,109,0,0,0,114,15,0,0,
+    0,114,67,0,0,0,218,8,105,115,111,108,97,116,101,100,
+    114,119,0,0,0,114,140,0,0,0,114,142,0,0,0,114,
+    150,0,0,0,41,1,114,26,0,0,0,114,7,0,0,0,
+    114,7,0,0,0,114,8,0,0,0,218,4,109,97,105,110,
+    23,2,0,0,115,32,0,0,0,0,8,6,1,6,1,8,
+    1,8,1,6,1,8,1,8,1,6,1,6,1,6,1,8,
+    1,6,1,6,1,4,1,6,1,114,152,0,0,0,99,0,
+    0,0,0,0,0,0,0,7,0,0,0,6,0,0,0,67,
+    0,0,0,115,96,1,0,0,100,1,125,0,116,0,106,1,
+    100,2,100,0,133,2,25,0,125,1,124,1,115,166,116,2,
+    131,0,125,2,116,3,131,0,125,3,116,4,100,3,131,1,
+    1,0,120,28,116,0,106,5,68,0,93,18,125,4,116,4,
+    100,4,124,4,102,1,22,0,131,1,1,0,113,50,87,0,
+    116,4,100,5,131,1,1,0,116,4,100,6,124,2,116,6,
+    106,5,160,7,124,2,161,1,114,102,100,7,110,2,100,8,
+    102,2,22,0,131,1,1,0,116,4,100,9,124,3,116,6,
+    106,5,160,7,124,3,161,1,114,134,100,7,110,2,100,8,
+    102,2,22,0,131,1,1,0,116,4,100,10,116,8,22,0,
+    131,1,1,0,116,0,160,9,100,11,161,1,1,0,103,0,
+    125,5,100,12,124,1,107,6,114,188,124,5,160,10,116,11,
+    161,1,1,0,100,13,124,1,107,6,114,206,124,5,160,10,
+    116,12,161,1,1,0,124,5,144,1,114,44,116,4,116,6,
+    106,13,160,14,124,5,161,1,131,1,1,0,116,8,114,244,
+    116,0,160,9,100,11,161,1,1,0,110,54,116,8,100,14,
+    107,8,144,1,114,10,116,0,160,9,100,2,161,1,1,0,
+    110,32,116,8,100,0,107,8,144,1,114,32,116,0,160,9,
+    100,15,161,1,1,0,110,10,116,0,160,9,100,16,161,1,
+    1,0,110,48,100,11,100,0,108,15,125,6,116,4,124,6,
+    160,16,124,0,116,0,106,1,100,11,25,0,116,6,106,13,
+    102,2,22,0,161,1,131,1,1,0,116,0,160,9,100,17,
+    161,1,1,0,100,0,83,0,41,18,78,97,178,1,0,0,
+    32,32,32,32,37,115,32,91,45,45,117,115,101,114,45,98,
+    97,115,101,93,32,91,45,45,117,115,101,114,45,115,105,116,
+    101,93,10,10,32,32,32,32,87,105,116,104,111,117,116,32,
+    97,114,103,117,109,101,110,116,115,32,112,114,105,110,116,32,
+    115,111,109,101,32,117,115,101,102,117,108,32,105,110,102,111,
+    114,109,97,116,105,111,110,10,32,32,32,32,87,105,116,104,
+    32,97,114,103,117,109,101,110,116,115,32,112,114,105,110,116,
+    32,116,104,101,32,118,97,108,117,101,32,111,102,32,85,83,
+    69,82,95,66,65,83,69,32,97,110,100,47,111,114,32,85,
+    83,69,82,95,83,73,84,69,32,115,101,112,97,114,97,116,
+    101,100,10,32,32,32,32,98,121,32,39,37,115,39,46,10,
+    10,32,32,32,32,69,120,105,116,32,99,111,100,101,115,32,
+    119,105,116,104,32,45,45,117,115,101,114,45,98,97,115,101,
+    32,111,114,32,45,45,117,115,101,114,45,115,105,116,101,58,
+    10,32,32,32,32,32,32,48,32,45,32,117,115,101,114,32,
+    115,105,116,101,32,100,105,114,101,99,116,111,114,121,32,105,
+    115,32,101,110,97,98,108,101,100,10,32,32,32,32,32,32,
+    49,32,45,32,117,115,101,114,32,115,105,116,101,32,100,105,
+    114,101,99,116,111,114,121,32,105,115,32,100,105,115,97,98,
+    108,101,100,32,98,121,32,117,115,101,114,10,32,32,32,32,
+    32,32,50,32,45,32,117,115,101,115,32,115,105,116,101,32,
+    100,105,114,101,99,116,111,114,121,32,105,115,32,100,105,115,
+    97,98,108,101,100,32,98,121,32,115,117,112,101,114,32,117,
+    115,101,114,10,32,32,32,32,32,32,32,32,32,32,111,114,
+    32,102,111,114,32,115,101,99,117,114,105,116,121,32,114,101,
+    97,115,111,110,115,10,32,32,32,32,32,62,50,32,45,32,
+    117,110,107,110,111,119,110,32,101,114,114,111,114,10,32,32,
+    32,32,114,38,0,0,0,122,12,115,121,115,46,112,97,116,
+    104,32,61,32,91,122,7,32,32,32,32,37,114,44,250,1,
+    93,122,18,85,83,69,82,95,66,65,83,69,58,32,37,114,
+    32,40,37,115,41,114,29,0,0,0,122,13,100,111,101,115,
+    110,39,116,32,101,120,105,115,116,122,18,85,83,69,82,95,
+    83,73,84,69,58,32,37,114,32,40,37,115,41,122,20,69,
+    78,65,66,76,69,95,85,83,69,82,95,83,73,84,69,58,
+    32,37,114,114,0,0,0,0,122,11,45,45,117,115,101,114,
+    45,98,97,115,101,122,11,45,45,117,115,101,114,45,115,105,
+    116,101,70,114,87,0,0,0,233,3,0,0,0,233,10,0,
+    0,0,41,17,114,15,0,0,0,90,4,97,114,103,118,114,
+    74,0,0,0,114,81,0,0,0,114,45,0,0,0,114,2,
+    0,0,0,114,1,0,0,0,114,83,0,0,0,114,82,0,
+    0,0,114,97,0,0,0,114,23,0,0,0,114,72,0,0,
+    0,114,78,0,0,0,90,7,112,97,116,104,115,101,112,114,
+    3,0,0,0,218,8,116,101,120,116,119,114,97,112,90,6,
+    100,101,100,101,110,116,41,7,114,108,0,0,0,218,4,97,
+    114,103,115,114,80,0,0,0,114,84,0,0,0,114,6,0,
+    0,0,90,6,98,117,102,102,101,114,114,156,0,0,0,114,
+    7,0,0,0,114,7,0,0,0,114,8,0,0,0,218,7,
+    95,115,99,114,105,112,116,53,2,0,0,115,64,0,0,0,
+    0,14,4,1,14,1,4,1,6,1,6,1,8,1,12,1,
+    18,1,8,1,6,1,26,1,6,1,26,1,12,1,10,2,
+    4,1,8,1,10,1,8,1,10,2,6,1,16,1,4,1,
+    12,1,10,1,12,1,10,1,12,2,12,2,8,1,30,1,
+    114,158,0,0,0,90,8,95,95,109,97,105,110,95,95,41,
+    1,78,41,1,78,41,1,78,41,36,114,110,0,0,0,114,
+    15,0,0,0,114,1,0,0,0,114,99,0,0,0,114,98,
+    0,0,0,114,92,0,0,0,114,128,0,0,0,114,88,0,
+    0,0,114,82,0,0,0,114,78,0,0,0,114,72,0,0,
+    0,114,9,0,0,0,114,22,0,0,0,114,28,0,0,0,
+    114,33,0,0,0,114,57,0,0,0,114,62,0,0,0,114,
+    70,0,0,0,114,74,0,0,0,114,81,0,0,0,114,85,
+    0,0,0,114,93,0,0,0,114,94,0,0,0,114,100,0,
+    0,0,114,107,0,0,0,114,109,0,0,0,114,119,0,0,
+    0,114,131,0,0,0,114,140,0,0,0,114,142,0,0,0,
+    114,150,0,0,0,114,152,0,0,0,114,67,0,0,0,218,
+    7,110,111,95,115,105,116,101,114,158,0,0,0,114,137,0,
+    0,0,114,7,0,0,0,114,7,0,0,0,114,7,0,0,
+    0,114,8,0,0,0,218,8,60,109,111,100,117,108,101,62,
+    70,0,0,0,115,68,0,0,0,4,2,8,1,8,1,8,
+    1,8,3,12,3,4,5,4,1,4,3,8,9,8,16,8,
+    19,8,13,8,42,10,24,8,24,8,14,8,23,8,14,10,
+    36,10,8,8,16,8,24,8,3,8,50,8,52,8,20,8,
+    20,8,18,8,27,10,1,6,2,8,51,10,1,
+};
+static const unsigned char _Py_M___sitebuiltins[] = {
+    99,0,0,0,0,0,0,0,0,0,0,0,0,4,0,0,
+    0,64,0,0,0,115,64,0,0,0,100,0,90,0,100,1,
+    100,2,108,1,90,1,71,0,100,3,100,4,132,0,100,4,
+    101,2,131,3,90,3,71,0,100,5,100,6,132,0,100,6,
+    101,2,131,3,90,4,71,0,100,7,100,8,132,0,100,8,
+    101,2,131,3,90,5,100,2,83,0,41,9,122,61,10,84,
+    104,101,32,111,98,106,101,99,116,115,32,117,115,101,100,32,
+    98,121,32,116,104,101,32,115,105,116,101,32,109,111,100,117,
+    108,101,32,116,111,32,97,100,100,32,99,117,115,116,111,109,
+    32,98,117,105,108,116,105,110,115,46,10,233,0,0,0,0,
+    78,99,0,0,0,0,0,0,0,0,0,0,0,0,3,0,
+    0,0,64,0,0,0,115,38,0,0,0,101,0,90,1,100,
+    0,90,2,100,1,100,2,132,0,90,3,100,3,100,4,132,
+    0,90,4,100,8,100,6,100,7,132,1,90,5,100,5,83,
+    0,41,9,218,7,81,117,105,116,116,101,114,99,3,0,0,
+    0,0,0,0,0,3,0,0,0,2,0,0,0,67,0,0,
+    0,115,16,0,0,0,124,1,124,0,95,0,124,2,124,0,
+    95,1,100,0,83,0,41,1,78,41,2,218,4,110,97,109,
+    101,218,3,101,111,102,41,3,218,4,115,101,108,102,114,2,
+    0,0,0,114,3,0,0,0,169,0,114,5,0,0,0,250,
+    25,60,115,116,100,108,105,98,62,47,95,115,105,116,101,98,
+    117,105,108,116,105,110,115,46,112,121,218,8,95,95,105,110,
+    105,116,95,95,14,0,0,0,115,4,0,0,0,0,1,6,
+    1,122,16,81,117,105,116,116,101,114,46,95,95,105,110,105,
+    116,95,95,99,1,0,0,0,0,0,0,0,1,0,0,0,
+    3,0,0,0,67,0,0,0,115,16,0,0,0,100,1,124,
+    0,106,0,124,0,106,1,102,2,22,0,83,0,41,2,78,
+    122,22,85,115,101,32,37,115,40,41,32,111,114,32,37,115,
+    32,116,111,32,101,120,105,116,41,2,114,2,0,0,0,114,
+    3,0,0,0,41,1,114,4,0,0,0,114,5,0,0,0,
+    114,5,0,0,0,114,6,0,0,0,218,8,95,95,114,101,
+    112,114,95,95,17,0,0,0,115,2,0,0,0,0,1,122,
+    16,81,117,105,116,116,101,114,46,95,95,114,101,112,114,95,
+    95,78,99,2,0,0,0,0,0,0,0,2,0,0,0,9,
+    0,0,0,67,0,0,0,115,40,0,0,0,121,14,116,0,
+    106,1,160,2,161,0,1,0,87,0,110,12,1,0,1,0,
+    1,0,89,0,110,2,88,0,116,3,124,1,131,1,130,1,
+    100,0,83,0,41,1,78,41,4,218,3,115,121,115,90,5,
+    115,116,100,105,110,218,5,99,108,111,115,101,218,10,83,121,
+    115,116,101,109,69,120,105,116,41,2,114,4,0,0,0,218,
+    4,99,111,100,101,114,5,0,0,0,114,5,0,0,0,114,
+    6,0,0,0,218,8,95,95,99,97,108,108,95,95,19,0,
+    0,0,115,10,0,0,0,0,3,2,1,14,1,6,1,6,
+    1,122,16,81,117,105,116,116,101,114,46,95,95,99,97,108,
+    108,95,95,41,1,78,41,6,218,8,95,95,110,97,109,101,
+    95,95,218,10,95,95,109,111,100,117,108,101,95,95,218,12,
+    95,95,113,117,97,108,110,97,109,101,95,95,114,7,0,0,
+    0,114,8,0,0,0,114,13,0,0,0,114,5,0,0,0,
+    114,5,0,0,0,114,5,0,0,0,114,6,0,0,0,114,
+    1,0,0,0,13,0,0,0,115,6,0,0,0,8,1,8,
+    3,8,2,114,1,0,0,0,99,0,0,0,0,0,0,0,
+    0,0,0,0,0,3,0,0,0,64,0,0,0,115,58,0,
+    0,0,101,0,90,1,100,0,90,2,100,1,90,3,100,2,
+    90,4,102,0,102,0,102,2,100,3,100,4,132,1,90,5,
+    100,5,100,6,132,0,90,6,100,7,100,8,132,0,90,7,
+    100,9,100,10,132,0,90,8,100,11,83,0,41,12,218,8,
+    95,80,114,105,110,116,101,114,122,110,105,110,116,101,114,97,
+    99,116,105,118,101,32,112,114,111,109,112,116,32,111,98,106,
+    101,99,116,115,32,102,111,114,32,112,114,105,110,116,105,110,
+    103,32,116,104,101,32,108,105,99,101,110,115,101,32,116,101,
+    120,116,44,32,97,32,108,105,115,116,32,111,102,10,32,32,
+    32,32,99,111,110,116,114,105,98,117,116,111,114,115,32,97,
+    110,100,32,116,104,101,32,99,111,112,121,114,105,103,104,116,
+    32,110,111,116,105,99,101,46,233,23,0,0,0,99,5,0,
+    0,0,0,0,0,0,5,0,0,0,3,0,0,0,3,0,
+    0,0,115,52,0,0,0,100,1,100,0,108,0,137,1,124,
+    1,124,0,95,1,124,2,124,0,95,2,100,0,124,0,95,
+    3,135,0,135,1,102,2,100,2,100,3,132,8,124,4,68,
+    0,131,1,124,0,95,4,100,0,83,0,41,4,78,114,0,
+    0,0,0,99,1,0,0,0,0,0,0,0,3,0,0,0,
+    7,0,0,0,19,0,0,0,115,36,0,0,0,103,0,124,
+    0,93,28,125,1,136,0,68,0,93,18,125,2,136,1,106,
+    0,160,1,124,1,124,2,161,2,145,3,113,12,113,4,83,
+    0,114,5,0,0,0,41,2,218,4,112,97,116,104,218,4,
+    106,111,105,110,41,3,90,2,46,48,218,3,100,105,114,218,
+    8,102,105,108,101,110,97,109,101,41,2,218,5,102,105,108,
+    101,115,218,2,111,115,114,5,0,0,0,114,6,0,0,0,
+    250,10,60,108,105,115,116,99,111,109,112,62,40,0,0,0,
+    115,4,0,0,0,6,1,2,1,122,37,95,80,114,105,110,
+    116,101,114,46,95,95,105,110,105,116,95,95,46,60,108,111,
+    99,97,108,115,62,46,60,108,105,115,116,99,111,109,112,62,
+    41,5,114,24,0,0,0,218,14,95,80,114,105,110,116,101,
+    114,95,95,110,97,109,101,218,14,95,80,114,105,110,116,101,
+    114,95,95,100,97,116,97,218,15,95,80,114,105,110,116,101,
+    114,95,95,108,105,110,101,115,218,19,95,80,114,105,110,116,
+    101,114,95,95,102,105,108,101,110,97,109,101,115,41,5,114,
+    4,0,0,0,114,2,0,0,0,218,4,100,97,116,97,114,
+    23,0,0,0,90,4,100,105,114,115,114,5,0,0,0,41,
+    2,114,23,0,0,0,114,24,0,0,0,114,6,0,0,0,
+    114,7,0,0,0,35,0,0,0,115,12,0,0,0,0,1,
+    8,1,6,1,6,1,6,1,12,1,122,17,95,80,114,105,
+    110,116,101,114,46,95,95,105,110,105,116,95,95,99,1,0,
+    0,0,0,0,0,0,4,0,0,0,16,0,0,0,67,0,
+    0,0,115,126,0,0,0,124,0,106,0,114,10,100,0,83,
+    0,100,0,125,1,120,72,124,0,106,1,68,0,93,62,125,
+    2,121,36,116,2,124,2,100,1,131,2,143,14,125,3,124,
+    3,160,3,161,0,125,1,87,0,100,0,81,0,82,0,88,
+    0,80,0,87,0,113,22,4,0,116,4,107,10,114,82,1,
+    0,1,0,1,0,89,0,113,22,88,0,113,22,87,0,124,
+    1,115,98,124,0,106,5,125,1,124,1,160,6,100,2,161,
+    1,124,0,95,0,116,7,124,0,106,0,131,1,124,0,95,
+    8,100,0,83,0,41,3,78,218,1,114,250,1,10,41,9,
+    114,28,0,0,0,114,29,0,0,0,90,4,111,112,101,110,
+    90,4,114,101,97,100,218,7,79,83,69,114,114,111,114,114,
+    27,0,0,0,218,5,115,112,108,105,116,218,3,108,101,110,
+    90,17,95,80,114,105,110,116,101,114,95,95,108,105,110,101,
+    99,110,116,41,4,114,4,0,0,0,114,30,0,0,0,114,
+    22,0,0,0,90,2,102,112,114,5,0,0,0,114,5,0,
+    0,0,114,6,0,0,0,90,7,95,95,115,101,116,117,112,
+    44,0,0,0,115,28,0,0,0,0,1,6,1,4,1,4,
+    1,12,1,2,1,12,1,18,1,6,1,14,1,10,1,4,
+    1,6,1,12,1,122,16,95,80,114,105,110,116,101,114,46,
+    95,95,115,101,116,117,112,99,1,0,0,0,0,0,0,0,
+    1,0,0,0,3,0,0,0,67,0,0,0,115,56,0,0,
+    0,124,0,160,0,161,0,1,0,116,1,124,0,106,2,131,
+    1,124,0,106,3,107,1,114,36,100,1,160,4,124,0,106,
+    2,161,1,83,0,100,2,124,0,106,5,102,1,100,3,20,
+    0,22,0,83,0,100,0,83,0,41,4,78,114,32,0,0,
+    0,122,33,84,121,112,101,32,37,115,40,41,32,116,111,32,
+    115,101,101,32,116,104,101,32,102,117,108,108,32,37,115,32,
+    116,101,120,116,233,2,0,0,0,41,6,218,15,95,80,114,
+    105,110,116,101,114,95,95,115,101,116,117,112,114,35,0,0,
+    0,114,28,0,0,0,218,8,77,65,88,76,73,78,69,83,
+    114,20,0,0,0,114,26,0,0,0,41,1,114,4,0,0,
+    0,114,5,0,0,0,114,5,0,0,0,114,6,0,0,0,
+    114,8,0,0,0,60,0,0,0,115,8,0,0,0,0,1,
+    8,1,16,1,12,2,122,17,95,80,114,105,110,116,101,114,
+    46,95,95,114,101,112,114,95,95,99,1,0,0,0,0,0,
+    0,0,5,0,0,0,11,0,0,0,67,0,0,0,115,152,
+    0,0,0,124,0,160,0,161,0,1,0,100,1,125,1,100,
+    2,125,2,120,130,121,44,120,38,116,1,124,2,124,2,124,
+    0,106,2,23,0,131,2,68,0,93,18,125,3,116,3,124,
+    0,106,4,124,3,25,0,131,1,1,0,113,38,87,0,87,
+    0,110,22,4,0,116,5,107,10,114,84,1,0,1,0,1,
+    0,80,0,89,0,113,18,88,0,124,2,124,0,106,2,55,
+    0,125,2,100,0,125,4,120,32,124,4,100,0,107,8,114,
+    132,116,6,124,1,131,1,125,4,124,4,100,5,107,7,114,
+    102,100,0,125,4,113,102,87,0,124,4,100,4,107,2,114,
+    18,80,0,113,18,87,0,100,0,83,0,41,6,78,122,48,
+    72,105,116,32,82,101,116,117,114,110,32,102,111,114,32,109,
+    111,114,101,44,32,111,114,32,113,32,40,97,110,100,32,82,
+    101,116,117,114,110,41,32,116,111,32,113,117,105,116,58,32,
+    114,0,0,0,0,218,0,218,1,113,41,2,114,39,0,0,
+    0,114,40,0,0,0,41,7,114,37,0,0,0,218,5,114,
+    97,110,103,101,114,38,0,0,0,218,5,112,114,105,110,116,
+    114,28,0,0,0,218,10,73,110,100,101,120,69,114,114,111,
+    114,218,5,105,110,112,117,116,41,5,114,4,0,0,0,90,
+    6,112,114,111,109,112,116,218,6,108,105,110,101,110,111,218,
+    1,105,90,3,107,101,121,114,5,0,0,0,114,5,0,0,
+    0,114,6,0,0,0,114,13,0,0,0,67,0,0,0,115,
+    34,0,0,0,0,1,8,1,4,1,4,1,2,1,2,1,
+    22,1,22,1,14,1,8,2,10,1,4,1,10,1,8,1,
+    8,1,8,1,8,1,122,17,95,80,114,105,110,116,101,114,
+    46,95,95,99,97,108,108,95,95,78,41,9,114,14,0,0,
+    0,114,15,0,0,0,114,16,0,0,0,218,7,95,95,100,
+    111,99,95,95,114,38,0,0,0,114,7,0,0,0,114,37,
+    0,0,0,114,8,0,0,0,114,13,0,0,0,114,5,0,
+    0,0,114,5,0,0,0,114,5,0,0,0,114,6,0,0,
+    0,114,17,0,0,0,29,0,0,0,115,12,0,0,0,8,
+    2,4,2,4,2,14,9,8,16,8,7,114,17,0,0,0,
+    99,0,0,0,0,0,0,0,0,0,0,0,0,2,0,0,
+    0,64,0,0,0,115,32,0,0,0,101,0,90,1,100,0,
+    90,2,100,1,90,3,100,2,100,3,132,0,90,4,100,4,
+    100,5,132,0,90,5,100,6,83,0,41,7,218,7,95,72,
+    101,108,112,101,114,97,51,1,0,0,68,101,102,105,110,101,
+    32,116,104,101,32,98,117,105,108,116,105,110,32,39,104,101,
+    108,112,39,46,10,10,32,32,32,32,84,104,105,115,32,105,
+    115,32,97,32,119,114,97,112,112,101,114,32,97,114,111,117,
+    110,100,32,112,121,100,111,99,46,104,101,108,112,32,116,104,
+    97,116,32,112,114,111,118,105,100,101,115,32,97,32,104,101,
+    108,112,102,117,108,32,109,101,115,115,97,103,101,10,32,32,
+    32,32,119,104,101,110,32,39,104,101,108,112,39,32,105,115,
+    32,116,121,112,101,100,32,97,116,32,116,104,101,32,80,121,
+    116,104,111,110,32,105,110,116,101,114,97,99,116,105,118,101,
+    32,112,114,111,109,112,116,46,10,10,32,32,32,32,67,97,
+    108,108,105,110,103,32,104,101,108,112,40,41,32,97,116,32,
+    116,104,101,32,80,121,116,104,111,110,32,112,114,111,109,112,
+    116,32,115,116,97,114,116,115,32,97,110,32,105,110,116,101,
+    114,97,99,116,105,118,101,32,104,101,108,112,32,115,101,115,
+    115,105,111,110,46,10,32,32,32,32,67,97,108,108,105,110,
+    103,32,104,101,108,112,40,116,104,105,110,103,41,32,112,114,
+    105,110,116,115,32,104,101,108,112,32,102,111,114,32,116,104,
+    101,32,112,121,116,104,111,110,32,111,98,106,101,99,116,32,
+    39,116,104,105,110,103,39,46,10,32,32,32,32,99,1,0,
+    0,0,0,0,0,0,1,0,0,0,1,0,0,0,67,0,
+    0,0,115,4,0,0,0,100,1,83,0,41,2,78,122,72,
+    84,121,112,101,32,104,101,108,112,40,41,32,102,111,114,32,
+    105,110,116,101,114,97,99,116,105,118,101,32,104,101,108,112,
+    44,32,111,114,32,104,101,108,112,40,111,98,106,101,99,116,
+    41,32,102,111,114,32,104,101,108,112,32,97,98,111,117,116,
+    32,111,98,106,101,99,116,46,114,5,0,0,0,41,1,114,
+    4,0,0,0,114,5,0,0,0,114,5,0,0,0,114,6,
+    0,0,0,114,8,0,0,0,98,0,0,0,115,2,0,0,
+    0,0,1,122,16,95,72,101,108,112,101,114,46,95,95,114,
+    101,112,114,95,95,99,1,0,0,0,0,0,0,0,4,0,
+    0,0,3,0,0,0,79,0,0,0,115,20,0,0,0,100,
+    1,100,0,108,0,125,3,124,3,106,1,124,1,124,2,142,
+    1,83,0,41,2,78,114,0,0,0,0,41,2,218,5,112,
+    121,100,111,99,90,4,104,101,108,112,41,4,114,4,0,0,
+    0,218,4,97,114,103,115,90,4,107,119,100,115,114,49,0,
+    0,0,114,5,0,0,0,114,5,0,0,0,114,6,0,0,
+    0,114,13,0,0,0,101,0,0,0,115,4,0,0,0,0,
+    1,8,1,122,16,95,72,101,108,112,101,114,46,95,95,99,
+    97,108,108,95,95,78,41,6,114,14,0,0,0,114,15,0,
+    0,0,114,16,0,0,0,114,47,0,0,0,114,8,0,0,
+    0,114,13,0,0,0,114,5,0,0,0,114,5,0,0,0,
+    114,5,0,0,0,114,6,0,0,0,114,48,0,0,0,88,
+    0,0,0,115,6,0,0,0,8,8,4,2,8,3,114,48,
+    0,0,0,41,6,114,47,0,0,0,114,9,0,0,0,218,
+    6,111,98,106,101,99,116,114,1,0,0,0,114,17,0,0,
+    0,114,48,0,0,0,114,5,0,0,0,114,5,0,0,0,
+    114,5,0,0,0,114,6,0,0,0,218,8,60,109,111,100,
+    117,108,101,62,3,0,0,0,115,8,0,0,0,4,8,8,
+    2,16,16,16,59,
+};
+
+#define FROZEN_STDLIB_COUNT 17
+#define FROZEN_STDLIB_MODULES \
+    {"abc", _Py_M__abc, (int)sizeof(_Py_M__abc)}, \
+    {"codecs", _Py_M__codecs, (int)sizeof(_Py_M__codecs)}, \
+    {"encodings", _Py_M__encodings, -(int)sizeof(_Py_M__encodings)}, \
+    {"encodings.aliases", _Py_M__encodings_aliases, (int)sizeof(_Py_M__encodings_aliases)}, \
+    {"encodings.ascii", _Py_M__encodings_ascii, (int)sizeof(_Py_M__encodings_ascii)}, \
+    {"encodings.latin_1", _Py_M__encodings_latin_1, (int)sizeof(_Py_M__encodings_latin_1)}, \
+    {"encodings.utf_8", _Py_M__encodings_utf_8, (int)sizeof(_Py_M__encodings_utf_8)}, \
+    {"io", _Py_M__io, (int)sizeof(_Py_M__io)}, \
+    {"_bootlocale", _Py_M___bootlocale, (int)sizeof(_Py_M___bootlocale)}, \
+    {"os", _Py_M__os, (int)sizeof(_Py_M__os)}, \
+    {"stat", _Py_M__stat, (int)sizeof(_Py_M__stat)}, \
+    {"posixpath", _Py_M__posixpath, (int)sizeof(_Py_M__posixpath)}, \
+    {"ntpath", _Py_M__ntpath, (int)sizeof(_Py_M__ntpath)}, \
+    {"genericpath", _Py_M__genericpath, (int)sizeof(_Py_M__genericpath)}, \
+    {"_collections_abc", _Py_M___collections_abc, (int)sizeof(_Py_M___collections_abc)}, \
+    {"site", _Py_M__site, (int)sizeof(_Py_M__site)}, \
+    {"_sitebuiltins", _Py_M___sitebuiltins, (int)sizeof(_Py_M___sitebuiltins)}, \
+    /* end of FROZEN_STDLIB_MODULES */
@@ -253,6 +253,20 @@ import_init(PyInterpreterState *interp, PyObject *sysmod)
     PyObject *sys_modules;
     PyObject *value;
 
+    /* With -X frozen_modules=off, the startup modules of the standard
+       library are imported from their source files rather than from
+       their frozen copy.  Embedders' own tables are left alone. */
+    if (PyImport_FrozenModules == _PyImport_FrozenStdlib) {
+        PyObject *xoptions = PySys_GetXOptions();
+        if (xoptions == NULL)
+            Py_FatalError("Py_Initialize: can't get sys._xoptions");
+        value = PyDict_GetItemString(xoptions, "frozen_modules");
+        if (value != NULL && PyUnicode_Check(value) &&
+                _PyUnicode_EqualToASCIIString(value, "off")) {
+            PyImport_FrozenModules = _PyImport_FrozenNoStdlib;
+        }
+    }
+
     /* Import _importlib through its frozen version, _frozen_importlib. */
     if (PyImport_ImportFrozenModule("_frozen_importlib") <= 0) {
         Py_FatalError("Py_Initialize: can't import _frozen_importlib");
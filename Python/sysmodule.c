@@ -1908,6 +1908,7 @@ PyObject *
 _PySys_Init(void)
 {
     PyObject *m, *sysdict, *version_info;
+    wchar_t *stdlib_dir;
     int res;
 
     m = PyModule_Create(&sysmodule);
@@ -1986,6 +1987,16 @@ _PySys_Init(void)
                         PyUnicode_FromWideChar(Py_GetPrefix(), -1));
     SET_SYS_FROM_STRING("base_exec_prefix",
                         PyUnicode_FromWideChar(Py_GetExecPrefix(), -1));
+    /* Used to locate the source of the frozen modules of the standard
+       library, see _stdlib_dir() in importlib._bootstrap_external */
+    stdlib_dir = _Py_GetStdlibDir();
+    if (stdlib_dir[0]) {
+        SET_SYS_FROM_STRING("_stdlib_dir",
+                            PyUnicode_FromWideChar(stdlib_dir, -1));
+    }
+    else {
+        SET_SYS_FROM_STRING_BORROW("_stdlib_dir", Py_None);
+    }
     SET_SYS_FROM_STRING("maxsize",
                         PyLong_FromSsize_t(PY_SSIZE_T_MAX));
     SET_SYS_FROM_STRING("float_info",
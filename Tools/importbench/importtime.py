@@ -0,0 +1,130 @@
+"""Rank the modules that make an import or a program slow to start.
+
+Runs Python with -X importtime (or reads the output of an earlier such
+run) and reports the modules with the highest self or cumulative import
+time, together with the module that first imported them.
+
+    importtime.py json asyncio          # python -X importtime -c 'import ...'
+    importtime.py -r 5 -n 10 -- -m pip --version
+    python -X importtime app.py 2> log; importtime.py --log log
+
+When run several times (-r) the best time of every module is kept, which
+filters out most of the noise of a single run.
+
+"""
+import argparse
+import re
+import subprocess
+import sys
+
+
+LINE_RE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)$')
+
+
+def parse(lines):
+    """Parse -X importtime output.
+
+    Returns a dict mapping module names to (self, cumulative, parent)
+    tuples, times being in microseconds.  The parent of a top-level
+    import is None.
+
+    """
+    modules = {}
+    # Children are reported before their parent: keep them pending at
+    # their nesting level until the parent line shows up.
+    pending = {}
+    for line in lines:
+        match = LINE_RE.match(line.rstrip('\n'))
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        level = len(indent) // 2
+        for child in pending.pop(level + 1, ()):
+            self_, cumulative, _ = modules[child]
+            modules[child] = (self_, cumulative, name)
+        modules[name] = (int(self_us), int(cumulative_us), None)
+        pending.setdefault(level, []).append(name)
+    return modules
+
+
+def run(python, args):
+    """Run python with -X importtime and return its stderr lines."""
+    cmd = [python, '-X', 'importtime'] + args
+    proc = subprocess.run(cmd, stdout=subprocess.DEVNULL,
+                          stderr=subprocess.PIPE, universal_newlines=True)
+    if proc.returncode:
+        sys.stderr.write(proc.stderr)
+        sys.exit('%s exited with status %d' % (' '.join(cmd), proc.returncode))
+    return proc.stderr.splitlines()
+
+
+def merge(runs):
+    """Keep the best self and cumulative time of every module."""
+    best = {}
+    for modules in runs:
+        for name, (self_, cumulative, parent) in modules.items():
+            if name in best:
+                old_self, old_cumulative, parent = best[name]
+                self_ = min(self_, old_self)
+                cumulative = min(cumulative, old_cumulative)
+            best[name] = (self_, cumulative, parent)
+    return best
+
+
+def report(modules, top, key):
+    index = 0 if key == 'self' else 1
+    ranked = sorted(modules.items(), key=lambda item: item[1][index],
+                    reverse=True)
+    total = sum(self_ for self_, _, _ in modules.values())
+    print('%d modules imported in %.1f ms' % (len(modules), total / 1000))
+    print()
+    print('%8s %8s %6s  %s' % ('self ms', 'cumul ms', 'self %', 'module'))
+    for name, (self_, cumulative, parent) in ranked[:top]:
+        via = ' (imported by %s)' % parent if parent is not None else ''
+        print('%8.1f %8.1f %5.1f%%  %s%s'
+              % (self_ / 1000, cumulative / 1000,
+                 100 * self_ / total if total else 0.0, name, via))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Rank modules by import time using -X importtime.')
+    parser.add_argument('-n', '--top', type=int, default=20,
+                        help='number of modules to report (default: 20)')
+    parser.add_argument('-r', '--repeat', type=int, default=3,
+                        help='number of runs, the best time of each module '
+                             'is kept (default: 3)')
+    parser.add_argument('-s', '--sort', choices=('self', 'cumulative'),
+                        default='self',
+                        help='rank by self or cumulative time '
+                             '(default: self)')
+    parser.add_argument('-p', '--python', default=sys.executable,
+                        help='interpreter to run (default: this one)')
+    parser.add_argument('--log', type=argparse.FileType('r'),
+                        help="read -X importtime output from a file "
+                             "('-' for stdin) instead of running Python")
+    parser.add_argument('args', nargs='*',
+                        help='modules to import, or the interpreter '
+                             'arguments after --')
+    options, rest = parser.parse_known_args()
+
+    if options.log is not None:
+        with options.log:
+            modules = parse(options.log)
+    else:
+        args = options.args
+        if '--' in sys.argv:
+            args = sys.argv[sys.argv.index('--') + 1:]
+        elif rest:
+            parser.error('unrecognized arguments: %s' % ' '.join(rest))
+        elif args:
+            args = ['-c', 'import ' + ', '.join(args)]
+        else:
+            args = ['-c', 'pass']
+        modules = merge(parse(run(options.python, args))
+                        for _ in range(options.repeat))
+    report(modules, options.top, options.sort)
+
+
+if __name__ == '__main__':
+    main()
@@ -659,6 +659,11 @@ class PyBuildExt(build_ext):
         exts.append( Extension('_opcode', ['_opcode.c']) )
         # asyncio speedups
         exts.append( Extension("_asyncio", ["_asynciomodule.c"]) )
+        # queue.SimpleQueue
+        if sysconfig.get_config_var('WITH_THREAD'):
+            exts.append( Extension("_queue", ["_queuemodule.c"]) )
+        else:
+            missing.append('_queue')
 
         # Modules with some UNIX dependencies -- on by default:
         # (If you have a really backward UNIX, select and socket may not be
@@ -1605,6 +1610,12 @@ class PyBuildExt(build_ext):
                                     include_dirs=["Modules/_multiprocessing"]))
         else:
             missing.append('_multiprocessing')
+
+        if host_platform != 'win32':
+            exts.append ( Extension('_posixshmem',
+                                    ['_multiprocessing/posixshmem.c'],
+                                    libraries=libraries,
+                                    include_dirs=["Modules/_multiprocessing"]))
         # End multiprocessing
 
         # Platform-specific libraries